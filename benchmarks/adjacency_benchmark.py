@@ -0,0 +1,72 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""Micro-benchmark of CDP/LLDP adjacency resolution in CiscoASASNMPAutoload
+
+Builds synthetic cdpCacheTable, lldpLocPortDesc and lldpRemTable tables with one neighbor per interface
+and measures index build plus adjacency lookup for every interface.
+Time per neighbor should stay flat while the table grows.
+
+Usage: python benchmarks/adjacency_benchmark.py [size ...]
+"""
+
+import logging
+import os
+import sys
+import time
+import types
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_PATH not in sys.path:
+    sys.path.insert(0, ROOT_PATH)
+
+from cloudshell.firewall.cisco.asa.autoload.cisco_asa_snmp_autoload import CiscoASASNMPAutoload
+from cloudshell.snmp.quali_snmp import QualiMibTable
+
+DEFAULT_SIZES = [1000, 2500, 5000, 10000]
+
+
+def build_autoload(size):
+    autoload = CiscoASASNMPAutoload(snmp_handler=object(), logger=logging.getLogger('benchmark'),
+                                    config=types.ModuleType('config'), snmp_community='public')
+    autoload.if_table = QualiMibTable('ifTable')
+    autoload.cdp_table = QualiMibTable('cdpCacheTable')
+    autoload.lldp_local_table = QualiMibTable('lldpLocPortDesc')
+    autoload.lldp_remote_table = QualiMibTable('lldpRemTable')
+    for if_index in range(1, size + 1):
+        interface_name = 'GigabitEthernet{0}/{1}'.format(if_index // 48, if_index % 48)
+        autoload.if_table[if_index] = {'suffix': str(if_index), 'ifName': interface_name}
+        autoload.lldp_local_table[if_index] = {'suffix': str(if_index), 'lldpLocPortDesc': interface_name}
+        if if_index % 2:
+            autoload.cdp_table[float('{0}.1'.format(if_index))] = {
+                'suffix': '{0}.1'.format(if_index),
+                'cdpCacheDeviceId': 'cdp-neighbor-{0}'.format(if_index),
+                'cdpCacheDevicePort': 'Gi1/0/{0}'.format(if_index)}
+        else:
+            autoload.lldp_remote_table['0.{0}.1'.format(if_index)] = {
+                'suffix': '0.{0}.1'.format(if_index),
+                'lldpRemSysName': 'lldp-neighbor-{0}'.format(if_index),
+                'lldpRemPortDesc': 'Gi2/0/{0}'.format(if_index)}
+    return autoload
+
+
+def run(size):
+    autoload = build_autoload(size)
+    start = time.time()
+    autoload._build_neighbor_index()
+    resolved = len([if_index for if_index in autoload.if_table if autoload._get_adjacent(if_index)])
+    elapsed = time.time() - start
+    if resolved != size:
+        raise Exception('Resolved {0} neighbors out of {1}'.format(resolved, size))
+    return elapsed
+
+
+def main(sizes):
+    print('{0:>10} {1:>12} {2:>16}'.format('neighbors', 'total, ms', 'per neighbor, us'))
+    for size in sizes:
+        elapsed = run(size)
+        print('{0:>10} {1:>12.2f} {2:>16.2f}'.format(size, elapsed * 1000, elapsed * 1000000 / size))
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,152 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""Autoload benchmark replaying SNMP fixtures
+
+Runs SNMP discovery of CiscoASASNMPAutoload against the hand-written snmprec fixtures modelled after ASA 5506-X,
+5525-X, 5585-X and a 5585-X cluster member in benchmarks/fixtures (see benchmarks/fixtures/README.md) and against
+synthetic devices with 1,000 and 5,000 interfaces built by topology_generator. Every fixture is discovered in
+a fresh interpreter. Request PDU and varbind counts don't depend on the machine, they are compared with
+benchmarks/autoload_budgets.json and exit status is 1 if any budget is exceeded. Wall time and peak RSS
+of the interpreter are only reported. --update-budgets stores measured counts as new budgets.
+
+Usage: python benchmarks/autoload_benchmark.py [--update-budgets] [--repeats N] [fixture ...]
+"""
+
+import gc
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+import types
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_PATH not in sys.path:
+    sys.path.insert(0, ROOT_PATH)
+
+from cloudshell.firewall.cisco.asa.autoload.cisco_asa_snmp_autoload import CiscoASASNMPAutoload
+from snmp_replay import ReplayCommandGenerator, create_snmp_handler, load_snmprec
+from topology_generator import TopologyGenerator
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+BENCHMARKS_PATH = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_PATH = os.path.join(BENCHMARKS_PATH, 'fixtures')
+BUDGETS_FILE = os.path.join(BENCHMARKS_PATH, 'autoload_budgets.json')
+FIXTURES = ['asa5506', 'asa5525', 'asa5585', 'asa5585_cluster']
+SYNTHETIC_FIXTURES = {
+    'synthetic_1k': dict(chassis_count=2, modules_per_chassis=5, ports_per_module=48, subinterfaces_per_port=1,
+                         port_channels=40, ports_per_channel=4),
+    'synthetic_5k': dict(chassis_count=4, modules_per_chassis=10, ports_per_module=62, subinterfaces_per_port=1,
+                         port_channels=40, ports_per_channel=4)}
+BUDGET_COUNTERS = ['pdus', 'varbinds']
+
+
+class ReplayAutoload(CiscoASASNMPAutoload):
+    """Autoload creating replaying SNMP handlers for table loader and GET pipeline threads"""
+
+    _snmp_engines = []
+
+    def _create_snmp_engine(self):
+        return ReplayCommandGenerator()
+
+
+def get_rss_kb():
+    if resource is None:
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def load_records(fixture):
+    if fixture in SYNTHETIC_FIXTURES:
+        return TopologyGenerator(**SYNTHETIC_FIXTURES[fixture]).generate()
+    return load_snmprec(os.path.join(FIXTURES_PATH, fixture + '.snmprec'))
+
+
+def discover(records):
+    """Run SNMP discovery of the records in this interpreter
+
+    :param records: pysnmp values by OID tuples
+    :rtype: dict
+    :return: wall time, PDU and varbind counts, peak RSS of the interpreter, resource and attribute counts
+    """
+
+    logger = logging.getLogger('benchmark')
+    logger.addHandler(logging.NullHandler())
+    snmp_handler = create_snmp_handler(records, logger)
+    autoload = ReplayAutoload(snmp_handler=snmp_handler, logger=logger, config=types.ModuleType('config'),
+                              snmp_community='public')
+    gc.collect()
+    start = time.time()
+    # SNMP discovery only, discover() also configures SNMP community through CLI
+    autoload.profiler.attach(snmp_handler)
+    result = autoload._get_autoload_details()
+    elapsed = time.time() - start
+    autoload.profiler.detach()
+    totals = autoload.profiler.get_report()['totals']
+    return {'wall_time': elapsed, 'pdus': totals['pdus'], 'varbinds': totals['varbinds'],
+            'peak_memory_kb': get_rss_kb(), 'resources': len(result.resources), 'attributes': len(result.attributes)}
+
+
+def load_budgets():
+    if not os.path.exists(BUDGETS_FILE):
+        return {}
+    with open(BUDGETS_FILE) as budgets_file:
+        return json.load(budgets_file)
+
+
+def main(fixtures, repeats, update_budgets):
+    budgets = load_budgets()
+    exceeded = []
+    print('{0:>16} {1:>10} {2:>11} {3:>13} {4:>6} {5:>9} {6:>13}  {7}'.format(
+        'fixture', 'resources', 'attributes', 'wall time, s', 'PDUs', 'varbinds', 'peak RSS, KB', 'budget'))
+    for fixture in fixtures:
+        results = []
+        for _ in range(repeats):
+            output = subprocess.check_output([sys.executable, os.path.abspath(__file__), '--measure', fixture])
+            results.append(json.loads(output.strip().splitlines()[-1]))
+        measured = {counter: max(result[counter] for result in results) for counter in BUDGET_COUNTERS}
+
+        if update_budgets:
+            budgets[fixture] = measured
+            status = 'updated'
+        elif fixture not in budgets:
+            status = 'no budget'
+        else:
+            over = sorted(name for name, value in measured.iteritems()
+                          if name in budgets[fixture] and value > budgets[fixture][name])
+            status = 'exceeded: {0}'.format(', '.join(over)) if over else 'ok'
+            if over:
+                exceeded.append(fixture)
+        print('{0:>16} {1:>10} {2:>11} {3:>13.3f} {4:>6} {5:>9} {6:>13}  {7}'.format(
+            fixture, results[0]['resources'], results[0]['attributes'],
+            min(result['wall_time'] for result in results), measured['pdus'], measured['varbinds'],
+            min(result['peak_memory_kb'] for result in results), status))
+
+    if update_budgets:
+        with open(BUDGETS_FILE, 'w') as budgets_file:
+            json.dump(budgets, budgets_file, indent=4, separators=(',', ': '), sort_keys=True)
+            budgets_file.write('\n')
+    return 1 if exceeded else 0
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3 and sys.argv[1] == '--measure':
+        print(json.dumps(discover(load_records(sys.argv[2]))))
+        sys.exit(0)
+
+    arguments = sys.argv[1:]
+    update = '--update-budgets' in arguments
+    if update:
+        arguments.remove('--update-budgets')
+    repeat_count = 3
+    if '--repeats' in arguments:
+        position = arguments.index('--repeats')
+        repeat_count = int(arguments[position + 1])
+        del arguments[position:position + 2]
+    sys.exit(main(arguments or FIXTURES + sorted(SYNTHETIC_FIXTURES), repeat_count, update))
@@ -0,0 +1,81 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""Startup benchmark of sysObjectID to model resolution
+
+Compares loading CISCO-PRODUCTS-MIB through pysnmp with the precompiled products table.
+Every path runs in a fresh interpreter, wall time and RSS growth are measured after pysnmp is imported.
+
+Usage: python benchmarks/device_model_benchmark.py [repeats]
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_PATH not in sys.path:
+    sys.path.insert(0, ROOT_PATH)
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+MIBS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'cloudshell', 'firewall', 'cisco', 'asa',
+                                         'mibs'))
+SYS_OBJECT_ID = (1, 3, 6, 1, 4, 1, 9, 1, 1408)
+PATHS = ['mib', 'table']
+
+
+def get_rss_kb():
+    if resource is None:
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def resolve_with_mib():
+    from pysnmp.smi import builder, view
+
+    mib_builder = builder.MibBuilder()
+    mib_builder.addMibSources(builder.DirMibSource(MIBS_PATH))
+    mib_builder.loadModules('CISCO-PRODUCTS-MIB')
+    mod_name, node_name, suffix = view.MibViewController(mib_builder).getNodeLocation(SYS_OBJECT_ID)
+    return node_name
+
+
+def resolve_with_table():
+    from cloudshell.firewall.cisco.asa.autoload.cisco_products_oids import CISCO_PRODUCTS, CISCO_PRODUCTS_PREFIX
+
+    if SYS_OBJECT_ID[:-1] == CISCO_PRODUCTS_PREFIX:
+        return CISCO_PRODUCTS[SYS_OBJECT_ID[-1]]
+
+
+def measure(path):
+    import pysnmp.smi.builder
+    import pysnmp.smi.view
+
+    rss = get_rss_kb()
+    start = time.time()
+    model = resolve_with_mib() if path == 'mib' else resolve_with_table()
+    elapsed = time.time() - start
+    print('{0} {1} {2}'.format(model, elapsed, get_rss_kb() - rss))
+
+
+def main(repeats):
+    print('{0:>6} {1:>14} {2:>14} {3:>16}'.format('path', 'model', 'wall time, ms', 'RSS growth, KB'))
+    for path in PATHS:
+        results = []
+        for _ in range(repeats):
+            output = subprocess.check_output([sys.executable, __file__, '--measure', path]).split()
+            results.append((float(output[1]), int(output[2]), output[0]))
+        elapsed, rss, model = min(results)
+        print('{0:>6} {1:>14} {2:>14.2f} {3:>16}'.format(path, model, elapsed * 1000, rss))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3 and sys.argv[1] == '--measure':
+        measure(sys.argv[2])
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,93 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""Scaling benchmark of entity table bookkeeping in CiscoASASNMPAutoload
+
+Feeds synthetic entPhysicalTable of the requested size (one chassis, module slots with 48 ports each)
+through entity table filtering, module list and relative paths building.
+Time per entity should stay flat while the table grows.
+
+Usage: python benchmarks/entity_bookkeeping_benchmark.py [size ...]
+"""
+
+import logging
+import os
+import sys
+import time
+import types
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_PATH not in sys.path:
+    sys.path.insert(0, ROOT_PATH)
+
+from cloudshell.firewall.cisco.asa.autoload.cisco_asa_snmp_autoload import CiscoASASNMPAutoload
+from cloudshell.snmp.quali_snmp import QualiMibTable
+
+DEFAULT_SIZES = [100, 1000, 10000]
+PORTS_PER_MODULE = 48
+
+
+def build_entity_table(size):
+    table = QualiMibTable('entPhysicalTable')
+    if_table = QualiMibTable('ifTable')
+    alias_mapping = {}
+
+    def add_entity(parent, entity_class, vendor_type, name, rel_pos):
+        index = len(table) + 1
+        table[index] = {'suffix': str(index), 'entPhysicalParentRelPos': str(rel_pos),
+                        'entPhysicalContainedIn': str(parent), 'entPhysicalClass': entity_class,
+                        'entPhysicalVendorType': vendor_type, 'entPhysicalDescr': name, 'entPhysicalName': name}
+        return index
+
+    chassis = add_entity(0, 'chassis', 'CISCO-ENTITY-VENDORTYPE-OID-MIB::cevChassisASA5585', 'Chassis', -1)
+    slot = 0
+    while len(table) < size:
+        container = add_entity(chassis, 'container', 'CISCO-ENTITY-VENDORTYPE-OID-MIB::cevContainerSlot',
+                               'Slot {0}'.format(slot), slot)
+        module = add_entity(container, 'module', 'CISCO-ENTITY-VENDORTYPE-OID-MIB::cevModuleASA5585Type',
+                            'Module {0}'.format(slot), 0)
+        for port_number in range(min(PORTS_PER_MODULE, size - len(table))):
+            name = 'GigabitEthernet{0}/{1}'.format(slot, port_number)
+            port = add_entity(module, 'port', 'CISCO-ENTITY-VENDORTYPE-OID-MIB::cevPortGigEthernet', name,
+                              port_number)
+            if_index = len(if_table) + 1
+            if_table[if_index] = {'suffix': str(if_index), 'ifName': name}
+            alias_mapping[port] = if_index
+        slot += 1
+    return table, if_table, alias_mapping
+
+
+def run(size):
+    entity_table, if_table, alias_mapping = build_entity_table(size)
+    logger = logging.getLogger('benchmark')
+    logger.addHandler(logging.NullHandler())
+    autoload = CiscoASASNMPAutoload(snmp_handler=object(), logger=logger, config=types.ModuleType('config'),
+                                    snmp_community='public')
+    autoload._walk_columns = lambda snmp_module_name, table_name, *columns: entity_table
+    autoload.if_table = if_table
+    autoload.ent_alias_mapping_index = alias_mapping
+
+    start = time.time()
+    autoload.entity_table = autoload._get_entity_table()
+    autoload._build_entity_tree()
+    for chassis in autoload.chassis_list:
+        autoload.relative_path[chassis] = autoload._get_resource_id(chassis)
+    autoload._filter_lower_bay_containers()
+    autoload.get_module_list()
+    autoload.add_relative_paths()
+    elapsed = time.time() - start
+
+    if len(autoload.port_list) + len(autoload.module_list) + len(autoload.chassis_list) > len(entity_table):
+        raise Exception('Inconsistent bookkeeping for {0} entities'.format(size))
+    return elapsed
+
+
+def main(sizes):
+    print('{0:>10} {1:>12} {2:>14}'.format('entities', 'total, ms', 'per entity, us'))
+    for size in sizes:
+        elapsed = run(size)
+        print('{0:>10} {1:>12.2f} {2:>14.2f}'.format(size, elapsed * 1000, elapsed * 1000000 / size))
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,94 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""Snapshot store benchmark
+
+Saves and loads synthetic AutoLoadDetails of 100, 1,000 and 5,000 ports with the snapshot store
+and with cPickle of the AutoLoadDetails object, reports file size and best save and load time.
+
+Usage: python benchmarks/snapshot_store_benchmark.py [port counts]
+"""
+
+import cPickle as pickle
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_PATH not in sys.path:
+    sys.path.insert(0, ROOT_PATH)
+
+from cloudshell.firewall.cisco.asa.autoload.snapshot_store import SnapshotStore
+from cloudshell.shell.core.driver_context import AutoLoadDetails, AutoLoadResource, AutoLoadAttribute
+
+SIZES = [100, 1000, 5000]
+REPEATS = 5
+RESOURCE_KEY = 'asa-benchmark@192.168.1.1'
+PORT_ATTRIBUTES = ['L2 Protocol Type', 'MAC Address', 'MTU', 'Bandwidth', 'Description', 'Adjacent', 'Duplex',
+                   'Auto Negotiation', 'IPv4 Address', 'IPv6 Address', 'Protocol Type']
+
+
+def build_autoload_details(ports):
+    resources = [AutoLoadResource('Generic Chassis', 'Chassis 0', '0')]
+    attributes = [AutoLoadAttribute('0', 'Model', 'ASA5585'), AutoLoadAttribute('0', 'Serial Number', 'JAF00001')]
+    for port in range(ports):
+        relative_address = '0/{0}/{1}'.format(port // 48, port % 48)
+        resources.append(AutoLoadResource('Generic Port', 'GigabitEthernet{0}-{1}'.format(port // 48, port % 48),
+                                          relative_address))
+        values = ['ethernetCsmacd', '00:1e:f7:00:{0:02x}:{1:02x}'.format(port // 256, port % 256), 1500,
+                  1000, 'GigabitEthernet{0}/{1} description'.format(port // 48, port % 48), '', 'Full', 'True',
+                  '10.{0}.{1}.1'.format(port // 256, port % 256), '', 'Transparent']
+        for name, value in zip(PORT_ATTRIBUTES, values):
+            attributes.append(AutoLoadAttribute(relative_address, name, value))
+    return AutoLoadDetails(resources, attributes)
+
+
+def best_time(function):
+    result = None
+    elapsed = None
+    for _ in range(REPEATS):
+        start = time.time()
+        result = function()
+        duration = time.time() - start
+        elapsed = duration if elapsed is None else min(elapsed, duration)
+    return elapsed, result
+
+
+def main(sizes):
+    print('{0:>6} {1:>9} {2:>10} {3:>10} {4:>10}'.format('ports', 'format', 'size, KB', 'save, ms', 'load, ms'))
+    store_path = tempfile.mkdtemp()
+    try:
+        for ports in sizes:
+            autoload_details = build_autoload_details(ports)
+
+            pickle_file = os.path.join(store_path, 'details.pickle')
+
+            def save_pickle():
+                with open(pickle_file, 'wb') as output_file:
+                    pickle.dump(autoload_details, output_file, pickle.HIGHEST_PROTOCOL)
+
+            def load_pickle():
+                with open(pickle_file, 'rb') as input_file:
+                    return pickle.load(input_file)
+
+            save_time = best_time(save_pickle)[0]
+            load_time = best_time(load_pickle)[0]
+            print('{0:>6} {1:>9} {2:>10.1f} {3:>10.2f} {4:>10.2f}'.format(
+                ports, 'cPickle', os.path.getsize(pickle_file) / 1024.0, save_time * 1000, load_time * 1000))
+
+            store = SnapshotStore(os.path.join(store_path, 'snapshots'))
+            save_time = best_time(lambda: store.save(RESOURCE_KEY, autoload_details))[0]
+            load_time, snapshot = best_time(lambda: store.load(RESOURCE_KEY))
+            assert len(snapshot.autoload_details.attributes) == len(autoload_details.attributes)
+            size = store.list_snapshots(RESOURCE_KEY)[0]['size']
+            store.evict(max_count=0)
+            print('{0:>6} {1:>9} {2:>10.1f} {3:>10.2f} {4:>10.2f}'.format(
+                ports, 'snapshot', size / 1024.0, save_time * 1000, load_time * 1000))
+    finally:
+        shutil.rmtree(store_path)
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or SIZES)
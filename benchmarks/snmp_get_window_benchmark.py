@@ -0,0 +1,98 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""Benchmark of pipelined residual entity GETs against SNMP_GET_WINDOW=1
+
+Discovers a fixture once without latency, then repeats the pipelined GET phase of residual chassis, module
+and power supply attributes with every SNMP_GET_WINDOW while replayed responses take --latency seconds.
+The first repeat of a window creates pysnmp engines of the GET threads, later ones reuse them the way
+later discoveries of the driver process do, both cold and warm phase times are reported.
+Exit status is 1 if a window larger than 1 is not faster than window 1 when engines are reused.
+
+Usage: python benchmarks/snmp_get_window_benchmark.py [--latency SECONDS] [--runs N] [fixture [window ...]]
+"""
+
+import logging
+import os
+import sys
+import time
+import types
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_PATH not in sys.path:
+    sys.path.insert(0, ROOT_PATH)
+
+from autoload_benchmark import ReplayAutoload, load_records
+from snmp_replay import create_snmp_handler
+
+DEFAULT_FIXTURE = 'synthetic_1k'
+DEFAULT_WINDOWS = [1, 2, 4, 8]
+# Typical response time of ASA SNMP agent
+DEFAULT_LATENCY = 0.02
+DEFAULT_RUNS = 3
+
+
+def prepare(records):
+    """Discover the records, so entity lists used by the GET phase are filled
+
+    :rtype: ReplayAutoload
+    """
+
+    logger = logging.getLogger('benchmark')
+    logger.addHandler(logging.NullHandler())
+    autoload = ReplayAutoload(snmp_handler=create_snmp_handler(records, logger), logger=logger,
+                              config=types.ModuleType('config'), snmp_community='public')
+    autoload._get_autoload_details()
+    autoload._release_snmp_workers()
+    return autoload
+
+
+def run_phase(autoload, window):
+    """Read residual entity attributes again with the window
+
+    :rtype: float
+    :return: phase wall time
+    """
+
+    autoload._snmp_get_window = window
+    autoload._snmp_property_cache.clear()
+    autoload.profiler.detach()
+    start = time.time()
+    autoload._prefetch_entity_attributes()
+    elapsed = time.time() - start
+    autoload._release_snmp_workers()
+    return elapsed
+
+
+def main(fixture, windows, latency, runs):
+    autoload = prepare(load_records(fixture))
+    autoload.snmp.target.latency = latency
+    print('{0}, {1:.1f} ms latency'.format(fixture, latency * 1000))
+    print('{0:>7} {1:>13} {2:>13}'.format('window', 'cold, s', 'warm, s'))
+    warm_times = {}
+    for window in windows:
+        ReplayAutoload._snmp_engines = []
+        results = [run_phase(autoload, window) for _ in range(runs)]
+        warm_times[window] = min(results[1:] or results)
+        print('{0:>7} {1:>13.3f} {2:>13.3f}'.format(window, results[0], warm_times[window]))
+
+    if 1 in warm_times and any(warm_times[window] >= warm_times[1] for window in warm_times if window > 1):
+        print('Pipelined GETs are not faster than SNMP_GET_WINDOW=1')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    arguments = sys.argv[1:]
+    latency = DEFAULT_LATENCY
+    runs = DEFAULT_RUNS
+    if '--latency' in arguments:
+        position = arguments.index('--latency')
+        latency = float(arguments[position + 1])
+        del arguments[position:position + 2]
+    if '--runs' in arguments:
+        position = arguments.index('--runs')
+        runs = int(arguments[position + 1])
+        del arguments[position:position + 2]
+    sys.exit(main(arguments[0] if arguments else DEFAULT_FIXTURE, [int(window) for window in arguments[1:]] or
+                  DEFAULT_WINDOWS, latency, runs))
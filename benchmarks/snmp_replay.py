@@ -0,0 +1,177 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""In-process SNMP agent stand-in replaying snmprec fixtures
+
+Fixture is a text file with one 'OID|tag|value' line per managed object instance, tags are ASN.1 type tags
+as snmpsim uses them, 'x' suffix marks hex encoded values. ReplayCommandGenerator answers GET, GETNEXT
+and GETBULK the way pysnmp synchronous CommandGenerator does and notifies pysnmp engine
+observers about every request and response, so the autoload profiler counts replayed traffic as real one.
+Records are held by ReplayTarget, the handler transport target, so autoload worker engines are reused
+for replaying handlers the same way they are for real ones.
+
+Usage: from snmp_replay import ReplayCommandGenerator, create_snmp_handler, load_snmprec
+"""
+
+import bisect
+import os
+import time
+
+from cloudshell.snmp import quali_snmp
+from cloudshell.snmp.quali_snmp import QualiSnmp
+from pysnmp.entity.rfc3413.oneliner import cmdgen
+from pysnmp.proto import rfc1902
+from pysnmp.proto.api import v2c
+from pysnmp.proto.rfc1905 import endOfMibView, noSuchInstance
+from pysnmp.smi import builder, view
+from pysnmp.smi.rfc1902 import ObjectIdentity, ObjectType
+
+SNMPREC_TYPES = {'2': rfc1902.Integer32, '4': rfc1902.OctetString, '5': v2c.Null,
+                 '6': rfc1902.ObjectIdentifier, '64': rfc1902.IpAddress, '65': rfc1902.Counter32,
+                 '66': rfc1902.Gauge32, '67': rfc1902.TimeTicks, '68': rfc1902.Opaque, '70': rfc1902.Counter64}
+
+
+def parse_snmprec_value(tag, value):
+    """Convert snmprec tag and value into pysnmp value
+
+    :param tag: ASN.1 type tag, i.e. '4' or '4x'
+    :param value: value as written in the fixture
+    """
+
+    if tag.endswith('x'):
+        tag = tag[:-1]
+        value = value.decode('hex')
+    value_type = SNMPREC_TYPES[tag]
+    if value_type is v2c.Null:
+        return value_type('')
+    if value_type in (rfc1902.Integer32, rfc1902.Counter32, rfc1902.Gauge32, rfc1902.TimeTicks,
+                      rfc1902.Counter64):
+        return value_type(int(value))
+    return value_type(value)
+
+
+def load_snmprec(file_path):
+    """Read snmprec fixture
+
+    :param file_path: fixture path
+    :rtype: dict
+    :return: pysnmp values by OID tuples
+    """
+
+    records = {}
+    with open(file_path) as fixture_file:
+        for line in fixture_file:
+            line = line.rstrip('\r\n')
+            if not line or line.startswith('#'):
+                continue
+            oid, tag, value = line.split('|', 2)
+            records[tuple(int(arc) for arc in oid.split('.'))] = parse_snmprec_value(tag, value)
+    return records
+
+
+class ReplayTarget(object):
+    """Transport target stand-in holding the fixture records, a response takes latency seconds"""
+
+    def __init__(self, records, latency=0.0):
+        self.records = records
+        self.oids = sorted(records)
+        self.latency = latency
+
+
+class ReplayCommandGenerator(object):
+    """Synchronous CommandGenerator stand-in answering from the records of the transport target,
+    like pysnmp engine it doesn't depend on the device, so autoload can reuse it for any handler"""
+
+    def __init__(self):
+        self.snmpEngine = cmdgen.SnmpEngine()
+        self.mib_builder = self.snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder
+        self.mib_viewer = view.MibViewController(self.mib_builder)
+
+    def _notify(self, transport_target, var_binds):
+        if transport_target.latency:
+            time.sleep(transport_target.latency)
+        request = v2c.GetRequestPDU()
+        v2c.apiPDU.setDefaults(request)
+        self.snmpEngine.observer.storeExecutionContext(self.snmpEngine, 'rfc3412.sendPdu', dict(pdu=request))
+        response = v2c.ResponsePDU()
+        v2c.apiPDU.setDefaults(response)
+        v2c.apiPDU.setRequestID(response, v2c.apiPDU.getRequestID(request))
+        v2c.apiPDU.setVarBinds(response, var_binds)
+        self.snmpEngine.observer.storeExecutionContext(self.snmpEngine, 'rfc3412.receiveMessage:response',
+                                                       dict(pdu=response))
+
+    def _get_oid(self, object_identity):
+        object_identity.resolveWithMib(self.mib_viewer)
+        return tuple(object_identity.getOid())
+
+    def _get_next_oid(self, transport_target, oid):
+        position = bisect.bisect_right(transport_target.oids, oid)
+        return transport_target.oids[position] if position < len(transport_target.oids) else None
+
+    def _make_var_bind(self, oid, value):
+        return ObjectType(ObjectIdentity(oid), value).resolveWithMib(self.mib_viewer)
+
+    def getCmd(self, auth_data, transport_target, *var_names, **kwargs):
+        records = transport_target.records
+        var_binds = [(oid, records.get(oid, noSuchInstance))
+                     for oid in [self._get_oid(var_name) for var_name in var_names]]
+        self._notify(transport_target, var_binds)
+        return None, 0, 0, [self._make_var_bind(oid, value) for oid, value in var_binds]
+
+    def nextCmd(self, auth_data, transport_target, *var_names, **kwargs):
+        records = transport_target.records
+        roots = [self._get_oid(var_name) for var_name in var_names]
+        current_oids = list(roots)
+        var_bind_table = []
+        while True:
+            next_oids = [self._get_next_oid(transport_target, oid) for oid in current_oids]
+            self._notify(transport_target, [(oid, records[oid]) if oid else (current_oid, endOfMibView)
+                                            for oid, current_oid in zip(next_oids, current_oids)])
+            if any(oid is None or oid[:len(root)] != root for oid, root in zip(next_oids, roots)):
+                return None, 0, 0, var_bind_table
+            current_oids = next_oids
+            var_bind_table.append([self._make_var_bind(oid, records[oid]) for oid in next_oids])
+
+    def bulkCmd(self, auth_data, transport_target, non_repeaters, max_repetitions, *var_names, **kwargs):
+        records = transport_target.records
+        roots = [self._get_oid(var_name) for var_name in var_names]
+        current_oids = list(roots)
+        var_bind_table = []
+        while any(oid is not None and oid[:len(root)] == root for oid, root in zip(current_oids, roots)):
+            response_var_binds = []
+            for _ in range(max_repetitions):
+                var_binds = []
+                for position, oid in enumerate(current_oids):
+                    next_oid = self._get_next_oid(transport_target, oid) if oid is not None else None
+                    current_oids[position] = next_oid
+                    if next_oid is None:
+                        var_binds.append((oid or roots[position], endOfMibView))
+                    else:
+                        var_binds.append((next_oid, records[next_oid]))
+                response_var_binds.extend(var_binds)
+                var_bind_table.append([self._make_var_bind(oid, value) for oid, value in var_binds])
+            self._notify(transport_target, response_var_binds)
+        return None, 0, 0, var_bind_table
+
+
+def create_snmp_handler(records, logger=None, latency=0.0):
+    """Create QualiSnmp handler answering from the fixture records instead of the device
+
+    :param records: pysnmp values by OID tuples, see load_snmprec
+    :param logger: logger of the handler
+    :param latency: seconds a response takes
+    :rtype: QualiSnmp
+    """
+
+    snmp_handler = QualiSnmp.__new__(QualiSnmp)
+    snmp_handler.cmd_gen = ReplayCommandGenerator()
+    snmp_handler.mib_builder = snmp_handler.cmd_gen.mib_builder
+    snmp_handler.mib_viewer = snmp_handler.cmd_gen.mib_viewer
+    snmp_handler.mib_path = builder.DirMibSource(os.path.join(os.path.dirname(os.path.abspath(quali_snmp.__file__)),
+                                                              'mibs'))
+    snmp_handler.mib_builder.setMibSources(snmp_handler.mib_path, *snmp_handler.mib_builder.getMibSources())
+    snmp_handler._logger = logger
+    snmp_handler.target = ReplayTarget(records, latency)
+    snmp_handler.security = None
+    snmp_handler._snmp_errors = {}
+    return snmp_handler
@@ -0,0 +1,190 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""Synthetic ASA topology generator
+
+Builds consistent ENTITY-MIB, IF-MIB, IP-MIB, IPV6-MIB, EtherLike-MIB, MAU-MIB, IEEE8023-LAG-MIB,
+CISCO-CDP-MIB and LLDP-MIB records of a device of configurable size: chassis count, modules per chassis,
+ports per module, subinterfaces per port and port-channels. Every port has entity, interface, alias mapping,
+duplex, auto negotiation and IPv4 address rows, even ports have a CDP neighbor, odd ports an LLDP one.
+Records are pysnmp values by OID tuples, the format snmp_replay.create_snmp_handler replays.
+
+Usage: from topology_generator import TopologyGenerator
+"""
+
+from pysnmp.proto import rfc1902
+
+SYSTEM = (1, 3, 6, 1, 2, 1, 1)
+IF_ENTRY = (1, 3, 6, 1, 2, 1, 2, 2, 1)
+IF_X_ENTRY = (1, 3, 6, 1, 2, 1, 31, 1, 1, 1)
+IF_TABLE_LAST_CHANGE = (1, 3, 6, 1, 2, 1, 31, 1, 5, 0)
+IP_ADDR_ENTRY = (1, 3, 6, 1, 2, 1, 4, 20, 1)
+IPV6_ADDR_ENTRY = (1, 3, 6, 1, 2, 1, 55, 1, 8, 1)
+ENT_PHYSICAL_ENTRY = (1, 3, 6, 1, 2, 1, 47, 1, 1, 1, 1)
+ENT_ALIAS_MAPPING_ENTRY = (1, 3, 6, 1, 2, 1, 47, 1, 3, 2, 1)
+ENT_LAST_CHANGE_TIME = (1, 3, 6, 1, 2, 1, 47, 1, 4, 1, 0)
+DOT3_STATS_ENTRY = (1, 3, 6, 1, 2, 1, 10, 7, 2, 1)
+IF_MAU_AUTO_NEG_ENTRY = (1, 3, 6, 1, 2, 1, 26, 5, 1, 1)
+DOT3AD_AGG_PORT_ENTRY = (1, 2, 840, 10006, 300, 43, 1, 2, 1, 1)
+CDP_INTERFACE_ENTRY = (1, 3, 6, 1, 4, 1, 9, 9, 23, 1, 1, 1, 1)
+CDP_CACHE_ENTRY = (1, 3, 6, 1, 4, 1, 9, 9, 23, 1, 2, 1, 1)
+LLDP_LOC_PORT_ENTRY = (1, 0, 8802, 1, 1, 2, 1, 3, 7, 1)
+LLDP_REM_ENTRY = (1, 0, 8802, 1, 1, 2, 1, 4, 1, 1)
+VENDOR_TYPE = (1, 3, 6, 1, 4, 1, 9, 12, 3, 1)
+
+
+class TopologyGenerator(object):
+    """Records of a synthetic ASA, a cluster of chassis under a stack entity if there is more than one chassis"""
+
+    def __init__(self, chassis_count=1, modules_per_chassis=1, ports_per_module=8, subinterfaces_per_port=0,
+                 port_channels=0, ports_per_channel=2, neighbors=True):
+        self.chassis_count = chassis_count
+        self.modules_per_chassis = modules_per_chassis
+        self.ports_per_module = ports_per_module
+        self.subinterfaces_per_port = subinterfaces_per_port
+        self.port_channels = port_channels
+        self.ports_per_channel = ports_per_channel
+        self.neighbors = neighbors
+        self._records = {}
+        self._entity_count = 0
+        self._interface_count = 0
+        self._ip_address_count = 0
+
+    @property
+    def interfaces_count(self):
+        ports = self.chassis_count * self.modules_per_chassis * self.ports_per_module
+        return ports * (1 + self.subinterfaces_per_port) + self.port_channels
+
+    def generate(self):
+        """Build records of the device
+
+        :rtype: dict
+        :return: pysnmp values by OID tuples
+        """
+
+        self._records = {}
+        self._entity_count = 0
+        self._interface_count = 0
+        self._ip_address_count = 0
+        self._add_system_group()
+
+        root = 0
+        if self.chassis_count > 1:
+            root = self._add_entity(0, 11, (), 'Cluster', 'ASA Cluster', -1)
+        ports = []
+        for chassis_number in range(self.chassis_count):
+            ports.extend(self._add_chassis(root, chassis_number))
+        for channel_number in range(self.port_channels):
+            self._add_port_channel(channel_number, ports[channel_number * self.ports_per_channel:
+                                                         (channel_number + 1) * self.ports_per_channel])
+        return self._records
+
+    def _set(self, entry, column, index, value):
+        self._records[entry + (column,) + index] = value
+
+    def _add_system_group(self):
+        for column, value in [(1, rfc1902.OctetString('Cisco Adaptive Security Appliance Version 9.8(2)20')),
+                              (2, rfc1902.ObjectIdentifier('1.3.6.1.4.1.9.1.1196')),
+                              (3, rfc1902.TimeTicks(312345600)), (4, rfc1902.OctetString('noc@example.com')),
+                              (5, rfc1902.OctetString('asa-synthetic-{0}'.format(self.interfaces_count))),
+                              (6, rfc1902.OctetString('lab'))]:
+            self._records[SYSTEM + (column, 0)] = value
+        self._records[ENT_LAST_CHANGE_TIME] = rfc1902.TimeTicks(3100)
+        self._records[IF_TABLE_LAST_CHANGE] = rfc1902.TimeTicks(312340000)
+
+    def _add_entity(self, parent, entity_class, vendor_type, name, descr, position, model='', serial='', revision=''):
+        self._entity_count += 1
+        index = (self._entity_count,)
+        for column, value in [(2, rfc1902.OctetString(descr)),
+                              (3, rfc1902.ObjectIdentifier(VENDOR_TYPE + vendor_type if vendor_type else (0, 0))),
+                              (4, rfc1902.Integer32(parent)), (5, rfc1902.Integer32(entity_class)),
+                              (6, rfc1902.Integer32(position)), (7, rfc1902.OctetString(name)),
+                              (8, rfc1902.OctetString(revision)), (10, rfc1902.OctetString(revision)),
+                              (11, rfc1902.OctetString(serial)), (12, rfc1902.OctetString('Cisco Systems Inc')),
+                              (13, rfc1902.OctetString(model))]:
+            self._set(ENT_PHYSICAL_ENTRY, column, index, value)
+        return self._entity_count
+
+    def _add_interface(self, name, if_type, speed, nameif=''):
+        self._interface_count += 1
+        if_index = self._interface_count
+        mac_address = '\x00\x1e\xf7' + chr(if_index >> 16 & 0xff) + chr(if_index >> 8 & 0xff) + chr(if_index & 0xff)
+        for column, value in [(2, rfc1902.OctetString("Adaptive Security Appliance '{0}' interface".format(
+                                   nameif or name))),
+                              (3, rfc1902.Integer32(if_type)), (4, rfc1902.Integer32(1500)),
+                              (5, rfc1902.Gauge32(min(speed, 4294967295))), (6, rfc1902.OctetString(mac_address)),
+                              (7, rfc1902.Integer32(1)), (8, rfc1902.Integer32(1 if nameif else 2))]:
+            self._set(IF_ENTRY, column, (if_index,), value)
+        for column, value in [(1, rfc1902.OctetString(name)), (15, rfc1902.Gauge32(speed // 1000000)),
+                              (18, rfc1902.OctetString(nameif))]:
+            self._set(IF_X_ENTRY, column, (if_index,), value)
+        return if_index
+
+    def _add_ip_address(self, if_index):
+        self._ip_address_count += 1
+        address = (10, self._ip_address_count >> 16 & 0xff, self._ip_address_count >> 8 & 0xff,
+                   self._ip_address_count & 0xff)
+        for column, value in [(1, rfc1902.IpAddress('.'.join(str(octet) for octet in address))),
+                              (2, rfc1902.Integer32(if_index)), (3, rfc1902.IpAddress('255.255.255.0'))]:
+            self._set(IP_ADDR_ENTRY, column, address, value)
+        if not if_index % 4:
+            index = (if_index, 32, 1, 13, 184) + (0,) * 10 + (if_index >> 8 & 0xff, if_index & 0xff)
+            self._set(IPV6_ADDR_ENTRY, 2, index, rfc1902.Integer32(64))
+            self._set(IPV6_ADDR_ENTRY, 3, index, rfc1902.Integer32(2))
+
+    def _add_chassis(self, root, chassis_number):
+        chassis = self._add_entity(root, 3, (3, 931), 'Chassis {0}'.format(chassis_number), 'ASA 5585-X',
+                                   chassis_number if root else -1, 'ASA5585', 'JMX{0:08d}'.format(chassis_number),
+                                   'V02')
+        for power_supply_number in range(2):
+            bay = self._add_entity(chassis, 5, (5, 1), 'Power Supply Bay {0}'.format(power_supply_number),
+                                   'Power Supply Bay', 100 + power_supply_number)
+            self._add_entity(bay, 6, (6, 10), 'Power Supply {0}'.format(power_supply_number),
+                             'ASA 5585-X AC Power Supply', 0, 'ASA5585-PWR-AC',
+                             'POG{0:04d}{1}'.format(chassis_number, power_supply_number), 'V02')
+        self._add_entity(chassis, 7, (7, 167), 'Chassis Cooling Fan', 'ASA 5585-X Chassis Fan', 102)
+        self._add_entity(chassis, 8, (8, 1), 'Temperature Sensor', 'Chassis Temperature Sensor', 103)
+
+        ports = []
+        for module_number in range(self.modules_per_chassis):
+            slot = self._add_entity(chassis, 5, (5, 1), 'Slot {0}'.format(module_number),
+                                    'ASA 5585-X Slot {0}'.format(module_number), module_number)
+            module = self._add_entity(slot, 9, (9, 83, 19), 'Module {0}'.format(module_number),
+                                      'ASA 5585-X Network Module', 0, 'ASA5585-NM-20-1GE',
+                                      'JAF{0:04d}{1:04d}'.format(chassis_number, module_number), '1.0')
+            for port_number in range(self.ports_per_module):
+                ports.append(self._add_port(module, chassis_number * self.modules_per_chassis + module_number,
+                                            port_number))
+        return ports
+
+    def _add_port(self, module, module_number, port_number):
+        name = 'GigabitEthernet{0}/{1}'.format(module_number, port_number)
+        entity = self._add_entity(module, 10, (10, 172), name, 'Gigabit Ethernet port', port_number)
+        if_index = self._add_interface(name, 6, 1000000000, 'port{0}-{1}'.format(module_number, port_number))
+        self._set(ENT_ALIAS_MAPPING_ENTRY, 2, (entity, 0), rfc1902.ObjectIdentifier(IF_ENTRY + (1, if_index)))
+        self._set(DOT3_STATS_ENTRY, 1, (if_index,), rfc1902.Integer32(if_index))
+        self._set(DOT3_STATS_ENTRY, 19, (if_index,), rfc1902.Integer32(3 if port_number % 3 else 2))
+        self._set(IF_MAU_AUTO_NEG_ENTRY, 1, (if_index, 1), rfc1902.Integer32(1 if port_number % 2 else 2))
+        self._add_ip_address(if_index)
+
+        if self.neighbors and port_number % 2:
+            self._set(LLDP_LOC_PORT_ENTRY, 4, (if_index,), rfc1902.OctetString(name))
+            self._set(LLDP_REM_ENTRY, 8, (0, if_index, 1), rfc1902.OctetString('Eth1/{0}'.format(if_index)))
+            self._set(LLDP_REM_ENTRY, 9, (0, if_index, 1), rfc1902.OctetString('leaf-{0}'.format(module_number)))
+        elif self.neighbors:
+            self._set(CDP_INTERFACE_ENTRY, 2, (if_index,), rfc1902.Integer32(1))
+            self._set(CDP_CACHE_ENTRY, 6, (if_index, 1), rfc1902.OctetString('switch-{0}'.format(module_number)))
+            self._set(CDP_CACHE_ENTRY, 7, (if_index, 1), rfc1902.OctetString('Gi1/0/{0}'.format(port_number + 1)))
+
+        for subinterface_number in range(1, self.subinterfaces_per_port + 1):
+            subinterface = self._add_interface('{0}.{1}'.format(name, subinterface_number), 135, 1000000000,
+                                               'vlan{0}-{1}'.format(if_index, subinterface_number))
+            self._add_ip_address(subinterface)
+        return if_index
+
+    def _add_port_channel(self, channel_number, members):
+        channel = self._add_interface('Port-channel{0}'.format(channel_number + 1), 161,
+                                      1000000000 * max(len(members), 1), 'channel{0}'.format(channel_number + 1))
+        self._add_ip_address(channel)
+        for member in members:
+            self._set(DOT3AD_AGG_PORT_ENTRY, 13, (member,), rfc1902.Integer32(channel))
@@ -0,0 +1,75 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""Autoload scaling benchmark over synthetic topologies
+
+Discovers synthetic clusters of CHASSIS_COUNT chassis with MODULES_PER_CHASSIS modules, a subinterface
+per port and PORT_CHANNELS port-channels, growing ports per module. Every size runs in a fresh interpreter,
+wall time, request PDU count and peak RSS are printed per size and optionally written to a CSV file to chart
+how discovery grows with the device.
+
+Usage: python benchmarks/topology_scale_benchmark.py [--csv file] [ports per module ...]
+"""
+
+import csv
+import json
+import os
+import subprocess
+import sys
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_PATH not in sys.path:
+    sys.path.insert(0, ROOT_PATH)
+
+from autoload_benchmark import discover
+from topology_generator import TopologyGenerator
+
+PORTS_PER_MODULE = [6, 12, 25, 50, 100]
+CHASSIS_COUNT = 2
+MODULES_PER_CHASSIS = 4
+SUBINTERFACES_PER_PORT = 1
+PORT_CHANNELS = 8
+COLUMNS = ['ports', 'interfaces', 'resources', 'attributes', 'wall_time', 'pdus', 'peak_memory_kb']
+
+
+def build_generator(ports_per_module):
+    return TopologyGenerator(chassis_count=CHASSIS_COUNT, modules_per_chassis=MODULES_PER_CHASSIS,
+                             ports_per_module=ports_per_module, subinterfaces_per_port=SUBINTERFACES_PER_PORT,
+                             port_channels=PORT_CHANNELS, ports_per_channel=4)
+
+
+def main(sizes, csv_file_path):
+    print('{0:>6} {1:>10} {2:>10} {3:>11} {4:>13} {5:>6} {6:>13} {7:>14}'.format(
+        'ports', 'interfaces', 'resources', 'attributes', 'wall time, s', 'PDUs', 'peak RSS, KB', 'per port, ms'))
+    rows = []
+    for ports_per_module in sizes:
+        generator = build_generator(ports_per_module)
+        output = subprocess.check_output([sys.executable, os.path.abspath(__file__), '--measure',
+                                          str(ports_per_module)])
+        row = json.loads(output.strip().splitlines()[-1])
+        row['ports'] = CHASSIS_COUNT * MODULES_PER_CHASSIS * ports_per_module
+        row['interfaces'] = generator.interfaces_count
+        rows.append(row)
+        print('{0:>6} {1:>10} {2:>10} {3:>11} {4:>13.3f} {5:>6} {6:>13} {7:>14.3f}'.format(
+            row['ports'], row['interfaces'], row['resources'], row['attributes'], row['wall_time'], row['pdus'],
+            row['peak_memory_kb'], row['wall_time'] * 1000 / row['ports']))
+
+    if csv_file_path:
+        with open(csv_file_path, 'wb') as csv_file:
+            writer = csv.DictWriter(csv_file, COLUMNS, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3 and sys.argv[1] == '--measure':
+        print(json.dumps(discover(build_generator(int(sys.argv[2])).generate())))
+        sys.exit(0)
+
+    arguments = sys.argv[1:]
+    csv_path = None
+    if '--csv' in arguments:
+        position = arguments.index('--csv')
+        csv_path = arguments[position + 1]
+        del arguments[position:position + 2]
+    main([int(size) for size in arguments] or PORTS_PER_MODULE, csv_path)
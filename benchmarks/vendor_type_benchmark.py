@@ -0,0 +1,103 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""Startup and lookup benchmark of entPhysicalVendorType resolution
+
+Compares loading CISCO-ENTITY-VENDORTYPE-OID-MIB and CISCO-PRODUCTS-MIB through pysnmp with the OID trie
+built from the precompiled vendor type and products tables.
+Every path runs in a fresh interpreter, wall time and RSS growth are measured after pysnmp is imported,
+lookup time is measured over LOOKUPS vendor type OIDs.
+
+Usage: python benchmarks/vendor_type_benchmark.py [repeats]
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_PATH not in sys.path:
+    sys.path.insert(0, ROOT_PATH)
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+MIBS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'cloudshell', 'firewall', 'cisco', 'asa',
+                                         'mibs'))
+VENDOR_TYPE_PREFIX = (1, 3, 6, 1, 4, 1, 9, 12, 3, 1)
+VENDOR_TYPES = [VENDOR_TYPE_PREFIX + arcs for arcs in [(3, 931), (5, 1), (6, 10), (9, 83), (10, 132), (9, 2, 1)]]
+LOOKUPS = 10000
+PATHS = ['mib', 'trie']
+
+
+def get_rss_kb():
+    if resource is None:
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def load_mib():
+    from pysnmp.smi import builder, view
+
+    mib_builder = builder.MibBuilder()
+    mib_builder.addMibSources(builder.DirMibSource(MIBS_PATH))
+    mib_builder.loadModules('CISCO-ENTITY-VENDORTYPE-OID-MIB', 'CISCO-PRODUCTS-MIB')
+    mib_view = view.MibViewController(mib_builder)
+
+    def lookup(oid):
+        mod_name, node_name, suffix = mib_view.getNodeLocation(oid)
+        return node_name, 'chassis' if 'cevchassis' in node_name.lower() else None
+    return lookup
+
+
+def load_trie():
+    from cloudshell.firewall.cisco.asa.autoload.cisco_products_oids import CISCO_PRODUCTS, CISCO_PRODUCTS_PREFIX
+    from cloudshell.firewall.cisco.asa.autoload.cisco_vendortype_oids import CISCO_VENDORTYPES
+    from cloudshell.firewall.cisco.asa.autoload.oid_trie import OidTrie
+
+    items = [(CISCO_PRODUCTS_PREFIX + (arc,), name) for arc, name in CISCO_PRODUCTS.items()]
+    items.extend((VENDOR_TYPE_PREFIX + arcs, name) for arcs, name in CISCO_VENDORTYPES)
+    trie = OidTrie(items)
+
+    def lookup(oid):
+        prefixes = trie.prefixes(oid)
+        return prefixes[-1][1], 'chassis' if prefixes[0][1] == 'cevChassis' else None
+    return lookup
+
+
+def measure(path):
+    import pysnmp.smi.builder
+    import pysnmp.smi.view
+
+    rss = get_rss_kb()
+    start = time.time()
+    lookup = load_mib() if path == 'mib' else load_trie()
+    elapsed = time.time() - start
+    rss = get_rss_kb() - rss
+    start = time.time()
+    for number in range(LOOKUPS):
+        name = lookup(VENDOR_TYPES[number % len(VENDOR_TYPES)])[0]
+    print('{0} {1} {2} {3}'.format(name, elapsed, rss, time.time() - start))
+
+
+def main(repeats):
+    print('{0:>6} {1:>14} {2:>16} {3:>20}'.format('path', 'load time, ms', 'RSS growth, KB',
+                                                  'lookup time, us'))
+    for path in PATHS:
+        results = []
+        for _ in range(repeats):
+            output = subprocess.check_output([sys.executable, __file__, '--measure', path]).split()
+            results.append((float(output[1]), int(output[2]), float(output[3])))
+        elapsed, rss, lookup_time = min(results)
+        print('{0:>6} {1:>14.2f} {2:>16} {3:>20.2f}'.format(path, elapsed * 1000, rss,
+                                                            lookup_time * 1000000 / LOOKUPS))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3 and sys.argv[1] == '--measure':
+        measure(sys.argv[2])
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
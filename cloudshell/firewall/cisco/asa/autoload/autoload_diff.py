@@ -0,0 +1,70 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict
+
+from cloudshell.shell.core.driver_context import AutoLoadDetails
+
+
+class AutoloadDiff(object):
+    """Difference between two AutoLoadDetails.
+
+    Resources are matched by relative_address, attributes by relative_address and attribute_name.
+    Changed items are kept as (old, new) pairs, added and changed items keep the order of the new details.
+    """
+
+    def __init__(self, old_details, new_details):
+        old_resources = OrderedDict((resource.relative_address, resource) for resource in old_details.resources)
+        new_resources = OrderedDict((resource.relative_address, resource) for resource in new_details.resources)
+        old_attributes = OrderedDict(((attribute.relative_address, attribute.attribute_name), attribute)
+                                     for attribute in old_details.attributes)
+        new_attributes = OrderedDict(((attribute.relative_address, attribute.attribute_name), attribute)
+                                     for attribute in new_details.attributes)
+
+        self.added_resources = [resource for key, resource in new_resources.iteritems() if key not in old_resources]
+        self.removed_resources = [resource for key, resource in old_resources.iteritems()
+                                  if key not in new_resources]
+        self.changed_resources = [(old_resources[key], resource) for key, resource in new_resources.iteritems()
+                                  if key in old_resources and self._get_resource_data(old_resources[key]) !=
+                                  self._get_resource_data(resource)]
+
+        self.added_attributes = [attribute for key, attribute in new_attributes.iteritems()
+                                 if key not in old_attributes]
+        self.removed_attributes = [attribute for key, attribute in old_attributes.iteritems()
+                                   if key not in new_attributes]
+        self.changed_attributes = [(old_attributes[key], attribute) for key, attribute in new_attributes.iteritems()
+                                   if key in old_attributes and
+                                   old_attributes[key].attribute_value != attribute.attribute_value]
+
+    @staticmethod
+    def _get_resource_data(resource):
+        return resource.model, resource.name, resource.unique_identifier
+
+    @property
+    def is_empty(self):
+        return not (self.added_resources or self.removed_resources or self.changed_resources or
+                    self.added_attributes or self.removed_attributes or self.changed_attributes)
+
+    def get_summary(self):
+        """Count added, removed and changed items
+
+        :rtype: dict
+        """
+
+        return {'added_resources': len(self.added_resources),
+                'removed_resources': len(self.removed_resources),
+                'changed_resources': len(self.changed_resources),
+                'added_attributes': len(self.added_attributes),
+                'removed_attributes': len(self.removed_attributes),
+                'changed_attributes': len(self.changed_attributes)}
+
+    def get_delta_details(self):
+        """Build AutoLoadDetails with added and changed resources and attributes only,
+        removed items can't be expressed in AutoLoadDetails
+
+        :rtype: AutoLoadDetails
+        """
+
+        resources = self.added_resources + [new for old, new in self.changed_resources]
+        attributes = self.added_attributes + [new for old, new in self.changed_attributes]
+        return AutoLoadDetails(resources=resources, attributes=attributes)
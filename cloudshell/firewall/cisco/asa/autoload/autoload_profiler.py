@@ -0,0 +1,164 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import json
+import threading
+import time
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
+
+from pysnmp.proto.api import v2c
+
+
+def autoload_phase(function):
+    """Record the method as a discovery phase of the autoload profiler, phase name is the method name"""
+
+    @wraps(function)
+    def wrapper(self, *args, **kwargs):
+        with self.profiler.phase(function.__name__):
+            return function(self, *args, **kwargs)
+    return wrapper
+
+
+class AutoloadProfiler(object):
+    """Wall time and SNMP traffic of discovery phases.
+
+    PDUs are counted by pysnmp engine observers of the attached SNMP handlers, every request PDU sent,
+    retransmissions included, is counted for the innermost phase of the thread that sent it.
+    Retries are retransmitted request ids, timeouts are request ids left without a response.
+    Phase wall time includes nested phases, SNMP counters don't.
+    """
+
+    COUNTERS = ['pdus', 'varbinds', 'retries', 'timeouts']
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._phases = OrderedDict()
+        self._default_phase = None
+        self._observers = []
+        self._start_time = time.time()
+
+    def attach(self, snmp_handler):
+        """Count SNMP traffic of the handler, handlers without pysnmp engine observer are skipped
+
+        :param snmp_handler: QualiSnmp handler
+        :return:
+        """
+
+        observer = getattr(getattr(getattr(snmp_handler, 'cmd_gen', None), 'snmpEngine', None), 'observer', None)
+        if observer is None or any(attached is observer for attached, callback in self._observers):
+            return
+
+        requests = {}
+
+        def callback(snmp_engine, execpoint, variables, context):
+            self._count_pdu(requests, execpoint, variables.get('pdu'))
+
+        observer.registerObserver(callback, 'rfc3412.sendPdu', 'rfc3412.receiveMessage:response')
+        self._observers.append((observer, callback))
+
+    def detach(self):
+        """Stop counting SNMP traffic of all attached handlers
+
+        :return:
+        """
+
+        for observer, callback in self._observers:
+            observer.unregisterObserver(callback)
+        self._observers = []
+
+    def _count_pdu(self, requests, execpoint, pdu):
+        if pdu is None:
+            return
+        request_id = int(v2c.apiPDU.getRequestID(pdu))
+        with self._lock:
+            phase = self._get_phase(self._get_current_phase_name())
+            if execpoint == 'rfc3412.sendPdu':
+                phase['pdus'] += 1
+                if request_id in requests:
+                    phase['retries'] += 1
+                else:
+                    requests[request_id] = phase
+                    phase['timeouts'] += 1
+            elif request_id in requests:
+                requests.pop(request_id)['timeouts'] -= 1
+                phase['varbinds'] += len(v2c.apiPDU.getVarBinds(pdu))
+
+    def _get_phase(self, name):
+        if name not in self._phases:
+            self._phases[name] = dict([('calls', 0), ('wall_time', 0.0), ('parent', None)] +
+                                      [(counter, 0) for counter in self.COUNTERS])
+        return self._phases[name]
+
+    def _get_phase_stack(self):
+        if not hasattr(self._local, 'phase_stack'):
+            self._local.phase_stack = []
+        return self._local.phase_stack
+
+    def _get_current_phase_name(self):
+        phase_stack = self._get_phase_stack()
+        if phase_stack:
+            return phase_stack[-1]
+        return self._default_phase or 'other'
+
+    @contextmanager
+    def phase(self, name):
+        """Record wall time and SNMP traffic of the block as the phase,
+        calls of the same phase are summed up
+
+        :param name: phase name
+        """
+
+        phase_stack = self._get_phase_stack()
+        parent = phase_stack[-1] if phase_stack else None
+        with self._lock:
+            phase = self._get_phase(name)
+            phase['calls'] += 1
+            if phase['parent'] is None:
+                phase['parent'] = parent
+            if not phase_stack and threading.current_thread().name == 'MainThread':
+                self._default_phase = name
+        phase_stack.append(name)
+        start_time = time.time()
+        try:
+            yield
+        finally:
+            phase_stack.pop()
+            with self._lock:
+                phase['wall_time'] += time.time() - start_time
+
+    def get_report(self):
+        """Build profile report
+
+        :rtype: dict
+        :return: total wall time, totals of SNMP counters and list of phases in order of the first call
+        """
+
+        with self._lock:
+            phases = []
+            for name, phase in self._phases.iteritems():
+                phase_report = OrderedDict([('name', name), ('parent', phase['parent']), ('calls', phase['calls']),
+                                            ('wall_time', round(phase['wall_time'], 6))])
+                phase_report.update((counter, phase[counter]) for counter in self.COUNTERS)
+                phases.append(phase_report)
+            totals = OrderedDict((counter, sum(phase[counter] for phase in self._phases.itervalues()))
+                                 for counter in self.COUNTERS)
+        return OrderedDict([('timestamp', self._start_time), ('wall_time', round(time.time() - self._start_time, 6)),
+                            ('totals', totals), ('phases', phases)])
+
+    def write_report(self, file_path, report=None, **extra):
+        """Append profile report as a JSON line to the metrics file
+
+        :param file_path: metrics file path
+        :param report: report to write, current report by default
+        :param extra: additional top level report fields, i.e. resource name
+        :return:
+        """
+
+        report = OrderedDict(report or self.get_report())
+        report.update(sorted(extra.iteritems()))
+        with open(file_path, 'a') as metrics_file:
+            metrics_file.write(json.dumps(report) + '\n')
@@ -0,0 +1,54 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import os
+import stat
+
+CACHE_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+
+
+def get_cache_path(name):
+    """Get default cache directory of the driver, it lives next to the driver package and not in a shared
+    temporary directory, where other users could plant files
+
+    :param name: cache name, i.e. 'mibs'
+    :rtype: str
+    """
+
+    return os.path.join(CACHE_ROOT, name)
+
+
+def ensure_private_directory(path):
+    """Create directory with 0700 mode if it's missing and check it's safe to load cached code and data from it,
+    it must be a real directory owned by the current user and not writable by group or others
+
+    :param path: directory path
+    :rtype: bool
+    :return: True if the directory is private
+    """
+
+    try:
+        os.makedirs(path, 0o700)
+    except OSError:
+        pass
+    try:
+        path_stat = os.lstat(path)
+    except OSError:
+        return False
+    if not stat.S_ISDIR(path_stat.st_mode):
+        return False
+    if hasattr(os, 'getuid'):
+        return path_stat.st_uid == os.getuid() and not path_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    return True
+
+
+def is_own_file(file_object):
+    """Check opened cache file is owned by the current user
+
+    :param file_object: opened file
+    :rtype: bool
+    """
+
+    if not hasattr(os, 'getuid'):
+        return True
+    return os.fstat(file_object.fileno()).st_uid == os.getuid()
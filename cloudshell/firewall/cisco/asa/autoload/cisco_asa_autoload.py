@@ -0,0 +1,407 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import hashlib
+import inject
+import json
+import os
+import tempfile
+import threading
+import time
+
+from functools import partial
+from multiprocessing.pool import ThreadPool
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from cloudshell.configuration.cloudshell_cli_binding_keys import CLI_SERVICE, CONNECTION_MANAGER, SESSION
+from cloudshell.configuration.cloudshell_shell_core_binding_keys import LOGGER, CONFIG
+from cloudshell.firewall.cisco.asa.autoload.cache_directory import ensure_private_directory
+from cloudshell.firewall.cisco.asa.autoload.cisco_asa_cli_autoload import CiscoASACLIAutoload
+from cloudshell.firewall.cisco.asa.autoload.cisco_asa_context_autoload import CiscoASAContextAutoload
+from cloudshell.firewall.cisco.asa.autoload.cisco_asa_snmp_autoload import CiscoASASNMPAutoload
+from cloudshell.firewall.cisco.asa.autoload.cli_output_parser import iter_lines, parse_contexts, parse_hostname
+from cloudshell.firewall.cisco.asa.autoload.snapshot_store import SnapshotStore
+from cloudshell.firewall.operations.interfaces.autoload_operations_interface import AutoloadOperationsInterface
+from cloudshell.shell.core.config_utils import override_attributes_from_config
+from cloudshell.shell.core.context_utils import get_attribute_by_name, get_context, get_resource_address, \
+    get_resource_name, put_context
+from cloudshell.shell.core.driver_context import AutoLoadDetails
+
+
+class CiscoASAAutoload(AutoloadOperationsInterface):
+    """Autoload running SNMP or CLI discovery depending on AUTOLOAD_MODE.
+
+    'snmp' and 'cli' always use the same engine. 'auto' switches only between engines that found the same chassis,
+    ports and port channels for the resource, the only parts of the tree both engines build: CLI doesn't report
+    power ports, Adjacent and modules without ports, and engines address resources differently, SNMP by entity
+    positions and CLI by interface numbers, so switching engines readdresses modules and ports.
+    The first autoload runs every engine to record its time and tree and returns the result of the first successful
+    one, SNMP first. Next autoloads run the fastest engine with the tree of the engine used last time and fall back
+    only to engines with that tree. Times, trees and the last engine are kept per resource in a JSON file
+    in the autoload cache folder.
+
+    With AUTOLOAD_CONTEXTS_ENABLED security contexts of a multiple context device are discovered as well,
+    every context over CLI in its own session, while the device itself is discovered in the autoload session.
+    Contexts are sub-resources CTX-<context name> of the device with ports of the context interfaces.
+    """
+
+    AUTOLOAD_MODE = 'snmp'
+    AUTOLOAD_MODES = ['snmp', 'cli', 'auto']
+    AUTOLOAD_CACHE_PATH = None
+    AUTOLOAD_TIMINGS_FILE = 'autoload_timings.json'
+    # Resource models every engine discovers with the same names
+    TREE_SIGNATURE_MODELS = ['Generic Chassis', 'Generic Port', 'Generic Port Channel']
+    _timings_lock = threading.Lock()
+    AUTOLOAD_CONTEXTS_ENABLED = False
+    AUTOLOAD_CONTEXT_WORKERS = 4
+
+    def __init__(self, snmp_handler=None, logger=None, config=None, cli_service=None, snmp_community=None,
+                 session=None):
+        """Basic init with injected snmp handler, cli service and logger, engines are created on demand
+
+        :param snmp_handler:
+        :param logger:
+        :param config:
+        :param cli_service:
+        :param snmp_community:
+        :param session: CLI session of CLI discovery
+        :return:
+        """
+
+        self._snmp_handler = snmp_handler
+        self._logger = logger
+        self._config = config
+        self._cli_service = cli_service
+        self._snmp_community = snmp_community
+        self._session = session
+
+        """Override attributes from global config"""
+        overridden_config = override_attributes_from_config(CiscoASAAutoload, config=self.config)
+        self._autoload_mode = overridden_config.AUTOLOAD_MODE.lower()
+        if self._autoload_mode not in self.AUTOLOAD_MODES:
+            raise Exception(self.__class__.__name__, 'Unsupported autoload mode {0}, supported modes are {1}'.format(
+                overridden_config.AUTOLOAD_MODE, ', '.join(self.AUTOLOAD_MODES)))
+        self._timings_path = os.path.join(SnapshotStore(overridden_config.AUTOLOAD_CACHE_PATH).store_path,
+                                          overridden_config.AUTOLOAD_TIMINGS_FILE)
+        self._autoload_contexts_enabled = overridden_config.AUTOLOAD_CONTEXTS_ENABLED
+        self._autoload_context_workers = overridden_config.AUTOLOAD_CONTEXT_WORKERS
+        self._engines = {'snmp': self.create_snmp_autoload, 'cli': self.create_cli_autoload}
+        self._hostname = None
+        self._worker_local = threading.local()
+
+    @property
+    def logger(self):
+        worker_logger = getattr(self._worker_local, 'logger', None)
+        if worker_logger:
+            return worker_logger
+        return self._logger or inject.instance(LOGGER)
+
+    @property
+    def config(self):
+        return self._config or inject.instance(CONFIG)
+
+    @property
+    def cli_service(self):
+        return self._cli_service or inject.instance(CLI_SERVICE)
+
+    @property
+    def session(self):
+        return self._session or inject.instance(SESSION)
+
+    def create_snmp_autoload(self):
+        return CiscoASASNMPAutoload(snmp_handler=self._snmp_handler, logger=self._logger, config=self._config,
+                                    cli_service=self._cli_service, snmp_community=self._snmp_community)
+
+    def create_cli_autoload(self):
+        return CiscoASACLIAutoload(logger=self._logger, config=self._config, cli_service=self._cli_service,
+                                   session=self._session)
+
+    def create_context_autoload(self, context, session, hostname=None):
+        return CiscoASAContextAutoload(context, logger=self.logger, config=self._config,
+                                       cli_service=self._cli_service, session=session, hostname=hostname)
+
+    def discover(self):
+        """General entry point for autoload
+
+        :return: AutoLoadDetails object or Exception
+        """
+
+        if not self._autoload_contexts_enabled:
+            return self._discover_device()
+
+        contexts = self._get_security_contexts()
+        if not contexts:
+            self.logger.info('No security contexts found, discovering the device only')
+            return self._discover_device()
+
+        self._hostname = self._get_hostname()
+        workers_count = self._get_context_workers_count(len(contexts))
+        self.logger.info('Discovering {0} security contexts with {1} workers'.format(len(contexts), workers_count))
+        start_time = time.time()
+        if not workers_count:
+            result = self._discover_device()
+            context_results = []
+            session_valid = True
+            for context in contexts:
+                if session_valid:
+                    context_result, session_valid = self._discover_context(context, self.session)
+                else:
+                    self.logger.error('Context {0} is added without interfaces, session is dropped'.format(
+                        context['name']))
+                    context_result = self._get_context_without_interfaces(context)
+                context_results.append(context_result)
+        else:
+            pool = ThreadPool(workers_count)
+            try:
+                async_result = pool.map_async(partial(self._discover_context_in_pool_session, get_context(),
+                                                      self.logger), contexts)
+                result = self._discover_device()
+                context_results = async_result.get()
+            finally:
+                pool.close()
+                pool.join()
+        self.logger.info('Device and {0} security contexts discovered in {1:.3f} sec'.format(
+            len(contexts), time.time() - start_time))
+
+        resources = list(result.resources)
+        attributes = list(result.attributes)
+        for context_result in context_results:
+            resources.extend(context_result.resources)
+            attributes.extend(context_result.attributes)
+        return AutoLoadDetails(resources=resources, attributes=attributes)
+
+    def _get_security_contexts(self):
+        """Read security contexts with 'show context', single context devices have none
+
+        :rtype: list
+        :return: parsed 'show context' records
+        """
+
+        try:
+            output = self.cli_service.send_command('show context')
+        except Exception as e:
+            self.logger.error('Failed to read security contexts: {0}'.format(e))
+            return []
+        return list(parse_contexts(iter_lines(output or '')))
+
+    def _get_hostname(self):
+        """Read device hostname with 'show hostname', context prompts are '<hostname>/<context>#'
+
+        :rtype: str
+        :return: hostname or None if it can't be read
+        """
+
+        try:
+            output = self.cli_service.send_command('show hostname')
+        except Exception as e:
+            self.logger.error('Failed to read hostname, any prompt hostname is accepted: {0}'.format(e))
+            return None
+        return parse_hostname(iter_lines(output or '')) or None
+
+    def _get_context_workers_count(self, contexts_count):
+        """Get number of concurrent context workers. Every worker takes a session from the CLI session pool
+        which already holds the autoload session, 0 means contexts are discovered one by one in the autoload session
+
+        :param contexts_count: number of security contexts
+        :rtype: int
+        """
+
+        try:
+            sessions_limit = int(get_attribute_by_name('Sessions Concurrency Limit') or 1)
+        except Exception:
+            sessions_limit = 1
+        workers_count = max(0, min(self._autoload_context_workers, contexts_count, sessions_limit - 1))
+        if not workers_count and self._autoload_context_workers > 0:
+            self.logger.warning('\'Sessions Concurrency Limit\' is {0}, security contexts are discovered one by one '
+                                'after the device, set it to {1} to discover them concurrently'.format(
+                                    sessions_limit, min(self._autoload_context_workers, contexts_count) + 1))
+        return workers_count
+
+    def _discover_context_in_pool_session(self, command_context, logger, context):
+        """Discover security context in a session taken from the CLI session pool, the session is returned after
+        unless it was set invalid. Injected logger and session pool are bound to the command context of the thread,
+        so the command context and the logger of the autoload thread are put into the pool thread first
+
+        :param command_context: command context of the autoload thread
+        :param logger: logger of the autoload thread
+        :param context: parsed 'show context' record
+        :rtype: AutoLoadDetails
+        """
+
+        if command_context is not None:
+            put_context(command_context)
+        self._worker_local.logger = logger
+        connection_manager = inject.instance(CONNECTION_MANAGER)
+        try:
+            session = connection_manager.get_session_instance()
+        except Exception as e:
+            self.logger.error('Failed to get session for context {0}: {1}'.format(context['name'], e))
+            return self._get_context_without_interfaces(context)
+        try:
+            result, session_valid = self._discover_context(context, session)
+        except Exception:
+            session.set_invalid()
+            raise
+        if session_valid:
+            connection_manager.return_session_to_pool(session)
+        return result
+
+    def _discover_context(self, context, session):
+        """Discover security context, failed context is added without interfaces
+
+        :param context: parsed 'show context' record
+        :param session: CLI session in the system execution space
+        :rtype: tuple
+        :return: AutoLoadDetails and False if the session was set invalid and must not be used again
+        """
+
+        start_time = time.time()
+        context_autoload = self.create_context_autoload(context, session, self._hostname)
+        try:
+            result = context_autoload.discover()
+        except Exception as e:
+            self.logger.error('Failed to discover context {0}: {1}'.format(context['name'], e))
+            return self._get_context_without_interfaces(context), context_autoload.session_valid
+        self.logger.info('Context {0} discovered in {1:.3f} sec'.format(context['name'], time.time() - start_time))
+        return result, context_autoload.session_valid
+
+    def _get_context_without_interfaces(self, context):
+        context_object = self.create_context_autoload(context, None).get_context_resource()
+        return AutoLoadDetails(resources=[context_object.get_autoload_resource_details()],
+                               attributes=context_object.get_autoload_resource_attributes())
+
+    def _discover_device(self):
+        """Discover the device with the engine of AUTOLOAD_MODE
+
+        :return: AutoLoadDetails object
+        """
+
+        if self._autoload_mode != 'auto':
+            return self._engines[self._autoload_mode]().discover()
+
+        resource_key = self._get_resource_key()
+        record = self._load_timings().get(resource_key, {}) if resource_key else {}
+        times = dict(record.get('times', {}))
+        # Records of previous driver versions hold signatures of the whole tree under 'trees', they are not used
+        trees = dict(record.get('port_trees', {}))
+        last_engine = record.get('engine')
+        first_autoload = last_engine not in self._engines or last_engine not in trees
+        if first_autoload:
+            engines = sorted(self._engines, key=lambda name: name != 'snmp')
+        else:
+            engines = sorted((name for name in self._engines if trees.get(name) == trees[last_engine]),
+                             key=lambda name: (times.get(name) is None, times.get(name), name != last_engine))
+            for name in sorted(set(self._engines) - set(engines)):
+                self.logger.info('{0} autoload is not used, its ports differ from {1} autoload ones'.format(
+                    name.upper(), last_engine.upper()))
+        self.logger.info('Autoload engines order: {0}, previous times: {1}'.format(', '.join(engines),
+                                                                                   json.dumps(times)))
+
+        result = None
+        error = None
+        for engine in engines:
+            start_time = time.time()
+            try:
+                engine_result = self._engines[engine]().discover()
+            except Exception as e:
+                times[engine] = None
+                error = error or e
+                self.logger.error('{0} autoload failed: {1}'.format(engine.upper(), e))
+                continue
+            times[engine] = time.time() - start_time
+            trees[engine] = self._get_tree_signature(engine_result)
+            self.logger.info('{0} autoload completed in {1:.3f} sec'.format(engine.upper(), times[engine]))
+            if result is None:
+                if not first_autoload and engine != last_engine:
+                    self.logger.info('Switching from {0} to {1} autoload, resources are readdressed'.format(
+                        last_engine.upper(), engine.upper()))
+                result = engine_result
+                last_engine = engine
+            if not first_autoload:
+                break
+
+        self._save_timings(resource_key, {'engine': last_engine, 'times': times, 'port_trees': trees})
+        if result is None:
+            raise error
+        return result
+
+    @classmethod
+    def _get_tree_signature(cls, autoload_details):
+        """Get signature of the resource tree built of the names of chassis, ports and port channels,
+        engines with equal signatures found the same resources, addresses differ between engines
+
+        :param autoload_details: AutoLoadDetails
+        :rtype: str
+        """
+
+        return hashlib.sha1('\n'.join(sorted('{0}\t{1}'.format(resource.model, resource.name)
+                                             for resource in autoload_details.resources
+                                             if resource.model in cls.TREE_SIGNATURE_MODELS))).hexdigest()
+
+    def _get_resource_key(self):
+        """Get key of the resource in the timings file
+
+        :rtype: str
+        :return: resource name and address or None if resource context is not available
+        """
+
+        try:
+            return '{0}@{1}'.format(get_resource_name(), get_resource_address())
+        except Exception as e:
+            self.logger.error('Resource context is not available, autoload times are not used: {0}'.format(e))
+            return None
+
+    def _load_timings(self):
+        """Read autoload times of all resources
+
+        :rtype: dict
+        :return: dicts of last used engine, engine times in seconds, None if the engine failed, and engine
+            resource tree signatures by resource key
+        """
+
+        if not ensure_private_directory(os.path.dirname(self._timings_path)):
+            return {}
+        try:
+            with open(self._timings_path) as timings_file:
+                return json.load(timings_file)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def _save_timings(self, resource_key, record):
+        """Record autoload times and resource trees of the engines for the resource. The timings file is shared
+        by all resources, it's read, updated and replaced under a thread lock and a lock file, so concurrent
+        autoloads don't lose each other's records and readers never see a partly written file
+
+        :param resource_key: resource key
+        :param record: dict of last used engine, engine times and engine resource tree signatures
+        """
+
+        if not resource_key:
+            return
+        timings_folder = os.path.dirname(self._timings_path)
+        try:
+            if not ensure_private_directory(timings_folder):
+                raise Exception(self.__class__.__name__,
+                                '{0} is not a directory private to the driver user'.format(timings_folder))
+            with self._timings_lock, open(self._timings_path + '.lock', 'a') as lock_file:
+                if fcntl:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                timings = self._load_timings()
+                timings[resource_key] = record
+                fd, temp_file = tempfile.mkstemp(dir=timings_folder, suffix='.tmp')
+                try:
+                    with os.fdopen(fd, 'w') as timings_file:
+                        json.dump(timings, timings_file)
+                    if os.name == 'nt' and os.path.exists(self._timings_path):
+                        os.remove(self._timings_path)
+                    os.rename(temp_file, self._timings_path)
+                except Exception:
+                    if os.path.exists(temp_file):
+                        os.remove(temp_file)
+                    raise
+        except Exception as e:
+            self.logger.error('Failed to save autoload times to {0}: {1}'.format(self._timings_path, e))
@@ -0,0 +1,378 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import inject
+import re
+import time
+
+from collections import OrderedDict
+
+from cloudshell.configuration.cloudshell_cli_binding_keys import CLI_SERVICE, SESSION
+from cloudshell.configuration.cloudshell_shell_core_binding_keys import LOGGER, CONFIG
+from cloudshell.firewall.cisco.asa.autoload.cisco_products_oids import CISCO_PRODUCTS
+from cloudshell.firewall.cisco.asa.autoload.cli_output_parser import iter_lines, parse_interfaces, parse_inventory, \
+    parse_nameif, parse_port_channel_summary, parse_version
+from cloudshell.firewall.operations.interfaces.autoload_operations_interface import AutoloadOperationsInterface
+from cloudshell.firewall.autoload.firewall_autoload_resource_structure import Port, PortChannel, PowerPort, \
+    Chassis, Module
+from cloudshell.firewall.autoload.firewall_autoload_resource_attributes import FirewallStandardRootAttributes
+from cloudshell.shell.core.config_utils import override_attributes_from_config
+from cloudshell.shell.core.driver_context import AutoLoadDetails
+
+
+class CiscoASACLIAutoload(AutoloadOperationsInterface):
+    """Autoload reading device structure from show commands instead of SNMP.
+
+    show version, show inventory, show nameif, show port-channel summary and show interface are sent
+    in a single CLI session, outputs are parsed line by line and resources are built while parsing.
+    Resources are Chassis, Module, Port, PortChannel and PowerPort like in SNMP autoload, but their addresses
+    differ: SNMP autoload addresses them by entPhysicalParentRelPos, which show commands don't report, while here
+    they are chassis 0, a module per interface slot, ports under their slot module by interface number, power
+    ports as PP<number> and port-channels as PC<number>. Switching a resource between engines readdresses its
+    sub-resources, 'auto' autoload mode switches only between engines that found the same ports.
+    Port description is the interface description or its nameif if there is no description, L2 protocol type comes
+    from the interface name or the 'Hardware is' line. Adjacent stays empty: ASA CLI has no CDP or LLDP neighbors
+    command, only SNMP autoload reads neighbors from CISCO-CDP-MIB and LLDP-MIB.
+    """
+
+    SUPPORTED_OS = ["A(daptive)? ?S(ecurity)? ?A(ppliance)?"]
+    PORT_EXCLUDE_PATTERN = r'serial|stack|engine|management|mgmt|internal|vlan|bvi|tunnel'
+    MODULE_NAME_PATTERN = r'^(module|slot)\s*(?P<index>\d+)$'
+    POWER_SUPPLY_NAME_PATTERN = r'^(power supply|psu)\s*(?P<index>\d+)$'
+    PORT_CHANNEL_NAME_PATTERN = r'^port-channel(?P<index>\d+)$'
+    CLI_COMMANDS = ['show version', 'show inventory', 'show nameif', 'show port-channel summary', 'show interface']
+    L2_PROTOCOL_TYPES = [(r'^port-channel|etherchannel', 'ieee8023adLag'),
+                         (r'^(redundant|virtual)', 'propVirtual'),
+                         (r'^(vlan|bvi)', 'l2vlan'),
+                         (r'^tunnel', 'tunnel'),
+                         (r'ethernet|^management|^(accelerator|en_vtun|i82|i21|bcm|ixgbe|mlx)', 'ethernetCsmacd')]
+
+    def __init__(self, logger=None, config=None, cli_service=None, session=None):
+        """Basic init with injected cli service, session and logger
+
+        :param logger:
+        :param config:
+        :param cli_service:
+        :param session: CLI session all show commands are sent to, thread session by default
+        :return:
+        """
+
+        self._config = config
+        self._logger = logger
+        self._cli_service = cli_service
+        self._session = session
+
+        """Override attributes from global config"""
+        overridden_config = override_attributes_from_config(CiscoASACLIAutoload, config=self.config)
+        self._supported_os = overridden_config.SUPPORTED_OS
+        self._port_exclude_pattern = overridden_config.PORT_EXCLUDE_PATTERN
+        self._cli_commands = overridden_config.CLI_COMMANDS
+
+        self.resources = list()
+        self.attributes = list()
+        self.modules = OrderedDict()
+        self.interface_name_index = {}
+
+    @property
+    def logger(self):
+        return self._logger or inject.instance(LOGGER)
+
+    @property
+    def config(self):
+        return self._config or inject.instance(CONFIG)
+
+    @property
+    def cli_service(self):
+        return self._cli_service or inject.instance(CLI_SERVICE)
+
+    @property
+    def session(self):
+        return self._session or inject.instance(SESSION)
+
+    def discover(self):
+        """General entry point for CLI autoload
+
+        :return: AutoLoadDetails object or Exception
+        """
+
+        try:
+            return self._get_autoload_details(self._send_commands())
+        except Exception as e:
+            self.logger.error('CLI autoload failed: {0}'.format(e.message))
+            raise Exception(self.__class__.__name__, e.message)
+
+    def _send_commands(self):
+        """Send all show commands through the same CLI session
+
+        :rtype: dict
+        :return: command outputs by command
+        """
+
+        session = self.session
+        outputs = {}
+        for command in self._cli_commands:
+            start_time = time.time()
+            outputs[command] = self.cli_service.send_command(command=command, session=session) or ''
+            self.logger.debug('{0}: {1} bytes in {2:.3f} sec'.format(command, len(outputs[command]),
+                                                                       time.time() - start_time))
+        return outputs
+
+    def _get_autoload_details(self, outputs):
+        """Build device structure and attributes from show command outputs
+
+        :param outputs: command outputs by command
+        :return: AutoLoadDetails object
+        """
+
+        self.resources = list()
+        self.attributes = list()
+        self.modules = OrderedDict()
+        self.interface_name_index = {}
+
+        self.logger.info('************************************************************************')
+        self.logger.info('Start CLI discovery process .....')
+
+        self._is_valid_device_os(outputs['show version'])
+        self._get_device_details(parse_version(iter_lines(outputs['show version'])))
+        chassis_id, power_supplies = self._get_inventory(parse_inventory(iter_lines(outputs['show inventory'])))
+        nameif_index = {record['name']: record['nameif']
+                        for record in parse_nameif(iter_lines(outputs['show nameif']))}
+        lag_member_index = {record['channel']: [name for name, flags in record['members']]
+                            for record in parse_port_channel_summary(iter_lines(outputs['show port-channel summary']))}
+
+        port_channels = []
+        for interface in parse_interfaces(iter_lines(outputs['show interface'])):
+            if re.search(self.PORT_CHANNEL_NAME_PATTERN, interface['name'], re.IGNORECASE):
+                port_channels.append(interface)
+            elif '.' not in interface['name'] and \
+                    not re.search(self._port_exclude_pattern, interface['name'], re.IGNORECASE):
+                self._add_port(chassis_id, interface, nameif_index)
+
+        self._get_module_attributes(chassis_id)
+        self._get_power_ports(chassis_id, power_supplies)
+        self._get_port_channels(port_channels, nameif_index, lag_member_index)
+
+        self.logger.info('*******************************************')
+        self.logger.info('CLI discovery Completed.')
+        self.logger.info('The following platform structure detected:' +
+                         '\nModel, Name, Relative Path, Unique Id')
+        for resource in self.resources:
+            self.logger.info('{0},\t\t{1},\t\t{2},\t\t{3}'.format(resource.model, resource.name,
+                                                                  resource.relative_address, resource.unique_identifier))
+        self.logger.info('*******************************************')
+        return AutoLoadDetails(resources=self.resources, attributes=self.attributes)
+
+    def _is_valid_device_os(self, version_output):
+        """Validate device OS using 'show version' output
+
+        :param version_output: 'show version' output
+        """
+
+        if re.search(r'({0})'.format('|'.join(self._supported_os)), version_output, flags=re.DOTALL | re.IGNORECASE):
+            return
+
+        error_message = 'Incompatible driver! Please use this driver for \'{0}\' operation system(s)'. \
+            format(str(tuple(self._supported_os)))
+        self.logger.error(error_message)
+        raise Exception(error_message)
+
+    def _get_device_details(self, version):
+        """Get root element attributes
+
+        :param version: parsed 'show version' output
+        """
+
+        self.logger.info('Load Firewall Attributes:')
+        root = FirewallStandardRootAttributes(system_name=version['hostname'], vendor='Cisco',
+                                              model=self._get_device_model(version['model']), location='',
+                                              contact='', version=version['version'])
+        self.attributes.extend(root.get_autoload_resource_attributes())
+        self.logger.info('Load Firewall Attributes completed.')
+
+    @staticmethod
+    def _get_device_model(hardware_model):
+        """Get device model the way SNMP autoload names it, i.e. 'Ciscoasa5525' for 'ASA5525'
+
+        :param hardware_model: 'show version' hardware model, i.e. 'ASA5525' or 'ASA5585-SSP-10'
+        :rtype: str
+        """
+
+        product_name = 'cisco' + hardware_model.replace('-', '').lower()
+        for name in CISCO_PRODUCTS.itervalues():
+            if name.lower() == product_name:
+                return name.capitalize()
+        return hardware_model
+
+    def _get_inventory(self, inventory):
+        """Add chassis and remember modules and power supplies of 'show inventory'
+
+        :param inventory: parsed 'show inventory' records
+        :return: chassis relative path and list of power supply records
+        """
+
+        chassis_id = '0'
+        chassis = None
+        power_supplies = []
+        for item in inventory:
+            name = item['name'].lower()
+            module_match = re.search(self.MODULE_NAME_PATTERN, name)
+            power_supply_match = re.search(self.POWER_SUPPLY_NAME_PATTERN, name)
+            if 'chassis' in name and chassis is None:
+                chassis = item
+            elif module_match:
+                self.modules[module_match.group('index')] = item
+            elif power_supply_match:
+                power_supplies.append((power_supply_match.group('index'), item))
+
+        chassis = chassis or {'description': '', 'pid': '', 'serial_number': ''}
+        chassis_object = Chassis(relative_path=chassis_id, chassis_model=chassis['pid'] or chassis['description'],
+                                 serial_number=chassis['serial_number'])
+        self._add_resource(chassis_object)
+        self.logger.info('Added ' + (chassis['description'] or 'Chassis') + ' Chassis')
+        return chassis_id, power_supplies
+
+    def _add_port(self, chassis_id, interface, nameif_index):
+        """Add port resource of 'show interface' record, slot module is added if the slot is new
+
+        :param chassis_id: chassis relative path
+        :param interface: parsed 'show interface' record
+        :param nameif_index: interface name to nameif index
+        """
+
+        numbers = re.findall(r'\d+', interface['name'])
+        if not numbers:
+            self.logger.error('Adding of {0} failed. Name is invalid'.format(interface['name']))
+            return
+        slot = numbers[0] if len(numbers) > 1 else '0'
+        port_id = '-'.join(numbers[1:]) or numbers[0]
+        self.modules.setdefault(slot, None)
+        self.interface_name_index.setdefault('/'.join(numbers), []).append(interface['name'])
+
+        port_object = Port(name=interface['name'], relative_path='{0}/{1}/{2}'.format(chassis_id, slot, port_id),
+                           **self._get_port_attributes(interface, nameif_index))
+        self._add_resource(port_object)
+        self.logger.info('Added ' + interface['name'] + ' Port')
+
+    def _get_port_attributes(self, interface, nameif_index):
+        """Get port attributes of 'show interface' record, adjacent is not reported by show commands
+
+        :param interface: parsed 'show interface' record
+        :param nameif_index: interface name to nameif index
+        :rtype: dict
+        """
+
+        return {'l2_protocol_type': self._get_l2_protocol_type(interface),
+                'mac': self._get_mac_address(interface['mac']),
+                'mtu': interface['mtu'],
+                'bandwidth': interface['bandwidth'],
+                'description': interface['description'] or nameif_index.get(interface['name'], interface['nameif']),
+                'adjacent': '',
+                'duplex': interface['duplex'],
+                'auto_negotiation': interface['auto_negotiation'],
+                'ipv4_address': ', '.join(interface['ipv4_address']),
+                'ipv6_address': ', '.join(interface['ipv6_address'])}
+
+    def _get_l2_protocol_type(self, interface):
+        """Get IF-MIB ifType name of the interface the way SNMP autoload reports it, from its name or its hardware
+        if the name is unknown, i.e. Redundant interfaces report hardware of their members
+
+        :param interface: parsed 'show interface' record
+        :rtype: str
+        """
+
+        for value in (interface['name'], interface['hardware']):
+            for pattern, l2_protocol_type in self.L2_PROTOCOL_TYPES:
+                if re.search(pattern, value, re.IGNORECASE):
+                    return l2_protocol_type
+        return 'other'
+
+    @staticmethod
+    def _get_mac_address(mac):
+        """Get MAC address the way SNMP autoload formats it, i.e. '00:1e:f7:5a:00:01' for '001e.f75a.0001'
+
+        :param mac: 'show interface' MAC address
+        :rtype: str
+        """
+
+        digits = re.sub(r'[^0-9a-fA-F]', '', mac).lower()
+        if len(digits) != 12:
+            return mac
+        return ':'.join(digits[position:position + 2] for position in xrange(0, 12, 2))
+
+    def _get_module_attributes(self, chassis_id):
+        """Add modules of 'show inventory' and interface slots
+
+        :param chassis_id: chassis relative path
+        """
+
+        self.logger.info('Start loading Modules')
+        for slot, item in self.modules.iteritems():
+            item = item or {'description': '', 'serial_number': ''}
+            module_object = Module(name='Module {0}'.format(slot), model='Generic Module',
+                                   relative_path='{0}/{1}'.format(chassis_id, slot),
+                                   module_model=item['description'], version='', serial_number=item['serial_number'])
+            self._add_resource(module_object)
+            self.logger.info('Module {0} added'.format(item['description'] or slot))
+        self.logger.info('Load modules completed.')
+
+    def _get_power_ports(self, chassis_id, power_supplies):
+        """Add power ports of 'show inventory'
+
+        :param chassis_id: chassis relative path
+        :param power_supplies: list of power supply index and record pairs
+        """
+
+        self.logger.info('Load Power Ports:')
+        for port_number, (index, item) in enumerate(power_supplies):
+            power_port_object = PowerPort(name='PP{0}'.format(port_number),
+                                          relative_path='{0}/PP{1}'.format(chassis_id, index),
+                                          port_model=item['pid'], description=item['description'],
+                                          version=item['vid'], serial_number=item['serial_number'])
+            self._add_resource(power_port_object)
+            self.logger.info('Added ' + item['name'] + ' Power Port')
+        self.logger.info('Load Power Ports completed.')
+
+    def _get_port_channels(self, port_channels, nameif_index, lag_member_index):
+        """Add port-channels of 'show interface' with members of 'show port-channel summary'
+
+        :param port_channels: parsed 'show interface' records of port-channels
+        :param nameif_index: interface name to nameif index
+        :param lag_member_index: channel number to abbreviated member names index
+        """
+
+        self.logger.info('Loading Port Channels:')
+        for interface in port_channels:
+            channel = int(re.search(self.PORT_CHANNEL_NAME_PATTERN, interface['name'], re.IGNORECASE).group('index'))
+            associated_ports = '; '.join(self._get_interface_name(member).replace('/', '-').replace(' ', '')
+                                         for member in lag_member_index.get(channel, []))
+            attribute_map = {'description': interface['description'] or nameif_index.get(interface['name'],
+                                                                                          interface['nameif']),
+                             'associated_ports': associated_ports,
+                             'ipv4_address': ', '.join(interface['ipv4_address']),
+                             'ipv6_address': ', '.join(interface['ipv6_address'])}
+            port_channel = PortChannel(name=interface['name'], relative_path='PC{0}'.format(channel), **attribute_map)
+            self._add_resource(port_channel)
+            self.logger.info('Added ' + interface['name'] + ' Port Channel')
+        self.logger.info('Load Port Channels completed.')
+
+    def _get_interface_name(self, short_name):
+        """Get full interface name of the abbreviated one, i.e. 'GigabitEthernet0/2' for 'Gi0/2'
+
+        :param short_name: abbreviated interface name
+        :rtype: str
+        """
+
+        prefix = re.match(r'[A-Za-z\-]*', short_name).group(0).lower()
+        for name in self.interface_name_index.get('/'.join(re.findall(r'\d+', short_name)), []):
+            if name.lower().startswith(prefix):
+                return name
+        return short_name
+
+    def _add_resource(self, resource):
+        """Add object data to resources and attributes lists
+
+        :param resource: object which contains all required data for certain resource
+        """
+
+        self.resources.append(resource.get_autoload_resource_details())
+        self.attributes.extend(resource.get_autoload_resource_attributes())
@@ -0,0 +1,166 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import re
+
+from cloudshell.firewall.autoload.firewall_autoload_resource_attributes import GenericResourceAttribute
+from cloudshell.firewall.autoload.firewall_autoload_resource_structure import GenericResource, Port
+from cloudshell.firewall.cisco.asa.autoload.cisco_asa_cli_autoload import CiscoASACLIAutoload
+from cloudshell.firewall.cisco.asa.autoload.cli_output_parser import iter_lines, parse_interfaces, parse_nameif
+from cloudshell.shell.core.config_utils import override_attributes_from_config
+from cloudshell.shell.core.driver_context import AutoLoadAttribute, AutoLoadDetails
+
+
+class SecurityContextAttributes(GenericResourceAttribute):
+    def __init__(self, relative_path, mode='', config_url='', allocated_interfaces=''):
+        self.mode = AutoLoadAttribute(relative_path, 'Context Mode', mode)
+        self.config_url = AutoLoadAttribute(relative_path, 'Config URL', config_url)
+        self.allocated_interfaces = AutoLoadAttribute(relative_path, 'Allocated Interfaces', allocated_interfaces)
+
+
+class SecurityContext(GenericResource):
+    def __init__(self, name='', model='Generic Security Context', relative_path='', **attributes_dict):
+        self.attributes_class = SecurityContextAttributes
+        GenericResource.__init__(self, name, model, relative_path, **attributes_dict)
+
+
+class CiscoASAContextAutoload(CiscoASACLIAutoload):
+    """CLI autoload of a single security context.
+
+    The session is switched to the context with changeto, interfaces the context sees are read
+    and the session is switched back to the system execution space. Result is the security context
+    resource CTX-<context name> with a port for every context interface, subinterfaces included.
+    Commands wait for the '<hostname>/<context>#' prompt, so '>' or '#' inside the output doesn't end it.
+    If the session can't be switched back to the system it's set invalid and must not be used or pooled again.
+    """
+
+    CONTEXT_CLI_COMMANDS = ['show nameif', 'show interface']
+    CONTEXT_PROMPT = r'(^|\n)\s*{hostname}/{context}(\(config\S*\))?\s*[>#]\s*$'
+    SYSTEM_PROMPT = r'(^|\n)\s*{hostname}(\(config\S*\))?\s*[>#]\s*$'
+    CONTEXT_ERROR_PATTERN = r'ERROR:|Invalid input'
+
+    def __init__(self, context, logger=None, config=None, cli_service=None, session=None, hostname=None):
+        """Basic init with the context record of 'show context' and the session to discover it in
+
+        :param context: parsed 'show context' record
+        :param logger:
+        :param config:
+        :param cli_service:
+        :param session: CLI session in the system execution space
+        :param hostname: device hostname the prompts start with, any hostname matches if it's unknown
+        :return:
+        """
+
+        CiscoASACLIAutoload.__init__(self, logger=logger, config=config, cli_service=cli_service, session=session)
+        self.context = context
+        self.session_valid = True
+
+        """Override attributes from global config"""
+        overridden_config = override_attributes_from_config(CiscoASAContextAutoload, config=self.config)
+        self._cli_commands = overridden_config.CONTEXT_CLI_COMMANDS
+        hostname_pattern = re.escape(hostname) if hostname else r'[^\s/>#]+'
+        self._context_prompt = overridden_config.CONTEXT_PROMPT.format(hostname=hostname_pattern,
+                                                                        context=re.escape(context['name']))
+        self._system_prompt = overridden_config.SYSTEM_PROMPT.format(hostname=hostname_pattern)
+        self._context_error_pattern = overridden_config.CONTEXT_ERROR_PATTERN
+
+    def _send_commands(self):
+        """Switch the session to the context, send show commands and switch it back to the system
+
+        :rtype: dict
+        :return: command outputs by command
+        """
+
+        session = self.session
+        try:
+            output = self._send_command(session, 'changeto context {0}'.format(self.context['name']),
+                                        self._context_prompt + '|' + self._system_prompt)
+        except Exception:
+            self._set_session_invalid(session)
+            raise
+        if re.search(self._context_error_pattern, output) or not re.search(self._context_prompt, output):
+            raise Exception(self.__class__.__name__,
+                            'Failed to change to context {0}: {1}'.format(self.context['name'], output))
+        try:
+            outputs = {}
+            for command in self._cli_commands:
+                outputs[command] = self._send_command(session, command, self._context_prompt)
+                if re.search(self._context_error_pattern, outputs[command]):
+                    raise Exception(self.__class__.__name__, 'Failed to run {0} in context {1}: {2}'.format(
+                        command, self.context['name'], outputs[command]))
+            return outputs
+        finally:
+            self._change_to_system(session)
+
+    def _send_command(self, session, command, prompt):
+        """Send command and wait for the prompt only, not for any line ending with '>' or '#'
+
+        :param session: CLI session
+        :param command: command to send
+        :param prompt: expected prompt pattern
+        :rtype: str
+        """
+
+        return self.cli_service.send_command(command=command, expected_str=prompt, session=session,
+                                             is_need_default_prompt=False) or ''
+
+    def _change_to_system(self, session):
+        """Switch the session back to the system execution space, set it invalid if that fails
+
+        :param session: CLI session
+        """
+
+        try:
+            output = self._send_command(session, 'changeto system', self._system_prompt)
+        except Exception as e:
+            output = str(e)
+        else:
+            if not re.search(self._context_error_pattern, output):
+                return
+        self.logger.error('Failed to change back to system from context {0}, session is dropped: {1}'.format(
+            self.context['name'], output))
+        self._set_session_invalid(session)
+
+    def _set_session_invalid(self, session):
+        self.session_valid = False
+        session.set_invalid()
+
+    def get_context_resource(self):
+        """Get security context resource without interfaces
+
+        :rtype: SecurityContext
+        """
+
+        return SecurityContext(name=self.context['name'], relative_path='CTX-{0}'.format(self.context['name']),
+                               mode=self.context['mode'], config_url=self.context['url'],
+                               allocated_interfaces=', '.join(self.context['interfaces']))
+
+    def _get_autoload_details(self, outputs):
+        """Build security context resource and its ports from show command outputs
+
+        :param outputs: command outputs by command
+        :return: AutoLoadDetails object
+        """
+
+        self.resources = list()
+        self.attributes = list()
+        context_object = self.get_context_resource()
+        self._add_resource(context_object)
+
+        nameif_index = {record['name']: record['nameif']
+                        for record in parse_nameif(iter_lines(outputs['show nameif']))}
+        port_ids = set()
+        for interface in parse_interfaces(iter_lines(outputs['show interface'])):
+            port_id = '-'.join(re.findall(r'\d+', interface['name'])) or interface['name']
+            if port_id in port_ids:
+                self.logger.error('Adding of {0} to context {1} failed. Name is not unique'.format(
+                    interface['name'], self.context['name']))
+                continue
+            port_ids.add(port_id)
+            port_object = Port(name=interface['name'],
+                               relative_path='{0}/{1}'.format(context_object.relative_path, port_id),
+                               **self._get_port_attributes(interface, nameif_index))
+            self._add_resource(port_object)
+
+        self.logger.info('Context {0}: {1} interfaces added'.format(self.context['name'], len(port_ids)))
+        return AutoLoadDetails(resources=self.resources, attributes=self.attributes)
@@ -1,28 +1,72 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
 
+import copy
 import inject
+import json
 import os
 import re
+import threading
+import time
 
+from functools import partial
 
 from cloudshell.configuration.cloudshell_cli_binding_keys import CLI_SERVICE
 from cloudshell.configuration.cloudshell_shell_core_binding_keys import LOGGER, CONFIG
 from cloudshell.configuration.cloudshell_snmp_binding_keys import SNMP_HANDLER
+from cloudshell.firewall.cisco.asa.autoload.autoload_diff import AutoloadDiff
+from cloudshell.firewall.cisco.asa.autoload.autoload_profiler import AutoloadProfiler, autoload_phase
+from cloudshell.firewall.cisco.asa.autoload.cisco_products_oids import CISCO_PRODUCTS, CISCO_PRODUCTS_PREFIX
+from cloudshell.firewall.cisco.asa.autoload.cisco_vendortype_oids import CISCO_VENDORTYPES, CISCO_VENDORTYPES_PREFIX
+from cloudshell.firewall.cisco.asa.autoload.mib_cache import CachedDirMibSource
+from cloudshell.firewall.cisco.asa.autoload.oid_trie import OidTrie
+from cloudshell.firewall.cisco.asa.autoload.ordered_set import OrderedSet
+from cloudshell.firewall.cisco.asa.autoload.snapshot_store import SnapshotStore
+from cloudshell.firewall.cisco.asa.autoload.snmp_recorder import SnmpRecorder
 from cloudshell.firewall.operations.interfaces.autoload_operations_interface import AutoloadOperationsInterface
 from cloudshell.firewall.autoload.firewall_autoload_resource_structure import Port, PortChannel, PowerPort, \
     Chassis, Module
 from cloudshell.firewall.autoload.firewall_autoload_resource_attributes import FirewallStandardRootAttributes
 from cloudshell.shell.core.config_utils import override_attributes_from_config
-from cloudshell.shell.core.context_utils import get_attribute_by_name
+from cloudshell.shell.core.context_utils import get_attribute_by_name, get_context, get_resource_address, \
+    get_resource_name, put_context
 from cloudshell.shell.core.driver_context import AutoLoadDetails
 from cloudshell.snmp.quali_snmp import QualiMibTable
+from pysnmp.entity.rfc3413.oneliner import cmdgen
+from pysnmp.proto.rfc1905 import EndOfMibView, NoSuchInstance, NoSuchObject
+from pysnmp.smi import view
+from pysnmp.smi.rfc1902 import ObjectIdentity
 
 
 class CiscoASASNMPAutoload(AutoloadOperationsInterface):
     SUPPORTED_OS = ["A(daptive)? ?S(ecurity)? ?A(ppliance)?"]
     IF_ENTITY = "ifName"
     ENTITY_PHYSICAL = "entPhysicalName"
+    IF_SPEED_MAX = 4294967295
+    SNMP_BULK_MODE = True
+    SNMP_BULK_MAX_REPETITIONS = 25
+    SNMP_TABLE_LOAD_WORKERS = 1
+    SNMP_MAX_MESSAGE_SIZE = 1472
+    SNMP_GET_WINDOW = 4
+    SNMP_GET_VALUE_SIZE = 64
+    ENTITY_TABLE_COLUMNS = ['entPhysicalParentRelPos', 'entPhysicalContainedIn', 'entPhysicalClass',
+                            'entPhysicalVendorType', 'entPhysicalDescr', 'entPhysicalName']
+    IF_TABLE_COLUMNS = ['ifType', 'ifPhysAddress', 'ifMtu', 'ifSpeed', 'ifHighSpeed', 'ifAlias']
+    SYSTEM_GROUP = ['sysDescr', 'sysObjectID', 'sysUpTime', 'sysContact', 'sysName', 'sysLocation']
+    MIB_CACHE_ENABLED = True
+    MIB_CACHE_PATH = None
+    AUTOLOAD_CACHE_ENABLED = False
+    AUTOLOAD_CACHE_PATH = None
+    AUTOLOAD_SNAPSHOTS_ENABLED = False
+    AUTOLOAD_SNAPSHOTS_MAX_COUNT = 5
+    AUTOLOAD_SNAPSHOTS_MAX_AGE = None
+    AUTOLOAD_DELTA_ONLY = False
+    AUTOLOAD_PROFILE_PATH = None
+    SNMP_RECORD_PATH = None
+    _cisco_oid_trie = None
+    # Idle (pysnmp command generator, MIB viewer) pairs of worker threads, shared by discoveries of the process
+    _snmp_engines = []
+    _snmp_engines_lock = threading.Lock()
 
     def __init__(self, snmp_handler=None, logger=None, config=None, cli_service=None, snmp_community=None):
         """Basic init with injected snmp handler and logger
@@ -44,23 +88,76 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
         """Override attributes from global config"""
         overridden_config = override_attributes_from_config(CiscoASASNMPAutoload, config=self.config)
         self._supported_os = overridden_config.SUPPORTED_OS
-
-        self.exclusion_list = []
-        self._excluded_models = []
-        self.module_list = []
-        self.chassis_list = []
-        self.port_list = []
+        self._snmp_bulk_mode = overridden_config.SNMP_BULK_MODE
+        self._snmp_bulk_max_repetitions = overridden_config.SNMP_BULK_MAX_REPETITIONS
+        self._snmp_table_load_workers = overridden_config.SNMP_TABLE_LOAD_WORKERS
+        self._snmp_max_message_size = overridden_config.SNMP_MAX_MESSAGE_SIZE
+        self._snmp_get_window = overridden_config.SNMP_GET_WINDOW
+        self._snmp_get_value_size = overridden_config.SNMP_GET_VALUE_SIZE
+        self._snmp_local = threading.local()
+        self._snmp_workers = []
+        self._entity_table_columns = overridden_config.ENTITY_TABLE_COLUMNS
+        self._if_table_columns = overridden_config.IF_TABLE_COLUMNS
+        self._mib_cache_enabled = overridden_config.MIB_CACHE_ENABLED
+        self._mib_cache_path = overridden_config.MIB_CACHE_PATH
+        self._autoload_cache_enabled = overridden_config.AUTOLOAD_CACHE_ENABLED
+        self._autoload_snapshots_enabled = overridden_config.AUTOLOAD_SNAPSHOTS_ENABLED
+        self._autoload_snapshots_max_count = overridden_config.AUTOLOAD_SNAPSHOTS_MAX_COUNT
+        self._autoload_snapshots_max_age = overridden_config.AUTOLOAD_SNAPSHOTS_MAX_AGE
+        self._autoload_delta_only = overridden_config.AUTOLOAD_DELTA_ONLY
+        self.snapshot_store = SnapshotStore(overridden_config.AUTOLOAD_CACHE_PATH)
+        self._autoload_profile_path = overridden_config.AUTOLOAD_PROFILE_PATH
+        self.profiler = AutoloadProfiler()
+        self._snmp_record_path = overridden_config.SNMP_RECORD_PATH
+        self._snmp_recorder = None
+
+        self.exclusion_list = OrderedSet()
+        self._excluded_models = OrderedSet()
+        self.module_list = OrderedSet()
+        self.chassis_list = OrderedSet()
+        self.port_list = OrderedSet()
         self.power_supply_list = []
         self.relative_path = {}
+        self.entity_parents = {}
+        self.entity_children = {}
+        self.entity_classes = {}
+        self._module_parents_cache = {}
+        self._resource_id_cache = {}
+        self._relative_path_cache = {}
         self.port_mapping = {}
+        self._mapped_port_ids = set()
+        self.ent_alias_mapping_index = {}
+        self.if_name_index = {}
+        self.ip_v4_address_index = {}
+        self.ip_v6_address_index = {}
+        self.cdp_neighbor_index = {}
+        self.lldp_local_port_index = {}
+        self.lldp_local_ports = []
+        self.lldp_neighbor_index = {}
+        self.lag_member_index = {}
+        self.duplex_index = {}
+        self.auto_negotiation_index = {}
         self.entity_table_black_list = ['alarm', 'fan', 'sensor']
         self.port_exclude_pattern = r'serial|stack|engine|management|mgmt'
         self.module_exclude_pattern = r'cevsfp'
+        self.vendor_type_classes = {'cevContainer': 'container', 'cevChassis': 'chassis', 'cevModule': 'module',
+                                    'cevPort': 'port', 'cevPowerSupply': 'powerSupply'}
+        self._vendor_type_cache = {}
         self.resources = list()
         self.attributes = list()
+        self._snmp_property_cache = {}
+        self._snmp_cache_hits = 0
+        self._snmp_cache_misses = 0
+        self.system_group = {}
+        self._cached_entity_table = None
+        self._entity_table_snapshot = None
+        self._pending_snapshot = None
 
     @property
     def logger(self):
+        worker_logger = getattr(self._snmp_local, 'logger', None)
+        if worker_logger:
+            return worker_logger
         return self._logger or inject.instance(LOGGER)
 
     @property
@@ -69,6 +166,9 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
 
     @property
     def snmp(self):
+        worker_snmp_handler = getattr(self._snmp_local, 'snmp_handler', None)
+        if worker_snmp_handler:
+            return worker_snmp_handler
         if not self._snmp:
             self._snmp = inject.instance(SNMP_HANDLER)
         return self._snmp
@@ -77,9 +177,32 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
     def cli_service(self):
         return self._cli_service or inject.instance(CLI_SERVICE)
 
+    @property
+    def snmp_cache_statistics(self):
+        """Hits and misses of the SNMP property cache collected during the last discovery
+
+        :rtype: dict
+        """
+
+        return {'hits': self._snmp_cache_hits, 'misses': self._snmp_cache_misses}
+
+    @autoload_phase
     def load_cisco_mib(self):
         path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'mibs'))
-        self.snmp.update_mib_sources(path)
+        if not self._mib_cache_enabled:
+            self.snmp.update_mib_sources(path)
+            return
+
+        mib_sources = self.snmp.mib_builder.getMibSources()
+        if any(isinstance(source, CachedDirMibSource) and source.fullPath() == path for source in mib_sources):
+            return
+        mib_source = CachedDirMibSource(path, self._mib_cache_path)
+        self.snmp.mib_builder.setMibSources(*(mib_sources + (mib_source,)))
+        if mib_source.cache_private:
+            self.logger.debug('Compiled MIB cache: {0}'.format(mib_source.cache_path))
+        else:
+            self.logger.warning('Compiled MIB cache {0} is not a directory private to the driver user, '
+                                'MIB modules are compiled on each load'.format(mib_source.cache_path))
 
     def enable_snmp(self):
         existing_snmp_community = self.snmp_community in self.cli_service.send_command("more system:running-config | inc snmp-server community").lower()
@@ -111,14 +234,44 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
         if self._enable_snmp:
             self.enable_snmp()
 
+        self.profiler = AutoloadProfiler()
         try:
-            return self._get_autoload_details()
+            self.profiler.attach(self.snmp)
+            if self._snmp_record_path:
+                self._snmp_recorder = SnmpRecorder(self._snmp_record_path, self.snmp_community)
+                self._snmp_recorder.attach(self.snmp)
+            result = self._get_autoload_details()
         except Exception as e:
             self.logger.error('Autoload failed: {0}'.format(e.message))
             raise Exception(self.__class__.__name__, e.message)
         finally:
+            self.profiler.detach()
+            if self._snmp_recorder:
+                self._snmp_recorder.close()
+                self.logger.info('{0} SNMP records saved to {1}'.format(self._snmp_recorder.records_count,
+                                                                       self._snmp_recorder.file_path))
+                self._snmp_recorder = None
+            self._release_snmp_workers()
+            self._report_profile()
             if self._disable_snmp:
                 self.disable_snmp()
+        self.save_autoload_snapshot()
+        return result
+
+    def _report_profile(self):
+        """Log profile report of the discovery and append it to the metrics file if it's configured
+
+        :return:
+        """
+
+        report = self.profiler.get_report()
+        self.logger.info('Autoload profile: {0}'.format(json.dumps(report)))
+        if not self._autoload_profile_path:
+            return
+        try:
+            self.profiler.write_report(self._autoload_profile_path, report, sys_name=self.system_group.get('sysName'))
+        except Exception as e:
+            self.logger.error('Failed to write autoload profile to {0}: {1}'.format(self._autoload_profile_path, e))
 
     def _get_autoload_details(self):
         """General entry point for autoload,
@@ -127,15 +280,40 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
         :return: AutoLoadDetails object
         """
 
+        self._snmp_property_cache = {}
+        self._snmp_cache_hits = 0
+        self._snmp_cache_misses = 0
+        self._cached_entity_table = None
+        self._entity_table_snapshot = None
+        self._pending_snapshot = None
+        self._load_system_group()
         self._is_valid_device_os()
 
+        resource_key = None
+        change_markers = None
+        if self._autoload_cache_enabled or self._autoload_snapshots_enabled or self._autoload_delta_only:
+            resource_key = self._get_resource_key()
+        if resource_key and self._autoload_cache_enabled:
+            change_markers = self._get_change_markers()
+        if resource_key and change_markers:
+            cached_result = self._get_cached_autoload_details(resource_key, change_markers)
+            if cached_result:
+                if self._autoload_delta_only:
+                    self.logger.info('Device did not change since the last autoload, autoload delta is empty')
+                    return AutoLoadDetails(resources=[], attributes=[])
+                return cached_result
+
         self.logger.info('************************************************************************')
         self.logger.info('Start SNMP discovery process .....')
 
         self.load_cisco_mib()
         self._get_device_details()
-        self.snmp.load_mib(['CISCO-PRODUCTS-MIB', 'CISCO-ENTITY-VENDORTYPE-OID-MIB'])
         self._load_snmp_tables()
+        self._build_ip_address_index()
+        self._build_neighbor_index()
+        self._build_lag_member_index()
+        self._build_interface_details_index()
+        self._build_entity_tree()
 
         if len(self.chassis_list) < 1:
             self.logger.error('Entity table error, no chassis found')
@@ -151,6 +329,8 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
         self._filter_lower_bay_containers()
         self.get_module_list()
         self.add_relative_paths()
+        if self._snmp_bulk_mode:
+            self._prefetch_entity_attributes()
         self._get_chassis_attributes(self.chassis_list)
         self._get_ports_attributes()
         self._get_module_attributes()
@@ -172,10 +352,143 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
             self.logger.info('{0},\t\t{1},\t\t{2}'.format(attribute.relative_address, attribute.attribute_name,
                                                           attribute.attribute_value))
 
+        self.logger.info('SNMP property cache: {hits} hits, {misses} misses'.format(**self.snmp_cache_statistics))
         self.logger.info('*******************************************')
 
+        if resource_key:
+            # Saved by save_autoload_snapshot once discover() returns, so the delta baseline only moves
+            # when the result was delivered
+            self._pending_snapshot = (resource_key, change_markers, result)
+            previous_snapshot = self.snapshot_store.load(resource_key) if self._autoload_delta_only else None
+            if previous_snapshot:
+                return self._get_autoload_delta(previous_snapshot.autoload_details, result)
         return result
 
+    def save_autoload_snapshot(self):
+        """Save full result of the last discovery to the snapshot store, it's the autoload cache entry and
+        the baseline of the next autoload delta. discover() calls it after the discovery succeeded
+
+        :return:
+        """
+
+        if self._pending_snapshot:
+            resource_key, change_markers, result = self._pending_snapshot
+            self._pending_snapshot = None
+            self._save_autoload_details(resource_key, change_markers, result)
+
+    def _get_autoload_delta(self, previous_result, result):
+        """Get added and changed resources and attributes of the discovery result,
+        removed ones are only logged
+
+        :param previous_result: AutoLoadDetails of the previous discovery
+        :param result: AutoLoadDetails of the current discovery
+        :rtype: AutoLoadDetails
+        """
+
+        autoload_diff = AutoloadDiff(previous_result, result)
+        self.logger.info('Autoload delta: {added_resources} added, {removed_resources} removed, '
+                         '{changed_resources} changed resources, {added_attributes} added, '
+                         '{removed_attributes} removed, {changed_attributes} changed attributes'.format(
+                             **autoload_diff.get_summary()))
+        for resource in autoload_diff.removed_resources:
+            self.logger.info('Resource {0} {1} is not found on the device anymore'.format(
+                resource.relative_address, resource.name))
+        return autoload_diff.get_delta_details()
+
+    def _get_resource_key(self):
+        """Get key of the resource in the autoload cache
+
+        :rtype: str
+        :return: resource name and address or None if resource context is not available
+        """
+
+        try:
+            return '{0}@{1}'.format(get_resource_name(), get_resource_address())
+        except Exception as e:
+            self.logger.error('Resource context is not available, autoload cache is not used: {0}'.format(e))
+            return None
+
+    @autoload_phase
+    def _get_change_markers(self):
+        """Read sysUpTime, entLastChangeTime and ifTableLastChange, sysUpTime comes with the system group
+
+        :rtype: dict
+        :return: change markers or None if the device doesn't support them
+        """
+
+        try:
+            response = self.snmp.get(('ENTITY-MIB', 'entLastChangeTime', 0), ('IF-MIB', 'ifTableLastChange', 0))
+            return {'sysUpTime': int(self.system_group['sysUpTime']),
+                    'entLastChangeTime': int(response['entLastChangeTime']),
+                    'ifTableLastChange': int(response['ifTableLastChange'])}
+        except Exception as e:
+            self.logger.error('Failed to get change markers, autoload cache is not used: {0}'.format(e))
+            return None
+
+    @autoload_phase
+    def _get_cached_autoload_details(self, resource_key, change_markers):
+        """Get result of the previous discovery if the device didn't change since then.
+        If only interfaces changed, the next discovery reuses cached entPhysicalTable instead of walking it
+
+        :param resource_key: resource key in the snapshot store
+        :param change_markers: current change markers
+        :rtype: AutoLoadDetails
+        :return: cached AutoLoadDetails or None if discovery is required
+        """
+
+        if not self.snapshot_store.is_private():
+            self.logger.warning('Autoload cache {0} is not a directory private to the driver user, '
+                                'autoload cache is not used'.format(self.snapshot_store.store_path))
+            return None
+        snapshot = self.snapshot_store.load(resource_key)
+        if snapshot is None or not snapshot.metadata or not snapshot.metadata.get('change_markers'):
+            self.logger.info('No cached autoload details found')
+            return None
+        entry = snapshot.metadata
+        cached_markers = entry['change_markers']
+        if change_markers['sysUpTime'] < cached_markers['sysUpTime']:
+            self.logger.info('Device was restarted since the last discovery')
+            return None
+        if change_markers['entLastChangeTime'] != cached_markers['entLastChangeTime']:
+            self.logger.info('Entity table changed since the last discovery')
+            return None
+        if change_markers['ifTableLastChange'] == cached_markers['ifTableLastChange']:
+            self.logger.info('Device did not change since the last discovery, returning cached autoload details')
+            return snapshot.autoload_details
+
+        if not self._snmp_bulk_mode or not entry.get('entity_table'):
+            self.logger.info('Interfaces changed since the last discovery')
+            return None
+
+        self.logger.info('Only interfaces changed since the last discovery, reusing cached entPhysicalTable')
+        self._cached_entity_table = QualiMibTable('entPhysicalTable', entry['entity_table'])
+        self._snmp_property_cache.update(entry['entity_properties'])
+        return None
+
+    @autoload_phase
+    def _save_autoload_details(self, resource_key, change_markers, result):
+        """Save discovery result with change markers and entity data to the snapshot store
+        and evict old snapshots of the resource
+
+        :param resource_key: resource key in the snapshot store
+        :param change_markers: change markers read before the discovery or None
+        :param result: AutoLoadDetails
+        """
+
+        entity_properties = {key: value for key, value in self._snmp_property_cache.iteritems()
+                             if key[0] == 'ENTITY-MIB'}
+        metadata = {'change_markers': change_markers,
+                    'entity_table': list(self._entity_table_snapshot or []),
+                    'entity_properties': entity_properties}
+        try:
+            snapshot_id = self.snapshot_store.save(resource_key, result, metadata)
+            self.snapshot_store.evict(resource_key, max_age=self._autoload_snapshots_max_age,
+                                      max_count=self._autoload_snapshots_max_count)
+            self.logger.info('Autoload details saved to the snapshot store, snapshot {0}'.format(snapshot_id))
+        except Exception as e:
+            self.logger.error('Failed to save autoload details to the snapshot store: {0}'.format(e))
+
+    @autoload_phase
     def _is_valid_device_os(self):
         """Validate device OS using snmp
 
@@ -183,7 +496,7 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
         """
 
         version = None
-        system_description = self.snmp.get(('SNMPv2-MIB', 'sysDescr'))['sysDescr']
+        system_description = self._get_property('SNMPv2-MIB', 'sysDescr', 0)
         res = re.search(r"({0})".format("|".join(self._supported_os)),
                         system_description,
                         flags=re.DOTALL | re.IGNORECASE)
@@ -199,6 +512,25 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
         self.logger.error(error_message)
         raise Exception(error_message)
 
+    @autoload_phase
+    def _load_system_group(self):
+        """Read SNMPv2-MIB system group scalars with a single multi-varbind GET and put them into
+        the SNMP property cache, falls back to a GET per scalar if the device rejects the request
+
+        :return:
+        """
+
+        try:
+            response = self.snmp.get(*[('SNMPv2-MIB', name, 0) for name in self.SYSTEM_GROUP])
+            self.system_group = {name: response.get(name, '').strip(' \t\n\r') for name in self.SYSTEM_GROUP}
+        except Exception as e:
+            self.logger.error('Failed to get system group with a single request, '
+                              'falling back to per scalar requests: {0}'.format(e))
+            self.system_group = {name: self.snmp.get_property('SNMPv2-MIB', name, 0) for name in self.SYSTEM_GROUP}
+        for name, value in self.system_group.iteritems():
+            self._snmp_property_cache[('SNMPv2-MIB', name, '0')] = value
+
+    @autoload_phase
     def _load_snmp_tables(self):
         """ Load all cisco required snmp tables
 
@@ -206,24 +538,170 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
         """
 
         self.logger.info('Start loading MIB tables:')
+        table_loaders = [
+            ('ifTable and entPhysicalTable', None, self._load_interface_and_entity_tables),
+            ('lldpLocPortDesc', 'lldp_local_table', partial(self._get_table, 'LLDP-MIB', 'lldpLocPortDesc')),
+            ('lldpRemTable', 'lldp_remote_table', partial(self._get_table, 'LLDP-MIB', 'lldpRemTable')),
+            ('cdpInterface', 'cdp_index_table', partial(self._get_table, 'CISCO-CDP-MIB', 'cdpInterface')),
+            ('cdpCacheTable', 'cdp_table', partial(self._get_table, 'CISCO-CDP-MIB', 'cdpCacheTable')),
+            ('dot3StatsTable', 'duplex_table', partial(self._get_table_columns, 'EtherLike-MIB', 'dot3StatsTable',
+                                                       'dot3StatsIndex', 'dot3StatsDuplexStatus')),
+            ('ifMauAutoNegTable', 'auto_negotiation_table', partial(self._get_table_columns, 'MAU-MIB',
+                                                                    'ifMauAutoNegTable', 'ifMauAutoNegAdminStatus')),
+            ('ipAddrTable', 'ip_v4_table', partial(self._get_table, 'IP-MIB', 'ipAddrTable')),
+            ('ipv6AddrEntry', 'ip_v6_table', partial(self._get_table, 'IPV6-MIB', 'ipv6AddrEntry')),
+            ('dot3adAggPortAttachedAggID', 'port_channel_ports', partial(self._get_table, 'IEEE8023-LAG-MIB',
+                                                                         'dot3adAggPortAttachedAggID'))]
+
+        start_time = time.time()
+        if self._snmp_table_load_workers > 1:
+            tables = self._map_with_snmp_workers(self._run_table_loader, table_loaders,
+                                                 min(self._snmp_table_load_workers, len(table_loaders)))
+        else:
+            tables = map(self._run_table_loader, table_loaders)
+
+        for (table_name, attribute_name, loader), table in zip(table_loaders, tables):
+            if attribute_name:
+                setattr(self, attribute_name, table)
+
+        self.logger.info('MIB Tables loaded successfully in {0:.3f} seconds'.format(time.time() - start_time))
+
+    def _load_interface_and_entity_tables(self):
+        """Load ifTable and entPhysicalTable, entity table processing maps ports to interfaces,
+        so these tables are loaded one after another
+
+        :return:
+        """
+
         self.if_table = self.snmp.get_table('IF-MIB', self.IF_ENTITY)
         self.logger.info('{0} table loaded'.format(self.IF_ENTITY))
+        if self._snmp_bulk_mode:
+            self._load_if_attributes()
+        self._build_port_mapping_index()
         self.entity_table = self._get_entity_table()
         if len(self.entity_table.keys()) < 1:
             raise Exception('Cannot load entPhysicalTable. Autoload cannot continue')
         self.logger.info('Entity table loaded')
 
-        self.lldp_local_table = self.snmp.get_table('LLDP-MIB', 'lldpLocPortDesc')
-        self.lldp_remote_table = self.snmp.get_table('LLDP-MIB', 'lldpRemTable')
-        self.cdp_index_table = self.snmp.get_table('CISCO-CDP-MIB', 'cdpInterface')
-        self.cdp_table = self.snmp.get_table('CISCO-CDP-MIB', 'cdpCacheTable')
-        self.duplex_table = self.snmp.get_table('EtherLike-MIB', 'dot3StatsIndex')
-        self.ip_v4_table = self.snmp.get_table('IP-MIB', 'ipAddrTable')
-        self.ip_v6_table = self.snmp.get_table('IPV6-MIB', 'ipv6AddrEntry')
-        self.port_channel_ports = self.snmp.get_table('IEEE8023-LAG-MIB', 'dot3adAggPortAttachedAggID')
+    def _get_table(self, snmp_module_name, table_name):
+        """Walk MIB table with the SNMP handler of the current thread
+
+        :param snmp_module_name: MIB name, i.e. 'LLDP-MIB'
+        :param table_name: table name, i.e. 'lldpRemTable'
+        :rtype: QualiMibTable
+        """
+
+        return self.snmp.get_table(snmp_module_name, table_name)
+
+    def _run_table_loader(self, table_loader):
+        """Run table loader and log how long it took
+
+        :param table_loader: tuple of (table name, attribute name, loader)
+        :return: loaded table
+        """
+
+        table_name, attribute_name, loader = table_loader
+        start_time = time.time()
+        with self.profiler.phase(table_name):
+            table = loader()
+        self.logger.info('{0} loaded in {1:.3f} seconds'.format(table_name, time.time() - start_time))
+        return table
+
+    def _map_with_snmp_workers(self, function, items, workers_count):
+        """Run function for every item in worker threads, each thread gets SNMP handler of its own.
+        Threads are plain ones joined as soon as items are done, thread pool housekeeping would add
+        more latency than a few pipelined requests save.
+        Injected logger is bound to the command context of the thread, so workers get the logger resolved
+        in the calling thread and the command context of the calling thread is put into every worker
+
+        :param function: function to run
+        :param items: list of function arguments
+        :param workers_count: number of threads
+        :rtype: list
+        :return: function results in order of items
+        """
+
+        snmp_handler = self.snmp
+        logger = self.logger
+        context = get_context()
+        positions = iter(range(len(items)))
+        positions_lock = threading.Lock()
+        results = [None] * len(items)
+        errors = []
+
+        def run_worker():
+            if context is not None:
+                put_context(context)
+            self._snmp_local.logger = logger
+            self._snmp_local.snmp_handler = self._create_snmp_worker(snmp_handler, logger)
+            self.profiler.attach(self._snmp_local.snmp_handler)
+            if self._snmp_recorder:
+                self._snmp_recorder.attach(self._snmp_local.snmp_handler)
+            while not errors:
+                with positions_lock:
+                    position = next(positions, None)
+                if position is None:
+                    return
+                try:
+                    results[position] = function(items[position])
+                except Exception as e:
+                    errors.append(e)
+
+        threads = [threading.Thread(target=run_worker) for _ in range(workers_count)]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+        return results
+
+    def _create_snmp_worker(self, snmp_handler, logger):
+        """Copy SNMP handler with a separate pysnmp engine and MIB builder,
+        pysnmp engine and MIB builder can't be shared between threads.
+        Engines are taken from the idle ones of previous discoveries of the process when possible,
+        so MIB modules loaded by a worker are not loaded again on every discovery
+
+        :param snmp_handler: QualiSnmp handler
+        :param logger: logger of the worker handler
+        :rtype: QualiSnmp
+        """
 
-        self.logger.info('MIB Tables loaded successfully')
+        with self._snmp_engines_lock:
+            engine = self._snmp_engines.pop() if self._snmp_engines else None
+        if engine is None:
+            cmd_gen = self._create_snmp_engine()
+            engine = (cmd_gen, view.MibViewController(cmd_gen.snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder))
 
+        worker_snmp_handler = copy.copy(snmp_handler)
+        worker_snmp_handler._logger = logger
+        worker_snmp_handler.cmd_gen, worker_snmp_handler.mib_viewer = engine
+        worker_snmp_handler.mib_builder = worker_snmp_handler.mib_viewer.mibBuilder
+        worker_snmp_handler.mib_builder.setMibSources(*snmp_handler.mib_builder.getMibSources())
+        self._snmp_workers.append(worker_snmp_handler)
+        return worker_snmp_handler
+
+    def _create_snmp_engine(self):
+        """Create pysnmp command generator of a worker thread
+
+        :rtype: cmdgen.CommandGenerator
+        """
+
+        return cmdgen.CommandGenerator()
+
+    def _release_snmp_workers(self):
+        """Return engines of the discovery workers to the idle ones, it's called after profiler and recorder
+        observers are detached from them
+
+        :return:
+        """
+
+        with self._snmp_engines_lock:
+            self._snmp_engines.extend((worker.cmd_gen, worker.mib_viewer) for worker in self._snmp_workers)
+        self._snmp_workers = []
+
+    @autoload_phase
     def _get_entity_table(self):
         """Read Entity-MIB and filter out device's structure and all it's elements, like ports, modules, chassis, etc.
 
@@ -237,15 +715,24 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
                                            'entPhysicalVendorType': 'str'}
         entity_table_optional_port_attr = {'entPhysicalDescr': 'str', 'entPhysicalName': 'str'}
 
-        physical_indexes = self.snmp.get_table('ENTITY-MIB', 'entPhysicalParentRelPos')
-        for index in physical_indexes.keys():
+        physical_indexes = None
+        if self._snmp_bulk_mode:
+            physical_indexes = self._get_entity_table_bulk()
+        is_bulk_loaded = physical_indexes is not None
+        if not is_bulk_loaded:
+            physical_indexes = self.snmp.get_table('ENTITY-MIB', 'entPhysicalParentRelPos')
+
+        for index in self._get_walk_order(physical_indexes):
             is_excluded = False
             if physical_indexes[index]['entPhysicalParentRelPos'] == '':
                 self.exclusion_list.append(index)
                 continue
             temp_entity_table = physical_indexes[index].copy()
-            temp_entity_table.update(self.snmp.get_properties('ENTITY-MIB', index, entity_table_critical_port_attr)
-                                     [index])
+            if not is_bulk_loaded:
+                temp_entity_table.update(self._get_properties('ENTITY-MIB', index,
+                                                                  entity_table_critical_port_attr)[index])
+            vendor_type, vendor_type_class = self._get_vendor_type(temp_entity_table['entPhysicalVendorType'])
+            temp_entity_table['entPhysicalVendorType'] = vendor_type
             if temp_entity_table['entPhysicalContainedIn'] == '':
                 is_excluded = True
                 self.exclusion_list.append(index)
@@ -258,26 +745,15 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
             if is_excluded is True:
                 continue
 
-            temp_entity_table.update(self.snmp.get_properties('ENTITY-MIB', index, entity_table_optional_port_attr)
-                                     [index])
+            if not is_bulk_loaded:
+                temp_entity_table.update(self._get_properties('ENTITY-MIB', index,
+                                                                  entity_table_optional_port_attr)[index])
 
             if temp_entity_table['entPhysicalClass'] == '':
-                vendor_type = self.snmp.get_property('ENTITY-MIB', 'entPhysicalVendorType', index)
-                index_entity_class = None
                 if vendor_type == '':
                     continue
-                if 'cevcontainer' in vendor_type.lower():
-                    index_entity_class = 'container'
-                elif 'cevchassis' in vendor_type.lower():
-                    index_entity_class = 'chassis'
-                elif 'cevmodule' in vendor_type.lower():
-                    index_entity_class = 'module'
-                elif 'cevport' in vendor_type.lower():
-                    index_entity_class = 'port'
-                elif 'cevpowersupply' in vendor_type.lower():
-                    index_entity_class = 'powerSupply'
-                if index_entity_class:
-                    temp_entity_table['entPhysicalClass'] = index_entity_class
+                if vendor_type_class:
+                    temp_entity_table['entPhysicalClass'] = vendor_type_class
             else:
                 temp_entity_table['entPhysicalClass'] = temp_entity_table['entPhysicalClass'].replace("'", "")
 
@@ -291,8 +767,9 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
                 if not re.search(self.port_exclude_pattern, temp_entity_table['entPhysicalName'], re.IGNORECASE) \
                   and not re.search(self.port_exclude_pattern, temp_entity_table['entPhysicalDescr'], re.IGNORECASE):
                     port_id = self._get_mapping(index, temp_entity_table[self.ENTITY_PHYSICAL])
-                    if port_id and port_id in self.if_table and port_id not in self.port_mapping.values():
+                    if port_id and port_id in self.if_table and port_id not in self._mapped_port_ids:
                         self.port_mapping[index] = port_id
+                        self._mapped_port_ids.add(port_id)
                         self.port_list.append(index)
             elif temp_entity_table['entPhysicalClass'] == 'powerSupply':
                 self.power_supply_list.append(index)
@@ -300,45 +777,349 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
         self._filter_entity_table(result_dict)
         return result_dict
 
+    def _get_entity_table_bulk(self):
+        """Read all required entPhysicalTable columns with pipelined GETBULK requests
+
+        :rtype: QualiMibTable
+        :return: entPhysicalTable rows joined by index or None if bulk walk failed
+        """
+
+        if self._cached_entity_table is not None:
+            self._entity_table_snapshot = [(index, self._cached_entity_table[index])
+                                           for index in self._get_walk_order(self._cached_entity_table)]
+            self._cache_table('ENTITY-MIB', self._cached_entity_table, self._entity_table_columns)
+            return self._cached_entity_table
+
+        try:
+            raw_entity_table = self._walk_columns('ENTITY-MIB', 'entPhysicalTable', *self._entity_table_columns)
+        except Exception as e:
+            self.logger.error('Failed to bulk load entPhysicalTable, falling back to per index requests: '
+                              '{0}'.format(e))
+            return None
+
+        result = QualiMibTable('entPhysicalTable')
+        for index, value in raw_entity_table.iteritems():
+            if 'entPhysicalParentRelPos' not in value:
+                continue
+            result[index] = {column: value.get(column, '') for column in self._entity_table_columns}
+            result[index]['suffix'] = value['suffix']
+        self._cache_table('ENTITY-MIB', result, self._entity_table_columns)
+        self._entity_table_snapshot = [(index, result[index]) for index in self._get_walk_order(result)]
+        self.logger.info('Bulk loaded {0} entPhysicalTable entries'.format(len(result)))
+        return result
+
+    def _load_if_attributes(self):
+        """Bulk load ifTable/ifXTable columns used by port discovery into the SNMP property cache,
+        so the port loop does not query the device per port
+
+        :return:
+        """
+
+        try:
+            if_attributes_table = self._walk_columns('IF-MIB', 'ifTable', *self._if_table_columns)
+        except Exception as e:
+            self.logger.error('Failed to bulk load interface attributes: {0}'.format(e))
+            return
+        self._cache_table('IF-MIB', if_attributes_table, self._if_table_columns, self.if_table.keys())
+        self.logger.info('Bulk loaded attributes of {0} interfaces'.format(len(if_attributes_table)))
+
+    def _cache_table(self, snmp_module_name, table, columns, indexes=None):
+        """Put values of walked table columns into the SNMP property cache,
+        indexes missing in the walk are cached as empty values, the same get_property returns for them
+
+        :param snmp_module_name: MIB name, i.e. 'IF-MIB'
+        :param table: QualiMibTable with walked columns
+        :param columns: list of cached columns
+        :param indexes: table indexes to cache, all table indexes by default
+        """
+
+        if indexes is None:
+            indexes = table.keys()
+        for index in indexes:
+            row = table.get(index, {})
+            for column in columns:
+                self._snmp_property_cache[(snmp_module_name, column, str(index))] = row.get(column, '')
+
+    def _get_table_columns(self, snmp_module_name, table_name, *columns):
+        """Read several columns of the same MIB table, with a single bulk walk in bulk mode,
+        otherwise column by column
+
+        :param snmp_module_name: MIB name, i.e. 'EtherLike-MIB'
+        :param table_name: name of the returned table, i.e. 'dot3StatsTable'
+        :param columns: column names, i.e. 'dot3StatsIndex', 'dot3StatsDuplexStatus'
+        :rtype: QualiMibTable
+        :return: columns joined by index
+        """
+
+        if self._snmp_bulk_mode:
+            try:
+                return self._walk_columns(snmp_module_name, table_name, *columns)
+            except Exception as e:
+                self.logger.error('Failed to bulk load {0}, falling back to walk: {1}'.format(table_name, e))
+
+        result = QualiMibTable(table_name)
+        for column in columns:
+            for index, value in self.snmp.get_table(snmp_module_name, column).iteritems():
+                if index not in result:
+                    result[index] = {'suffix': value['suffix']}
+                result[index][column] = value[column]
+        return result
+
+    def _get_property(self, snmp_module_name, property_name, index, return_type='str'):
+        """Read-through cache in front of QualiSnmp.get_property, lives for a single discovery
+
+        :param snmp_module_name: MIB name, like 'IF-MIB'
+        :param property_name: property name, i.e. 'ifDescr'
+        :param index: index of the required element, i.e. '1' or '1.2.3.0'
+        :param return_type: type of the output we expect to get in response, i.e. 'int'
+        :return: property value
+        """
+
+        key = (snmp_module_name, property_name, str(index))
+        if key in self._snmp_property_cache:
+            self._snmp_cache_hits += 1
+            value = self._snmp_property_cache[key]
+        else:
+            self._snmp_cache_misses += 1
+            value = self.snmp.get_property(snmp_module_name, property_name, index)
+            self._snmp_property_cache[key] = value
+
+        if 'int' in return_type:
+            try:
+                return int(value)
+            except ValueError:
+                return 0
+        return value
+
+    def _get_properties(self, snmp_module_name, index, properties_map):
+        """Cached equivalent of QualiSnmp.get_properties
+
+        :param snmp_module_name: MIB name 'IF-MIB'
+        :param index: index of the required element '1'
+        :param properties_map: map of required property and it's default type, i.e. {'ifDescr': 'str', 'ifMtu': 'int'}
+        :return: QualiMibTable
+        """
+
+        result = QualiMibTable(snmp_module_name)
+        result[index] = {}
+        for property_name, return_type in properties_map.iteritems():
+            result[index][property_name] = self._get_property(snmp_module_name, property_name, index, return_type)
+        return result
+
+    @autoload_phase
+    def _prefetch_entity_attributes(self):
+        """Read entPhysicalTable columns used by chassis, module and power port attributes
+        with pipelined multi-varbind GET requests and put them into the SNMP property cache
+
+        :return:
+        """
+
+        entity_properties = [(self.chassis_list, ['entPhysicalModelName', 'entPhysicalSerialNum']),
+                             (self.module_list, ['entPhysicalSoftwareRev', 'entPhysicalSerialNum']),
+                             (self.power_supply_list, ['entPhysicalModelName', 'entPhysicalDescr',
+                                                       'entPhysicalHardwareRev', 'entPhysicalSerialNum'])]
+        properties = OrderedSet()
+        for indexes, columns in entity_properties:
+            for index in indexes:
+                for column in columns:
+                    if ('ENTITY-MIB', column, str(index)) not in self._snmp_property_cache:
+                        properties.add(('ENTITY-MIB', column, index))
+        self._get_properties_pipelined(properties)
+
+    def _get_properties_pipelined(self, properties):
+        """Read scalar values with multi-varbind GET requests and put them into the SNMP property cache.
+        Requests are sized to fit SNMP_MAX_MESSAGE_SIZE, up to SNMP_GET_WINDOW requests are in flight.
+        Values of failed requests are not cached, _get_property reads them one by one later.
+
+        :param properties: list of (MIB name, property name, index)
+        """
+
+        if not properties:
+            return
+        start_time = time.time()
+        batches = self._get_varbind_batches(properties)
+        if self._snmp_get_window > 1 and len(batches) > 1:
+            results = self._map_with_snmp_workers(self._get_varbind_batch, batches,
+                                                  min(self._snmp_get_window, len(batches)))
+        else:
+            results = map(self._get_varbind_batch, batches)
+
+        for values in results:
+            self._snmp_property_cache.update(values)
+        self.logger.info('{0} properties read with {1} GET requests in {2:.3f} seconds'.format(
+            len(properties), len(batches), time.time() - start_time))
+
+    def _get_varbind_batches(self, properties):
+        """Split properties into GET requests, responses of which fit SNMP_MAX_MESSAGE_SIZE
+
+        :param properties: list of (MIB name, property name, index)
+        :rtype: list
+        :return: list of lists of (cache key, OID)
+        """
+
+        # Message header, community or USM parameters and PDU header
+        message_overhead = 64
+        batches = []
+        batch = []
+        batch_size = message_overhead
+        for snmp_module_name, property_name, index in properties:
+            index_list = index.split('.') if isinstance(index, str) else [index]
+            oid = ObjectIdentity(snmp_module_name, property_name, *index_list).resolveWithMib(
+                self.snmp.mib_viewer).getOid()
+            # varbind sequence header, BER encoded OID, expected value
+            varbind_size = 4 + sum((arc.bit_length() + 6) // 7 or 1 for arc in oid[2:]) + 1 + \
+                self._snmp_get_value_size
+            if batch and batch_size + varbind_size > self._snmp_max_message_size:
+                batches.append(batch)
+                batch = []
+                batch_size = message_overhead
+            batch.append(((snmp_module_name, property_name, str(index)), tuple(oid)))
+            batch_size += varbind_size
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _get_varbind_batch(self, batch):
+        """Read single multi-varbind GET request, request is split in halves if agent responds with tooBig
+
+        :param batch: list of (cache key, OID)
+        :rtype: dict
+        :return: values by cache key, missing instances are returned as empty values
+        """
+
+        error_indication, error_status, error_index, var_binds = self.snmp.cmd_gen.getCmd(
+            self.snmp.security, self.snmp.target, *[ObjectIdentity(oid) for key, oid in batch])
+        if error_status and error_status.prettyPrint() == 'tooBig' and len(batch) > 1:
+            result = self._get_varbind_batch(batch[:len(batch) // 2])
+            result.update(self._get_varbind_batch(batch[len(batch) // 2:]))
+            return result
+        if error_indication or error_status:
+            self.logger.error('Failed to get {0} properties with a single request: {1}'.format(
+                len(batch), error_indication or error_status.prettyPrint()))
+            return {}
+
+        result = {}
+        for (key, oid), var_bind in zip(batch, var_binds):
+            value = var_bind[1]
+            if isinstance(value, (NoSuchInstance, NoSuchObject, EndOfMibView)):
+                result[key] = ''
+            else:
+                result[key] = value.prettyPrint().strip(' \t\n\r')
+        return result
+
+    def _walk_columns(self, snmp_module_name, table_name, *columns):
+        """Walk several columns of the same MIB table at once using pipelined GETBULK requests,
+        every PDU carries one varbind per column, so the whole table is read in a few round trips
+
+        :param snmp_module_name: MIB name, i.e. 'ENTITY-MIB'
+        :param table_name: name of the returned table, i.e. 'entPhysicalTable'
+        :param columns: column names, i.e. 'entPhysicalClass', 'entPhysicalName'
+        :rtype: QualiMibTable
+        :return: columns joined by index, same shape as QualiSnmp.get_table returns
+        """
+
+        object_identities = [ObjectIdentity(snmp_module_name, column) for column in columns]
+        error_indication, error_status, error_index, var_bind_table = self.snmp.cmd_gen.bulkCmd(
+            self.snmp.security, self.snmp.target, 0, self._snmp_bulk_max_repetitions, *object_identities)
+        if error_indication or error_status:
+            raise Exception(self.__class__.__name__, 'Failed to walk {0}: {1}'.format(
+                table_name, error_indication or error_status.prettyPrint()))
+
+        result = QualiMibTable(table_name)
+        for var_binds in var_bind_table:
+            for column, var_bind in zip(columns, var_binds):
+                mod_name, mib_name, suffix = self.snmp.mib_viewer.getNodeLocation(var_bind[0])
+                # Column is exhausted, pysnmp keeps returning OIDs from the following columns for it
+                if mib_name != column:
+                    continue
+                index = self._get_table_index(suffix)
+                if index not in result:
+                    result[index] = {'suffix': str(suffix)}
+                result[index][mib_name] = var_bind[1].prettyPrint().strip(' \t\n\r')
+        return result
+
+    @staticmethod
+    def _get_walk_order(table):
+        """Get table indexes in the order SNMP walk returns rows, QualiMibTable is a plain dict and doesn't keep it
+
+        :param table: QualiMibTable with 'suffix' in rows
+        :rtype: list
+        """
+
+        def get_suffix_arcs(index):
+            return tuple(int(arc) for arc in str(table[index].get('suffix', index)).split('.') if arc.isdigit())
+
+        return sorted(table, key=get_suffix_arcs)
+
+    @staticmethod
+    def _get_table_index(suffix):
+        """Convert OID suffix to the table index the same way QualiSnmp.walk does
+
+        :param suffix: OID suffix of the table row
+        :return: int for single index, float for double index, str otherwise
+        """
+
+        if str(suffix).isdigit():
+            return int(str(suffix))
+        elif str(suffix).replace('.', '', 1).isdigit():
+            return float(str(suffix))
+        return str(suffix)
+
+    @autoload_phase
     def _filter_lower_bay_containers(self):
 
         upper_container = None
         lower_container = None
         containers = self.entity_table.filter_by_column('Class', "container").sort_by_column('ParentRelPos').keys()
         for container in containers:
-            vendor_type = self.snmp.get_property('ENTITY-MIB', 'entPhysicalVendorType', container)
+            vendor_type = self.entity_table[container]['entPhysicalVendorType']
             if 'uppermodulebay' in vendor_type.lower():
                 upper_container = container
             if 'lowermodulebay' in vendor_type.lower():
                 lower_container = container
         if lower_container and upper_container:
-            child_upper_items_len = len(self.entity_table.filter_by_column('ContainedIn', str(upper_container)
-                                                                           ).sort_by_column('ParentRelPos').keys())
-            child_lower_items = self.entity_table.filter_by_column('ContainedIn', str(lower_container)
-                                                                   ).sort_by_column('ParentRelPos').keys()
+            child_upper_items_len = len(self.entity_children.get(upper_container, []))
+            child_lower_items = self.entity_children.get(lower_container, [])
             for child in child_lower_items:
                 self.entity_table[child]['entPhysicalContainedIn'] = upper_container
                 self.entity_table[child]['entPhysicalParentRelPos'] = str(child_upper_items_len + int(
                     self.entity_table[child]['entPhysicalParentRelPos']))
+            self._build_entity_tree()
+
+    @autoload_phase
+    def _build_entity_tree(self):
+        """Build parent/children tree of the entity table with normalized entity classes,
+        drops memoized module parents, resource ids and relative paths built on the previous tree
 
+        :return:
+        """
+
+        self.entity_parents = {}
+        self.entity_children = {}
+        self.entity_classes = {}
+        for index, value in self.entity_table.iteritems():
+            parent_id = int(value['entPhysicalContainedIn'])
+            self.entity_parents[index] = parent_id
+            self.entity_children.setdefault(parent_id, []).append(index)
+            self.entity_classes[index] = value['entPhysicalClass']
+        self._module_parents_cache = {}
+        self._resource_id_cache = {}
+        self._relative_path_cache = {}
+
+    @autoload_phase
     def add_relative_paths(self):
         """Build dictionary of relative paths for each module and port
 
         :return:
         """
 
-        port_list = list(self.port_list)
-        module_list = list(self.module_list)
-        for module in module_list:
-            if module not in self.exclusion_list:
-                self.relative_path[module] = self.get_relative_path(module) + '/' + self._get_resource_id(module)
-            else:
-                self.module_list.remove(module)
-        for port in port_list:
-            if port not in self.exclusion_list:
-                self.relative_path[port] = self.get_relative_path(port) + '/' + self._get_resource_id(port)
-            else:
-                self.port_list.remove(port)
+        self.module_list -= self.exclusion_list
+        self.port_list -= self.exclusion_list
+        self._relative_path_cache = {}
+        for module in self.module_list:
+            self.relative_path[module] = self.get_relative_path(module) + '/' + self._get_resource_id(module)
+        for port in self.port_list:
+            self.relative_path[port] = self.get_relative_path(port) + '/' + self._get_resource_id(port)
 
     def _add_resource(self, resource):
         """Add object data to resources and attributes lists
@@ -349,6 +1130,7 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
         self.resources.append(resource.get_autoload_resource_details())
         self.attributes.extend(resource.get_autoload_resource_attributes())
 
+    @autoload_phase
     def get_module_list(self):
         """Set list of all modules from entity mib table for provided list of ports
 
@@ -356,35 +1138,39 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
         """
 
         for port in self.port_list:
-            modules = []
-            modules.extend(self._get_module_parents(port))
-            for module in modules:
-                if module in self.module_list:
+            for module in self._get_module_parents(port):
+                if module in self.module_list or module in self._excluded_models:
                     continue
-                vendor_type = self.snmp.get_property('ENTITY-MIB', 'entPhysicalVendorType', module)
+                vendor_type = self.entity_table[module]['entPhysicalVendorType']
                 if not re.search(self.module_exclude_pattern, vendor_type.lower()):
                     if module not in self.exclusion_list and module not in self.module_list:
                         self.module_list.append(module)
                 else:
                     self._excluded_models.append(module)
+        self._resource_id_cache = {}
 
     def _get_module_parents(self, module_id):
+        if module_id in self._module_parents_cache:
+            return self._module_parents_cache[module_id]
+
         result = []
-        parent_id = int(self.entity_table[module_id]['entPhysicalContainedIn'])
+        parent_id = self.entity_parents[module_id]
         if parent_id > 0 and parent_id in self.entity_table:
-            if re.search(r'module', self.entity_table[parent_id]['entPhysicalClass']):
+            if self.entity_classes[parent_id] == 'module':
                 result.append(parent_id)
                 result.extend(self._get_module_parents(parent_id))
-            elif re.search(r'chassis', self.entity_table[parent_id]['entPhysicalClass']):
-                return result
-            else:
+            elif self.entity_classes[parent_id] != 'chassis':
                 result.extend(self._get_module_parents(parent_id))
+        self._module_parents_cache[module_id] = result
         return result
 
     def _get_resource_id(self, item_id):
-        parent_id = int(self.entity_table[item_id]['entPhysicalContainedIn'])
+        if item_id in self._resource_id_cache:
+            return self._resource_id_cache[item_id]
+
+        parent_id = self.entity_parents[item_id]
         if parent_id > 0 and parent_id in self.entity_table:
-            if re.search(r'container|backplane', self.entity_table[parent_id]['entPhysicalClass']):
+            if self.entity_classes[parent_id] in ('container', 'backplane'):
                 result = self.entity_table[parent_id]['entPhysicalParentRelPos']
             elif parent_id in self._excluded_models:
                 result = self._get_resource_id(parent_id)
@@ -392,8 +1178,10 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
                 result = self.entity_table[item_id]['entPhysicalParentRelPos']
         else:
             result = self.entity_table[item_id]['entPhysicalParentRelPos']
+        self._resource_id_cache[item_id] = result
         return result
 
+    @autoload_phase
     def _get_chassis_attributes(self, chassis_list):
         """Get Chassis element attributes
 
@@ -405,8 +1193,8 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
         for chassis in chassis_list:
             chassis_id = self.relative_path[chassis]
             chassis_details_map = {
-                'chassis_model': self.snmp.get_property('ENTITY-MIB', 'entPhysicalModelName', chassis),
-                'serial_number': self.snmp.get_property('ENTITY-MIB', 'entPhysicalSerialNum', chassis)
+                'chassis_model': self._get_property('ENTITY-MIB', 'entPhysicalModelName', chassis),
+                'serial_number': self._get_property('ENTITY-MIB', 'entPhysicalSerialNum', chassis)
             }
             if chassis_details_map['chassis_model'] == '':
                 chassis_details_map['chassis_model'] = self.entity_table[chassis]['entPhysicalDescr']
@@ -416,6 +1204,7 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
             self.logger.info('Added ' + self.entity_table[chassis]['entPhysicalDescr'] + ' Chass')
         self.logger.info('Finished Loading Modules')
 
+    @autoload_phase
     def _get_module_attributes(self):
         """Set attributes for all discovered modules
 
@@ -428,8 +1217,8 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
             module_index = self._get_resource_id(module)
             module_details_map = {
                 'module_model': self.entity_table[module]['entPhysicalDescr'],
-                'version': self.snmp.get_property('ENTITY-MIB', 'entPhysicalSoftwareRev', module),
-                'serial_number': self.snmp.get_property('ENTITY-MIB', 'entPhysicalSerialNum', module)
+                'version': self._get_property('ENTITY-MIB', 'entPhysicalSoftwareRev', module),
+                'serial_number': self._get_property('ENTITY-MIB', 'entPhysicalSerialNum', module)
             }
 
             if '/' in module_id and len(module_id.split('/')) < 3:
@@ -444,6 +1233,7 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
             self.logger.info('Module {} added'.format(self.entity_table[module]['entPhysicalDescr']))
         self.logger.info('Load modules completed.')
 
+    @autoload_phase
     def _get_power_ports(self):
         """Get attributes for power ports provided in self.power_supply_list
 
@@ -451,17 +1241,17 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
         """
 
         self.logger.info('Load Power Ports:')
-        for port in self.power_supply_list:
+        for port_number, port in enumerate(self.power_supply_list):
             port_id = self.entity_table[port]['entPhysicalParentRelPos']
-            parent_index = int(self.entity_table[port]['entPhysicalContainedIn'])
+            parent_index = self.entity_parents[port]
             parent_id = int(self.entity_table[parent_index]['entPhysicalParentRelPos'])
             chassis_id = self.get_relative_path(parent_index)
             relative_path = '{0}/PP{1}-{2}'.format(chassis_id, parent_id, port_id)
-            port_name = 'PP{0}'.format(self.power_supply_list.index(port))
-            port_details = {'port_model': self.snmp.get_property('ENTITY-MIB', 'entPhysicalModelName', port, ),
-                            'description': self.snmp.get_property('ENTITY-MIB', 'entPhysicalDescr', port, 'str'),
-                            'version': self.snmp.get_property('ENTITY-MIB', 'entPhysicalHardwareRev', port),
-                            'serial_number': self.snmp.get_property('ENTITY-MIB', 'entPhysicalSerialNum', port)
+            port_name = 'PP{0}'.format(port_number)
+            port_details = {'port_model': self._get_property('ENTITY-MIB', 'entPhysicalModelName', port, ),
+                            'description': self._get_property('ENTITY-MIB', 'entPhysicalDescr', port, 'str'),
+                            'version': self._get_property('ENTITY-MIB', 'entPhysicalHardwareRev', port),
+                            'serial_number': self._get_property('ENTITY-MIB', 'entPhysicalSerialNum', port)
                             }
             power_port_object = PowerPort(name=port_name, relative_path=relative_path, **port_details)
             self._add_resource(power_port_object)
@@ -469,6 +1259,7 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
             self.logger.info('Added ' + self.entity_table[port]['entPhysicalName'].strip(' \t\n\r') + ' Power Port')
         self.logger.info('Load Power Ports completed.')
 
+    @autoload_phase
     def _get_port_channels(self):
         """Get all port channels and set attributes for them
 
@@ -488,7 +1279,7 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
             else:
                 self.logger.error('Adding of {0} failed. Name is invalid'.format(interface_model))
                 continue
-            attribute_map = {'description': self.snmp.get_property('IF-MIB', 'ifAlias', key),
+            attribute_map = {'description': self._get_property('IF-MIB', 'ifAlias', key),
                              'associated_ports': self._get_associated_ports(key)}
             attribute_map.update(self._get_ip_interface_details(key))
             port_channel = PortChannel(name=interface_model, relative_path=interface_id, **attribute_map)
@@ -505,11 +1296,24 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
         """
 
         result = ''
-        for key, value in self.port_channel_ports.iteritems():
-            if str(item_id) in value['dot3adAggPortAttachedAggID']:
-                result += self.if_table[key][self.IF_ENTITY].replace('/', '-').replace(' ', '') + '; '
+        for key in self.lag_member_index.get(item_id, []):
+            result += self.if_table[key][self.IF_ENTITY].replace('/', '-').replace(' ', '') + '; '
         return result.strip(' \t\n\r')
 
+    @autoload_phase
+    def _build_lag_member_index(self):
+        """Build aggregator ifIndex to member ifIndexes index from dot3adAggPortAttachedAggID in a single pass
+
+        :return:
+        """
+
+        self.lag_member_index = {}
+        for key in sorted(self.port_channel_ports.keys()):
+            aggregator_id = self.port_channel_ports[key].get('dot3adAggPortAttachedAggID', '')
+            if aggregator_id.isdigit() and int(aggregator_id) > 0 and key in self.if_table:
+                self.lag_member_index.setdefault(int(aggregator_id), []).append(key)
+
+    @autoload_phase
     def _get_ports_attributes(self):
         """Get resource details and attributes for every port in self.port_list
 
@@ -517,24 +1321,27 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
         """
 
         self.logger.info('Load Ports:')
+        if_table_port_attr = {'ifType': 'str', 'ifPhysAddress': 'str', 'ifMtu': 'int', 'ifSpeed': 'int'}
         for port in self.port_list:
-            if_table_port_attr = {'ifType': 'str', 'ifPhysAddress': 'str', 'ifMtu': 'int', 'ifSpeed': 'int'}
-            if_table = self.if_table[self.port_mapping[port]].copy()
-            if_table.update(self.snmp.get_properties('IF-MIB', self.port_mapping[port], if_table_port_attr))
-            interface_name = self.if_table[self.port_mapping[port]][self.IF_ENTITY].replace("'", '')
+            port_index = self.port_mapping[port]
+            if_table = self._get_properties('IF-MIB', port_index, if_table_port_attr)[port_index]
+            interface_name = self.if_table[port_index][self.IF_ENTITY].replace("'", '')
             if interface_name == '':
                 interface_name = self.entity_table[port]['entPhysicalName']
             if interface_name == '':
                 continue
-            interface_type = if_table[self.port_mapping[port]]['ifType'].replace('/', '').replace("'", '')
+            interface_type = if_table['ifType'].replace('/', '').replace("'", '')
+            bandwidth = if_table['ifSpeed']
+            if bandwidth >= self.IF_SPEED_MAX:
+                bandwidth = self._get_property('IF-MIB', 'ifHighSpeed', port_index, 'int') * 1000000
             attribute_map = {'l2_protocol_type': interface_type,
-                             'mac': if_table[self.port_mapping[port]]['ifPhysAddress'],
-                             'mtu': if_table[self.port_mapping[port]]['ifMtu'],
-                             'bandwidth': if_table[self.port_mapping[port]]['ifSpeed'],
-                             'description': self.snmp.get_property('IF-MIB', 'ifAlias', self.port_mapping[port]),
-                             'adjacent': self._get_adjacent(self.port_mapping[port])}
-            attribute_map.update(self._get_interface_details(self.port_mapping[port]))
-            attribute_map.update(self._get_ip_interface_details(self.port_mapping[port]))
+                             'mac': if_table['ifPhysAddress'],
+                             'mtu': if_table['ifMtu'],
+                             'bandwidth': bandwidth,
+                             'description': self._get_property('IF-MIB', 'ifAlias', port_index),
+                             'adjacent': self._get_adjacent(port_index)}
+            attribute_map.update(self._get_interface_details(port_index))
+            attribute_map.update(self._get_ip_interface_details(port_index))
             port_object = Port(name=interface_name, relative_path=self.relative_path[port], **attribute_map)
             self._add_resource(port_object)
             self.logger.info('Added ' + interface_name + ' Port')
@@ -547,10 +1354,13 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
         :return:
         """
 
+        if item_id in self._relative_path_cache:
+            return self._relative_path_cache[item_id]
+
         result = ''
         if item_id not in self.chassis_list:
-            parent_id = int(self.entity_table[item_id]['entPhysicalContainedIn'])
-            if parent_id not in self.relative_path.keys():
+            parent_id = self.entity_parents[item_id]
+            if parent_id not in self.relative_path:
                 if parent_id in self.module_list:
                     result = self._get_resource_id(parent_id)
                 if result != '':
@@ -562,6 +1372,7 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
         else:
             result = self.relative_path[item_id]
 
+        self._relative_path_cache[item_id] = result
         return result
 
     def _filter_entity_table(self, raw_entity_table):
@@ -577,6 +1388,28 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
             if parent_id not in raw_entity_table or parent_id in self.exclusion_list:
                 self.exclusion_list.append(element)
 
+    @autoload_phase
+    def _build_ip_address_index(self):
+        """Build ifIndex to IP addresses index from ipAddrTable and ipv6AddrTable in a single pass
+
+        :return:
+        """
+
+        self.ip_v4_address_index = {}
+        for key, value in self.ip_v4_table.iteritems():
+            if 'ipAdEntIfIndex' in value:
+                self.ip_v4_address_index.setdefault(int(value['ipAdEntIfIndex']), []).append(str(key))
+
+        self.ip_v6_address_index = {}
+        for value in self.ip_v6_table.values():
+            # ipv6AddrTable index is ipv6IfIndex followed by 16 octets of the address
+            suffix = value['suffix'].split('.')
+            if len(suffix) != 17:
+                continue
+            octets = [int(octet) for octet in suffix[1:]]
+            address = ':'.join('{0:x}'.format(high << 8 | low) for high, low in zip(octets[::2], octets[1::2]))
+            self.ip_v6_address_index.setdefault(int(suffix[0]), []).append(address)
+
     def _get_ip_interface_details(self, port_index):
         """Get IP address details for provided port
 
@@ -584,18 +1417,8 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
         :return interface_details: detected info for provided interface dict{'IPv4 Address': '', 'IPv6 Address': ''}
         """
 
-        interface_details = {'ipv4_address': '', 'ipv6_address': ''}
-        if self.ip_v4_table and len(self.ip_v4_table) > 1:
-            for key, value in self.ip_v4_table.iteritems():
-                if 'ipAdEntIfIndex' in value and int(value['ipAdEntIfIndex']) == port_index:
-                    interface_details['ipv4_address'] = key
-                break
-        if self.ip_v6_table and len(self.ip_v6_table) > 1:
-            for key, value in self.ip_v6_table.iteritems():
-                if 'ipAdEntIfIndex' in value and int(value['ipAdEntIfIndex']) == port_index:
-                    interface_details['ipv6_address'] = key
-                break
-        return interface_details
+        return {'ipv4_address': ', '.join(self.ip_v4_address_index.get(port_index, [])),
+                'ipv6_address': ', '.join(self.ip_v6_address_index.get(port_index, []))}
 
     def _get_interface_details(self, port_index):
         """Get interface attributes
@@ -604,35 +1427,48 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
         :return interface_details: detected info for provided interface dict{'Auto Negotiation': '', 'Duplex': ''}
         """
 
-        interface_details = {'duplex': 'Full', 'auto_negotiation': 'False'}
-        try:
-            auto_negotiation = self.snmp.get(('MAU-MIB', 'ifMauAutoNegAdminStatus', port_index, 1)).values()[0]
-            if 'enabled' in auto_negotiation.lower():
-                interface_details['auto_negotiation'] = 'True'
-        except Exception as e:
-            self.logger.error('Failed to load auto negotiation property for interface {0}'.format(e.message))
-        for key, value in self.duplex_table.iteritems():
-            if 'dot3StatsIndex' in value.keys() and value['dot3StatsIndex'] == str(port_index):
-                interface_duplex = self.snmp.get_property('EtherLike-MIB', 'dot3StatsDuplexStatus', key)
-                if 'halfDuplex' in interface_duplex:
-                    interface_details['duplex'] = 'Half'
+        interface_details = {'duplex': self.duplex_index.get(port_index, 'Full'),
+                             'auto_negotiation': self.auto_negotiation_index.get(port_index, 'False')}
         return interface_details
 
+    @autoload_phase
+    def _build_interface_details_index(self):
+        """Build ifIndex keyed duplex and auto negotiation indexes from dot3StatsTable and ifMauAutoNegTable
+
+        :return:
+        """
+
+        self.duplex_index = {}
+        for value in self.duplex_table.values():
+            if 'dot3StatsIndex' in value and 'dot3StatsDuplexStatus' in value:
+                self.duplex_index[int(value['dot3StatsIndex'])] = \
+                    'Half' if 'halfDuplex' in value['dot3StatsDuplexStatus'] else 'Full'
+
+        self.auto_negotiation_index = {}
+        for key in sorted(self.auto_negotiation_table.keys()):
+            value = self.auto_negotiation_table[key]
+            # ifMauAutoNegTable index is ifIndex.ifMauIndex, the first MAU of the interface is used
+            if_index = int(value['suffix'].split('.')[0])
+            if 'ifMauAutoNegAdminStatus' in value and if_index not in self.auto_negotiation_index:
+                self.auto_negotiation_index[if_index] = \
+                    'True' if 'enabled' in value['ifMauAutoNegAdminStatus'].lower() else 'False'
+
+    @autoload_phase
     def _get_device_details(self):
         """Get root element attributes
 
         """
 
         self.logger.info('Load Firewall Attributes:')
-        result = {'system_name': self.snmp.get_property('SNMPv2-MIB', 'sysName', 0),
+        result = {'system_name': self._get_property('SNMPv2-MIB', 'sysName', 0),
                   'vendor': 'Cisco',
                   'model': self._get_device_model(),
-                  'location': self.snmp.get_property('SNMPv2-MIB', 'sysLocation', 0),
-                  'contact': self.snmp.get_property('SNMPv2-MIB', 'sysContact', 0),
+                  'location': self._get_property('SNMPv2-MIB', 'sysLocation', 0),
+                  'contact': self._get_property('SNMPv2-MIB', 'sysContact', 0),
                   'version': ''}
 
         match_version = re.search(r'Version\s+(?P<software_version>\S+)\S*\s+',
-                                  self.snmp.get_property('SNMPv2-MIB', 'sysDescr', 0))
+                                  self._get_property('SNMPv2-MIB', 'sysDescr', 0))
         if match_version:
             result['version'] = match_version.groupdict()['software_version'].replace(',', '')
 
@@ -640,6 +1476,38 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
         self.attributes.extend(root.get_autoload_resource_attributes())
         self.logger.info('Load Firewall Attributes completed.')
 
+    @autoload_phase
+    def _build_neighbor_index(self):
+        """Build CDP neighbors index by ifIndex and LLDP neighbors index by local port number in a single pass
+        over cdpCacheTable, lldpLocPortDesc and lldpRemTable
+
+        :return:
+        """
+
+        self.cdp_neighbor_index = {}
+        for value in self.cdp_table.values():
+            if 'cdpCacheDeviceId' in value and 'cdpCacheDevicePort' in value:
+                # cdpCacheTable index is cdpCacheIfIndex.cdpCacheDeviceIndex
+                if_index = int(value['suffix'].split('.')[0])
+                self.cdp_neighbor_index[if_index] = '{0} through {1}'.format(value['cdpCacheDeviceId'],
+                                                                             value['cdpCacheDevicePort'])
+
+        self.lldp_local_port_index = {}
+        self.lldp_local_ports = []
+        for key in sorted(self.lldp_local_table.keys()):
+            value = self.lldp_local_table[key]
+            if 'lldpLocPortDesc' in value:
+                self.lldp_local_port_index.setdefault(value['lldpLocPortDesc'].strip(), key)
+                self.lldp_local_ports.append((value['lldpLocPortDesc'], key))
+
+        self.lldp_neighbor_index = {}
+        for value in self.lldp_remote_table.values():
+            if 'lldpRemSysName' in value and 'lldpRemPortDesc' in value:
+                # lldpRemTable index is lldpRemTimeMark.lldpRemLocalPortNum.lldpRemIndex
+                local_port = int(value['suffix'].split('.')[1])
+                self.lldp_neighbor_index[local_port] = '{0} through {1}'.format(value['lldpRemSysName'],
+                                                                                value['lldpRemPortDesc'])
+
     def _get_adjacent(self, interface_id):
         """Get connected device interface and device name to the specified port id, using cdp or lldp protocols
 
@@ -648,22 +1516,32 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
         :rtype string
         """
 
-        result = ''
-        for key, value in self.cdp_table.iteritems():
-            if 'cdpCacheDeviceId' in value and 'cdpCacheDevicePort' in value:
-                if re.search(r'^\d+', str(key)).group(0) == interface_id:
-                    result = '{0} through {1}'.format(value['cdpCacheDeviceId'], value['cdpCacheDevicePort'])
-        if result == '' and self.lldp_remote_table:
-            for key, value in self.lldp_local_table.iteritems():
-                interface_name = self.if_table[interface_id][self.IF_ENTITY]
-                if interface_name == '':
-                    break
-                if 'lldpLocPortDesc' in value and interface_name in value['lldpLocPortDesc']:
-                    if 'lldpRemSysName' in self.lldp_remote_table and 'lldpRemPortDesc' in self.lldp_remote_table:
-                        result = '{0} through {1}'.format(self.lldp_remote_table[key]['lldpRemSysName'],
-                                                          self.lldp_remote_table[key]['lldpRemPortDesc'])
+        result = self.cdp_neighbor_index.get(interface_id, '')
+        if result == '':
+            interface_name = self.if_table[interface_id][self.IF_ENTITY]
+            local_port = self._get_lldp_local_port(interface_name) if interface_name else None
+            if local_port is not None:
+                result = self.lldp_neighbor_index.get(local_port, '')
         return result
 
+    def _get_lldp_local_port(self, interface_name):
+        """Get LLDP local port number of the interface. lldpLocPortDesc equal to the interface name is looked up
+        first, otherwise the first description containing the interface name as a whole word is used,
+        i.e. "Adaptive Security Appliance 'GigabitEthernet0/1' interface", but not "GigabitEthernet0/10"
+
+        :param interface_name: interface name, i.e. 'GigabitEthernet0/1'
+        :return: lldpLocPortNum or None if no description matches
+        """
+
+        local_port = self.lldp_local_port_index.get(interface_name)
+        if local_port is not None:
+            return local_port
+        pattern = re.compile(r'(?<![\w/.:-]){0}(?![\w/.:-])'.format(re.escape(interface_name)))
+        for port_description, port_number in self.lldp_local_ports:
+            if pattern.search(port_description):
+                return port_number
+        return None
+
     def _get_device_model(self):
         """Get device model form snmp SNMPv2 mib
 
@@ -672,13 +1550,90 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
         """
 
         result = ''
-        if not result or result == '':
-            self.snmp.load_mib(['CISCO-PRODUCTS-MIB', 'CISCO-ENTITY-VENDORTYPE-OID-MIB'])
+        product_name = self._get_product_name(self._get_property('SNMPv2-MIB', 'sysObjectID', '0'))
+        if not product_name:
+            self.logger.info('sysObjectID is not in the precompiled products table, loading CISCO-PRODUCTS-MIB')
+            self.snmp.load_mib(['CISCO-PRODUCTS-MIB'])
             match_name = re.search(r'::(?P<model>\S+$)', self.snmp.get_property('SNMPv2-MIB', 'sysObjectID', '0'))
             if match_name:
-                result = match_name.groupdict()['model'].capitalize()
+                product_name = match_name.groupdict()['model']
+        if product_name:
+            result = product_name.capitalize()
+        return result
+
+    def _get_product_name(self, sys_object_id):
+        """Get CISCO-PRODUCTS-MIB symbol name for sysObjectID from the precompiled products table
+
+        :param sys_object_id: sysObjectID value, i.e. 'CISCO-SMI::ciscoProducts.1408' or '1.3.6.1.4.1.9.1.1408'
+        :return: product name, i.e. 'ciscoASA5525' or None if it is unknown
+        """
+
+        if sys_object_id.startswith('CISCO-PRODUCTS-MIB::'):
+            return sys_object_id.split('::', 1)[1]
+        oid = self._get_oid_arcs(sys_object_id)
+        if oid and oid[:-1] == CISCO_PRODUCTS_PREFIX:
+            return self._get_cisco_oid_trie().get(oid)
+        return None
+
+    def _get_vendor_type(self, vendor_type):
+        """Resolve entPhysicalVendorType value to CISCO-ENTITY-VENDORTYPE-OID-MIB symbol name and entity class
+        of its cev* family, i.e. cevChassis -> 'chassis'
+
+        :param vendor_type: entPhysicalVendorType value, i.e. 'SNMPv2-SMI::enterprises.9.12.3.1.3.1408'
+        :rtype: tuple
+        :return: (vendor type name, entity class or None), name is the original value if OID is not a vendor type
+        """
+
+        if vendor_type in self._vendor_type_cache:
+            return self._vendor_type_cache[vendor_type]
+
+        result = (vendor_type, None)
+        oid = self._get_oid_arcs(vendor_type) if vendor_type else ()
+        if oid[:len(CISCO_VENDORTYPES_PREFIX)] == CISCO_VENDORTYPES_PREFIX:
+            prefixes = self._get_cisco_oid_trie().prefixes(oid)
+            if prefixes:
+                depth, name = prefixes[-1]
+                family_depth, family = prefixes[0]
+                entity_class = None
+                if family_depth == len(CISCO_VENDORTYPES_PREFIX) + 1:
+                    entity_class = self.vendor_type_classes.get(family)
+                suffix = ''.join('.{0}'.format(arc) for arc in oid[depth:])
+                result = ('CISCO-ENTITY-VENDORTYPE-OID-MIB::{0}{1}'.format(name, suffix), entity_class)
+        self._vendor_type_cache[vendor_type] = result
         return result
 
+    @classmethod
+    def _get_cisco_oid_trie(cls):
+        """Get OID trie of CISCO-PRODUCTS-MIB and CISCO-ENTITY-VENDORTYPE-OID-MIB symbols,
+        it is built once and shared by all instances in the process
+
+        :rtype: OidTrie
+        """
+
+        if CiscoASASNMPAutoload._cisco_oid_trie is None:
+            items = [(CISCO_PRODUCTS_PREFIX + (arc,), name) for arc, name in CISCO_PRODUCTS.iteritems()]
+            items.extend((CISCO_VENDORTYPES_PREFIX + arcs, name) for arcs, name in CISCO_VENDORTYPES)
+            CiscoASASNMPAutoload._cisco_oid_trie = OidTrie(items)
+        return CiscoASASNMPAutoload._cisco_oid_trie
+
+    def _get_oid_arcs(self, value):
+        """Convert OID value returned by QualiSnmp to a tuple of arcs
+
+        :param value: OID value, i.e. 'CISCO-SMI::ciscoProducts.1408' or '1.3.6.1.4.1.9.1.1408'
+        :rtype: tuple
+        :return: OID arcs or empty tuple if value can't be resolved
+        """
+
+        try:
+            if '::' in value:
+                mib_name, symbol_name = value.split('::', 1)
+                symbol_name, _, suffix = symbol_name.partition('.')
+                object_identity = ObjectIdentity(mib_name, symbol_name).resolveWithMib(self.snmp.mib_viewer)
+                return tuple(object_identity.getOid()) + tuple(int(arc) for arc in suffix.split('.') if arc)
+            return tuple(int(arc) for arc in value.strip('.').split('.'))
+        except Exception:
+            return ()
+
     def _get_mapping(self, port_index, port_descr):
         """Get mapping from entPhysicalTable to ifTable.
         Build mapping based on ent_alias_mapping_table if exists else build manually based on
@@ -688,19 +1643,43 @@ class CiscoASASNMPAutoload(AutoloadOperationsInterface):
         |        {entPhysicalTable index: ifTable index, ...}
         """
 
-        port_id = None
-        try:
-            ent_alias_mapping_identifier = self.snmp.get(('ENTITY-MIB', 'entAliasMappingIdentifier', port_index, 0))
-            port_id = int(ent_alias_mapping_identifier['entAliasMappingIdentifier'].split('.')[-1])
-        except Exception as e:
-            try:
-                err_message = e.message._Integer__namedValues.valToNameIdx[e.message._value]
-            except:
-                err_message = str(e.message)
-            self.logger.error("Error during port mapping: {}".format(err_message))
-            if_table_re = "/".join(re.findall(r'\d+', port_descr))
-            for interface in self.if_table.values():
-                if re.search(if_table_re, interface[self.IF_ENTITY]):
-                    port_id = int(interface['suffix'])
-                    break
+        port_id = self.ent_alias_mapping_index.get(port_index)
+        if port_id is None:
+            port_id = self.if_name_index.get(self._get_interface_number(port_descr))
         return port_id
+
+    @autoload_phase
+    def _build_port_mapping_index(self):
+        """Build entPhysicalIndex to ifIndex index from entAliasMappingTable
+        and interface number to ifIndex index from ifName, used when entAliasMappingTable has no entry for a port
+
+        :return:
+        """
+
+        self.ent_alias_mapping_index = {}
+        alias_mapping_table = self._get_table_columns('ENTITY-MIB', 'entAliasMappingTable',
+                                                      'entAliasMappingIdentifier')
+        for value in alias_mapping_table.values():
+            # entAliasMappingTable index is entPhysicalIndex.entAliasLogicalIndexOrZero,
+            # entAliasMappingIdentifier points to ifIndex.<ifIndex>
+            if_index = value.get('entAliasMappingIdentifier', '').split('.')[-1]
+            if if_index.isdigit():
+                self.ent_alias_mapping_index[int(value['suffix'].split('.')[0])] = int(if_index)
+        if not self.ent_alias_mapping_index:
+            self.logger.info('entAliasMappingTable is empty, ports will be mapped by interface name')
+
+        self.if_name_index = {}
+        for key in sorted(self.if_table.keys()):
+            interface_number = self._get_interface_number(self.if_table[key][self.IF_ENTITY])
+            if interface_number and interface_number not in self.if_name_index:
+                self.if_name_index[interface_number] = int(self.if_table[key]['suffix'])
+
+    @staticmethod
+    def _get_interface_number(interface_name):
+        """Get normalized interface number, i.e. '0/1' for 'GigabitEthernet0/1'
+
+        :param interface_name: interface or physical port name
+        :rtype: str
+        """
+
+        return '/'.join(re.findall(r'\d+', interface_name))
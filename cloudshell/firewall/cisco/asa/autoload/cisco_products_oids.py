@@ -0,0 +1,462 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Generated by tools/generate_cisco_oids.py from CISCO-PRODUCTS-MIB, do not edit.
+# Source sha1: 5a6e80f4245c59f8f853fa39e9e7f5ec429827d8
+
+CISCO_PRODUCTS_PREFIX = (1, 3, 6, 1, 4, 1, 9, 1)
+
+# Last arc under ciscoProducts to CISCO-PRODUCTS-MIB symbol name
+CISCO_PRODUCTS = {
+    1: 'ciscoGatewayServer', 2: 'ciscoTerminalServer', 3: 'ciscoTrouter', 4: 'ciscoProtocolTranslator', 5: 'ciscoIGS',
+    6: 'cisco3000', 7: 'cisco4000', 8: 'cisco7000', 9: 'ciscoCS500', 10: 'cisco2000', 11: 'ciscoAGSplus',
+    12: 'cisco7010', 13: 'cisco2500', 14: 'cisco4500', 15: 'cisco2102', 16: 'cisco2202', 17: 'cisco2501',
+    18: 'cisco2502', 19: 'cisco2503', 20: 'cisco2504', 21: 'cisco2505', 22: 'cisco2506', 23: 'cisco2507',
+    24: 'cisco2508', 25: 'cisco2509', 26: 'cisco2510', 27: 'cisco2511', 28: 'cisco2512', 29: 'cisco2513',
+    30: 'cisco2514', 31: 'cisco2515', 32: 'cisco3101', 33: 'cisco3102', 34: 'cisco3103', 35: 'cisco3104',
+    36: 'cisco3202', 37: 'cisco3204', 38: 'ciscoAccessProRC', 39: 'ciscoAccessProEC', 40: 'cisco1000', 41: 'cisco1003',
+    42: 'cisco2516', 43: 'cisco1020', 44: 'cisco1004', 45: 'cisco7507', 46: 'cisco7513', 47: 'cisco7506',
+    48: 'cisco7505', 49: 'cisco1005', 50: 'cisco4700', 51: 'ciscoPro1003', 52: 'ciscoPro1004', 53: 'ciscoPro1005',
+    54: 'ciscoPro1020', 55: 'ciscoPro2500PCE', 56: 'ciscoPro2501', 57: 'ciscoPro2503', 58: 'ciscoPro2505',
+    59: 'ciscoPro2507', 60: 'ciscoPro2509', 61: 'ciscoPro2511', 62: 'ciscoPro2514', 63: 'ciscoPro2516',
+    64: 'ciscoPro2519', 65: 'ciscoPro2521', 66: 'ciscoPro4500', 67: 'cisco2517', 68: 'cisco2518', 69: 'cisco2519',
+    70: 'cisco2520', 71: 'cisco2521', 72: 'cisco2522', 73: 'cisco2523', 74: 'cisco2524', 75: 'cisco2525',
+    76: 'ciscoPro751', 77: 'ciscoPro752', 78: 'ciscoPro753', 79: 'ciscoPro901', 80: 'ciscoPro902', 81: 'cisco751',
+    82: 'cisco752', 83: 'cisco753', 84: 'ciscoPro741', 85: 'ciscoPro742', 86: 'ciscoPro743', 87: 'ciscoPro744',
+    88: 'ciscoPro761', 89: 'ciscoPro762', 90: 'ciscoPro763', 91: 'ciscoPro764', 92: 'ciscoPro765', 93: 'ciscoPro766',
+    94: 'cisco741', 95: 'cisco742', 96: 'cisco743', 97: 'cisco744', 98: 'cisco761', 99: 'cisco762', 100: 'cisco763',
+    101: 'cisco764', 102: 'cisco765', 103: 'cisco766', 104: 'ciscoPro2520', 105: 'ciscoPro2522', 106: 'ciscoPro2524',
+    107: 'ciscoLS1010', 108: 'cisco7206', 109: 'ciscoAS5200', 110: 'cisco3640', 111: 'ciscoCatalyst3500',
+    112: 'ciscoWSX3011', 113: 'cisco1601', 114: 'cisco1602', 115: 'cisco1603', 116: 'cisco1604', 117: 'ciscoPro1601',
+    118: 'ciscoPro1602', 119: 'ciscoPro1603', 120: 'ciscoPro1604', 121: 'ciscoWSX5301', 122: 'cisco3620',
+    123: 'ciscoPro3620', 124: 'ciscoPro3640', 125: 'cisco7204', 126: 'cisco771', 127: 'cisco772', 128: 'cisco775',
+    129: 'cisco776', 130: 'ciscoPro2502', 131: 'ciscoPro2504', 132: 'ciscoPro2506', 133: 'ciscoPro2508',
+    134: 'ciscoPro2510', 135: 'ciscoPro2512', 136: 'ciscoPro2513', 137: 'ciscoPro2515', 138: 'ciscoPro2517',
+    139: 'ciscoPro2518', 140: 'ciscoPro2523', 141: 'ciscoPro2525', 142: 'ciscoPro4700', 147: 'ciscoPro316T',
+    148: 'ciscoPro316C', 149: 'ciscoPro3116', 150: 'catalyst116T', 151: 'catalyst116C', 152: 'catalyst1116',
+    153: 'ciscoAS2509RJ', 154: 'ciscoAS2511RJ', 157: 'ciscoMC3810', 160: 'cisco1503', 161: 'cisco1502',
+    162: 'ciscoAS5300', 164: 'ciscoLS1015', 165: 'cisco2501FRADFX', 166: 'cisco2501LANFRADFX',
+    167: 'cisco2502LANFRADFX', 168: 'ciscoWSX5302', 169: 'ciscoFastHub216T', 170: 'catalyst2908xl',
+    171: 'catalyst2916mxl', 172: 'cisco1605', 173: 'cisco12012', 175: 'catalyst1912C', 176: 'ciscoMicroWebServer2',
+    177: 'ciscoFastHubBMMTX', 178: 'ciscoFastHubBMMFX', 179: 'ciscoUBR7246', 180: 'cisco6400', 181: 'cisco12004',
+    182: 'cisco12008', 183: 'catalyst2924XL', 184: 'catalyst2924CXL', 185: 'cisco2610', 186: 'cisco2611',
+    187: 'cisco2612', 188: 'ciscoAS5800', 189: 'ciscoSC3640', 190: 'cisco8510', 191: 'ciscoUBR904', 192: 'cisco6200',
+    194: 'cisco7202', 195: 'cisco2613', 196: 'cisco8515', 197: 'catalyst9006', 198: 'catalyst9009', 199: 'ciscoRPM',
+    200: 'cisco1710', 201: 'cisco1720', 202: 'catalyst8540msr', 203: 'catalyst8540csr', 204: 'cisco7576',
+    205: 'cisco3660', 206: 'cisco1401', 208: 'cisco2620', 209: 'cisco2621', 210: 'ciscoUBR7223', 211: 'cisco6400Nrp',
+    212: 'cisco801', 213: 'cisco802', 214: 'cisco803', 215: 'cisco804', 216: 'cisco1750', 217: 'catalyst2924XLv',
+    218: 'catalyst2924CXLv', 219: 'catalyst2912XL', 220: 'catalyst2924MXL', 221: 'catalyst2912MfXL',
+    222: 'cisco7206VXR', 223: 'cisco7204VXR', 224: 'cisco1538M', 225: 'cisco1548M', 226: 'ciscoFasthub100',
+    227: 'ciscoPIXFirewall', 228: 'ciscoMGX8850', 229: 'ciscoMGX8830', 230: 'catalyst8510msr', 231: 'catalyst8515msr',
+    232: 'ciscoIGX8410', 233: 'ciscoIGX8420', 234: 'ciscoIGX8430', 235: 'ciscoIGX8450', 237: 'ciscoBPX8620',
+    238: 'ciscoBPX8650', 239: 'ciscoBPX8680', 240: 'ciscoCacheEngine', 241: 'ciscoCat6000', 242: 'ciscoBPXSes',
+    243: 'ciscoIGXSes', 244: 'ciscoLocalDirector', 245: 'cisco805', 246: 'catalyst3508GXL', 247: 'catalyst3512XL',
+    248: 'catalyst3524XL', 249: 'cisco1407', 250: 'cisco1417', 251: 'cisco6100', 252: 'cisco6130', 253: 'cisco6260',
+    254: 'ciscoOpticalRegenerator', 255: 'ciscoUBR924', 256: 'ciscoWSX6302Msm', 257: 'catalyst5kRsfc',
+    258: 'catalyst6kMsfc', 259: 'cisco7120Quadt1', 260: 'cisco7120T3', 261: 'cisco7120E3', 262: 'cisco7120At3',
+    263: 'cisco7120Ae3', 264: 'cisco7120Smi3', 265: 'cisco7140Dualt3', 266: 'cisco7140Duale3', 267: 'cisco7140Dualat3',
+    268: 'cisco7140Dualae3', 269: 'cisco7140Dualmm3', 270: 'cisco827QuadV', 271: 'ciscoUBR7246VXR', 272: 'cisco10400',
+    273: 'cisco12016', 274: 'ciscoAs5400', 275: 'cat2948gL3', 276: 'cisco7140Octt1', 277: 'cisco7140Dualfe',
+    278: 'cat3548XL', 279: 'ciscoVG200', 280: 'cat6006', 281: 'cat6009', 282: 'cat6506', 283: 'cat6509',
+    284: 'cisco827', 285: 'ciscoManagementEngine1100', 286: 'ciscoMc3810V3', 287: 'cat3524tXLEn', 288: 'cisco7507z',
+    289: 'cisco7513z', 290: 'cisco7507mx', 291: 'cisco7513mx', 292: 'ciscoUBR912C', 293: 'ciscoUBR912S',
+    294: 'ciscoUBR914', 295: 'cisco802J', 296: 'cisco804J', 297: 'cisco6160', 298: 'cat4908gL3', 299: 'cisco6015',
+    300: 'cat4232L3', 301: 'catalyst6kMsfc2', 302: 'cisco7750Mrp200', 303: 'cisco7750Ssp80', 304: 'ciscoMGX8230',
+    305: 'ciscoMGX8250', 306: 'ciscoCVA122', 307: 'ciscoCVA124', 308: 'ciscoAs5850', 310: 'cat6509Sp',
+    311: 'ciscoMGX8240', 312: 'cat4840gL3', 313: 'ciscoAS5350', 314: 'cisco7750', 315: 'ciscoMGX8950',
+    316: 'ciscoUBR925', 317: 'ciscoUBR10012', 318: 'catalyst4kGateway', 319: 'cisco2650', 320: 'cisco2651',
+    321: 'cisco826QuadV', 322: 'cisco826', 323: 'catalyst295012', 324: 'catalyst295024', 325: 'catalyst295024C',
+    326: 'cisco1751', 327: 'cisco1730Iad8Fxs', 328: 'cisco1730Iad16Fxs', 329: 'cisco626', 330: 'cisco627',
+    331: 'cisco633', 332: 'cisco673', 333: 'cisco675', 334: 'cisco675e', 335: 'cisco676', 336: 'cisco677',
+    337: 'cisco678', 338: 'cisco3661Ac', 339: 'cisco3661Dc', 340: 'cisco3662Ac', 341: 'cisco3662Dc',
+    342: 'cisco3662AcCo', 343: 'cisco3662DcCo', 344: 'ciscoUBR7111', 345: 'ciscoUBR7111E', 346: 'ciscoUBR7114',
+    347: 'ciscoUBR7114E', 348: 'cisco12010', 349: 'cisco8110', 350: 'cisco8120', 351: 'ciscoUBR905', 352: 'ciscoIDS',
+    353: 'ciscoSOHO77', 354: 'ciscoSOHO76', 355: 'cisco7150Dualfe', 356: 'cisco7150Octt1', 357: 'cisco7150Dualt3',
+    358: 'ciscoOlympus', 359: 'catalyst2950t24', 360: 'ciscoVPS1110', 361: 'ciscoContentEngine', 362: 'ciscoIAD2420',
+    363: 'cisco677i', 364: 'cisco674', 365: 'ciscoDPA7630', 366: 'catalyst355024', 367: 'catalyst355048',
+    368: 'catalyst355012T', 369: 'catalyst2924LREXL', 370: 'catalyst2912LREXL', 371: 'ciscoCVA122E',
+    372: 'ciscoCVA124E', 373: 'ciscoURM', 374: 'ciscoURM2FE', 375: 'ciscoURM2FE2V', 376: 'cisco7401VXR',
+    377: 'cisco951', 378: 'cisco952', 379: 'ciscoCAP340', 380: 'ciscoCAP350', 381: 'ciscoDPA7610', 382: 'cisco828',
+    383: 'ciscoSOHO78', 384: 'cisco806', 385: 'cisco12416', 386: 'cat2948gL3Dc', 387: 'cat4908gL3Dc',
+    388: 'cisco12406', 389: 'ciscoPIXFirewall506', 390: 'ciscoPIXFirewall515', 391: 'ciscoPIXFirewall520',
+    392: 'ciscoPIXFirewall525', 393: 'ciscoPIXFirewall535', 394: 'cisco12410', 395: 'cisco811', 396: 'cisco813',
+    397: 'cisco10720', 398: 'ciscoMWR1900', 399: 'cisco4224', 400: 'ciscoWSC6513', 401: 'cisco7603', 402: 'cisco7606',
+    403: 'cisco7401ASR', 404: 'ciscoVG248', 405: 'ciscoHSE', 406: 'ciscoONS15540ESP', 407: 'ciscoSN5420',
+    408: 'ciscoIcs7750Ce300', 409: 'ciscoCe507', 410: 'ciscoCe560', 411: 'ciscoCe590', 412: 'ciscoCe7320',
+    413: 'cisco2691', 414: 'cisco3725', 415: 'cisco3640A', 416: 'cisco1760', 417: 'ciscoPIXFirewall501',
+    418: 'cisco2610M', 419: 'cisco2611M', 420: 'ciscoGP10', 421: 'ciscoMC21', 422: 'ciscoSN51', 423: 'cisco12404',
+    424: 'cisco9004', 425: 'cisco3631Co', 427: 'catalyst295012G', 428: 'catalyst295024G', 429: 'catalyst295048G',
+    430: 'catalyst295024S', 431: 'catalyst355012G', 432: 'ciscoCE507AV', 433: 'ciscoCE560AV', 434: 'ciscoIE2105',
+    435: 'ciscoMGX8850Pxm1E', 436: 'cisco3745', 437: 'cisco10005', 438: 'cisco10008', 439: 'cisco7304',
+    440: 'ciscoRpmXf', 441: 'ciscoOsm4oc3PosSmIr', 442: 'ciscoOsm4oc3PosMmSr', 443: 'ciscoOsm4oc3PosSmLr',
+    444: 'cisco1721', 445: 'cat4000Sup3', 446: 'cisco827H', 447: 'ciscoSOHO77H', 448: 'cat4006', 449: 'ciscoWSC6503',
+    450: 'ciscoPIXFirewall506E', 451: 'ciscoPIXFirewall515E', 452: 'cat355024Dc', 453: 'cat355024Mmf',
+    454: 'ciscoCE2636', 455: 'ciscoDwCE', 456: 'cisco7750Mrp300', 457: 'ciscoRPMPR', 458: 'cisco14MGX8830Pxm1E',
+    459: 'ciscoWlse', 460: 'ciscoONS15530', 461: 'ciscoONS15530NEBS', 462: 'ciscoONS15530ETSI', 463: 'ciscoSOHO71',
+    464: 'cisco6400UAC', 466: 'cisco2610XM', 467: 'cisco2611XM', 468: 'cisco2620XM', 469: 'cisco2621XM',
+    470: 'cisco2650XM', 471: 'cisco2651XM', 472: 'catalyst295024GDC', 474: 'ciscoAIRAP1200', 475: 'ciscoSN5428',
+    476: 'cisco7301', 477: 'cisco12816', 478: 'cisco12810', 479: 'cisco3250', 480: 'catalyst295024SX',
+    481: 'ciscoONS15540ESPx', 482: 'catalyst295024LRESt', 483: 'catalyst29508LRESt', 484: 'catalyst295024LREG',
+    485: 'catalyst355024PWR', 486: 'ciscoCDM4630', 487: 'ciscoCDM4650', 488: 'catalyst2955T12', 489: 'catalyst2955C12',
+    490: 'ciscoCE508', 491: 'ciscoCE565', 492: 'ciscoCE7325', 493: 'ciscoONS15454', 494: 'ciscoONS15327',
+    495: 'cisco837', 496: 'ciscoSOHO97', 497: 'cisco831', 498: 'ciscoSOHO91', 499: 'cisco836', 500: 'ciscoSOHO96',
+    501: 'cat4507', 502: 'cat4506', 503: 'cat4503', 504: 'ciscoCE7305', 505: 'ciscoCE510', 507: 'ciscoAIRAP1100',
+    508: 'catalyst2955S12', 509: 'cisco7609', 510: 'ciscoWSC65509', 511: 'catalyst375024', 512: 'catalyst375048',
+    513: 'catalyst375024TS', 514: 'catalyst375024T', 516: 'catalyst37xxStack', 517: 'ciscoGSS',
+    518: 'ciscoPrimaryGSSM', 519: 'ciscoStandbyGSSM', 520: 'ciscoMWR1941DC', 521: 'ciscoDSC9216K9',
+    522: 'cat6500FirewallSm', 523: 'ciscoSCA11000', 524: 'ciscoCSM', 525: 'ciscoAIRAP1210', 526: 'ciscoSCA211000',
+    527: 'catalyst297024', 528: 'cisco7613', 529: 'ciscoSN54282', 530: 'catalyst3750Ge12Sfp', 531: 'ciscoCR4430',
+    532: 'ciscoCR4450', 533: 'ciscoAIRBR1410', 534: 'ciscoWSC6509neba', 535: 'catalyst375048PS',
+    536: 'catalyst375024PS', 537: 'catalyst4510', 538: 'cisco1711', 539: 'cisco1712', 540: 'catalyst29408TT',
+    542: 'catalyst29408TF', 543: 'cisco3825', 544: 'cisco3845', 545: 'cisco2430Iad24Fxs', 546: 'cisco2431Iad8Fxs',
+    547: 'cisco2431Iad16Fxs', 548: 'cisco2431Iad1T1E1', 549: 'cisco2432Iad24Fxs', 550: 'cisco1701ADSLBRI',
+    551: 'catalyst2950St24LRE997', 552: 'ciscoAirAp350IOS', 553: 'cisco3220', 554: 'cat6500SslSm', 555: 'ciscoSIMSE',
+    556: 'ciscoESSE', 557: 'catalyst6kSup720', 558: 'ciscoVG224', 559: 'catalyst295048T', 560: 'catalyst295048SX',
+    561: 'catalyst297024TS', 562: 'ciscoNmNam', 563: 'catalyst356024PS', 564: 'catalyst356048PS',
+    565: 'ciscoAIRBR1300', 566: 'cisco851', 567: 'cisco857', 568: 'cisco876', 569: 'cisco877', 570: 'cisco878',
+    571: 'cisco871', 572: 'uMG9820', 573: 'catalyst6kGateway', 574: 'catalyst375024ME', 575: 'catalyst4000NAM',
+    576: 'cisco2811', 577: 'cisco2821', 578: 'cisco2851', 581: 'cisco3201WMIC', 582: 'ciscoMCS7815I',
+    583: 'ciscoMCS7825H', 584: 'ciscoMCS7835H', 585: 'ciscoMCS7835I', 586: 'ciscoMCS7845H', 587: 'ciscoMCS7845I',
+    588: 'ciscoMCS7855I', 589: 'ciscoMCS7865I', 590: 'cisco12006', 591: 'catalyst3750G16TD', 592: 'ciscoIGESM',
+    593: 'ciscoCCM', 594: 'cisco1718', 595: 'ciscoCe511K9', 596: 'ciscoCe566K9', 597: 'ciscoMGX8830Pxm45',
+    598: 'ciscoMGX8880', 599: 'ciscoWsSvcWLAN1K9', 600: 'ciscoCe7306K9', 601: 'ciscoCe7326K9',
+    602: 'catalyst3750G24PS', 603: 'catalyst3750G48PS', 604: 'catalyst3750G48TS', 606: 'ciscoBMGX8830Pxm45',
+    607: 'ciscoBMGX8830Pxm1E', 608: 'ciscoBMGX8850Pxm45', 609: 'ciscoBMGX8850Pxm1E', 610: 'ciscoSSLCSM',
+    611: 'ciscoNetworkRegistrar', 612: 'ciscoCe501K9', 613: 'ciscoCRS16S', 614: 'catalyst3560G24PS',
+    615: 'catalyst3560G24TS', 616: 'catalyst3560G48PS', 617: 'catalyst3560G48TS', 618: 'ciscoAIRAP1130',
+    619: 'cisco2801', 620: 'cisco1841', 621: 'ciscoWsSvcMWAM1', 622: 'ciscoNMCUE', 623: 'ciscoAIMCUE',
+    624: 'catalyst3750G24TS1U', 625: 'cisco371098HP001', 626: 'catalyst4948', 627: 'ciscoSB101', 628: 'ciscoSB106',
+    629: 'ciscoSB107', 630: 'ciscoWLSE1130', 631: 'ciscoWLSE1030', 632: 'ciscoHSE1140', 633: 'catalyst356024TS',
+    634: 'catalyst356048TS', 635: 'ciscoWsSvcadsm1K9', 636: 'ciscoWsSvcagsm1K9', 637: 'ciscoONS15310',
+    638: 'cisco1801', 639: 'cisco1802', 640: 'cisco1803', 641: 'cisco1811', 642: 'cisco1812', 643: 'ciscoCRS8S',
+    645: 'ciscoIDS4210', 646: 'ciscoIDS4215', 647: 'ciscoIDS4235', 648: 'ciscoIPS4240', 649: 'ciscoIDS4250',
+    650: 'ciscoIDS4250SX', 651: 'ciscoIDS4250XL', 652: 'ciscoIPS4255', 653: 'ciscoIDSIDSM2', 654: 'ciscoIDSNMCIDS',
+    655: 'ciscoIPSSSM20', 656: 'catalyst375024FS', 657: 'ciscoWSC6504E', 658: 'cisco7604', 659: 'catalyst494810GE',
+    660: 'ciscoIGESMSFP', 661: 'ciscoFE6326K9', 662: 'ciscoIPSSSM10', 663: 'ciscoNme16Es1Ge', 664: 'ciscoNmeX24Es1Ge',
+    665: 'ciscoNmeXd24Es2St', 666: 'ciscoNmeXd48Es2Ge', 667: 'cisco3202WMIC', 668: 'ciscoAs5400XM',
+    669: 'ciscoASA5510', 670: 'ciscoASA5520', 671: 'ciscoASA5520sc', 672: 'ciscoASA5540', 673: 'ciscoASA5540sc',
+    674: 'ciscoWsSvcFwm1sc', 675: 'ciscoPIXFirewall535sc', 676: 'ciscoPIXFirewall525sc', 677: 'ciscoPIXFirewall515Esc',
+    678: 'ciscoPIXFirewall515sc', 679: 'ciscoAs5350XM', 680: 'ciscoFe7326K9', 681: 'ciscoFe511K9',
+    682: 'ciscoSCEDispatcher', 683: 'ciscoSCE1000', 684: 'ciscoSCE2000', 685: 'ciscoAIRAP1240',
+    686: 'ciscoDSC9120CLK9', 687: 'ciscoFe611K9', 688: 'catalyst3750Ge12SfpDc', 689: 'cisco3271', 690: 'cisco3272',
+    691: 'cisco3241', 692: 'cisco3242', 693: 'ciscoICM', 694: 'catalyst296024', 695: 'catalyst296048',
+    696: 'catalyst2960G24', 697: 'catalyst2960G48', 698: 'catalyst45503', 699: 'catalyst45506', 700: 'catalyst45507',
+    701: 'catalyst455010', 702: 'ciscoNme16Es1GeNoPwr', 703: 'ciscoNmeX24Es1GeNoPwr', 704: 'ciscoNmeXd24Es2StNoPwr',
+    705: 'ciscoNmeXd48Es2GeNoPwr', 706: 'catalyst6kMsfc2a', 707: 'ciscoEDI', 708: 'ciscoCe611K9', 709: 'ciscoWLSEs20',
+    710: 'ciscoMPX', 711: 'ciscoNMCUEEC', 712: 'ciscoWLSE1132', 713: 'ciscoME6340ACA', 714: 'ciscoME6340DCA',
+    715: 'ciscoME6340DCB', 716: 'catalyst296024TT', 717: 'catalyst296048TT', 718: 'ciscoIGESMSFPT',
+    719: 'ciscoMEC6524gs8s', 720: 'ciscoMEC6524gt8s', 721: 'ciscoMEC6724s10x2', 722: 'ciscoMEC6724t10x2',
+    723: 'ciscoPaldron', 724: 'catalystsExpress50024TT', 725: 'catalystsExpress50024LC',
+    726: 'catalystsExpress50024PC', 727: 'catalystsExpress50012TC', 728: 'ciscoIGESMT', 729: 'ciscoACE04G',
+    730: 'ciscoACE10K9', 731: 'cisco5750', 732: 'ciscoMWR1941DCA', 733: 'cisco815', 734: 'cisco240024TSA',
+    735: 'cisco240024TSD', 736: 'cisco340024TSA', 737: 'cisco340024TSD', 738: 'ciscoCrs18Linecard',
+    739: 'ciscoCrs1Fabric', 740: 'ciscoFE2636', 741: 'ciscoIDS4220', 742: 'ciscoIDS4230', 743: 'ciscoIPS4260',
+    744: 'ciscoWsSvcSAMIBB', 745: 'ciscoASA5505', 746: 'ciscoMCS7825I', 747: 'ciscoWsC3750g24ps',
+    748: 'ciscoWs3020Hpq', 749: 'ciscoWs3030Del', 750: 'ciscoSpaOc48posSfp', 751: 'catalyst6kEnhancedGateway',
+    752: 'ciscoWLSE1133', 753: 'ciscoASA5550', 754: 'ciscoNMAONK9', 755: 'ciscoNMAONWS', 756: 'ciscoNMAONAPS',
+    757: 'ciscoWae612K9', 758: 'ciscoAIRAP1250', 759: 'ciscoCe512K9', 760: 'ciscoFe512K9', 761: 'ciscoCe612K9',
+    762: 'ciscoFe612K9', 763: 'ciscoASA5550sc', 764: 'ciscoASA5520sy', 765: 'ciscoASA5540sy', 766: 'ciscoASA5550sy',
+    767: 'ciscoWsSvcFwm1sy', 768: 'ciscoPIXFirewall515sy', 769: 'ciscoPIXFirewall515Esy', 770: 'ciscoPIXFirewall525sy',
+    771: 'ciscoPIXFirewall535sy', 772: 'ciscoIpRanOpt4p', 773: 'ciscoASA5510sc', 774: 'ciscoASA5510sy',
+    775: 'ciscoJumpgate', 776: 'ciscoOe512K9', 777: 'ciscoOe612K9', 778: 'catalyst3750G24WS25',
+    779: 'catalyst3750G24WS50', 780: 'ciscoMe3400g12CsA', 781: 'ciscoMe3400g12CsD', 782: 'cisco877M',
+    783: 'cisco1801M', 784: 'catalystWsCBS3040FSC', 785: 'ciscoOe511K9', 786: 'ciscoOe611K9', 787: 'ciscoOe7326K9',
+    788: 'ciscoMe492410GE', 789: 'catalyst3750E24TD', 790: 'catalyst3750E48TD', 791: 'catalyst3750E48PD',
+    792: 'catalyst3750E24PD', 793: 'catalyst3560E24TD', 794: 'catalyst3560E48TD', 795: 'catalyst3560E24PD',
+    796: 'catalyst3560E48PD', 797: 'catalyst35608PC', 798: 'catalyst29608TC', 799: 'catalyst2960G8TC',
+    800: 'ciscoTSPri', 801: 'ciscoTSSec', 802: 'ciscoUWIpPhone7921G', 803: 'ciscoUWIpPhone7920',
+    804: 'cisco3200WirelessMic', 805: 'ciscoISRWireless', 806: 'ciscoIPSVirtual', 807: 'ciscoIDS4215Virtual',
+    808: 'ciscoIDS4235Virtual', 809: 'ciscoIDS4250Virtual', 810: 'ciscoIDS4250SXVirtual', 811: 'ciscoIDS4250XLVirtual',
+    812: 'ciscoIDS4240Virtual', 813: 'ciscoIDS4255Virtual', 814: 'ciscoIDS4260Virtual', 815: 'ciscoIDSIDSM2Virtual',
+    816: 'ciscoIPSSSM20Virtual', 817: 'ciscoIPSSSM10Virtual', 818: 'ciscoNMWLCE', 819: 'cisco3205WirelessMic',
+    820: 'cisco5720', 821: 'cisco7201', 822: 'ciscoCrs14S', 823: 'ciscoNmWae', 824: 'ciscoACE4710K9',
+    825: 'ciscoMe3400g2csA', 826: 'ciscoNmeNam', 827: 'ciscoUbr7225Vxr', 828: 'ciscoAirWlc2106K9',
+    829: 'ciscoMwr1951DC', 830: 'ciscoIPS4270', 831: 'ciscoIPS4270Virtual', 832: 'ciscoWSC6509ve', 833: 'cisco5740',
+    834: 'cisco861', 835: 'cisco866', 836: 'cisco867', 837: 'cisco881', 838: 'cisco881G', 839: 'ciscoIad881F',
+    840: 'cisco881Srst', 841: 'ciscoIad881B', 842: 'cisco886', 843: 'cisco886G', 844: 'ciscoIad886F',
+    845: 'ciscoIad886B', 846: 'cisco886Srst', 847: 'cisco887', 848: 'cisco887G', 849: 'ciscoIad887F',
+    850: 'ciscoIad887B', 851: 'cisco887Srst', 852: 'cisco888', 853: 'cisco888G', 854: 'ciscoIad888F',
+    855: 'ciscoIad888B', 856: 'cisco888Srst', 857: 'cisco891', 858: 'cisco892', 859: 'cisco885D3',
+    860: 'ciscoIad885FD3', 861: 'cisco885EJ3', 862: 'cisco7603s', 863: 'cisco7606s', 864: 'cisco7609s',
+    865: 'cisco7600Seb', 866: 'ciscoNMECUE', 867: 'ciscoAIM2CUE', 868: 'ciscoUC500', 869: 'cisco860Ap',
+    870: 'cisco880Ap', 871: 'cisco890Ap', 872: 'cisco1900Ap', 873: 'cisco340024FSA', 874: 'catalyst4503e',
+    875: 'catalyst4506e', 876: 'catalyst4507re', 877: 'catalyst4510re', 878: 'ciscoUC520s8U4FXOK9',
+    879: 'ciscoUC520s8U4FXOWK9', 880: 'ciscoUC520s8U2BRIK9', 881: 'ciscoUC520s8U2BRIWK9', 882: 'ciscoUC520s16U4FXOK9',
+    883: 'ciscoUC520s16U4FXOWK9', 884: 'ciscoUC520s16U2BRIK9', 885: 'ciscoUC520s16U2BRIWK9',
+    886: 'ciscoUC520m32U8FXOK9', 887: 'ciscoUC520m32U8FXOWK9', 888: 'ciscoUC520m32U4BRIK9',
+    889: 'ciscoUC520m32U4BRIWK9', 890: 'ciscoUC520m48U12FXOK9', 891: 'ciscoUC520m48U12FXOWK9',
+    892: 'ciscoUC520m48U6BRIK9', 893: 'ciscoUC520m48U6BRIWK9', 894: 'ciscoUC520m48U1T1E1FK9',
+    895: 'ciscoUC520m48U1T1E1BK9', 896: 'catalyst65xxVirtualSwitch', 897: 'catalystExpress5208PC',
+    898: 'ciscoMCS7816I', 899: 'ciscoMCS7828I', 900: 'ciscoMCS7816H', 901: 'ciscoMCS7828H', 902: 'cisco1861Uc2BK9',
+    903: 'cisco1861Uc4FK9', 904: 'cisco1861Srst2BK9', 905: 'cisco1861Srst4FK9', 906: 'ciscoNmeApa',
+    907: 'ciscoOe7330K9', 908: 'ciscoOe7350K9', 909: 'ciscoWsCbs3110gS', 910: 'ciscoWsCbs3110gSt',
+    911: 'ciscoWsCbs3110xS', 912: 'ciscoWsCbs3110xSt', 913: 'ciscoSce8000', 914: 'ciscoASA5580', 915: 'ciscoASA5580sc',
+    916: 'ciscoASA5580sy', 917: 'cat4900M', 918: 'catWsCbs3120gS', 919: 'catWsCbs3120xS', 920: 'catWsCbs3032Del',
+    921: 'catWsCbs3130gS', 922: 'catWsCbs3130xS', 923: 'ciscoASR1002', 924: 'ciscoASR1004', 925: 'ciscoASR1006',
+    926: 'cisco520WirelessController', 927: 'cat296048TCS', 928: 'cat296024TCS', 929: 'cat296024S', 930: 'cat3560e12d',
+    931: 'ciscoCatRfgw', 932: 'catExpress52024TT', 933: 'catExpress52024LC', 934: 'catExpress52024PC',
+    935: 'catExpress520G24TC', 936: 'ciscoCDScde100', 937: 'ciscoCDScde200', 938: 'ciscoCDScde300',
+    939: 'cisco1861SrstCue2BK9', 940: 'cisco1861SrstCue4FK9', 941: 'ciscoVFrameDataCenter', 942: 'ciscoVQEServer',
+    943: 'ciscoIPSSSM40Virtual', 944: 'ciscoIPSSSM40', 945: 'ciscoVgd1t3', 946: 'ciscoCBS3100', 947: 'ciscoCBS3110',
+    948: 'ciscoCBS3120', 949: 'ciscoCBS3130', 950: 'catalyst296024PC', 951: 'catalyst296024LT',
+    952: 'catalyst2960PD8TT', 953: 'ciscoSpa2x1geSynce', 954: 'ciscoN5kC5020pBa', 955: 'ciscoN5kC5020pBd',
+    956: 'catalyst3560E12SD', 957: 'ciscoOe674', 958: 'ciscoIE30004TC', 959: 'ciscoIE30008TC',
+    960: 'ciscoRAIE1783MS06T', 961: 'ciscoRAIE1783MS10T', 962: 'cisco2435Iad8fxs', 963: 'ciscoVG204',
+    964: 'ciscoVG202', 965: 'catalyst291824TT', 966: 'catalyst291824TC', 967: 'catalyst291848TT',
+    968: 'catalyst291848TC', 969: 'ciscoVQETools', 970: 'ciscoUC520m24U4BRIK9', 971: 'ciscoUC520m24U8FXOK9',
+    972: 'ciscoUC520s16U2BRIWK9J', 973: 'ciscoUC520s8U2BRIWK9J', 974: 'ciscoVSIntSp', 975: 'ciscoVSSP',
+    976: 'ciscoVSHydecoder', 977: 'ciscoVSDecoder', 978: 'ciscoVSEncoder4P', 979: 'ciscoVSEncoder1P',
+    980: 'ciscoSCS1000K9', 981: 'cisco1805', 982: 'ciscoCe7341', 983: 'ciscoCe7371', 984: 'cisco7613s',
+    985: 'ciscoOe574', 986: 'ciscoOe474', 987: 'ciscoOe274', 988: 'ciscoAp801agn', 989: 'ciscoAp801gn',
+    990: 'cisco1861WSrstCue4FK9', 991: 'cisco1861WSrstCue2BK9', 992: 'cisco1861WSrst4FK9', 993: 'cisco1861WSrst2BK9',
+    994: 'cisco1861WUc4FK9', 995: 'cisco1861WUc2BK9', 996: 'ciscoCe674', 997: 'ciscoVQEIST', 998: 'ciscoAIRAP1160',
+    999: 'ciscoWsCbs3012Ibm', 1000: 'ciscoWsCbs3012IbmI', 1001: 'ciscoWsCbs3125gS', 1002: 'ciscoWsCbs3125xS',
+    1003: 'ciscoTSPriG2', 1004: 'catalyst492810GE', 1005: 'catalyst296048TTS', 1006: 'catalyst29608TCS',
+    1007: 'ciscoMe3400eg2csA', 1008: 'ciscoMe3400eg12csM', 1009: 'ciscoMe3400e24tsM', 1010: 'ciscoIPSSSC5Virtual',
+    1011: 'ciscoSR520FE', 1012: 'ciscoSR520ADSL', 1013: 'ciscoSR520ADSLi', 1014: 'ciscoMwr2941DC',
+    1015: 'catalyst356012PCS', 1016: 'catalyst296048PSTL', 1017: 'ciscoASR9010', 1018: 'ciscoASR9006',
+    1019: 'catalyst3560v224tsD', 1020: 'catalyst3560v224ts', 1021: 'catalyst3560v224ps', 1022: 'catalyst3750v224ts',
+    1023: 'catalyst3750v224ps', 1024: 'catalyst3560v248ts', 1025: 'catalyst3560v248ps', 1026: 'catalyst3750v248ts',
+    1027: 'catalyst3750v248ps', 1028: 'ciscoHwicCableD2', 1029: 'ciscoHwicCableEJ2', 1030: 'ciscoBr1430',
+    1031: 'ciscoAIRBR1430', 1032: 'ciscoNamApp2204', 1033: 'ciscoNamApp2220', 1034: 'ciscoAIRAP1141',
+    1035: 'ciscoAIRAP1142', 1036: 'ciscoASR14K4S', 1037: 'ciscoASR14K8S', 1038: 'cisco18xxx', 1039: 'ciscoIPSSSC5',
+    1040: 'cisco887Vdsl2', 1041: 'cisco3945', 1042: 'cisco3925', 1043: 'cisco2951', 1044: 'cisco2921',
+    1045: 'cisco2911', 1046: 'cisco2901', 1047: 'cisco1941', 1048: 'ciscoSm2k15Es1GePoe', 1049: 'ciscoSm3k15Es1GePoe',
+    1050: 'ciscoSm3k16GePoe', 1051: 'ciscoSm2k23Es1Ge', 1052: 'ciscoSm2k23Es1GePoe', 1053: 'ciscoSm3k23Es1GePoe',
+    1054: 'ciscoSm3k24GePoe', 1055: 'ciscoSmXd2k48Es2SFP', 1056: 'ciscoSmXd3k48Es2SFPPoe',
+    1057: 'ciscoSmXd3k48Ge2SFPPoe', 1058: 'ciscoEsw52024pK9', 1059: 'ciscoEsw54024pK9', 1060: 'ciscoEsw52048pK9',
+    1061: 'ciscoEsw52024K9', 1062: 'ciscoEsw54024K9', 1063: 'ciscoEsw52048K9', 1064: 'ciscoEsw54048K9',
+    1065: 'cisco1861', 1066: 'ciscoUC520', 1067: 'catalystWSC2975GS48PSL', 1068: 'catalystC2975Stack',
+    1069: 'cisco5500Wlc', 1070: 'ciscoSR520T1', 1071: 'ciscoPwrC3900Poe', 1072: 'ciscoPwrC3900AC',
+    1073: 'ciscoPwrC2921C2951Poe', 1074: 'ciscoPwrC2921C2951AC', 1075: 'ciscoPwrC2911Poe', 1076: 'ciscoPwrC2911AC',
+    1077: 'ciscoPwrC2901Poe', 1078: 'ciscoPwrC1941C2901AC', 1079: 'ciscoPwrC1941Poe', 1080: 'ciscoPwrC3900DC',
+    1081: 'ciscoPwrC2921C2951DC', 1082: 'ciscoPwrC2911DC', 1083: 'ciscoRpsAdptrC2921C2951', 1084: 'ciscoRpsAdptrC2911',
+    1085: 'ciscoIPSSSC2', 1086: 'ciscoIPSSSC2Virtual', 1087: 'catalystWSCBS3140XS', 1088: 'catalystWSCBS3140GS',
+    1089: 'catalystWSCBS3042FSC', 1090: 'catalystWSCBS3150XS', 1091: 'catalystWSCBS3150GS',
+    1092: 'catalystWSCBS3052NEC', 1093: 'ciscoCBS3140Stack', 1094: 'ciscoCBS3150Stack', 1095: 'cisco1941W',
+    1096: 'ciscoC888E', 1097: 'ciscoC888EG', 1098: 'ciscoIad888EB', 1099: 'ciscoIad888EF', 1100: 'ciscoC888ESRST',
+    1101: 'ciscoASA5505W', 1102: 'cisco3845nv', 1103: 'cisco3825nv', 1104: 'catalystWSC235048TD', 1105: 'cisco887M',
+    1106: 'ciscoVg250', 1107: 'ciscoVg226e', 1108: 'ciscoDsIbm8GfcK9', 1109: 'ciscoDsHp8GfcK9',
+    1110: 'ciscoDsDell8GfcK9', 1111: 'ciscoDsC9148K9', 1112: 'ciscoCeVirtualBlade', 1113: 'ciscoCDScde420',
+    1114: 'ciscoCDScde220', 1115: 'ciscoCDScde110', 1116: 'ciscoASR1002F', 1117: 'ciscoSecureAccessControlSystem',
+    1118: 'cisco861Npe', 1119: 'cisco881Npe', 1120: 'cisco881GNpe', 1121: 'cisco887Npe', 1122: 'cisco888GNpe',
+    1123: 'cisco891Npe', 1124: 'ciscoAIRAP3501', 1125: 'ciscoAIRAP3502', 1126: 'ciscoCDScde400', 1127: 'ciscoSA520K9',
+    1128: 'ciscoSA520WK9', 1129: 'ciscoSA540K9', 1130: 'ciscoSps2004B', 1131: 'ciscoSps204B', 1132: 'ciscoUC560T1E1K9',
+    1133: 'ciscoUC560BRIK9', 1134: 'ciscoUC560FXOK9', 1135: 'ciscoAp541nAK9', 1136: 'ciscoAp541nEK9',
+    1137: 'ciscoAp541nNK9', 1138: 'cisco887GVdsl2', 1139: 'cisco887SrstVdsl2', 1140: 'ciscoUc540wFxoK9',
+    1141: 'ciscoUc540wBriK9', 1142: 'ciscoCaServer', 1143: 'ciscoCaManager', 1144: 'cisco3925SPE200',
+    1145: 'cisco3945SPE250', 1146: 'catalyst296024LCS', 1147: 'catalyst296024PCS', 1148: 'catalyst296048PSTS',
+    1149: 'ciscoISM', 1150: 'ciscoSM', 1151: 'ciscoNMEAXP', 1152: 'ciscoAIMAXP', 1153: 'ciscoAIM2AXP',
+    1154: 'ciscoSRP521', 1155: 'ciscoSRP526', 1156: 'ciscoSRP527', 1157: 'ciscoSRP541', 1158: 'ciscoSRP546',
+    1159: 'ciscoSRP547', 1160: 'ciscoVS510FXO', 1161: 'ciscoNmWae900', 1162: 'ciscoNmWae700', 1163: 'cisco5940RA',
+    1164: 'cisco5940RC', 1165: 'ciscoASR1001', 1166: 'ciscoASR1013', 1167: 'ciscoCDScde205', 1168: 'ciscoPwr1941AC',
+    1169: 'ciscoNamWaasVirtualBlade', 1170: 'ciscoRaie1783Rms06t', 1171: 'ciscoRaie1783Rms10t', 1172: 'cisco1941WEK9',
+    1173: 'cisco1941WPK9', 1174: 'cisco1941WNK9', 1175: 'ciscoMXE5600', 1176: 'ciscoEsw5408pK9',
+    1177: 'ciscoEsw5208pK9', 1178: 'catalyst4948e10GE', 1179: 'cat2960x48tsS', 1180: 'cat2960x24tsS',
+    1181: 'cat2960xs48fpdL', 1182: 'cat2960xs48lpdL', 1183: 'cat2960xs48ltdL', 1184: 'cat2960xs24pdL',
+    1185: 'cat2960xs24tdL', 1186: 'cat2960xs48fpsL', 1187: 'cat2960xs48lpsL', 1188: 'cat2960xs24psL',
+    1189: 'cat2960xs48tsL', 1190: 'cat2960xs24tsL', 1191: 'cisco1921k9', 1192: 'cisco1905k9',
+    1193: 'ciscoPwrC1921C1905AC', 1194: 'ciscoASA5585Ssp10', 1195: 'ciscoASA5585Ssp20', 1196: 'ciscoASA5585Ssp40',
+    1197: 'ciscoASA5585Ssp60', 1198: 'ciscoASA5585Ssp10sc', 1199: 'ciscoASA5585Ssp20sc', 1200: 'ciscoASA5585Ssp40sc',
+    1201: 'ciscoASA5585Ssp60sc', 1202: 'ciscoASA5585Ssp10sy', 1203: 'ciscoASA5585Ssp20sy', 1204: 'ciscoASA5585Ssp40sy',
+    1205: 'ciscoASA5585Ssp60sy', 1206: 'cisco3925SPE250', 1207: 'cisco3945SPE200', 1208: 'cat29xxStack',
+    1209: 'ciscoOeNm302', 1210: 'ciscoOeNm502', 1211: 'ciscoOeNm522', 1212: 'ciscoOeSmSre700', 1213: 'ciscoOeSmSre900',
+    1214: 'ciscoVsaNam', 1215: 'ciscoMwr2941DCA', 1216: 'ciscoN7KC7018IOS', 1217: 'ciscoN7KC7010IOS',
+    1218: 'ciscoN4KDellEth', 1219: 'ciscoN4KDellCiscoEth', 1220: 'cisco1941WCK9', 1221: 'ciscoCDScde2202s3',
+    1222: 'cat3750x24', 1223: 'cat3750x48', 1224: 'cat3750x24P', 1225: 'cat3750x48P', 1226: 'cat3560x24',
+    1227: 'cat3560x48', 1228: 'cat3560x24P', 1229: 'cat3560x48P', 1230: 'ciscoNMEAIR', 1231: 'ciscoACE30K9',
+    1232: 'ciscoASA5585SspIps10', 1233: 'ciscoASA5585SspIps20', 1234: 'ciscoASA5585SspIps40',
+    1235: 'ciscoASA5585SspIps60', 1236: 'cisco1841CK9', 1237: 'cisco2801CK9', 1238: 'cisco2811CK9',
+    1239: 'cisco2821CK9', 1240: 'cisco2851CK9', 1241: 'cisco3825CK9', 1242: 'cisco3845CK9', 1243: 'cisco3825CnvK9',
+    1244: 'cisco3845CnvK9', 1245: 'ciscoCGS252024TC', 1246: 'ciscoCGS252016S8PC', 1247: 'ciscoAIRAP1262',
+    1248: 'ciscoAIRAP1261', 1249: 'cisco892F', 1250: 'ciscoMe3600x24fsM', 1251: 'ciscoMe3600x24tsM',
+    1252: 'ciscoMe3800x24fsM', 1253: 'ciscoCGR2010', 1254: 'ciscoPwrCGR20xxCGS25xxPoeAC',
+    1255: 'ciscoPwrCGR20xxCGS25xxPoeDC', 1256: 'catWsC2960s48tsS', 1257: 'catWsC2960s24tsS', 1258: 'catWsC2960s48fpdL',
+    1259: 'catWsC2960s48ldpL', 1260: 'catWsC2960s48tdL', 1261: 'catWsC2960s24pdL', 1262: 'catWsC2960s24tdL',
+    1263: 'catWsC2960s48fpsL', 1264: 'catWsC2960s48lpsL', 1265: 'catWsC2960s24psL', 1266: 'catWsC2960s48tsL',
+    1267: 'catWsC2960s24tsL', 1268: 'cisco1906CK9', 1269: 'ciscoAIRAP1042', 1270: 'ciscoAIRAP1041',
+    1271: 'cisco887VaM', 1272: 'cisco867Va', 1273: 'cisco886Va', 1274: 'cisco887Va', 1275: 'ciscoASASm1sc',
+    1276: 'ciscoASASm1sy', 1277: 'ciscoASASm1', 1278: 'cat2960cPD8TT', 1279: 'ciscoAirCt2504K9', 1280: 'ciscoISMAXP',
+    1281: 'ciscoSMAXP', 1282: 'ciscoAxpSmSre900', 1283: 'ciscoAxpSmSre700', 1284: 'ciscoAxpIsmSre300',
+    1285: 'ciscoCDSISM', 1286: 'cat4507rpluse', 1287: 'cat4510rpluse', 1288: 'ciscoAxpNme302', 1289: 'ciscoAxpNme502',
+    1290: 'ciscoAxpNme522', 1291: 'ciscoACE20K9', 1292: 'ciscoWsC236048tdS', 1293: 'ciscoWiSM2',
+    1294: 'ciscoCDScde250', 1295: 'cisco7500Wlc', 1296: 'ciscoAnmVirtualApp', 1297: 'ciscoECDS3100',
+    1298: 'ciscoECDS1100', 1299: 'cisco881G2', 1300: 'catWsC3750v224fsS', 1301: 'ciscoOeVWaas',
+    1302: 'ciscoASA5585Ssp10K7', 1303: 'ciscoASA5585Ssp20K7', 1304: 'ciscoASA5585Ssp40K7', 1305: 'ciscoASA5585Ssp60K7',
+    1306: 'ciscoASA5585Ssp10K7sc', 1307: 'ciscoASA5585Ssp20K7sc', 1308: 'ciscoASA5585Ssp40K7sc',
+    1309: 'ciscoASA5585Ssp60K7sc', 1310: 'ciscoASA5585Ssp10K7sy', 1311: 'ciscoASA5585Ssp20K7sy',
+    1312: 'ciscoASA5585Ssp40K7sy', 1313: 'ciscoASA5585Ssp60K7sy', 1314: 'ciscoSreSmNam', 1315: 'cat2960cPD8PT',
+    1316: 'cat2960cG8TC', 1317: 'cat3560cG8PC', 1318: 'cat3560cG8TC', 1319: 'ciscoIE301016S8PC',
+    1320: 'ciscoIE301024TC', 1321: 'ciscoRAIE1783RMSB10T', 1322: 'ciscoRAIE1783RMSB06T',
+    1323: 'ciscoASA5585SspIps10K7', 1324: 'ciscoASA5585SspIps20K7', 1325: 'ciscoASA5585SspIps40K7',
+    1326: 'ciscoASA5585SspIps60K7', 1327: 'catalyst4948ef10GE', 1328: 'cat292824TCC', 1329: 'cat292848TCC',
+    1330: 'cat292824LTC', 1331: 'ciscoCrs16SB', 1332: 'ciscoQuad', 1334: 'ciscoASASm1K7sc', 1335: 'ciscoASASm1K7sy',
+    1336: 'ciscoASASm1K7', 1337: 'ciscoPwrCGR2010PoeAC', 1338: 'ciscoPwrCGR2010PoeDC', 1339: 'cisco1861eUc2BK9',
+    1340: 'cisco1861eUc4FK9', 1341: 'ciscoC1861eSrstFK9', 1342: 'ciscoC1861eSrstBK9', 1343: 'ciscoC1861eSrstCFK9',
+    1344: 'ciscoC1861eSrstCBK9', 1346: 'ciscoGrwicDes6s', 1347: 'ciscoGrwicDes2s8pc', 1348: 'ciscoUCVirtualMachine',
+    1349: 'ciscoWave8541', 1350: 'ciscoWave7571', 1351: 'ciscoWave7541', 1352: 'ciscoWave694', 1353: 'ciscoWave594',
+    1354: 'ciscoWave294', 1355: 'cisco5915RC', 1356: 'cisco5915RA', 1358: 'cisco867VAEK9', 1359: 'cisco866VAEK9',
+    1360: 'cisco867VAE', 1361: 'cisco866VAE', 1362: 'ciscoAp802gn', 1363: 'ciscoAp802agn', 1364: 'catwsC2960C8tcS',
+    1365: 'catwsC2960C8tcL', 1366: 'catwsC2960C8pcL', 1367: 'catwsC2960C12pcL', 1368: 'catwsC3560CPD8ptS',
+    1369: 'cisco1841ve', 1370: 'cisco2811ve', 1371: 'cisco881WAK9', 1372: 'cisco881WEK9', 1373: 'cisco881WPK9',
+    1374: 'cisco886VaWEK9', 1375: 'cisco887VamWEK9', 1376: 'cisco887VaWAK9', 1377: 'cisco887VaWEK9',
+    1378: 'cisco819GUK9', 1379: 'cisco819GSK9', 1380: 'cisco819GVK9', 1381: 'cisco819GBK9', 1382: 'cisco819G7AK9',
+    1383: 'cisco819G7K9', 1384: 'cisco819HGUK9', 1385: 'cisco819HGSK9', 1386: 'cisco819HGVK9', 1387: 'cisco819HGBK9',
+    1388: 'cisco819HG7AK9', 1389: 'cisco819HG7K9', 1390: 'cisco886Vag7K9', 1391: 'cisco887VagSK9',
+    1392: 'cisco887Vag7K9', 1393: 'cisco887Vamg7K9', 1394: 'cisco888Eg7K9', 1395: 'cisco881GUK9', 1396: 'cisco881GSK9',
+    1397: 'cisco881GVK9', 1398: 'cisco881GBK9', 1399: 'cisco881G7K9', 1400: 'cisco881G7AK9', 1404: 'cat3750x24s',
+    1405: 'cat3750x12s', 1406: 'ciscoNME', 1407: 'ciscoASA5512', 1408: 'ciscoASA5525', 1409: 'ciscoASA5545',
+    1410: 'ciscoASA5555', 1411: 'ciscoASA5512sc', 1412: 'ciscoASA5525sc', 1413: 'ciscoASA5545sc',
+    1414: 'ciscoASA5555sc', 1415: 'ciscoASA5512sy', 1416: 'ciscoASA5515sy', 1417: 'ciscoASA5525sy',
+    1418: 'ciscoASA5545sy', 1419: 'ciscoASA5555sy', 1420: 'ciscoASA5515sc', 1421: 'ciscoASA5515', 1422: 'ciscoPCM',
+    1423: 'ciscoIse3315K9', 1424: 'ciscoIse3395K9', 1425: 'ciscoIse3355K9', 1426: 'ciscoIseVmK9', 1428: 'ciscoIPS4345',
+    1429: 'ciscoIPS4360', 1432: 'ciscoEcdsVB', 1433: 'ciscoTsCodecG2', 1434: 'ciscoTsCodecG2C',
+    1435: 'ciscoTSCodecG2RC', 1436: 'ciscoTSCodecG2R', 1437: 'ciscoASA5585SspIps10Virtual',
+    1438: 'ciscoASA5585SspIps20Virtual', 1439: 'ciscoASA5585SspIps40Virtual', 1440: 'ciscoASA5585SspIps60Virtual',
+    1441: 'ciscoASR903', 1442: 'ciscoASA5512K7', 1443: 'ciscoASA5515K7', 1444: 'ciscoASA5525K7',
+    1445: 'ciscoASA5545K7', 1446: 'ciscoASA5555K7', 1447: 'ciscoASA5512K7sc', 1448: 'ciscoASA5515K7sc',
+    1449: 'ciscoASA5525K7sc', 1450: 'ciscoASA5545K7sc', 1451: 'ciscoASA5555K7sc', 1452: 'ciscoASA5512K7sy',
+    1453: 'ciscoASA5515K7sy', 1454: 'ciscoASA5525K7sy', 1455: 'ciscoASA5545K7sy', 1456: 'ciscoASA5555K7sy',
+    1457: 'ciscoASR5500', 1462: 'ciscoXfp10Ger192IrL', 1463: 'ciscoXfp10Glr192SrL', 1464: 'ciscoXfp10Gzr192LrL',
+    1465: 'catwsC3560C12pcS', 1466: 'catwsC3560C8pcS', 1467: 'ciscoCRSFabBP', 1468: 'ciscoIE20004TS',
+    1469: 'ciscoIE20004T', 1470: 'ciscoIE20004TSG', 1471: 'ciscoIE20004TG', 1472: 'ciscoIE20008TC',
+    1473: 'ciscoIE20008TCG', 1474: 'ciscoIE200016TC', 1475: 'ciscoIE200016TCG', 1476: 'ciscoRAIE1783BMS06SL',
+    1477: 'ciscoRAIE1783BMS06TL', 1478: 'ciscoRAIE1783BMS06TA', 1479: 'ciscoRAIE1783BMS06SGL',
+    1480: 'ciscoRAIE1783BMS06SGA', 1481: 'ciscoRAIE1783BMS06TGL', 1482: 'ciscoRAIE1783BMS06TGA',
+    1483: 'ciscoRAIE1783BMS10CL', 1484: 'ciscoRAIE1783BMS10CA', 1485: 'ciscoRAIE1783BMS10CGL',
+    1486: 'ciscoRAIE1783BMS10CGA', 1487: 'ciscoRAIE1783BMS10CGP', 1488: 'ciscoRAIE1783BMS10CGN',
+    1489: 'ciscoRAIE1783BMS20CL', 1490: 'ciscoRAIE1783BMS20CA', 1491: 'ciscoRAIE1783BMS20CGL',
+    1492: 'ciscoRAIE1783BMS20CGP', 1493: 'ciscoRAIE1783BMS20CGPK', 1494: 'cisco819HG4GGK9', 1495: 'cisco819G4GAK9',
+    1496: 'cisco819G4GVK9', 1497: 'cisco819G4GGK9', 1512: 'ciscoUcsC200', 1513: 'ciscoUcsC210', 1514: 'ciscoUcsC250',
+    1515: 'ciscoUcsC260', 1516: 'ciscoUcsC460', 1519: 'ciscoRAIE1783BMS06SA', 1520: 'ciscoIE200016TCGX',
+    1521: 'ciscoASR901', 1522: 'ciscoASR901E', 1523: 'ciscoOeSmSre910', 1524: 'ciscoOeSmSre710', 1525: 'ciscoASR1002X',
+    1527: 'ciscoNam2304', 1528: 'ciscoNam2320', 1529: 'ciscoNam3', 1530: 'cisco819HG4GAK9', 1536: 'ciscoECDS50IVB',
+    1537: 'ciscoCSR1000v', 1538: 'ciscoASR5000', 1539: 'ciscoflowAgent3000', 1540: 'ciscoTelePresenceMCU5310',
+    1541: 'ciscoTelePresenceMCU5320', 1542: 'cisco888ea', 1557: 'ciscoVG350', 1560: 'cisco881GW7AK9',
+    1561: 'cisco881GW7EK9', 1562: 'cisco881GWSAK9', 1563: 'cisco881GWVAK9', 1564: 'cisco887Vagw7AK9',
+    1565: 'cisco887Vagw7EK9', 1566: 'cisco881WDAK9', 1567: 'cisco881WDEK9', 1568: 'cisco887VaWDAK9',
+    1569: 'cisco887VaWDEK9', 1570: 'cisco819HGW7EK9', 1571: 'cisco819HGW7NK9', 1572: 'cisco819HGW7AAK9',
+    1573: 'cisco819HGWVAK9', 1574: 'cisco819HGWSAK9', 1575: 'cisco819HK9', 1576: 'cisco819HWDEK9',
+    1577: 'cisco819HWDAK9', 1578: 'cisco812G7K9', 1579: 'cisco812GCIFI7EK9', 1580: 'cisco812GCIFI7NK9',
+    1581: 'cisco812GCIFIVAK9', 1582: 'cisco812GCIFISAK9', 1583: 'cisco819GUMK9', 1584: 'cisco819GSMK9',
+    1585: 'cisco819GVMK9', 1586: 'cisco819GBMK9', 1587: 'cisco819G7AMK9', 1588: 'cisco819G7MK9',
+    1589: 'cisco819HGUMK9', 1590: 'cisco819HGSMK9', 1591: 'cisco819HGVMK9', 1592: 'cisco819HGBMK9',
+    1593: 'cisco819HG7AMK9', 1594: 'cisco819HG7MK9', 1595: 'ciscoCDScde2502s6', 1596: 'ciscoCDScde2502m0',
+    1597: 'ciscoCDScde2502s8', 1600: 'cisco881V', 1601: 'cisco887vaV', 1602: 'cisco887vaVW', 1603: 'ciscoMDE10XVB',
+    1605: 'cat4500X16', 1606: 'cat4500X32', 1607: 'ciscoCDScde2502s9', 1608: 'ciscoCDScde2502s10',
+    1610: 'ciscoASA5585Nm20x1GE', 1611: 'ciscoCDScdeGeneric', 1612: 'ciscoASA1000Vsy', 1613: 'ciscoASA1000Vsc',
+    1614: 'ciscoASA1000V', 1615: 'cisco8500WLC', 1617: 'ciscoASA5585Nm8x10GE', 1618: 'ciscoASA5585Nm4x10GE',
+    1619: 'ciscoISR4400', 1620: 'cisco892FspK9', 1622: 'cisco897VaMK9', 1631: 'ciscoVirtualWlc',
+    1632: 'ciscoAIRAP802agn', 1633: 'ciscoAp802Hagn', 1634: 'ciscoE160DP', 1635: 'ciscoE160D', 1636: 'ciscoE140DP',
+    1637: 'ciscoE140D', 1638: 'ciscoE140S', 1639: 'ciscoASR9001', 1640: 'ciscoASR9922', 1641: 'cat385048P',
+    1642: 'cat385024P', 1643: 'cat385048', 1644: 'cat385024', 1645: 'cisco5760wlc', 1646: 'ciscoVSGateway',
+    1647: 'ciscoIbiza', 1648: 'ciscoSkyros', 1656: 'ciscoAIRAP1601', 1658: 'ciscoCRS8SB', 1659: 'ciscoAIRAP2602',
+    1660: 'ciscoAIRAP1602', 1661: 'ciscoAIRAP3602', 1662: 'ciscoAIRAP3601', 1664: 'ciscoAIRAP1552',
+    1665: 'ciscoAIRAP1553', 1666: 'ciscoNgsm3k16gepoeplus', 1667: 'ciscoNexus1010X', 1668: 'ciscoNexus1110S',
+    1669: 'ciscoNexus1110X', 1670: 'ciscoNexus1110XL', 1674: 'ciscoHsE300K9', 1675: 'cisco866VAEWEK9',
+    1676: 'cisco867VAEWAK9', 1677: 'cisco867VAEWEK9', 1678: 'cisco867VAEPOEWAK9', 1679: 'ciscoSmES3x24P',
+    1680: 'ciscoSmDES3x48P', 1681: 'ciscoOeKWaas', 1682: 'ciscoUcsC220', 1683: 'ciscoUcsC240', 1684: 'ciscoUcsC22',
+    1685: 'ciscoUcsC24', 1686: 'ciscoCDScde2202s4', 1687: 'ciscoCDScde4604r1', 1688: 'ciscoASR1002XC',
+    1690: 'catWsC2960x48fpdL', 1691: 'catWsC2960x48lpdL', 1692: 'catWsC2960x48tdL', 1693: 'catWsC2960x24pdL',
+    1694: 'catWsC2960x24tdL', 1695: 'catWsC2960x48fpsL', 1696: 'catWsC2960x48lpsL', 1697: 'catWsC2960x24psL',
+    1698: 'catWsC2960x48tsL', 1699: 'catWsC2960x24tsL', 1700: 'catWsC2960x24psqL', 1701: 'catWsC2960x48lpsS',
+    1702: 'catWsC2960x24psS', 1703: 'catWsC2960x48tsLL', 1704: 'catWsC2960x24tsLL', 1705: 'ciscoISR4441',
+    1706: 'ciscoISR4442', 1707: 'ciscoISR4451', 1708: 'ciscoISR4452', 1709: 'ciscoASR9912', 1710: 'cat3560x48U',
+    1711: 'cat3560x24U', 1712: 'cat3750x48U', 1713: 'cat3750x24U', 1714: 'ciscoIE20008TCGN', 1715: 'ciscoIE200016TCGN',
+    1720: 'ciscoIem30004SM', 1721: 'ciscoIem30008SM', 1722: 'cisco1783MX04S', 1723: 'cisco1783MX08S',
+    1724: 'ciscoASR901TenGigDCE', 1725: 'ciscoASR901TenGigACE', 1726: 'ciscoASR901TenGigDC',
+    1727: 'ciscoASR901TenGigAC', 1729: 'ciscoIE200016TCGP', 1730: 'ciscoIE200016TCGEP', 1731: 'ciscoIE200016TCGNXP',
+    1732: 'cat4xxxVirtualSwitch', 1733: 'ciscoRAIE1783BMS20CGN', 1735: 'ciscoRAIE1783BMS12T4E2CGP',
+    1736: 'ciscoRAIE1783BMS12T4E2CGNK', 1737: 'ciscoMds9848512K9SM', 1738: 'ciscoMds9710SM', 1739: 'ciscoMds9710FM',
+    1740: 'ciscoMds9710FCS', 1741: 'ciscoMDS9250iIFSPS', 1742: 'ciscoMDS9250iIFSDC', 1743: 'ciscoMDS9250iIFS',
+    1744: 'ciscoNexus1000VH', 1745: 'cat38xxstack', 1746: 'ciscoVG202XM', 1747: 'ciscoVG204XM',
+    1748: 'ciscoWsC2960P48PstL', 1749: 'ciscoWsC2960P24PcL', 1750: 'ciscoWsC2960P24LcL', 1751: 'ciscoWsC2960P48TcL',
+    1752: 'ciscoWsC2960P24TcL', 1753: 'ciscoWsC2960P48PstS', 1754: 'ciscoWsC2960P24PcS', 1755: 'ciscoWsC2960P24LcS',
+    1756: 'ciscoWsC2960P48TcS', 1757: 'ciscoWsC2960P24TcS', 1762: 'ciscoASR9904', 1763: 'ciscoME2600X',
+    1764: 'ciscoPanini', 1765: 'ciscoC6807xl', 1767: 'cat385024U', 1768: 'cat385048U', 1769: 'ciscoVG310',
+    1770: 'ciscoVG320', 1784: 'ciscoC6880xle', 1796: 'cat45Sup8e', 1797: 'ciscoWsC2960XR48FpdI',
+    1798: 'ciscoWsC2960XR48LpdI', 1799: 'ciscoWsC2960XR48TdI', 1800: 'ciscoWsC2960XR24PdI',
+    1801: 'ciscoWsC2960XR24TdI', 1802: 'ciscoWsC2960XR48FpsI', 1803: 'ciscoWsC2960XR48LpsI',
+    1804: 'ciscoWsC2960XR48TsI', 1805: 'ciscoWsC2960XR24PsI', 1806: 'ciscoWsC2960XR24TsI',
+    1817: 'ciscoUCSC460M4Rackserver', 1818: 'ciscoA901S4SGFD', 1819: 'ciscoA901S3SGFD', 1820: 'ciscoA901S2SGFD',
+    1821: 'ciscoA901S3SGFAH', 1822: 'ciscoA901S2SGFAH', 1823: 'ciscoC365024TS', 1824: 'ciscoC365048TS',
+    1825: 'ciscoC365024PS', 1826: 'ciscoC365048PS', 1827: 'ciscoC365024TD', 1828: 'ciscoC365048TD',
+    1829: 'ciscoC365024PD', 1830: 'ciscoC365048PD', 1839: 'ciscoIE2000U4STSG', 1840: 'ciscoIE2000U16TCGP',
+    1841: 'ciscoIE20008T67B', 1842: 'ciscoIE200016T67B', 1843: 'ciscoIE200024T67B', 1844: 'ciscoIE20008T67PGE',
+    1845: 'ciscoIE200016T67PGE', 1846: 'ciscoRAIE1783ZMS8TA', 1847: 'ciscoRAIE1783ZMS16TA',
+    1848: 'ciscoRAIE1783ZMS24TA', 1849: 'ciscoRAIE1783ZMS4T4E2TGP', 1850: 'ciscoRAIE1783ZMS8T8E2TGP',
+    1851: 'ciscoNcs6008', 1852: 'ciscoC881K9', 1853: 'ciscoC886VaK9', 1854: 'ciscoC886VaJK9', 1855: 'ciscoC887VaK9',
+    1856: 'ciscoC887VaMK9', 1857: 'ciscoC888K9', 1858: 'ciscoC891FK9', 1859: 'ciscoC891FwAK9', 1860: 'ciscoC891FwEK9',
+    1861: 'ciscoASR1001X', 1862: 'cisco1783WAP5100xK9', 1863: 'ciscoCDScde2502s5', 1864: 'ciscoUcsE140S',
+    1865: 'ciscoNXNAM1', 1866: 'ciscoC6800ia48fpdL', 1867: 'ciscoC6800ia48tdL', 1868: 'ciscoIE2000U4TG',
+    1869: 'ciscoIE2000U4TSG', 1870: 'ciscoIE2000U8TCG', 1871: 'ciscoIE2000U16TCG', 1872: 'ciscoIE2000U16TCGX',
+    1873: 'ciscoAIRAP3702', 1874: 'ciscoAIRAP702', 1875: 'ciscoAIRAP1532', 1876: 'ciscoEsxNAM', 1877: 'ciscoKvmNAM',
+    1878: 'ciscoHyperNAM', 1879: 'ciscoC385024S', 1880: 'ciscoC385012S', 1881: 'ciscoC365048PQ',
+    1882: 'ciscoC365048TQ', 1897: 'ciscoASR902', 1899: 'ciscoME1200', 1902: 'ciscoVASA', 1903: 'ciscoVASASy',
+    1904: 'ciscoVASASc', 1915: 'ciscoN9Kc9508', 1916: 'ciscoWapAP702', 1917: 'ciscoWapAP2602', 1918: 'ciscoWapAP1602',
+    1923: 'ciscoN9KC93128TX', 1924: 'ciscoN9KC9396TX', 1925: 'ciscoN9KC9396PX', 1931: 'ciscoUcsEN120S',
+    1934: 'ciscoC68xxVirtualSwitch', 1935: 'ciscoISR4431', 1936: 'ciscoC6880x', 1937: 'ciscoCPT50',
+    1938: 'ciscoAIRAP2702', 1940: 'ciscoCSE340WG32K9', 1941: 'ciscoCSE340WG32AK9', 1942: 'ciscoCSE340WG32CK9',
+    1943: 'ciscoCSE340WG32EK9', 1944: 'ciscoCSE340WG32NK9', 1945: 'ciscoCSE340WM32K9', 1946: 'ciscoCSE340WM32AK9',
+    1947: 'ciscoCSE340WM32CK9', 1948: 'ciscoCSE340WM32EK9', 1949: 'ciscoCSE340WM32NK9', 1952: 'ciscoitpRT1081K9',
+    1953: 'ciscoitpRT1091FK9', 1954: 'ciscoitpPwr30WAC', 1955: 'ciscoitpPwr60WAC', 1956: 'ciscoitpPwr60WACV2',
+    1957: 'ciscoitpPwr125WAC', 1958: 'ciscoitpRT2241K9', 1959: 'ciscoitpRT2221K9', 1960: 'ciscoitpRT2241WCK9',
+    1961: 'ciscoitpAxpIsmSre300', 1962: 'ciscoitpPwr2241AC', 1963: 'ciscoitpRT3211K9', 1964: 'ciscoitpRT3221K9',
+    1965: 'ciscoitpRT3201K9', 1966: 'ciscoitpPwrRT3201AC', 1967: 'ciscoitpPwrRT3211AC', 1968: 'ciscoitpPwrRT3211DC',
+    1969: 'ciscoitpPwrRT32AC', 1970: 'ciscoitpRpsAdptrRT3211', 1971: 'ciscoitpRpsAdptrRT32',
+    1972: 'ciscoitpAxpSmSre710', 1973: 'ciscoitpAxpSmSre910', 1996: 'ciscoN9Kc9516', 1997: 'ciscoN9Kc9504',
+    1998: 'ciscoDoorCGR1240', 1999: 'ciscoISR4351', 2000: 'ciscoWRP500', 2008: 'cisco897VABK9', 2023: 'cisco819HWDCK9',
+    2026: 'catAIRCT57006', 2045: 'cisco897VAMGLTEGAK9', 2053: 'cisco897VAGLTEGAK9', 2058: 'cisco887VAG4GGAK9',
+    2059: 'cisco819G4GGAK9', 2063: 'ciscoIOG910WK9', 2064: 'ciscoIOG910GK9', 2065: 'ciscoIOG910K9',
+    2066: 'cat36xxstack', 2067: 'cat57xxstack', 2068: 'ciscoISR4331', 2069: 'ciscoIE40004TC4GE',
+    2070: 'ciscoIE40008T4GE', 2071: 'ciscoIE40008S4GE', 2072: 'ciscoIE40004T4P4GE', 2073: 'ciscoIE400016T4GE',
+    2074: 'ciscoIE40004S8P4GE', 2075: 'ciscoIE40008GT4GE', 2076: 'ciscoIE40008GS4GE', 2077: 'ciscoIE40004GC4GP4GE',
+    2078: 'ciscoIE400016GT4GE', 2079: 'ciscoIE40008GT8GP4GE', 2080: 'ciscoIE40004GS8GP4GE',
+    2081: 'ciscoRAIE1783HMS4C4CGN', 2082: 'ciscoRAIE1783HMS8T4CGN', 2083: 'ciscoRAIE1783HMS8S4CGN',
+    2084: 'ciscoRAIE1783HMS4T4E4CGN', 2085: 'ciscoRAIE1783HMS16T4CGN', 2086: 'ciscoRAIE1783HMS4S8E4CGN',
+    2087: 'ciscoRAIE1783HMS8TG4CGN', 2088: 'ciscoRAIE1783HMS8SG4CGN', 2089: 'ciscoRAIE1783HMS4EG8CGN',
+    2090: 'ciscoRAIE1783HMS16TG4CGN', 2091: 'ciscoRAIE1783HMS8TG8EG4CGN', 2092: 'ciscoRAIE1783HMS4SG8EG4CGN',
+    2093: 'ciscoISR4321', 2094: 'ciscoCSE340G32K9', 2095: 'ciscoCSE340M32K9', 2096: 'ciscoSCE10000',
+    2097: 'ciscoVirtualSCE', 2098: 'ciscoASR901AC10GS', 2099: 'ciscoASR901DC10GS', 2100: 'ciscoASR92024SZIM',
+    2101: 'ciscoASR92024TZM', 2102: 'ciscoASR92024SZM', 2112: 'ciscoWallander1x1GESKU', 2113: 'ciscoWallander2x1GESKU',
+    2114: 'ciscoASA5506', 2115: 'ciscoASA5506sc', 2116: 'ciscoASA5506sy', 2117: 'ciscoASA5506W',
+    2118: 'ciscoASA5506Wsc', 2119: 'ciscoASA5506Wsy', 2120: 'ciscoASA5508', 2121: 'ciscoASA5508sc',
+    2122: 'ciscoASA5508sy', 2123: 'ciscoASA5506K7', 2124: 'ciscoASA5506K7sc', 2125: 'ciscoASA5506K7sy',
+    2126: 'ciscoASA5508K7', 2127: 'ciscoASA5508K7sc', 2128: 'ciscoASA5508K7sy', 2129: 'ciscoAIRAP1702',
+    2132: 'catwsC3560CX12pdS', 2133: 'catwsC3560CX12tcS', 2134: 'catwsC3560CX12pcS', 2135: 'catwsC3560CX8tcS',
+    2136: 'catwsC3560CX8pcS', 2137: 'catwsC2960CX8tcL', 2138: 'cisco2911TK9', 2139: 'ciscoSNS3495K9',
+    2140: 'ciscoSNS3415K9', 2146: 'ciscoAIRAP702w', 2148: 'cisco891x24XK9', 2155: 'ciscoASR9204SZD',
+    2156: 'ciscoASR9208SZ0A', 2157: 'ciscoASR92012CZA', 2158: 'ciscoASR92012CZD', 2159: 'ciscoASR9204SZA',
+    2160: 'ciscoASR9208SZ0D', 2161: 'ciscoTSCodecG3', 2162: 'ciscoC385012XS', 2163: 'ciscoC385024XS',
+    2164: 'ciscoC385048XS', 2165: 'ciscoC385012X48U', 2166: 'ciscoC385024XU', 2168: 'ciscoRAIE1783ZMS4T4E2TGN',
+    2169: 'ciscoRAIE1783ZMS8T8E2TGN', 2172: 'ciscoRAIE1783HMS8TG4CGR', 2173: 'ciscoRAIE1783HMS8SG4CGR',
+    2174: 'ciscoRAIE1783HMS4EG8CGR', 2175: 'ciscoRAIE1783HMS16TG4CGR', 2176: 'ciscoRAIE1783HMS8TG8EG4CGR',
+    2177: 'ciscoRAIE1783HMS4SG8EG4CGR', 2178: 'ciscoUCSC220M4', 2179: 'ciscoUCSC240M4', 2180: 'ciscoUCSC3160',
+    2181: 'cisco1941WTK9', 2182: 'ciscoUCSC3260', 2185: 'ciscoCDScde2802s5', 2186: 'ciscoCDScde2802s10',
+    2187: 'ciscoCDScde2802s21', 2188: 'ciscoCDScde2802h0', 2189: 'ciscoCDScde2802h13', 2190: 'ciscoCDScde2802h26',
+    2192: 'cisco1941WIK9', 2193: 'ciscoFp7030K9', 2194: 'ciscoFp7050K9', 2195: 'ciscoFp7110K9',
+    2196: 'ciscoFp7110FiK9', 2197: 'ciscoFp7115K9', 2198: 'ciscoFp7120K9', 2199: 'ciscoFp7120FiK9',
+    2200: 'ciscoFp7125K9', 2201: 'ciscoFp8120K9', 2202: 'ciscoFp8130K9', 2203: 'ciscoFp8140K9', 2204: 'ciscoFp8250K9',
+    2205: 'ciscoFp8260K9', 2206: 'ciscoFp8270K9', 2207: 'ciscoFp8290K9', 2208: 'ciscoFp8350K9', 2209: 'ciscoFp8360K9',
+    2210: 'ciscoFp8370K9', 2211: 'ciscoFp8390K9', 2212: 'ciscoFs750K9', 2213: 'ciscoFs1500K9', 2214: 'ciscoFs3500K9',
+    2215: 'ciscoFs4000K9', 2216: 'ciscoAmp7150K9', 2217: 'ciscoAmp8050K9', 2218: 'ciscoAmp8150K9',
+    2219: 'ciscoAmp8350K9', 2220: 'ciscoAmp8360K9', 2221: 'ciscoAmp8370K9', 2222: 'ciscoAmp8390K9',
+    2223: 'ciscoFpSsl1500K9', 2224: 'ciscoFpSsl1500FiK9', 2225: 'ciscoFpSsl2000K9', 2226: 'ciscoFpSsl8200K9',
+    2227: 'ciscoFp7010K9', 2228: 'ciscoFp7020K9', 2229: 'cisco841Mx4XK9', 2230: 'cisco841Mx8XK9',
+    2231: 'ciscoC819GWLTEMNAAK9', 2232: 'ciscoC819GWLTEGAEK9', 2233: 'ciscoIE500012S12P10G',
+    2234: 'ciscoRAIE1783IMS28NAC', 2235: 'ciscoRAIE1783IMS28NDC', 2236: 'ciscoRAIE1783IMS28RAC',
+    2237: 'ciscoRAIE1783IMS28RDC', 2238: 'ciscoACIController', 2240: 'ciscoAIRAPIW3702', 2241: 'ciscoASA5506H',
+    2242: 'ciscoASA5516', 2243: 'ciscoASA5506Hsc', 2244: 'ciscoASA5516sc', 2245: 'ciscoASA5506Hsy',
+    2246: 'ciscoASA5516sy', 2248: 'ciscoIR829GWLTEMAAK9', 2249: 'ciscoPwsX474812X48uE', 2264: 'ciscoIOSXRv9000',
+    2265: 'ciscoSNS3515K9', 2266: 'ciscoSNS3595K9', 2272: 'ciscoC888EAK9', 2273: 'ciscoC6816xle',
+    2274: 'ciscoC6832xle', 2275: 'ciscoC6824xle', 2276: 'ciscoC6840xle', 2277: 'cat35xxStack', 2282: 'ciscoNam2420',
+    2283: 'ciscoNam2440', 2284: 'ciscoflowAgent3300', 2285: 'ciscoFpr9300K9', 2286: 'ciscoFpr9000SM24',
+    2288: 'ciscoFpr9000SM36', 2296: 'ciscoIE500016S12P', 2297: 'ciscoASA5512td', 2298: 'ciscoASA5515td',
+    2299: 'ciscoASA5525td', 2300: 'ciscoASA5545td', 2301: 'ciscoASA5555td', 2302: 'ciscoASA5506td',
+    2303: 'ciscoASA5506Wtd', 2304: 'ciscoASA5506Htd', 2305: 'ciscoASA5508td', 2306: 'ciscoASA5516td',
+    2307: 'ciscoPIUCSAPLK9', 2308: 'cisco899GLTEJPK9', 2309: 'cisco819GLTEMNAK9', 2319: 'ciscoFpvK9',
+    2320: 'ciscoASR901CC', 2321: 'ciscoASR901ECC', 2322: 'ciscoASR901DC10GCC', 2323: 'ciscoASR901EDC10GCC',
+    2324: 'ciscoASR901DC10GSCC', 2325: 'ciscoASR92012SZIMCC', 2326: 'ciscoNcs4201', 2327: 'ciscoNcs4202',
+    2328: 'ciscoNcs4206', 2329: 'ciscoNcs4216', 2334: 'ciscoVFTD', 2344: 'ciscoQSFP100GCWDM4S',
+    2345: 'cisco897VAGWLTEGAEK9', 2346: 'cisco886VAGLTEGAK9', 2347: 'ciscoNcs1002',
+}
@@ -0,0 +1,2827 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Generated by tools/generate_cisco_oids.py from CISCO-ENTITY-VENDORTYPE-OID-MIB, do not edit.
+# Source sha1: 56b000a4fa555ec9cb98b4a60618e3f11d7511b2
+
+CISCO_VENDORTYPES_PREFIX = (1, 3, 6, 1, 4, 1, 9, 12, 3, 1)
+
+# OID arcs under cevMIBObjects and CISCO-ENTITY-VENDORTYPE-OID-MIB symbol name, sorted by OID
+CISCO_VENDORTYPES = (
+    ((1,), 'cevOther'), ((1, 1), 'cevOtherUnknownCard'), ((1, 2), 'cevOtherMoH'), ((1, 3), 'cevNmeApaLink'),
+    ((1, 5), 'cevOtherSce8000Scm'), ((1, 6), 'cevOtherSce8000Sip'), ((1, 8), 'cevOtherCscLink'),
+    ((1, 9), 'cevOtherPHY'), ((1, 10), 'cevAcceleratorAsa5506'), ((1, 11), 'cevAcceleratorAsa5506W'),
+    ((1, 12), 'cevAcceleratorAsa5508'), ((1, 13), 'cevAcceleratorAsa5506K7'), ((1, 14), 'cevAcceleratorAsa5508K7'),
+    ((1, 15), 'cevAcceleratorAsa5506H'), ((1, 16), 'cevAcceleratorAsa5516'), ((2,), 'cevUnknown'),
+    ((3,), 'cevChassis'), ((3, 1), 'cevChassisUnknown'), ((3, 2), 'cevChassis2000'), ((3, 3), 'cevChassis2500'),
+    ((3, 4), 'cevChassis2501'), ((3, 5), 'cevChassis2502'), ((3, 6), 'cevChassis2503'), ((3, 7), 'cevChassis2504'),
+    ((3, 8), 'cevChassis2505'), ((3, 9), 'cevChassis2506'), ((3, 10), 'cevChassis2507'), ((3, 11), 'cevChassis2508'),
+    ((3, 12), 'cevChassis2509'), ((3, 13), 'cevChassis2510'), ((3, 14), 'cevChassis2511'), ((3, 15), 'cevChassis2512'),
+    ((3, 16), 'cevChassis2513'), ((3, 17), 'cevChassis2514'), ((3, 18), 'cevChassis2515'), ((3, 19), 'cevChassis2516'),
+    ((3, 20), 'cevChassis2517'), ((3, 21), 'cevChassis2518'), ((3, 22), 'cevChassis2519'), ((3, 23), 'cevChassis2520'),
+    ((3, 24), 'cevChassis2521'), ((3, 25), 'cevChassis2522'), ((3, 26), 'cevChassis2523'), ((3, 27), 'cevChassis2524'),
+    ((3, 28), 'cevChassis2525'), ((3, 29), 'cevChassis3000'), ((3, 30), 'cevChassis3104'), ((3, 31), 'cevChassis3204'),
+    ((3, 32), 'cevChassisIGS'), ((3, 33), 'cevChassis2501LANFRADFX'), ((3, 34), 'cevChassis2501FRADFX'),
+    ((3, 35), 'cevChassis2502LANFRADFX'), ((3, 36), 'cevChassisWSX3011'), ((3, 37), 'cevChassisAccessProEC'),
+    ((3, 38), 'cevChassisAccessProRC'), ((3, 39), 'cevChassisWSX5301'), ((3, 40), 'cevChassisAS2509RJ'),
+    ((3, 41), 'cevChassisAS2511RJ'), ((3, 42), 'cevChassis3800'), ((3, 43), 'cevChassis3620'),
+    ((3, 44), 'cevChassis3640'), ((3, 45), 'cevChassis7204'), ((3, 46), 'cevChassis7206'),
+    ((3, 47), 'cevChassisAS5300'), ((3, 49), 'cevChassisAs5800RS'), ((3, 50), 'cevChassisAs5800DS'),
+    ((3, 51), 'cevChassis7202'), ((3, 52), 'cevChassisRpm'), ((3, 53), 'cevChassis1710'), ((3, 54), 'cevChassis1720'),
+    ((3, 55), 'cevChassisCat8540Msr'), ((3, 56), 'cevChassisCat8540Csr'), ((3, 57), 'cevChassisUbr7246'),
+    ((3, 58), 'cevChassis7576'), ((3, 59), 'cevChassis3660'), ((3, 60), 'cevChassis1401'), ((3, 61), 'cevChassis2613'),
+    ((3, 62), 'cevChassis2610'), ((3, 63), 'cevChassis2612'), ((3, 64), 'cevChassis2611'), ((3, 65), 'cevChassis2620'),
+    ((3, 66), 'cevChassis2621'), ((3, 67), 'cevChassisCat8510Csr'), ((3, 68), 'cevChassisUbr7223'),
+    ((3, 69), 'cevChassis6400Nrp'), ((3, 70), 'cevChassis801'), ((3, 71), 'cevChassis802'), ((3, 72), 'cevChassis803'),
+    ((3, 73), 'cevChassis804'), ((3, 74), 'cevChassis7206Vxr'), ((3, 75), 'cevChassis7204Vxr'),
+    ((3, 76), 'cevChassis1750'), ((3, 77), 'cevChassisCat2924XLv'), ((3, 78), 'cevChassisCat2924CXLv'),
+    ((3, 79), 'cevChassisCat2912XL'), ((3, 80), 'cevChassisCat2924MXL'), ((3, 81), 'cevChassisCat2912MfXL'),
+    ((3, 82), 'cevChassis1538M'), ((3, 83), 'cevChassis1548M'), ((3, 84), 'cevChassisFasthub100'),
+    ((3, 85), 'cevChassisPIXFirewall'), ((3, 86), 'cevChassisMGX8850'), ((3, 87), 'cevChassisMGX8820'),
+    ((3, 88), 'cevChassisCat8510Msr'), ((3, 89), 'cevChassisCat8515Msr'), ((3, 90), 'cevChassisIGX8410'),
+    ((3, 91), 'cevChassisIGX8420'), ((3, 92), 'cevChassisIGX8430'), ((3, 93), 'cevChassisIGX8450'),
+    ((3, 95), 'cevChassisBPX8620'), ((3, 96), 'cevChassisBPX8650'), ((3, 97), 'cevChassisBPX8680'),
+    ((3, 98), 'cevChassisCacheEngine'), ((3, 99), 'cevChassisCat6000'), ((3, 100), 'cevChassisMC3810'),
+    ((3, 102), 'cevChassisIGXSes'), ((3, 103), 'cevChassisLocalDirector'), ((3, 104), 'cevChassis805'),
+    ((3, 105), 'cevChassisCat3508GXL'), ((3, 106), 'cevChassisCat3512XL'), ((3, 107), 'cevChassisCat3524XL'),
+    ((3, 108), 'cevChassisCat2908XL'), ((3, 109), 'cevChassisCat2916MXL'), ((3, 111), 'cevChassis1417'),
+    ((3, 112), 'cevChassisOpticalRegenerator'), ((3, 113), 'cevChassis6100'), ((3, 114), 'cevChassis6130'),
+    ((3, 115), 'cevChassis6260'), ((3, 116), 'cevChassisCat2924XL'), ((3, 117), 'cevChassisCat2924CXL'),
+    ((3, 118), 'cevChassisUbr924'), ((3, 119), 'cevChassisWsX6302Msm'), ((3, 120), 'cevChassisCat5kRsfc'),
+    ((3, 122), 'cevChassis7120Quadt1'), ((3, 123), 'cevChassis7120T3'), ((3, 124), 'cevChassis7120E3'),
+    ((3, 125), 'cevChassis7120At3'), ((3, 126), 'cevChassis7120Ae3'), ((3, 127), 'cevChassis7120Smi3'),
+    ((3, 128), 'cevChassis7140Dualt3'), ((3, 129), 'cevChassis7140Duale3'), ((3, 130), 'cevChassis7140Dualat3'),
+    ((3, 131), 'cevChassis7140Dualae3'), ((3, 132), 'cevChassis7140Dualmm3'), ((3, 133), 'cevChassis827QuadV'),
+    ((3, 134), 'cevChassisUbr7246Vxr'), ((3, 136), 'cevChassis12016'), ((3, 137), 'cevChassisAs5400'),
+    ((3, 138), 'cevChassis7140Octt1'), ((3, 139), 'cevChassis7140Dualfe'), ((3, 140), 'cevChassisCat3548XL'),
+    ((3, 141), 'cevChassisCat6006'), ((3, 142), 'cevChassisCat6009'), ((3, 143), 'cevChassisCat6506'),
+    ((3, 144), 'cevChassisCat6509'), ((3, 145), 'cevChassis827'), ((3, 146), 'cevChassisAS5200'),
+    ((3, 147), 'cevChassis12008'), ((3, 148), 'cevChassis12012'), ((3, 149), 'cevChassisMc3810V3'),
+    ((3, 151), 'cevChassis7507z'), ((3, 152), 'cevChassis7513z'), ((3, 153), 'cevChassis7507mx'),
+    ((3, 154), 'cevChassis7513mx'), ((3, 155), 'cevChassisUbr912C'), ((3, 156), 'cevChassisUbr912S'),
+    ((3, 157), 'cevChassisUbr914'), ((3, 160), 'cevChassis6160'), ((3, 161), 'cevChassisCat2948gL3'),
+    ((3, 164), 'cevChassisCat4232L3'), ((3, 165), 'cevChassisOpticalRegeneratorDCPower'),
+    ((3, 171), 'cevChassisCVA122'), ((3, 172), 'cevChassisCVA124'), ((3, 173), 'cevChassisAs5850'),
+    ((3, 176), 'cevChassisMGX8240'), ((3, 178), 'cevChassisAs5350'), ((3, 181), 'cevChassisMGX8950'),
+    ((3, 182), 'cevChassisUbr925'), ((3, 183), 'cevChassisUbr10012'), ((3, 184), 'cevChassisCat4kGateway'),
+    ((3, 185), 'cevChassis120168r'), ((3, 186), 'cevChassis2650'), ((3, 187), 'cevChassis2651'),
+    ((3, 189), 'cevChassis826'), ((3, 190), 'cevChassisCat295012'), ((3, 191), 'cevChassisCat295024'),
+    ((3, 193), 'cevChassis1751'), ((3, 194), 'cevChassis1730Iad8Fxs'), ((3, 195), 'cevChassis1730Iad16Fxs'),
+    ((3, 196), 'cevChassis626'), ((3, 197), 'cevChassis627'), ((3, 198), 'cevChassis633'), ((3, 199), 'cevChassis673'),
+    ((3, 200), 'cevChassis675'), ((3, 201), 'cevChassis675e'), ((3, 202), 'cevChassis676'),
+    ((3, 203), 'cevChassis677'), ((3, 204), 'cevChassis678'), ((3, 205), 'cevChassis3661Ac'),
+    ((3, 206), 'cevChassis3661Dc'), ((3, 207), 'cevChassis3662Ac'), ((3, 208), 'cevChassis3662Dc'),
+    ((3, 209), 'cevChassis3662AcCo'), ((3, 210), 'cevChassis3662DcCo'), ((3, 211), 'cevChassisUbr7111'),
+    ((3, 213), 'cevChassisUbr7114'), ((3, 215), 'cevChassis12010'), ((3, 216), 'cevChassis8110'),
+    ((3, 220), 'cevChassisSOHO77'), ((3, 221), 'cevChassisSOHO76'), ((3, 222), 'cevChassis7150Dualfe'),
+    ((3, 223), 'cevChassis7150Octt1'), ((3, 224), 'cevChassis7150Dualt3'), ((3, 226), 'cevChassisCat2950t24'),
+    ((3, 227), 'cevChassisVPS1110'), ((3, 228), 'cevChassisContentEngine'), ((3, 229), 'cevChassisIAD2420'),
+    ((3, 230), 'cevChassis677i'), ((3, 231), 'cevChassis674'), ((3, 232), 'cevChassisDPA7630'),
+    ((3, 233), 'cevChassisCat355024'), ((3, 234), 'cevChassisCat355048'), ((3, 235), 'cevChassisCat355012T'),
+    ((3, 238), 'cevChassisCVA122E'), ((3, 239), 'cevChassisCVA124E'), ((3, 240), 'cevChassisURM'),
+    ((3, 241), 'cevChassisURM2FE'), ((3, 242), 'cevChassisURM2FE2V'), ((3, 245), 'cevChassisCAP340'),
+    ((3, 247), 'cevChassisDPA7610'), ((3, 248), 'cevChassis828'), ((3, 249), 'cevChassisSOHO78'),
+    ((3, 250), 'cevChassis806'), ((3, 251), 'cevChassis12416'), ((3, 252), 'cevChassisCat2948gL3Dc'),
+    ((3, 253), 'cevChassisCat4908gL3Dc'), ((3, 254), 'cevChassis12406'), ((3, 255), 'cevChassisPIXFirewall506'),
+    ((3, 256), 'cevChassisPIXFirewall515'), ((3, 257), 'cevChassisPIXFirewall520'),
+    ((3, 258), 'cevChassisPIXFirewall525'), ((3, 259), 'cevChassisPIXFirewall535'), ((3, 260), 'cevChassis12410'),
+    ((3, 261), 'cevChassis811'), ((3, 262), 'cevChassis813'), ((3, 263), 'cevChassis10720'),
+    ((3, 264), 'cevChassisMWR1900'), ((3, 265), 'cevChassis4224'), ((3, 266), 'cevChassisWSC6513'),
+    ((3, 267), 'cevChassisCisco7603'), ((3, 268), 'cevChassisCisco7606'), ((3, 269), 'cevChassis7401ASR'),
+    ((3, 271), 'cevChassis1105'), ((3, 272), 'cevChassisONS15540ESP'), ((3, 275), 'cevChassisCe507'),
+    ((3, 276), 'cevChassisCe560'), ((3, 277), 'cevChassisCe590'), ((3, 278), 'cevChassisCe7320'),
+    ((3, 279), 'cevChassis2691'), ((3, 280), 'cevChassis3725'), ((3, 282), 'cevChassis1760'),
+    ((3, 283), 'cevChassisPIXFirewall501'), ((3, 284), 'cevChassis2610M'), ((3, 285), 'cevChassis2611M'),
+    ((3, 289), 'cevChassis12404'), ((3, 290), 'cevChassis9004'), ((3, 293), 'cevChassisCat295012G'),
+    ((3, 294), 'cevChassisCat295024G'), ((3, 295), 'cevChassisCat295048G'), ((3, 297), 'cevChassisCat355012G'),
+    ((3, 298), 'cevChassisCE507AV'), ((3, 299), 'cevChassisCE560AV'), ((3, 300), 'cevChassisIE2105'),
+    ((3, 301), 'cevChassis3745'), ((3, 302), 'cevChassis10005'), ((3, 303), 'cevChassis10008'),
+    ((3, 304), 'cevChassis7304'), ((3, 305), 'cevChassis7505'), ((3, 310), 'cevChassis1721'),
+    ((3, 311), 'cevChassisCat4000Sup3'), ((3, 312), 'cevChassis827H'), ((3, 313), 'cevChassisSOHO77H'),
+    ((3, 314), 'cevChassisCat4006'), ((3, 315), 'cevChassisCat355024Mmf'), ((3, 316), 'cevChassisWSC6503'),
+    ((3, 317), 'cevChassisPIXFirewall506E'), ((3, 318), 'cevChassisPIXFirewall515E'),
+    ((3, 319), 'cevChassisCat355024Dc'), ((3, 320), 'cevChassisCe2636'), ((3, 321), 'cevChassisCeDw2636'),
+    ((3, 323), 'cevChassis14MGX8830'), ((3, 325), 'cevChassisONS15530NEBS'), ((3, 326), 'cevChassisONS15530ETSI'),
+    ((3, 327), 'cevChassisSOHO71'), ((3, 328), 'cevChassis6400UAC'), ((3, 329), 'cevChassisRPMPR'),
+    ((3, 330), 'cevChassis2610XM'), ((3, 331), 'cevChassis2611XM'), ((3, 332), 'cevChassis2620XM'),
+    ((3, 333), 'cevChassis2621XM'), ((3, 334), 'cevChassis2650XM'), ((3, 335), 'cevChassis2651XM'),
+    ((3, 336), 'cevChassisCat295024GDc'), ((3, 337), 'cevChassisONS15540ESPx'), ((3, 340), 'cevChassisC7301'),
+    ((3, 341), 'cevChassis12816'), ((3, 342), 'cevChassis12810'), ((3, 347), 'cevChassisCat295024sx'),
+    ((3, 348), 'cevChassisAs5400HPX'), ((3, 349), 'cevChassisAs5350HPX'), ((3, 350), 'cevChassisCat2955T12'),
+    ((3, 351), 'cevChassisCat2955C12'), ((3, 354), 'cevChassis837'), ((3, 355), 'cevChassisSOHO97'),
+    ((3, 356), 'cevChassis831'), ((3, 357), 'cevChassisSOHO91'), ((3, 358), 'cevChassis836'),
+    ((3, 359), 'cevChassisSOHO96'), ((3, 360), 'cevChassisCat4507'), ((3, 361), 'cevChassisCat4506'),
+    ((3, 362), 'cevChassisCat4503'), ((3, 363), 'cevChassis7507'), ((3, 364), 'cevChassis7513'),
+    ((3, 365), 'cevChassisAIRAP1100'), ((3, 367), 'cevChassisCat2955S12'), ((3, 368), 'cevChassisCisco7609'),
+    ((3, 369), 'cevChassisWSC65509'), ((3, 370), 'cevChassisCat375024'), ((3, 371), 'cevChassisCat375048'),
+    ((3, 372), 'cevChassisCat375024TS'), ((3, 373), 'cevChassisCat375024T'), ((3, 374), 'cevChassisMWR1941DC'),
+    ((3, 375), 'cevChassisDSC9506'), ((3, 376), 'cevChassisDSC9509'), ((3, 377), 'cevChassisDSC9513'),
+    ((3, 378), 'cevChassisONS15201'), ((3, 379), 'cevChassisONS15252'), ((3, 380), 'cevChassisMdsDSX9216'),
+    ((3, 381), 'cevChassisVG200'), ((3, 382), 'cevChassisAIRAP1210'), ((3, 383), 'cevChassisCat375048PS'),
+    ((3, 384), 'cevChassisCat375024PS'), ((3, 385), 'cevChassisCe510'), ((3, 386), 'cevChassisCe565'),
+    ((3, 387), 'cevChassisCe7305'), ((3, 388), 'cevChassisCe7325'), ((3, 389), 'cevChassisCe4630'),
+    ((3, 390), 'cevChassisCe4650'), ((3, 391), 'cevChassisCat297024'), ((3, 392), 'cevChassisCisco7613'),
+    ((3, 394), 'cevChassisCat3750Ge12Sfp'), ((3, 395), 'cevChassisCr4450'), ((3, 396), 'cevChassisAIRBR1410'),
+    ((3, 397), 'cevChassisWSC6509neba'), ((3, 398), 'cevChassisCat4510'), ((3, 399), 'cevChassisCisco1711'),
+    ((3, 400), 'cevChassisCisco1712'), ((3, 401), 'cevChassisCisco1701'), ((3, 402), 'cevChassis29408TT'),
+    ((3, 403), 'cevChassis29408TF'), ((3, 404), 'cevChassis3825'), ((3, 405), 'cevChassis3845'),
+    ((3, 406), 'cevChassis2430Iad24Fxs'), ((3, 407), 'cevChassis2431Iad8Fxs'), ((3, 408), 'cevChassis2431Iad16Fxs'),
+    ((3, 409), 'cevChassis2431Iad1T1E1'), ((3, 410), 'cevChassis2432Iad24Fxs'), ((3, 411), 'cevChassisDSC9140K9'),
+    ((3, 412), 'cevChassisAirAp350IOS'), ((3, 413), 'cevChassis3220'), ((3, 414), 'cevChassisDSC9120K9'),
+    ((3, 415), 'cevChassisCat295024LreSt997'), ((3, 416), 'cevChassisCat6kSup720'), ((3, 417), 'cevChassisVG224'),
+    ((3, 418), 'cevChassisCat295048T'), ((3, 419), 'cevChassisCat295048SX'), ((3, 420), 'cevChassisCat297024TS'),
+    ((3, 421), 'cevChassisCrs116Fabric'), ((3, 422), 'cevChassisCrs116LineCard'),
+    ((3, 423), 'cevChassisCrs18LineCard'), ((3, 424), 'cevChassisCat356048PS'), ((3, 425), 'cevChassisCat356024PS'),
+    ((3, 426), 'cevChassisAIRBR1300'), ((3, 427), 'cevChassis12004'), ((3, 428), 'cevChassis12006'),
+    ((3, 429), 'cevChassis851'), ((3, 430), 'cevChassis857'), ((3, 431), 'cevChassis876'), ((3, 432), 'cevChassis877'),
+    ((3, 433), 'cevChassis878'), ((3, 434), 'cevChassis871'), ((3, 435), 'cevChassisUmg9820'),
+    ((3, 436), 'cevChassis2811'), ((3, 437), 'cevChassis2821'), ((3, 438), 'cevChassis2851'),
+    ((3, 439), 'cevChassisCat375024ME'), ((3, 442), 'cevChassisMdsDSC9216AK9'), ((3, 443), 'cevChassis3201WMIC'),
+    ((3, 444), 'cevChassisCat3750G16TD'), ((3, 445), 'cevChassis1718'), ((3, 446), 'cevChassisIGESM'),
+    ((3, 447), 'cevChassisASA5510'), ((3, 448), 'cevChassisASA5520'), ((3, 449), 'cevChassisASA5540'),
+    ((3, 450), 'cevChassis1841'), ((3, 451), 'cevChassis2801'), ((3, 452), 'cevChassisCe511K9'),
+    ((3, 453), 'cevChassisCe566K9'), ((3, 454), 'cevChassisASA5560'), ((3, 455), 'cevChassisMGX8880'),
+    ((3, 456), 'cevChassisCe7306K9'), ((3, 457), 'cevChassisCe7326K9'), ((3, 458), 'cevChassisCat3750G24PS'),
+    ((3, 459), 'cevChassisCat3750G48PS'), ((3, 460), 'cevChassisCat3750G48TS'), ((3, 461), 'cevChassisCat297048TS'),
+    ((3, 462), 'cevChassisDSX9132K9'), ((3, 463), 'cevChassisDSX9116K9'), ((3, 464), 'cevChassisBMGX8830'),
+    ((3, 465), 'cevChassisBMGX8850'), ((3, 466), 'cevChassisWsC4948'), ((3, 467), 'cevChassisCe501K9'),
+    ((3, 468), 'cevChassisCat3560G24PS'), ((3, 469), 'cevChassisCat3560G24TS'), ((3, 470), 'cevChassisCat3560G48PS'),
+    ((3, 471), 'cevChassisCat3560G48TS'), ((3, 472), 'cevChassisDSC9216iK9'), ((3, 473), 'cevChassisAs5400XM'),
+    ((3, 474), 'cevChassisAs5350XM'), ((3, 475), 'cevChassisAIRAP1130'), ((3, 476), 'cevChassisCisco7604'),
+    ((3, 477), 'cevChassisWsC494810GE'), ((3, 478), 'cevChassisCat3750G24TS1U'), ((3, 480), 'cevChassis371098HP001'),
+    ((3, 481), 'cevChassisSB101'), ((3, 482), 'cevChassisSB106'), ((3, 483), 'cevChassisSB107'),
+    ((3, 484), 'cevChassisCat356024TS'), ((3, 485), 'cevChassisCat356048TS'), ((3, 486), 'cevChassisONS15310'),
+    ((3, 487), 'cevChassis1801'), ((3, 488), 'cevChassis1802'), ((3, 489), 'cevChassis1803'),
+    ((3, 490), 'cevChassis1811'), ((3, 491), 'cevChassis1812'), ((3, 492), 'cevWLSEChassis1130'),
+    ((3, 493), 'cevWLSEChassis1030'), ((3, 495), 'cevChassisIDS4210'), ((3, 496), 'cevChassisIDS4215'),
+    ((3, 497), 'cevChassisIDS4235'), ((3, 498), 'cevChassisIDS4240'), ((3, 499), 'cevChassisIDS4250'),
+    ((3, 500), 'cevChassisIDS4250SX'), ((3, 501), 'cevChassisIDS4250XL'), ((3, 502), 'cevChassisIDS4255'),
+    ((3, 503), 'cevChassisCat375024FS'), ((3, 504), 'cevChassisWSC6504E'), ((3, 505), 'cevChassisIGESMSFP'),
+    ((3, 506), 'cevChasisFe6326K9'), ((3, 508), 'cevChassisFe7326K9'), ((3, 509), 'cevChassisFe511K9'),
+    ((3, 510), 'cevChassisSCEDispatcher'), ((3, 511), 'cevChassisSCE2000'), ((3, 512), 'cevChassisSCE1000'),
+    ((3, 513), 'cevChassisAIRAP1240'), ((3, 514), 'cevChassisDSC902020K9'), ((3, 515), 'cevChassisFe611K9'),
+    ((3, 520), 'cevChassisCat3750Ge12SfpDc'), ((3, 521), 'cevChassisCat296024'), ((3, 522), 'cevChassisCat296048'),
+    ((3, 523), 'cevChassisCat2960G24'), ((3, 524), 'cevChassisCat2960G48'), ((3, 529), 'cevChassisCat6kMsfc2a'),
+    ((3, 530), 'cevChassisCe611K9'), ((3, 531), 'cevChassisME6340ACA'), ((3, 532), 'cevChassisME6340DCA'),
+    ((3, 533), 'cevChassisME6340DCB'), ((3, 534), 'cevChassisCat296024TT'), ((3, 535), 'cevChassisCat296048TT'),
+    ((3, 536), 'cevChassisIGESMSFPT'), ((3, 537), 'cevChassisMec6524gs8s'), ((3, 538), 'cevChassisMec6524gt8s'),
+    ((3, 541), 'cevChassisPaldron'), ((3, 542), 'cevChassisIGESMT'), ((3, 543), 'cevChassisCatCE50024TT'),
+    ((3, 544), 'cevChassisCatCE50024LC'), ((3, 545), 'cevChassisCatCE50024PC'), ((3, 546), 'cevChassisCatCE50012TC'),
+    ((3, 547), 'cevChassis5750'), ((3, 548), 'cevChassisMWR1941DCA'), ((3, 549), 'cevChassis815'),
+    ((3, 550), 'cevChassis240024TSA'), ((3, 551), 'cevChassis240024TSD'), ((3, 552), 'cevChassis340024TSA'),
+    ((3, 553), 'cevChassis340024TSD'), ((3, 556), 'cevChassisFe2636'), ((3, 557), 'cevChassisIDS4220'),
+    ((3, 558), 'cevChassisIDS4230'), ((3, 560), 'cevChassisASA5505'), ((3, 561), 'cevChassisWS3020HPQ'),
+    ((3, 562), 'cevChassisWS3030DEL'), ((3, 563), 'cevChassisWLSE1133'), ((3, 564), 'cevChassisASA5550'),
+    ((3, 565), 'cevChassisWae612K9'), ((3, 567), 'cevChassisAirap1250'), ((3, 568), 'cevChassisCe512K9'),
+    ((3, 569), 'cevChassisFe512K9'), ((3, 570), 'cevChassisCe612K9'), ((3, 571), 'cevChassisFe612K9'),
+    ((3, 573), 'cevChassisOe512K9'), ((3, 574), 'cevChassisOe612K9'), ((3, 575), 'cevChassisCat3750G24WS'),
+    ((3, 576), 'cevChassisCrs14LineCard'), ((3, 577), 'cevChassisMe3400g12CsA'), ((3, 578), 'cevChassisMe3400g12CsD'),
+    ((3, 579), 'cevChassis877M'), ((3, 580), 'cevChassis1801M'), ((3, 581), 'cevChassisWsCbs3040Fsc'),
+    ((3, 582), 'cevChassisSpaIPSEC2g2'), ((3, 583), 'cevChassisOe511K9'), ((3, 584), 'cevChassisOe611K9'),
+    ((3, 585), 'cevChassisOe7326K9'), ((3, 586), 'cevChassisMe492410GE'), ((3, 587), 'cevChassisDSC9124'),
+    ((3, 588), 'cevChassisCat3750E48TD'), ((3, 589), 'cevChassisCat3750E24TD'), ((3, 590), 'cevChassisCat3750E24PD'),
+    ((3, 591), 'cevChassisCat3750E48PD'), ((3, 592), 'cevChassisCat3560E24TD'), ((3, 593), 'cevChassisCat3560E48TD'),
+    ((3, 594), 'cevChassisCat3560E24PD'), ((3, 595), 'cevChassisCat3560E48PD'), ((3, 596), 'cevChassisCat35608PC'),
+    ((3, 597), 'cevChassisCat29608TC'), ((3, 598), 'cevChassisCat2960G8TC'), ((3, 599), 'cevChassisCisco7606S'),
+    ((3, 600), 'cevChassisCisco7609S'), ((3, 601), 'cevChassisDSIBMFC'), ((3, 602), 'cevChassisIPSVirtual'),
+    ((3, 603), 'cevChassis3250'), ((3, 604), 'cevChassis3205WMIC'), ((3, 605), 'cevChassisCisco5720'),
+    ((3, 607), 'cevChassisMe3400g2csA'), ((3, 608), 'cevChassis7201'), ((3, 609), 'cevChassisNmWae'),
+    ((3, 610), 'cevChassisACE4710K9'), ((3, 612), 'cevChassisN7Kc7010'), ((3, 613), 'cevChassisUbr7225Vxr'),
+    ((3, 615), 'cevChassisWSC6509ve'), ((3, 616), 'cevChassisDSC9134'), ((3, 617), 'cevChassisCisco7603S'),
+    ((3, 620), 'cevChassis5740'), ((3, 623), 'cevChassis867'), ((3, 624), 'cevChassis881'),
+    ((3, 625), 'cevChassis881G'), ((3, 626), 'cevChassisIad881F'), ((3, 627), 'cevChassisIad881B'),
+    ((3, 628), 'cevChassis881Srst'), ((3, 629), 'cevChassis886'), ((3, 630), 'cevChassis886G'),
+    ((3, 631), 'cevChassisIad886F'), ((3, 632), 'cevChassisIad886B'), ((3, 633), 'cevChassis886Srst'),
+    ((3, 634), 'cevChassis887'), ((3, 635), 'cevChassis887G'), ((3, 636), 'cevChassisIad887F'),
+    ((3, 637), 'cevChassisIad887B'), ((3, 638), 'cevChassis887Srst'), ((3, 640), 'cevChassis888G'),
+    ((3, 641), 'cevChassisIad888F'), ((3, 642), 'cevChassisIad888B'), ((3, 643), 'cevChassis888Srst'),
+    ((3, 644), 'cevChassis891'), ((3, 645), 'cevChassis892'), ((3, 646), 'cevChassis885D3'),
+    ((3, 647), 'cevChassisIad885FD3'), ((3, 648), 'cevChassis885EJ3'), ((3, 649), 'cevChassis7816H'),
+    ((3, 650), 'cevChassisSce8000'), ((3, 651), 'cevChassisMdsDSC9222i'), ((3, 653), 'cevChassis860Ap'),
+    ((3, 654), 'cevChassis880Ap'), ((3, 655), 'cevChassis890Ap'), ((3, 656), 'cevChassis1900Ap'),
+    ((3, 657), 'cevChassis340024FSA'), ((3, 658), 'cevChassisCat4503e'), ((3, 659), 'cevChassisCat4506e'),
+    ((3, 660), 'cevChassisCat4507re'), ((3, 661), 'cevChassisCat4510re'), ((3, 662), 'cevChassisUc520s8U4FxoK9'),
+    ((3, 663), 'cevChassisUc520s8U4FxoWK9'), ((3, 664), 'cevChassisUc520s8U2BriK9'),
+    ((3, 665), 'cevChassisUc520s8U2BriWK9'), ((3, 666), 'cevChassisUc520s16U4FxoK9'),
+    ((3, 667), 'cevChassisUc520s16U4FxoWK9'), ((3, 668), 'cevChassisUc520s16U2BriK9'),
+    ((3, 669), 'cevChassisUc520s16U2BriWK9'), ((3, 670), 'cevChassisUc520m32U8FxoK9'),
+    ((3, 671), 'cevChassisUc520m32U8FxoW'), ((3, 672), 'cevChassisUc520m32U4BriK9'),
+    ((3, 673), 'cevChassisUc520m32U4BriW'), ((3, 674), 'cevChassisUc520m48U12FxoK9'),
+    ((3, 675), 'cevChassisUc520m48U12FxoW'), ((3, 676), 'cevChassisUc520m48U6BriK9'),
+    ((3, 677), 'cevChassisUc520m48U6BriW'), ((3, 678), 'cevChassisUc520m48U1T1E1FK9'),
+    ((3, 679), 'cevChassisUc520m48U1T1E1BK9'), ((3, 680), 'cevChassisCE5208PC'), ((3, 681), 'cevChassis7828H'),
+    ((3, 682), 'cevChassis7816I'), ((3, 683), 'cevChassis7828I'), ((3, 684), 'cevChassis1861Uc2BK9'),
+    ((3, 685), 'cevChassis1861Uc4FK9'), ((3, 686), 'cevChassis1861Srst2BK9'), ((3, 687), 'cevChassis1861Srst4FK9'),
+    ((3, 688), 'cevChassisOe7330K9'), ((3, 689), 'cevChassisOe7350K9'), ((3, 694), 'cevChassisCat296048TCS'),
+    ((3, 695), 'cevChassisCat296024TCS'), ((3, 696), 'cevChassisCat296024S'), ((3, 697), 'cevChassisCat296024PC'),
+    ((3, 698), 'cevChassisCat296024LT'), ((3, 699), 'cevChassisCat2960PD8TT'), ((3, 700), 'cevChassisASR1002'),
+    ((3, 701), 'cevChassisASR1004'), ((3, 702), 'cevChassisASR1006'), ((3, 703), 'cevChassisWsC4900M'),
+    ((3, 704), 'cevChassisASA5580'), ((3, 705), 'cevChassisCatRfgw'), ((3, 706), 'cevChassisCE52024PC'),
+    ((3, 707), 'cevChassisCE52024LC'), ((3, 708), 'cevChassisCE52024TT'), ((3, 709), 'cevChassisCE520G24TC'),
+    ((3, 710), 'cevChassis1861Srst2BCueK9'), ((3, 711), 'cevChassis1861Srst4FCueK9'), ((3, 712), 'cevChassisVgd1t3'),
+    ((3, 718), 'cevChassisCat3560e12d'), ((3, 719), 'cevChassisN5kC5020pBf'), ((3, 720), 'cevChassisN5kC5020pBd'),
+    ((3, 721), 'cevChassisCat3560E12SD'), ((3, 722), 'cevChassisOe674'), ((3, 723), 'cevChassisIE30004TC'),
+    ((3, 724), 'cevChassisIE30008TC'), ((3, 725), 'cevChassisRAIE1783MS06'), ((3, 726), 'cevChassisRAIE1783MS10T'),
+    ((3, 727), 'cevChassis2435Iad8Fxs'), ((3, 728), 'cevChassisVG204'), ((3, 729), 'cevChassisVG202'),
+    ((3, 730), 'cevChassisCat291824TT'), ((3, 731), 'cevChassisCat291824TC'), ((3, 732), 'cevChassisCat291848TT'),
+    ((3, 733), 'cevChassisCat291848TC'), ((3, 734), 'cevChassis1805'), ((3, 735), 'cevChassisUc52024u4briK9'),
+    ((3, 736), 'cevChassisUc52024u8fxoK9'), ((3, 737), 'cevChassisUc520s8u2briWJK9'),
+    ((3, 738), 'cevChassisUc520s16u2briWJK9'), ((3, 739), 'cevChassisVSIntSP'), ((3, 740), 'cevChassisVSSP'),
+    ((3, 741), 'cevChassisVSHydecoder'), ((3, 742), 'cevChassisVSDecoder'), ((3, 743), 'cevChassisVSEncoder1P'),
+    ((3, 745), 'cevChassisCiscoMwr2941Dc'), ((3, 746), 'cevChassisOe574'), ((3, 747), 'cevChassisOe474'),
+    ((3, 748), 'cevChassisOe274'), ((3, 749), 'cevChassis7816c'), ((3, 750), 'cevChassisAp801agn'),
+    ((3, 751), 'cevChassisAp801gn'), ((3, 752), 'cevChassisC1861WSrst4FCueK9'),
+    ((3, 753), 'cevChassisC1861WSrst2BCueK9'), ((3, 754), 'cevChassisC1861WSrst4FK9'),
+    ((3, 755), 'cevChassisC1861WSrst2BK9'), ((3, 756), 'cevChassisC1861WUc4FK9'), ((3, 757), 'cevChassisC1861WUc2BK9'),
+    ((3, 758), 'cevChassisMe3400e24tsM'), ((3, 759), 'cevChassisMe3400eg12csM'), ((3, 760), 'cevChassisMe3400eg2csA'),
+    ((3, 761), 'cevChassisCe674'), ((3, 762), 'cevChassisCAM35'), ((3, 763), 'cevChassisCe7341'),
+    ((3, 764), 'cevChassisCe7371'), ((3, 768), 'cevChassisWsCbs3125gS'), ((3, 770), 'cevChassisWsC492810GE'),
+    ((3, 771), 'cevChassisCat296048TTS'), ((3, 772), 'cevChassisCat29608TCS'), ((3, 774), 'cevChassisSr520FE'),
+    ((3, 775), 'cevChassisSr520ADSL'), ((3, 776), 'cevChassisSr520ADSLi'), ((3, 777), 'cevChassisN7Kc7018'),
+    ((3, 778), 'cevChassisCat356012PCS'), ((3, 779), 'cevChassisCat296048PSTL'), ((3, 780), 'cevChassisASR9010'),
+    ((3, 781), 'cevChassisASR9006'), ((3, 782), 'cevChassisASR14K4'), ((3, 783), 'cevChassisASR14K8'),
+    ((3, 784), 'cevChassisCat3560v224tsD'), ((3, 785), 'cevChassisCat3560v224ts'),
+    ((3, 786), 'cevChassisCat3560v224ps'), ((3, 787), 'cevChassisCat3750v224ts'),
+    ((3, 788), 'cevChassisCat3750v224ps'), ((3, 789), 'cevChassisCat3560v248ts'),
+    ((3, 790), 'cevChassisCat3560v248ps'), ((3, 791), 'cevChassisCat3750v248ts'),
+    ((3, 792), 'cevChassisCat3750v248ps'), ((3, 793), 'cevChassisAirbr1430'), ((3, 794), 'cevChassisNamApp2204rj45'),
+    ((3, 795), 'cevChassisNamApp2220'), ((3, 796), 'cevChassisAIRAP1141'), ((3, 797), 'cevChassisAIRAP1142'),
+    ((3, 798), 'cevChassisN5kC5010pBf'), ((3, 799), 'cevChassisASR9010DC'), ((3, 800), 'cevChassisASR9006DC'),
+    ((3, 801), 'cevChassis18xxx'), ((3, 802), 'cevChassisc887Vdsl2'), ((3, 803), 'cevChassisC1941'),
+    ((3, 804), 'cevChassisC2901'), ((3, 805), 'cevChassisC2911'), ((3, 806), 'cevChassisC2921'),
+    ((3, 807), 'cevChassisC2951'), ((3, 808), 'cevChassisC3925'), ((3, 809), 'cevChassisC3945'),
+    ((3, 810), 'cevChassisEsw52024pK9'), ((3, 811), 'cevChassisEsw54024pK9'), ((3, 812), 'cevChassisEsw52048pK9'),
+    ((3, 813), 'cevChassisEsw52024K9'), ((3, 814), 'cevChassisEsw54024K9'), ((3, 815), 'cevChassisEsw52048K9'),
+    ((3, 816), 'cevChassisEsw54048K9'), ((3, 817), 'cevChassisNamApp2204sfp'), ((3, 818), 'cevChassisSR520T1'),
+    ((3, 820), 'cevChassisN2kC2148T1GE'), ((3, 827), 'cevChassisC1941W'), ((3, 828), 'cevChassisC888E'),
+    ((3, 829), 'cevChassisC888EG'), ((3, 830), 'cevChassisIad888EF'), ((3, 831), 'cevChassisIad888EB'),
+    ((3, 832), 'cevChassisC888ESRST'), ((3, 833), 'cevChassis3845nv'), ((3, 834), 'cevChassis3825nv'),
+    ((3, 836), 'cevChassisWSC235048TD'), ((3, 837), 'cevChassis887M'), ((3, 838), 'cevChassisASR9010AC'),
+    ((3, 839), 'cevChassisASR9006AC'), ((3, 840), 'cevChassisN1KV'), ((3, 847), 'cevChassisUCSN10S6100'),
+    ((3, 848), 'cevChassisCDScde420'), ((3, 849), 'cevChassisCDScde220'), ((3, 850), 'cevChassisCDScde110'),
+    ((3, 851), 'cevChassisCiscoCeVirtualBlade'), ((3, 852), 'cevChassisASR1002F'), ((3, 853), 'cevChassisADE2120'),
+    ((3, 860), 'cevChassisAIRAP3501'), ((3, 861), 'cevChassisAIRAP3502'), ((3, 862), 'cevChassisCDScde200'),
+    ((3, 863), 'cevChassisCDScde100'), ((3, 864), 'cevChassisCDScde300'), ((3, 865), 'cevChassisCDScde400'),
+    ((3, 869), 'cevChassisSps2004B'), ((3, 870), 'cevChassisSps204B'), ((3, 874), 'cevChassisAp541nAK9'),
+    ((3, 875), 'cevChassisAp541nEK9'), ((3, 876), 'cevChassisAp541nNK9'), ((3, 877), 'cevChassisSRP521'),
+    ((3, 878), 'cevChassisSRP526'), ((3, 879), 'cevChassisSRP527'), ((3, 880), 'cevChassisSRP541'),
+    ((3, 881), 'cevChassisSRP546'), ((3, 882), 'cevChassisSRP547'), ((3, 883), 'cevChassisVS510FXO'),
+    ((3, 884), 'cevChassis887GVdsl2'), ((3, 885), 'cevChassis887SrstVdsl2'), ((3, 895), 'cevChassis59xx'),
+    ((3, 896), 'cevChassisCat296024LCS'), ((3, 897), 'cevChassisCat296024PCS'), ((3, 898), 'cevChassisCat296048PSTS'),
+    ((3, 900), 'cevChassisCiscoNMWAE900'), ((3, 901), 'cevChassisCiscoNMWAE700'), ((3, 902), 'cevChassis5940'),
+    ((3, 903), 'cevChassisN4KIBMEth'), ((3, 904), 'cevChassisASR1001'), ((3, 905), 'cevChassisASR1013'),
+    ((3, 906), 'cevChassisCDScde205'), ((3, 907), 'cevChassisNexus1010'), ((3, 908), 'cevChassisRaie1783Rms06t'),
+    ((3, 909), 'cevChassisRaie1783Rms10t'), ((3, 910), 'cevChassisMXE5600'), ((3, 911), 'cevChassisEsw5408pK9'),
+    ((3, 912), 'cevChassisEsw5208pK9'), ((3, 913), 'cevChassisN2kC2232PP10GE'), ((3, 914), 'cevChassisN2kC2248TP1GE'),
+    ((3, 915), 'cevChassisWsC4948e10GE'), ((3, 928), 'cevChassis1921k9'), ((3, 929), 'cevChassis1905k9'),
+    ((3, 930), 'cevChassisN4KIBMCiscoEth'), ((3, 931), 'cevChassisASA5585'), ((3, 932), 'cevChassisN7Kc7009'),
+    ((3, 933), 'cevChassisMwr2941DcA'), ((3, 937), 'cevChassisOeNm302'), ((3, 938), 'cevChassisOeNm502'),
+    ((3, 939), 'cevChassisOeNm522'), ((3, 940), 'cevChassisOeSmSre700'), ((3, 941), 'cevChassisOeSmSre900'),
+    ((3, 944), 'cevChassisCDScde2202s3'), ((3, 945), 'cevChassisWsC3750x24'), ((3, 946), 'cevChassisWsC3750x48'),
+    ((3, 947), 'cevChassisWsC3750x24P'), ((3, 948), 'cevChassisWsC3750x48P'), ((3, 949), 'cevChassisWsC3560x24'),
+    ((3, 950), 'cevChassisWsC3560x48'), ((3, 957), 'cevChassis1841Ck9'), ((3, 958), 'cevChassis2801Ck9'),
+    ((3, 959), 'cevChassis2811Ck9'), ((3, 960), 'cevChassis2821Ck9'), ((3, 962), 'cevChassis3825Ck9'),
+    ((3, 963), 'cevChassis3845Ck9'), ((3, 966), 'cevChassisAIRAP1262'), ((3, 967), 'cevChassisAIRAP1261'),
+    ((3, 968), 'cevChassis892F'), ((3, 969), 'cevChassisMe3600x24fsM'), ((3, 970), 'cevChassisMe3600x24tsM'),
+    ((3, 971), 'cevChassisMe3800x24fsM'), ((3, 972), 'cevChassisCGR2010'), ((3, 973), 'cevChassisWsC2960s48tsS'),
+    ((3, 974), 'cevChassisWsC2960s24tsS'), ((3, 975), 'cevChassisWsC2960s48fpdL'),
+    ((3, 976), 'cevChassisWsC2960s48lpdL'), ((3, 977), 'cevChassisWsC2960s48tdL'),
+    ((3, 978), 'cevChassisWsC2960s24pdL'), ((3, 979), 'cevChassisWsC2960s24tdL'),
+    ((3, 980), 'cevChassisWsC2960s48fpsL'), ((3, 981), 'cevChassisWsC2960s48lpsL'),
+    ((3, 982), 'cevChassisWsC2960s24psL'), ((3, 983), 'cevChassisWsC2960s48tsL'),
+    ((3, 984), 'cevChassisWsC2960S24tsL'), ((3, 985), 'cevChassis1906Ck9'), ((3, 986), 'cevChassisAIRAP1042'),
+    ((3, 987), 'cevChassisAIRAP1041'), ((3, 988), 'cevChassis887Va'), ((3, 989), 'cevChassis886Va'),
+    ((3, 990), 'cevChassis867Va'), ((3, 991), 'cevChassis887VaM'), ((3, 992), 'cevChassisASR1001IDC2pOc3Pos'),
+    ((3, 993), 'cevChassisASR1001IDC4pT3'), ((3, 994), 'cevChassisASR1001IDC4pGE'),
+    ((3, 995), 'cevChassisASR1001IDC8pCT1E1'), ((3, 996), 'cevChassisASR1001IDCHDD'),
+    ((3, 997), 'cevChassisCat2960cPD8TT'), ((3, 998), 'cevChassisCGS252024TC'), ((3, 999), 'cevChassisCGS252016S8PC'),
+    ((3, 1002), 'cevChassisWsC236048TdS'), ((3, 1003), 'cevChassisN2kC2232TT10GE'),
+    ((3, 1004), 'cevChassisN2kC2232TP10GE'), ((3, 1005), 'cevChassisN2kC2248TT1GE'),
+    ((3, 1006), 'cevChassisN2kC2224TP1GE'), ((3, 1007), 'cevChassisCDScde250'), ((3, 1008), 'cevChassisN5kC5548p'),
+    ((3, 1009), 'cevChassis881G2'), ((3, 1010), 'cevChassisWsC3750v224fsS'), ((3, 1011), 'cevChassisOeVWaas'),
+    ((3, 1012), 'cevChassisCrs16SB'), ((3, 1014), 'cevChassisCat2960cG8TC'), ((3, 1017), 'cevChassisECDS1100'),
+    ((3, 1018), 'cevChassisECDS3100'), ((3, 1019), 'cevChassisIE301016S8PC'), ((3, 1020), 'cevChassisIE301024TC'),
+    ((3, 1023), 'cevChassisWsC4948ef10GE'), ((3, 1024), 'cevChassisWave284K9'), ((3, 1025), 'cevChassisWave584K9'),
+    ((3, 1026), 'cevChassisWave684K9'), ((3, 1027), 'cevChassisWave7441K9'), ((3, 1028), 'cevChassisWave7471K9'),
+    ((3, 1029), 'cevChassisWave7626K9'), ((3, 1032), 'cevChassisCat292848TCC'), ((3, 1033), 'cevChassisCat292824TCC'),
+    ((3, 1034), 'cevChassisCat292824LTC'), ((3, 1036), 'cevChassisGrwicDes2s8pc'), ((3, 1037), 'cevChassisGrwicDes6s'),
+    ((3, 1038), 'cevChassisN5kC5596Up'), ((3, 1039), 'cevChassisC1861eUc2BriK9'),
+    ((3, 1040), 'cevChassisC1861eUc4FxoK9'), ((3, 1041), 'cevChassisC1861eSrstFK9'),
+    ((3, 1042), 'cevChassisC1861eSrstBK9'), ((3, 1043), 'cevChassisC1861eSrstCFK9'),
+    ((3, 1044), 'cevChassisC1861eSrstCBK9'), ((3, 1045), 'cevChassis88XG2DSL'),
+    ((3, 1046), 'cevChassisN2kC2248TPE1GE'), ((3, 1047), 'cevChassisWave8541'), ((3, 1048), 'cevChassisWave7571'),
+    ((3, 1049), 'cevChassisWave7541'), ((3, 1050), 'cevChassisWave694'), ((3, 1051), 'cevChassisWave594'),
+    ((3, 1052), 'cevChassisWave294'), ((3, 1053), 'cevChassis5915'), ((3, 1055), 'cevChassis86xVAE'),
+    ((3, 1056), 'cevChassisAp802gn'), ((3, 1058), 'cevChassisN2kB22HPP'), ((3, 1059), 'cevChassisN2kC2248GVP'),
+    ((3, 1060), 'cevChassisN3kC3064PQ'), ((3, 1061), 'cevChassisN2kC2232TM10GE'), ((3, 1062), 'cevChassisUCSFI6248UP'),
+    ((3, 1063), 'cevChassisUCSFI6296UP'), ((3, 1064), 'cevChassis2811ve'), ((3, 1065), 'cevChassis1841ve'),
+    ((3, 1066), 'cevChassis2960c8tcS'), ((3, 1067), 'cevChassis2960c8tcL'), ((3, 1068), 'cevChassis2960c8pcL'),
+    ((3, 1069), 'cevChassis2960c12pcL'), ((3, 1070), 'cevChassis3560cpd8ptS'), ((3, 1071), 'cevChassis886Vag7K9'),
+    ((3, 1072), 'cevChassis887VagSK9'), ((3, 1073), 'cevChassis887Vag7K9'), ((3, 1074), 'cevChassis887Vamg7K9'),
+    ((3, 1075), 'cevChassis888Eg7K9'), ((3, 1076), 'cevChassis881GUK9'), ((3, 1077), 'cevChassis881GSK9'),
+    ((3, 1078), 'cevChassis881GVK9'), ((3, 1079), 'cevChassis881GBK9'), ((3, 1080), 'cevChassis881G7K9'),
+    ((3, 1081), 'cevChassis881G7AK9'), ((3, 1084), 'cevChassisN5kC5548UP'), ((3, 1085), 'cevChassis881W'),
+    ((3, 1086), 'cevChassis886VAW'), ((3, 1087), 'cevChassis887VAMW'), ((3, 1088), 'cevChassis887VAW'),
+    ((3, 1089), 'cevChassis819G'), ((3, 1090), 'cevChassis819HG'), ((3, 1091), 'cevChassisIAD886VA'),
+    ((3, 1092), 'cevChassisIAD886VAJ'), ((3, 1093), 'cevChassisIAD887VA'), ((3, 1094), 'cevChassisIAD887VAM'),
+    ((3, 1095), 'cevChassisPCM'), ((3, 1102), 'cevChassisDSavsm'), ((3, 1104), 'cevChassisEcdsVB'),
+    ((3, 1105), 'cevChassisN3kC3064PQ10GE'), ((3, 1106), 'cevChassisN3kC3048TP1GE'),
+    ((3, 1107), 'cevChassisN3kC3016Q40GE'), ((3, 1118), 'cevChassisASR903'), ((3, 1121), 'cevChassis3560c12pcS'),
+    ((3, 1122), 'cevChassis3560c8pcS'), ((3, 1123), 'cevChassisCrs8SB'), ((3, 1124), 'cevChassisRAIE1783BMS06S'),
+    ((3, 1125), 'cevChassisRAIE1783BMS06T'), ((3, 1126), 'cevChassisRAIE1783BMS06SG'),
+    ((3, 1127), 'cevChassisRAIE1783BMS10C'), ((3, 1128), 'cevChassisRAIE1783BMS06TG'),
+    ((3, 1129), 'cevChassisRAIE1783BMS10CG'), ((3, 1130), 'cevChassisRAIE1783BMS20C'),
+    ((3, 1131), 'cevChassisRAIE1783BMS20CG'), ((3, 1132), 'cevChassisRAIE1783BMS20CGPK'),
+    ((3, 1133), 'cevChassisIE20004TS'), ((3, 1134), 'cevChassisIE20004T'), ((3, 1135), 'cevChassisIE20004TSG'),
+    ((3, 1136), 'cevChassisIE20004TG'), ((3, 1137), 'cevChassisIE20008TC'), ((3, 1138), 'cevChassisIE20008TCG'),
+    ((3, 1139), 'cevChassisIE200016TC'), ((3, 1140), 'cevChassisIE200016TCG'), ((3, 1141), 'cevChassisIE200016TCGX'),
+    ((3, 1145), 'cevChassisASR5000CHSSYSK9'), ((3, 1146), 'cevChassisASR55CHSSYS'), ((3, 1147), 'cevChassisN7Kc7004'),
+    ((3, 1159), 'cevChassisASR901'), ((3, 1160), 'cevChassisASR901E'), ((3, 1161), 'cevChassisOeSmSre710'),
+    ((3, 1162), 'cevChassisOeSmSre910'), ((3, 1163), 'cevChassisN3kC3064PQ10GX'), ((3, 1165), 'cevChassisCSR1000v'),
+    ((3, 1166), 'cevChassisFlowAgent3000'), ((3, 1167), 'cevChassisASR1002X'), ((3, 1168), 'cevChassisNamApp2304'),
+    ((3, 1169), 'cevChassisNamApp2320'), ((3, 1173), 'cevChassisECDS50IVB'), ((3, 1175), 'cevChassisN5kC5596TFA'),
+    ((3, 1178), 'cevChassisASR9001'), ((3, 1188), 'cevChassis819GM'), ((3, 1189), 'cevChassis819HGM'),
+    ((3, 1190), 'cevChassisN2kC2232TME10GE'), ((3, 1191), 'cevChassisCDScde2502s6'),
+    ((3, 1192), 'cevChassisCDScde2502m0'), ((3, 1193), 'cevChassisCDScde2502s8'), ((3, 1194), 'cevChassisASA1000V'),
+    ((3, 1195), 'cevChassisISR4400'), ((3, 1196), 'cevChassisMe3600x24CxM'), ((3, 1197), 'cevChassisA9014CFD'),
+    ((3, 1198), 'cevChassisA9014CFtD'), ((3, 1199), 'cevChassisMDE10XVB'), ((3, 1202), 'cevChassisWsC4500x16'),
+    ((3, 1203), 'cevChassisWsC4500x32'), ((3, 1205), 'cevChassisN2kC2248PQ10GE'),
+    ((3, 1206), 'cevChassisCDScde2502s9'), ((3, 1207), 'cevChassisCDScde2502s10'),
+    ((3, 1208), 'cevChassisCDScdeGeneric'), ((3, 1210), 'cevChassisN2kB22FTSP'), ((3, 1211), 'cevChassisN2kB22DELLP'),
+    ((3, 1225), 'cevChassisASR9922Dc'), ((3, 1226), 'cevChassisASR9922Ac'), ((3, 1237), 'cevChassisN6kC600496Q'),
+    ((3, 1238), 'cevChassisN3kC3548P10G'), ((3, 1239), 'cevChassisN3kC3064TQ10GT'), ((3, 1240), 'cevChassis86xVAEW'),
+    ((3, 1241), 'cevChassisASR9912AC'), ((3, 1242), 'cevChassisASR9912DC'), ((3, 1243), 'cevChassisOeKWaas'),
+    ((3, 1244), 'cevChassisasr1000'), ((3, 1245), 'cevChassisCDScde2202s4'), ((3, 1246), 'cevChassisISR4441'),
+    ((3, 1247), 'cevChassisISR4442'), ((3, 1248), 'cevChassisISR4451'), ((3, 1249), 'cevChassisISR4452'),
+    ((3, 1250), 'cevChassisASR1002XC'), ((3, 1251), 'cevChassisAIRAP1553'), ((3, 1252), 'cevChassisAIRAP1552'),
+    ((3, 1253), 'cevChassisAIRAP1602'), ((3, 1254), 'cevChassisAIRAP1601'), ((3, 1255), 'cevChassisAIRAP2602'),
+    ((3, 1256), 'cevChassisAIRAP2601'), ((3, 1257), 'cevChassisAIRAP3602'), ((3, 1258), 'cevChassisAIRAP3601'),
+    ((3, 1259), 'cevChassisWsC2960x48fpdL'), ((3, 1260), 'cevChassisWsC2960x48lpdL'),
+    ((3, 1261), 'cevChassisWsC2960x48tdL'), ((3, 1262), 'cevChassisWsC2960x24pdL'),
+    ((3, 1263), 'cevChassisWsC2960x24tdL'), ((3, 1264), 'cevChassisWsC2960x48fpsL'),
+    ((3, 1265), 'cevChassisWsC2960x48lpsL'), ((3, 1266), 'cevChassisWsC2960x24psL'),
+    ((3, 1267), 'cevChassisWsC2960x48tsL'), ((3, 1268), 'cevChassisWsC2960x24tsL'),
+    ((3, 1269), 'cevChassisWsC2960x24psqL'), ((3, 1270), 'cevChassisWsC2960x48lpsS'),
+    ((3, 1271), 'cevChassisWsC2960x24psS'), ((3, 1272), 'cevChassisWsC2960x48tsLL'),
+    ((3, 1273), 'cevChassisWsC2960x24tsLL'), ((3, 1274), 'cevChassisWsC3560x48U'),
+    ((3, 1275), 'cevChassisWsC3560x24U'), ((3, 1276), 'cevChassisWsC3750x48U'), ((3, 1277), 'cevChassisWsC3750x24U'),
+    ((3, 1278), 'cevChassisIE200016TCGP'), ((3, 1279), 'cevChassisIE200016TCGEP'),
+    ((3, 1280), 'cevChassisIE200016TCGNXP'), ((3, 1281), 'cevChassisRAIE1783BMS12T4E2CGL'),
+    ((3, 1282), 'cevChassisRAIE1783BMS12T4E2CGP'), ((3, 1283), 'cevChassisRAIE1783BMS12T4E2CGNK'),
+    ((3, 1284), 'cevChassisIE20008TCGN'), ((3, 1285), 'cevChassisIE200016TCGN'),
+    ((3, 1286), 'cevChassisRAIE1783BMS10CGN'), ((3, 1287), 'cevChassisRAIE1783BMS20CGN'),
+    ((3, 1288), 'cevChassisNexus1010X'), ((3, 1289), 'cevChassisNexus1110S'), ((3, 1290), 'cevChassisNexus1110XL'),
+    ((3, 1291), 'cevChassisNexus1110X'), ((3, 1292), 'cevChassisNexus1000VKVM'), ((3, 1294), 'cevChassisNexus1000VMH'),
+    ((3, 1295), 'cevChassisVG202XM'), ((3, 1296), 'cevChassisVG204XM'), ((3, 1301), 'cevChassisAsr9904AC'),
+    ((3, 1302), 'cevChassisAsr9904DC'), ((3, 1303), 'cevChassisME2600X'), ((3, 1304), 'cevChassisNCSCHASSIS'),
+    ((3, 1305), 'cevChassisC6807xl'), ((3, 1308), 'cevChassisN6kC600164P'), ((3, 1309), 'cevChassis131WsC385024U'),
+    ((3, 1310), 'cevChassis131WsC385048U'), ((3, 1326), 'cevChassisDSC9250IK9'), ((3, 1327), 'cevChassisDSC9710'),
+    ((3, 1328), 'cevChassisC6880xle'), ((3, 1338), 'cevChassisIE2000U16TCGP'), ((3, 1339), 'cevChassisN2kB22IBMP'),
+    ((3, 1340), 'cevChassisN6kC600164T'), ((3, 1342), 'cevChassisWsC2960P48PstL'),
+    ((3, 1343), 'cevChassisWsC2960P24PcL'), ((3, 1344), 'cevChassisWsC2960P24LcL'),
+    ((3, 1345), 'cevChassisWsC2960P48TcL'), ((3, 1346), 'cevChassisWsC2960P24TcL'),
+    ((3, 1347), 'cevChassisWsC2960P48PstS'), ((3, 1348), 'cevChassisWsC2960P24PcS'),
+    ((3, 1349), 'cevChassisWsC2960P24LcS'), ((3, 1350), 'cevChassisWsC2960P48TcS'),
+    ((3, 1351), 'cevChassisWsC2960P24TcS'), ((3, 1352), 'cevChassisN77c7718'), ((3, 1353), 'cevChassisN77c7710'),
+    ((3, 1354), 'cevChassisN77c7706'), ((3, 1355), 'cevChassisWsC2960XR48FpdI'),
+    ((3, 1356), 'cevChassisWsC2960XR48LpdI'), ((3, 1357), 'cevChassisWsC2960XR48TdI'),
+    ((3, 1358), 'cevChassisWsC2960XR24PdI'), ((3, 1359), 'cevChassisWsC2960XR24TdI'),
+    ((3, 1360), 'cevChassisWsC2960XR48FpsI'), ((3, 1361), 'cevChassisWsC2960XR48LpsI'),
+    ((3, 1362), 'cevChassisWsC2960XR48TsI'), ((3, 1363), 'cevChassisWsC2960XR24PsI'),
+    ((3, 1364), 'cevChassisWsC2960XR24TsI'), ((3, 1375), 'cevChassisA901S4SGFD'), ((3, 1376), 'cevChassisA901S3SGFD'),
+    ((3, 1377), 'cevChassisA901S2SGFD'), ((3, 1378), 'cevChassisA901S3SGFAH'), ((3, 1379), 'cevChassisA901S2SGFAH'),
+    ((3, 1380), 'cevChassisASR901AC10G'), ((3, 1381), 'cevChassisASR901DC10G'), ((3, 1382), 'cevChassisASR901eAC10G'),
+    ((3, 1383), 'cevChassisASR901eDC10G'), ((3, 1384), 'cevChassisIE2000U4STSG'), ((3, 1385), 'cevChassisC881'),
+    ((3, 1386), 'cevChassisC886VA'), ((3, 1387), 'cevChassisC887VA'), ((3, 1388), 'cevChassisN3KC3172PQ10GE'),
+    ((3, 1389), 'cevChassisN3KC3172TQ10GT'), ((3, 1390), 'cevChassisN3KC3132Q40GE'),
+    ((3, 1391), 'cevChassisN3KC3132Q40GS'), ((3, 1392), 'cevChassisASR9001S'), ((3, 1393), 'cevChassisIE20008T67B'),
+    ((3, 1394), 'cevChassisIE200016T67B'), ((3, 1395), 'cevChassisIE200024T67B'),
+    ((3, 1396), 'cevChassisIE20008T67PGE'), ((3, 1397), 'cevChassisIE200016T67PGE'),
+    ((3, 1398), 'cevChassisRAIE1783ZMS8TA'), ((3, 1399), 'cevChassisRAIE1783ZMS16TA'),
+    ((3, 1400), 'cevChassisRAIE1783ZMS24TA'), ((3, 1401), 'cevChassisRAIE1783ZMS4T4E2TGP'),
+    ((3, 1402), 'cevChassisRAIE1783ZMS8T8E2TGP'), ((3, 1403), 'cevChassisC888'), ((3, 1404), 'cevChassisC891F'),
+    ((3, 1405), 'cevChassisC891FW'), ((3, 1406), 'cevChassisASR1001X'), ((3, 1407), 'cevChassis1783WAP5100xK9'),
+    ((3, 1408), 'cevChassisCDScde2502s5'), ((3, 1409), 'cevChassisN5KC56128P'), ((3, 1410), 'cevChassisN5KC5672UP'),
+    ((3, 1412), 'cevChassisIE2000U4TG'), ((3, 1413), 'cevChassisIE2000U4TSG'), ((3, 1414), 'cevChassisIE2000U8TCG'),
+    ((3, 1415), 'cevChassisIE2000U16TCG'), ((3, 1416), 'cevChassisIE2000U16TCGX'),
+    ((3, 1417), 'cevChassisN3KC3132Q40GX'), ((3, 1418), 'cevChassisVG310'), ((3, 1419), 'cevChassisVG320'),
+    ((3, 1420), 'cevChassisDSC9706'), ((3, 1421), 'cevChassisAIRAP3702'), ((3, 1422), 'cevChassisAIRAP702'),
+    ((3, 1423), 'cevChassisAIRAP1532'), ((3, 1424), 'cevChassisC6800IA48FPD'), ((3, 1425), 'cevChassisC6800IA48TD'),
+    ((3, 1426), 'cevChassisNCS4016SAAC'), ((3, 1433), 'cevChassis131WsC385024S'),
+    ((3, 1434), 'cevChassis131WsC385012S'), ((3, 1449), 'cevChassisASR902'), ((3, 1451), 'cevChassisVASA'),
+    ((3, 1454), 'cevChassisUCSFIM6324'), ((3, 1467), 'cevChassisN9Kc9508'), ((3, 1469), 'cevChassisME12006sAO'),
+    ((3, 1470), 'cevChassisME12006sD'), ((3, 1471), 'cevChassisME12006sA'), ((3, 1472), 'cevChassis1783SR'),
+    ((3, 1475), 'cevChassisWapAP702'), ((3, 1476), 'cevChassisWapAP2602'), ((3, 1477), 'cevChassisWapAP1602'),
+    ((3, 1485), 'cevChassisISR4431'), ((3, 1486), 'cevChassisC6880x'), ((3, 1487), 'cevChassisAIRAP2702'),
+    ((3, 1488), 'cevChassisUCSFI6332'), ((3, 1489), 'cevChassisN6kC6004'), ((3, 1490), 'cevChassisAsr9000V24vDcA'),
+    ((3, 1491), 'cevChassisDSC9148SK9'), ((3, 1494), 'cevChassisRT1081K9'), ((3, 1495), 'cevChassisRT1091FK9'),
+    ((3, 1496), 'cevChassisRT2241K9'), ((3, 1497), 'cevChassisRT2221K9'), ((3, 1498), 'cevChassisRT2241WCK9'),
+    ((3, 1499), 'cevChassisRT3211K9'), ((3, 1500), 'cevChassisRT3221K9'), ((3, 1501), 'cevChassisRT3201K9'),
+    ((3, 1506), 'cevChassisN9Kc9516'), ((3, 1507), 'cevChassisN9Kc9504'), ((3, 1508), 'cevChassisN9KC9396PX'),
+    ((3, 1509), 'cevChassisN9KC9396TX'), ((3, 1510), 'cevChassisN9KC93128TX'), ((3, 1511), 'cevChassisISR4351'),
+    ((3, 1519), 'cevChassisVSGateway'), ((3, 1520), 'cevChassisPrime'), ((3, 1521), 'cevChassis897VAB'),
+    ((3, 1537), 'cevChassisC385012X48U'), ((3, 1538), 'cevChassisC385024XU'), ((3, 1539), 'cevChassisN5kC5696Q'),
+    ((3, 1540), 'cevChassisN2KC2348TQ'), ((3, 1541), 'cevChassisN2KC2348UPQ'), ((3, 1542), 'cevChassisC6800IA48FPDR'),
+    ((3, 1544), 'cevChassisISR4331'), ((3, 1545), 'cevChassisNCSFSYSS'), ((3, 1546), 'cevChassisIE40004TC4GE'),
+    ((3, 1547), 'cevChassisIE40008T4GE'), ((3, 1548), 'cevChassisIE40008S4GE'), ((3, 1549), 'cevChassisIE40004T4P4GE'),
+    ((3, 1550), 'cevChassisIE400016T4GE'), ((3, 1551), 'cevChassisIE40004S8P4GE'),
+    ((3, 1552), 'cevChassisIE40008GT4GE'), ((3, 1553), 'cevChassisIE40008GS4GE'),
+    ((3, 1554), 'cevChassisIE40004GC4GP4GE'), ((3, 1555), 'cevChassisIE400016GT4GE'),
+    ((3, 1556), 'cevChassisIE40008GT8GP4GE'), ((3, 1557), 'cevChassisIE40004GS8GP4GE'),
+    ((3, 1558), 'cevChassisRAIE1783HMS4C4CGN'), ((3, 1559), 'cevChassisRAIE1783HMS8T4CGN'),
+    ((3, 1560), 'cevChassisRAIE1783HMS8S4CGN'), ((3, 1561), 'cevChassisRAIE1783HMS4T4E4CGN'),
+    ((3, 1562), 'cevChassisRAIE1783HMS16T4CGN'), ((3, 1563), 'cevChassisRAIE1783HMS4S8E4CGN'),
+    ((3, 1564), 'cevChassisRAIE1783HMS8TG4CGN'), ((3, 1565), 'cevChassisRAIE1783HMS8SG4CGN'),
+    ((3, 1566), 'cevChassisRAIE1783HMS4EG8CGN'), ((3, 1567), 'cevChassisRAIE1783HMS16TG4CGN'),
+    ((3, 1568), 'cevChassisRAIE1783HMS8TG8EG4CGN'), ((3, 1569), 'cevChassisRAIE1783HMS4SG8EG4CGN'),
+    ((3, 1571), 'cevChassisN2KC2232TQ'), ((3, 1572), 'cevChassisASR9010ACv2'), ((3, 1573), 'cevChassisASR9010DCv2'),
+    ((3, 1574), 'cevChassisASR9006ACv2'), ((3, 1575), 'cevChassisASR9006DCv2'), ((3, 1576), 'cevChassisISR4321'),
+    ((3, 1577), 'cevChassisASR901eDC10GS'), ((3, 1578), 'cevChassisASR901eAC10GS'),
+    ((3, 1579), 'cevChassisNCS4009SAAC'), ((3, 1580), 'cevChassisNCS4009SADC'), ((3, 1585), 'cevChassisCiscoQvPCDI'),
+    ((3, 1586), 'cevChassisCiscoQvPC'), ((3, 1589), 'cevChassisWSC3560CX12PDS'),
+    ((3, 1590), 'cevChassisWSC3560CX12TCS'), ((3, 1591), 'cevChassisWSC3560CX12PCS'),
+    ((3, 1592), 'cevChassisWSC3560CX8TCS'), ((3, 1593), 'cevChassisWSC3560CX8PCS'),
+    ((3, 1594), 'cevChassisWSC2960CX8TCL'), ((3, 1595), 'cevChassisIOG910GK9'), ((3, 1596), 'cevChassisIOG910WK9'),
+    ((3, 1597), 'cevChassisIOG910K9'), ((3, 1600), 'cevChassisAsa5506'), ((3, 1601), 'cevChassisAsa5506W'),
+    ((3, 1602), 'cevChassisAsa5508'), ((3, 1603), 'cevChassisAsa5506K7'), ((3, 1604), 'cevChassisAsa5508K7'),
+    ((3, 1605), 'cevChassisC385012XS'), ((3, 1606), 'cevChassisC385024XS'), ((3, 1607), 'cevChassisC385048XS'),
+    ((3, 1608), 'cevChassisAIRAP1702'), ((3, 1609), 'cevChassisN3KC3164Q40GE'), ((3, 1610), 'cevChassisCCE8RU'),
+    ((3, 1611), 'cevChassisCCE13RU'), ((3, 1612), 'cevChassisCCE18RU'), ((3, 1614), 'cevChassis891x24X'),
+    ((3, 1615), 'cevChassisAsr9KvV2Ac'), ((3, 1616), 'cevChassisAsr9KvV2DcA'), ((3, 1617), 'cevChassisAsr9KvV2DcE'),
+    ((3, 1618), 'cevChassiscBR8'), ((3, 1619), 'cevChassisN5KC5624Q'), ((3, 1620), 'cevChassisN5KC5648Q'),
+    ((3, 1621), 'cevChassisN5KC5672UP16G'), ((3, 1623), 'cevChassisAIRAP1572'), ((3, 1624), 'cevChassisAIRAP702w'),
+    ((3, 1625), 'cevChassisN9KC9332PQ'), ((3, 1626), 'cevChassisN9KC9372PX'), ((3, 1627), 'cevChassisN9KC9372TX'),
+    ((3, 1630), 'cevChassisCiscoQvPCVSM'), ((3, 1632), 'cevChassisRAIE1783ZMS4T4E2TGN'),
+    ((3, 1633), 'cevChassisRAIE1783ZMS8T8E2TGN'), ((3, 1636), 'cevChassisRAIE1783HMS8TG4CGR'),
+    ((3, 1637), 'cevChassisRAIE1783HMS8SG4CGR'), ((3, 1638), 'cevChassisRAIE1783HMS4EG8CGR'),
+    ((3, 1639), 'cevChassisRAIE1783HMS16TG4CGR'), ((3, 1640), 'cevChassisRAIE1783HMS8TG8EG4CGR'),
+    ((3, 1641), 'cevChassisRAIE1783HMS4SG8EG4CGR'), ((3, 1642), 'cevChassisCDScde2802s5'),
+    ((3, 1643), 'cevChassisCDScde2802s10'), ((3, 1644), 'cevChassisCDScde2802s21'),
+    ((3, 1645), 'cevChassisCDScde2802h0'), ((3, 1646), 'cevChassisCDScde2802h13'),
+    ((3, 1647), 'cevChassisCDScde2802h26'), ((3, 1648), 'cevChassisN77c7702'), ((3, 1650), 'cevChassis841Mx4X'),
+    ((3, 1651), 'cevChassis841Mx8X'), ((3, 1652), 'cevChassisN2kC2332TQ10GT'), ((3, 1654), 'cevChassisSce10000'),
+    ((3, 1655), 'cevChassisIE500012S12P10G'), ((3, 1656), 'cevChassisRAIE1783IMS28NAC'),
+    ((3, 1657), 'cevChassisRAIE1783IMS28NDC'), ((3, 1658), 'cevChassisRAIE1783IMS28RAC'),
+    ((3, 1659), 'cevChassisRAIE1783IMS28RDC'), ((3, 1660), 'cevChassisDSC9396SK9'),
+    ((3, 1661), 'cevChassisAIRAPIW3702'), ((3, 1663), 'cevChassisAsa5506H'), ((3, 1664), 'cevChassisAsa5516'),
+    ((3, 1665), 'cevChassis819GWLTE'), ((3, 1666), 'cevChassisN3kC3548P10GX'),
+    ((3, 1668), 'cevChassisciscoIR829GWLTEVZAK9'), ((3, 1669), 'cevChassisciscoIR829GWLTENAAK9'),
+    ((3, 1670), 'cevChassisciscoIR829GWLTEGAEK9'), ((3, 1671), 'cevChassisciscoIR829GWLTEGAZK9'),
+    ((3, 1672), 'cevChassisciscoIR829GWLTEMAAK9'), ((3, 1673), 'cevChassisNCS4016SADC'),
+    ((3, 1675), 'cevChassisN9KC93120TX'), ((3, 1676), 'cevChassisASR9910'), ((3, 1683), 'cevChassisDSC9718'),
+    ((3, 1684), 'cevChassisN2KC2348TQ10GE'), ((3, 1690), 'cevChassisN9KC9264PQ'), ((3, 1691), 'cevChassisN3KC31128PQ'),
+    ((3, 1692), 'cevChassisN3KC3132QXOE'), ((3, 1693), 'cevChassisN3KC3172PQOE'),
+    ((3, 1694), 'cevChassisN3KC3172TQOE'), ((3, 1695), 'cevChassisN3KC3064XOE'), ((3, 1696), 'cevChassisN3KC3048OE'),
+    ((3, 1697), 'cevChassisN3KC3232C'), ((3, 1698), 'cevChassisNamApp2420'), ((3, 1699), 'cevChassisNamApp2440'),
+    ((3, 1700), 'cevChassisFlowAgent3300'), ((3, 1701), 'cevChassisFPRC9300AC'), ((3, 1702), 'cevChassisFPRC9300DC'),
+    ((3, 1703), 'cevChassisC899GLTEJPK9'), ((3, 1706), 'cevChassisN3KC3132QV'), ((3, 1707), 'cevChassisFPRC9300'),
+    ((3, 1710), 'cevChassisIE500016S12P'), ((3, 1711), 'cevChassisC819GLTEMNAK9'),
+    ((3, 1712), 'cevChassisN9KC9372PXE'), ((3, 1713), 'cevChassisN9KC9372TXE'), ((3, 1714), 'cevChassisFPR4110'),
+    ((3, 1715), 'cevChassisFPR4120'), ((3, 1716), 'cevChassisFPR4140'), ((3, 1721), 'cevChassis898EAGLTELAK9'),
+    ((3, 1722), 'cevChassis897VAGLTELAK9'), ((3, 1723), 'cevChassis819GWLTELACK9'),
+    ((3, 1724), 'cevChassis819GWLTELAQK9'), ((3, 1725), 'cevChassis819GWLTELANK9'),
+    ((3, 1726), 'cevChassisN3KC3132QXL40GX'), ((3, 1727), 'cevChassisN3KC3172PQXL10GE'),
+    ((3, 1728), 'cevChassisN3KC3172TQXL10GT'), ((3, 1729), 'cevChassisNCS4216SA'), ((3, 1730), 'cevChassisNCS4206SA'),
+    ((3, 1731), 'cevChassisNCS4202SA'), ((3, 1732), 'cevChassisASR901CC'), ((3, 1733), 'cevChassisASR901ECC'),
+    ((3, 1734), 'cevChassisASR901DC10GCC'), ((3, 1735), 'cevChassisASR901EDC10GCC'),
+    ((3, 1736), 'cevChassisASR901DC10GSCC'), ((3, 1737), 'cevChassisASR92012SZIMCC'),
+    ((3, 1738), 'cevChassisN3KC3172PQZ810GE'), ((3, 1743), 'cevChassisN3KC3264Q'),
+    ((3, 1744), 'cevChassisN9KC92160YC'), ((3, 1745), 'cevChassisN9KC9272Q'),
+    ((3, 1760), 'cevChassisRAIE1783IMS28GNAC'), ((3, 1761), 'cevChassisRAIE1783IMS28GNDC'),
+    ((3, 1762), 'cevChassisRAIE1783IMS28GRAC'), ((3, 1763), 'cevChassisRAIE1783IMS28GRDC'),
+    ((3, 1764), 'cevChassisCisco819GLTELAK9'), ((3, 1765), 'cevChassisCisco899GLTELAK9'),
+    ((3, 1766), 'cevChassisC897vagwlte'), ((3, 1767), 'cevChassisC886vagwlte'),
+    ((3, 1768), 'cevChassisCPUC897vagwlte'), ((3, 1769), 'cevChassisCPUC886vag'),
+    ((3, 1777), 'cevChassisN3KC3172PQXL10GE16'), ((3, 1778), 'cevChassisN3KC3172PQXLOE'),
+    ((3, 1779), 'cevChassisN3KC3132Q40GEOE'), ((3, 1780), 'cevChassisN3KC3232COE'),
+    ((3, 1781), 'cevChassisN3KC3264QOE'), ((3, 1782), 'cevChassisN3KC3132QVOE'),
+    ((3, 1783), 'cevChassisN3KC31108PCVOE'), ((3, 1784), 'cevChassisN3KC31108TCVOE'),
+    ((3, 1785), 'cevChassisNCS4201SA'), ((3, 1786), 'cevChassisNCS1002'), ((3, 1787), 'cevChassisCiscoFpr4110td'),
+    ((3, 1788), 'cevChassisCiscoFpr4120td'), ((3, 1789), 'cevChassisCiscoFpr4140td'),
+    ((3, 1790), 'cevChassisCiscoFpr4150td'), ((3, 1791), 'cevChassisCiscoFpr9000SM24td'),
+    ((3, 1792), 'cevChassisCiscoFpr9000SM24Ntd'), ((3, 1793), 'cevChassisCiscoFpr9000SM36td'),
+    ((3, 1794), 'cevChassisCiscoFpr9000SM44'), ((3, 1795), 'cevChassisCiscoFTDVVMW'),
+    ((3, 1796), 'cevChassisCiscoFTDVAWS'), ((3, 1797), 'cevChassisCiscoFTDVKVM'),
+    ((3, 1798), 'cevChassisCiscoFTDVHYPERV'), ((3, 1799), 'cevChassisCiscoFTDVAZURE'),
+    ((3, 1812), 'cevChassisN9KC93180YCEX'), ((3, 1821), 'cevChassisStealthWatch2404'),
+    ((3, 1822), 'cevChassisStealthWatch2420'), ((3, 1823), 'cevChassisNamApp2404'),
+    ((3, 1824), 'cevchassisN9KC93108TCEX'), ((3, 1827), 'cevChassisN1KVhv'), ((4,), 'cevBackplane'),
+    ((4, 4), 'cevBackplaneAtm'), ((4, 5), 'cevBackplaneCat5500'), ((4, 6), 'cevBackplaneCat6400'),
+    ((4, 7), 'cevBackplaneCat8510'), ((4, 8), 'cevBackplaneCat8540'), ((4, 9), 'cevBackplaneMGX8850'),
+    ((4, 10), 'cevBackplaneMGX8820'), ((4, 11), 'cevBackplaneBPXSes'), ((4, 12), 'cevBackplaneIGXSes'),
+    ((4, 13), 'cevBackplaneCat6000'), ((4, 14), 'cevBackplaneCat6500'), ((4, 15), 'cevBackplaneMGX8950'),
+    ((4, 16), 'cevBackplaneONS15540Fixed'), ((4, 18), 'cevBackplaneCat4006'), ((4, 19), 'cevBackplaneMGX8830'),
+    ((4, 20), 'cevBackplaneONS15530'), ((4, 23), 'cevBackplaneCat4507'), ((4, 24), 'cevBackplaneCat4503'),
+    ((4, 25), 'cevBackplaneCat4506'), ((4, 26), 'cevBackplaneDSC9506'), ((4, 27), 'cevBackplaneDSC9509'),
+    ((4, 28), 'cevBackplaneDSC9513'), ((4, 29), 'cevBackplaneONS15540ESPx'), ((4, 30), 'cevBackplaneUnknown'),
+    ((4, 31), 'cevBackplaneCat4510'), ((4, 32), 'cevBackplaneDSC9140K9'), ((4, 33), 'cevBackplaneBMGX8850'),
+    ((4, 34), 'cevBackplaneBMGX8950'), ((4, 35), 'cevBackplaneCisco7600'), ((4, 36), 'cevBackplaneBMGX8830'),
+    ((4, 37), 'cevBackplaneDSC9216AK9'), ((4, 38), 'cevBackplaneMGX8880'), ((4, 39), 'cevBackplane6SlotsRCON8850'),
+    ((4, 40), 'cevBackplane4SlotsRCON8850'), ((4, 41), 'cevBackplane4SlotsRCON8830'),
+    ((4, 42), 'cevBackplaneDSX9116K9'), ((4, 43), 'cevBackplaneONS15310'), ((4, 48), 'cevBackplaneCat4503e'),
+    ((4, 49), 'cevBackplaneCat4506e'), ((4, 50), 'cevBackplaneCat4507re'), ((4, 51), 'cevBackplaneCat4510re'),
+    ((4, 52), 'cevBackplaneN7Kc7010'), ((4, 53), 'cevBackplaneCatRfgw'), ((4, 55), 'cevBackplaneN7Kc7018'),
+    ((4, 56), 'cevBackplaneMXE5600'), ((4, 57), 'cevBackplaneN7Kc7009'), ((4, 61), 'cevBackplaneN7Kc7004'),
+    ((4, 63), 'cevBackplaneDSC9710'), ((4, 64), 'cevBackplaneN77c7718'), ((4, 65), 'cevBackplaneN77c7710'),
+    ((4, 66), 'cevBackplaneN77c7706'), ((4, 67), 'cevBackplaneCat6800'), ((4, 68), 'cevBackplaneDSC9706'),
+    ((4, 69), 'cevBackplaneNCS4K'), ((4, 70), 'cevBackplaneN77c7702'), ((4, 71), 'cevBackplaneDSC9718'),
+    ((4, 76), 'cevBackplaneNCS1002'), ((5,), 'cevContainer'), ((5, 1), 'cevContainerSlot'),
+    ((5, 2), 'cevContainerDaughterCard'), ((5, 12), 'cevContainerPCMCIA'), ((5, 16), 'cevContainerDSPModuleSlot'),
+    ((5, 17), 'cevContainerCat8500Carrier'), ((5, 18), 'cevContainerCat8500CpuSwitchAndFeature'),
+    ((5, 19), 'cevContainerCat8500CpuSwitchAndFeaturePFQ'), ((5, 20), 'cevContainerCat8500SuperCarrier'),
+    ((5, 21), 'cevContainerCat8500CpuRoute'), ((5, 22), 'cevContainerCat8500Switch10GAndFC'),
+    ((5, 23), 'cevContainerCat8500Switch10GNoFC'), ((5, 24), 'cevContainerDslamSlot'),
+    ((5, 25), 'cevContainerC6260PsSlot'), ((5, 26), 'cevContainerC6260FanSlot'),
+    ((5, 27), 'cevContainerDslamControllerSlot'), ((5, 28), 'cevContainerDslamNi2DcSlot'),
+    ((5, 31), 'cevContainerPsmSlot'), ((5, 32), 'cevContainerSmSlot'), ((5, 33), 'cevContainerMGX8800FanTray'),
+    ((5, 34), 'cevContainerSrmSlot'), ((5, 35), 'cevContainerMGX8800ACPSTray'), ((5, 36), 'cevContainerSESFanTray'),
+    ((5, 37), 'cevContainer12012TopBlowerBay'), ((5, 38), 'cevContainer12012BottomBlowerBay'),
+    ((5, 39), 'cevContainer12012ModuleBay'), ((5, 40), 'cevContainer12012SwitchFabricBay'),
+    ((5, 41), 'cevContainer12012PowerSupplyBay'), ((5, 42), 'cevContainer12008PowerBlowerBay'),
+    ((5, 43), 'cevContainer12008MainBlowerBay'), ((5, 44), 'cevContainer12008ModuleBay'),
+    ((5, 45), 'cevContainer12008SwitchFabricBay'), ((5, 46), 'cevContainer12008PowerSupplyBay'),
+    ((5, 48), 'cevContainerC6160PsSlot'), ((5, 49), 'cevContainerC6160FanSlot'), ((5, 52), 'cevContainerMGXXm60Slot'),
+    ((5, 55), 'cevContainerCat8500CMPMCarrier'), ((5, 56), 'cevContainer12010TopBlowerBay'),
+    ((5, 57), 'cevContainer12010BottomBlowerBay'), ((5, 58), 'cevContainer12010UpperModuleBay'),
+    ((5, 59), 'cevContainer12010LowerModuleBay'), ((5, 60), 'cevContainer12010SwitchFabricBay'),
+    ((5, 61), 'cevContainer12010PowerSupplyBay'), ((5, 62), 'cevContainer12010PowerBlowerBay'),
+    ((5, 63), 'cevContainer12010MainBlowerBay'), ((5, 64), 'cevContainer12406ModuleBay'),
+    ((5, 65), 'cevContainer12406FabricAlarmBay'), ((5, 66), 'cevContainer12406PowerSupplyBay'),
+    ((5, 67), 'cevContainer12406MainBlowerBay'), ((5, 68), 'cevContainer12410TopBlowerBay'),
+    ((5, 69), 'cevContainer12410BottomBlowerBay'), ((5, 70), 'cevContainer12410UpperModuleBay'),
+    ((5, 71), 'cevContainer12410LowerModuleBay'), ((5, 72), 'cevContainer12410SwitchFabricBay'),
+    ((5, 73), 'cevContainer12410PowerSupplyBay'), ((5, 74), 'cevContainer12410PowerBlowerBay'),
+    ((5, 75), 'cevContainer12410MainBlowerBay'), ((5, 76), 'cevContainerONS15540CardSlot'),
+    ((5, 77), 'cevContainerONS15540FanTraySlot'), ((5, 78), 'cevContainerONS15540TspSubslot'),
+    ((5, 79), 'cevContainerONS15540MDXSubslot'), ((5, 80), 'cevContainerONS15540SubCardSlot'),
+    ((5, 81), 'cevContainer12404ModuleBay'), ((5, 82), 'cevContainer12404FabricAlarmBay'),
+    ((5, 83), 'cevContainer12404PowerSupplyBay'), ((5, 84), 'cevContainer12404MainBlowerBay'),
+    ((5, 85), 'cevContainerC7304PowerSupplyBay'), ((5, 86), 'cevContainerC10KSlot'),
+    ((5, 87), 'cevContainerC10KPowerSupplySlot'), ((5, 88), 'cevContainerC10KFanTraySlot'),
+    ((5, 89), 'cevContainerC10KFlashCardSlot'), ((5, 90), 'cevContainerCat4kFanTrayBay'),
+    ((5, 91), 'cevContainerCat4kPowerSupplyBay'), ((5, 92), 'cevContainerCat4kPEMBay'),
+    ((5, 93), 'cevContainer12016PowerBlowerBay'), ((5, 94), 'cevContainer12016LowerModuleBay'),
+    ((5, 95), 'cevContainer12016SwitchFabricBay'), ((5, 96), 'cevContainer12016PowerSupplyBay'),
+    ((5, 97), 'cevContainer12016TopBlowerBay'), ((5, 98), 'cevContainer12016BottomBlowerBay'),
+    ((5, 99), 'cevContainer12016UpperModuleBay'), ((5, 100), 'cevContainerONS15530CardSlot'),
+    ((5, 102), 'cevContainerONS15530FanTraySlot'), ((5, 103), 'cevContainerONS15530PSSlot'),
+    ((5, 104), 'cevContainerONS15530SubCardSlot'), ((5, 105), 'cevContainerONS15530PortSlot'),
+    ((5, 106), 'cevContainerONS15540PortSlot'), ((5, 111), 'cevContainerCat4kContainerPSBay'),
+    ((5, 114), 'cevContainerSPABay'), ((5, 115), 'cevContainerSFP'), ((5, 116), 'cevContainerGsrAlarmSlot'),
+    ((5, 117), 'cevContainerGsrPowerSupplySlot'), ((5, 118), 'cevContainerGsrFanBlowerSlot'),
+    ((5, 119), 'cevContainerGsrSwitchFabricSlot'), ((5, 120), 'cevContainerONS15252CardSlot'),
+    ((5, 121), 'cevContainerONS15201CardSlot'), ((5, 122), 'cevContainerSupFabricSlot'),
+    ((5, 123), 'cevContainerLineCardSlot'), ((5, 124), 'cevContainer9506PowerSupplyBay'),
+    ((5, 125), 'cevContainer9509PowerSupplyBay'), ((5, 126), 'cevContainer9513PowerSupplyBay'),
+    ((5, 127), 'cevContainer9506FanBay'), ((5, 128), 'cevContainer9509FanBay'), ((5, 129), 'cevContainer9513FanBay'),
+    ((5, 130), 'cevContainer9216FanBay'), ((5, 131), 'cevContainer9216PowerSupplyBay'),
+    ((5, 132), 'cevContainerC7300CCPA'), ((5, 133), 'cevContainerPABay'), ((5, 134), 'cevChassisCr4430'),
+    ((5, 135), 'cevMgx2uPlenumFanTray'), ((5, 136), 'cevContainerMDSPowerSupplyBay'),
+    ((5, 137), 'cevContainerMDSFanTrayBay'), ((5, 138), 'cevContainerFlashCardSlot'),
+    ((5, 139), 'cevContainerFanTraySlot'), ((5, 140), 'cevContainerPowerSupplyBay'),
+    ((5, 141), 'cevContainerPowerSupply'), ((5, 142), 'cevContainerGbic'), ((5, 143), 'cevContainerCrs1RPSlot'),
+    ((5, 144), 'cevContainerCrs1LCDRPSlot'), ((5, 145), 'cevContainerCrs1FabricSlot'),
+    ((5, 146), 'cevContainerCrs1AlarmSlot'), ((5, 147), 'cevContainerCrs1PowerSupplySlot'),
+    ((5, 148), 'cevContainerCrs1FanSlot'), ((5, 149), 'cevContainerPowerSupplySlot'), ((5, 150), 'cevContainerVtt'),
+    ((5, 151), 'cevContainerClock'), ((5, 152), 'cevContainer10GigBasePort'),
+    ((5, 153), 'cevContainerUmg9820ProcessorCard'), ((5, 154), 'cevContainerUmg9820PowerSupplyBay'),
+    ((5, 155), 'cevContainerUmg9820QamModuleSlot'), ((5, 156), 'cevContainerUmg9820FanTraySlot'),
+    ((5, 157), 'cevContainer9116FanBay'), ((5, 158), 'cevContainer9116PowerSupplyBay'),
+    ((5, 159), 'cevContainerONS15310CardSlot'), ((5, 160), 'cevContainerGSR6Blwr'),
+    ((5, 161), 'cevContainerGSR10GSR16Blwr'), ((5, 162), 'cevContainer9513RearFanBay'),
+    ((5, 163), 'cevContainerFabricSlot'), ((5, 164), 'cevContainerCrs18RPSlot'),
+    ((5, 165), 'cevContainerCrs18FabricSlot'), ((5, 166), 'cevContainerCrs1FabricShelfControllerSlot'),
+    ((5, 167), 'cevContainerCrs1FabricSwitchFabricSlot'), ((5, 168), 'cevContainerCrs1FabricFiberModuleSlot'),
+    ((5, 169), 'cevContainerCrs1FabricLEDModuleSlot'), ((5, 170), 'cevPowerSupplyCrs1PowerSupplyShelf'),
+    ((5, 171), 'cevContainerTransceiver'), ((5, 173), 'cevContainer9124PowerSupplyBay'),
+    ((5, 174), 'cevContainer9124FanBay'), ((5, 175), 'cevContainerC3KPowerSupply'),
+    ((5, 176), 'cevContainerC3KRemotePowerSupply'), ((5, 177), 'cevContainerC3KBlower'),
+    ((5, 178), 'cevContainer9222iFanBay'), ((5, 179), 'cevContainerN7Kc7010PowerSupplyBay'),
+    ((5, 180), 'cevContainerN7KC7010MainFanBay'), ((5, 181), 'cevContainerN7KC7010FabricFanBay'),
+    ((5, 182), 'cevContainerASR1000RPSlot'), ((5, 183), 'cevContainerASR1000FPSlot'),
+    ((5, 184), 'cevContainerASR1000CCSlot'), ((5, 185), 'cevContainerASR1000PowerSupplyBay'),
+    ((5, 186), 'cevContainerN5kC5020FanBay'), ((5, 187), 'cevContainerN5kC5020PowerSupplyBay'),
+    ((5, 188), 'cevContainerASR9KFanTraySlot'), ((5, 189), 'cevContainerASR9KPowerSupplySlotDC'),
+    ((5, 190), 'cevContainerASR9KPowerSupplySlotAC'), ((5, 191), 'cevContainerASR9KRSPSlot'),
+    ((5, 192), 'cevContainerASR9KLCSlot'), ((5, 193), 'cevContainerN7Kc7018PowerSupplyBay'),
+    ((5, 194), 'cevContainerN7KC7018FanBay'), ((5, 195), 'cevContainerCrs1PowerShelfSlot'),
+    ((5, 196), 'cevContainerN5kC5010FanBay'), ((5, 197), 'cevContainerN5kC5010PowerSupplyBay'),
+    ((5, 198), 'cevContainerXFP'), ((5, 199), 'cevContainerAsr14kPowerSupplySlot'),
+    ((5, 200), 'cevContainerAsr14kPowerShelfSlot'), ((5, 201), 'cevContainerAsr14kFanTraySlot'),
+    ((5, 202), 'cevContainerAsr14kFabricCardSlot'), ((5, 203), 'cevContainerAsr14kFPSlot'),
+    ((5, 204), 'cevContainerAsr14kRPSlot'), ((5, 205), 'cevContainerHardDiskSlot'),
+    ((5, 206), 'cevContainerNexusLogicalFabric'), ((5, 207), 'cevContainerN2kC2148T1GEPowerSupplyBay'),
+    ((5, 208), 'cevContainerN2kC2148T1GEFanBay'), ((5, 209), 'cevContainerUCSN10S6100FanBay'),
+    ((5, 210), 'cevContainerUCSN10S6100PowerSupplyBay'), ((5, 213), 'cevContainerMXE5600PowerSupplyBay'),
+    ((5, 214), 'cevContainerMXE5600FanTray'), ((5, 218), 'cevContainerN2kC2248TP1GEPowerSupplyBay'),
+    ((5, 219), 'cevContainerN7Kc7009PowerSupplyBay'), ((5, 220), 'cevContainerN7KC7009FanBay'),
+    ((5, 221), 'cevContainerFruLinkModuleSlot'), ((5, 222), 'cevContainerFlexStackModuleSlot'),
+    ((5, 223), 'cevContainerMXE5600ShelfManagerBay'), ((5, 224), 'cevContainerMXE5600NpmSlot'),
+    ((5, 225), 'cevContainerMXE5600MpmSlot'), ((5, 226), 'cevContainerN5KC5548FanBay'),
+    ((5, 227), 'cevContainerN5kC5548PowerSupplyBay'), ((5, 228), 'cevContainerCrs18PowerShelfVirtual'),
+    ((5, 229), 'cevContainer40GigBasePort'), ((5, 230), 'cevContainerSAMBay'),
+    ((5, 231), 'cevContainerN5KC5596FanBay'), ((5, 232), 'cevContainerN5kC5596PowerSupplyBay'),
+    ((5, 235), 'cevContainerN3KC3064FanBay'), ((5, 236), 'cevContainerUCS6248FanBay'),
+    ((5, 237), 'cevContainerUCS6248PowerSupplyBay'), ((5, 238), 'cevContainerUCS6296FanBay'),
+    ((5, 239), 'cevContainerUCS6296PowerSupplyBay'), ((5, 240), 'cevContainerDIMM8541Slot'),
+    ((5, 241), 'cevContainerDIMM7571Slot'), ((5, 242), 'cevContainerDIMM7541Slot'),
+    ((5, 243), 'cevContainerDIMM694Slot'), ((5, 244), 'cevContainerDIMM594Slot'),
+    ((5, 245), 'cevContainerDIMM294Slot'), ((5, 246), 'cevContainerASR900RSPSlot'),
+    ((5, 247), 'cevContainerASR900PowerSupplyBay'), ((5, 248), 'cevContainerASR900FanTrayBay'),
+    ((5, 249), 'cevContainerIMBay'), ((5, 250), 'cevContainerN7Kc7004FanBay'),
+    ((5, 251), 'cevContainerN7Kc7004PowerSupplyBay'), ((5, 252), 'cevContainerN3KC3048FanBay'),
+    ((5, 253), 'cevContainerESGPSBay'), ((5, 254), 'cevContainerESGPOEConvBay'),
+    ((5, 255), 'cevContainerESGFanTrayBay'), ((5, 256), 'cevContainerESG2000RPSlot'),
+    ((5, 257), 'cevContainerESG2000FPSlot'), ((5, 258), 'cevContainerESGNGSMSlot'), ((5, 259), 'cevContainerNGWICBay'),
+    ((5, 262), 'cevContainerN6kC6004FanBay'), ((5, 263), 'cevContainerN6kC6004PowerSupplyBay'),
+    ((5, 264), 'cevContainerASR9KSwitchFabricSlot'), ((5, 265), 'cevContainerCFP'),
+    ((5, 268), 'cevContainerISR4400ESMSlot'), ((5, 269), 'cevContainerISR4400PSBay'),
+    ((5, 270), 'cevContainerISR4400FanTrayBay'), ((5, 271), 'cevContainerISR4400POEBay'),
+    ((5, 272), 'cevContainerISR4400InternalPOEBay'), ((5, 273), 'cevContainerDSC9710FanBay'),
+    ((5, 274), 'cevContainerMDS9250iFanBay'), ((5, 275), 'cevContainerNCSProcessorSlot'),
+    ((5, 276), 'cevContainerNCSLineCardSlot'), ((5, 277), 'cevContainerNCSFabcardSlot'),
+    ((5, 278), 'cevContainerNCSPwrTraySlot'), ((5, 279), 'cevContainerNCSFanTraySlot'),
+    ((5, 280), 'cevContainerNCSPwrSupSlot'), ((5, 281), 'cevContainerNCSDisplaySlot'),
+    ((5, 282), 'cevContainerN77c7718PowerSupplyBay'), ((5, 283), 'cevContainerN77c7710PowerSupplyBay'),
+    ((5, 284), 'cevContainerN77c7706PowerSupplyBay'), ((5, 285), 'cevContainerN77c7718FanBay'),
+    ((5, 286), 'cevContainerN77c7710FanBay'), ((5, 287), 'cevContainerN77c7706FanBay'), ((5, 288), 'cevContainerCXP'),
+    ((5, 289), 'cevContainerCPAK'), ((5, 290), 'cevContainerPsConverter'), ((5, 292), 'cevContainerQIron22Qzinc2'),
+    ((5, 293), 'cevContainerDSC9706'), ((5, 301), 'cevContainerN9Kc9508FanBay'),
+    ((5, 302), 'cevContainerN9Kc9508PowerSupplyBay'), ((5, 303), 'cevContainerASR5000SPCSlot'),
+    ((5, 304), 'cevContainerASR5000PTACSlot'), ((5, 305), 'cevContainerASR5000RCCSlot'),
+    ((5, 306), 'cevContainerASR5000SPIOSlot'), ((5, 307), 'cevContainerASR5000LCSlot'),
+    ((5, 308), 'cevContainerASR5000FanTraySlot'), ((5, 309), 'cevContainerASR5000PowerSupplySlot'),
+    ((5, 310), 'cevContainerASR5500MMIOSlot'), ((5, 311), 'cevContainerASR5500DPCSlot'),
+    ((5, 312), 'cevContainerASR5500FSCSlot'), ((5, 313), 'cevContainerASR5500SSCSlot'),
+    ((5, 314), 'cevContainerASR5500SIOSlot'), ((5, 315), 'cevContainerASR5500FanTraySlot'),
+    ((5, 316), 'cevContainerASR5500PowerSupplySlot'), ((5, 317), 'cevContainerDSC48SFAN'),
+    ((5, 318), 'cevContainerN9Kc9516FanBay'), ((5, 319), 'cevContainerN9Kc9504FanBay'),
+    ((5, 320), 'cevContainerN9KC9300FanBay2'), ((5, 321), 'cevContainerN9KC9300FanBay1'),
+    ((5, 322), 'cevContainerISRSSDSlot'), ((5, 323), 'cevContainerNIMSlot'), ((5, 324), 'cevContainerISRPVDMSlot'),
+    ((5, 327), 'cevContainerN5KC56128FanBay'), ((5, 328), 'cevContainerNXAPowerSupplyBay'),
+    ((5, 329), 'cevContainerN6kC6001FanBay'), ((5, 330), 'cevContainerNCS4KSFP'),
+    ((5, 331), 'cevContainerNCS4KPwrSupSlot'), ((5, 332), 'cevContainerNCS6KSwitchCard'),
+    ((5, 333), 'cevContainerUSB'), ((5, 334), 'cevContainerCCEPowerSupplyBay'),
+    ((5, 335), 'cevContainerCCEFanTraySlot'), ((5, 336), 'cevContainerN77c7702PowerSupplyBay'),
+    ((5, 337), 'cevContainerN77c7702FanBay'), ((5, 339), 'cevContainerDSCAC1200W'),
+    ((5, 340), 'cevContainerDSC96SFAN'), ((5, 344), 'cevContainerDSCAC973KW'), ((5, 345), 'cevContainerDSC9718FAN'),
+    ((5, 346), 'cevContainerN9kc9264PQFanBay'), ((5, 359), 'cevContainerFPRLogicalFabric'),
+    ((5, 361), 'cevContainerFPRC9300PowerSupplyBay'), ((5, 362), 'cevContainerFPRC9300FanBay'),
+    ((5, 363), 'cevContainerFPR4KFanBay'), ((5, 364), 'cevContainerFPR4KPowerSupplyBay'),
+    ((5, 366), 'cevContainerCbr8PowerShelfSlot'), ((5, 372), 'cevContainerNonCiscoQSFP28CWDM'),
+    ((5, 373), 'cevContainerNCS420XRSP'), ((5, 374), 'cevContainerNCS4216RSP'),
+    ((5, 377), 'cevContainerNCS1002LineCardVirtual'), ((5, 378), 'cevContainerNCS1002RP'),
+    ((5, 379), 'cevContainerPowerModuleSlot'), ((6,), 'cevPowerSupply'), ((6, 1), 'cevPowerSupplyAC1360W'),
+    ((6, 2), 'cevPowerSupplyDC1360W'), ((6, 3), 'cevPowerSupplyAC1000W'), ((6, 4), 'cevPowerSupplyDC1000W'),
+    ((6, 5), 'cevPowerSupplyPowerone'), ((6, 6), 'cevPowerSupplyAstec'), ((6, 7), 'cevPowerSupplyMinus48VDC'),
+    ((6, 8), 'cevPowerSupplyEmpty'), ((6, 9), 'cevPowerSupplyAC1100W'), ((6, 10), 'cevPowerSupplyAC1200W'),
+    ((6, 11), 'cevPowerSupplyDC1200W'), ((6, 12), 'cevPowerSupplyPem'), ((6, 13), 'cevPowerSupplyAC2000W'),
+    ((6, 14), 'cevPowerSupplyDC2000W'), ((6, 15), 'cevPowerSupply6260DC'), ((6, 16), 'cevPowerSupply6260AC'),
+    ((6, 17), 'cevPowerSupplyMGX8800Pem'), ((6, 18), 'cevPowerSupply12012DC'), ((6, 19), 'cevPowerSupply12012AC'),
+    ((6, 20), 'cevPowerSupply12008DC'), ((6, 21), 'cevPowerSupply12008AC'), ((6, 22), 'cevPowerSupplyDC2500W'),
+    ((6, 23), 'cevPowerSupplyAC1050W'), ((6, 24), 'cevPowerSupplyAC2500W'), ((6, 25), 'cevPowerSupply6160DC'),
+    ((6, 28), 'cevPowerSupplyAC4000W'), ((6, 29), 'cevPowerSupplyDC4000W'), ((6, 31), 'cevPowerSupply12010DC'),
+    ((6, 32), 'cevPowerSupply12010AC'), ((6, 33), 'cevPowerSupply5850DC'), ((6, 34), 'cevPowerSupply12406DC'),
+    ((6, 35), 'cevPowerSupply12406AC'), ((6, 36), 'cevPowerSupply12410DC'), ((6, 37), 'cevPowerSupply12410AC'),
+    ((6, 38), 'cevPowerSupplyAC1900W'), ((6, 39), 'cevPowerSupplyDC1900W'), ((6, 40), 'cevPowerSupplyDC950W'),
+    ((6, 41), 'cevPowerSupplyAC950W'), ((6, 42), 'cevPowerSupply12404DC'), ((6, 43), 'cevPowerSupply12404AC'),
+    ((6, 44), 'cevPowerSupplyBP7513AC1200W'), ((6, 45), 'cevPowerSupplyBP7513DC1200W'),
+    ((6, 46), 'cevPowerSupplyBP7505AC600W'), ((6, 47), 'cevPowerSupplyBP7505DC600W'),
+    ((6, 48), 'cevPowerSupplyBP7507AC700W'), ((6, 49), 'cevPowerSupplyBP7507DC700W'),
+    ((6, 50), 'cevPowerSupplyAC1900W6'), ((6, 51), 'cevPowerSupplyC7300AC'), ((6, 52), 'cevPowerSupplyC7300DC'),
+    ((6, 53), 'cevPowerSupplyAC600W'), ((6, 54), 'cevPowerSupplyDC600W'), ((6, 55), 'cevPowerSupplyC10KDC'),
+    ((6, 56), 'cevPowerSupplyC10KAC'), ((6, 59), 'cevPowerSupply15530AC'), ((6, 60), 'cevPowerSupply15530DC'),
+    ((6, 61), 'cevPowerSupplyAC3000W'), ((6, 63), 'cevPowerSupply12016DC'), ((6, 64), 'cevPowerSupply12016AC'),
+    ((6, 70), 'cevPowerSupplyDC3000W'), ((6, 71), 'cevPowerSupplyCat3750AC50W12V'),
+    ((6, 72), 'cevPowerSupplyCat3750AC102W12V'), ((6, 73), 'cevPowerSupplyCat3750AC204W12V'),
+    ((6, 74), 'cevPowerSupplyCat3750AC252W12V'), ((6, 76), 'cevPowerSupplyDsCac2500W'),
+    ((6, 77), 'cevPowerSupplyRedDsCac2500W'), ((6, 78), 'cevPowerSupplyDsCdc2500W'),
+    ((6, 79), 'cevPowerSupplyRedDsCdc2500W'), ((6, 80), 'cevPowerSupplyDsCac4000WUs'),
+    ((6, 81), 'cevPowerSupplyRedDsCac4000WUs'), ((6, 82), 'cevPowerSupplyDsCac4000WInt'),
+    ((6, 83), 'cevPowerSupplyRedDsCac4000WInt'), ((6, 84), 'cevPowerSupplyDsCac1900W'),
+    ((6, 85), 'cevPowerSupplyRedDsCac1900W'), ((6, 86), 'cevPowerSupplyDsCdc1900W'),
+    ((6, 87), 'cevPowerSupplyRedDsCdc1900W'), ((6, 88), 'cevPowerSupplyRedDsCac845W'),
+    ((6, 89), 'cevPowerSupplyDsCac845W'), ((6, 90), 'cevPowerSupplyUnknown'),
+    ((6, 91), 'cevPowerSupplyC2970AC156W12V'), ((6, 92), 'cevPowerSupplyAc150W'), ((6, 93), 'cevPowerSupplyC7200AC'),
+    ((6, 94), 'cevPowerSupplyC7200DC'), ((6, 95), 'cevPowerSupplyAc465W'), ((6, 96), 'cevPowerSupplyDsCac300W'),
+    ((6, 97), 'cevPowerSupplyRedDsCac300W'), ((6, 98), 'cevPowerSupplyAc1400W'),
+    ((6, 99), 'cevPowerSupplyC2970AC204W12V'), ((6, 100), 'cevPowerSupplyCrs1PowerSupply'),
+    ((6, 101), 'cevPowerSupplyCrs1PowerZone'), ((6, 102), 'cevPowerSupplyAC6000W'), ((6, 103), 'cevPowerSupplyDc150W'),
+    ((6, 104), 'cevPowerSupplyAC2700W'), ((6, 105), 'cevPowerSupplyDC2700W'), ((6, 106), 'cevPowerSupplyPwrC45300AC'),
+    ((6, 107), 'cevPowerSupplyPwrC45300DC'), ((6, 108), 'cevPowerSupplyAC2900WE'),
+    ((6, 109), 'cevPowerSupplyAC6000WE'), ((6, 110), 'cevPowerSupplyAC8700WE'), ((6, 111), 'cevPowerSupplyPWR2700AC4'),
+    ((6, 112), 'cevPowerSupplyPWR2700DC4'), ((6, 113), 'cevPowerSupplyPWRC49AC300W'),
+    ((6, 114), 'cevPowerSupplyPWRC49DC300W'), ((6, 115), 'cevPowerSupplyGSR6PemAC'),
+    ((6, 116), 'cevPowerSupplyGSR6PemDC'), ((6, 117), 'cevPowerSupplyGSR10PemAC'),
+    ((6, 118), 'cevPowerSupplyGSR10PemDC'), ((6, 119), 'cevPowerSupplyGSR4PemAC'),
+    ((6, 120), 'cevPowerSupplyGSR4PemDC'), ((6, 121), 'cevPowerSupplyGSR16PemAC'),
+    ((6, 122), 'cevPowerSupplyGSR16PemDC'), ((6, 123), 'cevPowerSupplyC451400DCSP'),
+    ((6, 124), 'cevPowerSupplyAc125W'), ((6, 125), 'cevPowerSupplyAc60W'), ((6, 126), 'cevPowerSupplyC454200ACv'),
+    ((6, 127), 'cevPowerSupply400wDC'), ((6, 128), 'cevPowerSupplyEnh12404AC'), ((6, 129), 'cevPowerSupplyEnh12404DC'),
+    ((6, 130), 'cevPowerSupplyEnh12406AC'), ((6, 131), 'cevPowerSupplyEnh12406DC'),
+    ((6, 132), 'cevPowerSupplyEnh12410AC'), ((6, 133), 'cevPowerSupplyEnh12410DC'),
+    ((6, 134), 'cevPowerSupplyEnh12416AC'), ((6, 135), 'cevPowerSupplyEnh12416DC'),
+    ((6, 136), 'cevPowerSupply76xxDC2500W'), ((6, 137), 'cevPowerSupply76xxAC3000W'),
+    ((6, 138), 'cevPowerSupply76xxAC4000US'), ((6, 139), 'cevPowerSupply76xxAC4000INT'),
+    ((6, 140), 'cevPowerSupply76xxAC6000W'), ((6, 141), 'cevPowerSupplyDC100W'),
+    ((6, 144), 'cevPowerSupplyDsCAD6000W'), ((6, 145), 'cevPowerSupplyCat2960AC60W12V'),
+    ((6, 146), 'cevPowerSupplyCat2960AC125W12V'), ((6, 147), 'cevPowerSupplyCat2960AC210W12V'),
+    ((6, 148), 'cevPowerSupply6340PWRDC'), ((6, 149), 'cevPowerSupply6340PWRAC'),
+    ((6, 150), 'cevPowerSupplyUbr10012AC'), ((6, 151), 'cevPowerSupplyUbr10012DC'), ((6, 152), 'cevPowerSupply400wAC'),
+    ((6, 153), 'cevPowerSupplyCE500AC60W12V'), ((6, 154), 'cevPowerSupplyCE500AC375W48V'),
+    ((6, 155), 'cevPowerSupplyCE500AC75W48V'), ((6, 156), 'cevPowerSupplyCE500AC168W12V'),
+    ((6, 157), 'cevPowerSupplyCat3750AC210W12V'), ((6, 158), 'cevPowerSupplyCat3750AC375W48V'),
+    ((6, 159), 'cevPowerSupplyAC50W'), ((6, 160), 'cevPowerSupplyDC50W'),
+    ((6, 161), 'cevPowerSupplyCrs116PowerShelfACDelta'), ((6, 162), 'cevPowerSupplyCrs116PowerShelfACWye'),
+    ((6, 163), 'cevPowerSupplyCrs116PowerShelfDC'), ((6, 164), 'cevPowerSupplyCrs116ACRectifier'),
+    ((6, 165), 'cevPowerSupplyCrs116DCPEM'), ((6, 167), 'cevPowerSupplyDsCac3000W'),
+    ((6, 168), 'cevPowerSupplyPWR6000DC'), ((6, 169), 'cevPowerSupplyCrs18ACRectifier'),
+    ((6, 170), 'cevPowerSupplyCrs18DCPem'), ((6, 171), 'cevPowerSupplyCrs18ACDelta'),
+    ((6, 172), 'cevPowerSupplyCrs18ACW'), ((6, 173), 'cevPowerSupplyCrs18DC'), ((6, 174), 'cevPowerSupplyCrs18PduACD'),
+    ((6, 175), 'cevPowerSupplyCrs18PduACW'), ((6, 176), 'cevPowerSupplyCrs18PduDC'),
+    ((6, 177), 'cevPowerSupplyCrs1FcACD'), ((6, 178), 'cevPowerSupplyCrs1FcACW'), ((6, 179), 'cevPowerSupplyCrs1FcDC'),
+    ((6, 180), 'cevPowerSupplyCrs14PowerShelfAC'), ((6, 181), 'cevPowerSupplyCrs14PowerShelfDC'),
+    ((6, 182), 'cevPowerSupplyCrs14PowerSupplyDC'), ((6, 183), 'cevPowerSupplyCrs14PowerSupplyAC'),
+    ((6, 184), 'cevPowerSupplyC3KPWR265WAC'), ((6, 185), 'cevPowerSupplyC3KPWR265WDC'),
+    ((6, 186), 'cevPowerSupplyC3KPWR750WAC'), ((6, 188), 'cevPowerSupplyCat2960AC36W12V'),
+    ((6, 189), 'cevPowerSupplyCat3560AC173W48V'), ((6, 190), 'cevPowerSupplyAC345'),
+    ((6, 191), 'cevPowerSupplyC3KPWR1150WAC'), ((6, 192), 'cevPowerSupplyPwrRPS2300'),
+    ((6, 193), 'cevPowerSupplyCrs14DcPim'), ((6, 194), 'cevPowerSupplyDC1500W'), ((6, 195), 'cevPowerSupplyC7201AC'),
+    ((6, 196), 'cevPowerSupplyC7201DC'), ((6, 197), 'cevPowerSupplyCE520AC173W48V'),
+    ((6, 198), 'cevPowerSupplyAC100W'), ((6, 199), 'cevPowerSupplyN7KAC5600W'), ((6, 200), 'cevPowerSupplyASR1002AC'),
+    ((6, 201), 'cevPowerSupplyASR1002DC'), ((6, 202), 'cevPowerSupplyASR1004AC'),
+    ((6, 203), 'cevPowerSupplyASR1004DC'), ((6, 204), 'cevPowerSupplyASR1006AC'),
+    ((6, 205), 'cevPowerSupplyASR1006DC'), ((6, 206), 'cevPowerSupplyASR1000Unknown'),
+    ((6, 207), 'cevPowerSupplyC49M1000AC'), ((6, 208), 'cevPowerSupplyC49M1000DC'),
+    ((6, 209), 'cevPowerSupplyN7KAC7500W'), ((6, 210), 'cevPowerSupplyCE520LCAC135W12V'),
+    ((6, 211), 'cevPowerSupplyCE520PCAC558W12V'), ((6, 212), 'cevPowerSupplyCE520TTAC60W12V'),
+    ((6, 213), 'cevPowerSupplyCE520GTCAC125W12V'), ((6, 214), 'cevPowerSupplyN7KAC6000W'),
+    ((6, 215), 'cevPowerSupplyDc4500W'), ((6, 216), 'cevPowerSupplyIE3000AC'), ((6, 217), 'cevPowerSupplyN5kPac1200W'),
+    ((6, 218), 'cevPowerSupplyCat2918AC60W12V'), ((6, 220), 'cevPowerSupplyC3KPWR300WAC'),
+    ((6, 221), 'cevPowerSupplyC3KPWR300WDC'), ((6, 222), 'cevPowerSupplyDCPowerSupply'),
+    ((6, 223), 'cevPowerSupplyACPowerSupply'), ((6, 228), 'cevPowerSupplyN7KAC7500WINT'),
+    ((6, 229), 'cevPowerSupplyN7KAC7500WUS'), ((6, 230), 'cevPowerSupplyN5kPac550W'),
+    ((6, 231), 'cevPowerSupplyASR9KDC2100W'), ((6, 232), 'cevPowerSupplyASR9KDC1500W'),
+    ((6, 233), 'cevPowerSupplyASR9KAC3KW'), ((6, 234), 'cevPowerSupplyCrs16dcPemB'),
+    ((6, 235), 'cevPowerSupplyC3900PWRPOE'), ((6, 236), 'cevPowerSupplyC3900PWRAC'),
+    ((6, 237), 'cevPowerSupplyC2921C2951PWRPOE'), ((6, 238), 'cevPowerSupplyC2921C2951PWRAC'),
+    ((6, 239), 'cevPowerSupplyC2911PWRPOE'), ((6, 240), 'cevPowerSupplyC2911PWRAC'),
+    ((6, 241), 'cevPowerSupplyC2901PWRPOE'), ((6, 242), 'cevPowerSupplyC1941C2901PWRAC'),
+    ((6, 243), 'cevPowerSupplyC1941PWRPOE'), ((6, 244), 'cevPowerSupplyC3900PWRDC'),
+    ((6, 245), 'cevPowerSupplyC2921C2951PWRDC'), ((6, 246), 'cevPowerSupplyC2911PWRDC'),
+    ((6, 247), 'cevPowerSupplyC2921C2951RPSADPTR'), ((6, 248), 'cevPowerSupplyC2911RPSADPTR'),
+    ((6, 249), 'cevPowerSupplyN2kPac200W'), ((6, 250), 'cevPowerSupplyC456000ACV'),
+    ((6, 251), 'cevPowerUCSN10PAC1550W'), ((6, 253), 'cevPowerSupplyN7KDC6000W'),
+    ((6, 254), 'cevPowerSupplyCrs18PowerShelfDCModular'), ((6, 255), 'cevPowerSupplyCrs18PowerShelfACModular'),
+    ((6, 256), 'cevPowerSupplyCrs116FCCPowerShelfDCModular'), ((6, 257), 'cevPowerSupplyCrs116FCCPowerShelfACModular'),
+    ((6, 258), 'cevPowerSupplyCrs1DCPowerModule'), ((6, 259), 'cevPowerSupplyCrs1ACPowerModule'),
+    ((6, 260), 'cevPowerSupplyCrs116LCCPowerShelfDCModular'), ((6, 261), 'cevPowerSupplyCrs116LCCPowerShelfACModular'),
+    ((6, 262), 'cevPowerSupplyCat2960AC123W12V'), ((6, 263), 'cevPowerSupplyCat2960AC370W12V'),
+    ((6, 264), 'cevPowerSupplyCat2960AC235W12V'), ((6, 265), 'cevPowerSupplyCat2960AC525W12V'),
+    ((6, 267), 'cevPowerSupplyASR1001AC'), ((6, 268), 'cevPowerSupplyASR1001DC'),
+    ((6, 269), 'cevPowerSupplyASR1013AC'), ((6, 270), 'cevPowerSupplyASR1013DC'),
+    ((6, 271), 'cevPowerSupplyC1941PWRAC'), ((6, 272), 'cevPowerSupplyASR1002DC24V'),
+    ((6, 273), 'cevPowerSupplyN2kC2200Pac400W'), ((6, 278), 'cevPowerSupplyC3kxPwr350wAc'),
+    ((6, 279), 'cevPowerSupplyC3kxPwr715wAc'), ((6, 280), 'cevPowerSupplyC3kxPwr1100wAc'),
+    ((6, 282), 'cevPowerSupplyPWRME3KXAC'), ((6, 283), 'cevPowerSupplyPWRME3KXDC'),
+    ((6, 284), 'cevPowerSupplyCGR20xxCGS25xxPWRACPOE'), ((6, 285), 'cevPowerSupplyCGR20xxCGS25xxPWRDCPOE'),
+    ((6, 286), 'cevPowerSupplyMXE5600'), ((6, 287), 'cevPowerSupplyC7225AC'),
+    ((6, 288), 'cevPowerSupplyPWRC49EAC300WR'), ((6, 290), 'cevPowerSupplyC2360Pwr135wac'),
+    ((6, 291), 'cevPowerSupplyN55Pac750W'), ((6, 293), 'cevPowerSupplyCrs16PshDcB'),
+    ((6, 294), 'cevPowerSupplyCrs16PshAcB'), ((6, 295), 'cevPowerSupplyPWRC49EAC300WF'),
+    ((6, 296), 'cevPowerSupplyPWRC49DC300WF'), ((6, 297), 'cevPowerSupplyN2kN2200Pdc400W'),
+    ((6, 298), 'cevPowerSupplyASR1000PS'), ((6, 299), 'cevPowerSupplyCat2928AC60W12V'),
+    ((6, 300), 'cevPowerSupplyCat2928AC100W12V'), ((6, 301), 'cevPowerSupplyPwrXPS2200'),
+    ((6, 302), 'cevPowerSupplyN55Pac1100W'), ((6, 303), 'cevPowerSupplyN2kN2200Pac400WB'),
+    ((6, 306), 'cevPowerSupplyUCS6248UpAC750W'), ((6, 307), 'cevPowerSupplyUCS6248UpDC750W'),
+    ((6, 308), 'cevPowerSupplyUCS6296UpDC1100W'), ((6, 309), 'cevPowerSupplyUCS6296UpAC1100W'),
+    ((6, 310), 'cevPowerSupplyN7KDC3KW'), ((6, 311), 'cevPowerSupplyCat2960CAC167W'),
+    ((6, 312), 'cevPowerSupplyCat2960CAC36W12V'), ((6, 313), 'cevPowerSupplyN7KAC3KW'),
+    ((6, 314), 'cevPowerSupplyN55Pdc750W'), ((6, 315), 'cevPowerSupplyOe8541'), ((6, 316), 'cevPowerSupplyOe7571'),
+    ((6, 317), 'cevPowerSupplyOe7541'), ((6, 318), 'cevPowerSupplyOe694'), ((6, 319), 'cevPowerSupplyOe594'),
+    ((6, 320), 'cevPowerSupplyOe294'), ((6, 324), 'cevPowerSupplyASA5555PSInput'),
+    ((6, 325), 'cevPowerSupplyN2kN2200Pac400W'), ((6, 326), 'cevPowerSupplyN55Pac750WB'),
+    ((6, 327), 'cevPowerSupplyN55Pac1100WB'), ((6, 328), 'cevPowerSupplyASR900DC500W'),
+    ((6, 330), 'cevPowerSupplyCrs8PshDcB'), ((6, 331), 'cevPowerSupplyCrs8PshAcB'),
+    ((6, 332), 'cevPowerSupplyASR5KPfu'), ((6, 333), 'cevPowerSupplyASR55PFU'), ((6, 334), 'cevPowerSupplyIE2000AC'),
+    ((6, 337), 'cevPowerSupplyC459000ACV'), ((6, 338), 'cevPowerSupplyN2kN2200Pdc350WB'),
+    ((6, 339), 'cevPowerSupplyVG350PWRAC'), ((6, 340), 'cevPowerSupplyVG350PWRDC'),
+    ((6, 341), 'cevPowerSupplyASR9KAC3KWV2'), ((6, 342), 'cevPowerSupplyASR9KDC2100WV2'),
+    ((6, 343), 'cevPowerSupplyASR9KAC750W'), ((6, 344), 'cevPowerSupplyASR9KDC750W'),
+    ((6, 345), 'cevPowerSupplyISR4400PWR1000'), ((6, 346), 'cevPowerSupplyISR4400PWR450'),
+    ((6, 347), 'cevPowerSupplyC4KXPWR750DCF'), ((6, 348), 'cevPowerSupplyC4KXPWR750ACF'),
+    ((6, 349), 'cevPowerSupplyC4KXPWR750DCR'), ((6, 350), 'cevPowerSupplyC4KXPWR750ACR'),
+    ((6, 351), 'cevPowerSupplyNXAPac200WB'), ((6, 352), 'cevPowerSupplyNXAPac200W'),
+    ((6, 353), 'cevPowerSupplyISR4400Unknown'), ((6, 354), 'cevPowerSupplyASR9000vGenericPm'),
+    ((6, 355), 'cevPowerSupplyNXAPac1100W'), ((6, 359), 'cevPowerSupplyNXAPac1100WB'),
+    ((6, 360), 'cevPowerSupplyN3kPac400WB'), ((6, 361), 'cevPowerSupplyN3kPac400W'),
+    ((6, 362), 'cevPowerSupplyNXAPAC500W'), ((6, 363), 'cevPowerSupplyNXAPAC500WB'),
+    ((6, 364), 'cevPowerSupplyISR4400PS'), ((6, 365), 'cevPowerSupplyN55PDC1100W'),
+    ((6, 366), 'cevPowerSupplyASA5545PSInputSensor'), ((6, 367), 'cevPowerSupplyASA5555PSInputSensor'),
+    ((6, 368), 'cevPowerSupplyASA5545K7PSInputSensor'), ((6, 369), 'cevPowerSupplyASA5555K7PSInputSensor'),
+    ((6, 370), 'cevPowerSupplyCat2960XAC173W'), ((6, 372), 'cevPowerSupplyC6880X3KWAC'),
+    ((6, 373), 'cevPowerSupplyC6880X3KWDC'), ((6, 374), 'cevPowerSupplyDS9710'),
+    ((6, 375), 'cevPowerSupplyPWR2KWDCV2'), ((6, 376), 'cevPowerSupplyPWR3KWACV2'),
+    ((6, 377), 'cevPowerSupplyNCSDCPWRTRAY'), ((6, 378), 'cevPowerSupplyNCSACPWRTRAY'),
+    ((6, 380), 'cevPowerSupplyDSC50I300AC'), ((6, 381), 'cevPowerSupplyDSCAC973KW'),
+    ((6, 382), 'cevPowerSupplyDSCDC973KW'), ((6, 383), 'cevPowerSupplyN77AC3KW'), ((6, 384), 'cevPowerSupplyN77DC3KW'),
+    ((6, 385), 'cevPowerSupplyC6800XL3KWAC'), ((6, 390), 'cevPowerSupplyC2960XR250W'),
+    ((6, 391), 'cevPowerSupplyC2960XR640W'), ((6, 392), 'cevPowerSupplyC2960XR1025W'),
+    ((6, 397), 'cevPowerSupplyVG3X0PWRAC'), ((6, 398), 'cevPowerSupplyVG3X0PWRDC'),
+    ((6, 399), 'cevPowerSupplyNXAPDC500W'), ((6, 400), 'cevPowerSupplyNXAPDC500WB'),
+    ((6, 401), 'cevPowerSupplyC2960XR60W'), ((6, 402), 'cevPowerSupplyC2960XR450W'),
+    ((6, 403), 'cevPowerSupplyC2960XR835W'), ((6, 404), 'cevPowerSupplyN9KAC3000W'),
+    ((6, 405), 'cevPowerSupplyN9KPac1200WB'), ((6, 406), 'cevPowerSupplyN9KPac1200W'),
+    ((6, 407), 'cevPowerSupplyN9KPac650WB'), ((6, 408), 'cevPowerSupplyN9KPac650W'),
+    ((6, 409), 'cevPowerSupplyISR4430PWR250'), ((6, 414), 'cevPowerSupplyASR1001XAC'),
+    ((6, 415), 'cevPowerSupplyASR1001XDC'), ((6, 416), 'cevPowerSupply30WAC'), ((6, 417), 'cevPowerSupply60WAC'),
+    ((6, 418), 'cevPowerSupply60WACV2'), ((6, 419), 'cevPowerSupply125WAC'), ((6, 420), 'cevPowerSupplyRT2241PWRAC'),
+    ((6, 421), 'cevPowerSupplyRT3201PWRAC'), ((6, 422), 'cevPowerSupplyRT3211PWRAC'),
+    ((6, 423), 'cevPowerSupplyRT3211PWRDC'), ((6, 424), 'cevPowerSupplyRT32PWRAC'),
+    ((6, 425), 'cevPowerSupplyRT3211RPSADPTR'), ((6, 426), 'cevPowerSupplyRT32RPSADPTR'),
+    ((6, 439), 'cevPowerSupplyDSC48S300AC'), ((6, 440), 'cevPowerSupplyISR4430PWR250DC'),
+    ((6, 441), 'cevPowerSupplyISR4430PWR500ACIP'), ((6, 442), 'cevPowerSupplyISR4330PWR250AC'),
+    ((6, 443), 'cevPowerSupplyISR4330PWR500ACIP'), ((6, 444), 'cevPowerSupplyISR4320PWR110AC'),
+    ((6, 445), 'cevPowerSupplyISR4320PWR230ACIP'), ((6, 446), 'cevPowerSupply540WPSU'),
+    ((6, 447), 'cevPowerSupplyNXAPHV500WB'), ((6, 448), 'cevPowerSupplyNXAPHV500W'),
+    ((6, 449), 'cevPowerSupplyNXAPHV1100WB'), ((6, 450), 'cevPowerSupplyNXAPHV1100W'),
+    ((6, 451), 'cevPowerSupplyUCS6248HVDC750W'), ((6, 454), 'cevPowerSupplyNCS4kAC2750W'),
+    ((6, 455), 'cevPowerSupplyNCS4KDCPWRTRAY'), ((6, 456), 'cevPowerSupplyContainerNCS4KPwrSupSlot'),
+    ((6, 457), 'cevPowerSupplyNCS4KACPWRTRAY'), ((6, 458), 'cevPowerSupplyNCS4kDCPEM'),
+    ((6, 459), 'cevPowerSupplyCCEAC'), ((6, 460), 'cevPowerSupplyCCEDC'), ((6, 463), 'cevPowerSupplyASR92024SZIM'),
+    ((6, 464), 'cevPowerSupplyASR92024SZM'), ((6, 465), 'cevPowerSupplyASR92024TZM'),
+    ((6, 466), 'cevPowerSupplyNCS4KPwrTrayDCDM'), ((6, 467), 'cevPowerSupplyNCS4KPwrTrayDM'),
+    ((6, 471), 'cevPowerSupplyASR920PWRA'), ((6, 472), 'cevPowerSupplyASR920PWRD'),
+    ((6, 473), 'cevPowerSupplyC2911PWRDCPOE'), ((6, 474), 'cevPowerSupplyCat300W'), ((6, 475), 'cevPowerSupplyCat42W'),
+    ((6, 476), 'cevPowerSupplyUCS6296HVDC1100W'), ((6, 480), 'cevPowerSupplySCE10000AC1200W'),
+    ((6, 481), 'cevPowerSupplySCE10000DC930W'), ((6, 482), 'cevPowerSupplyDSCAC1200WE'),
+    ((6, 483), 'cevPowerSupplyDSCAC1200W'), ((6, 496), 'cevPowerSupplyC6880X3500WHVAC'),
+    ((6, 501), 'cevPowerSupplyPWRC3750WACR'), ((6, 502), 'cevPowerSupplyPWRC3750WDCR'),
+    ((6, 503), 'cevPowerSupplyPWRC3750WACF'), ((6, 504), 'cevPowerSupplyPWRC3750WDCF'),
+    ((6, 512), 'cevPowerSupply1783IMXAC'), ((6, 513), 'cevPowerSupply1783IMXDC'),
+    ((6, 514), 'cevPowerSupplyFPR9KPSAC'), ((6, 515), 'cevPowerSupplyFPR9KPSDC'),
+    ((6, 520), 'cevPowerSupplyN9KPuv1200W'), ((6, 521), 'cevPowerSupplyNEBS650WAC'),
+    ((6, 522), 'cevPowerSupplyNXAPAC650WPI'), ((6, 523), 'cevPowerSupplyNXAPAC650WPE'),
+    ((6, 524), 'cevPowerSupplyNXAPAC1200WPI'), ((6, 525), 'cevPowerSupplyNXAPAC1200WPE'),
+    ((6, 526), 'cevPowerSupplyUCSPSU6332DC'), ((6, 527), 'cevPowerSupplyN9KPAC3000WB'),
+    ((6, 528), 'cevPowerSupplyNCS5KPAC650WBK'), ((6, 529), 'cevPowerSupplyNCS5KPAC650WFR'),
+    ((6, 530), 'cevPowerSupplyNCS5KPDC930WFR'), ((6, 531), 'cevPowerSupplyNCS5KPDC930WBK'),
+    ((6, 537), 'cevPowerSupplyNCS4K'), ((6, 547), 'cevPowerSupplyA900PWR900A'),
+    ((6, 548), 'cevPowerSupplyA900PWR900D'), ((6, 549), 'cevPowerSupplyNCS4KDC250W'),
+    ((6, 550), 'cevPowerSupplyNCS4KAC250W'), ((6, 561), 'cevPowerSupplyNCS1002AC2KW'), ((7,), 'cevFan'),
+    ((7, 3), 'cevFanC6260FanTray'), ((7, 4), 'cevFanSinglePulse'), ((7, 5), 'cevFanDualPulse'),
+    ((7, 6), 'cevFan12012FanTray3'), ((7, 7), 'cevFan12008FanTray6'), ((7, 8), 'cevFan12008FanTray4'),
+    ((7, 9), 'cevFanC6160FanTray'), ((7, 11), 'cevFanC6100FanTray'), ((7, 13), 'cevFan12010FanTray3'),
+    ((7, 14), 'cevFan12406FanTray3'), ((7, 15), 'cevFan12410FanTray3'), ((7, 16), 'cevFanONS15540FanTray8'),
+    ((7, 17), 'cevFan12404FanTray7'), ((7, 18), 'cevFanBP7513MainFan'), ((7, 19), 'cevFanBP7513PS1Fan'),
+    ((7, 20), 'cevFanBP7513PS2Fan'), ((7, 21), 'cevFan7505Fan'), ((7, 22), 'cevFan7507Fan'),
+    ((7, 23), 'cevFanC7300PowerSupplyFan'), ((7, 24), 'cevFanC7300FanModule'), ((7, 25), 'cevFanTrayC10008'),
+    ((7, 26), 'cevFanTrayC10005'), ((7, 27), 'cevFanCat4kFanTray'), ((7, 28), 'cevFanCat4kPowerSupplyFan'),
+    ((7, 29), 'cevFanC6160ITempFanTray'), ((7, 30), 'cevFanONS15530FanTray6'), ((7, 31), 'cevFan12016FanTray3'),
+    ((7, 34), 'cevFanCat3750CFM26'), ((7, 35), 'cevFanDs6SlotFanTray'), ((7, 36), 'cevFanDs9SlotFanTray'),
+    ((7, 37), 'cevFanDs13SlotFanTray'), ((7, 38), 'cevFanTrayUnknown'), ((7, 39), 'cevFanDs2SlotFanTray'),
+    ((7, 40), 'cevFanCat3710CFM26'), ((7, 41), 'cevFanCat37xx12'), ((7, 42), 'cevFanWS9SlotFanTray'),
+    ((7, 43), 'cevFanMod9FanTray'), ((7, 44), 'cevFanCat2970CFM26'), ((7, 45), 'cevFanDs1RUFanTray'),
+    ((7, 46), 'cevFanFanMod3'), ((7, 47), 'cevFanWSC6k6SlotFan'), ((7, 48), 'cevFanWSC6k6SlotFan2'),
+    ((7, 49), 'cevFanWSC6k9SlotFan'), ((7, 50), 'cevFanWSC6k9SlotFan2'), ((7, 51), 'cevFanWSC6509NebFan'),
+    ((7, 52), 'cevFanWSC6k13SlotFan'), ((7, 53), 'cevFanWSC6k13SlotFan2'), ((7, 54), 'cevFanFanMod3HS'),
+    ((7, 55), 'cevFanWSC6509NebFan2'), ((7, 56), 'cevFanFanMod6'), ((7, 57), 'cevFanFanMod6HS'),
+    ((7, 58), 'cevFanCrs1Fan'), ((7, 59), 'cevFanCat3560CFM26'), ((7, 60), 'cevFanDs1RUFanTray9116'),
+    ((7, 61), 'cevFanWSC6506eFanTray'), ((7, 62), 'cevFanWSC6509eFanTray'), ((7, 63), 'cevFanWSC6513eFanTray'),
+    ((7, 64), 'cevFanWSC6503eFanTray'), ((7, 65), 'cevFanUmg9820FanTray'), ((7, 66), 'cevFanMod4HS'),
+    ((7, 67), 'cevFanC4kFCFanTray'), ((7, 68), 'cevFan12410EnhFanTray3'), ((7, 69), 'cevFan12406EnhFanTray3'),
+    ((7, 70), 'cevFan12416EnhFanTray3'), ((7, 71), 'cevFan12404FanTray6'), ((7, 72), 'cevFan12404EnhFanTray6'),
+    ((7, 73), 'cevFan9513FanTrayR'), ((7, 74), 'cevFanCat2960CFM22'), ((7, 75), 'cevFanCat2960CFM26'),
+    ((7, 76), 'cevFanTrayUbr10012'), ((7, 77), 'cevFanC6524'), ((7, 78), 'cevFanCatEx500CFM22'),
+    ((7, 79), 'cevFanCatEx500CFM32'), ((7, 80), 'cevFanCat3750CFM35'), ((7, 81), 'cevFanCFM15'),
+    ((7, 82), 'cevFanCrs1FabricFanTray'), ((7, 83), 'cevModuleCrs116FanTray'), ((7, 84), 'cevModuleCrs18FanTray'),
+    ((7, 85), 'cevModuleCrs14FanTray'), ((7, 86), 'cevFanC3KBLWR60CFM'), ((7, 87), 'cevFanMod6ShsFanTray'),
+    ((7, 88), 'cevFanMod9ShsFanTray'), ((7, 89), 'cevFanMod9StFanTray'), ((7, 90), 'cevFanBlwrRPS2300'),
+    ((7, 91), 'cevFanACE4710K9CpuFan'), ((7, 92), 'cevFanACE4710K9DimmFan'), ((7, 93), 'cevFanACE4710K9PciFan'),
+    ((7, 94), 'cevFanWSC6509veFan'), ((7, 95), 'cevFanMod3ShsFanTray'), ((7, 96), 'cevFanSce8000FanTray'),
+    ((7, 97), 'cevFanN7Kc7010MainFanTray'), ((7, 98), 'cevFanN7KC7010FabricFanTray'), ((7, 99), 'cevFanASR1002'),
+    ((7, 100), 'cevFanASR1004'), ((7, 101), 'cevFanASR1006'), ((7, 102), 'cevFanCe520Cfm22'),
+    ((7, 103), 'cevFanCe520Cfm32'), ((7, 104), 'cevFanN5kC5020Fan'), ((7, 105), 'cevFanCat2918Cfm22'),
+    ((7, 106), 'cevFanC3KFAN16CFM'), ((7, 107), 'cevFanPowerSupplyFan'), ((7, 109), 'cevFanN7Kc7018FanTray'),
+    ((7, 110), 'cevFanCrs16lccFntrB'), ((7, 111), 'cevFanASR14K4FanTray'), ((7, 112), 'cevFanASR14K8FanTray'),
+    ((7, 113), 'cevFanN5kC5010Fan'), ((7, 114), 'cevFanASR9KFan'), ((7, 115), 'cevFanASR9010'),
+    ((7, 116), 'cevFanASR9006'), ((7, 117), 'cevFanASR14K4Fan'), ((7, 118), 'cevFanASR14K8Fan'),
+    ((7, 119), 'cevFanCrs14Fan'), ((7, 120), 'cevFanCrs18Fan'), ((7, 121), 'cevFanCrs116Fan'),
+    ((7, 122), 'cevFanN2kC2148TFan'), ((7, 124), 'cevContainerUCSN10S6100Fan1'), ((7, 125), 'cevFanCat2960CFM32'),
+    ((7, 126), 'cevFanContainerUCSN10Fan2'), ((7, 129), 'cevFanN7Kc7009FanTray'), ((7, 130), 'cevFanMEFanTray'),
+    ((7, 131), 'cevFanMXE5600'), ((7, 132), 'cevFanC2360Fan'), ((7, 133), 'cevFanASR1001FanTray'),
+    ((7, 134), 'cevFanASR1000Fan'), ((7, 135), 'cevFanN5548PFan'), ((7, 139), 'cevFanCrs16FanTrB'),
+    ((7, 140), 'cevFanCat2928Cfm22'), ((7, 141), 'cevFanCat2928Cfm32'), ((7, 142), 'cevFanBlwrXPS2200'),
+    ((7, 143), 'cevFanN5596UPFan'), ((7, 144), 'cevFanN2kC2248TBFan'), ((7, 145), 'cevFanN2kC2232TBFan'),
+    ((7, 148), 'cevFanN3kC3064Fan'), ((7, 149), 'cevFanUCS6248UPFan'), ((7, 150), 'cevFanUCS6296UPFan'),
+    ((7, 151), 'cevFanOe694'), ((7, 152), 'cevFanOe594'), ((7, 153), 'cevFanOe294'), ((7, 154), 'cevFanOe7571'),
+    ((7, 155), 'cevFanOe7541'), ((7, 156), 'cevFanOe8541'), ((7, 157), 'cevFanCrs16SBFan'),
+    ((7, 158), 'cevFanCrs16FabricFan'), ((7, 160), 'cevFanASA5555PSFan'), ((7, 167), 'cevFanASA5555ChassisFan'),
+    ((7, 173), 'cevFanN3kC3064FanB'), ((7, 174), 'cevFanASR903FanTray'), ((7, 175), 'cevFanASR900Fan'),
+    ((7, 176), 'cevFanASR5KFANTLW'), ((7, 177), 'cevFanASR5KFANTUP'), ((7, 178), 'cevFanASR55FANTF'),
+    ((7, 179), 'cevFanASR55FANTR'), ((7, 180), 'cevFanN7Kc7004FanTray'), ((7, 181), 'cevFanN3kC3048Fan'),
+    ((7, 182), 'cevFanN3kC3048FanB'), ((7, 183), 'cevFanASR9001'), ((7, 185), 'cevFanTrayISR4400'),
+    ((7, 187), 'cevFanAsr9922Fan'), ((7, 188), 'cevFanAirstrikeCpuBlower'), ((7, 189), 'cevFanMod13SeFanTray'),
+    ((7, 190), 'cevFanN6kC600496PQFanB'), ((7, 191), 'cevFanN6kC600496PQFanF'), ((7, 192), 'cevFanN3kC3548PFanB'),
+    ((7, 193), 'cevFanN3kC3548PFan'), ((7, 194), 'cevFanA9K9912FAN'), ((7, 195), 'cevFanISR4400Fan'),
+    ((7, 196), 'cevFanAsr9010FanV2'), ((7, 197), 'cevFanCat2960XCFM23'), ((7, 198), 'cevFanCat2960XCFM38'),
+    ((7, 200), 'cevFanDSC9710'), ((7, 201), 'cevFanAsr9904Fan'), ((7, 202), 'cevFanNCSFANTRAY'),
+    ((7, 203), 'cevFanDSC50I'), ((7, 204), 'cevFanC6880xFan'), ((7, 205), 'cevFanCrs18SBFan'),
+    ((7, 206), 'cevFanCrs18FanTrayB'), ((7, 207), 'cevFanN77c7718Fan'), ((7, 208), 'cevFanN77c7710Fan'),
+    ((7, 209), 'cevFanN77c7706Fan'), ((7, 210), 'cevFanC6807xlFan'), ((7, 211), 'cevFanNCSFan'),
+    ((7, 213), 'cevFanN3KC3172TQFAN'), ((7, 214), 'cevFanN3KC3172TQFANB'), ((7, 215), 'cevFanN3KC3172PQFANB'),
+    ((7, 216), 'cevFanN3KC3172PQFAN'), ((7, 217), 'cevFanN3KC3132FAN'), ((7, 218), 'cevFanN3KC3132FANB'),
+    ((7, 219), 'cevFanDSC9706FAN'), ((7, 222), 'cevFanN9Kc9508FanTray'), ((7, 223), 'cevFanTrayISR4430'),
+    ((7, 225), 'cevFanASR1001XFanTray'), ((7, 226), 'cevFanASR902FanTray'), ((7, 227), 'cevFanN56128FanB'),
+    ((7, 228), 'cevFanN56128FanF'), ((7, 229), 'cevFanDSC48SFAN'), ((7, 230), 'cevFanN9Kc9516FanTray'),
+    ((7, 231), 'cevFanN9Kc9504FanTray'), ((7, 232), 'cevFanN9Kc9300FanTray2B'), ((7, 233), 'cevFanN9Kc9300FanTray2'),
+    ((7, 234), 'cevFanN9Kc9300FanTray1B'), ((7, 235), 'cevFanN9Kc9300FanTray1'), ((7, 236), 'cevFanAsr9922FanV2'),
+    ((7, 237), 'cevFanNXAFAN30CFMB'), ((7, 238), 'cevFanNXAFAN30CFMF'), ((7, 239), 'cevFanASR9001V2'),
+    ((7, 240), 'cevFanN6kC6001FanF'), ((7, 241), 'cevFanN6kC6001FanB'), ((7, 242), 'cevFanNCSFFANTRAY'),
+    ((7, 244), 'cevFanTrayISR4330'), ((7, 245), 'cevFanTrayISR4320'), ((7, 246), 'cevFanASR1000XFanTray'),
+    ((7, 247), 'cevFanAsa5508ChassisFan'), ((7, 248), 'cevFanAsa5508K7ChassisFan'), ((7, 250), 'cevFanAsr9KvV2Fan'),
+    ((7, 251), 'cevFanASR920FanTray15ru'), ((7, 252), 'cevFanASR920FanTray1ru'), ((7, 253), 'cevFanN5K5696FanB'),
+    ((7, 254), 'cevFanN5K5696FanF'), ((7, 255), 'cevFanN77c7702Fan'), ((7, 257), 'cevFanASR9006V2'),
+    ((7, 258), 'cevFanN9KC9300FAN3B'), ((7, 261), 'cevFanSce10000Fan'), ((7, 262), 'cevFanDSC96SFANE'),
+    ((7, 263), 'cevFanDSC96SFANI'), ((7, 264), 'cevFanAsa5516ChassisFan'), ((7, 267), 'cevFanAsr9910Fan'),
+    ((7, 269), 'cevFanDSC9718FAN'), ((7, 275), 'cevFanT3R'), ((7, 276), 'cevFanT3F'), ((7, 279), 'cevFanNCS5001FANBK'),
+    ((7, 280), 'cevFanNCS5001FANFR'), ((7, 281), 'cevFanNCS5002FANFR'), ((7, 282), 'cevFanNCS5002FANBK'),
+    ((7, 285), 'cevFanNCS4K'), ((7, 289), 'cevFanNCS4201'), ((7, 290), 'cevFanASR920FanTray2ruCc'),
+    ((7, 291), 'cevFanNCS1002FanTray'), ((8,), 'cevSensor'), ((8, 11), 'cevSensorMGX8800Temp'),
+    ((8, 12), 'cevSensorMGX8800PSVoltage'), ((8, 13), 'cevSensorMGX8800FanSpeed'), ((8, 14), 'cevSensorONS15540Temp'),
+    ((8, 15), 'cevSensorONS15540Power'), ((8, 16), 'cevSensor7500ChassisInterface'),
+    ((8, 17), 'cevSensorC7300InletTempVoltage'), ((8, 18), 'cevSensorC7300OutletTempVoltage'),
+    ((8, 19), 'cevSensorC7300HotspotTempVoltage'), ((8, 20), 'cevSensorC7300NseDbTempVoltage'),
+    ((8, 21), 'cevSensorC7300PSFanState'), ((8, 22), 'cevSensorC10KInletTemp'), ((8, 23), 'cevSensorC10000CoreTemp'),
+    ((8, 24), 'cevSensorCat4kTemp'), ((8, 25), 'cevSensorONS15530Temp'), ((8, 26), 'cevSensorONS15530Power'),
+    ((8, 27), 'cevSensorVxsmVoltage'), ((8, 28), 'cevSensorVxsmTemp'), ((8, 29), 'cevSensor15302701Temp'),
+    ((8, 30), 'cevSensorUnknown'), ((8, 31), 'cevSensorModuleDeviceTemp'), ((8, 32), 'cevSensorClock'),
+    ((8, 33), 'cevSensorVtt'), ((8, 34), 'cevSensorModulePowerOutputFail'), ((8, 35), 'cevSensorModuleOutletTemp'),
+    ((8, 36), 'cevSensorModuleInletTemp'), ((8, 37), 'cevSensorFanTrayStatus'), ((8, 38), 'cevSensorPSFan'),
+    ((8, 39), 'cevSensorPSOutput'), ((8, 40), 'cevSensorPSInput'), ((8, 41), 'cevSensorCrs1Voltage'),
+    ((8, 42), 'cevSensorCrs1Temp'), ((8, 43), 'cevSensorCrs1Current'), ((8, 44), 'cevSensorCrs1FanSpeed'),
+    ((8, 45), 'cevSensorModuleDeviceVoltage'), ((8, 46), 'cevSensorTransceiverRxPwr'),
+    ((8, 47), 'cevSensorTransceiverTxPwr'), ((8, 48), 'cevSensorTransceiverCurrent'),
+    ((8, 49), 'cevSensorTransceiverVoltage'), ((8, 50), 'cevSensorTransceiverTemp'),
+    ((8, 51), 'cevSensorModuleFanUpgradeRequired'), ((8, 52), 'cevSensorModuleInsufficientCooling'),
+    ((8, 55), 'cevSensorPSFanIncompatible'), ((8, 56), 'cevSensorACE4710K9CPUTemp'),
+    ((8, 57), 'cevSensorACE4710K9AmbientTemp'), ((8, 58), 'cevSensorCpuFanSpeed'),
+    ((8, 59), 'cevSensorACE4710K9DimmFanSpeed'), ((8, 60), 'cevSensorACE4710K9PciFanSpeed'),
+    ((8, 61), 'cevSensorModuleDeviceCurrent'), ((8, 62), 'cevSensorCrs16dcPemB'),
+    ((8, 63), 'cevSensorExternalContact'), ((8, 64), 'cevSensorFanSpeed'), ((8, 65), 'cevSensorCrs1PwrVoltage'),
+    ((8, 66), 'cevSensorCrs1Led'), ((8, 67), 'cevSensorMXE5600Temp'), ((8, 68), 'cevSensorMXE5600FanSpeed'),
+    ((8, 69), 'cevSensorMXE5600Voltage'), ((8, 70), 'cevSensorMXE5600Current'),
+    ((8, 132), 'cevSensorModuleDevicePower'), ((8, 133), 'cevSensorModuleDeviceFanRotation'),
+    ((8, 134), 'cevSensorModuleDevicePressure'), ((8, 135), 'cevSensorVoltagesensor'),
+    ((8, 136), 'cevSensorCursensor'), ((8, 137), 'cevSensorTempsensor'), ((8, 138), 'cevSensorLEDsensor'),
+    ((8, 139), 'cevSensorFanSpeedsensor'), ((8, 140), 'cevSensorMultiSensorModule'),
+    ((8, 141), 'cevSensorPowersensor'), ((8, 143), 'cevSensorDiagStatus'), ((8, 151), 'cevSensorASR5000CardTemp'),
+    ((8, 152), 'cevSensorASR5000CardVoltage'), ((8, 153), 'cevSensorASR5000FanTemp'),
+    ((8, 154), 'cevSensorASR5500CardTemp'), ((8, 155), 'cevSensorASR5500CardVoltage'),
+    ((8, 156), 'cevSensorASR5500CardPower'), ((8, 157), 'cevSensorASR5500CardAirFlow'),
+    ((8, 158), 'cevSensorASR5500CardBinary'), ((8, 159), 'cevSensorASR5500CardPercentage'),
+    ((8, 160), 'cevSensorASR5500CardCurrent'), ((8, 161), 'cevSensorASR5500FanTemp'),
+    ((8, 162), 'cevSensorAsa5508ChassisFanSensor'), ((8, 163), 'cevSensorAsa5508K7ChassisFanSensor'),
+    ((8, 164), 'cevSensorAsa5506CpuTempSensor'), ((8, 165), 'cevSensorAsa5506WCpuTempSensor'),
+    ((8, 166), 'cevSensorAsa5508CpuTempSensor'), ((8, 167), 'cevSensorAsa5506K7CpuTempSensor'),
+    ((8, 168), 'cevSensorAsa5508K7CpuTempSensor'), ((8, 169), 'cevSensorAsa5506AcceleratorTempSensor'),
+    ((8, 170), 'cevSensorAsa5506WAcceleratorTempSensor'), ((8, 171), 'cevSensorAsa5508AcceleratorTempSensor'),
+    ((8, 172), 'cevSensorAsa5506K7AcceleratorTempSensor'), ((8, 173), 'cevSensorAsa5508K7AcceleratorTempSensor'),
+    ((8, 174), 'cevSensorAsa5506ChassisTempSensor'), ((8, 175), 'cevSensorAsa5506WChassisTempSensor'),
+    ((8, 176), 'cevSensorAsa5508ChassisTempSensor'), ((8, 177), 'cevSensorAsa5506K7ChassisTempSensor'),
+    ((8, 178), 'cevSensorAsa5508K7ChassisTempSensor'), ((8, 179), 'cevSensorNCS4kPowersensor'),
+    ((8, 180), 'cevSensorAsa5516ChassisFanSensor'), ((8, 181), 'cevSensorAsa5506HCpuTempSensor'),
+    ((8, 182), 'cevSensorAsa5516CpuTempSensor'), ((8, 183), 'cevSensorAsa5506HAcceleratorTempSensor'),
+    ((8, 184), 'cevSensorAsa5516AcceleratorTempSensor'), ((8, 185), 'cevSensorAsa5506HChassisTempSensor'),
+    ((8, 186), 'cevSensorAsa5516ChassisTempSensor'), ((9,), 'cevModule'), ((9, 1), 'cevModuleUnknownCard'),
+    ((9, 2), 'cevModuleCommonCards'), ((9, 2, 1), 'cevWicSerial1t'), ((9, 2, 5), 'cevWicST3420'),
+    ((9, 2, 6), 'cevWicST2186'), ((9, 2, 7), 'cevWicU3420'), ((9, 2, 8), 'cevWicU2091'),
+    ((9, 2, 9), 'cevWicU20912081'), ((9, 2, 10), 'cevWicST2186Leased'), ((9, 2, 11), 'cevVicFxs'),
+    ((9, 2, 12), 'cevVicFxo'), ((9, 2, 13), 'cevVicEm'), ((9, 2, 14), 'cevAimCompression'),
+    ((9, 2, 16), 'cevWvic1dsuT1'), ((9, 2, 17), 'cevWvic1dsuE1'), ((9, 2, 18), 'cevWvic2dsuT1'),
+    ((9, 2, 19), 'cevWvic2dsuE1'), ((9, 2, 20), 'cevWvic2dsuT1Di'), ((9, 2, 21), 'cevWvic2dsuE1Di'),
+    ((9, 2, 22), 'cevAimEncryption'), ((9, 2, 23), 'cevPmNmToAim'), ((9, 2, 24), 'cevDfc8ce1'),
+    ((9, 2, 25), 'cevDfc8ct1'), ((9, 2, 26), 'cevDfcCt3'), ((9, 2, 27), 'cevDfcNp108'),
+    ((9, 2, 29), 'cevWicSerial2as'), ((9, 2, 30), 'cevWicCsuDsuFT1'), ((9, 2, 31), 'cevIsaIpsecMppe'),
+    ((9, 2, 32), 'cevWicDslsar20150'), ((9, 2, 35), 'cevDfc2ce1'), ((9, 2, 37), 'cevDfcNp60'),
+    ((9, 2, 43), 'cevSpeNp6'), ((9, 2, 47), 'cevWvic2dsuT1DIR'), ((9, 2, 48), 'cevWvic2dsuE1DIR'),
+    ((9, 2, 49), 'cevVic4vpFxsDid'), ((9, 2, 50), 'cevVic4fxoUsM1'), ((9, 2, 51), 'cevVic4fxoM2M3'),
+    ((9, 2, 52), 'cevVic4fxoCAMA'), ((9, 2, 55), 'cevWicEthernet'), ((9, 2, 56), 'cevCeSA6DC'),
+    ((9, 2, 57), 'cevCeSA6AC'), ((9, 2, 58), 'cevCeSA12AC'), ((9, 2, 59), 'cevC2610XM1Fe'),
+    ((9, 2, 60), 'cevC2611XM2Fe'), ((9, 2, 61), 'cevC2620XM1Fe'), ((9, 2, 62), 'cevC2621XM2Fe'),
+    ((9, 2, 63), 'cevC2650XM1Fe'), ((9, 2, 64), 'cevC2651XM2Fe'), ((9, 2, 65), 'cevVic8fxoUsM1'),
+    ((9, 2, 66), 'cevCeSA14'), ((9, 2, 67), 'cevWicDslsar20174Isdn'), ((9, 2, 68), 'cevWicDslsar20174Pots'),
+    ((9, 2, 69), 'cevSpaIpSec2G'), ((9, 2, 70), 'cevNmSe'), ((9, 2, 71), 'cevAimSe'), ((9, 2, 72), 'cevWicSe'),
+    ((9, 2, 73), 'cevCeDs2100'), ((9, 2, 74), 'cevDfc16ce1'), ((9, 2, 75), 'cevDfc16ct1'),
+    ((9, 2, 76), 'cevSpa2pOc3Atm'), ((9, 2, 77), 'cevSpa4pOc3Atm'), ((9, 2, 78), 'cevSpa1pOc12Atm'),
+    ((9, 2, 80), 'cevSpa1pOc48Atm'), ((9, 2, 83), 'cevSpa2pOc3Pos'), ((9, 2, 84), 'cevSpa4pOc3Pos'),
+    ((9, 2, 85), 'cevSpa1pOc12Pos'), ((9, 2, 86), 'cevSpa2pOc12Pos'), ((9, 2, 87), 'cevSpa8pOc12Pos'),
+    ((9, 2, 88), 'cevSpa4pFe7304'), ((9, 2, 89), 'cevSpa2pGe7304'), ((9, 2, 90), 'cevWicEswitch4'),
+    ((9, 2, 91), 'cevWicBri3086u'), ((9, 2, 92), 'cevSpa1pOc192PosRprXfp'), ((9, 2, 94), 'cevSpa1pOc192PosRprSmLr'),
+    ((9, 2, 95), 'cevSpa1pOc192PosRprVsr'), ((9, 2, 96), 'cevSpa2pT3E3Serial'), ((9, 2, 97), 'cevSpa4pT3E3Serial'),
+    ((9, 2, 98), 'cevSpa8pCT1E1'), ((9, 2, 99), 'cevSpa2pCT3'), ((9, 2, 100), 'cevSpa4pCT3'),
+    ((9, 2, 101), 'cevNmAONS'), ((9, 2, 102), 'cevHwic4fe'), ((9, 2, 103), 'cevHwic9fes'),
+    ((9, 2, 104), 'cevHwic4fes'), ((9, 2, 105), 'cevHwic4ilp'), ((9, 2, 106), 'cevHwic9ilp'),
+    ((9, 2, 107), 'cevSpa10pGe'), ((9, 2, 108), 'cevSpa1p10GeXfp'), ((9, 2, 109), 'cevSpa5pGe'),
+    ((9, 2, 115), 'cevSpa2pGe'), ((9, 2, 116), 'cevCompactFlash64MB'), ((9, 2, 117), 'cevCompactFlash128MB'),
+    ((9, 2, 118), 'cevCompactFlash256MB'), ((9, 2, 119), 'cevCompactFlash512MB'), ((9, 2, 120), 'cevCompactFlash'),
+    ((9, 2, 121), 'cevSpa1pChOc3Stm1'), ((9, 2, 122), 'cevFlashCard48MB'), ((9, 2, 123), 'cevFlashCard64MB'),
+    ((9, 2, 124), 'cevFlashCard128MB'), ((9, 2, 125), 'cevFlashCard256MB'), ((9, 2, 126), 'cevFlashCard512MB'),
+    ((9, 2, 127), 'cevFlashCard'), ((9, 2, 128), 'cevHwicdot11abg'), ((9, 2, 129), 'cevHwicdot11bg'),
+    ((9, 2, 130), 'cevAimVpnBp'), ((9, 2, 131), 'cevAimVpnEp'), ((9, 2, 132), 'cevNmVpnMp'),
+    ((9, 2, 133), 'cevAimVpnHp'), ((9, 2, 134), 'cevAimVpnBp2'), ((9, 2, 135), 'cevAimVpnEp2'),
+    ((9, 2, 136), 'cevAimVpnHp2'), ((9, 2, 137), 'cevAimVpnBp2Plus'), ((9, 2, 138), 'cevAimVpnEp2Plus'),
+    ((9, 2, 139), 'cevAimVpnHp2Plus'), ((9, 2, 140), 'cevHwicAdslBriPots'), ((9, 2, 141), 'cevHwicAdslBriIsdn'),
+    ((9, 2, 142), 'cevHwicAdslIsdn'), ((9, 2, 143), 'cevHwicAdslPots'), ((9, 2, 144), 'cevSpa2pOc48PosRprHH'),
+    ((9, 2, 146), 'cevNMCueEc'), ((9, 2, 147), 'cevC180xdot11abg'), ((9, 2, 148), 'cevC180xdot11bg'),
+    ((9, 2, 149), 'cevC180x8ilp'), ((9, 2, 150), 'cevDfcDl108'), ((9, 2, 151), 'cevDfcDl60'),
+    ((9, 2, 152), 'cevNmWlanController'), ((9, 2, 153), 'cevWicCsuDsuFT1v2'), ((9, 2, 154), 'cevSpa8xfeTx'),
+    ((9, 2, 155), 'cevNMIntegratedServiceEngine'), ((9, 2, 156), 'cevNmWaEngine'), ((9, 2, 157), 'cevSpa2pGeV2'),
+    ((9, 2, 158), 'cevSpa5pGeV2'), ((9, 2, 159), 'cevSpa8pGeV2'), ((9, 2, 160), 'cevSpa10pGeV2'),
+    ((9, 2, 161), 'cevSpa1p10GeXfpV2'), ((9, 2, 162), 'cevSpa8xfeTxV2'), ((9, 2, 163), 'cevModuleCrs14OC192IRPlim'),
+    ((9, 2, 164), 'cevSpa8xGe'), ((9, 2, 166), 'cevSpa8xoc3Pos'), ((9, 2, 167), 'cevSpa4xoc12Pos'),
+    ((9, 2, 168), 'cevWic1ShdslV3'), ((9, 2, 169), 'cevUsbFlash'), ((9, 2, 170), 'cevUsbToken'),
+    ((9, 2, 171), 'cevUsbHub'), ((9, 2, 172), 'cevVEncM'), ((9, 2, 173), 'cevUsbDevice'),
+    ((9, 2, 174), 'cevSpa1pOc48PosSfp'), ((9, 2, 175), 'cevSpa4pOc48PosSfp'), ((9, 2, 176), 'cevIpRanOpt4P'),
+    ((9, 2, 177), 'cevAimIps1'), ((9, 2, 178), 'cevAimIps2'), ((9, 2, 180), 'cevNmCips'), ((9, 2, 181), 'cevHwic1fe'),
+    ((9, 2, 182), 'cevHwic2fe'), ((9, 2, 183), 'cevHwicBriU82912'), ((9, 2, 184), 'cevHwicBri4bST'),
+    ((9, 2, 185), 'cevModuleCrs1RPB'), ((9, 2, 186), 'cevModuleCrs1FccSCGe'), ((9, 2, 187), 'cevModuleCrs1SPAInfCard'),
+    ((9, 2, 188), 'cevModule4OC192DptIr'), ((9, 2, 189), 'cevModuleCrs116mFabricCard'),
+    ((9, 2, 190), 'cevHwicAdslPotsAnnexM'), ((9, 2, 191), 'cevSpa4pOc3PosV2'), ((9, 2, 192), 'cevCVRX2SFP'),
+    ((9, 2, 193), 'cevSpaIPSEC2g2'), ((9, 2, 194), 'cevSpa8pCt1e1CemAtm'), ((9, 2, 195), 'cevSpa24pCt1e1CemAtm'),
+    ((9, 2, 196), 'cevSpa2pCt3e3CemAtm'), ((9, 2, 197), 'cevSpa1pChoc3CemAtm'), ((9, 2, 198), 'cevSpa1x10geWlV2'),
+    ((9, 2, 199), 'cevSpa1x10geDwdmV2'), ((9, 2, 200), 'cevSpa1pChoc48Ds3'), ((9, 2, 201), 'cevSpa1pChoc12Ds0'),
+    ((9, 2, 202), 'cevAimAtm8'), ((9, 2, 203), 'cevSpa4xtSerial'), ((9, 2, 204), 'cevSpa1xOC3AtmV2'),
+    ((9, 2, 205), 'cevSpa2xOC3AtmV2'), ((9, 2, 206), 'cevSpa3xOC3AtmV2'), ((9, 2, 207), 'cevSpa1xOC12AtmV2'),
+    ((9, 2, 208), 'cevNmTransOptSrvcEng1'), ((9, 2, 209), 'cevAimTransOptSrvcEng1'),
+    ((9, 2, 210), 'cevNmTransOptSrvcEng2'), ((9, 2, 211), 'cevAimTransOptSrvcEng2'), ((9, 2, 212), 'cevOnboardSe'),
+    ((9, 2, 213), 'cevAimIpsK9'), ((9, 2, 214), 'cevNmeApaModule'), ((9, 2, 215), 'cevHwicVdslPots'),
+    ((9, 2, 216), 'cevHwicVdslIsdn'), ((9, 2, 217), 'cevWsIpsec3'), ((9, 2, 218), 'cevHwic2as'),
+    ((9, 2, 219), 'cevHwic2t'), ((9, 2, 220), 'cevHwic1t'), ((9, 2, 221), 'cevHwic1dsuT1'),
+    ((9, 2, 222), 'cevDsx930418fk9'), ((9, 2, 223), 'cevC7600SSC400'), ((9, 2, 224), 'cevWSSSC600'),
+    ((9, 2, 225), 'cevSpa2pGeSynce'), ((9, 2, 226), 'cevSpa2pChoc12Ds0'), ((9, 2, 227), 'cevAimVpnSsl1'),
+    ((9, 2, 228), 'cevAimVpnSsl2'), ((9, 2, 229), 'cevAimVpnSsl3'), ((9, 2, 230), 'cevWsIpsec2'),
+    ((9, 2, 231), 'cevCVRX2SFP10G'), ((9, 2, 232), 'cevHardDisk'), ((9, 2, 234), 'cevIsmSre300K9'),
+    ((9, 2, 237), 'cevSmSre700K9'), ((9, 2, 239), 'cevSmSre900K9'), ((9, 2, 240), 'cevSpaWmaSw'),
+    ((9, 2, 242), 'cevHwic4ShdslEfm'), ((9, 2, 243), 'cevAimAxp102'), ((9, 2, 244), 'cevAim2Axp104'),
+    ((9, 2, 245), 'cevNmAxp302'), ((9, 2, 246), 'cevNmAxp502'), ((9, 2, 247), 'cevNmAxp522'),
+    ((9, 2, 248), 'cevWicGshdslEfm'), ((9, 2, 249), 'cevNmeIss'), ((9, 2, 250), 'cevNmeVmss216'),
+    ((9, 2, 251), 'cevNmeVmssHp32'), ((9, 2, 252), 'cevNmeVmss2Hp32'), ((9, 2, 253), 'cevNmeVmssHp16'),
+    ((9, 2, 254), 'cevNmeVmss16'), ((9, 2, 260), 'cevNamWaasVirtualBlade'), ((9, 2, 273), 'cevSpaDsp'),
+    ((9, 2, 274), 'cevModuleCrs4S140GFabricCard'), ((9, 2, 275), 'cevModuleCrs8S140GFabricCard'),
+    ((9, 2, 276), 'cevModuleCrs16S140GFabricCard'), ((9, 2, 277), 'cevModuleCrs16S140GFabricCardMulti'),
+    ((9, 2, 278), 'cevModuleCrs1140GFCCSFC'), ((9, 2, 279), 'cevC3KxNm1g'), ((9, 2, 280), 'cevC3KxNm10g'),
+    ((9, 2, 282), 'cevHwic2tC'), ((9, 2, 283), 'cevHwic1tC'), ((9, 2, 284), 'cevHwic4fesC'),
+    ((9, 2, 285), 'cevHwic9fesC'), ((9, 2, 286), 'cevVwic2Mft1G703C'), ((9, 2, 287), 'cevVwic2Mft2G703C'),
+    ((9, 2, 288), 'cevNmEswitch16C'), ((9, 2, 291), 'cevC2960sStack'), ((9, 2, 292), 'cevHardiskIdc'),
+    ((9, 2, 293), 'cevEhwic4esg'), ((9, 2, 294), 'cevEhwicD8esg'), ((9, 2, 295), 'cevEhwicD8esgP'),
+    ((9, 2, 296), 'cevEhwic4esgP'), ((9, 2, 297), 'cevVmssSmSre700K9'), ((9, 2, 298), 'cevVmssSmSre900K9'),
+    ((9, 2, 299), 'cevIssSmSre700K9'), ((9, 2, 300), 'cevIssSmSre900K9'), ((9, 2, 301), 'cevModem3gGsm504A'),
+    ((9, 2, 302), 'cevModem3gGsm504G'), ((9, 2, 303), 'cevCvrCfp4sfp10g'), ((9, 2, 304), 'cevModem3gCdma5728V'),
+    ((9, 2, 305), 'cevModem3gGsmMC8705'), ((9, 2, 306), 'cevModem3gGsmMC8795'), ((9, 2, 313), 'cevModem3gGsmMc8705A'),
+    ((9, 2, 314), 'cevHardDisk8541'), ((9, 2, 315), 'cevHardDisk7571'), ((9, 2, 316), 'cevHardDisk7541'),
+    ((9, 2, 317), 'cevHardDisk694'), ((9, 2, 318), 'cevHardDisk594'), ((9, 2, 319), 'cevHardDisk294'),
+    ((9, 2, 320), 'cevModuleDIMM8541'), ((9, 2, 321), 'cevModuleDIMM7541'), ((9, 2, 322), 'cevModuleDIMM7571'),
+    ((9, 2, 323), 'cevModuleDIMM294'), ((9, 2, 324), 'cevModuleDIMM694'), ((9, 2, 325), 'cevModuleDIMM594'),
+    ((9, 2, 328), 'cevModuleIOM294'), ((9, 2, 329), 'cevModuleIOM594'), ((9, 2, 330), 'cevModuleIOM694'),
+    ((9, 2, 331), 'cevModuleIOM7541'), ((9, 2, 332), 'cevModuleIOM7571'), ((9, 2, 333), 'cevModuleIOM8541'),
+    ((9, 2, 334), 'cevIM8pGeCu'), ((9, 2, 335), 'cevIM8pGeSFP'), ((9, 2, 336), 'cevIM16pT1E1'),
+    ((9, 2, 337), 'cevIM1p10GeXfp'), ((9, 2, 338), 'cevIM4pOc3R1pOc12'), ((9, 2, 343), 'cevEp1p40GeQsfp'),
+    ((9, 2, 344), 'cevEp2p40GeQsfp'), ((9, 2, 350), 'cevMpa2X10GE'), ((9, 2, 351), 'cevMpa4X10GE'),
+    ((9, 2, 352), 'cevMpa20X1GE'), ((9, 2, 353), 'cevMpa1X40GE'), ((9, 2, 354), 'cevMpa2X40GE'),
+    ((9, 2, 359), 'cevModuleNic2x10GeSfp'), ((9, 2, 360), 'cevModuleNic4x10GeSfp'),
+    ((9, 2, 361), 'cevModuleNic4x1GeSfp'), ((9, 2, 362), 'cevModule4portNic4x1GeCu'),
+    ((9, 2, 363), 'cevModule1xNitrox3'), ((9, 2, 364), 'cevModule4xNitrox3'), ((9, 2, 365), 'cevSpaHDwbdSfp'),
+    ((9, 2, 366), 'cevSpa8pT3E3Serial'), ((9, 2, 367), 'cevSolidStateDisk8541'),
+    ((9, 2, 368), 'cevSolidStateDisk7541'), ((9, 2, 369), 'cevSolidStateDisk7571'),
+    ((9, 2, 370), 'cevSolidStateDisk694'), ((9, 2, 371), 'cevSolidStateDisk594'),
+    ((9, 2, 372), 'cevSolidStateDisk294'), ((9, 2, 373), 'cevWaveInlnGe4T'), ((9, 2, 374), 'cevWaveInlnGe8T'),
+    ((9, 2, 375), 'cevWaveInlnGe4SX'), ((9, 2, 376), 'cevWave10Ge2SFP'), ((9, 2, 377), 'cevIM32pT1E1'),
+    ((9, 2, 378), 'cevA9kMpa8X10GE'), ((9, 2, 379), 'cevA9KMpa8X10GE'), ((9, 2, 380), 'cevIom4GeInln'),
+    ((9, 2, 381), 'cevIom8GeInln'), ((9, 2, 382), 'cevIom4GefInln'), ((9, 2, 383), 'cevIom2X10Ge'),
+    ((9, 2, 384), 'cevSfpH10GbCu5M'), ((9, 2, 385), 'cevWaveScGe12T'), ((9, 2, 386), 'cevWaveScGe12Sfp'),
+    ((9, 2, 387), 'cevWaveSc10Ge4Sfp'), ((9, 2, 388), 'cevWaveApnvGe12T'), ((9, 2, 389), 'cevWaveApnvGe12Sfp'),
+    ((9, 2, 390), 'cevWaveApnv10Ge4Sfp'), ((9, 2, 403), 'cevModuleNCSFCS'), ((9, 2, 404), 'cevModuleNCS10X100GMK'),
+    ((9, 2, 405), 'cevModuleNCS10X100GMP'), ((9, 2, 406), 'cevModuleNCSRP'), ((9, 2, 407), 'cevIM14pSerial'),
+    ((9, 2, 413), 'cevModuleNCSCRFT'), ((9, 2, 414), 'cevModuleCommonCardsPSEASIC'),
+    ((9, 2, 415), 'cevModuleCommonCardsFIA'), ((9, 2, 418), 'cevModulePowerController'),
+    ((9, 2, 419), 'cevModuleDIMM'), ((9, 2, 420), 'cevModuleNCS10X100GLP'), ((9, 2, 421), 'cevModuleNCS10X100GLK'),
+    ((9, 2, 422), 'cevModuleFPD'), ((9, 2, 423), 'cevModuleI2CMUX'), ((9, 2, 424), 'cevModulePCIESwitch'),
+    ((9, 2, 425), 'cevModuleStorage'), ((9, 2, 426), 'cevModuleControlSwitch'), ((9, 2, 427), 'cevModuleC3KxNm4x10g'),
+    ((9, 2, 429), 'cevModuleNC6410X100GMK'), ((9, 2, 430), 'cevModuleNC6610X100GLK'),
+    ((9, 2, 445), 'cevModulePseAsicPlim'), ((9, 2, 446), 'cevModuleCisco60P10GeSFPPlusLsrLC'),
+    ((9, 2, 447), 'cevModuleCisco30P10GeSFPPlusLsrLC'), ((9, 2, 448), 'cevModuleCisco15P10GeSFPPlusLsrLC'),
+    ((9, 2, 449), 'cevModuleCisco15P10GeSFPPlusLC'), ((9, 2, 450), 'cevModuleCisco30P10GeSFPPlusLC'),
+    ((9, 2, 451), 'cevModuleCisco60P10GeSFPPlusLC'), ((9, 2, 452), 'cevModuleVirtualBlade'),
+    ((9, 2, 453), 'cevModuleASA55125515ASAIC6GECUA'), ((9, 2, 454), 'cevModuleASA5525ASAIC6GECUB'),
+    ((9, 2, 455), 'cevModuleASA55455555ASAIC6GECUC'), ((9, 2, 456), 'cevModuleASA55125515ASAIC6GESFPA'),
+    ((9, 2, 457), 'cevModuleASA5525ASAIC6GESFPB'), ((9, 2, 458), 'cevModuleASA55455555ASAIC6GESFPC'),
+    ((9, 2, 459), 'cevModuleNCS4KDCPWF'), ((9, 2, 460), 'cevModuleNCS4KECU'), ((9, 2, 470), 'cevPEhwic4Esg'),
+    ((9, 2, 471), 'cevPEhwicD8Esg'), ((9, 2, 472), 'cevPWic1BStV3'), ((9, 2, 473), 'cevPhwic1Adsl'),
+    ((9, 2, 474), 'cevPhwic1Adslm'), ((9, 2, 475), 'cevPHwic1Dsut1'), ((9, 2, 476), 'cevPHwic1t'),
+    ((9, 2, 477), 'cevPHwic2as'), ((9, 2, 478), 'cevPHwic2Fe'), ((9, 2, 479), 'cevPHwic2t'),
+    ((9, 2, 480), 'cevPIsmSre300K9'), ((9, 2, 481), 'cevSpa14pSaSerial'), ((9, 2, 483), 'cevModuleCrs1FccSc22GeB'),
+    ((9, 2, 484), 'cevPEhwicVaMMDslA'), ((9, 2, 485), 'cevPEhwicVaMMDslM'), ((9, 2, 486), 'cevSPA1XOC12PS'),
+    ((9, 2, 487), 'cevModuleNCSFSCSW'), ((9, 2, 488), 'cevModuleNCSFSC'), ((9, 2, 489), 'cevModuleNCSFFC'),
+    ((9, 2, 490), 'cevModuleNC6FCMC'), ((9, 2, 491), 'cevModuleA900IMA8S1Z'), ((9, 2, 492), 'cevModuleA900IMA8T1Z'),
+    ((9, 2, 493), 'cevModuleA900IMA2Z'), ((9, 2, 494), 'cevModuleNCS4009FCS'),
+    ((9, 2, 495), 'cevModuleNCS4KEthContMod'), ((9, 2, 496), 'cevModuleNCS4KProcContHub'),
+    ((9, 2, 497), 'cevModuleNCS4KCPU'), ((9, 2, 498), 'cevModuleNCS4KDaughterboard'),
+    ((9, 2, 499), 'cevModuleNCS4KMotherboard'), ((9, 2, 500), 'cevModuleNCS4KASIC'),
+    ((9, 2, 501), 'cevModuleNCS4KGENNUM'), ((9, 2, 502), 'cevModuleNCS4KEAGLE'),
+    ((9, 2, 503), 'cevModuleNCS4KGEARBOX'), ((9, 2, 504), 'cevModuleNCS4KCRFT'), ((9, 2, 505), 'cevModuleNCSFCB2B'),
+    ((9, 2, 506), 'cevModuleNCSSfpPlusOpticsMod'), ((9, 2, 507), 'cevModuleNCS6KSRTCAM'),
+    ((9, 2, 508), 'cevModuleNCS6K210X100GMK'), ((9, 2, 509), 'cevModuleNCS6K210X100GLK'),
+    ((9, 2, 510), 'cevModuleNCS6K230X10GMS'), ((9, 2, 511), 'cevModuleNCS6K230X10GLS'),
+    ((9, 2, 512), 'cevModuleSPAETHER24xGE4x10GECU'), ((9, 2, 513), 'cevModuleSPAETHER24xGE4x10GESFP'),
+    ((9, 2, 514), 'cevModuleSPAETHER24xGE4x10GE'), ((9, 2, 515), 'cevModuleSPAETHER12xGE2x10GEDUAL'),
+    ((9, 2, 516), 'cevModuleSPAETHER2xGE4x10GEDUAL'), ((9, 2, 517), 'cevModuleSPAETHER10xGE2x10GEDUAL'),
+    ((9, 2, 518), 'cevModuleA900IMA32D'), ((9, 2, 519), 'cevModuleA900IMA8D'), ((9, 2, 521), 'cevModuleC3KxNm8x10g'),
+    ((9, 2, 522), 'cevModuleC3KxNm2x40g'), ((9, 2, 530), 'cevCVRCFP2CPAK10'), ((9, 2, 531), 'cevCVRCFP2CPAK4'),
+    ((9, 2, 532), 'cevCVR4SFP10GQSFP'), ((9, 2, 533), 'cevModuleNC55RP'), ((9, 2, 534), 'cevModuleNC55SC'),
+    ((9, 2, 537), 'cevModuleNCS4K2HOPWC2'), ((9, 2, 545), 'cevMpa20X10GE'), ((9, 2, 546), 'cevModuleNC6FCU'),
+    ((9, 2, 549), 'cevModuleNcs4K4HOPK'), ((9, 2, 550), 'cevModuleNC620x100GEMC'),
+    ((9, 2, 551), 'cevModuleNC6FanTray2'), ((9, 2, 552), 'cevModuleCVRCPAKQSFP40'),
+    ((9, 2, 554), 'cevModuleNCS5001ACCKIT'), ((9, 2, 555), 'cevModuleNCS5002ACCKIT'),
+    ((9, 2, 556), 'cevModuleNCS5002FLTBK'), ((9, 2, 557), 'cevModuleNCS5002FLTFR'), ((9, 2, 568), 'cevMpa2X100GE'),
+    ((9, 2, 590), 'cevModuleNCS42001HPK'), ((9, 2, 591), 'cevModuleNCS42001T8LRPS'),
+    ((9, 2, 592), 'cevModuleNCS42001T16GPS'), ((9, 2, 593), 'cevModuleNCS42008E1T1CE'),
+    ((9, 2, 594), 'cevModuleNCS42001T8S20CS'), ((9, 2, 595), 'cevModuleNCS420048T1E1CE'),
+    ((9, 2, 596), 'cevModuleNCS420048T3E3CE'), ((9, 2, 597), 'cevModuleNCS42001T8S10CS'),
+    ((9, 2, 598), 'cevModuleNCS42008TPS'), ((9, 2, 599), 'cevModuleNCS42002QP'),
+    ((9, 2, 600), 'cevModuleNCS42001T8S10MS'), ((9, 2, 608), 'cevModuleSPAETHER12XGE4X10GE'),
+    ((9, 2, 609), 'cevModuleA9KMPA20X10GECM'), ((9, 3), 'cevModuleC36xxType'), ((9, 3, 1), 'cevPmCpm1e2w'),
+    ((9, 3, 2), 'cevPmCpm2e2w'), ((9, 3, 3), 'cevPmCpm1e1r2w'), ((9, 3, 4), 'cevPmCt1Csu'),
+    ((9, 3, 5), 'cevPm2ct1Csu'), ((9, 3, 6), 'cevPmCt1Dsx1'), ((9, 3, 7), 'cevPm2ct1Dsx1'),
+    ((9, 3, 8), 'cevPmCe1Balanced'), ((9, 3, 9), 'cevPm2ce1Balanced'), ((9, 3, 10), 'cevPmCe1Unbalanced'),
+    ((9, 3, 11), 'cevPm2ce1Unbalanced'), ((9, 3, 12), 'cevPm4bU'), ((9, 3, 13), 'cevPm4bSt'), ((9, 3, 14), 'cevPm8bU'),
+    ((9, 3, 15), 'cevPm8bSt'), ((9, 3, 16), 'cevPm4as'), ((9, 3, 17), 'cevPm8as'), ((9, 3, 18), 'cevPm4e'),
+    ((9, 3, 19), 'cevPm1e'), ((9, 3, 21), 'cevPmM4t'), ((9, 3, 22), 'cevPm16a'), ((9, 3, 23), 'cevPm32a'),
+    ((9, 3, 24), 'cevPmC36001fe'), ((9, 3, 25), 'cevPmC3600Compression'), ((9, 3, 26), 'cevPmDmodem'),
+    ((9, 3, 27), 'cevPm8admodem'), ((9, 3, 28), 'cevPm16admodem'), ((9, 3, 29), 'cevVpm2v'), ((9, 3, 30), 'cevVpm4v'),
+    ((9, 3, 31), 'cevPmC36001feTx'), ((9, 3, 32), 'cevPmC36001feFx'), ((9, 3, 33), 'cevPm1fe1t1'),
+    ((9, 3, 34), 'cevPm1fe2t1'), ((9, 3, 35), 'cevPm1fe1e1'), ((9, 3, 36), 'cevPm1fe2e1'),
+    ((9, 3, 37), 'cevPm1fe1t1Csu'), ((9, 3, 38), 'cevPm1fe2t1Csu'), ((9, 3, 39), 'cevC36xx2feTx'),
+    ((9, 3, 40), 'cevPmOc3mm'), ((9, 3, 41), 'cevPmOc3mmVpd'), ((9, 3, 42), 'cevPmOc3smiVpd'),
+    ((9, 3, 43), 'cevPmOc3smlVpd'), ((9, 3, 44), 'cevPmOc3sml'), ((9, 3, 45), 'cevPmOc3smi'),
+    ((9, 3, 46), 'cevVic2fxoEu'), ((9, 3, 47), 'cevVic2fxoM3'), ((9, 3, 48), 'cevVic2fxoM4'),
+    ((9, 3, 49), 'cevVic2fxoM5'), ((9, 3, 50), 'cevVic2fxoM6'), ((9, 3, 51), 'cevVic2fxoM7'),
+    ((9, 3, 52), 'cevVic2fxoM8'), ((9, 3, 53), 'cevVic2ST2086'), ((9, 3, 54), 'cevHdv'), ((9, 3, 59), 'cevNm1fe2w'),
+    ((9, 3, 60), 'cevNm2fe2w'), ((9, 3, 61), 'cevNm1fe1r2w'), ((9, 3, 62), 'cevNm2w'), ((9, 3, 63), 'cevC36xx1feTx'),
+    ((9, 3, 64), 'cevAimLc4e1Compression'), ((9, 3, 65), 'cevVic2fxoM1'), ((9, 3, 68), 'cevVic2fxoM2'),
+    ((9, 3, 69), 'cevPmDs3'), ((9, 3, 70), 'cevPmE3'), ((9, 3, 74), 'cevVic2vpFxsDid'),
+    ((9, 3, 75), 'cevVic2ST2086NtTe'), ((9, 3, 76), 'cevNmAic64'), ((9, 3, 77), 'cevMIX366064'),
+    ((9, 3, 78), 'cevWicAsync1am'), ((9, 3, 79), 'cevWicAsync2am'), ((9, 3, 81), 'cevAim4Dsps'),
+    ((9, 3, 82), 'cevHdaNm4fxs'), ((9, 3, 84), 'cevC2610M'), ((9, 3, 85), 'cevC2611M'), ((9, 3, 91), 'cevNm1t3e3'),
+    ((9, 3, 92), 'cevNm1ct3e3'), ((9, 3, 93), 'cevNm8ct1e1'), ((9, 3, 94), 'cevHdaEm4fxo'), ((9, 3, 95), 'cevNm16AS'),
+    ((9, 3, 102), 'cevNm1ct1e1Pri'), ((9, 3, 103), 'cevNm2ct1e1Pri'), ((9, 3, 104), 'cevNmCeoip4t1e1'),
+    ((9, 3, 105), 'cevNmCeoip4Serial'), ((9, 3, 106), 'cevNm1aOc3mmEp'), ((9, 3, 107), 'cevNm1aOc3smiEp'),
+    ((9, 3, 108), 'cevNm1aOc3smlEp'), ((9, 3, 109), 'cevNmCids'), ((9, 3, 119), 'cevHwic1GeSfp'),
+    ((9, 3, 120), 'cevPortHdDsp'), ((9, 3, 121), 'cevHdv2port0'), ((9, 3, 122), 'cevHdv2port2'),
+    ((9, 3, 123), 'cevHdv2port1'), ((9, 3, 124), 'cevNmAtm25'), ((9, 3, 125), 'cevNmNam'), ((9, 3, 126), 'cevNm8amV2'),
+    ((9, 3, 127), 'cevNm16amV2'), ((9, 3, 129), 'cevCpuC28112fe'), ((9, 3, 130), 'cevCpuC28212ge'),
+    ((9, 3, 131), 'cevCpuC28512ge'), ((9, 3, 132), 'cevHWicSerial4t'), ((9, 3, 133), 'cevHWicSerial4as'),
+    ((9, 3, 134), 'cevHWicSerial8as'), ((9, 3, 135), 'cevHWicSerial8a'), ((9, 3, 136), 'cevHWicSerial16a'),
+    ((9, 3, 137), 'cevNm1AOc3Pom'), ((9, 3, 146), 'cevHWic1DOCSIS20CableModem'), ((9, 3, 148), 'cevNm8ce1t1Pri'),
+    ((9, 3, 149), 'cevHWic4t1e1'), ((9, 3, 150), 'cevHWic2ce1t1Pri'), ((9, 3, 151), 'cevHWic1ce1t1Pri'),
+    ((9, 3, 152), 'cevHWic1DOCSIS20CableModemEJ'), ((9, 3, 154), 'cevHwic1t1e1'), ((9, 3, 157), 'cevHwic4Shdsl'),
+    ((9, 3, 158), 'cevHwic2Shdsl'), ((9, 3, 159), 'cevNmRvpnSterra'), ((9, 3, 160), 'cevNmRvpn'),
+    ((9, 3, 161), 'cevNmSpclSrvcEng'), ((9, 3, 162), 'cevNmIntgrtdSrvcEng2'), ((9, 3, 163), 'cevHWIC1Ser'),
+    ((9, 3, 164), 'cevHWIC2Ser'), ((9, 3, 165), 'cevInternalServiceModuleAIM'), ((9, 3, 167), 'cevSm1nm'),
+    ((9, 3, 168), 'cevSm2k15Es1GePoe'), ((9, 3, 169), 'cevSm3k15Es1GePoe'), ((9, 3, 170), 'cevSm3k16GePoe'),
+    ((9, 3, 171), 'cevSm2k23Es1Ge'), ((9, 3, 172), 'cevSm2k23Es1GePoe'), ((9, 3, 173), 'cevSm3k23Es1GePoe'),
+    ((9, 3, 174), 'cevSm3k24GePoe'), ((9, 3, 175), 'cevSmXd2k48Es2SFP'), ((9, 3, 176), 'cevSmXd3k48Es2SFPPoe'),
+    ((9, 3, 177), 'cevSmXd3k48Ge2SFPPoe'), ((9, 3, 180), 'cevHwic4ce1t1Pri'), ((9, 3, 181), 'cevEHwic1GeSfpCu'),
+    ((9, 3, 182), 'cevEhwic3gEvdo'), ((9, 3, 183), 'cevEhwic3gHspaU'), ((9, 3, 184), 'cevSm1pa'),
+    ((9, 3, 185), 'cevSm1Stm1Smi'), ((9, 3, 186), 'cevSm1Stm1Mm'), ((9, 3, 187), 'cevEhwic3gHspa7'),
+    ((9, 3, 188), 'cevIsmVpnSsl3'), ((9, 3, 189), 'cevIsmVpnSsl2'), ((9, 3, 190), 'cevIsmVpnSsl1'),
+    ((9, 3, 191), 'cevEhwic3gHspa7A'), ((9, 3, 192), 'cevEhwic3gMm'), ((9, 3, 193), 'cevEhwic4gLteA'),
+    ((9, 3, 194), 'cevEhwic4gLteG'), ((9, 3, 195), 'cevEhwic4gLteV'), ((9, 3, 196), 'cevSm1T3E3'),
+    ((9, 3, 197), 'cevSM32A'), ((9, 3, 202), 'cevSmD48FxsE'), ((9, 3, 203), 'cevSmD72Fxs'),
+    ((9, 3, 206), 'cevNgsmXd3k48ge2sfpPoeplus'), ((9, 3, 207), 'cevNgsm3k24gePoeplus'),
+    ((9, 3, 208), 'cevNgsm3k16gePoeplus'), ((9, 3, 209), 'cevGrwicSerial4t'), ((9, 3, 210), 'cevEhwic4gLteJp'),
+    ((9, 3, 211), 'cevEhwic4gLteBe'), ((9, 3, 212), 'cevPEhwic1GeSfpCu'), ((9, 3, 213), 'cevPEhwic3gHspa7'),
+    ((9, 3, 214), 'cevPHwicSerial16a'), ((9, 3, 215), 'cevPhwic1Ce1T1Pri'), ((9, 3, 216), 'cevPHwic2Ce1t1Pri'),
+    ((9, 3, 217), 'cevPHwicSerial4As'), ((9, 3, 218), 'cevPHwicSerial4t'), ((9, 3, 219), 'cevPHwic4T1E1'),
+    ((9, 3, 220), 'cevPHwicSerial8a'), ((9, 3, 221), 'cevPHwicSerial8as'), ((9, 3, 222), 'cevPIsmVpn29'),
+    ((9, 3, 223), 'cevPVic2Fxo2'), ((9, 3, 224), 'cevPVic2Fxo4'), ((9, 3, 225), 'cevPSm2k23Es1Ge'),
+    ((9, 3, 226), 'cevPSm3k16GePoe'), ((9, 3, 227), 'cevPSmXd2k48Es2SFP'), ((9, 3, 228), 'cevPSmXd3k48Es2SFPPoe'),
+    ((9, 3, 229), 'cevPSmXd3k48Ge2SFPPoe'), ((9, 3, 230), 'cevPSm2k15Es1GePoe'), ((9, 3, 231), 'cevPSm2k23Es1GePoe'),
+    ((9, 3, 232), 'cevPSm3k15Es1GePoe'), ((9, 3, 233), 'cevPSm3k23Es1GePoe'), ((9, 3, 234), 'cevPSm3k24GePoe'),
+    ((9, 3, 235), 'cevPSm1nm'), ((9, 3, 236), 'cevPHdv2port2'), ((9, 3, 246), 'cevEhwic4gLteLA'),
+    ((9, 3, 247), 'cevEhwic4gLteCI'), ((9, 3, 248), 'cevEhwic4gLteJN'), ((9, 4), 'cevModuleVipPortAdapters'),
+    ((9, 4, 1), 'cevPa1fe'), ((9, 4, 2), 'cevPa8e'), ((9, 4, 3), 'cevPa4e'), ((9, 4, 4), 'cevPa5e'),
+    ((9, 4, 5), 'cevPa4t'), ((9, 4, 6), 'cevPa4r'), ((9, 4, 7), 'cevPaFddi'), ((9, 4, 8), 'cevSaEncryption'),
+    ((9, 4, 9), 'cevPaAh1t'), ((9, 4, 10), 'cevPaAh2t'), ((9, 4, 12), 'cevPaA8tV35'), ((9, 4, 13), 'cevPa1feTxIsl'),
+    ((9, 4, 14), 'cevPa1feFxIsl'), ((9, 4, 15), 'cevPa1feTxNisl'), ((9, 4, 16), 'cevSaCompression'),
+    ((9, 4, 17), 'cevPaAtmLite1'), ((9, 4, 18), 'cevPaCt3'), ((9, 4, 19), 'cevPaOc3smMuxCbrt1'),
+    ((9, 4, 20), 'cevPaOc3smMuxCbr120e1'), ((9, 4, 21), 'cevPaOc3smMuxCbr75e1'), ((9, 4, 22), 'cevPaOc3mmMuxCbrt1'),
+    ((9, 4, 23), 'cevPaOc3mmMuxCbr120e1'), ((9, 4, 24), 'cevPaOc3mmMuxCbr75e1'), ((9, 4, 25), 'cevPaDs3MuxCbrt1'),
+    ((9, 4, 26), 'cevPaE3MuxCbr120e1'), ((9, 4, 27), 'cevPaE3smMuxCbr75e1'), ((9, 4, 28), 'cevPa8bSt'),
+    ((9, 4, 29), 'cevPa4bU'), ((9, 4, 30), 'cevPaFddiFd'), ((9, 4, 31), 'cevPaJt2'), ((9, 4, 32), 'cevPaPosdw'),
+    ((9, 4, 33), 'cevPa4me1Bal'), ((9, 4, 34), 'cevPa2ce1Balanced'), ((9, 4, 35), 'cevPa2ct1'),
+    ((9, 4, 36), 'cevPa1vg'), ((9, 4, 37), 'cevPaAtmdxDs3'), ((9, 4, 38), 'cevPaAtmdxE3'),
+    ((9, 4, 39), 'cevPaAtmdxSmlOc3'), ((9, 4, 40), 'cevPaAtmdxSmiOc3'), ((9, 4, 41), 'cevPaAtmdxMmOc3'),
+    ((9, 4, 42), 'cevPaA8tX21'), ((9, 4, 43), 'cevPaA8tRs232'), ((9, 4, 44), 'cevPa4me1Unbal'),
+    ((9, 4, 45), 'cevPa4rFdx'), ((9, 4, 46), 'cevPa1e3'), ((9, 4, 47), 'cevPa2e3'), ((9, 4, 48), 'cevPa1t3'),
+    ((9, 4, 49), 'cevPa2t3'), ((9, 4, 50), 'cevPa2ce1Unbalanced'), ((9, 4, 51), 'cevPa14eSwitch'),
+    ((9, 4, 52), 'cevas58001fedsi'), ((9, 4, 53), 'cevPa1feFxNisl'), ((9, 4, 54), 'cevPaIo1fe'),
+    ((9, 4, 55), 'cevPaIo'), ((9, 4, 56), 'cevPa2feTx'), ((9, 4, 57), 'cevPa2feFx'), ((9, 4, 59), 'cevPaGe'),
+    ((9, 4, 60), 'cevPaPosswSm'), ((9, 4, 61), 'cevPaPosswMm'), ((9, 4, 62), 'cevPaPosswLr'),
+    ((9, 4, 63), 'cevPa4ct1Csu'), ((9, 4, 64), 'cevPa8ct1Csu'), ((9, 4, 65), 'cevPa8ct1'), ((9, 4, 66), 'cevPa8ce1'),
+    ((9, 4, 67), 'cevPaVxc2t1e1'), ((9, 4, 68), 'cevPaVxb2t1e1'), ((9, 4, 69), 'cevPaAtmOc12Mm'),
+    ((9, 4, 70), 'cevPaAtmOc12Smi'), ((9, 4, 71), 'cevPaMct3'), ((9, 4, 72), 'cevPaMc2t3'),
+    ((9, 4, 73), 'cevPa1t3Plus'), ((9, 4, 74), 'cevPa2t3Plus'), ((9, 4, 75), 'cevPaPosOc12Mm'),
+    ((9, 4, 76), 'cevPaPosOc12Sm'), ((9, 4, 77), 'cevPaImaT1'), ((9, 4, 78), 'cevPaImaE1'),
+    ((9, 4, 79), 'cevSrpPaOc12Mm'), ((9, 4, 80), 'cevSrpPaOc12SmIr'), ((9, 4, 81), 'cevSrpPaOc12Lr'),
+    ((9, 4, 82), 'cevPa2ct1Csu'), ((9, 4, 83), 'cevPa2ce1'), ((9, 4, 84), 'cevPaMcx2te1'),
+    ((9, 4, 85), 'cevPaMcx4te1'), ((9, 4, 86), 'cevPaMcx8te1'), ((9, 4, 87), 'cevSrpPaOc12SmXr'),
+    ((9, 4, 90), 'cevPaMcStm1Smi'), ((9, 4, 91), 'cevPaMcStm1Mm'), ((9, 4, 92), 'cevPa2feTxI82543'),
+    ((9, 4, 93), 'cevPa2feFxI82543'), ((9, 4, 94), 'cevPaDualWideGe'), ((9, 4, 95), 'cevPaVxa1T1E124'),
+    ((9, 4, 96), 'cevPaVxa1T1E130'), ((9, 4, 97), 'cevPaMcT1E1'), ((9, 4, 99), 'cevPaMcx8te1M'),
+    ((9, 4, 100), 'cevPa1ce3'), ((9, 4, 101), 'cevPa2OC3PosSw'), ((9, 4, 102), 'cevPa2feFxIsl'),
+    ((9, 4, 103), 'cevPa4Dtr'), ((9, 4, 104), 'cevPaVmHda8FxsDid'), ((9, 4, 105), 'cevPa1OC3PosSw'),
+    ((9, 4, 106), 'cevPaA6mmOc3'), ((9, 4, 107), 'cevPaA6SmiOc3'), ((9, 4, 108), 'cevPaA6SmlOc3'),
+    ((9, 4, 109), 'cevPaA6Ds3'), ((9, 4, 110), 'cevPaA6E3'), ((9, 4, 111), 'cevPaMcx4te1Q'),
+    ((9, 4, 112), 'cevPaMct3ec'), ((9, 4, 113), 'cevPaMc2t3ec'), ((9, 4, 114), 'cevPa1t3e3ec'),
+    ((9, 4, 115), 'cevPa2t3e3ec'), ((9, 5), 'cevModuleCpuType'), ((9, 5, 1), 'cevC7200Io1fe'),
+    ((9, 5, 2), 'cevC7200Io'), ((9, 5, 3), 'cevCpuAS5300'), ((9, 5, 7), 'cevCpuRpm'), ((9, 5, 8), 'cevCpu2600'),
+    ((9, 5, 9), 'cevCpu7200Npe300'), ((9, 5, 10), 'cevCpu1400'), ((9, 5, 11), 'cevCpu800'),
+    ((9, 5, 12), 'cevCpuPSM1Gbps'), ((9, 5, 14), 'cevCpu7200Npe175'), ((9, 5, 15), 'cevCpu7200Npe225'),
+    ((9, 5, 17), 'cevCpu1417'), ((9, 5, 18), 'cevCpuPsm11oc12'), ((9, 5, 19), 'cevCpuOpticalRegenerator'),
+    ((9, 5, 20), 'cevCpuUbr924'), ((9, 5, 21), 'cevCpu7120'), ((9, 5, 22), 'cevCpu7140'),
+    ((9, 5, 23), 'cevCpuPsm12t3e3'), ((9, 5, 24), 'cevCpuPsm14oc3'), ((9, 5, 26), 'cevCpu7200Npe100'),
+    ((9, 5, 27), 'cevCpu7200Npe150'), ((9, 5, 28), 'cevCpu7200Npe200'), ((9, 5, 29), 'cevCpuCreRp'),
+    ((9, 5, 30), 'cevCpuCreFp'), ((9, 5, 31), 'cevCpuAs5400'), ((9, 5, 34), 'cevCpuAS5200'), ((9, 5, 35), 'cevCpuGrp'),
+    ((9, 5, 36), 'cevCpuMc3810V3'), ((9, 5, 38), 'cevCpuAs5850'), ((9, 5, 39), 'cevCpu7200Npe400'),
+    ((9, 5, 40), 'cevCpuAs5350'), ((9, 5, 41), 'cevCpuRsp4Plus'), ((9, 5, 42), 'cevCpuUbr91x'),
+    ((9, 5, 43), 'cevCpu7150'), ((9, 5, 44), 'cevCpuPXMB45Gbps'), ((9, 5, 47), 'cevCpuONS15540'),
+    ((9, 5, 48), 'cevCpuRsp16'), ((9, 5, 49), 'cevCpuPrp1'), ((9, 5, 50), 'cevCpuC7300Nse100'),
+    ((9, 5, 51), 'cevCpuPXM1E1Gbps'), ((9, 5, 52), 'cevCpuPXM1E2Oc12'), ((9, 5, 53), 'cevCpuPXM1E8Oc3'),
+    ((9, 5, 54), 'cevCpuPXM1E8T3E3'), ((9, 5, 55), 'cevCpuPXM1EComboT3E3Oc3'), ((9, 5, 56), 'cevCpu7200Npeg1'),
+    ((9, 5, 57), 'cevCpu26912fe'), ((9, 5, 58), 'cevCpu37452fe'), ((9, 5, 59), 'cevCpu37252fe'),
+    ((9, 5, 60), 'cevCpu36311fe'), ((9, 5, 61), 'cevCpu19002fe'), ((9, 5, 62), 'cevCpuONS15530SW'),
+    ((9, 5, 63), 'cevCpu6400Nsp'), ((9, 5, 64), 'cevCpu6400Nrp'), ((9, 5, 65), 'cevCpu6400Nrp2'),
+    ((9, 5, 66), 'cevCpu6400Nrp2Sv'), ((9, 5, 67), 'cevCpuPXM1E4Oc3'), ((9, 5, 68), 'cevCpu1700'),
+    ((9, 5, 71), 'cevCpu7301Npeg1'), ((9, 5, 72), 'cevCpuPXM1E16t1e1'), ((9, 5, 73), 'cevCpu7300Nse100Plus'),
+    ((9, 5, 74), 'cevCpuPxm1eB8t3e34Oc3'), ((9, 5, 75), 'cevCpu4604'), ((9, 5, 76), 'cevCpu4224'),
+    ((9, 5, 77), 'cevCpuAs5400HPX'), ((9, 5, 78), 'cevCpuAs5350HPX'), ((9, 5, 80), 'cevCpuAs5850tb'),
+    ((9, 5, 81), 'cevCpuC7300Npeg100'), ((9, 5, 82), 'cevCpuMdsCpp'), ((9, 5, 83), 'cevCpuMdsDpp'),
+    ((9, 5, 84), 'cevCpuMdsSup'), ((9, 5, 85), 'cevCpu2430Iad24Fxs'), ((9, 5, 86), 'cevCpu2431Iad8Fxs'),
+    ((9, 5, 87), 'cevCpu2431Iad16Fxs'), ((9, 5, 88), 'cevCpu2431Iad1T1E1'), ((9, 5, 89), 'cevCpu2432Iad24Fxs'),
+    ((9, 5, 90), 'cevCpu3220'), ((9, 5, 91), 'cevCpuVG224'), ((9, 5, 92), 'cevCpuCat6kWsSup720RP'),
+    ((9, 5, 93), 'cevCpuCat6kMsfc'), ((9, 5, 94), 'cevCpuCat6kMsfc2'), ((9, 5, 95), 'cevCpuCat6kWsxSup12ge'),
+    ((9, 5, 96), 'cevCpuCat6kWsxSup22ge'), ((9, 5, 97), 'cevCpuCat6kWsxSup1a2ge'),
+    ((9, 5, 98), 'cevCpuCat6kWsSup720SP'), ((9, 5, 99), 'cevCpu3845ge2'), ((9, 5, 100), 'cevCpu3825ge2'),
+    ((9, 5, 101), 'cevCpuCrs1AsmpRoute'), ((9, 5, 102), 'cevCpuCrs1DsmpRoute'), ((9, 5, 103), 'cevCpuCrs1pfeAsic'),
+    ((9, 5, 104), 'cevCpuCrs1EgressqAsic'), ((9, 5, 105), 'cevCpuCrs1FabricqAsic'),
+    ((9, 5, 106), 'cevCpuCrs1IngressqAsic'), ((9, 5, 107), 'cevCpuCrs1SPLC'), ((9, 5, 108), 'cevCpuCrs1SPFC'),
+    ((9, 5, 109), 'cevCpu1800Mod'), ((9, 5, 110), 'cevCpuPrp2'), ((9, 5, 111), 'cevCpuCat6kWsSup32ge'),
+    ((9, 5, 112), 'cevCpuCat6kWsSup3210ge'), ((9, 5, 113), 'cevCpuAs5400XM'), ((9, 5, 114), 'cevCpuAs5350XM'),
+    ((9, 5, 115), 'cevCpu1800'), ((9, 5, 118), 'cevCpu7200Npeg2'), ((9, 5, 119), 'cevCpuCat6kMsfc2a'),
+    ((9, 5, 120), 'cevCpuC28012fe'), ((9, 5, 121), 'cevCpuIXP2350WestportNP'), ((9, 5, 122), 'cevCpuC7300Nse150'),
+    ((9, 5, 123), 'cevCpuCre1Rp'), ((9, 5, 124), 'cevCpuCre2Rp'), ((9, 5, 125), 'cevCpuCre3Rp'),
+    ((9, 5, 126), 'cevCpuCre1Fp'), ((9, 5, 127), 'cevCpuCre2Fp'), ((9, 5, 128), 'cevCpuCre3Fp'),
+    ((9, 5, 130), 'cevCpu7600Sip600DC'), ((9, 5, 131), 'cevCpuCat6kVsF6kMsfc3'), ((9, 5, 132), 'cevCpuCat6kVsS72010G'),
+    ((9, 5, 133), 'cevCpu7201Npeg2'), ((9, 5, 134), 'cevCpuSamiDc8548H'), ((9, 5, 135), 'cevCpuUC500'),
+    ((9, 5, 138), 'cevCpuBroadcomSB1A'), ((9, 5, 139), 'cevCpuCrs1SPLCB'), ((9, 5, 140), 'cevCpuUc520s'),
+    ((9, 5, 141), 'cevCpuUc520m'), ((9, 5, 144), 'cevCpu1861'), ((9, 5, 145), 'cevCpuTraffic'),
+    ((9, 5, 146), 'cevCpuCat6kWsSup32Pge'), ((9, 5, 147), 'cevCpuCat6kWsSup32P10ge'),
+    ((9, 5, 148), 'cevCpuCat6kWsF6kPisa'), ((9, 5, 152), 'cevCpuCrs1PlimAsic'), ((9, 5, 153), 'cevCpu2435Iad8Fxs'),
+    ((9, 5, 154), 'cevCpuVG204'), ((9, 5, 155), 'cevCpuVG202'), ((9, 5, 157), 'cevCpu2941'),
+    ((9, 5, 158), 'cevCPU8641D'), ((9, 5, 159), 'cevCpuCat6kVsSup2t10g'), ((9, 5, 160), 'cevCpu19412ge'),
+    ((9, 5, 161), 'cevCpu29012ge'), ((9, 5, 162), 'cevCpu29113ge'), ((9, 5, 163), 'cevCpu29213ge'),
+    ((9, 5, 164), 'cevCpu29513ge'), ((9, 5, 165), 'cevCpu39253ge'), ((9, 5, 166), 'cevCpu39453ge'),
+    ((9, 5, 167), 'cevCpuSr520T1'), ((9, 5, 168), 'cevCpu1941w2ge'), ((9, 5, 169), 'cevCpu3825nvge2'),
+    ((9, 5, 170), 'cevCpu3845nvge2'), ((9, 5, 175), 'cevCpuCrs1SPFP'), ((9, 5, 179), 'cevCpu3900SPE2004ge'),
+    ((9, 5, 182), 'cevCpu3900Spe100K9'), ((9, 5, 183), 'cevCpu3900Spe150K9'), ((9, 5, 186), 'cevCpu3900SPE2504ge'),
+    ((9, 5, 187), 'cevCpuCrs1FP140'), ((9, 5, 188), 'cevCpuCrs1MSC140G'), ((9, 5, 189), 'cevCpuC1841C2fek9'),
+    ((9, 5, 190), 'cevCpuC2801C2fek9'), ((9, 5, 191), 'cevCpuC2811C2fek9'), ((9, 5, 192), 'cevCpuC2821C2gek9'),
+    ((9, 5, 194), 'cevCpu3825C2gek9'), ((9, 5, 195), 'cevCpu3845C2gek9'), ((9, 5, 198), 'cevCpuCGR20102ge'),
+    ((9, 5, 199), 'cevCpu1906Ck9'), ((9, 5, 201), 'cevCpuDsp'), ((9, 5, 202), 'cevCpu5915'),
+    ((9, 5, 212), 'cevCpu86xVAE'), ((9, 5, 213), 'cevCpuCryptoAsic'), ((9, 5, 214), 'cevCpu2811ve2fe'),
+    ((9, 5, 215), 'cevCpu1841ve2fe'), ((9, 5, 216), 'cevCpu819HG'), ((9, 5, 217), 'cevCpu819G'),
+    ((9, 5, 218), 'cevCpu881W'), ((9, 5, 219), 'cevCpu886VAW'), ((9, 5, 220), 'cevCpu887VAMW'),
+    ((9, 5, 221), 'cevCpu887VAW'), ((9, 5, 222), 'cevCpuAsaSm1'), ((9, 5, 223), 'cevCpuAsaSm1K7'),
+    ((9, 5, 234), 'cevCpuCrsLSP140'), ((9, 5, 243), 'cevCpuCre5Fp'), ((9, 5, 244), 'cevCpuCre5Rp'),
+    ((9, 5, 245), 'cevCpuVG350'), ((9, 5, 250), 'cevCpu819HGW'), ((9, 5, 251), 'cevCpu819H'),
+    ((9, 5, 252), 'cevCpu819HWD'), ((9, 5, 253), 'cevCpu812G'), ((9, 5, 254), 'cevCpu812GCIFI'),
+    ((9, 5, 255), 'cevCpu819HGM'), ((9, 5, 256), 'cevCpu819GM'), ((9, 5, 266), 'cevCpuCgrSup'),
+    ((9, 5, 267), 'cevCpu86xVAEW'), ((9, 5, 268), 'cevCpuvg202xm'), ((9, 5, 269), 'cevCpuvg204xm'),
+    ((9, 5, 270), 'cevCpuC6880x'), ((9, 5, 280), 'cevCpu1783SR'), ((9, 5, 281), 'cevCpuTypeCPU'),
+    ((9, 5, 282), 'cevCpuC881'), ((9, 5, 283), 'cevCpuC886VA'), ((9, 5, 284), 'cevCpuC887VA'),
+    ((9, 5, 285), 'cevCpuC888'), ((9, 5, 286), 'cevCpuC891F'), ((9, 5, 287), 'cevCpuC891FW'),
+    ((9, 5, 288), 'cevCpuVG310'), ((9, 5, 289), 'cevCpuVG320'), ((9, 5, 290), 'cevCpuCat6kSup'),
+    ((9, 5, 293), 'cevCPURT1081K9'), ((9, 5, 294), 'cevCPURT1091K9'), ((9, 5, 295), 'cevCpuRT2241K9'),
+    ((9, 5, 296), 'cevCpuRT2221K9'), ((9, 5, 297), 'cevCpuRT2241WCK9'), ((9, 5, 298), 'cevCpuRT3211K9'),
+    ((9, 5, 299), 'cevCpuRT3221K9'), ((9, 5, 300), 'cevCpuRT3201K9'), ((9, 5, 306), 'cevCpu897VAB'),
+    ((9, 5, 307), 'cevCpuCrs1LSPX'), ((9, 5, 308), 'cevCpuCrs1FPX'), ((9, 5, 309), 'cevCpuCrs1MSCX'),
+    ((9, 5, 312), 'cevCpuAsa5506'), ((9, 5, 313), 'cevCpuAsa5506W'), ((9, 5, 314), 'cevCpuAsa5508'),
+    ((9, 5, 315), 'cevCpuAsa5506K7'), ((9, 5, 316), 'cevCpuAsa5508K7'), ((9, 5, 318), 'cevCpu891x24X'),
+    ((9, 5, 321), 'cevCpu841Mx4X'), ((9, 5, 322), 'cevCpu841Mx8X'), ((9, 5, 323), 'cevCpuCrs1MSCXL'),
+    ((9, 5, 324), 'cevCpuCrs1FPXL'), ((9, 5, 325), 'cevCpuN9kCpu'), ((9, 5, 326), 'cevCpuAsa5506H'),
+    ((9, 5, 327), 'cevCpuAsa5516'), ((9, 5, 328), 'cevCpuC819GWLTE'), ((9, 6), 'cevModuleCscType'),
+    ((9, 7), 'cevModuleC7xxxType'), ((9, 7, 1), 'cevC7xxxMc14a'), ((9, 7, 2), 'cevC7xxxMc16a'),
+    ((9, 7, 3), 'cevC7xxxMc11'), ((9, 7, 4), 'cevC7xxxMc12a'), ((9, 7, 5), 'cevC7xxxMc11a'),
+    ((9, 7, 6), 'cevC7xxxIo1feTxIsl'), ((9, 7, 8), 'cevC7xxxMc28'), ((9, 7, 9), 'cevVip480'),
+    ((9, 7, 10), 'cevVip450'), ((9, 7, 11), 'cevC7xxxIoEGE'), ((9, 7, 12), 'cevC7xxxIo2FE'),
+    ((9, 7, 16), 'cevC7xxxEIP'), ((9, 7, 17), 'cevC7xxxFIP'), ((9, 7, 18), 'cevC7xxxSrsFIP'),
+    ((9, 7, 19), 'cevC7xxxTRIP'), ((9, 7, 20), 'cevC7xxxSrsTRIP'), ((9, 7, 21), 'cevC7xxxFSIP'),
+    ((9, 7, 22), 'cevC7xxxSSIP'), ((9, 7, 23), 'cevC7xxxMIP'), ((9, 7, 24), 'cevC7xxxSMIP'),
+    ((9, 7, 25), 'cevC7xxxVIP2'), ((9, 7, 26), 'cevC7xxxVIP250'), ((9, 7, 27), 'cevC7xxxRSP1'),
+    ((9, 7, 28), 'cevC7xxxRSP2'), ((9, 7, 29), 'cevC7xxxRSP4'), ((9, 7, 30), 'cevC7xxxPosIP'),
+    ((9, 7, 31), 'cevC7xxxFeIP2'), ((9, 7, 33), 'cevC73004Oc3PosMm'), ((9, 7, 34), 'cevC73004Oc3PosSmIr'),
+    ((9, 7, 35), 'cevC73004Oc3PosSmLr'), ((9, 7, 36), 'cevC7300Oc48PosSmSr'), ((9, 7, 37), 'cevC7300Oc48PosSmIr'),
+    ((9, 7, 38), 'cevC7300Oc48PosSmLr'), ((9, 7, 58), 'cevC7500AIP'), ((9, 7, 59), 'cevC7500CIP'),
+    ((9, 7, 60), 'cevC7500CIP2'), ((9, 7, 61), 'cevC7500GEIP'), ((9, 7, 62), 'cevC7500FEIP'),
+    ((9, 7, 63), 'cevC7xxxSIP'), ((9, 7, 64), 'cevC7xxxRSP'), ((9, 7, 65), 'cevC7xxxHSSI'), ((9, 7, 66), 'cevC7411'),
+    ((9, 7, 67), 'cevC7411IoGE'), ((9, 7, 68), 'cevC7301'), ((9, 7, 69), 'cevC7301IoGE'), ((9, 7, 70), 'cevVip680'),
+    ((9, 7, 76), 'cevC7300CCPA'), ((9, 7, 77), 'cevC7304MSC100'), ((9, 7, 78), 'cevC73006E3'),
+    ((9, 7, 79), 'cevC73001Oc12Atm'), ((9, 7, 81), 'cevC7200Vsa'), ((9, 8), 'cevModuleC4xxxType'),
+    ((9, 8, 1), 'cevC4xxxUnknown'), ((9, 8, 2), 'cevC4xxxNp4Gb'), ((9, 8, 3), 'cevC4wsx4548GbRj45VPlus'),
+    ((9, 8, 4), 'cevCat4kWsx4948e10GE'), ((9, 8, 5), 'cevCat4kWsx45Sup7LE'), ((9, 8, 6), 'cevCat4kWsx45Sup8e'),
+    ((9, 8, 7), 'cevNIM4gLteNA7354'), ((9, 8, 8), 'cevNIM4gLteGA7304'), ((9, 8, 9), 'cevNIM4gLteVZ7350'),
+    ((9, 8, 10), 'cevNIM4gLteST7350'), ((9, 8, 13), 'cevNIM4gLteLA7430'), ((9, 8, 14), 'cevNIM4gLteALA7430'),
+    ((9, 8, 15), 'cevNIM4gLteAEA7455'), ((9, 9), 'cevModuleAS5200Type'), ((9, 9, 1), 'cevAS5200Carrier'),
+    ((9, 9, 2), 'cevAS5200DtdCarrier'), ((9, 9, 3), 'cevPmAS5xxx12m56k'), ((9, 9, 4), 'cevPmAS5xxx12mV110'),
+    ((9, 10), 'cevModuleC25xxType'), ((9, 11), 'cevModuleAS5300Type'), ((9, 11, 1), 'cevAS53004ct1'),
+    ((9, 11, 2), 'cevAS53004ce1'), ((9, 11, 3), 'cevPmDtdCarrier'), ((9, 11, 4), 'cevPmDtd6m'),
+    ((9, 11, 5), 'cevAS5300Carrier'), ((9, 11, 6), 'cevPmAS5xxx12m'), ((9, 11, 7), 'cevAS5300VoiceCarrierCard'),
+    ((9, 11, 8), 'cevAS5300Dspmc542'), ((9, 11, 9), 'cevAS5300Dsp'), ((9, 11, 10), 'cevAS5300PmDtd12m'),
+    ((9, 11, 11), 'cevAS53008ct14t'), ((9, 11, 12), 'cevAS53008ce14t'), ((9, 11, 13), 'cevAS53004ct14t'),
+    ((9, 11, 14), 'cevAS53004ce14t'), ((9, 11, 15), 'cevAS5300Amazon2Carrier'), ((9, 11, 16), 'cevAS5300Dspm6c549'),
+    ((9, 12), 'cevModuleAS5800Type'), ((9, 12, 1), 'cevMAs5800Dsc'), ((9, 12, 2), 'cevMAs5800E1'),
+    ((9, 12, 3), 'cevMAs5800T1'), ((9, 12, 4), 'cevMAs5800MicaHmm'), ((9, 12, 5), 'cevMAs5800T3'),
+    ((9, 12, 6), 'cevMAs5800FeDsi'), ((9, 12, 7), 'cevMAs5800MicaDmm'), ((9, 12, 8), 'cevMAs5800Vcc'),
+    ((9, 12, 9), 'cevMAs5800Dspm6c549'), ((9, 12, 10), 'cevMAs5800Dsp'), ((9, 14), 'cevModuleFabricType'),
+    ((9, 14, 3), 'cev12012Sfc'), ((9, 14, 4), 'cev12012Csc'), ((9, 14, 5), 'cev12008Sfc8'),
+    ((9, 14, 6), 'cev12008Csc8'), ((9, 14, 7), 'cev12016Sfc16'), ((9, 14, 8), 'cev12016Csc16'),
+    ((9, 14, 9), 'cev12016Sfc16Oc192'), ((9, 14, 10), 'cev12016Csc16Oc192'), ((9, 14, 11), 'cev12010Sfc10'),
+    ((9, 14, 12), 'cev12010Csc10'), ((9, 14, 13), 'cev12406Sfc6'), ((9, 14, 14), 'cev12406Csc6'),
+    ((9, 14, 15), 'cev12410Sfc10'), ((9, 14, 16), 'cev12410Csc10'), ((9, 14, 17), 'cev12404Csc64'),
+    ((9, 14, 18), 'cev12816Csc16Oc768'), ((9, 14, 19), 'cev12810Csc10Oc768'), ((9, 14, 20), 'cev12810Sfc10Oc768'),
+    ((9, 14, 21), 'cev12816Sfc16Oc768'), ((9, 14, 22), 'cev12006CscAdvncd'), ((9, 14, 23), 'cev12010CscAdvncd'),
+    ((9, 14, 24), 'cev12016CscAdvncd'), ((9, 14, 25), 'cev12006SfcAdvncd'), ((9, 14, 26), 'cev12010SfcAdvncd'),
+    ((9, 14, 27), 'cev12016SfcAdvncd'), ((9, 14, 28), 'cev12004FabAdvncd'), ((9, 14, 29), 'cev12816Csc16Oc768B'),
+    ((9, 14, 30), 'cev12810Csc10Oc768B'), ((9, 14, 45), 'cevModuleFabricTypeAsic'), ((9, 15), 'cevModuleDaughterCard'),
+    ((9, 15, 4), 'cevDslamNi2Controller'), ((9, 15, 5), 'cevWvic2dsuE1DiG703'), ((9, 15, 6), 'cevWvic1dsuE1G703'),
+    ((9, 15, 7), 'cevDspmPvdm3'), ((9, 15, 12), 'cevDspmPvdm1'), ((9, 15, 13), 'cevDspmPvdm2'),
+    ((9, 15, 14), 'cevDspmPvdm4'), ((9, 15, 15), 'cevDspmPvdm5'), ((9, 15, 17), 'cevHdaEm10fxs'),
+    ((9, 15, 18), 'cevHdaEm4dsp'), ((9, 15, 19), 'cevC7300Nse100Db'), ((9, 15, 24), 'cevCeScsi2636'),
+    ((9, 15, 25), 'cevCeIde2636'), ((9, 15, 26), 'cevVic4vpFxs4Did'), ((9, 15, 27), 'cevC7300Nse100PlusDb'),
+    ((9, 15, 28), 'cevModuleCat4000DaughterCardType'), ((9, 15, 28, 1), 'cevCat4kDCWsf4531'),
+    ((9, 15, 28, 2), 'cevCat4kDCWsu4504FxMt'), ((9, 15, 29), 'cevVwic2Mft1T1E1'), ((9, 15, 30), 'cevVwic2Mft1G703'),
+    ((9, 15, 31), 'cevVwic2Mft2T1E1'), ((9, 15, 32), 'cevVwic2Mft2G703'), ((9, 15, 33), 'cevEcMft32'),
+    ((9, 15, 34), 'cevEcMft64'), ((9, 15, 35), 'cevEm4Fxs4Fxo'), ((9, 15, 36), 'cevEm6Fxo'),
+    ((9, 15, 37), 'cevEm4BriNtTe'), ((9, 15, 38), 'cevpvdm2dsphalf'), ((9, 15, 39), 'cevpvdm2dsp4'),
+    ((9, 15, 40), 'cevpvdm2dsp3'), ((9, 15, 41), 'cevpvdm2dsp2'), ((9, 15, 42), 'cevpvdm2dsp1'),
+    ((9, 15, 43), 'cevpvdm2hwecan3'), ((9, 15, 44), 'cevpvdm2hwecan2'), ((9, 15, 45), 'cevpvdm2hwecan1'),
+    ((9, 15, 46), 'cevNetworkProcessor'), ((9, 15, 47), 'cevVic2Mft1T1E1'), ((9, 15, 48), 'cevVic2Mft2T1E1'),
+    ((9, 15, 49), 'cevEm2Hda4Fxo'), ((9, 15, 50), 'cevVic1J1'), ((9, 15, 51), 'cevWic1amV2'),
+    ((9, 15, 52), 'cevWic2amV2'), ((9, 15, 53), 'cevPvdmII12dm'), ((9, 15, 59), 'cevVwic2T1E1Ran'),
+    ((9, 15, 60), 'cev7300Nse150Db'), ((9, 15, 61), 'cevVic3Em2'), ((9, 15, 62), 'cevVic3FxsDid2'),
+    ((9, 15, 63), 'cevVic3FxsDid4'), ((9, 15, 64), 'cevHdaEm3FxsDid8'), ((9, 15, 65), 'cev1DOCSIS20CableModemDC'),
+    ((9, 15, 66), 'cev1DOCSIS20CableModemDCEJ'), ((9, 15, 67), 'cevAsmM2900Top'), ((9, 15, 68), 'cevVic3FxsEDid2'),
+    ((9, 15, 69), 'cevModuleASR9KLCDb'), ((9, 15, 70), 'cevModemWan3g'), ((9, 15, 73), 'cevModulePVDM3c64'),
+    ((9, 15, 74), 'cevModulePVDM3c32'), ((9, 15, 75), 'cevModulePVDM3c128'), ((9, 15, 76), 'cevModulePVDM3c192'),
+    ((9, 15, 77), 'cevModulePVDM3c256'), ((9, 15, 78), 'cevNM2838'), ((9, 15, 79), 'cevPANO2838'),
+    ((9, 15, 82), 'cevVwic3Mft4T1E1'), ((9, 15, 83), 'cevVwic3Mft1T1E1'), ((9, 15, 84), 'cevVwic3Mft1G703'),
+    ((9, 15, 85), 'cevVwic3Mft2T1E1'), ((9, 15, 86), 'cevVwic3Mft2G703'), ((9, 15, 87), 'cevPrp3Smdc'),
+    ((9, 15, 88), 'cevModemWan4g'), ((9, 15, 89), 'cevMdcC6880xPfc'), ((9, 15, 90), 'cevMdcC6880xlePfc'),
+    ((9, 15, 91), 'cevMdcC6880xDfc'), ((9, 15, 92), 'cevMdcC6880xleDfc'), ((9, 15, 93), 'cevPWic1AmV2'),
+    ((9, 15, 94), 'cevPVwic3Mft1G703'), ((9, 15, 95), 'cevPVwic3Mft1T1E1'), ((9, 15, 96), 'cevPVwic3Mft2G703'),
+    ((9, 15, 97), 'cevPVwic3Mft2T1E1'), ((9, 15, 98), 'cevPVwic3Mft4T1E1'), ((9, 15, 99), 'cevModulePPVDM3c128'),
+    ((9, 15, 100), 'cevModulePPVDM3c16'), ((9, 15, 101), 'cevModulePPVDM3c192'), ((9, 15, 102), 'cevModulePPVDM3c256'),
+    ((9, 15, 103), 'cevModulePPVDM3c32'), ((9, 15, 104), 'cevModulePPVDM3c64'), ((9, 15, 105), 'cevPVic3Em2'),
+    ((9, 15, 106), 'cevPVic3Fxs2Did'), ((9, 15, 107), 'cevPVic3Fxs4Did'), ((9, 15, 112), 'cevCbr8Gemini1'),
+    ((9, 15, 113), 'cevCbr8Gemini2'), ((9, 15, 114), 'cevCbr8Leoben1'), ((9, 15, 115), 'cevCbr8Leoben3'),
+    ((9, 15, 116), 'cevCbr8SupDc'), ((9, 15, 117), 'cevCbr8SupPicDc'), ((9, 16), 'cevModuleGBICs'),
+    ((9, 16, 1), 'cevMGBIC1000BaseLX'), ((9, 16, 2), 'cevMGBIC1000BaseSX'), ((9, 16, 3), 'cevMGBIC1000BaseCX'),
+    ((9, 16, 4), 'cevMGBIC1000BaseLH'), ((9, 16, 5), 'cevMGBIC1000BaseZX'), ((9, 16, 6), 'cevMGBIC1000BaseCXSTACK'),
+    ((9, 16, 7), 'cevMGBIC1000BaseT'), ((9, 16, 16), 'cevMGBICDWDM6061'), ((9, 16, 17), 'cevMGBICDWDM5979'),
+    ((9, 16, 18), 'cevMGBICDWDM5898'), ((9, 16, 19), 'cevMGBICDWDM5817'), ((9, 16, 20), 'cevMGBICDWDM5655'),
+    ((9, 16, 21), 'cevMGBICDWDM5575'), ((9, 16, 22), 'cevMGBICDWDM5494'), ((9, 16, 23), 'cevMGBICDWDM5413'),
+    ((9, 16, 24), 'cevMGBICDWDM5252'), ((9, 16, 25), 'cevMGBICDWDM5172'), ((9, 16, 26), 'cevMGBICDWDM5092'),
+    ((9, 16, 27), 'cevMGBICDWDM5012'), ((9, 16, 28), 'cevMGBICDWDM4851'), ((9, 16, 29), 'cevMGBICDWDM4772'),
+    ((9, 16, 30), 'cevMGBICDWDM4692'), ((9, 16, 31), 'cevMGBICDWDM4612'), ((9, 16, 32), 'cevMGBICDWDM4453'),
+    ((9, 16, 33), 'cevMGBICDWDM4373'), ((9, 16, 34), 'cevMGBICDWDM4294'), ((9, 16, 35), 'cevMGBICDWDM4214'),
+    ((9, 16, 36), 'cevMGBICDWDM4056'), ((9, 16, 37), 'cevMGBICDWDM3977'), ((9, 16, 38), 'cevMGBICDWDM3898'),
+    ((9, 16, 39), 'cevMGBICDWDM3819'), ((9, 16, 40), 'cevMGBICDWDM3661'), ((9, 16, 41), 'cevMGBICDWDM3582'),
+    ((9, 16, 42), 'cevMGBICDWDM3504'), ((9, 16, 43), 'cevMGBICDWDM3425'), ((9, 16, 44), 'cevMGBICDWDM3268'),
+    ((9, 16, 45), 'cevMGBICDWDM3190'), ((9, 16, 46), 'cevMGBICDWDM3112'), ((9, 16, 47), 'cevMGBICDWDM3033'),
+    ((9, 16, 48), 'cevMGBICXWDMRxOnly'), ((9, 16, 49), 'cevMGBIC1490BaseBX10D'),
+    ((9, 16, 50), 'cevMGBIC1310BaseBX10U'), ((9, 16, 51), 'cevMGBICDWDM6141'), ((9, 16, 52), 'cevMGBICDWDM5736'),
+    ((9, 16, 53), 'cevMGBICDWDM5332'), ((9, 16, 54), 'cevMGBICDWDM4931'), ((9, 16, 55), 'cevMGBICDWDM4532'),
+    ((9, 16, 56), 'cevMGBICDWDM4134'), ((9, 16, 57), 'cevMGBICDWDM3739'), ((9, 16, 58), 'cevMGBICDWDM3346'),
+    ((9, 17), 'cevModuleC6xxxType'), ((9, 17, 1), 'cevC6xxxSlcCap8'), ((9, 17, 2), 'cevC6xxxNtcOc3si'),
+    ((9, 17, 3), 'cevC6xxxNtcOc3mm'), ((9, 17, 4), 'cevC6xxxNtcStm1si'), ((9, 17, 5), 'cevC6xxxNtcStm1mm'),
+    ((9, 17, 6), 'cevC6xxxSlcDmt8'), ((9, 17, 7), 'cevC6xxxSlcDmt16'), ((9, 17, 8), 'cevC6xxxNtcDs3'),
+    ((9, 17, 10), 'cevC6xxxOsm1Oc48PosSs'), ((9, 17, 11), 'cevC6xxxOsm1Oc48PosSl'),
+    ((9, 17, 12), 'cevC6xxxOsm1Oc48PosSi'), ((9, 17, 15), 'cevC6xxxOsm2Oc12PosSl'),
+    ((9, 17, 16), 'cevC6xxxOsm4Oc12PosSl'), ((9, 17, 17), 'cevC6xxxOsm2Oc12PosMm'),
+    ((9, 17, 18), 'cevC6xxxOsm4Oc12PosMm'), ((9, 17, 19), 'cevC6xxxOsm2Oc12PosSi'),
+    ((9, 17, 20), 'cevC6xxxOsm4Oc12PosSi'), ((9, 17, 21), 'cevC6xxxOsm8Oc3PosSi'),
+    ((9, 17, 22), 'cevC6xxxOsm16Oc3PosSi'), ((9, 17, 23), 'cevC6xxxOsm8Oc3PosMm'),
+    ((9, 17, 24), 'cevC6xxxOsm16Oc3PosMm'), ((9, 17, 25), 'cevC6xxxOsm8Oc3PosSl'),
+    ((9, 17, 26), 'cevC6xxxOsm16Oc3PosSl'), ((9, 17, 27), 'cevC6xxx4GeWanGbic'),
+    ((9, 17, 31), 'cevC6xxxOsm4ge4oc12ChDs3SmIr'), ((9, 17, 32), 'cevC6xxxOsm4ge8oc12ChDs3SmIr'),
+    ((9, 17, 33), 'cevC6xxxOsm4geoc48ChDs3SmSr'), ((9, 17, 34), 'ceC6xxxOsm4ge2oc48ChDs3SmSr'),
+    ((9, 17, 35), 'cevC6xxxOsm4geoc48ChDs3SmIr'), ((9, 17, 36), 'cevC6xxxOsm4ge2oc48ChDs3SmIr'),
+    ((9, 17, 37), 'cevC6xxxOsm4geoc12ChDs3SmIr'), ((9, 17, 38), 'cevC6xxxOsm4ge2oc12ChDs3SmIr'),
+    ((9, 17, 40), 'cevC6xxxOsm2Oc12AtmMmPlus'), ((9, 17, 41), 'cevC6xxxOsm2Oc12AtmSiPlus'),
+    ((9, 17, 42), 'cevC6xxx4GeWanGbicPlus'), ((9, 17, 43), 'cevC6xxxOsm1Oc48PosSsPlus'),
+    ((9, 17, 44), 'cevC6xxxOsm1Oc48PosSiPlus'), ((9, 17, 45), 'cevC6xxxOsm1Oc48PosSlPlus'),
+    ((9, 17, 46), 'cevC6xxxOsm4Oc12PosSiPlus'), ((9, 17, 47), 'cevC6xxxOsm2Oc12PosMmPlus'),
+    ((9, 17, 48), 'cevC6xxxOsm4Oc3PosSiPlus'), ((9, 17, 49), 'cevC6xxxOsm8Oc3PosSiPlus'),
+    ((9, 17, 50), 'cevC6xxxOsm8Oc3PosSlPlus'), ((9, 17, 51), 'cevC6xxxOsm16Oc3PosSiPlus'),
+    ((9, 17, 52), 'cevC6xxxOsm12Ct3T1'), ((9, 17, 53), 'cevC6xxxCwpa2'), ((9, 17, 54), 'cevC6xxxSIP200'),
+    ((9, 17, 55), 'cevC6xxxSIP400'), ((9, 17, 56), 'cevC6xxxSIP600'), ((9, 17, 57), 'cevC6xxxOsm2Oc12PosSiPlus'),
+    ((9, 17, 58), 'cevC6xxxOsm4Oc3PosSi'), ((9, 17, 59), 'cevC6xxxOsm4Oc3PosSl'),
+    ((9, 17, 60), 'cevC6xxxOsm4Oc3PosMm'), ((9, 17, 61), 'cevC6xxxOsm24Ct3T1'), ((9, 17, 62), 'cevCat6kWsx6600'),
+    ((9, 17, 63), 'cevC6xxxSSC600'), ((9, 17, 64), 'cevC6xxxSSC400'), ((9, 17, 65), 'cevC6xxxRSP720Base'),
+    ((9, 17, 66), 'cevC6xxxRSP32GEBase'), ((9, 17, 67), 'cevC6xxxRSP3210GEBase'), ((9, 17, 68), 'cevC6xxxRSP720'),
+    ((9, 17, 69), 'cevC6xxxRSP32'), ((9, 17, 71), 'cevC6xxxSIP600DC'), ((9, 17, 72), 'cevC6xxxRSP720MsfcNaboo'),
+    ((9, 17, 73), 'cevC6xxxRSP720PfcGanges'), ((9, 17, 74), 'cevC6xxxEsm20G'), ((9, 17, 75), 'cevC6xxxEsm20GCpuDc'),
+    ((9, 17, 76), 'cevC6xxxEsm20GPfc3CxlDc'), ((9, 17, 77), 'cevC6xxxEsm20GPfc3CDc'),
+    ((9, 17, 78), 'cevC6xxxEsm20G2x10gDc'), ((9, 17, 79), 'cevC6xxxEsm20G20x1gDc'),
+    ((9, 17, 80), 'cevC6xxxRSP72010GEBase'), ((9, 17, 81), 'cevC6xxxEs20C3c'), ((9, 17, 82), 'cevC6xxxEs40C3c'),
+    ((9, 17, 83), 'cevC6xxxEs20C3cxl'), ((9, 17, 84), 'cevC6xxxEs40C3cxl'), ((9, 17, 85), 'cevC6xxxEs20G3c'),
+    ((9, 17, 86), 'cevC6xxxEs2Tg3c'), ((9, 17, 87), 'cevC6xxxEs40G3c'), ((9, 17, 88), 'cevC6xxxEs4Tg3c'),
+    ((9, 17, 89), 'cevC6xxxEs20G3cxl'), ((9, 17, 90), 'cevC6xxxEs2Tg3cxl'), ((9, 17, 91), 'cevC6xxxEs40G3cxl'),
+    ((9, 17, 92), 'cevC6xxxEs4Tg3cxl'), ((9, 17, 93), 'cevC6xxxMsfc4'), ((9, 17, 94), 'cevC6xxxPfc3c'),
+    ((9, 17, 95), 'cevC6xxxPfc3cxl'), ((9, 17, 96), 'cevC6xxxEs2Tg20GDc'), ((9, 17, 97), 'cevC6xxxEs1Tg10GDc'),
+    ((9, 17, 98), 'cevC6xxxEsBase'), ((9, 17, 99), 'cevC6xxxEsPfc3CxlDc'), ((9, 17, 100), 'cevC6xxxEsPfc3CDc'),
+    ((9, 17, 101), 'cevC6xxxEs20GDc'), ((9, 17, 102), 'cevC6xxxEs2TgDc'), ((9, 17, 103), 'cevC6xxxEs40GDc'),
+    ((9, 17, 104), 'cevC6xxxEs4TgDc'), ((9, 17, 105), 'cevC6xxxEsItu2TgDc'), ((9, 17, 106), 'cevC6xxxEsItu4TgDc'),
+    ((9, 17, 107), 'cevC6xxxEsItu2Tg3cxl'), ((9, 17, 108), 'cevC6xxxEsItu4Tg3cxl'), ((9, 17, 109), 'cevC6xxxEsT'),
+    ((9, 17, 110), 'cevC6xxxEsItu2Tg3c'), ((9, 17, 111), 'cevC6xxxEsItu4Tg3c'), ((9, 17, 112), 'cevC6xxxEst20gDc'),
+    ((9, 17, 113), 'cevC6xxxEst40gDc'), ((9, 17, 114), 'cevC6xxxEstItu2tgDc'), ((9, 17, 115), 'cevC6xxxEstItu4tgDc'),
+    ((9, 17, 116), 'cevC6xxxEst20G3Cxl'), ((9, 17, 117), 'cevC6xxxEst40G3Cxl'),
+    ((9, 17, 118), 'cevC6xxxEstItu2TG3Cxl'), ((9, 17, 119), 'cevC6xxxEstItu4TG3Cxl'),
+    ((9, 17, 120), 'cevC6xxxEsTXc20G'), ((9, 17, 121), 'cevC6xxxEsTXc40G'), ((9, 17, 122), 'cevC6xxxEsT8Tg'),
+    ((9, 17, 123), 'cevC6xxxEsXt8TG'), ((9, 17, 124), 'cevC6xxxIA48FPD'), ((9, 17, 125), 'cevC6xxxIA48TD'),
+    ((9, 18), 'cevModuleGsrType'), ((9, 18, 1), 'cevGsrOc12Chsts3Mm'), ((9, 18, 2), 'cevGsrOc12Chsts3Sm'),
+    ((9, 18, 3), 'cevGsrQoc12Mm'), ((9, 18, 4), 'cevGsrQoc12Sm'), ((9, 18, 5), 'cevPosOc48SmLrFc'),
+    ((9, 18, 6), 'cevPosQoc3SmL'), ((9, 18, 7), 'cevPos8oc3Mm'), ((9, 18, 8), 'cevPos8oc3Ir'),
+    ((9, 18, 9), 'cevPos8oc3Lr'), ((9, 18, 10), 'cevPos16oc3Mm'), ((9, 18, 11), 'cevPos16oc3Ir'),
+    ((9, 18, 12), 'cevPos16oc3Lr'), ((9, 18, 13), 'cevGsr8feTx'), ((9, 18, 14), 'cevGsr8feFx'),
+    ((9, 18, 15), 'cevSsrpOc48SmSr'), ((9, 18, 16), 'cevSsrpOc48SmLr'), ((9, 18, 17), 'cevPosQoc12SmLr'),
+    ((9, 18, 18), 'cevPosQoc12MmSr'), ((9, 18, 19), 'cevPosOc48SmSrFc'), ((9, 18, 20), 'cevPosOc48SmLrSc'),
+    ((9, 18, 21), 'cevPosOc48SmSrSc'), ((9, 18, 22), 'cevSrpOc12SmIr'), ((9, 18, 23), 'cevSrpOc12SmLr'),
+    ((9, 18, 24), 'cevSrpOc12Mm'), ((9, 18, 25), 'cevPosEnOc48SrSc'), ((9, 18, 26), 'cevPosEnOc48SrFc'),
+    ((9, 18, 27), 'cevPosEnOc48LrSc'), ((9, 18, 28), 'cevPosEnOc48LrFc'), ((9, 18, 29), 'cevPosEnQoc12Sr'),
+    ((9, 18, 30), 'cevPosEnQoc12Ir'), ((9, 18, 31), 'cevCopper6ds3'), ((9, 18, 32), 'cevCopper12ds3'),
+    ((9, 18, 33), 'cevPosOc192SmIrFc'), ((9, 18, 34), 'cevPosOc192SmSrFc'), ((9, 18, 35), 'cevPosOc192SmIrSc'),
+    ((9, 18, 36), 'cevPosOc192SmSrSc'), ((9, 18, 37), 'cevPos4Oc3Mm'), ((9, 18, 38), 'cevPos4Oc3Sm'),
+    ((9, 18, 39), 'cevPosOc12Mm'), ((9, 18, 40), 'cevPosOc12Sm'), ((9, 18, 41), 'cevAtmOc12Mm'),
+    ((9, 18, 42), 'cevAtmOc12Sm'), ((9, 18, 43), 'cevPosOc48MmL'), ((9, 18, 44), 'cevAtm4Oc3Sm'),
+    ((9, 18, 45), 'cevAtm4Oc3Mm'), ((9, 18, 46), 'cevOc12ChDs3Mm'), ((9, 18, 47), 'cevOc12ChDs3Sm'),
+    ((9, 18, 48), 'cevGsrGe'), ((9, 18, 49), 'cevGsr3ge'), ((9, 18, 50), 'cevGsrAlarm16'),
+    ((9, 18, 51), 'cevGsrBusBoard16'), ((9, 18, 52), 'cevSrpOc12SmXr'), ((9, 18, 53), 'cevPosEnQoc12Mm'),
+    ((9, 18, 54), 'cevPosEnQoc48SmSrFc'), ((9, 18, 55), 'cevPosEnQoc48SmSrSc'), ((9, 18, 56), 'cevPosEnQoc48SmLrSc'),
+    ((9, 18, 57), 'cevPosEnQoc48SmLrFc'), ((9, 18, 58), 'cevGsr6Ct3'), ((9, 18, 59), 'cevPosEnOc192SmLrFc'),
+    ((9, 18, 60), 'cevPosEnOc192SmLrSc'), ((9, 18, 61), 'cevPosEnOc192SmVsrSc'), ((9, 18, 62), 'cevPosEnOc192SmVsrFc'),
+    ((9, 18, 66), 'cevGsrQoc12Chstsds3SmIrSc'), ((9, 18, 67), 'cevGsrQoc12Chstsds3MmSrSc'),
+    ((9, 18, 68), 'cevGsrOc48Chstsds3MmSrSc'), ((9, 18, 69), 'cevGsrOc48Chstsds3SmIrSc'),
+    ((9, 18, 70), 'cevGsrOc48Chstsds3SmLrSc'), ((9, 18, 71), 'cevGsr16Oc3Chstsds3MmSrSc'),
+    ((9, 18, 72), 'cevGsr16Oc3Chstsds3SmIrSc'), ((9, 18, 73), 'cevGsr16Oc3Chstsds3SmLrSc'),
+    ((9, 18, 74), 'cevGsr2Oc3ChDs1'), ((9, 18, 75), 'cevSsrpOc192SmLr'), ((9, 18, 76), 'cevSsrpOc192SmIr'),
+    ((9, 18, 77), 'cevSsrpOc192SmSr'), ((9, 18, 78), 'cevSsrpOc192SmVsr'), ((9, 18, 80), 'cev2Oc12ChDs3Sm'),
+    ((9, 18, 81), 'cevGsrAlarm10'), ((9, 18, 82), 'cevGsrBusBoard10'), ((9, 18, 83), 'cevGsrOc48Chstsds3SmSrSc'),
+    ((9, 18, 84), 'cevGsrE48PosOc48SmSrSc'), ((9, 18, 85), 'cevGsrE48PosOc48SmLrSc'),
+    ((9, 18, 86), 'cevGsrE48PosQoc12SmIrSc'), ((9, 18, 87), 'cevGsrE48Pos16oc3SmIrSc'), ((9, 18, 88), 'cevCopper6e3'),
+    ((9, 18, 89), 'cevCopper12e3'), ((9, 18, 93), 'cevGsrE48Pos16oc3SmIrLc'),
+    ((9, 18, 94), 'cevGsr16oc3Chstsds3SmIrLc'), ((9, 18, 95), 'cevGsrOc12ChDs1SmIrSc'), ((9, 18, 96), 'cevGsrAlarm6'),
+    ((9, 18, 97), 'cevPosEnQoc48Vsr'), ((9, 18, 98), 'cevPosEnQoc48MmSrSc'), ((9, 18, 99), 'cevPosEnQoc48SmIrSc'),
+    ((9, 18, 100), 'cevPosEnQoc48SmIrFc'), ((9, 18, 101), 'cevPosEnQoc48SmVlrSc'),
+    ((9, 18, 102), 'cevPosEnQoc48SmVlrFc'), ((9, 18, 103), 'cevPosEnQoc48SmElrSc'),
+    ((9, 18, 104), 'cevPosEnQoc48SmElrFc'), ((9, 18, 105), 'cevPosEnOc192Vsr'), ((9, 18, 106), 'cevPosEnOc192SmSr2Sc'),
+    ((9, 18, 107), 'cevPosEnOc192SmSr2Fc'), ((9, 18, 108), 'cevPosEnOc192SmVlrSc'),
+    ((9, 18, 109), 'cevPosEnOc192SmVlrFc'), ((9, 18, 110), 'cevPosEnOc192SmElrSc'),
+    ((9, 18, 111), 'cevPosEnOc192SmElrFc'), ((9, 18, 112), 'cevGsrEn8Oc3'), ((9, 18, 113), 'cevGsr1p10ge'),
+    ((9, 18, 114), 'cevGsrE48PosOc48SmIrSc'), ((9, 18, 116), 'cevGsrEOc192SmLrSc'),
+    ((9, 18, 117), 'cevGsrEOc192SmVsrSc'), ((9, 18, 118), 'cevGsrEOc192SmVsrFc'), ((9, 18, 119), 'cevGsrEOc192SmSrFc'),
+    ((9, 18, 120), 'cevGsrEOc192SmSrSc'), ((9, 18, 121), 'cevGsrEOc192SmLrFc'), ((9, 18, 122), 'cevGsrEQoc48SmLrFc'),
+    ((9, 18, 123), 'cevGsrEQoc48SmLrSc'), ((9, 18, 124), 'cevGsrEQoc48SmVsrSc'), ((9, 18, 125), 'cevGsrEQoc48SmVsrFc'),
+    ((9, 18, 126), 'cevGsrEQoc48SmSrFc'), ((9, 18, 127), 'cevGsrEQoc48SmSrSc'), ((9, 18, 128), 'cevGsrEQoc48Vsr'),
+    ((9, 18, 129), 'cevGsrEQoc48SmSr2Sc'), ((9, 18, 130), 'cevGsrEQoc48SmSr2Fc'), ((9, 18, 131), 'cevGsrEQoc48MmSrSc'),
+    ((9, 18, 132), 'cevGsrEQoc48SmIrSc'), ((9, 18, 133), 'cevGsrEQoc48SmIrFc'), ((9, 18, 134), 'cevGsrEQoc48SmVlrSc'),
+    ((9, 18, 135), 'cevGsrEQoc48SmVlrFc'), ((9, 18, 136), 'cevGsrEQoc48SmElrSc'),
+    ((9, 18, 137), 'cevGsrEQoc48SmElrFc'), ((9, 18, 138), 'cevGsrEOc192Vsr'), ((9, 18, 139), 'cevGsrEOc192SmSr2Sc'),
+    ((9, 18, 140), 'cevGsrEOc192SmSr2Fc'), ((9, 18, 141), 'cevGsrEOc192MmSrSc'), ((9, 18, 142), 'cevGsrEOc192SmIrSc'),
+    ((9, 18, 143), 'cevGsrEOc192SmIrFc'), ((9, 18, 144), 'cevGsrEOc192SmVlrSc'), ((9, 18, 145), 'cevGsrEOc192SmVlrFc'),
+    ((9, 18, 146), 'cevGsrEOc192SmElrSc'), ((9, 18, 147), 'cevGsrEOc192SmElrFc'),
+    ((9, 18, 148), 'cevSsrp2Oc48SrpSmSrLc'), ((9, 18, 149), 'cevSsrp2Oc48SrpSmIrLc'),
+    ((9, 18, 150), 'cevSsrp2Oc48SrpSmLrLc'), ((9, 18, 151), 'cevSsrp2Oc48PosSmSrLc'),
+    ((9, 18, 152), 'cevSsrp2Oc48PosSmIrLc'), ((9, 18, 153), 'cevSsrp2Oc48PosSmLrLc'),
+    ((9, 18, 155), 'cevGsrE48PosQoc12MmSrSc'), ((9, 18, 156), 'cevGsrGeFe'), ((9, 18, 157), 'cevGsrE48Atm4oc12SmIrSc'),
+    ((9, 18, 158), 'cevGsrE48Atm4oc12MmSrSc'), ((9, 18, 159), 'cevGsrE48Atm4oc3SmIrSc'),
+    ((9, 18, 160), 'cevGsrE48Atm4oc3MmSrSc'), ((9, 18, 162), 'cevGsrE48Pos4oc3SmIrLc'),
+    ((9, 18, 166), 'cevGsrE48Pos8oc3SmIrLc'), ((9, 18, 167), 'cevSsrp2Oc12E48SmIr'),
+    ((9, 18, 168), 'cevSsrp2Oc12E48SmXr'), ((9, 18, 169), 'cevSsrp1Oc12E48SmIr'),
+    ((9, 18, 170), 'cevSsrp1Oc12E48SmXr'), ((9, 18, 171), 'cevGsrSIP600'), ((9, 18, 173), 'cevGsr4pge'),
+    ((9, 18, 174), 'cevGsrAtmEn8Oc3Mm'), ((9, 18, 175), 'cevGsr2Oc192Pos'), ((9, 18, 176), 'cevGsr8Oc48Pos'),
+    ((9, 18, 177), 'cevGsrOc48Msr'), ((9, 18, 178), 'cevPosE2Oc192Vsr'), ((9, 18, 179), 'cevPosE2Oc192SmSr2Sc'),
+    ((9, 18, 180), 'cevPosE2Oc192SmSr2Fc'), ((9, 18, 181), 'cevPosE2Oc192SmSrSc'),
+    ((9, 18, 182), 'cevPosE2Oc192SmSrFc'), ((9, 18, 183), 'cevPosE2Oc192SmIrSc'),
+    ((9, 18, 184), 'cevPosE2Oc192SmIrFc'), ((9, 18, 185), 'cevPosE2Oc192SmLrSc'),
+    ((9, 18, 186), 'cevPosE2Oc192SmLrFc'), ((9, 18, 187), 'cevPosE2Oc192SmVlrSc'),
+    ((9, 18, 188), 'cevPosE2Oc192SmVlrFc'), ((9, 18, 189), 'cevPosE2Oc192SmElrSc'),
+    ((9, 18, 190), 'cevPosE2Oc192SmElrFc'), ((9, 18, 191), 'cevGsr6Ds3e3Smb'), ((9, 18, 192), 'cevGsr6Ds3e3Ct3Smb'),
+    ((9, 18, 193), 'cevGsr2Oc3Chds1ds3e3SmIrSc'), ((9, 18, 194), 'cevGsrService'), ((9, 18, 195), 'cevGsrSIP601'),
+    ((9, 18, 196), 'cevGsrSIP501'), ((9, 18, 197), 'cevGsrSIP401'), ((9, 18, 198), 'cevGsrSsrp2Oc48Lc'),
+    ((9, 18, 200), 'cevGsrE384Cec'), ((9, 19), 'cevModuleRpmType'), ((9, 19, 1), 'cevAtmdxRpm'),
+    ((9, 20), 'cevModuleCat8500Type'), ((9, 20, 1), 'cevCat8500CpuSwitch'), ((9, 20, 2), 'cevCat8500FeatureFpga'),
+    ((9, 20, 3), 'cevCat8500FeatureAsic'), ((9, 20, 4), 'cevCat8500FeaturePVC'), ((9, 20, 5), 'cevCat8500FeUTP8p16k'),
+    ((9, 20, 6), 'cevCat8500FeUTP8p64k'), ((9, 20, 7), 'cevCat8500FeMMF8p16k'), ((9, 20, 8), 'cevCat8500FeMMF8p64k'),
+    ((9, 20, 9), 'cevCat8500FeUTP16p16k'), ((9, 20, 10), 'cevCat8500FeUTP16p64k'),
+    ((9, 20, 11), 'cevCat8500FeMMF16p16k'), ((9, 20, 12), 'cevCat8500FeMMF16p64k'),
+    ((9, 20, 13), 'cevCat8500GeF1p16k'), ((9, 20, 14), 'cevCat8500GeF1p64k'), ((9, 20, 15), 'cevCat8500GeF2p16k'),
+    ((9, 20, 16), 'cevCat8500GeF2p64k'), ((9, 20, 17), 'cevCat8500FeBridge4p'), ((9, 20, 18), 'cevCat8500RouteProc'),
+    ((9, 20, 19), 'cevCat8500Switch10GProc'), ((9, 20, 20), 'cevCat8500FeatureNetClock'),
+    ((9, 20, 21), 'cevCat8500FeatureABR'), ((9, 20, 22), 'cevCat8500FeatureLite'),
+    ((9, 20, 23), 'cevCat8500m16pOC3Mm'), ((9, 20, 24), 'cevCat8500m16pOC3Sm'), ((9, 20, 25), 'cevCat8500m4pOC12Mm'),
+    ((9, 20, 26), 'cevCat8500m4pOC12Sm'), ((9, 20, 27), 'cevCat8500m4pOC3Utp5'),
+    ((9, 20, 28), 'cevCat8500m4pOC3Mixed'), ((9, 20, 29), 'cevCat8500m4pOC3Sm'), ((9, 20, 30), 'cevCat8500m4pOC3Mm'),
+    ((9, 20, 31), 'cevCat8500mATM25'), ((9, 20, 32), 'cevCat8500m4pE3'), ((9, 20, 33), 'cevCat8500m4pDs3'),
+    ((9, 20, 34), 'cevCat8500mCbr75E1'), ((9, 20, 35), 'cevCat8500mCbr120E1'), ((9, 20, 36), 'cevCat8500mCbrT1'),
+    ((9, 20, 37), 'cevCat8500mE1'), ((9, 20, 38), 'cevCat8500mT1'), ((9, 20, 39), 'cevCat8500mE1Bnc'),
+    ((9, 20, 40), 'cevCat8500mE3'), ((9, 20, 41), 'cevCat8500mDs3'), ((9, 20, 42), 'cevCat8500m4pFrCE1'),
+    ((9, 20, 43), 'cevCat8500m1pFrCT3'), ((9, 20, 44), 'cevCat8500GeF8p64k'), ((9, 20, 45), 'cevCat8500mArm1p64k'),
+    ((9, 20, 46), 'cevCat8500mArm2p64k'), ((9, 20, 47), 'cevCat8500mOC48c1pSm'), ((9, 20, 48), 'cevCat8500mIma8pT1'),
+    ((9, 20, 49), 'cevCat8500mIma8pE1'), ((9, 20, 50), 'cevCat8500mATM25m4p'), ((9, 20, 51), 'cevCat8500mOC121pMm'),
+    ((9, 20, 52), 'cevCat8500mOC121pSm'), ((9, 20, 53), 'cevCat8500m1pOC12Mixed'),
+    ((9, 20, 54), 'cevCat8500mFimBridge'), ((9, 20, 55), 'cevCat8500mFimOC12Mm'),
+    ((9, 20, 56), 'cevCat8500Ge1pXpif16k'), ((9, 20, 57), 'cevCat8500Ge1pXpif64k'),
+    ((9, 20, 58), 'cevCat8500Ge1pXpif256k'), ((9, 20, 59), 'cevCat8500Atm1pXpif64kOc12SmIr'),
+    ((9, 20, 60), 'cevCat8500Atm1pXpif256kOc12SmIr'), ((9, 20, 61), 'cevCat8500Atm1pXpif64kOc12Mm'),
+    ((9, 20, 62), 'cevCat8500Atm1pXpif256kOc12Mm'), ((9, 20, 63), 'cevCat8500Atm1pXpif64kOc3SmIr'),
+    ((9, 20, 64), 'cevCat8500Atm1pXpif256kOc3SmIr'), ((9, 20, 65), 'cevCat8500Atm1pXpif64kOc3Mm'),
+    ((9, 20, 66), 'cevCat8500Atm1pXpif256kOc3Mm'), ((9, 20, 67), 'cevCat8500Pos1pXpif64kOc12SmIr'),
+    ((9, 20, 68), 'cevCat8500Pos1pXpif256kOc12SmIr'), ((9, 20, 69), 'cevCat8500Pos1pXpif64kOc12SmLr'),
+    ((9, 20, 70), 'cevCat8500Pos1pXpif256kOc12SmLr'), ((9, 21), 'cevModuleWASCommonCards'), ((9, 21, 1), 'cevAusm8t1'),
+    ((9, 21, 2), 'cevAusm8e1'), ((9, 21, 3), 'cevCesm8t1'), ((9, 21, 4), 'cevCesm8e1'), ((9, 21, 5), 'cevFrsm8t1'),
+    ((9, 21, 6), 'cevFrsm8e1'), ((9, 21, 7), 'cevFrsm4x21'), ((9, 21, 8), 'cevFrsm2hssi'),
+    ((9, 21, 9), 'cevAxsm1Oc48'), ((9, 21, 10), 'cevAxsm4Oc12'), ((9, 21, 11), 'cevAxsm8Oc3'),
+    ((9, 21, 12), 'cevAxsm16Oc3'), ((9, 21, 13), 'cevAxsm16T3E3'), ((9, 21, 14), 'cevCesm1t3'),
+    ((9, 21, 15), 'cevCesm1e3'), ((9, 21, 16), 'cevVism8t1'), ((9, 21, 17), 'cevVism8e1'), ((9, 21, 18), 'cevMGXRpm'),
+    ((9, 21, 19), 'cevMGXSrm3t3'), ((9, 21, 20), 'cevEnhAxsm1oc12'), ((9, 21, 21), 'cevEnhAxsm2oc12'),
+    ((9, 21, 22), 'cevEnhAxsm4oc3'), ((9, 21, 23), 'cevEnhAxsm8oc3'), ((9, 21, 24), 'cevEnhAxsm4stm1'),
+    ((9, 21, 25), 'cevEnhAxsm8stm1'), ((9, 21, 26), 'cevEnhAxsm8t3e3'), ((9, 21, 27), 'cevEnhAxsm16t3e3'),
+    ((9, 21, 28), 'cevEnhAxsm8t1'), ((9, 21, 29), 'cevEnhAxsm16t1'), ((9, 21, 30), 'cevEnhAxsm8e1'),
+    ((9, 21, 31), 'cevEnhAxsm16e1'), ((9, 21, 32), 'cevAxsm2oc12'), ((9, 21, 34), 'cevMGXRpmPr'),
+    ((9, 21, 38), 'cevFrsm4V35'), ((9, 21, 39), 'cevFrsm2Ct3'), ((9, 21, 40), 'cevFrsm2t3'),
+    ((9, 21, 41), 'cevFrsm2e3'), ((9, 21, 42), 'cevAusmB8t1'), ((9, 21, 43), 'cevAusmB8e1'),
+    ((9, 21, 45), 'cevVixm4oc12'), ((9, 21, 46), 'cevVixm16oc3'), ((9, 21, 49), 'cevCesmB8e1'),
+    ((9, 21, 50), 'cevCesmB8t1'), ((9, 21, 51), 'cevFrsmC8e1'), ((9, 21, 52), 'cevFrsmC8t1'),
+    ((9, 21, 53), 'cevFrsmB2hssi'), ((9, 21, 54), 'cevFrsmB12In1'), ((9, 21, 55), 'cevHsfr12t3'),
+    ((9, 21, 56), 'cevHsfr12e3'), ((9, 21, 57), 'cevFrsm12t3'), ((9, 21, 58), 'cevFrsm12e3'),
+    ((9, 21, 59), 'cevFrsmB2T3'), ((9, 21, 60), 'cevMgxSrme1Sts3'), ((9, 21, 61), 'cevMgxSrm3t3NoBc'),
+    ((9, 21, 62), 'cevMgxSrmeNoBc'), ((9, 21, 63), 'cevAxsmEn16t1e1'), ((9, 21, 64), 'cevAxsmEn32t1e1'),
+    ((9, 21, 66), 'cevFrsmB2e3'), ((9, 21, 70), 'cevVismPr8t1'), ((9, 21, 71), 'cevVismPr8e1'),
+    ((9, 21, 72), 'cevMGXSrmE1Oc3'), ((9, 21, 73), 'cevAxsm2Oc48'), ((9, 21, 74), 'cevAxsm8Oc12'),
+    ((9, 21, 81), 'cevVxsm4Oc3'), ((9, 21, 82), 'cevMGXSrm4Oc3'), ((9, 21, 87), 'cevMpsm8t1e1'),
+    ((9, 21, 88), 'cevMpsm8t1Atm'), ((9, 21, 89), 'cevMpsm8t1Fr'), ((9, 21, 90), 'cevMpsm8t1Ces'),
+    ((9, 21, 91), 'cevMpsm8e1Atm'), ((9, 21, 92), 'cevMpsm8e1Fr'), ((9, 21, 93), 'cevMpsm8e1Ces'),
+    ((9, 21, 94), 'cevMpsm16t1e1'), ((9, 21, 95), 'cevMpsm16t1Atm'), ((9, 21, 96), 'cevMpsm16t1Fr'),
+    ((9, 21, 97), 'cevMpsm16t1Ces'), ((9, 21, 98), 'cevMpsm16e1Atm'), ((9, 21, 99), 'cevMpsm16e1Fr'),
+    ((9, 21, 100), 'cevMpsm16e1Ces'), ((9, 21, 101), 'cevMpsm155t3e3'), ((9, 21, 102), 'cevMGXSm'),
+    ((9, 21, 103), 'cevVxsm48t1e1'), ((9, 21, 104), 'cevVxsm3T3E3'), ((9, 21, 105), 'cevVxsm6t3e3'),
+    ((9, 21, 106), 'cevVxsm6t3'), ((9, 21, 107), 'cevMpsm16t1e1Ppp'), ((9, 21, 108), 'cevMpsm155t3e3Ppp'),
+    ((9, 22), 'cevModule38xxType'), ((9, 22, 1), 'cevMc3810Vcm3'), ((9, 22, 2), 'cevMc3810Bvm'),
+    ((9, 22, 3), 'cevMc3810AvmFxoUk'), ((9, 22, 4), 'cevMc3810AvmFxoGer'), ((9, 22, 5), 'cevMc3810Hcm2'),
+    ((9, 22, 6), 'cevMc3810Hcm6'), ((9, 22, 7), 'cevMc3810AvmFxoPr3'), ((9, 22, 8), 'cevMc3810AvmFxoPr2'),
+    ((9, 22, 9), 'cevMc3810Vdm'), ((9, 22, 10), 'cevMc3810ApmFxsDid'), ((9, 22, 11), 'cevMc3810BvmNtTe'),
+    ((9, 22, 12), 'cevMc3810Hcm1'), ((9, 22, 13), 'cevMc3810Hcm3'), ((9, 22, 14), 'cevMc3810Hcm4'),
+    ((9, 22, 15), 'cevMc3810Hcm5'), ((9, 22, 17), 'cevSmSre710K9'), ((9, 22, 18), 'cevSmSre910K9'),
+    ((9, 22, 19), 'cevPSmSre710K9'), ((9, 22, 20), 'cevPSmSre910K9'), ((9, 23), 'cevModuleCat29xxType'),
+    ((9, 23, 1), 'cevX2914'), ((9, 23, 2), 'cevX2922'), ((9, 23, 3), 'cevX2914V'), ((9, 23, 4), 'cevX2922V'),
+    ((9, 23, 5), 'cevX2924V'), ((9, 23, 6), 'cevX2951'), ((9, 23, 7), 'cevX2961'), ((9, 23, 8), 'cevX2971'),
+    ((9, 23, 9), 'cevX2972'), ((9, 23, 10), 'cevX2931'), ((9, 23, 12), 'cevModuleCat297024'),
+    ((9, 23, 13), 'cevModuleCat297024TS'), ((9, 23, 14), 'cevModuleCat297048TS'), ((9, 23, 15), 'cevModuleCat296024'),
+    ((9, 23, 16), 'cevModuleCat296048'), ((9, 23, 17), 'cevModuleCat2960G24'), ((9, 23, 18), 'cevModuleCat2960G48'),
+    ((9, 23, 19), 'cevModuleCat296024TT'), ((9, 23, 20), 'cevModuleCat296048TT'), ((9, 23, 21), 'cevModuleCat29608TC'),
+    ((9, 23, 22), 'cevModuleCat2960G8TC'), ((9, 23, 23), 'cevModuleCat296048TCS'),
+    ((9, 23, 24), 'cevModuleCat296024TCS'), ((9, 23, 25), 'cevModuleCat296024S'),
+    ((9, 23, 26), 'cevModuleCat296024PC'), ((9, 23, 27), 'cevModuleCat296024LT'),
+    ((9, 23, 28), 'cevModuleCat2960PD8TT'), ((9, 23, 29), 'cevModuleCat291824TT'),
+    ((9, 23, 30), 'cevModuleCat291824TC'), ((9, 23, 31), 'cevModuleCat291848TT'),
+    ((9, 23, 32), 'cevModuleCat291848TC'), ((9, 23, 33), 'cevModuleCat296048TTS'),
+    ((9, 23, 34), 'cevModuleCat29608TCS'), ((9, 23, 35), 'cevModuleCat296048PSTL'),
+    ((9, 23, 36), 'cevModuleCat296024LCS'), ((9, 23, 37), 'cevModuleCat296024PCS'),
+    ((9, 23, 38), 'cevModuleCat296048PSTS'), ((9, 23, 39), 'cevModuleWsC2960s48tsS'),
+    ((9, 23, 40), 'cevModuleWsC2960s24tsS'), ((9, 23, 41), 'cevModuleWsC2960s48fpdL'),
+    ((9, 23, 42), 'cevModuleWsC2960s48lpdL'), ((9, 23, 43), 'cevModuleWsC2960s48tdL'),
+    ((9, 23, 44), 'cevModuleWsC2960s24pdL'), ((9, 23, 45), 'cevModuleWsC2960s24tdL'),
+    ((9, 23, 46), 'cevModuleWsC2960s48fpsL'), ((9, 23, 47), 'cevModuleWsC2960s48lpsL'),
+    ((9, 23, 48), 'cevModuleWsC2960s24psL'), ((9, 23, 49), 'cevModuleWsC2960s48tsL'),
+    ((9, 23, 50), 'cevModuleWsC2960S24tsL'), ((9, 23, 51), 'cevModuleCat2960cPD8TT'),
+    ((9, 23, 53), 'cevModuleCat2960cG8TC'), ((9, 23, 54), 'cevModuleCat292824TCC'),
+    ((9, 23, 55), 'cevModuleCat292824LTC'), ((9, 23, 56), 'cevModuleCat292848TCC'),
+    ((9, 23, 57), 'cevModuleWsC2960C8tcS'), ((9, 23, 58), 'cevModuleWsC2960C8tcL'),
+    ((9, 23, 59), 'cevModuleWsC2960C8pcL'), ((9, 23, 60), 'cevModuleWsC2960C12pcL'),
+    ((9, 23, 68), 'cevModuleWsC2960x48fpdL'), ((9, 23, 69), 'cevModuleWsC2960x48lpdL'),
+    ((9, 23, 70), 'cevModuleWsC2960x48tdL'), ((9, 23, 71), 'cevModuleWsC2960x24pdL'),
+    ((9, 23, 72), 'cevModuleWsC2960x24tdL'), ((9, 23, 73), 'cevModuleWsC2960x48fpsL'),
+    ((9, 23, 74), 'cevModuleWsC2960x48lpsL'), ((9, 23, 75), 'cevModuleWsC2960x24psL'),
+    ((9, 23, 76), 'cevModuleWsC2960x48tsL'), ((9, 23, 77), 'cevModuleWsC2960x24tsL'),
+    ((9, 23, 78), 'cevModuleWsC2960x24psqL'), ((9, 23, 79), 'cevModuleWsC2960x48lpsS'),
+    ((9, 23, 80), 'cevModuleWsC2960x24psS'), ((9, 23, 81), 'cevModuleWsC2960x48tsLL'),
+    ((9, 23, 82), 'cevModuleWsC2960x24tsLL'), ((9, 23, 83), 'cevModuleC2960XStack'),
+    ((9, 23, 84), 'cevModuleC2960XFex'), ((9, 23, 85), 'cevModuleC2960XFexStack'),
+    ((9, 23, 86), 'cevModuleWsC2960P48PstL'), ((9, 23, 87), 'cevModuleWsC2960P24PcL'),
+    ((9, 23, 88), 'cevModuleWsC2960P24LcL'), ((9, 23, 89), 'cevModuleWsC2960P48TcL'),
+    ((9, 23, 90), 'cevModuleWsC2960P24TcL'), ((9, 23, 91), 'cevModuleWsC2960P48PstS'),
+    ((9, 23, 92), 'cevModuleWsC2960P24PcS'), ((9, 23, 93), 'cevModuleWsC2960P24LcS'),
+    ((9, 23, 94), 'cevModuleWsC2960P48TcS'), ((9, 23, 95), 'cevModuleWsC2960P24TcS'),
+    ((9, 23, 96), 'cevModuleWsC2960XR48FpdI'), ((9, 23, 97), 'cevModuleWsC2960XR48LpdI'),
+    ((9, 23, 98), 'cevModuleWsC2960XR48TdI'), ((9, 23, 99), 'cevModuleWsC2960XR24PdI'),
+    ((9, 23, 100), 'cevModuleWsC2960XR24TdI'), ((9, 23, 101), 'cevModuleWsC2960XR48FpsI'),
+    ((9, 23, 102), 'cevModuleWsC2960XR48LpsI'), ((9, 23, 103), 'cevModuleWsC2960XR48TsI'),
+    ((9, 23, 104), 'cevModuleWsC2960XR24PsI'), ((9, 23, 105), 'cevModuleWsC2960XR24TsI'),
+    ((9, 23, 142), 'cevModuleWsC2960CX8TCL'), ((9, 24), 'cevModuleOscillatorType'), ((9, 24, 1), 'cevStratum3'),
+    ((9, 24, 2), 'cevStratum4'), ((9, 25), 'cevModuleDslamType'), ((9, 25, 1), 'cevNi2WanOc3mmSubOc3mm'),
+    ((9, 25, 2), 'cevNi2WanDs3Sub2Ds3'), ((9, 25, 3), 'cevAtuc1p2Cap'), ((9, 25, 4), 'cevAtuc1p2Dmt'),
+    ((9, 25, 5), 'cevAtuc1p4Dmt'), ((9, 25, 6), 'cevLim'), ((9, 25, 7), 'cevNi2WanOc3smSubOc3sm'),
+    ((9, 25, 8), 'cevNi2WanE3Sub2E3'), ((9, 25, 9), 'cevNi2WanDs3Sub8Ds1Ima'), ((9, 25, 10), 'cevAtuc1p4Cap'),
+    ((9, 25, 11), 'cevStuc1p4'), ((9, 25, 13), 'cevAtuc1p4FlexiDmt'), ((9, 25, 14), 'cevAtuc1p4FlexiCap'),
+    ((9, 25, 15), 'cevAtuc1p4Flexi'), ((9, 25, 16), 'cevAtuc1p4DmtIsdn'), ((9, 25, 17), 'cevNi2WanOc3smSub2Ds3'),
+    ((9, 25, 18), 'cevNi2WanOc3mmSub2Ds3'), ((9, 25, 21), 'cevAtuc1p8DmtItemp'), ((9, 25, 22), 'cevStuc1p8Itemp'),
+    ((9, 25, 35), 'cevNi2WanDs3Sub2Ds3Rev2'), ((9, 25, 36), 'cevNi2WanOc3smSubOc3smRev2'),
+    ((9, 25, 37), 'cevNi2WanOc3mmSubOc3mmRev2'), ((9, 25, 38), 'cevNi2WanOc3smSub2Ds3Rev2'),
+    ((9, 25, 39), 'cevNi2WanOc3mmSub2Ds3Rev2'), ((9, 25, 40), 'cevNi2WanOc3smSubOc3smItemp'),
+    ((9, 25, 43), 'cevIo6100DS3'), ((9, 25, 44), 'cevIo6160DS3'), ((9, 25, 45), 'cevIo6260OC3'),
+    ((9, 25, 46), 'cevIo6260Ds3T1'), ((9, 26), 'cevModuleWASBackCards'), ((9, 26, 1), 'cevLmBnc2t3'),
+    ((9, 26, 2), 'cevLmBnc2e3'), ((9, 26, 3), 'cevLmDb154x21'), ((9, 26, 4), 'cevLmScsi22hssi'),
+    ((9, 26, 5), 'cevLmRj488t1'), ((9, 26, 6), 'cevLmRj488t1R'), ((9, 26, 7), 'cevLmRj488e1'),
+    ((9, 26, 8), 'cevLmRj488e1R'), ((9, 26, 9), 'cevLmSmb8e1'), ((9, 26, 10), 'cevLmSmb8e1R'),
+    ((9, 26, 11), 'cevLmPsmUI'), ((9, 26, 12), 'cevLmMmf4oc3'), ((9, 26, 13), 'cevLmSmfIr4oc3'),
+    ((9, 26, 14), 'cevLmSmfLr4oc3'), ((9, 26, 15), 'cevLmSmfIr1oc12'), ((9, 26, 16), 'cevLmSmfLr1oc12'),
+    ((9, 26, 17), 'cevLmS3Ui'), ((9, 26, 18), 'cevLm1feTx'), ((9, 26, 19), 'cevLm1feFx'),
+    ((9, 26, 20), 'cevLm1mmfFddi'), ((9, 26, 21), 'cevLm1smfFddi'), ((9, 26, 22), 'cevLmRj454e'),
+    ((9, 26, 23), 'cevLmMmf8oc3'), ((9, 26, 24), 'cevLmSmfIr8oc3'), ((9, 26, 25), 'cevLmSmfLr8oc3'),
+    ((9, 26, 26), 'cevLmSmfIr1oc48'), ((9, 26, 27), 'cevLmSmfLr1oc48'), ((9, 26, 28), 'cevLmPsmHD'),
+    ((9, 26, 29), 'cevLmSmb8t3'), ((9, 26, 30), 'cevLmSmb8e3'), ((9, 26, 31), 'cevLmSmb4stm1'),
+    ((9, 26, 32), 'cevLmSmfIr2oc12'), ((9, 26, 33), 'cevLmSmfLr2oc12'), ((9, 26, 34), 'cevLmSmfSr1oc48'),
+    ((9, 26, 35), 'cevLmSmfXlr1oc48'), ((9, 26, 36), 'cevLmBnc3t3'), ((9, 26, 37), 'cevLmSmfIr1Oc48B'),
+    ((9, 26, 38), 'cevLmSmfLr1Oc48B'), ((9, 26, 39), 'cevLmSmfSr1Oc48B'), ((9, 26, 40), 'cevLmSmfIr2Oc12B'),
+    ((9, 26, 41), 'cevLmSmfLr2Oc12B'), ((9, 26, 42), 'cevLmSmfIr1Oc12C'), ((9, 26, 43), 'cevLmSmfLr1Oc12C'),
+    ((9, 26, 44), 'cevLmMmf4Oc3C'), ((9, 26, 45), 'cevLmSmfIr4Oc3C'), ((9, 26, 46), 'cevLmSmfLr4Oc3C'),
+    ((9, 26, 51), 'cevLmSmfXlr1Oc48B'), ((9, 26, 55), 'cevLm1feTxcp'), ((9, 26, 58), 'cevLmSmfIr8Oc3C'),
+    ((9, 26, 59), 'cevLmSmfLr8Oc3C'), ((9, 26, 60), 'cevLmMmf8Oc3C'), ((9, 26, 61), 'cevLmSmfIr1Oc3'),
+    ((9, 26, 62), 'cevLmSmfLr1Oc3'), ((9, 26, 63), 'cevLmSmb1Stm1'), ((9, 26, 64), 'cevLmScsi2B2hssi'),
+    ((9, 26, 65), 'cevLm12In18s'), ((9, 26, 66), 'cevLmSmb6e3'), ((9, 26, 67), 'cevLmComboT3E3Oc3'),
+    ((9, 26, 68), 'cevLmRj488t1e1'), ((9, 26, 69), 'cevLmMcc16e1'), ((9, 26, 70), 'cevLmRj4816t1e1'),
+    ((9, 26, 71), 'cevLmSmfIr2Oc12c'), ((9, 26, 72), 'cevLmSmfLr2Oc12c'), ((9, 26, 82), 'cevLmSmb8Stm1'),
+    ((9, 26, 83), 'cevLmSmf8Oc3Sfp'), ((9, 26, 84), 'cevLmRbbn16t1e1'), ((9, 26, 85), 'cevLmSmfSr1Oc192'),
+    ((9, 26, 86), 'cevLmSmfIr1Oc192'), ((9, 26, 87), 'cevLmSmfLr1Oc192'), ((9, 26, 88), 'cevLmSmfXlr1Oc192'),
+    ((9, 26, 89), 'cevLmMcc8oc3'), ((9, 26, 92), 'cevLmRbbn16t1e11N'), ((9, 26, 93), 'cevLmMcc16e11N'),
+    ((9, 26, 94), 'cevLmRed16t1e1'), ((9, 26, 95), 'cevLmSfp2Oc3'), ((9, 26, 96), 'cevLmSmb2Oc3EL'),
+    ((9, 26, 97), 'cevLmBnc3t3e3'), ((9, 26, 98), 'cevLmRed2Oc3'), ((9, 26, 99), 'cevLmRed3t3e3'),
+    ((9, 26, 100), 'cevLmSmf4Oc12'), ((9, 26, 101), 'cevLmChamp24t1e1'), ((9, 26, 102), 'cevLmSmb3t3e3'),
+    ((9, 26, 103), 'cevLmVxsmSmfIr4Oc3'), ((9, 26, 104), 'cevLmVxsmSmfLr4Oc3'), ((9, 26, 105), 'cevLmVxsm4Oc3R'),
+    ((9, 26, 106), 'cevLmVxsmMmf4Oc3'), ((9, 26, 107), 'cevLm4V35'), ((9, 26, 108), 'cevLm4X21'),
+    ((9, 26, 109), 'cevLmMgxXfUIB'), ((9, 26, 110), 'cevLm5efegeTx'), ((9, 26, 111), 'cevLmPsmHDV'),
+    ((9, 27), 'cevModuleUbrType'), ((9, 27, 2), 'cevUbrMc16s'), ((9, 27, 3), 'cevUbrMc11'),
+    ((9, 27, 4), 'cevUbrMc11c'), ((9, 27, 5), 'cevUbrMc12c'), ((9, 27, 6), 'cevUbrMc14c'), ((9, 27, 7), 'cevUbrMc16a'),
+    ((9, 27, 8), 'cevUbrMc16b'), ((9, 27, 9), 'cevUbrMc16c'), ((9, 27, 10), 'cevUbrMc16e'),
+    ((9, 27, 11), 'cevUbrMc28c'), ((9, 27, 12), 'cevUbrMc26'), ((9, 27, 13), 'cevUbr912C'),
+    ((9, 27, 14), 'cevUbr912S'), ((9, 27, 15), 'cevUbr914R'), ((9, 27, 16), 'cevUbrClk'), ((9, 27, 17), 'cevUbr925'),
+    ((9, 27, 18), 'cevUbrMc26c'), ((9, 27, 21), 'cevUbrMc28cf'), ((9, 27, 22), 'cevUbrMc28cBnc'),
+    ((9, 27, 23), 'cevUbrMc26cf'), ((9, 27, 24), 'cevUbrMc26cBnc'), ((9, 27, 26), 'cevUbrDlc24'),
+    ((9, 27, 33), 'cevUbrMc28j'), ((9, 27, 34), 'cevUbrMc28u'), ((9, 27, 35), 'cevUbrMc16u'),
+    ((9, 27, 36), 'cevUbrMc28x'), ((9, 27, 37), 'cevUbrMc16x'), ((9, 27, 38), 'cevUbrMc520uD'),
+    ((9, 27, 39), 'cevUbrMc520uF'), ((9, 27, 41), 'cevUbrTccPlus'), ((9, 27, 42), 'cevUbrMc16uE'),
+    ((9, 27, 43), 'cevUbrMc28uE'), ((9, 27, 44), 'cevUbrDtcc'), ((9, 27, 46), 'cevUbrMc88v'),
+    ((9, 27, 47), 'cevUbrmc2020'), ((9, 27, 48), 'cevUbrMc3g60Mha'), ((9, 27, 49), 'cevUbrMc3g60rphy'),
+    ((9, 27, 50), 'cevUbrcBR8'), ((9, 28), 'cevModuleCmccType'), ((9, 28, 1), 'cevCmccCip'),
+    ((9, 28, 2), 'cevCmccCip2'), ((9, 28, 3), 'cevCmccPa1ec'), ((9, 28, 4), 'cevCmccPa1pc'),
+    ((9, 28, 5), 'cevCmccPa1ec4'), ((9, 29), 'cevModuleCat6000Type'), ((9, 29, 2), 'cevCat6kWsxSup12ge'),
+    ((9, 29, 3), 'cevCat6kWsx6408Gbic'), ((9, 29, 4), 'cevCat6kWsx6224Fx100Mt'), ((9, 29, 5), 'cevCat6kWsx6248Rj45'),
+    ((9, 29, 6), 'cevCat6kWsx6248Tel'), ((9, 29, 7), 'cevCat6kWsx6302Msm'), ((9, 29, 9), 'cevCat6kWsx6024Mtrj'),
+    ((9, 29, 10), 'cevCat6kMsfc2'), ((9, 29, 11), 'cevCat6kWsx6316GeTx'), ((9, 29, 12), 'cevCat6kWsx6416Gbic'),
+    ((9, 29, 13), 'cevCat6kWsx6324100Fx'), ((9, 29, 14), 'cevCat6kWsx6348Rj45'), ((9, 29, 15), 'cevCat6kWsx650210ge'),
+    ((9, 29, 16), 'cevCat6kWsx6066SlbApc'), ((9, 29, 18), 'cevCat6kWsx6548Rj45'), ((9, 29, 19), 'cevCat6kWsx6248aTel'),
+    ((9, 29, 20), 'cevCat6kWsxSup22ge'), ((9, 29, 21), 'cevCat6kWsc6500SFM'), ((9, 29, 22), 'cevCat6kWsc6500SFM2'),
+    ((9, 29, 23), 'cevCat6kWsx6816GBIC'), ((9, 29, 27), 'cevCat6kWsx6600Audio'), ((9, 29, 28), 'cevCat6kWsx6348RJ21'),
+    ((9, 29, 29), 'cevCat6kWsx6516GBIC'), ((9, 29, 30), 'cevCat6kWsxSup1a2ge'), ((9, 29, 31), 'cevCat6kWsx6548RJ21'),
+    ((9, 29, 32), 'cevCat6kWsx6416GEMT'), ((9, 29, 33), 'cevCat6kWsx6380NAM'), ((9, 29, 34), 'cevCat6kWsx6248aRJ45'),
+    ((9, 29, 35), 'cevCat6kWsx6408aGbic'), ((9, 29, 36), 'cevCat6kWsx6381IDS'), ((9, 29, 37), 'cevCat6kWsx6524MmMT'),
+    ((9, 29, 38), 'cevCat6kWsx6516GeTx'), ((9, 29, 39), 'cevCat6kWsx650110Gex4'),
+    ((9, 29, 40), 'cevCat6kWsx6816Oc3Mm'), ((9, 29, 41), 'cevCat6kWsf6kVpwr'), ((9, 29, 42), 'cevCat6kWsSvcNam1'),
+    ((9, 29, 43), 'cevCat6kWsSvcNam2'), ((9, 29, 44), 'cevCat6kWsSvcFwm1'), ((9, 29, 45), 'cevCat6kWsSvcSsl1'),
+    ((9, 29, 46), 'cevCat6kWsx6516aGBIC'), ((9, 29, 49), 'cevCat6kIpSecVPNSm'), ((9, 29, 50), 'cevCat6kWsSup720'),
+    ((9, 29, 51), 'cevCat6kWsSup720Base'), ((9, 29, 52), 'cevCat6kWsx680210Ge'), ((9, 29, 53), 'cevCat6kWsx6832Sfp'),
+    ((9, 29, 54), 'cevCat6kWsx6748GeTx'), ((9, 29, 55), 'cevCat6kWsx670410Ge'), ((9, 29, 56), 'cevCat6kWsx6748Sfp'),
+    ((9, 29, 57), 'cevCat6kWsx6724Sfp'), ((9, 29, 58), 'cevCat6kWsf6kPfc'), ((9, 29, 59), 'cevCat6kWsf6kPfc2'),
+    ((9, 29, 60), 'cevCat6kWsf6kDfc'), ((9, 29, 61), 'cevCat6kWsf6kPfc3a'), ((9, 29, 62), 'cevCat6kWsf6kDfc3a'),
+    ((9, 29, 63), 'cevCat6kWsx6148GeTx'), ((9, 29, 64), 'cevCat6kWsx6148Rj21'), ((9, 29, 65), 'cevCat6kWsx6148Rj45'),
+    ((9, 29, 66), 'cevCat6kMWAMBlade'), ((9, 29, 67), 'cevCat6kWsx6548GeTx'), ((9, 29, 68), 'cevCat6kWsf6700dfc3a'),
+    ((9, 29, 69), 'cevCat6kWsx6324100FxSm'), ((9, 29, 70), 'cevCat6kWsc6000cl'), ((9, 29, 71), 'cevCat6kWsc6513cl'),
+    ((9, 29, 72), 'cevClk7600'), ((9, 29, 73), 'cevCat6kWsc6kvtt'), ((9, 29, 74), 'cevCat6kWsx6302aMsm'),
+    ((9, 29, 75), 'cevCat6kMemC6kAta164M'), ((9, 29, 76), 'cevCat6kMemC6kCptfl64M'),
+    ((9, 29, 77), 'cevCat6kMemC6kCptfl128M'), ((9, 29, 78), 'cevCat6kMemC6kCptfl256M'),
+    ((9, 29, 79), 'cevCat6kMemC6kFlc16M'), ((9, 29, 80), 'cevCat6kMemC6kFlc24M'), ((9, 29, 81), 'cevCat6kWsSvcIdsm2'),
+    ((9, 29, 82), 'cevCat6kWssvcidsupg'), ((9, 29, 83), 'cevCat6kWsx6148x2Rj45'),
+    ((9, 29, 84), 'cevCat6kWsf6kFe48x2Af'), ((9, 29, 85), 'cevCat6kWsf6kFe48Af'), ((9, 29, 86), 'cevCat6kWsf6kGe48Af'),
+    ((9, 29, 87), 'cevCat6kWsf6kVpwrGe'), ((9, 29, 88), 'cevCat6kWsf6700cfc'), ((9, 29, 89), 'cevCat6kWsSvcWlan1K9'),
+    ((9, 29, 90), 'cevCat6kWsx6624Fxs'), ((9, 29, 91), 'cevCat6kWsSvcAon1'), ((9, 29, 92), 'cevCat6kWsSup32ge'),
+    ((9, 29, 93), 'cevCat6kWsSup3210ge'), ((9, 29, 94), 'cevCat6kPSDBlade'), ((9, 29, 95), 'cevCat6kWsc6kvtte'),
+    ((9, 29, 98), 'cevCat6kWsx6066SlbsK9'), ((9, 29, 99), 'cevCat6kWsf6kpfc3b'), ((9, 29, 100), 'cevCat6kWsf6kdfc3b'),
+    ((9, 29, 101), 'cevCat6kWsf6700dfc3b'), ((9, 29, 102), 'cevCat6kWsf6kpfc3bxl'),
+    ((9, 29, 103), 'cevCat6kWsf6kdfc3bxl'), ((9, 29, 104), 'cevCat6kWsf6700dfc3bxl'), ((9, 29, 105), 'cevCat6kCsg'),
+    ((9, 29, 106), 'cevCat6kMsfc2a'), ((9, 29, 107), 'cevCat6kWs6340Sup'), ((9, 29, 108), 'cevCat6kWs6340LcA'),
+    ((9, 29, 109), 'cevCat6kWs6340LcB'), ((9, 29, 110), 'cevCat6kMec6524gs8s'), ((9, 29, 111), 'cevCat6kMec6524gt8s'),
+    ((9, 29, 114), 'cevCat6kMec6524Msfc2a'), ((9, 29, 115), 'cevCat6kMec6524Pfc3c'),
+    ((9, 29, 116), 'cevCat6kWsx6196Rj21'), ((9, 29, 117), 'cevCat6kWsx6148FeSfp'),
+    ((9, 29, 118), 'cevCat6kWsx6148aGeTx'), ((9, 29, 119), 'cevCat6kWsx6148aRj45'), ((9, 29, 120), 'cevCat6kAce10K9'),
+    ((9, 29, 122), 'cevCat6kWsg6483'), ((9, 29, 123), 'cevCat6kWsg6485'), ((9, 29, 124), 'cevCat6kWsg6488'),
+    ((9, 29, 125), 'cevCat6kWsg6489'), ((9, 29, 126), 'cevCat6kWsSvcWebVpnK9'), ((9, 29, 127), 'cevCat6kSAMIBB'),
+    ((9, 29, 128), 'cevCat6kWsx6708a10ge'), ((9, 29, 129), 'cevCat6kWsx670810ge'),
+    ((9, 29, 131), 'cevCat6kWsf6700Dfc3c'), ((9, 29, 132), 'cevCat6kWsf6700Dfc3cxl'),
+    ((9, 29, 133), 'cevCat6kVsS72010G'), ((9, 29, 134), 'cevCat6kVsf6kPfc3c'), ((9, 29, 135), 'cevCat6kVsf6kPfc3cxl'),
+    ((9, 29, 136), 'cevCat6kVsF6kMsfc3'), ((9, 29, 137), 'cevCat6kWsF6kPisa'), ((9, 29, 138), 'cevCat6kVsF6kPfc4xl'),
+    ((9, 29, 139), 'cevCat6kWsF6kDfc4exl'), ((9, 29, 142), 'cevCat6kWsx671610Ge'), ((9, 29, 143), 'cevCat6kVsF6kPfc4'),
+    ((9, 29, 144), 'cevCat6kWsF6kDfc4e'), ((9, 29, 145), 'cevCat6kWsSup32Pge'), ((9, 29, 146), 'cevCat6kWsSup32P10ge'),
+    ((9, 29, 148), 'cevCat6kWsx690810g'), ((9, 29, 155), 'cevCat6kWsc6513Ecl'), ((9, 29, 156), 'cevCat6kWsSvcWism'),
+    ((9, 29, 157), 'cevCat6kWsSvcNam1S250'), ((9, 29, 158), 'cevCat6kWsSvcNam2S250'),
+    ((9, 29, 159), 'cevCat6kWsF6kDfc4a'), ((9, 29, 160), 'cevCat6kWsF6kDfc4axl'), ((9, 29, 163), 'cevCat6kVsSup2t10g'),
+    ((9, 29, 164), 'cevCat6kVsF6kMsfc5'), ((9, 29, 166), 'cevCat6kWsf6k48At'),
+    ((9, 29, 167), 'cevCat6kWsx6148eGe45At'), ((9, 29, 168), 'cevCat6kWsx671610T'),
+    ((9, 29, 169), 'cevCat6kWsSvcAsaSm1'), ((9, 29, 172), 'cevCat6kWsx6148eGeTx'),
+    ((9, 29, 174), 'cevCat6kWsx690440g'), ((9, 29, 175), 'cevCat6kWsSvcNam3K9'), ((9, 29, 176), 'cevCat6kWsx6848Tx'),
+    ((9, 29, 178), 'cevCat6kWsx6848sfp'), ((9, 29, 179), 'cevCat6kWsx6824sfp'), ((9, 29, 181), 'cevCat6kWsx681610ge'),
+    ((9, 29, 182), 'cevCat6kWsx681610t'), ((9, 29, 184), 'cevCat6kACE20K9'), ((9, 29, 185), 'cevCat6kWsSvcWism2'),
+    ((9, 29, 186), 'cevCat6kWsSvcAsaSm1K7'), ((9, 29, 187), 'cevCat6kWsSvcVse1K9'),
+    ((9, 29, 188), 'cevCat6kSvcAppProc1'), ((9, 29, 189), 'cevCat6kC6880xSup'), ((9, 29, 190), 'cevCat6kC6880xleSup'),
+    ((9, 29, 191), 'cevCat6kC6880x16p10g'), ((9, 29, 192), 'cevCat6kC6880xle16p10g'),
+    ((9, 29, 195), 'cevCat6kC6800xl33vCon'), ((9, 29, 196), 'cevCat6kC680032p10g'),
+    ((9, 29, 197), 'cevCat6kC680032p10gxl'), ((9, 29, 198), 'cevCat6kC680016p10g'),
+    ((9, 29, 199), 'cevCat6kC680016p10gxl'), ((9, 29, 200), 'cevCat6kC68008p10g'),
+    ((9, 29, 201), 'cevCat6kC68008p10gxl'), ((9, 29, 210), 'cevCat6kIA48FPDR'), ((9, 29, 211), 'cevCat6kPrimus'),
+    ((9, 29, 212), 'cevCat6kOptimus'), ((9, 29, 213), 'cevCat6kRodimus'), ((9, 29, 214), 'cevCat6kTransformer'),
+    ((9, 29, 215), 'cevCat6kC6800Sup6t'), ((9, 29, 216), 'cevCat6kC6800Sup6txl'), ((9, 30), 'cevModuleCat5000Type'),
+    ((9, 30, 1), 'cevCat5kRsfc'), ((9, 31), 'cevModule7100Type'), ((9, 31, 1), 'cevIo2feTxIsl'),
+    ((9, 31, 2), 'cevIsmIpsecMppe'), ((9, 31, 3), 'cev7100VPNAccelerator'),
+    ((9, 31, 4), 'cev7100VPNAcceleratorModule2'), ((9, 31, 5), 'cev7100VPNAcceleratorAES'),
+    ((9, 31, 6), 'cev7100VPNAM2Plus'), ((9, 32), 'cevModule10000Type'), ((9, 32, 1), 'cevPos1oc12'),
+    ((9, 32, 2), 'cevP6Ct3'), ((9, 32, 3), 'cevGe'), ((9, 32, 4), 'cevAtm1Oc12'), ((9, 32, 5), 'cevP1COc12'),
+    ((9, 32, 6), 'cevP4Chstm1'), ((9, 32, 8), 'cev24feTx'), ((9, 32, 9), 'cev24feFxMm'), ((9, 32, 10), 'cev24feFxSm'),
+    ((9, 32, 11), 'cevSrpOc48SmSr'), ((9, 32, 12), 'cevSrpOc48SmIr'), ((9, 32, 13), 'cevPos6oc3'),
+    ((9, 32, 14), 'cevAtm4oc3'), ((9, 32, 15), 'cevP8E3Ds3'), ((9, 32, 16), 'cevSrpPos1oc48SmSr'),
+    ((9, 32, 17), 'cevSrpPos1oc48SmLr'), ((9, 32, 18), 'cevC10K48MbFlashCard'), ((9, 32, 19), 'cevC10K128MbFlashCard'),
+    ((9, 32, 22), 'cevP24ChE1T1'), ((9, 32, 23), 'cev4Ge8FeTx'), ((9, 32, 24), 'cev4Ge8FeFxMm'),
+    ((9, 32, 25), 'cev4Ge8FeFxSm'), ((9, 32, 26), 'cevSrpOc48SmLr1'), ((9, 32, 27), 'cevSrpOc48SmLr2'),
+    ((9, 32, 30), 'cevP8Fe'), ((9, 32, 31), 'cevP8Ds3E3Atm'), ((9, 32, 32), 'cevC10720Mnt'),
+    ((9, 32, 34), 'cevPosSrpOc48SmSr'), ((9, 32, 35), 'cevPosSrpOc48SmIr'), ((9, 32, 36), 'cevPosSrpOc48SmLr1'),
+    ((9, 32, 37), 'cevPosSrpOc48SmLr2'), ((9, 32, 38), 'cevC10KJacket'), ((9, 32, 39), 'cev24feTxB'),
+    ((9, 32, 40), 'cev4Ge8FeTxB'), ((9, 32, 41), 'cevRprSrpOc48'), ((9, 32, 42), 'cevP4Ct3'),
+    ((9, 32, 43), 'cevAtm4oc3stm1Lr'), ((9, 33), 'cevModuleAs5400Type'), ((9, 33, 1), 'cevAs5400DfcCarrier'),
+    ((9, 33, 2), 'cevAs5400DfcNp348'), ((9, 33, 3), 'cevAs5400DfcNp192'), ((9, 33, 4), 'cevAs5400XMDfcCarrier'),
+    ((9, 33, 5), 'cevAs5400XMVFC'), ((9, 35), 'cevModuleCat4000Type'), ((9, 35, 1), 'cevCat4232L3'),
+    ((9, 35, 2), 'cevCat4kGateway'), ((9, 35, 3), 'cevCat4kWsx4014'), ((9, 35, 4), 'cevCat4kWsx4124FxMt'),
+    ((9, 35, 5), 'cevCat4kWsx4148FxMt'), ((9, 35, 6), 'cevCat4kWsx4148Rj'), ((9, 35, 7), 'cevCat4kWsx4148Rj21'),
+    ((9, 35, 8), 'cevCat4kWsx4148Rj45V'), ((9, 35, 9), 'cevCat4kWsx4232GbRj'), ((9, 35, 10), 'cevCat4kWsx4232RjXx'),
+    ((9, 35, 11), 'cevCat4kWsx4306Gb'), ((9, 35, 12), 'cevCat4kWsx4418Gb'), ((9, 35, 13), 'cevCat4kWsx44122GbTx'),
+    ((9, 35, 14), 'cevCat4kWsx4424GbRj45'), ((9, 35, 15), 'cevCat4kWsx4448GbLx'),
+    ((9, 35, 16), 'cevCat4kWsx4448GbRj45'), ((9, 35, 17), 'cevCat4kPEM'), ((9, 35, 18), 'cevCat4kWsx4515'),
+    ((9, 35, 19), 'cevCat4kWsx4148LxMt'), ((9, 35, 20), 'cevCat4kWsx4248Rj45V'), ((9, 35, 21), 'cevCat4kWsx4516'),
+    ((9, 35, 22), 'cevCat4kWsx4013Plus'), ((9, 35, 23), 'cevCat4kWsx4248Rj21V'), ((9, 35, 24), 'cevCat4kWsx4302Gb'),
+    ((9, 35, 25), 'cevCat4kWsx4548GbRj45V'), ((9, 35, 26), 'cevCat4kWsx4548GbRj45'),
+    ((9, 35, 27), 'cevCat4kWsx4712Qam24B'), ((9, 35, 28), 'cevCat4kWsx4148FeBdLc'), ((9, 35, 29), 'cevCat4kWsx4124Rj'),
+    ((9, 35, 30), 'cevCat4kWsx4224Rj45V'), ((9, 35, 31), 'cevCat4kWsx4524GbRj45V'),
+    ((9, 35, 32), 'cevCat4kWsx4506GBT'), ((9, 35, 33), 'cevCat4kWsxSvcNam'), ((9, 35, 34), 'cevCat4kWsx4448GbSfp'),
+    ((9, 35, 35), 'cevCat4kWsX4013PlusTS'), ((9, 35, 36), 'cevCat4kWsx4kClock'), ((9, 35, 37), 'cevCat4kWsx4948'),
+    ((9, 35, 38), 'cevCat4kWsx451610GE'), ((9, 35, 40), 'cevCat4kWsx4013Plus10GE'),
+    ((9, 35, 42), 'cevCat4kWsx494810GE'), ((9, 35, 43), 'cevCat4kWsx4kMux'), ((9, 35, 44), 'cevCat4kWsx490410ge'),
+    ((9, 35, 45), 'cevCat4kWsx4900M'), ((9, 35, 46), 'cevCat4kWsx490810ge'), ((9, 35, 47), 'cevCat4kWsx4920Gbrj45'),
+    ((9, 35, 48), 'cevCat4kWsx4590'), ((9, 35, 49), 'cevCatWsx4624SfpE'), ((9, 35, 50), 'cevCat4kWsx492810GE'),
+    ((9, 35, 51), 'cevCat4kWsx4548GbRj45VPlus'), ((9, 35, 52), 'cevCat4kWsx490810GRj45'),
+    ((9, 35, 54), 'cevCat4kWsx4948ef10GE'), ((9, 35, 55), 'cevCat4kC4kxNm8'), ((9, 35, 56), 'cevCat4kWsx4500x16'),
+    ((9, 35, 57), 'cevCat4kWsx4500x32'), ((9, 36), 'cevModuleCVAType'), ((9, 36, 1), 'cevCVA122'),
+    ((9, 36, 2), 'cevCVA124'), ((9, 36, 3), 'cevCVA122E'), ((9, 36, 4), 'cevCVA124E'),
+    ((9, 37), 'cevModuleAs5850Type'), ((9, 37, 1), 'cevAs5850EPM2Ge'), ((9, 37, 2), 'cevAs5850Ct3Up216'),
+    ((9, 37, 3), 'cevAs58508Ce1Up216'), ((9, 37, 4), 'cevAs58xxUp324'), ((9, 37, 5), 'cevAs585024E1'),
+    ((9, 37, 6), 'cevAs585024T1'), ((9, 38), 'cevModuleAs5350Type'), ((9, 38, 2), 'cevAs5350XMDfcCarrier'),
+    ((9, 39), 'cevModule24xxType'), ((9, 39, 1), 'cevIad2420Vm8fxs'), ((9, 39, 2), 'cevIad242016fxs'),
+    ((9, 39, 3), 'cevIad2420VmPwr'), ((9, 39, 4), 'cevIad2420Adsl'), ((9, 39, 5), 'cevIad2420Hcm1'),
+    ((9, 39, 6), 'cevIad2420Hcm2'), ((9, 39, 7), 'cevIad2420Hcm3'), ((9, 39, 8), 'cevIad2420Hcm4'),
+    ((9, 39, 9), 'cevIad2420Hcm5'), ((9, 39, 10), 'cevIad2420Hcm6'), ((9, 39, 11), 'cevIad2420Cpu'),
+    ((9, 39, 12), 'cevIad2420MfmE1Unbalanced'), ((9, 39, 13), 'cevIad2420MfmE1Dsx1Csu'),
+    ((9, 39, 14), 'cevIad2420MfmT1Dsx1Csu'), ((9, 39, 15), 'cevIad24208fxo'),
+    ((9, 39, 18), 'cevIad242016fxsOffPremise'), ((9, 39, 19), 'cevIad2430Ob8Fxs'), ((9, 39, 20), 'cevIad2430Ob16Fxs'),
+    ((9, 39, 21), 'cevIad2430Ob24Fxs'), ((9, 39, 22), 'cevIad2430ObT1E1'), ((9, 39, 23), 'cevIad2435ObT1E1'),
+    ((9, 39, 24), 'cevIad2435Ob8Fxs'), ((9, 39, 25), 'cevVG204Ob4Fxs'), ((9, 39, 26), 'cevVG202Ob2Fxs'),
+    ((9, 39, 27), 'cevVg202xmOb2fxs'), ((9, 39, 28), 'cevVg204xmOb4fxs'), ((9, 39, 29), 'cevVg3x0ob24fxs'),
+    ((9, 40), 'cevModule10000Bases'), ((9, 40, 2), 'cevM10000BaseLX4'), ((9, 40, 3), 'cevM10000BaseEX4'),
+    ((9, 40, 4), 'cevM10000BaseLR'), ((9, 40, 5), 'cevM10000BaseER'), ((9, 40, 6), 'cevM10000BaseSX4'),
+    ((9, 40, 7), 'cevM10000BaseSR'), ((9, 40, 8), 'cevM10000BaseCX4'), ((9, 40, 9), 'cevM10000BaseZR'),
+    ((9, 40, 10), 'cev10GBaseLW'), ((9, 40, 11), 'cev10GBaseEW'), ((9, 40, 12), 'cev10GBaseSW'),
+    ((9, 40, 13), 'cev10GBaseEdc1310'), ((9, 40, 14), 'cev10GBaseDwdm3033'), ((9, 40, 15), 'cev10GBaseDwdm3112'),
+    ((9, 40, 16), 'cev10GBaseDwdm3190'), ((9, 40, 17), 'cev10GBaseDwdm3268'), ((9, 40, 18), 'cev10GBaseDwdm3425'),
+    ((9, 40, 19), 'cev10GBaseDwdm3504'), ((9, 40, 20), 'cev10GBaseDwdm3582'), ((9, 40, 21), 'cev10GBaseDwdm3661'),
+    ((9, 40, 22), 'cev10GBaseDwdm3819'), ((9, 40, 23), 'cev10GBaseDwdm3898'), ((9, 40, 24), 'cev10GBaseDwdm3977'),
+    ((9, 40, 25), 'cev10GBaseDwdm4056'), ((9, 40, 26), 'cev10GBaseDwdm4214'), ((9, 40, 27), 'cev10GBaseDwdm4294'),
+    ((9, 40, 28), 'cev10GBaseDwdm4373'), ((9, 40, 29), 'cev10GBaseDwdm4453'), ((9, 40, 30), 'cev10GBaseDwdm4612'),
+    ((9, 40, 31), 'cev10GBaseDwdm4692'), ((9, 40, 32), 'cev10GBaseDwdm4772'), ((9, 40, 33), 'cev10GBaseDwdm4851'),
+    ((9, 40, 34), 'cev10GBaseDwdm5012'), ((9, 40, 35), 'cev10GBaseDwdm5092'), ((9, 40, 36), 'cev10GBaseDwdm5172'),
+    ((9, 40, 37), 'cev10GBaseDwdm5252'), ((9, 40, 38), 'cev10GBaseDwdm5413'), ((9, 40, 39), 'cev10GBaseDwdm5494'),
+    ((9, 40, 40), 'cev10GBaseDwdm5575'), ((9, 40, 41), 'cev10GBaseDwdm5655'), ((9, 40, 42), 'cev10GBaseDwdm5817'),
+    ((9, 40, 43), 'cev10GBaseDwdm5898'), ((9, 40, 44), 'cev10GBaseDwdm5979'), ((9, 40, 45), 'cev10GBaseDwdm6061'),
+    ((9, 40, 46), 'cev10GBaseRec'), ((9, 42), 'cevModuleONS15540Type'), ((9, 42, 1), 'cevONS15540LCMBTspProtect'),
+    ((9, 42, 2), 'cevONS15540LCMBTspEast'), ((9, 42, 3), 'cevONS15540LCMBTspWest'),
+    ((9, 42, 4), 'cevONS15540MDXMBOSC'), ((9, 42, 5), 'cevONS15540MDXMB'), ((9, 42, 6), 'cevONS15540Tsp1Ch0102MmSc'),
+    ((9, 42, 7), 'cevONS15540Tsp1Ch0304MmSc'), ((9, 42, 8), 'cevONS15540Tsp1Ch0506MmSc'),
+    ((9, 42, 9), 'cevONS15540Tsp1Ch0708MmSc'), ((9, 42, 10), 'cevONS15540Tsp1Ch0910MmSc'),
+    ((9, 42, 11), 'cevONS15540Tsp1Ch1112MmSc'), ((9, 42, 12), 'cevONS15540Tsp1Ch1314MmSc'),
+    ((9, 42, 13), 'cevONS15540Tsp1Ch1516MmSc'), ((9, 42, 14), 'cevONS15540Tsp1Ch1718MmSc'),
+    ((9, 42, 15), 'cevONS15540Tsp1Ch1920MmSc'), ((9, 42, 16), 'cevONS15540Tsp1Ch2122MmSc'),
+    ((9, 42, 17), 'cevONS15540Tsp1Ch2324MmSc'), ((9, 42, 18), 'cevONS15540Tsp1Ch2526MmSc'),
+    ((9, 42, 19), 'cevONS15540Tsp1Ch2728MmSc'), ((9, 42, 20), 'cevONS15540Tsp1Ch2930MmSc'),
+    ((9, 42, 21), 'cevONS15540Tsp1Ch3132MmSc'), ((9, 42, 22), 'cevONS15540Tsp1Ch0102SmSc'),
+    ((9, 42, 23), 'cevONS15540Tsp1Ch0304SmSc'), ((9, 42, 24), 'cevONS15540Tsp1Ch0506SmSc'),
+    ((9, 42, 25), 'cevONS15540Tsp1Ch0708SmSc'), ((9, 42, 26), 'cevONS15540Tsp1Ch0910SmSc'),
+    ((9, 42, 27), 'cevONS15540Tsp1Ch1112SmSc'), ((9, 42, 28), 'cevONS15540Tsp1Ch1314SmSc'),
+    ((9, 42, 29), 'cevONS15540Tsp1Ch1516SmSc'), ((9, 42, 30), 'cevONS15540Tsp1Ch1718SmSc'),
+    ((9, 42, 31), 'cevONS15540Tsp1Ch1920SmSc'), ((9, 42, 32), 'cevONS15540Tsp1Ch2122SmSc'),
+    ((9, 42, 33), 'cevONS15540Tsp1Ch2324SmSc'), ((9, 42, 34), 'cevONS15540Tsp1Ch2526SmSc'),
+    ((9, 42, 35), 'cevONS15540Tsp1Ch2728SmSc'), ((9, 42, 36), 'cevONS15540Tsp1Ch2930SmSc'),
+    ((9, 42, 37), 'cevONS15540Tsp1Ch3132SmSc'), ((9, 42, 38), 'cevONS15540MDX4ChA'),
+    ((9, 42, 39), 'cevONS15540MDX4ChB'), ((9, 42, 40), 'cevONS15540MDX4ChC'), ((9, 42, 41), 'cevONS15540MDX4ChD'),
+    ((9, 42, 42), 'cevONS15540MDX4ChE'), ((9, 42, 43), 'cevONS15540MDX4ChF'), ((9, 42, 44), 'cevONS15540MDX4ChG'),
+    ((9, 42, 45), 'cevONS15540MDX4ChH'), ((9, 42, 46), 'cevONS15540MDX8ChAB'), ((9, 42, 47), 'cevONS15540MDX8ChCD'),
+    ((9, 42, 48), 'cevONS15540MDX8ChEF'), ((9, 42, 49), 'cevONS15540MDX8ChGH'), ((9, 42, 50), 'cevONS15540MDX4ChAOSC'),
+    ((9, 42, 51), 'cevONS15540MDX4ChBOSC'), ((9, 42, 52), 'cevONS15540MDX4ChCOSC'),
+    ((9, 42, 53), 'cevONS15540MDX4ChDOSC'), ((9, 42, 54), 'cevONS15540MDX4ChEOSC'),
+    ((9, 42, 55), 'cevONS15540MDX4ChFOSC'), ((9, 42, 56), 'cevONS15540MDX4ChGOSC'),
+    ((9, 42, 57), 'cevONS15540MDX4ChHOSC'), ((9, 42, 58), 'cevONS15540MDX8ChABOSC'),
+    ((9, 42, 59), 'cevONS15540MDX8ChCDOSC'), ((9, 42, 60), 'cevONS15540MDX8ChEFOSC'),
+    ((9, 42, 61), 'cevONS15540MDX8ChGHOSC'), ((9, 42, 62), 'cevONS15540MDX16ChADOSC'),
+    ((9, 42, 63), 'cevONS15540MDX16ChEH'), ((9, 42, 64), 'cevONS15540Tsp2Ch0102'),
+    ((9, 42, 65), 'cevONS15540Tsp2Ch0304'), ((9, 42, 66), 'cevONS15540Tsp2Ch0506'),
+    ((9, 42, 67), 'cevONS15540Tsp2Ch0708'), ((9, 42, 68), 'cevONS15540Tsp2Ch0910'),
+    ((9, 42, 69), 'cevONS15540Tsp2Ch1112'), ((9, 42, 70), 'cevONS15540Tsp2Ch1314'),
+    ((9, 42, 71), 'cevONS15540Tsp2Ch1516'), ((9, 42, 72), 'cevONS15540Tsp2Ch1718'),
+    ((9, 42, 73), 'cevONS15540Tsp2Ch1920'), ((9, 42, 74), 'cevONS15540Tsp2Ch2122'),
+    ((9, 42, 75), 'cevONS15540Tsp2Ch2324'), ((9, 42, 76), 'cevONS15540Tsp2Ch2526'),
+    ((9, 42, 77), 'cevONS15540Tsp2Ch2728'), ((9, 42, 78), 'cevONS15540Tsp2Ch2930'),
+    ((9, 42, 79), 'cevONS15540Tsp2Ch3132'), ((9, 42, 80), 'cevONS15540LCMB10GOC192c'),
+    ((9, 42, 81), 'cevONS15540ESPxLCMBTspSp'), ((9, 42, 82), 'cevONS15540ESPxLCMBTsp'),
+    ((9, 42, 83), 'cevONS15540ESPxLCMB10GOC192cSp'), ((9, 42, 84), 'cevONS15540ESPxLCMB10GOC192c'),
+    ((9, 42, 85), 'cevONS15540LCDC10G'), ((9, 42, 86), 'cevONS15540ESPxMDXMBOsc'),
+    ((9, 42, 87), 'cevONS15540ESPxMDXMB'), ((9, 42, 88), 'cevONS15540ESPxMDXMBOscESP'),
+    ((9, 42, 89), 'cevONS15540ESPxMDXMBESP'), ((9, 42, 90), 'cevONS1554010GigITUCh01'),
+    ((9, 42, 91), 'cevONS1554010GigITUCh02'), ((9, 42, 92), 'cevONS1554010GigITUCh03'),
+    ((9, 42, 93), 'cevONS1554010GigITUCh04'), ((9, 42, 94), 'cevONS1554010GigITUCh05'),
+    ((9, 42, 95), 'cevONS1554010GigITUCh06'), ((9, 42, 96), 'cevONS1554010GigITUCh07'),
+    ((9, 42, 97), 'cevONS1554010GigITUCh08'), ((9, 42, 98), 'cevONS1554010GigITUCh09'),
+    ((9, 42, 99), 'cevONS1554010GigITUCh10'), ((9, 42, 100), 'cevONS1554010GigITUCh11'),
+    ((9, 42, 101), 'cevONS1554010GigITUCh12'), ((9, 42, 102), 'cevONS1554010GigITUCh13'),
+    ((9, 42, 103), 'cevONS1554010GigITUCh14'), ((9, 42, 104), 'cevONS1554010GigITUCh15'),
+    ((9, 42, 105), 'cevONS1554010GigITUCh16'), ((9, 42, 106), 'cevONS1554010GigITUCh17'),
+    ((9, 42, 107), 'cevONS1554010GigITUCh18'), ((9, 42, 108), 'cevONS1554010GigITUCh19'),
+    ((9, 42, 109), 'cevONS1554010GigITUCh20'), ((9, 42, 110), 'cevONS1554010GigITUCh21'),
+    ((9, 42, 111), 'cevONS1554010GigITUCh22'), ((9, 42, 112), 'cevONS1554010GigITUCh23'),
+    ((9, 42, 113), 'cevONS1554010GigITUCh24'), ((9, 42, 114), 'cevONS1554010GigITUCh25'),
+    ((9, 42, 115), 'cevONS1554010GigITUCh26'), ((9, 42, 116), 'cevONS1554010GigITUCh27'),
+    ((9, 42, 117), 'cevONS1554010GigITUCh28'), ((9, 42, 118), 'cevONS1554010GigITUCh29'),
+    ((9, 42, 119), 'cevONS1554010GigITUCh30'), ((9, 42, 120), 'cevONS1554010GigITUCh31'),
+    ((9, 42, 121), 'cevONS1554010GigITUCh32'), ((9, 42, 122), 'cevONS15540OC192cITUCh01'),
+    ((9, 42, 123), 'cevONS15540OC192cITUCh02'), ((9, 42, 124), 'cevONS15540OC192cITUCh03'),
+    ((9, 42, 125), 'cevONS15540OC192cITUCh04'), ((9, 42, 126), 'cevONS15540OC192cITUCh05'),
+    ((9, 42, 127), 'cevONS15540OC192cITUCh06'), ((9, 42, 128), 'cevONS15540OC192cITUCh07'),
+    ((9, 42, 129), 'cevONS15540OC192cITUCh08'), ((9, 42, 130), 'cevONS15540OC192cITUCh09'),
+    ((9, 42, 131), 'cevONS15540OC192cITUCh10'), ((9, 42, 132), 'cevONS15540OC192cITUCh11'),
+    ((9, 42, 133), 'cevONS15540OC192cITUCh12'), ((9, 42, 134), 'cevONS15540OC192cITUCh13'),
+    ((9, 42, 135), 'cevONS15540OC192cITUCh14'), ((9, 42, 136), 'cevONS15540OC192cITUCh15'),
+    ((9, 42, 137), 'cevONS15540OC192cITUCh16'), ((9, 42, 138), 'cevONS15540OC192cITUCh17'),
+    ((9, 42, 139), 'cevONS15540OC192cITUCh18'), ((9, 42, 140), 'cevONS15540OC192cITUCh19'),
+    ((9, 42, 141), 'cevONS15540OC192cITUCh20'), ((9, 42, 142), 'cevONS15540OC192cITUCh21'),
+    ((9, 42, 143), 'cevONS15540OC192cITUCh22'), ((9, 42, 144), 'cevONS15540OC192cITUCh23'),
+    ((9, 42, 145), 'cevONS15540OC192cITUCh24'), ((9, 42, 146), 'cevONS15540OC192cITUCh25'),
+    ((9, 42, 147), 'cevONS15540OC192cITUCh26'), ((9, 42, 148), 'cevONS15540OC192cITUCh27'),
+    ((9, 42, 149), 'cevONS15540OC192cITUCh28'), ((9, 42, 150), 'cevONS15540OC192cITUCh29'),
+    ((9, 42, 151), 'cevONS15540OC192cITUCh30'), ((9, 42, 152), 'cevONS15540OC192cITUCh31'),
+    ((9, 42, 153), 'cevONS15540OC192cITUCh32'), ((9, 42, 154), 'cevONS15540ESPxMDX4ChA'),
+    ((9, 42, 155), 'cevONS15540ESPxMDX4ChB'), ((9, 42, 156), 'cevONS15540ESPxMDX4ChC'),
+    ((9, 42, 157), 'cevONS15540ESPxMDX4ChD'), ((9, 42, 158), 'cevONS15540ESPxMDX4ChE'),
+    ((9, 42, 159), 'cevONS15540ESPxMDX4ChF'), ((9, 42, 160), 'cevONS15540ESPxMDX4ChG'),
+    ((9, 42, 161), 'cevONS15540ESPxMDX4ChH'), ((9, 42, 162), 'cevONS15540ESPxMDX8ChAB'),
+    ((9, 42, 163), 'cevONS15540ESPxMDX8ChCD'), ((9, 42, 164), 'cevONS15540ESPxMDX8ChEF'),
+    ((9, 42, 165), 'cevONS15540ESPxMDX8ChGH'), ((9, 42, 166), 'cevONS15540ESPxMDX16ChEH'),
+    ((9, 42, 167), 'cevONS15540ESPxMDX4ChAOSC'), ((9, 42, 168), 'cevONS15540ESPxMDX4ChBOSC'),
+    ((9, 42, 169), 'cevONS15540ESPxMDX4ChCOSC'), ((9, 42, 170), 'cevONS15540ESPxMDX4ChDOSC'),
+    ((9, 42, 171), 'cevONS15540ESPxMDX4ChEOSC'), ((9, 42, 172), 'cevONS15540ESPxMDX4ChFOSC'),
+    ((9, 42, 173), 'cevONS15540ESPxMDX4ChGOSC'), ((9, 42, 174), 'cevONS15540ESPxMDX4ChHOSC'),
+    ((9, 42, 175), 'cevONS15540ESPxMDX8ChABOSC'), ((9, 42, 176), 'cevONS15540ESPxMDX8ChCDOSC'),
+    ((9, 42, 177), 'cevONS15540ESPxMDX8ChEFOSC'), ((9, 42, 178), 'cevONS15540ESPxMDX8ChGHOSC'),
+    ((9, 42, 179), 'cevONS15540ESPxMDX16ChADOSC'), ((9, 42, 180), 'cevONS15540ESPxMDX32ChOSC'),
+    ((9, 42, 181), 'cevONS15540EspPxPSM'), ((9, 42, 182), 'cevONS15540ESPxVOA1ITUCh1'),
+    ((9, 42, 183), 'cevONS15540ESPxVOA1ITUCh2'), ((9, 42, 184), 'cevONS15540ESPxVOA1ITUCh3'),
+    ((9, 42, 185), 'cevONS15540ESPxVOA1ITUCh4'), ((9, 42, 186), 'cevONS15540ESPxVOA1ITUCh5'),
+    ((9, 42, 187), 'cevONS15540ESPxVOA1ITUCh6'), ((9, 42, 188), 'cevONS15540ESPxVOA1ITUCh7'),
+    ((9, 42, 189), 'cevONS15540ESPxVOA1ITUCh8'), ((9, 42, 190), 'cevONS15540ESPxVOA1ITUCh9'),
+    ((9, 42, 191), 'cevONS15540ESPxVOA1ITUCh10'), ((9, 42, 192), 'cevONS15540ESPxVOA1ITUCh11'),
+    ((9, 42, 193), 'cevONS15540ESPxVOA1ITUCh12'), ((9, 42, 194), 'cevONS15540ESPxVOA1ITUCh13'),
+    ((9, 42, 195), 'cevONS15540ESPxVOA1ITUCh14'), ((9, 42, 196), 'cevONS15540ESPxVOA1ITUCh15'),
+    ((9, 42, 197), 'cevONS15540ESPxVOA1ITUCh16'), ((9, 42, 198), 'cevONS15540ESPxVOA1ITUCh17'),
+    ((9, 42, 199), 'cevONS15540ESPxVOA1ITUCh18'), ((9, 42, 200), 'cevONS15540ESPxVOA1ITUCh19'),
+    ((9, 42, 201), 'cevONS15540ESPxVOA1ITUCh20'), ((9, 42, 202), 'cevONS15540ESPxVOA1ITUCh21'),
+    ((9, 42, 203), 'cevONS15540ESPxVOA1ITUCh22'), ((9, 42, 204), 'cevONS15540ESPxVOA1ITUCh23'),
+    ((9, 42, 205), 'cevONS15540ESPxVOA1ITUCh24'), ((9, 42, 206), 'cevONS15540ESPxVOA1ITUCh25'),
+    ((9, 42, 207), 'cevONS15540ESPxVOA1ITUCh26'), ((9, 42, 208), 'cevONS15540ESPxVOA1ITUCh27'),
+    ((9, 42, 209), 'cevONS15540ESPxVOA1ITUCh28'), ((9, 42, 210), 'cevONS15540ESPxVOA1ITUCh29'),
+    ((9, 42, 211), 'cevONS15540ESPxVOA1ITUCh30'), ((9, 42, 212), 'cevONS15540ESPxVOA1ITUCh31'),
+    ((9, 42, 213), 'cevONS15540ESPxVOA1ITUCh32'), ((9, 42, 214), 'cevONS15540ESPxVOA1ITUCh33'),
+    ((9, 42, 215), 'cevONS15540ESPxVOA2ITUCh0102'), ((9, 42, 216), 'cevONS15540ESPxVOA2ITUCh0304'),
+    ((9, 42, 217), 'cevONS15540ESPxVOA2ITUCh0506'), ((9, 42, 218), 'cevONS15540ESPxVOA2ITUCh0708'),
+    ((9, 42, 219), 'cevONS15540ESPxVOA2ITUCh0910'), ((9, 42, 220), 'cevONS15540ESPxVOA2ITUCh1112'),
+    ((9, 42, 221), 'cevONS15540ESPxVOA2ITUCh1314'), ((9, 42, 222), 'cevONS15540ESPxVOA2ITUCh1516'),
+    ((9, 42, 223), 'cevONS15540ESPxVOA2ITUCh1718'), ((9, 42, 224), 'cevONS15540ESPxVOA2ITUCh1920'),
+    ((9, 42, 225), 'cevONS15540ESPxVOA2ITUCh2122'), ((9, 42, 226), 'cevONS15540ESPxVOA2ITUCh2324'),
+    ((9, 42, 227), 'cevONS15540ESPxVOA2ITUCh2526'), ((9, 42, 228), 'cevONS15540ESPxVOA2ITUCh2728'),
+    ((9, 42, 229), 'cevONS15540ESPxVOA2ITUCh2930'), ((9, 42, 230), 'cevONS15540ESPxVOA2ITUCh3132'),
+    ((9, 42, 231), 'cevONS15540ESPxVOA4'), ((9, 43), 'cevModuleGsrPortAdapterType'), ((9, 43, 1), 'cevGsrPaUnknown'),
+    ((9, 43, 2), 'cevGsrPa1Ge'), ((9, 43, 3), 'cevGsrPa3Ge'), ((9, 43, 4), 'cevGsrPa24Fe'),
+    ((9, 44), 'cevModuleONS15530Type'), ((9, 44, 1), 'cevONS15530LCMBOsc'), ((9, 44, 2), 'cevONS15530Osc'),
+    ((9, 44, 3), 'cevONS15530MDX4ChA'), ((9, 44, 4), 'cevONS15530MDX4ChB'), ((9, 44, 5), 'cevONS15530MDX4ChC'),
+    ((9, 44, 6), 'cevONS15530MDX4ChD'), ((9, 44, 7), 'cevONS15530MDX4ChE'), ((9, 44, 8), 'cevONS15530MDX4ChF'),
+    ((9, 44, 9), 'cevONS15530MDX4ChG'), ((9, 44, 10), 'cevONS15530MDX4ChH'), ((9, 44, 11), 'cevONS15530MDX4ChAOsc'),
+    ((9, 44, 12), 'cevONS15530MDX4ChBOsc'), ((9, 44, 13), 'cevONS15530MDX4ChCOsc'),
+    ((9, 44, 14), 'cevONS15530MDX4ChDOsc'), ((9, 44, 15), 'cevONS15530MDX4ChEOsc'),
+    ((9, 44, 16), 'cevONS15530MDX4ChFOsc'), ((9, 44, 17), 'cevONS15530MDX4ChGOsc'),
+    ((9, 44, 18), 'cevONS15530MDX4ChHOsc'), ((9, 44, 19), 'cevONS15530Tsp1Ch0102MmScSp'),
+    ((9, 44, 20), 'cevONS15530Tsp1Ch0304MmScSp'), ((9, 44, 21), 'cevONS15530Tsp1Ch0506MmScSp'),
+    ((9, 44, 22), 'cevONS15530Tsp1Ch0708MmScSp'), ((9, 44, 23), 'cevONS15530Tsp1Ch0910MmScSp'),
+    ((9, 44, 24), 'cevONS15530Tsp1Ch1112MmScSp'), ((9, 44, 25), 'cevONS15530Tsp1Ch1314MmScSp'),
+    ((9, 44, 26), 'cevONS15530Tsp1Ch1516MmScSp'), ((9, 44, 27), 'cevONS15530Tsp1Ch1718MmScSp'),
+    ((9, 44, 28), 'cevONS15530Tsp1Ch1920MmScSp'), ((9, 44, 29), 'cevONS15530Tsp1Ch2122MmScSp'),
+    ((9, 44, 30), 'cevONS15530Tsp1Ch2324MmScSp'), ((9, 44, 31), 'cevONS15530Tsp1Ch2526MmScSp'),
+    ((9, 44, 32), 'cevONS15530Tsp1Ch2728MmScSp'), ((9, 44, 33), 'cevONS15530Tsp1Ch2930MmScSp'),
+    ((9, 44, 34), 'cevONS15530Tsp1Ch3132MmScSp'), ((9, 44, 35), 'cevONS15530Tsp1Ch0102SmScSp'),
+    ((9, 44, 36), 'cevONS15530Tsp1Ch0304SmScSp'), ((9, 44, 37), 'cevONS15530Tsp1Ch0506SmScSp'),
+    ((9, 44, 38), 'cevONS15530Tsp1Ch0708SmScSp'), ((9, 44, 39), 'cevONS15530Tsp1Ch0910SmScSp'),
+    ((9, 44, 40), 'cevONS15530Tsp1Ch1112SmScSp'), ((9, 44, 41), 'cevONS15530Tsp1Ch1314SmScSp'),
+    ((9, 44, 42), 'cevONS15530Tsp1Ch1516SmScSp'), ((9, 44, 43), 'cevONS15530Tsp1Ch1718SmScSp'),
+    ((9, 44, 44), 'cevONS15530Tsp1Ch1920SmScSp'), ((9, 44, 45), 'cevONS15530Tsp1Ch2122SmScSp'),
+    ((9, 44, 46), 'cevONS15530Tsp1Ch2324SmScSp'), ((9, 44, 47), 'cevONS15530Tsp1Ch2526SmScSp'),
+    ((9, 44, 48), 'cevONS15530Tsp1Ch2728SmScSp'), ((9, 44, 49), 'cevONS15530Tsp1Ch2930SmScSp'),
+    ((9, 44, 50), 'cevONS15530Tsp1Ch3132SmScSp'), ((9, 44, 51), 'cevONS15530Tsp1Ch0102MmSc'),
+    ((9, 44, 52), 'cevONS15530Tsp1Ch0304MmSc'), ((9, 44, 53), 'cevONS15530Tsp1Ch0506MmSc'),
+    ((9, 44, 54), 'cevONS15530Tsp1Ch0708MmSc'), ((9, 44, 55), 'cevONS15530Tsp1Ch0910MmSc'),
+    ((9, 44, 56), 'cevONS15530Tsp1Ch1112MmSc'), ((9, 44, 57), 'cevONS15530Tsp1Ch1314MmSc'),
+    ((9, 44, 58), 'cevONS15530Tsp1Ch1516MmSc'), ((9, 44, 59), 'cevONS15530Tsp1Ch1718MmSc'),
+    ((9, 44, 60), 'cevONS15530Tsp1Ch1920MmSc'), ((9, 44, 61), 'cevONS15530Tsp1Ch2122MmSc'),
+    ((9, 44, 62), 'cevONS15530Tsp1Ch2324MmSc'), ((9, 44, 63), 'cevONS15530Tsp1Ch2526MmSc'),
+    ((9, 44, 64), 'cevONS15530Tsp1Ch2728MmSc'), ((9, 44, 65), 'cevONS15530Tsp1Ch2930MmSc'),
+    ((9, 44, 66), 'cevONS15530Tsp1Ch3132MmSc'), ((9, 44, 67), 'cevONS15530Tsp1Ch0102SmSc'),
+    ((9, 44, 68), 'cevONS15530Tsp1Ch0304SmSc'), ((9, 44, 69), 'cevONS15530Tsp1Ch0506SmSc'),
+    ((9, 44, 70), 'cevONS15530Tsp1Ch0708SmSc'), ((9, 44, 71), 'cevONS15530Tsp1Ch0910SmSc'),
+    ((9, 44, 72), 'cevONS15530Tsp1Ch1112SmSc'), ((9, 44, 73), 'cevONS15530Tsp1Ch1314SmSc'),
+    ((9, 44, 74), 'cevONS15530Tsp1Ch1516SmSc'), ((9, 44, 75), 'cevONS15530Tsp1Ch1718SmSc'),
+    ((9, 44, 76), 'cevONS15530Tsp1Ch1920SmSc'), ((9, 44, 77), 'cevONS15530Tsp1Ch2122SmSc'),
+    ((9, 44, 78), 'cevONS15530Tsp1Ch2324SmSc'), ((9, 44, 79), 'cevONS15530Tsp1Ch2526SmSc'),
+    ((9, 44, 80), 'cevONS15530Tsp1Ch2728SmSc'), ((9, 44, 81), 'cevONS15530Tsp1Ch2930SmSc'),
+    ((9, 44, 82), 'cevONS15530Tsp1Ch3132SmSc'), ((9, 44, 83), 'cevONS15530LCEscon10'),
+    ((9, 44, 84), 'cevONS15500XvrEscon1310MmMTRJ'), ((9, 44, 85), 'cevONS15530LC10GESmSc'),
+    ((9, 44, 86), 'cevONS1553010GCh01Sp'), ((9, 44, 87), 'cevONS1553010GCh02Sp'),
+    ((9, 44, 88), 'cevONS1553010GCh03Sp'), ((9, 44, 89), 'cevONS1553010GCh04Sp'),
+    ((9, 44, 90), 'cevONS1553010GCh05Sp'), ((9, 44, 91), 'cevONS1553010GCh06Sp'),
+    ((9, 44, 92), 'cevONS1553010GCh07Sp'), ((9, 44, 93), 'cevONS1553010GCh08Sp'),
+    ((9, 44, 94), 'cevONS1553010GCh09Sp'), ((9, 44, 95), 'cevONS1553010GCh10Sp'),
+    ((9, 44, 96), 'cevONS1553010GCh11Sp'), ((9, 44, 97), 'cevONS1553010GCh12Sp'),
+    ((9, 44, 98), 'cevONS1553010GCh13Sp'), ((9, 44, 99), 'cevONS1553010GCh14Sp'),
+    ((9, 44, 100), 'cevONS1553010GCh15Sp'), ((9, 44, 101), 'cevONS1553010GCh16Sp'),
+    ((9, 44, 102), 'cevONS1553010GCh17Sp'), ((9, 44, 103), 'cevONS1553010GCh18Sp'),
+    ((9, 44, 104), 'cevONS1553010GCh19Sp'), ((9, 44, 105), 'cevONS1553010GCh20Sp'),
+    ((9, 44, 106), 'cevONS1553010GCh21Sp'), ((9, 44, 107), 'cevONS1553010GCh22Sp'),
+    ((9, 44, 108), 'cevONS1553010GCh23Sp'), ((9, 44, 109), 'cevONS1553010GCh24Sp'),
+    ((9, 44, 110), 'cevONS1553010GCh25Sp'), ((9, 44, 111), 'cevONS1553010GCh26Sp'),
+    ((9, 44, 112), 'cevONS1553010GCh27Sp'), ((9, 44, 113), 'cevONS1553010GCh28Sp'),
+    ((9, 44, 114), 'cevONS1553010GCh29Sp'), ((9, 44, 115), 'cevONS1553010GCh30Sp'),
+    ((9, 44, 116), 'cevONS1553010GCh31Sp'), ((9, 44, 117), 'cevONS1553010GCh32Sp'),
+    ((9, 44, 118), 'cevONS1553010GCh01'), ((9, 44, 119), 'cevONS1553010GCh02'), ((9, 44, 120), 'cevONS1553010GCh03'),
+    ((9, 44, 121), 'cevONS1553010GCh04'), ((9, 44, 122), 'cevONS1553010GCh05'), ((9, 44, 123), 'cevONS1553010GCh06'),
+    ((9, 44, 124), 'cevONS1553010GCh07'), ((9, 44, 125), 'cevONS1553010GCh08'), ((9, 44, 126), 'cevONS1553010GCh09'),
+    ((9, 44, 127), 'cevONS1553010GCh10'), ((9, 44, 128), 'cevONS1553010GCh11'), ((9, 44, 129), 'cevONS1553010GCh12'),
+    ((9, 44, 130), 'cevONS1553010GCh13'), ((9, 44, 131), 'cevONS1553010GCh14'), ((9, 44, 132), 'cevONS1553010GCh15'),
+    ((9, 44, 133), 'cevONS1553010GCh16'), ((9, 44, 134), 'cevONS1553010GCh17'), ((9, 44, 135), 'cevONS1553010GCh18'),
+    ((9, 44, 136), 'cevONS1553010GCh19'), ((9, 44, 137), 'cevONS1553010GCh20'), ((9, 44, 138), 'cevONS1553010GCh21'),
+    ((9, 44, 139), 'cevONS1553010GCh22'), ((9, 44, 140), 'cevONS1553010GCh23'), ((9, 44, 141), 'cevONS1553010GCh24'),
+    ((9, 44, 142), 'cevONS1553010GCh25'), ((9, 44, 143), 'cevONS1553010GCh26'), ((9, 44, 144), 'cevONS1553010GCh27'),
+    ((9, 44, 145), 'cevONS1553010GCh28'), ((9, 44, 146), 'cevONS1553010GCh29'), ((9, 44, 147), 'cevONS1553010GCh30'),
+    ((9, 44, 148), 'cevONS1553010GCh31'), ((9, 44, 149), 'cevONS1553010GCh32'), ((9, 44, 150), 'cevONS15530FCGE8P'),
+    ((9, 44, 151), 'cevONS155302p5GCh0102Sp'), ((9, 44, 152), 'cevONS155302p5GCh0304Sp'),
+    ((9, 44, 153), 'cevONS155302p5GCh0506Sp'), ((9, 44, 154), 'cevONS155302p5GCh0708Sp'),
+    ((9, 44, 155), 'cevONS155302p5GCh0910Sp'), ((9, 44, 156), 'cevONS155302p5GCh1112Sp'),
+    ((9, 44, 157), 'cevONS155302p5GCh1314Sp'), ((9, 44, 158), 'cevONS155302p5GCh1516Sp'),
+    ((9, 44, 159), 'cevONS155302p5GCh1718Sp'), ((9, 44, 160), 'cevONS155302p5GCh1920Sp'),
+    ((9, 44, 161), 'cevONS155302p5GCh2122Sp'), ((9, 44, 162), 'cevONS155302p5GCh2324Sp'),
+    ((9, 44, 163), 'cevONS155302p5GCh2526Sp'), ((9, 44, 164), 'cevONS155302p5GCh2728Sp'),
+    ((9, 44, 165), 'cevONS155302p5GCh2930Sp'), ((9, 44, 166), 'cevONS155302p5GCh3132Sp'),
+    ((9, 44, 167), 'cevONS155302p5GCh0102'), ((9, 44, 168), 'cevONS155302p5GCh0304'),
+    ((9, 44, 169), 'cevONS155302p5GCh0506'), ((9, 44, 170), 'cevONS155302p5GCh0708'),
+    ((9, 44, 171), 'cevONS155302p5GCh0910'), ((9, 44, 172), 'cevONS155302p5GCh1112'),
+    ((9, 44, 173), 'cevONS155302p5GCh1314'), ((9, 44, 174), 'cevONS155302p5GCh1516'),
+    ((9, 44, 175), 'cevONS155302p5GCh1718'), ((9, 44, 176), 'cevONS155302p5GCh1920'),
+    ((9, 44, 177), 'cevONS155302p5GCh2122'), ((9, 44, 178), 'cevONS155302p5GCh2324'),
+    ((9, 44, 179), 'cevONS155302p5GCh2526'), ((9, 44, 180), 'cevONS155302p5GCh2728'),
+    ((9, 44, 181), 'cevONS155302p5GCh2930'), ((9, 44, 182), 'cevONS155302p5GCh3132'), ((9, 44, 183), 'cevONS15530PSM'),
+    ((9, 44, 184), 'cevONS15530LC2xFC4P'), ((9, 44, 185), 'cevONS15530MRC8PCh0102Sp'),
+    ((9, 44, 186), 'cevONS15530MRC8PCh0304Sp'), ((9, 44, 187), 'cevONS15530MRC8PCh0506Sp'),
+    ((9, 44, 188), 'cevONS15530MRC8PCh0708Sp'), ((9, 44, 189), 'cevONS15530MRC8PCh0910Sp'),
+    ((9, 44, 190), 'cevONS15530MRC8PCh1112Sp'), ((9, 44, 191), 'cevONS15530MRC8PCh1314Sp'),
+    ((9, 44, 192), 'cevONS15530MRC8PCh1516Sp'), ((9, 44, 193), 'cevONS15530MRC8PCh1718Sp'),
+    ((9, 44, 194), 'cevONS15530MRC8PCh1920Sp'), ((9, 44, 195), 'cevONS15530MRC8PCh2122Sp'),
+    ((9, 44, 196), 'cevONS15530MRC8PCh2324Sp'), ((9, 44, 197), 'cevONS15530MRC8PCh2526Sp'),
+    ((9, 44, 198), 'cevONS15530MRC8PCh2728Sp'), ((9, 44, 199), 'cevONS15530MRC8PCh2930Sp'),
+    ((9, 44, 200), 'cevONS15530MRC8PCh3132Sp'), ((9, 44, 201), 'cevONS15530MRC8PCh0102'),
+    ((9, 44, 202), 'cevONS15530MRC8PCh0304'), ((9, 44, 203), 'cevONS15530MRC8PCh0506'),
+    ((9, 44, 204), 'cevONS15530MRC8PCh0708'), ((9, 44, 205), 'cevONS15530MRC8PCh0910'),
+    ((9, 44, 206), 'cevONS15530MRC8PCh1112'), ((9, 44, 207), 'cevONS15530MRC8PCh1314'),
+    ((9, 44, 208), 'cevONS15530MRC8PCh1516'), ((9, 44, 209), 'cevONS15530MRC8PCh1718'),
+    ((9, 44, 210), 'cevONS15530MRC8PCh1920'), ((9, 44, 211), 'cevONS15530MRC8PCh2122'),
+    ((9, 44, 212), 'cevONS15530MRC8PCh2324'), ((9, 44, 213), 'cevONS15530MRC8PCh2526'),
+    ((9, 44, 214), 'cevONS15530MRC8PCh2728'), ((9, 44, 215), 'cevONS15530MRC8PCh2930'),
+    ((9, 44, 216), 'cevONS15530MRC8PCh3132'), ((9, 44, 217), 'cevONS1553010G4ChASp'),
+    ((9, 44, 218), 'cevONS1553010G4ChBSp'), ((9, 44, 219), 'cevONS1553010G4ChCSp'),
+    ((9, 44, 220), 'cevONS1553010G4ChDSp'), ((9, 44, 221), 'cevONS1553010G4ChESp'),
+    ((9, 44, 222), 'cevONS1553010G4ChFSp'), ((9, 44, 223), 'cevONS1553010G4ChGSp'),
+    ((9, 44, 224), 'cevONS1553010G4ChHSp'), ((9, 44, 225), 'cevONS1553010G4ChA'), ((9, 44, 226), 'cevONS1553010G4ChB'),
+    ((9, 44, 227), 'cevONS1553010G4ChC'), ((9, 44, 228), 'cevONS1553010G4ChD'), ((9, 44, 229), 'cevONS1553010G4ChE'),
+    ((9, 44, 230), 'cevONS1553010G4ChF'), ((9, 44, 231), 'cevONS1553010G4ChG'), ((9, 44, 232), 'cevONS1553010G4ChH'),
+    ((9, 44, 233), 'cevONS1553010G32ChSp'), ((9, 44, 234), 'cevONS1553010G32Ch'), ((9, 46), 'cevModuleONS15500Type'),
+    ((9, 46, 1), 'cevONS15500PEQ01A'), ((9, 46, 2), 'cevONS15500PEQ01B'), ((9, 46, 3), 'cevONS15500PEQ01C'),
+    ((9, 46, 4), 'cevONS15500PEQ01D'), ((9, 46, 5), 'cevONS15500PEQ01E'), ((9, 46, 6), 'cevONS15500PEQ01F'),
+    ((9, 46, 7), 'cevONS15500PEQ01G'), ((9, 46, 8), 'cevONS15500PEQ01H'), ((9, 46, 9), 'cevONS15500PEQ02AB'),
+    ((9, 46, 10), 'cevONS15500PEQ02CD'), ((9, 46, 11), 'cevONS15500PEQ02EF'), ((9, 46, 12), 'cevONS15500PEQ02GH'),
+    ((9, 46, 13), 'cevONS15500VOA01'), ((9, 46, 14), 'cevONS15500VOA02'), ((9, 46, 15), 'cevONS15500XvrEscon1310MTRJ'),
+    ((9, 46, 16), 'cevONS15500XvrEscon1310LC'), ((9, 46, 17), 'cevONS15500XvrFC850LC'),
+    ((9, 46, 18), 'cevONS15500XvrFC850MTRJ'), ((9, 46, 19), 'cevONS15500XvrFC1310LC'),
+    ((9, 46, 20), 'cevONS15500XvrFC1310MTRJ'), ((9, 46, 21), 'cevONS15500XvrGE850LC'),
+    ((9, 46, 22), 'cevONS15500XvrGE850MTRJ'), ((9, 46, 23), 'cevONS15500XvrGE1310LC'),
+    ((9, 46, 24), 'cevONS15500XvrGE1310MTRJ'), ((9, 46, 25), 'cevONS15500XvrGEFC850LC'),
+    ((9, 46, 26), 'cevONS15500XvrGEFC850MTRJ'), ((9, 46, 27), 'cevONS15500XvrGEFC1310LC'),
+    ((9, 46, 28), 'cevONS15500XvrGEFC1310MTRJ'), ((9, 46, 29), 'cevONS15500XvrOC3Son1310MTRJ'),
+    ((9, 46, 30), 'cevONS15500XvrOC3Son1310LC'), ((9, 46, 31), 'cevONS15500XvrOC12Son1310MTRJ'),
+    ((9, 46, 32), 'cevONS15500XvrOC12Son1310LC'), ((9, 46, 33), 'cevONS15500XvrOC48Son1310MTRJ'),
+    ((9, 46, 34), 'cevONS15500XvrOC48Son1310LC'), ((9, 46, 35), 'cevONS15500XvrLowMM1310LC'),
+    ((9, 46, 36), 'cevONS15500XvrLowSM1310LC'), ((9, 46, 37), 'cevONS15500XvrMidMM1310LC'),
+    ((9, 46, 38), 'cevONS15500XvrMidSM1310LC'), ((9, 46, 39), 'cevONS15500XvrHighSM1310LC'),
+    ((9, 46, 40), 'cevONS15500XvrT1'), ((9, 46, 41), 'cevONS15500XvrE1'), ((9, 46, 42), 'cevONS15500XvrDV'),
+    ((9, 47), 'cevModuleC4224Type'), ((9, 47, 1), 'cevC42241FeTx'), ((9, 47, 2), 'cevC422424FeTx'),
+    ((9, 48), 'cevModuleONS15454Type'), ((9, 48, 3), 'cevONS15454FeCE100'), ((9, 48, 4), 'cevONS15454Ge10ML2'),
+    ((9, 48, 5), 'cevONS15454Ge10CE2'), ((9, 48, 9), 'cevONS15454cptPtf25610GX4'), ((9, 50), 'cevModuleCat37xxType'),
+    ((9, 50, 1), 'cevModuleCat375024'), ((9, 50, 2), 'cevModuleCat375048'), ((9, 50, 3), 'cevModuleCat375024TS'),
+    ((9, 50, 4), 'cevModuleCat375024T'), ((9, 50, 6), 'cevModuleCat3750Ge12Sfp'), ((9, 50, 7), 'cevModuleCat375048PS'),
+    ((9, 50, 8), 'cevModuleCat375024PS'), ((9, 50, 9), 'cevModuleCat375024ME'), ((9, 50, 10), 'cevModuleCat3750G16TD'),
+    ((9, 50, 11), 'cevModuleCat3750G24PS'), ((9, 50, 12), 'cevModuleCat3750G48PS'),
+    ((9, 50, 13), 'cevModuleCat3750G48TS'), ((9, 50, 14), 'cevModuleCat3750G24TS1U'),
+    ((9, 50, 16), 'cevModuleCat375024FS'), ((9, 50, 17), 'cevModuleCat3750Ge12SfpDc'),
+    ((9, 50, 18), 'cevModuleCat3750G24WS'), ((9, 50, 19), 'cevModuleCat3750E24TD'),
+    ((9, 50, 20), 'cevModuleCat3750E48TD'), ((9, 50, 21), 'cevModuleCat3750E48PD'),
+    ((9, 50, 22), 'cevModuleCat3750E24PD'), ((9, 50, 23), 'cevModuleCat3750v248ps'),
+    ((9, 50, 24), 'cevModuleCat3750v248ts'), ((9, 50, 25), 'cevModuleCat3750v224ps'),
+    ((9, 50, 26), 'cevModuleCat3750v224ts'), ((9, 50, 27), 'cevModuleCat3750x24'),
+    ((9, 50, 28), 'cevModuleCat3750x48'), ((9, 50, 29), 'cevModuleCat3750x24P'), ((9, 50, 30), 'cevModuleCat3750x48P'),
+    ((9, 50, 33), 'cevModuleCat3750x48U'), ((9, 50, 34), 'cevModuleCat3750x24U'), ((9, 51), 'cevModuleSFPType'),
+    ((9, 51, 1), 'cevSFPOc3mm'), ((9, 51, 2), 'cevSFPOc12mm'), ((9, 51, 3), 'cevSFPOc48'),
+    ((9, 51, 4), 'cevSFPOc3Oc12'), ((9, 51, 5), 'cevSFPOc3Oc12Oc48'), ((9, 51, 6), 'cevSFP1000BaseSx'),
+    ((9, 51, 7), 'cevSFP1000BaseLx'), ((9, 51, 8), 'cevSFP1000BaseT'), ((9, 51, 9), 'cevSFP1000BaseZx'),
+    ((9, 51, 10), 'cevSFPCwdm1470'), ((9, 51, 11), 'cevSFPCwdm1490'), ((9, 51, 12), 'cevSFPCwdm1510'),
+    ((9, 51, 13), 'cevSFPCwdm1530'), ((9, 51, 14), 'cevSFPCwdm1550'), ((9, 51, 15), 'cevSFPCwdm1570'),
+    ((9, 51, 16), 'cevSFPCwdm1590'), ((9, 51, 17), 'cevSFPCwdm1610'), ((9, 51, 18), 'cevSFP1000BaseLh'),
+    ((9, 51, 19), 'cevSFP1000BaseCx'), ((9, 51, 20), 'cevSFPOc3smir'), ((9, 51, 21), 'cevSFPOc3smlr'),
+    ((9, 51, 22), 'cevSFPOc12smir'), ((9, 51, 23), 'cevSFPOc12smlr'), ((9, 51, 24), 'cevSFPOc48smsr'),
+    ((9, 51, 25), 'cevSFPOc48smir'), ((9, 51, 26), 'cevSFPOc48smlr'), ((9, 51, 27), 'cevXFPOc192smsr1'),
+    ((9, 51, 28), 'cevXFPOc192smir2'), ((9, 51, 29), 'cevXFPOc192smlr2'), ((9, 51, 30), 'cevSFPCable50cm'),
+    ((9, 51, 33), 'cevSFPOc48smlr2'), ((9, 51, 34), 'cevSFPOc3smsr'), ((9, 51, 35), 'cevSFPOc12smsr'),
+    ((9, 51, 36), 'cevSFPOc48mm'), ((9, 51, 37), 'cevSFPDwdm3033'), ((9, 51, 38), 'cevSFPDwdm3112'),
+    ((9, 51, 39), 'cevSFPDwdm3190'), ((9, 51, 40), 'cevSFPDwdm3268'), ((9, 51, 41), 'cevSFPDwdm3425'),
+    ((9, 51, 42), 'cevSFPDwdm3504'), ((9, 51, 43), 'cevSFPDwdm3582'), ((9, 51, 44), 'cevSFPDwdm3661'),
+    ((9, 51, 45), 'cevSFPDwdm3819'), ((9, 51, 46), 'cevSFPDwdm3898'), ((9, 51, 47), 'cevSFPDwdm3977'),
+    ((9, 51, 48), 'cevSFPDwdm4056'), ((9, 51, 49), 'cevSFPDwdm4214'), ((9, 51, 50), 'cevSFPDwdm4294'),
+    ((9, 51, 51), 'cevSFPDwdm4373'), ((9, 51, 52), 'cevSFPDwdm4453'), ((9, 51, 53), 'cevSFPDwdm4612'),
+    ((9, 51, 54), 'cevSFPDwdm4692'), ((9, 51, 55), 'cevSFPDwdm4772'), ((9, 51, 56), 'cevSFPDwdm4851'),
+    ((9, 51, 57), 'cevSFPDwdm5012'), ((9, 51, 58), 'cevSFPDwdm5092'), ((9, 51, 59), 'cevSFPDwdm5172'),
+    ((9, 51, 60), 'cevSFPDwdm5252'), ((9, 51, 61), 'cevSFPDwdm5413'), ((9, 51, 62), 'cevSFPDwdm5494'),
+    ((9, 51, 63), 'cevSFPDwdm5575'), ((9, 51, 64), 'cevSFPDwdm5655'), ((9, 51, 65), 'cevSFPDwdm5817'),
+    ((9, 51, 66), 'cevSFPDwdm5898'), ((9, 51, 67), 'cevSFPDwdm5979'), ((9, 51, 68), 'cevSFPDwdm6061'),
+    ((9, 51, 69), 'cevSFP1000BaseBX10D'), ((9, 51, 70), 'cevSFP1000BaseBX10U'), ((9, 51, 71), 'cevSFP100BaseFX'),
+    ((9, 51, 72), 'cevSFP100BaseLX'), ((9, 51, 73), 'cevSFP100BaseSX'), ((9, 51, 74), 'cevSFP100BaseZX'),
+    ((9, 51, 75), 'cevSFP100BaseEX'), ((9, 51, 76), 'cevSFP100BaseBX10D'), ((9, 51, 77), 'cevSFP100BaseBX10U'),
+    ((9, 51, 78), 'cevSFPDwdmXFP6061'), ((9, 51, 79), 'cevSFPDwdmXFP5979'), ((9, 51, 80), 'cevSFPDwdmXFP5898'),
+    ((9, 51, 81), 'cevSFPDwdmXFP5817'), ((9, 51, 82), 'cevSFPDwdmXFP5655'), ((9, 51, 83), 'cevSFPDwdmXFP5575'),
+    ((9, 51, 84), 'cevSFPDwdmXFP5494'), ((9, 51, 85), 'cevSFPDwdmXFP5413'), ((9, 51, 86), 'cevSFPDwdmXFP5252'),
+    ((9, 51, 87), 'cevSFPDwdmXFP5172'), ((9, 51, 88), 'cevSFPDwdmXFP5092'), ((9, 51, 89), 'cevSFPDwdmXFP5012'),
+    ((9, 51, 90), 'cevSFPDwdmXFP4851'), ((9, 51, 91), 'cevSFPDwdmXFP4772'), ((9, 51, 92), 'cevSFPDwdmXFP4692'),
+    ((9, 51, 93), 'cevSFPDwdmXFP4612'), ((9, 51, 94), 'cevSFPDwdmXFP4453'), ((9, 51, 95), 'cevSFPDwdmXFP4373'),
+    ((9, 51, 96), 'cevSFPDwdmXFP4294'), ((9, 51, 97), 'cevSFPDwdmXFP4214'), ((9, 51, 98), 'cevSFPDwdmXFP4056'),
+    ((9, 51, 99), 'cevSFPDwdmXFP3977'), ((9, 51, 100), 'cevSFPDwdmXFP3898'), ((9, 51, 101), 'cevSFPDwdmXFP3819'),
+    ((9, 51, 102), 'cevSFPDwdmXFP3661'), ((9, 51, 103), 'cevSFPDwdmXFP3582'), ((9, 51, 104), 'cevSFPDwdmXFP3504'),
+    ((9, 51, 105), 'cevSFPDwdmXFP3425'), ((9, 51, 106), 'cevSFPDwdmXFP3268'), ((9, 51, 107), 'cevSFPDwdmXFP3190'),
+    ((9, 51, 108), 'cevSFPDwdmXFP3112'), ((9, 51, 109), 'cevSFPDwdmXFP3033'), ((9, 51, 110), 'cevSFPDwdm6141'),
+    ((9, 51, 111), 'cevSFPDwdm5736'), ((9, 51, 112), 'cevSFPDwdm5332'), ((9, 51, 113), 'cevSFPDwdm4931'),
+    ((9, 51, 114), 'cevSFPDwdm4532'), ((9, 51, 115), 'cevSFPDwdm4134'), ((9, 51, 116), 'cevSFPDwdm3739'),
+    ((9, 51, 117), 'cevSFPDwdm3346'), ((9, 51, 118), 'cevSFPUnknown'), ((9, 51, 119), 'cevXFPUnknown'),
+    ((9, 51, 120), 'cevSFPStm1E'), ((9, 51, 121), 'cevXFPmmsr'), ((9, 51, 122), 'cevXFR10gMMSR'),
+    ((9, 51, 123), 'cevSFPTDwdmXfp'), ((9, 51, 124), 'cevXFP10GLR192SRL'), ((9, 51, 125), 'cevXFP10GER192IRL'),
+    ((9, 51, 126), 'cevSFPCiscoSfpT3Ge'), ((9, 51, 127), 'cevSFPT1E1Fe'), ((9, 51, 128), 'cevSFPT3E3Fe'),
+    ((9, 51, 129), 'cevXFPDWDMXFPC'), ((9, 51, 130), 'cevXFP10GLROC192'), ((9, 51, 131), 'cevXFP10GER192IR'),
+    ((9, 51, 132), 'cevXFP10GZROC192'), ((9, 51, 133), 'cevXFP10GMMSR'), ((9, 51, 134), 'cevSFPGLC2BXD'),
+    ((9, 51, 135), 'cevSFPGLC2BXU'), ((9, 51, 136), 'cevSFPGLCFE1002BX'), ((9, 51, 137), 'cevSFPGLCFE1002BXU'),
+    ((9, 51, 138), 'cevSFPGlcSxMmd'), ((9, 51, 139), 'cevSFPGlcTe'), ((9, 51, 140), 'cevSFPGlcZxSmd'),
+    ((9, 51, 141), 'cevSFPGlcExSmd'), ((9, 51, 142), 'cevSFPGlcLhSmd'), ((9, 51, 143), 'cevSFP100BaseF'),
+    ((9, 51, 144), 'cevSFPDSSFPFC16GSW'), ((9, 51, 145), 'cevSFDSSFPFC16GLW'), ((9, 51, 146), 'cevSFPGLCGE100FX'),
+    ((9, 51, 147), 'cevSFPCwdmXFP1570'), ((9, 51, 148), 'cevSFPCwdmXFP1470'), ((9, 51, 149), 'cevSFPCwdmXFP1490'),
+    ((9, 51, 150), 'cevSFPCwdmXFP1510'), ((9, 51, 151), 'cevSFPCwdmXFP1530'), ((9, 51, 152), 'cevSFPCwdmXFP1550'),
+    ((9, 51, 153), 'cevSFPCwdmXFP1590'), ((9, 51, 154), 'cevSFPCwdmXFP1610'), ((9, 51, 155), 'cevSFP1000BaseBX40D'),
+    ((9, 51, 156), 'cevSFP1000BaseBX40U'), ((9, 51, 157), 'cevSFP1000BaseBX80D'),
+    ((9, 51, 158), 'cevSFP1000BaseBX80U'), ((9, 51, 159), 'cevSFP100BaseGlcExFe'),
+    ((9, 51, 160), 'cevSFP100BaseGlcZxFe'), ((9, 51, 186), 'cevSFPONSSIGESX'), ((9, 51, 187), 'cevSFPONSSIGELX'),
+    ((9, 51, 188), 'cevSFPONSSIGEZX'), ((9, 51, 189), 'cevSFPONSSEZEEL'), ((9, 51, 190), 'cevSFPONSSI2GS1'),
+    ((9, 51, 191), 'cevSFPONSSI2GL1'), ((9, 51, 192), 'cevSFPONSSI2GL2'), ((9, 51, 193), 'cevSFPONSSEZ1'),
+    ((9, 51, 194), 'cevSFP1000BaseBx40DI'), ((9, 51, 195), 'cevSFP1000BaseBx40DAI'),
+    ((9, 51, 196), 'cevSFP1000BaseBx40UI'), ((9, 51, 197), 'cevSFP1000BaseBx80DI'),
+    ((9, 51, 198), 'cevSFP1000BaseBx80UI'), ((9, 51, 199), 'cevSFPGlcT'), ((9, 51, 200), 'cevSSFPOAM1000BaseZX'),
+    ((9, 51, 201), 'cevSSFPOAM1000BaseLX'), ((9, 51, 202), 'cevSFPGLCBX40UI'), ((9, 51, 203), 'cevSFPGLCBX40DI'),
+    ((9, 51, 204), 'cevSFPGLCBX40DAI'), ((9, 51, 205), 'cevSFPGLCBX80UI'), ((9, 51, 206), 'cevSFPGLCBX80DI'),
+    ((9, 51, 249), 'cevSFP100BaseGlcFeBxU'), ((9, 51, 250), 'cevSFP100BaseGlcFeBxD'), ((9, 51, 251), 'cevSFPGLCFETI'),
+    ((9, 51, 252), 'cevSFPGLC2BXDI'), ((9, 51, 254), 'cevSFPASR9KvGlcFe100ex'),
+    ((9, 51, 255), 'cevSFPASR9KvGlcFe100zx'), ((9, 52), 'cevModuleONS15200Type'), ((9, 52, 1), 'cevONS15252Clip'),
+    ((9, 52, 2), 'cevONS15201Clip'), ((9, 52, 3), 'cevONS15252Ncb'), ((9, 53), 'cevModuleMDSType'),
+    ((9, 53, 1), 'cevMDSDsX9530Sf1K9'), ((9, 53, 2), 'cevMDSRedDsX9530Sf1K9'), ((9, 53, 3), 'cevMDSDsX9016'),
+    ((9, 53, 4), 'cevMDSDsX9032'), ((9, 53, 5), 'cevMDSDsX9032Smv'), ((9, 53, 6), 'cevMDSDsX9308Smip'),
+    ((9, 53, 7), 'cevMDSDsX9560Smc'), ((9, 53, 8), 'cevMDSDsSfpFc2Gsw'), ((9, 53, 9), 'cevMDSDsSfpFc2Glw'),
+    ((9, 53, 10), 'cevMDSDsSfpGeSw'), ((9, 53, 11), 'cevMDSDsSfpGeLw'), ((9, 53, 12), 'cevMDSDsC9500Cl'),
+    ((9, 53, 13), 'cevMDSDsX9216K9Sup'), ((9, 53, 14), 'cevMDSMemFld512M'), ((9, 53, 15), 'cevMDSMemMd1G'),
+    ((9, 53, 16), 'cevMDSDsC9509Cl'), ((9, 53, 17), 'cevMDSDsC9506Cl'), ((9, 53, 18), 'cevMDSDsX9140K9Sup'),
+    ((9, 53, 19), 'cevMDSDsX9120K9Sup'), ((9, 53, 20), 'cevMDSDsX9032Sma'), ((9, 53, 21), 'cevMDSDsX9216Mgt'),
+    ((9, 53, 22), 'cevMDSDsX930214K9'), ((9, 53, 23), 'cevMDSDsX9202'), ((9, 53, 24), 'cevMDSDsX9304Smip'),
+    ((9, 53, 25), 'cevMDSDsX9132K9Sup'), ((9, 53, 26), 'cevMDSDsX9116K9Sup'), ((9, 53, 27), 'cevMDSDsX9216IK9Sup'),
+    ((9, 53, 28), 'cevMDSDsX9530Sf2K9'), ((9, 53, 29), 'cevMDSDsX9112'), ((9, 53, 30), 'cevMDSDsX9124'),
+    ((9, 53, 31), 'cevMDSDsX9148'), ((9, 53, 32), 'cevMDSDsX9704'), ((9, 53, 33), 'cevMDSDs13SltFab1'),
+    ((9, 53, 34), 'cevMDSDsC9513Cl'), ((9, 53, 35), 'cevMDSDsX9124S2K9'), ((9, 53, 36), 'cevMDSDsIBMFC'),
+    ((9, 53, 37), 'cevMDSDsHPFC'), ((9, 53, 38), 'cevMDSDsX9222iK9Sup'), ((9, 53, 39), 'cevMDSDxX930418K9'),
+    ((9, 53, 40), 'cevMDSDsX9134S2K9'), ((9, 53, 41), 'cevMdsDSC9222iK9Sup'), ((9, 53, 42), 'cevMDSDsX9248FC48Gbps'),
+    ((9, 53, 43), 'cevMDSDsX9248FC96Gbps'), ((9, 53, 44), 'cevMDSDsX9316SSM'), ((9, 53, 45), 'cevMDSDs13SltFab2'),
+    ((9, 53, 46), 'cevMDSDsX922496k9'), ((9, 53, 52), 'cevMDSDsX9716K9'), ((9, 53, 53), 'cevMDSDsX9248x256K9'),
+    ((9, 53, 54), 'cevMDSDsX9232x256K9'), ((9, 53, 55), 'cevMDSDs13SlotFabricEvia3'),
+    ((9, 53, 56), 'cevMDSDsX9530Sf2AK9'), ((9, 53, 57), 'cevMDSDs9708HPK9'), ((9, 53, 58), 'cevMDSDs9708K9'),
+    ((9, 53, 61), 'cevMDSDSX9448n768K9'), ((9, 53, 62), 'cevMDSDSX9848n480K9SM'), ((9, 53, 63), 'cevMDSDSX97SF1K9SUP'),
+    ((9, 53, 64), 'cevMDSDSX9710FAB1'), ((9, 53, 65), 'cevMDS9710FCS'), ((9, 53, 66), 'cevMDS9250iIFSPS'),
+    ((9, 53, 67), 'cevMDS9250iIFSDC'), ((9, 53, 68), 'cevMDSDSC9250i22PK9SUPFS'), ((9, 53, 69), 'cevMDSDSX9848480K9'),
+    ((9, 53, 70), 'cevMDSDSX9706FAB1'), ((9, 53, 71), 'cevMDSDSC9148SK9SUP'), ((9, 53, 72), 'cevMDSDSC9396SK9SUP'),
+    ((9, 53, 73), 'cevMDSDSX97SF1EK9'), ((9, 53, 74), 'cevMDSDSX9718FAB1'), ((9, 53, 75), 'cevMDSDSX9334K9'),
+    ((9, 53, 76), 'cevMDSDSX9824960K9'), ((9, 54), 'cevModuleC3220Type'), ((9, 54, 1), 'cevC3220Smic'),
+    ((9, 54, 2), 'cevC3220Fesmic'), ((9, 55), 'cevModuleCrs1Type'), ((9, 55, 1), 'cevModuleCrs1RP'),
+    ((9, 55, 2), 'cevModuleCrs1DRP'), ((9, 55, 3), 'cevModuleCrs18sS123Fabric'),
+    ((9, 55, 4), 'cevModuleCrs116sS123Fabric'), ((9, 55, 5), 'cevModuleCrs116dS123TFabric'),
+    ((9, 55, 6), 'cevModuleCrs116mS13Fabric'), ((9, 55, 7), 'cevModuleCrs116mS2CCFabric'),
+    ((9, 55, 8), 'cevModuleCrs116mS2Fabric'), ((9, 55, 9), 'cevModuleCrs1FanCtrllrLC'),
+    ((9, 55, 10), 'cevModuleCrs116mS2FanCtrllrFabric'), ((9, 55, 11), 'cevModuleCrs1Alarm'),
+    ((9, 55, 12), 'cevModuleCrs116mFabricLED'), ((9, 55, 13), 'cevModuleCrs1DRPPlim'),
+    ((9, 55, 14), 'cevModuleCrs116OC48Plim'), ((9, 55, 15), 'cevModuleCrs14OC192VSRPlim'),
+    ((9, 55, 16), 'cevModuleCrs14OC192SRPlim'), ((9, 55, 17), 'cevModulecrs14OC192LRPlim'),
+    ((9, 55, 18), 'cevModuleCrs1OC768VSRPlim'), ((9, 55, 19), 'cevModuleCrs1OC768SRPlim'),
+    ((9, 55, 20), 'cevModuleCrs16x10GePlim'), ((9, 55, 21), 'cevModuleCrs18x10GePlim'),
+    ((9, 55, 22), 'cevModuleCrs18RP'), ((9, 55, 23), 'cevModuleCrs18Fabric'),
+    ((9, 55, 24), 'cevModuleCrs1FabricShelfController'), ((9, 55, 25), 'cevModuleCrs1FabricSwitchFabric'),
+    ((9, 55, 26), 'cevModuleCrs1FabricLEDModule'), ((9, 55, 27), 'cevModuleCrs1FabricOIMSingleSlot'),
+    ((9, 55, 28), 'cevModuleCrs1FabricOIMDualSlot'), ((9, 55, 29), 'cevModuleCrs18dS123Fabric'),
+    ((9, 55, 30), 'cevModuleCrs18mS123Fabric'), ((9, 55, 31), 'cevModuleCrs116dS123Fabric'),
+    ((9, 55, 32), 'cevModuleCrs1FccSc22Ge'), ((9, 55, 33), 'cevModuleCrs1FccSFEc'),
+    ((9, 55, 34), 'cevModuleCrs14x10GeCDwdmPlim'), ((9, 55, 35), 'cevModuleCrs14OC192CDwdmPlim'),
+    ((9, 55, 36), 'cevModuleCrs1OC768CDwdmPlim'), ((9, 55, 37), 'cevModuleCrs1DRPBPlim'),
+    ((9, 55, 38), 'cevModuleCrs1DRPB'), ((9, 55, 39), 'cevModuleCrs1OC768CDwdmDpskC'),
+    ((9, 55, 42), 'cevModuleCrs14FabricCard'), ((9, 55, 43), 'cevModuleCrsASPLIM'),
+    ((9, 55, 44), 'cevModuleCrs4OC192DptLr'), ((9, 55, 45), 'cevModuleCrs4OC192DptSr'),
+    ((9, 55, 46), 'cevModuleCrs4OC192DptVs'), ((9, 55, 47), 'cevModuleCrs14x10GE'),
+    ((9, 55, 48), 'cevModuleCrs142x1GE'), ((9, 55, 49), 'cevModuleCrs120x1GeFl'),
+    ((9, 55, 50), 'cevModuleCrs12x10GeFl'), ((9, 55, 51), 'cevModuleCrs116Alarm'),
+    ((9, 55, 52), 'cevModuleCrs14x10GbeWLXfpPlim'), ((9, 55, 53), 'cevModuleCrs18x10GbeWLXfpPlim'),
+    ((9, 55, 54), 'cevModuleCrs1LcB40G'), ((9, 55, 55), 'cevModuleCrs1Lc40G'),
+    ((9, 55, 56), 'cevModuleCrs114X10GBEWLXFPPlim'), ((9, 55, 57), 'cevModuleCrs120X10GBEWLXFPPlim'),
+    ((9, 55, 58), 'cevModuleCrs11X100GBEPlim'), ((9, 55, 59), 'cevModuleCrs8Prp12g'),
+    ((9, 55, 60), 'cevModuleCrs8Prp6g'), ((9, 55, 61), 'cevModuleCrs16Prp12g'), ((9, 55, 62), 'cevModuleCrs16Prp6g'),
+    ((9, 55, 63), 'cevModuleCrs16FanCtB'), ((9, 55, 64), 'cevModuleCrs16AlarmMB'),
+    ((9, 55, 65), 'cevModuleCrs16LccFCtB'), ((9, 55, 66), 'cevModuleCrs114X10GBEDwdmXfpPlim'),
+    ((9, 55, 67), 'cevModuleCrs120X10GBEDwdmXfpPlim'), ((9, 55, 68), 'cevModuleCrs14X40GBEOtu3Plim'),
+    ((9, 55, 69), 'cevModuleCrs11X100GBEDwdmPlim'), ((9, 55, 72), 'cevModuleCrsCgsePlusPlim'),
+    ((9, 55, 73), 'cevModuleCrs140X10GEWLOPlim'), ((9, 55, 74), 'cevModuleCrs14x100GELOPlim'),
+    ((9, 55, 75), 'cevModuleCrs12X100GELOFlex40Plim'), ((9, 55, 76), 'cevModuleCrs400GEDWDMFLEX'),
+    ((9, 56), 'cevModuleCat35xxType'), ((9, 56, 1), 'cevModuleCat356024PS'), ((9, 56, 2), 'cevModuleCat356048PS'),
+    ((9, 56, 3), 'cevModuleCat3560G24PS'), ((9, 56, 4), 'cevModuleCat3560G24TS'),
+    ((9, 56, 5), 'cevModuleCat3560G48PS'), ((9, 56, 6), 'cevModuleCat3560G48TS'), ((9, 56, 7), 'cevModuleCat356024TS'),
+    ((9, 56, 8), 'cevModuleCat356048TS'), ((9, 56, 9), 'cevModuleCat3560E24TD'),
+    ((9, 56, 10), 'cevModuleCat3560E48TD'), ((9, 56, 11), 'cevModuleCat3560E24PD'),
+    ((9, 56, 12), 'cevModuleCat3560E48PD'), ((9, 56, 13), 'cevModuleCat35608PC'),
+    ((9, 56, 14), 'cevModuleCat3560e12d'), ((9, 56, 15), 'cevModuleCat3560E12SD'),
+    ((9, 56, 16), 'cevModuleCat356012PCS'), ((9, 56, 17), 'cevModuleCat3560v248ps'),
+    ((9, 56, 18), 'cevModuleCat3560v248ts'), ((9, 56, 19), 'cevModuleCat3560v224ps'),
+    ((9, 56, 20), 'cevModuleCat3560v224ts'), ((9, 56, 21), 'cevModuleCat3560v224tsD'),
+    ((9, 56, 22), 'cevModuleCat3560x24'), ((9, 56, 23), 'cevModuleCat3560x48'),
+    ((9, 56, 28), 'cevModuleWsC3560CPD8ptS'), ((9, 56, 29), 'cevModuleWsC3560C12pcS'),
+    ((9, 56, 30), 'cevModuleWsC3560C8pcS'), ((9, 56, 31), 'cevModuleCat3560x48U'),
+    ((9, 56, 32), 'cevModuleCat3557x24U'), ((9, 56, 45), 'cevModuleWsC3560CX12PDS'),
+    ((9, 56, 46), 'cevModuleWsC3560CX12TCS'), ((9, 56, 47), 'cevModuleWsC3560CX12PCS'),
+    ((9, 56, 48), 'cevModuleWsC3560CX8TCS'), ((9, 56, 49), 'cevModuleWsC3560CX8PCS'),
+    ((9, 57), 'cevModuleASA5523Type'), ((9, 57, 1), 'cevMASA5523IsmSsmIds20K9'), ((9, 57, 2), 'cevMASA5523PmSsmIO4ge'),
+    ((9, 57, 3), 'cevMASA5523IsmSsmIds10K9'), ((9, 57, 4), 'cevPmSsmIO4geInc'), ((9, 57, 5), 'cevMASA5523IsmSsmCsc10'),
+    ((9, 57, 6), 'cevMASA5523IsmSsmCsc20'), ((9, 57, 7), 'cevMASA5523IsmSsmIds40K9'),
+    ((9, 58), 'cevModuleUmg9820Type'), ((9, 58, 1), 'cevModuleUmg9820GigEProc'),
+    ((9, 58, 2), 'cevModuleUmg9820QamCard'), ((9, 59), 'cevModuleONS15310Type'), ((9, 59, 1), 'cevONS15310FeML100'),
+    ((9, 59, 2), 'cevONS15310FeCE100'), ((9, 59, 3), 'cevONS15310Ge8CE2'), ((9, 60), 'cevModuleX2s'),
+    ((9, 60, 1), 'cevMX210GBaseSR'), ((9, 60, 2), 'cevMX210GBaseLR'), ((9, 60, 3), 'cevMX210GBaseER'),
+    ((9, 60, 4), 'cevMX210GBaseLX4'), ((9, 60, 5), 'cevMX210GBaseCX4'), ((9, 60, 6), 'cevMX210GBaseZR'),
+    ((9, 60, 7), 'cevMX210GBaseLW'), ((9, 60, 8), 'cevMX210GBaseLRM'), ((9, 60, 9), 'cevMX210GBaseT'),
+    ((9, 60, 10), 'cevMX2s10GBaseWdmRxOnly'), ((9, 60, 11), 'cevMX2s10GBaseDwdm3033'),
+    ((9, 60, 13), 'cevMX2s10GBaseDwdm3112'), ((9, 60, 14), 'cevMX2s10GBaseDwdm3190'),
+    ((9, 60, 15), 'cevMX2s10GBaseDwdm3268'), ((9, 60, 16), 'cevMX2s10GBaseDwdm3425'),
+    ((9, 60, 17), 'cevMX2s10GBaseDwdm3504'), ((9, 60, 18), 'cevMX2s10GBaseDwdm3582'),
+    ((9, 60, 19), 'cevMX2s10GBaseDwdm3661'), ((9, 60, 20), 'cevMX2s10GBaseDwdm3819'),
+    ((9, 60, 21), 'cevMX2s10GBaseDwdm3898'), ((9, 60, 22), 'cevMX2s10GBaseDwdm3977'),
+    ((9, 60, 23), 'cevMX2s10GBaseDwdm4056'), ((9, 60, 24), 'cevMX2s10GBaseDwdm4214'),
+    ((9, 60, 25), 'cevMX2s10GBaseDwdm4294'), ((9, 60, 26), 'cevMX2s10GBaseDwdm4373'),
+    ((9, 60, 27), 'cevMX2s10GBaseDwdm4453'), ((9, 60, 28), 'cevMX2s10GBaseDwdm4612'),
+    ((9, 60, 29), 'cevMX2s10GBaseDwdm4692'), ((9, 60, 30), 'cevMX2s10GBaseDwdm4772'),
+    ((9, 60, 31), 'cevMX2s10GBaseDwdm4851'), ((9, 60, 32), 'cevMX2s10GBaseDwdm5012'),
+    ((9, 60, 33), 'cevMX2s10GBaseDwdm5092'), ((9, 60, 34), 'cevMX2s10GBaseDwdm5172'),
+    ((9, 60, 35), 'cevMX2s10GBaseDwdm5252'), ((9, 60, 36), 'cevMX2s10GBaseDwdm5413'),
+    ((9, 60, 37), 'cevMX2s10GBaseDwdm5494'), ((9, 60, 38), 'cevMX2s10GBaseDwdm5575'),
+    ((9, 60, 39), 'cevMX2s10GBaseDwdm5655'), ((9, 60, 40), 'cevMX2s10GBaseDwdm5817'),
+    ((9, 60, 41), 'cevMX2s10GBaseDwdm5898'), ((9, 60, 42), 'cevMX2s10GBaseDwdm5979'),
+    ((9, 60, 43), 'cevMX2s10GBaseDwdm6061'), ((9, 60, 44), 'cevMX210GEBaseT'), ((9, 63), 'cevModuleCE5xxType'),
+    ((9, 63, 1), 'cevModuleCE50024TT'), ((9, 63, 2), 'cevModuleCE50024LC'), ((9, 63, 3), 'cevModuleCE50024PC'),
+    ((9, 63, 4), 'cevModuleCE500G12TC'), ((9, 63, 5), 'cevModuleCE5208PC'), ((9, 63, 6), 'cevModuleCE52024PC'),
+    ((9, 63, 7), 'cevModuleCE52024TT'), ((9, 63, 8), 'cevModuleCE52024LC'), ((9, 63, 9), 'cevModule520G24TC'),
+    ((9, 64), 'cevModuleMEType'), ((9, 64, 1), 'cevModuleME240024TS'), ((9, 64, 2), 'cevModuleME340024TS'),
+    ((9, 64, 3), 'cevModuleME3400G12CS'), ((9, 64, 4), 'cevModuleME3400G2CS'), ((9, 64, 5), 'cevModuleME492410GE'),
+    ((9, 64, 6), 'cevModuleME340024FS'), ((9, 64, 7), 'cevModuleME3400E24TS'), ((9, 64, 8), 'cevModuleME3400EG12CS'),
+    ((9, 64, 9), 'cevModuleME3400EG2CS'), ((9, 64, 10), 'cevModuleME3600X24FS'), ((9, 64, 11), 'cevModuleME3600X24TS'),
+    ((9, 64, 12), 'cevModuleME3800X24FS'), ((9, 65), 'cevModuleCat4000EType'), ((9, 65, 1), 'cevCat4kWsx45Sup6e'),
+    ((9, 65, 2), 'cevCat4kWsx4648Rj45e'), ((9, 65, 3), 'cevCat4kWsx4648Rj45ve'), ((9, 65, 4), 'cevCat4kWsx4606X2e'),
+    ((9, 65, 5), 'cevCat4kWsx4624Sfpe'), ((9, 65, 7), 'cevCat4kWsx4590E'), ((9, 65, 9), 'cevCat4kWsx4648Rj45je'),
+    ((9, 65, 10), 'cevCat4kWsx4648Rj45vPlusE'), ((9, 65, 13), 'cevCat4kWsx45Sup6LE'),
+    ((9, 65, 14), 'cevCat4kWsx45Sup7e'), ((9, 65, 15), 'cevCat4kWsx4748Rj45VPlusE'),
+    ((9, 65, 16), 'cevCat4kWsx4712SfpPlusE'), ((9, 65, 17), 'cevCat4kWsx4612SfpE'),
+    ((9, 65, 18), 'cevCat4kWsx4640CSfpE'), ((9, 65, 19), 'cevCatWsX4748Rj45E'), ((9, 65, 20), 'cevCat4kWsX4748NgpoeE'),
+    ((9, 65, 21), 'cevCat4kWsx4712SfpE'), ((9, 65, 22), 'cevCat4kWsx4724SfpE'), ((9, 65, 23), 'cevCat4kWsx4748SfpE'),
+    ((9, 65, 33), 'cevCat4kWsX474812X48uE'), ((9, 66), 'cevModuleN7KType'), ((9, 66, 1), 'cevN7KSup1'),
+    ((9, 66, 2), 'cevN7KM148GT04'), ((9, 66, 3), 'cevN7KM132XP08'), ((9, 66, 4), 'cevN7Kc7010Fab40'),
+    ((9, 66, 5), 'cevN7KM148GS11'), ((9, 66, 6), 'cevN7Kc7018Fab1'), ((9, 66, 7), 'cevN7KF132Xp15'),
+    ((9, 66, 8), 'cevN7KM108X212'), ((9, 66, 9), 'cevN7KM108X212L'), ((9, 66, 10), 'cevN7KM148GS11L'),
+    ((9, 66, 11), 'cevN7KM116XP22L'), ((9, 66, 12), 'cevN7KM108XP22L'), ((9, 66, 13), 'cevN7KM132XP12L'),
+    ((9, 66, 14), 'cevN7Kc7009Fab2'), ((9, 66, 16), 'cevN7Kc7010Fab2'), ((9, 66, 17), 'cevN7Kc7018Fab2'),
+    ((9, 66, 18), 'cevN7KF248XP24'), ((9, 66, 19), 'cevN7KF248XT24'), ((9, 66, 20), 'cevN7KSUP2'),
+    ((9, 66, 21), 'cevN7KM202CF22L'), ((9, 66, 22), 'cevN7KM206FQ23L'), ((9, 66, 23), 'cevN7KM148GT11L'),
+    ((9, 66, 27), 'cevN7KSMNAMK9'), ((9, 66, 31), 'cevN7KFabricExtenderConnectionCable'),
+    ((9, 66, 32), 'cevN7KM224XP23L'), ((9, 66, 33), 'cevN7KSUP2E'), ((9, 66, 34), 'cevN7KForwardingEngine'),
+    ((9, 66, 35), 'cevN7KF306CK25'), ((9, 66, 36), 'cevN7KF312FQ25'), ((9, 66, 45), 'cevN7KF248XT25E'),
+    ((9, 66, 46), 'cevN7KF248XP25E'), ((9, 67), 'cevModuleASA5580Type'), ((9, 67, 1), 'cevModuleASA5580Pm4x1geCu'),
+    ((9, 67, 2), 'cevModuleASA5580Pm4x1geFi'), ((9, 67, 3), 'cevModuleASA5580Pm2x10geFi'),
+    ((9, 68), 'cevModuleASR1000Type'), ((9, 68, 1), 'cevModuleASR1000RP1'), ((9, 68, 2), 'cevModuleASR1000ESP10'),
+    ((9, 68, 3), 'cevModuleASR1000SIP10'), ((9, 68, 4), 'cevModuleASR1000UnknownRP'),
+    ((9, 68, 5), 'cevModuleASR1000UnknownESP'), ((9, 68, 6), 'cevModuleASR1000UnknownSIP'),
+    ((9, 68, 7), 'cevModuleASR1002RP1'), ((9, 68, 8), 'cevModuleASR1000ESP5'), ((9, 68, 9), 'cevModuleASR1000ESP20'),
+    ((9, 68, 10), 'cevModuleASR1002Spa4pGe'), ((9, 68, 11), 'cevModuleASR1002SIP10'),
+    ((9, 68, 12), 'cevModuleASR1000SIP40'), ((9, 68, 13), 'cevModuleASR1000RP2'),
+    ((9, 68, 14), 'cevModuleASR1000ESP10N'), ((9, 68, 15), 'cevModuleASR1002FESP'),
+    ((9, 68, 16), 'cevModuleASR1002FSIP10'), ((9, 68, 17), 'cevModuleASR1000ESP40'),
+    ((9, 68, 18), 'cevModuleASR1001RP'), ((9, 68, 19), 'cevModuleASR1001ESP'), ((9, 68, 20), 'cevModuleASR1001SIP'),
+    ((9, 68, 21), 'cevModuleASR1001Spa4pGe'), ((9, 68, 22), 'cevModuleASR1001IDC2xOc3Pos'),
+    ((9, 68, 23), 'cevModuleASR1001IDC4xT3'), ((9, 68, 24), 'cevModuleASR1001IDC8xChT1E1'),
+    ((9, 68, 25), 'cevModuleASR1001IDC4xGe'), ((9, 68, 26), 'cevModuleASR1001IDCHDD'),
+    ((9, 68, 27), 'cevModuleASR1002XRP'), ((9, 68, 28), 'cevModuleASR1002XESP'), ((9, 68, 29), 'cevModuleASR1002XSIP'),
+    ((9, 68, 30), 'cevModuleASR1002X6xGeBuiltIn'), ((9, 68, 31), 'cevModuleASR1000ESP100'),
+    ((9, 68, 32), 'cevModuleASR1000ESP200'), ((9, 68, 33), 'cevModuleASR1000ELC2xT20xGe'),
+    ((9, 68, 34), 'cevModuleASR1000ELC40GModule'), ((9, 68, 35), 'cevModuleASR1002XCRP'),
+    ((9, 68, 36), 'cevModuleASR1002XCESP'), ((9, 68, 37), 'cevModuleASR1002XCSIP'),
+    ((9, 68, 38), 'cevModuleASR1002XC2xGeBuiltIn'), ((9, 68, 39), 'cevModuleASR1001XRP'),
+    ((9, 68, 40), 'cevModuleASR1001XESP'), ((9, 68, 41), 'cevModuleASR1001XSIP'), ((9, 69), 'cevModuleCatRfgwType'),
+    ((9, 69, 1), 'cevRfgwDtcc'), ((9, 69, 2), 'cevRfgwQam48ABC'), ((9, 69, 3), 'cevRfgwPort4Qam'),
+    ((9, 69, 4), 'cevRfgwRfswitch'), ((9, 69, 5), 'cevRfgwQam384ABC'), ((9, 70), 'cevModuleVgdType'),
+    ((9, 70, 1), 'cevVgdDfcCT3'), ((9, 70, 2), 'cevVgdDfcVFC'), ((9, 70, 3), 'cevVgdDfcCarrier'),
+    ((9, 71), 'cevModuleIEType'), ((9, 71, 1), 'cevModuleIE30004TC'), ((9, 71, 2), 'cevModuleIE30008TC'),
+    ((9, 71, 3), 'cevModuleIE30008TM'), ((9, 71, 4), 'cevModuleIE30008FM'), ((9, 71, 5), 'cevModuleRAIE1783MS06T'),
+    ((9, 71, 6), 'cevModuleRAIE1783MS10T'), ((9, 71, 7), 'cevModuleRAIE1783MX08T'),
+    ((9, 71, 8), 'cevModuleRAIE1783MX08F'), ((9, 71, 9), 'cevModuleIE301016S8PC'),
+    ((9, 71, 13), 'cevModuleRAIE1783RMS06T'), ((9, 71, 14), 'cevModuleRAIE1783RMS10T'),
+    ((9, 71, 15), 'cevModuleIE20004TS'), ((9, 71, 16), 'cevModuleIE20004T'), ((9, 71, 17), 'cevModuleIE20004TSG'),
+    ((9, 71, 18), 'cevModuleIE20004TG'), ((9, 71, 19), 'cevModuleIE20008TC'), ((9, 71, 20), 'cevModuleIE20008TCG'),
+    ((9, 71, 21), 'cevModuleIE200016TC'), ((9, 71, 22), 'cevModuleIE200016TCG'),
+    ((9, 71, 23), 'cevModuleIE200016TCGX'), ((9, 71, 24), 'cevModuleRAIE1783BMS06SL'),
+    ((9, 71, 25), 'cevModuleRAIE1783BMS06SA'), ((9, 71, 26), 'cevModuleRAIE1783BMS06TL'),
+    ((9, 71, 27), 'cevModuleRAIE1783BMS06TA'), ((9, 71, 28), 'cevModuleRAIE1783BMS06SGL'),
+    ((9, 71, 29), 'cevModuleRAIE1783BMS06SGA'), ((9, 71, 30), 'cevModuleRAIE1783BMS06TGL'),
+    ((9, 71, 31), 'cevModuleRAIE1783BMS06TGA'), ((9, 71, 32), 'cevModuleRAIE1783BMS10CL'),
+    ((9, 71, 33), 'cevModuleRAIE1783BMS10CA'), ((9, 71, 34), 'cevModuleRAIE1783BMS10CGL'),
+    ((9, 71, 35), 'cevModuleRAIE1783BMS10CGA'), ((9, 71, 36), 'cevModuleRAIE1783BMS10CGP'),
+    ((9, 71, 37), 'cevModuleRAIE1783BMS10CGN'), ((9, 71, 38), 'cevModuleRAIE1783BMS20CL'),
+    ((9, 71, 39), 'cevModuleRAIE1783BMS20CA'), ((9, 71, 40), 'cevModuleRAIE1783BMS20CGL'),
+    ((9, 71, 41), 'cevModuleRAIE1783BMS20CGP'), ((9, 71, 42), 'cevModuleRAIE1783BMS20CGPK'),
+    ((9, 71, 52), 'cevModuleIE200016TCGP'), ((9, 71, 53), 'cevModuleIE200016TCGEP'),
+    ((9, 71, 54), 'cevModuleIE200016TCGNXP'), ((9, 71, 55), 'cevModuleIE30004SM'), ((9, 71, 56), 'cevModuleIE30008SM'),
+    ((9, 71, 57), 'cevModuleRAIE1783MX04S'), ((9, 71, 58), 'cevModuleRAIE1783MX08S'),
+    ((9, 71, 59), 'cevModuleIE30004PC'), ((9, 71, 60), 'cevModuleIE30004PC4TC'),
+    ((9, 71, 61), 'cevModuleRAIE1783MX04E'), ((9, 71, 62), 'cevModuleRAIE1783MX04T04E'),
+    ((9, 71, 63), 'cevModuleIE20008TCGN'), ((9, 71, 64), 'cevModuleIE200016TCGN'),
+    ((9, 71, 65), 'cevModuleRAIE1783BMS20CGN'), ((9, 71, 66), 'cevModuleRAIE1783BMS12T4E2CGL'),
+    ((9, 71, 67), 'cevModuleRAIE1783BMS12T4E2CGP'), ((9, 71, 68), 'cevModuleRAIE1783BMS12T4E2CGNK'),
+    ((9, 71, 69), 'cevModuleIem30004Pc'), ((9, 71, 70), 'cevModuleIem30004Pc4TC'), ((9, 71, 71), 'cevModule1783MX04E'),
+    ((9, 71, 72), 'cevModule1783MX04T04E'), ((9, 71, 79), 'cevModuleIE20008T67B'),
+    ((9, 71, 80), 'cevModuleIE200016T67B'), ((9, 71, 81), 'cevModuleIE200024T67B'),
+    ((9, 71, 82), 'cevModuleIE20008T67PGE'), ((9, 71, 83), 'cevModuleIE200016T67PGE'),
+    ((9, 71, 84), 'cevModuleRAIE1783ZMS8TA'), ((9, 71, 85), 'cevModuleRAIE1783ZMS16TA'),
+    ((9, 71, 86), 'cevModuleRAIE1783ZMS24TA'), ((9, 71, 87), 'cevModuleRAIE1783ZMS4T4E2TGP'),
+    ((9, 71, 88), 'cevModuleRAIE1783ZMS8T8E2TGP'), ((9, 71, 89), 'cevModuleIE2000U4STSG'),
+    ((9, 71, 90), 'cevModuleIE2000U16TCGP'), ((9, 71, 91), 'cevModuleIE2000U4TG'),
+    ((9, 71, 92), 'cevModuleIE2000U4TSG'), ((9, 71, 93), 'cevModuleIE2000U8TCG'),
+    ((9, 71, 94), 'cevModuleIE2000U16TCG'), ((9, 71, 95), 'cevModuleIE2000U16TCGX'),
+    ((9, 71, 96), 'cevModuleIE40004TC4GE'), ((9, 71, 97), 'cevModuleIE40008T4GE'),
+    ((9, 71, 98), 'cevModuleIE40008S4GE'), ((9, 71, 99), 'cevModuleIE40004T4P4GE'),
+    ((9, 71, 100), 'cevModuleIE400016T4GE'), ((9, 71, 101), 'cevModuleIE40004S8P4GE'),
+    ((9, 71, 102), 'cevModuleIE40008GT4GE'), ((9, 71, 103), 'cevModuleIE40008GS4GE'),
+    ((9, 71, 104), 'cevModuleIE40004GC4GP4GE'), ((9, 71, 105), 'cevModuleIE400016GT4GE'),
+    ((9, 71, 106), 'cevModuleIE40008GT8GP4GE'), ((9, 71, 107), 'cevModuleIE40004GS8GP4GE'),
+    ((9, 71, 108), 'cevModuleRAIE1783HMS4C4CGN'), ((9, 71, 109), 'cevModuleRAIE1783HMS8T4CGN'),
+    ((9, 71, 110), 'cevModuleRAIE1783HMS8S4CGN'), ((9, 71, 111), 'cevModuleRAIE1783HMS4T4E4CGN'),
+    ((9, 71, 112), 'cevModuleRAIE1783HMS16T4CGN'), ((9, 71, 113), 'cevModuleRAIE1783HMS4S8E4CGN'),
+    ((9, 71, 114), 'cevModuleRAIE1783HMS8TG4CGN'), ((9, 71, 115), 'cevModuleRAIE1783HMS8SG4CGN'),
+    ((9, 71, 116), 'cevModuleRAIE1783HMS4EG8CGN'), ((9, 71, 117), 'cevModuleRAIE1783HMS16TG4CGN'),
+    ((9, 71, 118), 'cevModuleRAIE1783HMS8TG8EG4CGN'), ((9, 71, 119), 'cevModuleRAIE1783HMS4SG8EG4CGN'),
+    ((9, 71, 120), 'cevModuleRAIE1783HMS8TG4CGR'), ((9, 71, 121), 'cevModuleRAIE1783HMS8SG4CGR'),
+    ((9, 71, 122), 'cevModuleRAIE1783HMS4EG8CGR'), ((9, 71, 123), 'cevModuleRAIE1783HMS16TG4CGR'),
+    ((9, 71, 124), 'cevModuleRAIE1783HMS8TG8EG4CGR'), ((9, 71, 125), 'cevModuleRAIE1783HMS4SG8EG4CGR'),
+    ((9, 71, 126), 'cevModuleIE500012S12P10G'), ((9, 71, 127), 'cevModuleRAIE1783IMS28NAC'),
+    ((9, 71, 128), 'cevModuleRAIE1783IMS28NDC'), ((9, 71, 129), 'cevModuleRAIE1783IMS28RAC'),
+    ((9, 71, 130), 'cevModuleRAIE1783IMS28RDC'), ((9, 71, 131), 'cevModuleIE500016S12P'),
+    ((9, 71, 136), 'cevModuleRAIE1783IMS28GNAC'), ((9, 71, 137), 'cevModuleRAIE1783IMS28GNDC'),
+    ((9, 71, 138), 'cevModuleRAIE1783IMS28GRAC'), ((9, 71, 139), 'cevModuleRAIE1783IMS28GRDC'),
+    ((9, 72), 'cevModuleN5KType'), ((9, 72, 1), 'cevN5kM1008'), ((9, 72, 2), 'cevN5KM1404'),
+    ((9, 72, 3), 'cevN5kM1Blnk'), ((9, 72, 4), 'cevN5KM1600'), ((9, 72, 5), 'cevN5kC5020FixedModule'),
+    ((9, 72, 6), 'cevN5kC5010FixedModule'), ((9, 72, 7), 'cevN5kFabricExtenderConnection'),
+    ((9, 72, 10), 'cevN5kC5548pFixedModule'), ((9, 72, 11), 'cevN5KN55M16P'), ((9, 72, 12), 'cevN5KN55M8P8FP'),
+    ((9, 72, 13), 'cevN5KN55M16UP'), ((9, 72, 14), 'cevN5KN55DL2'), ((9, 72, 15), 'cevN5KN55D160L3'),
+    ((9, 72, 16), 'cevN5KN55M160L3'), ((9, 72, 17), 'cevN5KC5596UpFixedModule'), ((9, 72, 18), 'cevN5KN55M16FP'),
+    ((9, 72, 19), 'cevN5kC5548UPFixedModule'), ((9, 72, 20), 'cevN5KN55M160L3V2'), ((9, 72, 21), 'cevN5KN55D160L3V2'),
+    ((9, 72, 22), 'cevN5kC5596TFAFixedModule'), ((9, 72, 23), 'cevN5KN55M12T'), ((9, 72, 24), 'cevN5KN55M4Q'),
+    ((9, 72, 25), 'cevN5KN56M24UP2Q'), ((9, 72, 26), 'cevN5KC56128PFixedModule'), ((9, 72, 27), 'cevN5KC5672UPM6Q'),
+    ((9, 72, 28), 'cevN5KC5672UPFixedModule'), ((9, 72, 29), 'cevN5KC5672UP16GFixedModule'),
+    ((9, 72, 30), 'cevN5KN5648M12QFIX'), ((9, 72, 31), 'cevN5KN5624M12QFIX'), ((9, 72, 32), 'cevN5KN5600M12Q'),
+    ((9, 72, 33), 'cevN5KC5648QFixedModule'), ((9, 72, 34), 'cevN5KC5624QFixedModule'),
+    ((9, 72, 35), 'cevN5KN5696M12Q'), ((9, 72, 36), 'cevN5KN5696M4C'), ((9, 72, 37), 'cevN5KN5696M20UP'),
+    ((9, 72, 38), 'cevN5KC5696QFixedModule'), ((9, 72, 39), 'cevN5KN5600M16UP6Q'),
+    ((9, 72, 40), 'cevN5KN560072UP16GFC'), ((9, 72, 41), 'cevN5KN560072UP16GFCM6Q'),
+    ((9, 72, 42), 'cevN5KN560072UP16GFCFC'), ((9, 73), 'cevModuleASA5505Type'),
+    ((9, 73, 1), 'cevMASA5505IsmSscIps5K9'), ((9, 74), 'cevModuleASR9KType'), ((9, 74, 1), 'cevModuleA9K8x10GEB'),
+    ((9, 74, 2), 'cevModuleA9K8x10GEE'), ((9, 74, 3), 'cevModuleA9K4x10GEB'), ((9, 74, 4), 'cevModuleA9K4x10GEE'),
+    ((9, 74, 5), 'cevModuleA9K40x1GEB'), ((9, 74, 6), 'cevModuleA9K40x1GEE'), ((9, 74, 7), 'cevModuleA9KRSP'),
+    ((9, 74, 8), 'cevModuleA9KRSP4G'), ((9, 74, 9), 'cevModuleASR9KHost'), ((9, 74, 10), 'cevModuleA9K2x10GE20x1GEB'),
+    ((9, 74, 11), 'cevModuleA9K8x10GELRB'), ((9, 74, 12), 'cevModuleA9K8x10GELRE'),
+    ((9, 74, 13), 'cevModuleA9K40x1GEL'), ((9, 74, 14), 'cevModuleA9K4x10GEL'), ((9, 74, 15), 'cevModuleA9K8x10GEL'),
+    ((9, 74, 16), 'cevModuleA9K2x10GE20x1GEE'), ((9, 74, 17), 'cevModuleA9KISM100'),
+    ((9, 74, 18), 'cevModuleA9KQFPSIP'), ((9, 74, 19), 'cevModuleA9KRSP8G'),
+    ((9, 74, 20), 'cevModuleA9K2x10GE20x1GEL'), ((9, 74, 21), 'cevModuleA9K8x10GELRL'),
+    ((9, 74, 22), 'cevModuleA9K16x10GEOVB'), ((9, 74, 23), 'cevModuleA9KQFPSIP500'),
+    ((9, 74, 24), 'cevModuleA9KServiceAcceleratorModule'), ((9, 74, 25), 'cevModuleA9KRsp440Se'),
+    ((9, 74, 26), 'cevModuleA9KRsp440Tr'), ((9, 74, 27), 'cevModuleA9K1X100GeSe'),
+    ((9, 74, 28), 'cevModuleA9K1X100GeTr'), ((9, 74, 29), 'cevModuleA9K36X10GeSe'),
+    ((9, 74, 30), 'cevModuleA9K36X10GeTr'), ((9, 74, 31), 'cevModuleA9K2X100GeSe'),
+    ((9, 74, 32), 'cevModuleA9K2X100GeTr'), ((9, 74, 33), 'cevModuleA9K24X10GeSe'),
+    ((9, 74, 34), 'cevModuleA9K24X10GeTr'), ((9, 74, 35), 'cevModuleA9KMOD80SE'), ((9, 74, 36), 'cevModuleA9KMOD80TR'),
+    ((9, 74, 37), 'cevModuleA9KMOD160SE'), ((9, 74, 38), 'cevModuleA9KMOD160TR'),
+    ((9, 74, 39), 'cevModuleA9K9922RpSe'), ((9, 74, 40), 'cevModuleA9K9922RpTr'),
+    ((9, 74, 41), 'cevModuleA9K9922Sfc110'), ((9, 74, 42), 'cevModuleA9KVGenericLc'),
+    ((9, 74, 43), 'cevModuleA9K9912SFC110'), ((9, 74, 44), 'cevModuleA9K9912RpTr'),
+    ((9, 74, 45), 'cevModuleA9K9912RpSe'), ((9, 74, 46), 'cevModuleA9KMODULEv'), ((9, 74, 47), 'cevModuleA9K9001Lc'),
+    ((9, 74, 48), 'cevModuleA9K9001Rp'), ((9, 74, 49), 'cevModuleA9KSip7008G'), ((9, 74, 53), 'cevModuleA9K9001LcS'),
+    ((9, 74, 54), 'cevModuleA9KVSM500'), ((9, 74, 55), 'cevModuleA9K40x1GeSe'), ((9, 74, 56), 'cevModuleA9K40x1GeTr'),
+    ((9, 74, 57), 'cevModuleA9K16x1G4x10GeTr'), ((9, 74, 58), 'cevModuleA9K16x1G4x10GeSe'),
+    ((9, 74, 60), 'cevModuleA9K8X100GeLSe'), ((9, 74, 61), 'cevModuleA9KRsp880Se'),
+    ((9, 74, 62), 'cevModuleA9KRsp880Tr'), ((9, 74, 63), 'cevModuleA9K9900Sfc2'), ((9, 74, 64), 'cevModuleA99RpV2Se'),
+    ((9, 74, 65), 'cevModuleA99RpV2Tr'), ((9, 74, 66), 'cevModuleA9K8X100GeCm'),
+    ((9, 74, 67), 'cevModuleA998X100GeCm'), ((9, 74, 68), 'cevModuleA9K8X100GESE'),
+    ((9, 74, 69), 'cevModuleA9K8x100GETR'), ((9, 74, 70), 'cevModuleA9K4X100GESE'),
+    ((9, 74, 71), 'cevModuleA9K4X100GETR'), ((9, 74, 72), 'cevModuleA9912X100GE'),
+    ((9, 74, 73), 'cevModuleA9912X100GECM'), ((9, 74, 75), 'cevModuleA99Rsp16G'), ((9, 74, 76), 'cevModuleA99Rsp32G'),
+    ((9, 74, 77), 'cevModuleA9K9910SfcS'), ((9, 74, 78), 'cevModuleA9KMOD400TR'),
+    ((9, 74, 79), 'cevModuleA9KMOD400SE'), ((9, 74, 82), 'cevModuleA998X100GESE'),
+    ((9, 74, 83), 'cevModuleA998X100GETR'), ((9, 74, 84), 'cevModuleA994X100GESE'),
+    ((9, 74, 85), 'cevModuleA994X100GETR'), ((9, 74, 86), 'cevModuleA99400GDWDMTR'),
+    ((9, 74, 87), 'cevModuleA99MOD400TR'), ((9, 74, 88), 'cevModuleA99MOD400SE'),
+    ((9, 74, 89), 'cevModuleA99MOD200TR'), ((9, 74, 90), 'cevModuleA99MOD200SE'),
+    ((9, 74, 91), 'cevModuleA998X100GELSE'), ((9, 74, 98), 'cevModuleA9KMOD400CM'), ((9, 75), 'cevModuleASR14KType'),
+    ((9, 75, 1), 'cevModuleASR14K20x1GeFl'), ((9, 75, 2), 'cevModuleASR14K42x1GE'),
+    ((9, 75, 3), 'cevModuleASR14K4x10GE'), ((9, 75, 4), 'cevModuleASR14K4FabricCard'),
+    ((9, 75, 5), 'cevModuleASR14K8FabricCard'), ((9, 75, 6), 'cevModuleASR14KRP'), ((9, 75, 7), 'cevModuleASR14KFP40'),
+    ((9, 75, 8), 'cevModuleASR14KFPE'), ((9, 75, 9), 'cevModuleASR14K2x10WLFL'), ((9, 76), 'cevModuleSFPPlusS'),
+    ((9, 76, 1), 'cevSFP10GLR'), ((9, 76, 2), 'cevSFP10GLRM'), ((9, 76, 3), 'cevSFP10GSR'),
+    ((9, 76, 4), 'cevSFP10GUSR'), ((9, 76, 5), 'cevSFP10GER'), ((9, 76, 7), 'cevSFP10GLRMSM'),
+    ((9, 76, 8), 'cevSFP10GZR'), ((9, 76, 9), 'cevSFP10GCU1M'), ((9, 76, 10), 'cevSFP10GCU3M'),
+    ((9, 76, 11), 'cevSFP10GCU5M'), ((9, 76, 12), 'cevSFP10GACU7M'), ((9, 76, 13), 'cevSFPH10GbAcu10m'),
+    ((9, 76, 14), 'cevSFPOe8541'), ((9, 76, 15), 'cevSFPOe7571'), ((9, 76, 16), 'cevSFPOe7541'),
+    ((9, 76, 17), 'cevSFPOe694'), ((9, 76, 18), 'cevSFPOe594'), ((9, 76, 19), 'cevSFPOe294'),
+    ((9, 76, 20), 'cevSFPDwdmSfp10g3190'), ((9, 76, 21), 'cevSFPDwdmSfp10g3112'),
+    ((9, 76, 22), 'cevSFPDwdmSfp10g3033'), ((9, 76, 23), 'cevSFPDwdmSfp10g3582'),
+    ((9, 76, 24), 'cevSFPDwdmSfp10g3504'), ((9, 76, 25), 'cevSFPDwdmSfp10g3425'),
+    ((9, 76, 26), 'cevSFPDwdmSfp10g3347'), ((9, 76, 27), 'cevSFPDwdmSfp10g3268'),
+    ((9, 76, 28), 'cevSFPDwdmSfp10g3977'), ((9, 76, 29), 'cevSFPDwdmSfp10g3898'),
+    ((9, 76, 30), 'cevSFPDwdmSfp10g3819'), ((9, 76, 31), 'cevSFPDwdmSfp10g3740'),
+    ((9, 76, 32), 'cevSFPDwdmSfp10g3661'), ((9, 76, 33), 'cevSFPDwdmSfp10g4373'),
+    ((9, 76, 34), 'cevSFPDwdmSfp10g4294'), ((9, 76, 35), 'cevSFPDwdmSfp10g4214'),
+    ((9, 76, 36), 'cevSFPDwdmSfp10g4135'), ((9, 76, 37), 'cevSFPDwdmSfp10g4056'),
+    ((9, 76, 38), 'cevSFPDwdmSfp10g4772'), ((9, 76, 39), 'cevSFPDwdmSfp10g4692'),
+    ((9, 76, 40), 'cevSFPDwdmSfp10g4612'), ((9, 76, 41), 'cevSFPDwdmSfp10g4532'),
+    ((9, 76, 42), 'cevSFPDwdmSfp10g5172'), ((9, 76, 43), 'cevSFPDwdmSfp10g5092'),
+    ((9, 76, 44), 'cevSFPDwdmSfp10g5012'), ((9, 76, 45), 'cevSFPDwdmSfp10g4932'),
+    ((9, 76, 46), 'cevSFPDwdmSfp10g4851'), ((9, 76, 47), 'cevSFPDwdmSfp10g5575'),
+    ((9, 76, 48), 'cevSFPDwdmSfp10g5494'), ((9, 76, 49), 'cevSFPDwdmSfp10g5413'),
+    ((9, 76, 50), 'cevSFPDwdmSfp10g5333'), ((9, 76, 51), 'cevSFPDwdmSfp10g5252'),
+    ((9, 76, 52), 'cevSFPDwdmSfp10g5979'), ((9, 76, 53), 'cevSFPDwdmSfp10g5898'),
+    ((9, 76, 54), 'cevSFPDwdmSfp10g5817'), ((9, 76, 55), 'cevSFPDwdmSfp10g5736'),
+    ((9, 76, 56), 'cevSFPDwdmSfp10g5655'), ((9, 76, 57), 'cevSFPDwdmSfp10g6061'),
+    ((9, 76, 58), 'cevSFPDwdmSfp10g6141'), ((9, 76, 59), 'cevSFPDwdmSfp10g4453'), ((9, 76, 60), 'cevSFPFET10G'),
+    ((9, 76, 61), 'cevSFPSC10GTDwdmC'), ((9, 76, 62), 'cevSFPSC10GSR'), ((9, 76, 63), 'cevSFPSC10GER'),
+    ((9, 76, 64), 'cevSFPSC10GLR'), ((9, 76, 65), 'cevSFPSC10GZR'), ((9, 76, 66), 'cevSFPSE10GLR'),
+    ((9, 76, 67), 'cevSFPSC10G303'), ((9, 76, 68), 'cevSFPSC10G311'), ((9, 76, 69), 'cevSFPSC10G319'),
+    ((9, 76, 70), 'cevSFPSC10G326'), ((9, 76, 71), 'cevSFPSC10G334'), ((9, 76, 72), 'cevSFPSC10G342'),
+    ((9, 76, 73), 'cevSFPSC10G350'), ((9, 76, 74), 'cevSFPSC10G358'), ((9, 76, 75), 'cevSFPSC10G366'),
+    ((9, 76, 76), 'cevSFPSC10G374'), ((9, 76, 77), 'cevSFPSC10G381'), ((9, 76, 78), 'cevSFPSC10G389'),
+    ((9, 76, 79), 'cevSFPSC10G397'), ((9, 76, 80), 'cevSFPSC10G405'), ((9, 76, 81), 'cevSFPSC10G415'),
+    ((9, 76, 82), 'cevSFPSC10G421'), ((9, 76, 83), 'cevSFPSC10G429'), ((9, 76, 84), 'cevSFPSC10G437'),
+    ((9, 76, 85), 'cevSFPSC10G445'), ((9, 76, 86), 'cevSFPSC10G453'), ((9, 76, 87), 'cevSFPSC10G461'),
+    ((9, 76, 88), 'cevSFPSC10G469'), ((9, 76, 89), 'cevSFPSC10G477'), ((9, 76, 90), 'cevSFPSC10G485'),
+    ((9, 76, 91), 'cevSFPSC10G493'), ((9, 76, 92), 'cevSFPSC10G501'), ((9, 76, 93), 'cevSFPSC10G509'),
+    ((9, 76, 94), 'cevSFPSC10G517'), ((9, 76, 95), 'cevSFPSC10G525'), ((9, 76, 96), 'cevSFPSC10G533'),
+    ((9, 76, 97), 'cevSFPSC10G541'), ((9, 76, 98), 'cevSFPSC10G549'), ((9, 76, 99), 'cevSFPSC10G557'),
+    ((9, 76, 100), 'cevSFPSC10G565'), ((9, 76, 101), 'cevSFPSC10G573'), ((9, 76, 102), 'cevSFPSC10G581'),
+    ((9, 76, 103), 'cevSFPSC10G589'), ((9, 76, 104), 'cevSFPSC10G597'), ((9, 76, 105), 'cevSFPSC10G606'),
+    ((9, 76, 106), 'cevSFPSC10G614'), ((9, 76, 114), 'cevSFPPONSSI2GI1'), ((9, 76, 115), 'cevSFPPONSSC10GEP618'),
+    ((9, 76, 116), 'cevSFPPONSSC10GEP614'), ((9, 76, 117), 'cevSFPPONSSC10GEP610'),
+    ((9, 76, 118), 'cevSFPPONSSC10GEP606'), ((9, 76, 119), 'cevSFPPONSSC10GEP602'),
+    ((9, 76, 120), 'cevSFPPONSSC10GEP597'), ((9, 76, 121), 'cevSFPPONSSC10GEP593'),
+    ((9, 76, 122), 'cevSFPPONSSC10GEP589'), ((9, 76, 123), 'cevSFPPONSSC10GEP585'),
+    ((9, 76, 124), 'cevSFPPONSSC10GEP581'), ((9, 76, 125), 'cevSFPPONSSC10GEP577'),
+    ((9, 76, 126), 'cevSFPPONSSC10GEP573'), ((9, 76, 127), 'cevSFPPONSSC10GEP569'),
+    ((9, 76, 128), 'cevSFPPONSSC10GEP565'), ((9, 76, 129), 'cevSFPPONSSC10GEP561'),
+    ((9, 76, 130), 'cevSFPPONSSC10GEP557'), ((9, 76, 131), 'cevSFPPONSSC10GEP553'),
+    ((9, 76, 132), 'cevSFPPONSSC10GEP549'), ((9, 76, 133), 'cevSFPPONSSC10GEP545'),
+    ((9, 76, 134), 'cevSFPPONSSC10GEP541'), ((9, 76, 135), 'cevSFPPONSSC10GEP537'),
+    ((9, 76, 136), 'cevSFPPONSSC10GEP533'), ((9, 76, 137), 'cevSFPPONSSC10GEP529'),
+    ((9, 76, 138), 'cevSFPPONSSC10GEP525'), ((9, 76, 139), 'cevSFPPONSSC10GEP521'),
+    ((9, 76, 140), 'cevSFPPONSSC10GEP517'), ((9, 76, 141), 'cevSFPPONSSC10GEP513'),
+    ((9, 76, 142), 'cevSFPPONSSC10GEP509'), ((9, 76, 143), 'cevSFPPONSSC10GEP505'),
+    ((9, 76, 144), 'cevSFPPONSSC10GEP501'), ((9, 76, 145), 'cevSFPPONSSC10GEP497'),
+    ((9, 76, 146), 'cevSFPPONSSC10GEP493'), ((9, 76, 147), 'cevSFPPONSSC10GEP489'),
+    ((9, 76, 148), 'cevSFPPONSSC10GEP485'), ((9, 76, 149), 'cevSFPPONSSC10GEP481'),
+    ((9, 76, 150), 'cevSFPPONSSC10GEP477'), ((9, 76, 151), 'cevSFPPONSSC10GEP473'),
+    ((9, 76, 152), 'cevSFPPONSSC10GEP469'), ((9, 76, 153), 'cevSFPPONSSC10GEP465'),
+    ((9, 76, 154), 'cevSFPPONSSC10GEP461'), ((9, 76, 155), 'cevSFPPONSSC10GEP457'),
+    ((9, 76, 156), 'cevSFPPONSSC10GEP453'), ((9, 76, 157), 'cevSFPPONSSC10GEP449'),
+    ((9, 76, 158), 'cevSFPPONSSC10GEP445'), ((9, 76, 159), 'cevSFPPONSSC10GEP441'),
+    ((9, 76, 160), 'cevSFPPONSSC10GEP437'), ((9, 76, 161), 'cevSFPPONSSC10GEP433'),
+    ((9, 76, 162), 'cevSFPPONSSC10GEP429'), ((9, 76, 163), 'cevSFPPONSSC10GEP425'),
+    ((9, 76, 164), 'cevSFPPONSSC10GEP421'), ((9, 76, 165), 'cevSFPPONSSC10GEP417'),
+    ((9, 76, 166), 'cevSFPPONSSC10GEP413'), ((9, 76, 167), 'cevSFPPONSSC10GEP409'),
+    ((9, 76, 168), 'cevSFPPONSSC10GEP405'), ((9, 76, 169), 'cevSFPPONSSC10GEP401'),
+    ((9, 76, 170), 'cevSFPPONSSC10GEP397'), ((9, 76, 171), 'cevSFPPONSSC10GEP393'),
+    ((9, 76, 172), 'cevSFPPONSSC10GEP389'), ((9, 76, 173), 'cevSFPPONSSC10GEP385'),
+    ((9, 76, 174), 'cevSFPPONSSC10GEP381'), ((9, 76, 175), 'cevSFPPONSSC10GEP377'),
+    ((9, 76, 176), 'cevSFPPONSSC10GEP374'), ((9, 76, 177), 'cevSFPPONSSC10GEP370'),
+    ((9, 76, 178), 'cevSFPPONSSC10GEP366'), ((9, 76, 179), 'cevSFPPONSSC10GEP362'),
+    ((9, 76, 180), 'cevSFPPONSSC10GEP358'), ((9, 76, 181), 'cevSFPPONSSC10GEP354'),
+    ((9, 76, 182), 'cevSFPPONSSC10GEP350'), ((9, 76, 183), 'cevSFPPONSSC10GEP346'),
+    ((9, 76, 184), 'cevSFPPONSSC10GEP342'), ((9, 76, 185), 'cevSFPPONSSC10GEP338'),
+    ((9, 76, 186), 'cevSFPPONSSC10GEP334'), ((9, 76, 187), 'cevSFPPONSSC10GEP330'),
+    ((9, 76, 188), 'cevSFPPONSSC10GEP326'), ((9, 76, 189), 'cevSFPPONSSC10GEP322'),
+    ((9, 76, 190), 'cevSFPPONSSC10GEP319'), ((9, 76, 191), 'cevSFPPONSSC10GEP315'),
+    ((9, 76, 192), 'cevSFPPONSSC10GEP311'), ((9, 76, 193), 'cevSFPPONSSC10GEP307'),
+    ((9, 76, 194), 'cevSFPPONSSC10GEP303'), ((9, 76, 195), 'cevSFPPONSSC10GC'), ((9, 76, 196), 'cevSFPCwdmSfp10g1610'),
+    ((9, 76, 197), 'cevSFPCwdmSfp10g1590'), ((9, 76, 198), 'cevSFPCwdmSfp10g1570'),
+    ((9, 76, 199), 'cevSFPCwdmSfp10g1550'), ((9, 76, 200), 'cevSFPCwdmSfp10g1530'),
+    ((9, 76, 201), 'cevSFPCwdmSfp10g1510'), ((9, 76, 202), 'cevSFPCwdmSfp10g1490'),
+    ((9, 76, 203), 'cevSFPCwdmSfp10g1470'), ((9, 76, 204), 'cevSFP10GBXDI'), ((9, 76, 205), 'cevSFP10GBXUI'),
+    ((9, 76, 206), 'cevSFP10GBX40DI'), ((9, 76, 207), 'cevSFP10GBX40UI'), ((9, 76, 208), 'cevSFPQsfpPlusLROpticsMod'),
+    ((9, 76, 209), 'cevSFPQsfpPlusSROpticsMod'), ((9, 76, 213), 'cevSFPPDWDMSFP10GC'),
+    ((9, 76, 214), 'cevDWDMSFP10GCS'), ((9, 76, 215), 'cevSFP10GZRS'), ((9, 76, 216), 'cevSFP10GERS'),
+    ((9, 76, 217), 'cevSFP10GLRS'), ((9, 76, 218), 'cevSFP10GSRS'), ((9, 77), 'cevDirectAttachCable10Gs'),
+    ((9, 77, 1), 'cevSFPH10GBCU1M'), ((9, 77, 2), 'cevSFPH10GBCU5M'), ((9, 77, 3), 'cevSFPH10GBCU3M'),
+    ((9, 77, 4), 'cevSFPH10GBCU7M'), ((9, 77, 9), 'cevSFPH10GBACU1M'), ((9, 77, 10), 'cevSFPH10GBACU3M'),
+    ((9, 77, 11), 'cevSFPH10GBACU5M'), ((9, 77, 12), 'cevSFPH10GBACU15M'), ((9, 77, 13), 'cevSFPH10GBACU10M'),
+    ((9, 77, 14), 'cevSFPH10GBACU7M'), ((9, 77, 15), 'cevSFPH10GBCU150CM'), ((9, 77, 16), 'cevSFPH10GBCU250CM'),
+    ((9, 77, 17), 'cevSFP10GAOC1M'), ((9, 77, 18), 'cevSFP10GAOC2M'), ((9, 77, 19), 'cevSFP10GAOC3M'),
+    ((9, 77, 20), 'cevSFP10GAOC5M'), ((9, 77, 21), 'cevSFP10GAOC7M'), ((9, 77, 22), 'cevSFP10GAOC10M'),
+    ((9, 77, 23), 'cevSFPH10GBCU200CM'), ((9, 77, 24), 'cevSFPH10GBAOC1M'), ((9, 77, 25), 'cevSFPH10GBAOC2M'),
+    ((9, 77, 26), 'cevSFPH10GBAOC3M'), ((9, 77, 27), 'cevSFPH10GBAOC5M'), ((9, 77, 28), 'cevSFPH10GBAOC7M'),
+    ((9, 77, 29), 'cevSFPH10GBAOC10M'), ((9, 77, 30), 'cevSFPH10GBCU10M'), ((9, 77, 31), 'cevQSFP4x10GAC7M'),
+    ((9, 77, 32), 'cevQSFP4x10GAC10M'), ((9, 78), 'cevModuleN2KType'), ((9, 78, 1), 'cevN2kC2148T1GEFixedModule'),
+    ((9, 78, 2), 'cevN2kC2232PP10GEFixedModule'), ((9, 78, 3), 'cevN2kC2248TP1GEFixedModule'),
+    ((9, 78, 4), 'cevN2kC2224TP1GEFixedModule'), ((9, 78, 5), 'cevN2kC2232TT10GEFixedModule'),
+    ((9, 78, 6), 'cevN2kC2232TP10GEFixedModule'), ((9, 78, 7), 'cevN2kC2248TT1GEFixedModule'),
+    ((9, 78, 8), 'cevN2kC2248TPE1GEFixedModule'), ((9, 78, 9), 'cevN2kB22HPPFixedModule'),
+    ((9, 78, 10), 'cevN2kM2800P'), ((9, 78, 11), 'cevN2kC2232TM10GEFixedModule'),
+    ((9, 78, 12), 'cevN2kC2232TME10GEFixedModule'), ((9, 78, 13), 'cevN2kC2248PQ10GEFixedModule'),
+    ((9, 78, 14), 'cevN2kB22DELLPFixedModule'), ((9, 78, 15), 'cevN2kB22FTSPFixedModule'),
+    ((9, 78, 16), 'cevN2kB22IBMPFixedModule'), ((9, 78, 17), 'cevN2KC2348UPQFixedModule'),
+    ((9, 78, 18), 'cevN2KC2348TQFixedModule'), ((9, 78, 19), 'cevN2KC2232TQFixedModule'),
+    ((9, 78, 20), 'cevN2KC2348TQ10GE'), ((9, 79), 'cevModuleN1KVType'), ((9, 79, 1), 'cevN1KVVSM'),
+    ((9, 79, 2), 'cevN1KVVEM'), ((9, 79, 3), 'cevN1KVVXLANGateway'), ((9, 79, 4), 'cevN1KVInterCloudExtender'),
+    ((9, 79, 5), 'cevN1KVInterCloudSwitch'), ((9, 80), 'cevModuleUCSType'), ((9, 80, 1), 'cevUCSN10S6100FixedModule'),
+    ((9, 80, 2), 'cevUCSN10E0080'), ((9, 80, 3), 'cevUCSN10E0440'), ((9, 80, 4), 'cevUCSN10E0600'),
+    ((9, 80, 7), 'cevUCSFIE16UP'), ((9, 80, 8), 'cevUCSFI6248UPFixedModule'),
+    ((9, 80, 9), 'cevUCSFI6296UPFixedModule'), ((9, 80, 10), 'cevUCSFIDL2'),
+    ((9, 80, 171), 'cevUCSFIM6324FixedModule'), ((9, 80, 172), 'cevUCSFI6332FixedModule'),
+    ((9, 80, 176), 'cevUCSIOM2304Q'), ((9, 81), 'cevModuleNexus1010Type'), ((9, 81, 1), 'cevNexus1010VSM'),
+    ((9, 81, 2), 'cevNexusN1KVSANam'), ((9, 82), 'cevModuleMxeType'), ((9, 82, 1), 'cevMxeNpm'),
+    ((9, 82, 2), 'cevMxeMpm'), ((9, 82, 3), 'cevMxe5600ShelfManager'), ((9, 83), 'cevModuleASA5585Type'),
+    ((9, 83, 1), 'cevASA5585Ssp10'), ((9, 83, 2), 'cevASA5585Ssp20'), ((9, 83, 3), 'cevASA5585Ssp40'),
+    ((9, 83, 4), 'cevASA5585Ssp60'), ((9, 83, 5), 'cevASA5585IsmSspIps10'), ((9, 83, 6), 'cevASA5585IsmSspIps20'),
+    ((9, 83, 7), 'cevASA5585IsmSspIps40'), ((9, 83, 8), 'cevASA5585IsmSspIps60'), ((9, 83, 9), 'cevMASA5585Ssp10K7'),
+    ((9, 83, 10), 'cevMASA5585Ssp20K7'), ((9, 83, 11), 'cevMASA5585Ssp40K7'), ((9, 83, 12), 'cevMASA5585Ssp60K7'),
+    ((9, 83, 13), 'cevMASA5585IsmSspIps10K7'), ((9, 83, 14), 'cevMASA5585IsmSspIps20K7'),
+    ((9, 83, 15), 'cevMASA5585IsmSspIps40K7'), ((9, 83, 16), 'cevMASA5585IsmSspIps60K7'),
+    ((9, 83, 17), 'cevMASA5585Nm8x10GE'), ((9, 83, 18), 'cevMASA5585Nm4x10GE'), ((9, 83, 19), 'cevMASA5585Nm20x1GE'),
+    ((9, 83, 20), 'cevMASA5585CxSsp40'), ((9, 83, 21), 'cevMASA5585CxSsp60'), ((9, 83, 22), 'cevMASA5585CxSsp10'),
+    ((9, 83, 23), 'cevMASA5585CxSsp20'), ((9, 83, 24), 'cevMASA5585SFRSsp10'), ((9, 83, 25), 'cevMASA5585SFRSsp20'),
+    ((9, 83, 26), 'cevMASA5585SFRSsp40'), ((9, 83, 27), 'cevMASA5585SFRSsp60'), ((9, 84), 'cevModuleCFPs'),
+    ((9, 84, 1), 'cevCFP100GLR4'), ((9, 84, 2), 'cevCFP40GLR4'), ((9, 84, 3), 'cevCFP40GSR4'),
+    ((9, 84, 4), 'cevCFP40GFR'), ((9, 84, 5), 'cevCFP100GSR10'), ((9, 84, 6), 'cevCFP100GER4'),
+    ((9, 84, 7), 'cevCFPUnknown'), ((9, 85), 'cevModuleN3KType'), ((9, 85, 1), 'cevN3kC3064PQfixedModule'),
+    ((9, 85, 2), 'cevN3kC3064PQ10GEFixedModule'), ((9, 85, 3), 'cevN3kC3048TP1GEFixedModule'),
+    ((9, 85, 4), 'cevN3kC3016Q40GEFixedModule'), ((9, 85, 5), 'cevN3kC3064Pq10GXFixedModule'),
+    ((9, 85, 6), 'cevN3kC3548P10GFixedModule'), ((9, 85, 7), 'cevN3kC3064TQ10GTFixedModule'),
+    ((9, 85, 8), 'cevN3KC3172'), ((9, 85, 9), 'cevN3KC3172TQ'), ((9, 85, 10), 'cevN3KC3132TQ'),
+    ((9, 85, 11), 'cevN3KC3132CR'), ((9, 85, 12), 'cevN3kC3164Q40GEFixedModule'),
+    ((9, 85, 13), 'cevN3kC3548P10GXFixedModule'), ((9, 85, 14), 'cevN3KC3132QXOE'), ((9, 85, 15), 'cevN3KC3172PQOE'),
+    ((9, 85, 16), 'cevN3KC3172TQOE'), ((9, 85, 17), 'cevN3KC3064XOE'), ((9, 85, 18), 'cevN3KC3048OE'),
+    ((9, 85, 19), 'cevN3kC3232CFixedModule'), ((9, 85, 20), 'cevN3kC31128PQfixedModule'),
+    ((9, 85, 21), 'cevN3KC3132QXL'), ((9, 85, 22), 'cevN3KC3172PQXL'), ((9, 85, 23), 'cevN3KC3172TQXL'),
+    ((9, 85, 24), 'cevN3KC3172PQZ8'), ((9, 86), 'cevModuleCGSType'), ((9, 86, 1), 'cevModuleCGS252016S8PC'),
+    ((9, 86, 2), 'cevModuleCGS252024TC'), ((9, 87), 'cevModuleASR900Type'), ((9, 87, 1), 'cevModuleASR903RSP1A'),
+    ((9, 87, 2), 'cevModuleASR900ESP'), ((9, 87, 3), 'cevModuleASR903RSP1B'), ((9, 87, 4), 'cevModuleASR903RSP2A64G'),
+    ((9, 87, 5), 'cevModuleASR903RSP2A128G'), ((9, 87, 6), 'cevModuleASR92024SZIM'),
+    ((9, 87, 7), 'cevModuleASR92024SZM'), ((9, 87, 8), 'cevModuleASR92024TZM'), ((9, 87, 9), 'cevModuleASR92012CZA'),
+    ((9, 87, 10), 'cevModuleASR92012CZD'), ((9, 87, 11), 'cevModuleASR9204SZA'), ((9, 87, 12), 'cevModuleASR9204SZD'),
+    ((9, 87, 13), 'cevModuleASR92010SZPA'), ((9, 87, 14), 'cevModuleASR92010SZPD'),
+    ((9, 87, 20), 'cevModuleASR900RSP3C200CC'), ((9, 88), 'cevModuleASR5000Type'),
+    ((9, 88, 1), 'cevModuleASR5K01100eK9'), ((9, 88, 2), 'cevModuleASR5K0110gMmK9'),
+    ((9, 88, 3), 'cevModuleASR5K0110gSmK9'), ((9, 88, 4), 'cevModuleASR5K011G2LxK9'),
+    ((9, 88, 5), 'cevModuleASR5K011G2SxK9'), ((9, 88, 6), 'cevModuleASR5K011G2TK9'),
+    ((9, 88, 7), 'cevModuleASR5K011GELxK9'), ((9, 88, 8), 'cevModuleASR5K011GESxK9'),
+    ((9, 88, 9), 'cevModuleASR5K011GETK9'), ((9, 88, 10), 'cevModuleASR5K01OC3MmK9'),
+    ((9, 88, 11), 'cevModuleASR5K01OC3SmK9'), ((9, 88, 12), 'cevModuleASR5K041GeLxK9'),
+    ((9, 88, 13), 'cevModuleASR5K041GeSxK9'), ((9, 88, 14), 'cevModuleASR5K041GeTK9'),
+    ((9, 88, 15), 'cevModuleASR5K042GeLxK9'), ((9, 88, 16), 'cevModuleASR5K042GeSxK9'),
+    ((9, 88, 17), 'cevModuleASR5K042GeTK9'), ((9, 88, 18), 'cevModuleASR5K08100eK9'),
+    ((9, 88, 19), 'cevModuleASR5K4OC3CMmK9'), ((9, 88, 20), 'cevModuleASR5K4OC3CSmK9'),
+    ((9, 88, 21), 'cevModuleASR5KC1OC3MnK9'), ((9, 88, 22), 'cevModuleASR5KC1OC3SmK9'),
+    ((9, 88, 23), 'cevModuleASR5KC4OC3MmK9'), ((9, 88, 24), 'cevModuleASR5KC4OC3SmK9'),
+    ((9, 88, 25), 'cevModuleASR5KppcK9'), ((9, 88, 26), 'cevModuleASR5Kpsc16gK9'),
+    ((9, 88, 27), 'cevModuleASR5Kpsc32gK9'), ((9, 88, 28), 'cevModuleASR5Kpsc64gK9'),
+    ((9, 88, 29), 'cevModuleASR5KpscK9'), ((9, 88, 30), 'cevModuleASR5KsmcK9'),
+    ((9, 88, 31), 'cevModuleASR5KSps3BncK9'), ((9, 88, 32), 'cevModuleASR5KSps33pnK9'),
+    ((9, 88, 33), 'cevModuleASR5KSpioBncK9'), ((9, 88, 34), 'cevModuleASR5KSpio3pnK9'),
+    ((9, 88, 35), 'cevModuleASR5KRccK9'), ((9, 89), 'cevModuleASR5500Type'), ((9, 89, 1), 'cevModuleASR55DPC'),
+    ((9, 89, 2), 'cevModuleASR55FSC'), ((9, 89, 3), 'cevModuleASR55MIO10GL10'),
+    ((9, 89, 4), 'cevModuleASR55MIO10GL20'), ((9, 89, 5), 'cevModuleASR55MIO10GS10'),
+    ((9, 89, 6), 'cevModuleASR55MIO10GS20'), ((9, 89, 7), 'cevModuleASR55MIOBASE'), ((9, 89, 8), 'cevModuleASR55SSC'),
+    ((9, 89, 9), 'cevModuleASR55DPC2'), ((9, 89, 10), 'cevModuleASR55UDPC2'), ((9, 90), 'cevModuleCSR1000vType'),
+    ((9, 90, 1), 'cevModuleCSR1000vRP'), ((9, 90, 2), 'cevModuleCSR1000vESP'), ((9, 91), 'cevModuleCgrType'),
+    ((9, 91, 18), 'cevModuleCGMPlc'), ((9, 91, 19), 'cevModuleCGMGe'), ((9, 91, 21), 'cevModuleCGM3gEVDOSE'),
+    ((9, 91, 22), 'cevModuleCGM3gEVDOVE'), ((9, 91, 23), 'cevModuleCGM3gHSPAAE'),
+    ((9, 91, 24), 'cevModuleCGM3gHSPAGE'), ((9, 91, 25), 'cevModuleCGM3gHspaAbGE'),
+    ((9, 91, 26), 'cevModuleCGM4gLteGA7304'), ((9, 91, 27), 'cevModuleCGM4gLteNA7354'),
+    ((9, 91, 28), 'cevModuleCGMServerX86C4F800'), ((9, 91, 29), 'cevModuleCGM4gLteNA7354MNAAB'),
+    ((9, 91, 30), 'cevModuleCGMServerX86C4F800D128'), ((9, 91, 31), 'cevModuleCGM4gLteLA7430'),
+    ((9, 91, 32), 'cevModuleCGM4gLteEA7455'), ((9, 92), 'cevModuleISR4400Type'), ((9, 92, 1), 'cevModuleISR4441RP'),
+    ((9, 92, 2), 'cevModuleISR4442RP'), ((9, 92, 3), 'cevModuleISR4451RP'), ((9, 92, 4), 'cevModuleISR4452RP'),
+    ((9, 92, 5), 'cevModuleISR4400RP'), ((9, 92, 6), 'cevModuleISR4441FP'), ((9, 92, 7), 'cevModuleISR4442FP'),
+    ((9, 92, 8), 'cevModuleISR4451FP'), ((9, 92, 9), 'cevModuleISR4452FP'), ((9, 92, 10), 'cevModuleISR4400FP'),
+    ((9, 92, 11), 'cevModuleISR4400NIM'), ((9, 92, 12), 'cevModuleISR4441NIM'), ((9, 92, 13), 'cevModuleISR4442NIM'),
+    ((9, 92, 14), 'cevModuleISR4451NIM'), ((9, 92, 15), 'cevModuleISR4452NIM'), ((9, 92, 16), 'cevModuleISR4400ESM'),
+    ((9, 92, 17), 'cevModuleISR4441ESM'), ((9, 92, 18), 'cevModuleISR4442ESM'), ((9, 92, 19), 'cevModuleISR4451ESM'),
+    ((9, 92, 20), 'cevModuleISR4452ESM'), ((9, 92, 21), 'cevModuleISR44000FP4xGE'),
+    ((9, 92, 22), 'cevModuleISR4400InternalPOE'), ((9, 92, 42), 'cevModuleISR4400ExternalPOE'),
+    ((9, 92, 43), 'cevModuleNGWICSerial1T'), ((9, 92, 44), 'cevModuleNGWICSerial2T'),
+    ((9, 92, 45), 'cevModuleNGWICSerial4T'), ((9, 92, 46), 'cevModuleISR4431RP'), ((9, 92, 47), 'cevModuleISR4431FP'),
+    ((9, 92, 48), 'cevModuleISR4431NIM'), ((9, 93), 'cevModuleQSFPPlusS'), ((9, 93, 1), 'cevQSFP40GLR4'),
+    ((9, 93, 2), 'cevQSFP40GSR4'), ((9, 93, 3), 'cevQSFP40GSMSR4'), ((9, 93, 4), 'cevQSFP40GCR4Active'),
+    ((9, 93, 5), 'cevQSFP40GCR4Passive'), ((9, 93, 6), 'cevSFPQSFP40GECSR4'), ((9, 93, 7), 'cevSFPQSFP40GELR4'),
+    ((9, 93, 8), 'cevQSFP40GSRBD'), ((9, 93, 9), 'cevQSFP40GER4'), ((9, 93, 10), 'cevQSFP40GSR4S'),
+    ((9, 93, 11), 'cevQSFP40GLR4LS'), ((9, 93, 12), 'cevQSFP40GLR4S'), ((9, 93, 13), 'cevQSFP4X10GLRS'),
+    ((9, 95), 'cevModuleN6KType'), ((9, 95, 1), 'cevN6KN6004XM20UP'), ((9, 95, 2), 'cevN6KC6004M12Q'),
+    ((9, 95, 3), 'cevN6KC600496QFixedModule'), ((9, 95, 4), 'cevN6KC6001M4Q'),
+    ((9, 95, 5), 'cevN6KC600164PFixedModule'), ((9, 95, 6), 'cevN6K48P10G'), ((9, 95, 7), 'cevN6K32Q40G'),
+    ((9, 95, 8), 'cevN6K24Q40G'), ((9, 95, 11), 'cevN6KC600164TFixedModule'), ((9, 95, 12), 'cevN6KN6002M24UP2Q'),
+    ((9, 95, 13), 'cevN6KN6002M24UP2Q16G'), ((9, 95, 15), 'cevN6KC6002128PFixedModule'),
+    ((9, 95, 16), 'cevN6KC600172UPFixedModule'), ((9, 95, 18), 'cevN6KN6004M12Q'), ((9, 95, 19), 'cevN6KC6001M6Q'),
+    ((9, 96), 'cevModuleISRType'), ((9, 96, 1), 'cevModuleISRSM1T3E3'), ((9, 96, 2), 'cevModuleISRSM6XGE'),
+    ((9, 96, 3), 'cevModuleISRSM1X10GE4XGE'), ((9, 96, 4), 'cevModuleISRSmEs3x16P'),
+    ((9, 96, 5), 'cevModuleISRSmEs3x24P'), ((9, 96, 6), 'cevModuleISRSmDEs3x48P'), ((9, 96, 7), 'cevModuleISRSSD'),
+    ((9, 96, 8), 'cevModuleISRMSM50'), ((9, 96, 9), 'cevModuleISRMSM100'), ((9, 96, 10), 'cevModuleISRMSM200'),
+    ((9, 96, 11), 'cevModuleISRMSM300'), ((9, 96, 12), 'cevModuleISRMSM400'), ((9, 96, 13), 'cevModuleISRExtNIM'),
+    ((9, 96, 14), 'cevModuleISRNIM1XGE'), ((9, 96, 15), 'cevModuleISRNIM2XGE'), ((9, 97), 'cevModuleN77Type'),
+    ((9, 97, 1), 'cevN77c7718Fab2'), ((9, 97, 2), 'cevN77c7710Fab2'), ((9, 97, 3), 'cevN77c7706Fab2'),
+    ((9, 97, 4), 'cevN77F248XP23E'), ((9, 97, 5), 'cevN77SUP2E'), ((9, 97, 6), 'cevN77F324FQ25'),
+    ((9, 97, 7), 'cevN77F348XP23'), ((9, 97, 8), 'cevN77F312CK26'), ((9, 98), 'cevModuleCat3KCAxType'),
+    ((9, 98, 1), 'cevModuleCat365048PQ'), ((9, 98, 2), 'cevModuleCat365048TQ'), ((9, 98, 3), 'cevModuleCat385024u'),
+    ((9, 98, 4), 'cevModuleCat385048u'), ((9, 98, 5), 'cevModuleCat365024TD'), ((9, 98, 6), 'cevModuleCat365048TD'),
+    ((9, 98, 7), 'cevModuleCat365024PD'), ((9, 98, 8), 'cevModuleCat365048PD'), ((9, 98, 9), 'cevModuleCat365024TS'),
+    ((9, 98, 10), 'cevModuleCat365048TS'), ((9, 98, 11), 'cevModuleCat365024PS'),
+    ((9, 98, 12), 'cevModuleCat365048PS'), ((9, 98, 13), 'cevModuleCat385024T'), ((9, 98, 14), 'cevModuleCat385048T'),
+    ((9, 98, 15), 'cevModuleCat385024P'), ((9, 98, 16), 'cevModuleCat385048P'), ((9, 98, 17), 'cevModuleCat385012S'),
+    ((9, 98, 18), 'cevModuleCat385024S'), ((9, 99), 'cevModule57xxwlc'), ((9, 99, 2), 'cevModuleCat5760wlc'),
+    ((9, 99, 3), 'cevModuleCat5700wlc'), ((9, 100), 'cevModuleN95KType'), ((9, 100, 1), 'cevN9KSUPA'),
+    ((9, 100, 2), 'cevN9Kc9508FM'), ((9, 100, 3), 'cevN9kScA'), ((9, 100, 4), 'cevN9kX9564PX'),
+    ((9, 100, 5), 'cevN9kX9564TX'), ((9, 100, 6), 'cevN9kX9636PQ'), ((9, 100, 13), 'cevN9KX9536PQ'),
+    ((9, 100, 14), 'cevN9Kc9516FM'), ((9, 100, 15), 'cevN9Kc9504FM'), ((9, 100, 18), 'cevN9KX9464PX'),
+    ((9, 100, 19), 'cevN9KX9464TX'), ((9, 100, 20), 'cevN9KX9432PQ'), ((9, 100, 21), 'cevN9KSUPB'),
+    ((9, 100, 22), 'cevN9KX9632PC'), ((9, 100, 23), 'cevN9KX9464TX2'), ((9, 100, 24), 'cevN9kC9508FM2'),
+    ((9, 100, 25), 'cevN9kC9504FM2'), ((9, 100, 26), 'cevN9KX9408PC'), ((9, 100, 27), 'cevN9KX9736Ce'),
+    ((9, 100, 28), 'cevN9KC9504FMe'), ((9, 100, 29), 'cevN9KC9508FMe'), ((9, 100, 32), 'cevN9KX9736CEX'),
+    ((9, 100, 35), 'cevN9KX9732CEX'), ((9, 101), 'cevModuleCPAKType'), ((9, 101, 1), 'cevCPAK100GLR4'),
+    ((9, 101, 2), 'cevCPAK100GSR10'), ((9, 101, 3), 'cevCPAK100GLR10'), ((9, 101, 4), 'cevCPAK100GER4L'),
+    ((9, 101, 5), 'cevCPAKUnknown'), ((9, 101, 6), 'cevCPAK10X10GLR'), ((9, 101, 7), 'cevCPAK100GSR4'),
+    ((9, 102), 'cevDirectAttachCable40Gs'), ((9, 102, 1), 'cevQSFP4SFP10GCU1M'), ((9, 102, 2), 'cevQSFP4SFP10GCU3M'),
+    ((9, 102, 3), 'cevQSFP4SFP10GCU5M'), ((9, 102, 4), 'cevQSFPH40GBCU1M'), ((9, 102, 5), 'cevQSFPH40GBCU3M'),
+    ((9, 102, 6), 'cevQSFPH40GBCU5M'), ((9, 102, 7), 'cevQSFPH40GBACU7M'), ((9, 102, 8), 'cevQSFPH40GBACU10M'),
+    ((9, 102, 9), 'cevQSFP4SFP10GACU7M'), ((9, 102, 10), 'cevQSFP4SFP10GACU10M'), ((9, 103), 'cevModuleN93KType'),
+    ((9, 103, 1), 'cevN9KM6PQ'), ((9, 103, 2), 'cevN9KM12PQ'), ((9, 103, 3), 'cevN9KC93128TXfixedModule'),
+    ((9, 103, 4), 'cevN9KC9396TXfixedModule'), ((9, 103, 5), 'cevN9KC9396PXfixedModule'),
+    ((9, 103, 7), 'cevN9KC9372PXfixedModule'), ((9, 103, 8), 'cevN9KC9372TXfixedModule'),
+    ((9, 103, 9), 'cevN9KC9332PQfixedModule'), ((9, 103, 10), 'cevN9KM4PC'), ((9, 103, 11), 'cevN9KM6PQE'),
+    ((9, 103, 16), 'cevN9KC93120TXFixedModule'), ((9, 104), 'cevModuleISR4300Type'),
+    ((9, 104, 1), 'cevModuleISR4351RP'), ((9, 104, 2), 'cevModuleISR4351FP'), ((9, 104, 3), 'cevModuleISR4351NIM'),
+    ((9, 104, 4), 'cevModuleISR4351ESM'), ((9, 104, 5), 'cevModuleISR4300FP3xGE'), ((9, 104, 6), 'cevModuleISR4331RP'),
+    ((9, 104, 7), 'cevModuleISR4331FP'), ((9, 104, 8), 'cevModuleISR4331NIM'), ((9, 104, 9), 'cevModuleISR4331ESM'),
+    ((9, 104, 10), 'cevModuleISR4321RP'), ((9, 104, 11), 'cevModuleISR4321FP'), ((9, 104, 12), 'cevModuleISR4321NIM'),
+    ((9, 104, 13), 'cevModuleISR4300FP2xGE'), ((9, 105), 'cevModuleNIMType'), ((9, 105, 1), 'cevModuleNIM1MftT1E1'),
+    ((9, 105, 2), 'cevModuleNIM2MftT1E1'), ((9, 105, 3), 'cevModuleNIM4MftT1E1'),
+    ((9, 105, 4), 'cevModuleNIM8MftT1E1'), ((9, 105, 5), 'cevModuleNIM1CE1T1PRI'),
+    ((9, 105, 6), 'cevModuleNIM2CE1T1PRI'), ((9, 105, 7), 'cevModuleNIM8CE1T1PRI'),
+    ((9, 105, 8), 'cevModuleNIMPVDM4c32'), ((9, 105, 9), 'cevModuleNIMPVDM4c64'),
+    ((9, 105, 10), 'cevModuleNIMPVDM4c128'), ((9, 105, 11), 'cevModuleNIMPVDM4c192'),
+    ((9, 105, 12), 'cevModuleNIMPVDM4c256'), ((9, 105, 13), 'cevModuleNIMSSD'), ((9, 105, 14), 'cevModuleNIMHDD'),
+    ((9, 105, 15), 'cevModuleNIM2FXS'), ((9, 105, 16), 'cevModuleNIM4FXS'), ((9, 105, 17), 'cevModuleNIM2FXO'),
+    ((9, 105, 18), 'cevModuleNIM4FXO'), ((9, 105, 19), 'cevModuleNIM2FXS4FXO'), ((9, 105, 20), 'cevModuleNIM2EM'),
+    ((9, 105, 21), 'cevModuleNIM4EM'), ((9, 105, 22), 'cevModuleNIM2BRI'), ((9, 105, 23), 'cevModuleNIM4BRI'),
+    ((9, 105, 25), 'cevModuleNIMVABAnnexA'), ((9, 105, 26), 'cevModuleNIMVAAnnexB'),
+    ((9, 105, 27), 'cevModuleNIMVABAnnexM'), ((9, 105, 31), 'cevModuleNIM16A'), ((9, 105, 32), 'cevModuleNIM24A'),
+    ((9, 106), 'cevModuleCXPType'), ((9, 106, 1), 'cevModuleCXP100GSR10'), ((9, 106, 2), 'cevModuleCXP100GSR12'),
+    ((9, 107), 'cevModuleASA5506Type'), ((9, 107, 1), 'cevModuleAsa5506SSD'), ((9, 107, 2), 'cevModuleAsa5506WSSD'),
+    ((9, 107, 3), 'cevModuleAsa5506K7SSD'), ((9, 107, 4), 'cevModuleAsa5506HSSD'), ((9, 108), 'cevModuleASA5508Type'),
+    ((9, 108, 1), 'cevModuleAsa5508SSD'), ((9, 108, 2), 'cevModuleAsa5508K7SSD'), ((9, 109), 'cevModuleCCEType'),
+    ((9, 109, 1), 'cevModuleCCESup'), ((9, 109, 2), 'cevModuleCCESupPic'), ((9, 109, 3), 'cevModuleCCESsi'),
+    ((9, 109, 4), 'cevModuleCCESsiPic'), ((9, 109, 5), 'cevModuleCCECbrRS422BaseRJ45'),
+    ((9, 109, 6), 'cevModuleCCECbrBNC'), ((9, 110), 'cevModuleWIMType'), ((9, 110, 3), 'cevModuleWIM1T'),
+    ((9, 110, 4), 'cevModuleWIM3G'), ((9, 113), 'cevModuleCFP2Type'), ((9, 113, 1), 'cevModuleCFP2ONSCFP2WDM'),
+    ((9, 113, 2), 'cevModuleCFP2100GER4'), ((9, 114), 'cevModuleN92KType'), ((9, 114, 1), 'cevN9KC9264PQ'),
+    ((9, 114, 2), 'cevN9KC9264PQfixedModule'), ((9, 115), 'cevModuleN9KType'),
+    ((9, 115, 1), 'cevN9KFabricExtenderConnectionCable'), ((9, 116), 'cevModuleFPRType'),
+    ((9, 116, 1), 'cevFPR9KSUPFixedModule'), ((9, 116, 2), 'cevFPRNetworkModule4X40G'),
+    ((9, 116, 3), 'cevFPRNetworkModule8X10G'), ((9, 116, 4), 'cevFPR4120SUPFixedModule'),
+    ((9, 116, 5), 'cevFPR4140SUPFixedModule'), ((9, 116, 7), 'cevFPR4110SUPFixedModule'),
+    ((9, 116, 8), 'cevFPRDNM2X100GF'), ((9, 116, 9), 'cevFPRDNM2X100G'), ((9, 116, 11), 'cevFPRNM6X10LRF'),
+    ((9, 116, 12), 'cevFPRNM6X10SRF'), ((9, 116, 13), 'cevFPRNM6X1SXF'), ((9, 117), 'cevModuleQSFP28'),
+    ((9, 117, 1), 'cevQSFP100GELR4'), ((9, 117, 2), 'cevQSFP100GESR4'), ((9, 117, 3), 'cevQSFP100GESR4S'),
+    ((9, 117, 4), 'cevQSFP100GELR4S'), ((9, 117, 5), 'cevQSFP100GEAOC10M'), ((9, 117, 6), 'cevQSFP28Unknown'),
+    ((9, 118), 'cevModuleQSFP28S'), ((9, 118, 1), 'cevQSFP100GSR4S'), ((9, 118, 2), 'cevQSFP100GCWDM4S'),
+    ((9, 118, 3), 'cevQSFP100GPSM4S'), ((9, 118, 4), 'cevQSFP100GLR4S'), ((9, 118, 5), 'cevQSFP100GAOC1M'),
+    ((9, 118, 6), 'cevQSFP100GAOC2M'), ((9, 118, 7), 'cevQSFP100GAOC3M'), ((9, 118, 8), 'cevQSFP100GAOC5M'),
+    ((9, 118, 9), 'cevQSFP100GAOC7M'), ((9, 118, 10), 'cevQSFP100GAOC10M'), ((9, 118, 11), 'cevQSFP100GAOC15M'),
+    ((9, 118, 12), 'cevQSFP100GAOC20M'), ((9, 118, 13), 'cevQSFP100GAOC25M'), ((9, 118, 14), 'cevQSFP100GAOC30M'),
+    ((9, 118, 15), 'cevQSFP100GCU1M'), ((9, 118, 16), 'cevQSFP100GCU2M'), ((9, 118, 17), 'cevQSFP100GCU3M'),
+    ((9, 118, 18), 'cevQSFP100GCU4M'), ((9, 118, 19), 'cevQSFP100GCU5M'), ((9, 118, 20), 'cevQSFP4SFP25GCU1M'),
+    ((9, 118, 21), 'cevQSFP4SFP25GCU2M'), ((9, 118, 22), 'cevQSFP4SFP25GCU3M'), ((9, 118, 23), 'cevQSFP4SFP25GCU4M'),
+    ((9, 118, 24), 'cevQSFP4SFP25GCU5M'), ((9, 118, 31), 'cevQSFP100GSMSR'), ((9, 118, 32), 'cevQSFPUnknown'),
+    ((9, 119), 'cevModuleNCS4K'), ((9, 119, 1), 'cevModuleNCS4216RSP'), ((9, 119, 2), 'cevModuleNCS420XRSP'),
+    ((9, 119, 4), 'cevModuleNCS4201RSP'), ((9, 120), 'cevModuleASA5516Type'), ((9, 120, 1), 'cevModuleAsa5516SSD'),
+    ((9, 121), 'cevModuleNCS1002'), ((9, 121, 1), 'cevModuleNCS1002RP0'), ((9, 122), 'cevModuleSFP25S'),
+    ((9, 122, 1), 'cevSFPH25GCU1M'), ((9, 122, 2), 'cevSFPH25GCU2M'), ((9, 122, 3), 'cevSFPH25GCU3M'),
+    ((9, 122, 4), 'cevSFPH25GCU5M'), ((10,), 'cevPort'), ((10, 1), 'cevPortUnknown'), ((10, 2), 'cevPortMCIEther'),
+    ((10, 3), 'cevPortMCISerial'), ((10, 4), 'cevPortCBusSerial'), ((10, 5), 'cevPortFddi'), ((10, 6), 'cevPortFddit'),
+    ((10, 7), 'cevPortCBusTR'), ((10, 8), 'cevPortAsync'), ((10, 9), 'cevPortHSSI'), ((10, 10), 'cevPortT1'),
+    ((10, 11), 'cevPortE1'), ((10, 12), 'cevPortBRI'), ((10, 13), 'cevPortAIP'), ((10, 14), 'cevPortCIP'),
+    ((10, 15), 'cevPortVtyAsync'), ((10, 16), 'cevPortFEIP'), ((10, 17), 'cevPortAsyncGroup'),
+    ((10, 18), 'cevPortVTemplate'), ((10, 19), 'cevPortVAccess'), ((10, 20), 'cevPortT3'),
+    ((10, 21), 'cevPortVGAnyLAN'), ((10, 22), 'cevPortLance'), ((10, 23), 'cevPortATMS2000'),
+    ((10, 24), 'cevPortSALI25'), ((10, 25), 'cevPortSonicT'), ((10, 26), 'cevPortOC3SUNI'),
+    ((10, 27), 'cevPortOC12SUNI'), ((10, 28), 'cevPortDS3SUNI'), ((10, 29), 'cevPortE3SUNI'),
+    ((10, 30), 'cevPortDS3SUNIQUAD'), ((10, 31), 'cevPortE3SUNIQUAD'), ((10, 32), 'cevPortMK5025'),
+    ((10, 33), 'cevPortTMS380'), ((10, 34), 'cevPortBSI'), ((10, 35), 'cevPortATMZR'), ((10, 36), 'cevPortHD64570'),
+    ((10, 37), 'cevPortPCBus'), ((10, 38), 'cevPortQuiccEther'), ((10, 39), 'cevPortQuiccSerial'),
+    ((10, 40), 'cevPortAMDP2'), ((10, 41), 'cevPortMIF68840'), ((10, 42), 'cevPortCYLEPA'),
+    ((10, 43), 'cevPortS4T68360'), ((10, 44), 'cevPortIBM2692'), ((10, 45), 'cevPortMueslix'),
+    ((10, 46), 'cevPortCD2430'), ((10, 47), 'cevPortILACC'), ((10, 48), 'cevPortNIC100'), ((10, 49), 'cevPortDCUATM'),
+    ((10, 50), 'cevPortDCUATMPort'), ((10, 51), 'cevPortTI1570'), ((10, 52), 'cevPortPOS'),
+    ((10, 53), 'cevPortLoopBack'), ((10, 54), 'cevPortLex'), ((10, 55), 'cevPortDialer'),
+    ((10, 56), 'cevPortCIPLANAdapter'), ((10, 57), 'cevPortBVI'), ((10, 58), 'cevPortOSPFVL'),
+    ((10, 59), 'cevPortRinconSwitch'), ((10, 60), 'cevPortSynALCATM'), ((10, 61), 'cevPortSynALCBIGA'),
+    ((10, 62), 'cevPortSwitchTrunk'), ((10, 63), 'cevPortC2KATM'), ((10, 64), 'cevPortDec21140A'),
+    ((10, 65), 'cevPortC5Ether'), ((10, 66), 'cevPortC5TR'), ((10, 69), 'cevPortEswitch'), ((10, 70), 'cevPortBITS'),
+    ((10, 71), 'cevPortAdslCap'), ((10, 72), 'cevPortAdslDmt'), ((10, 73), 'cevPortSdsl2b1q'),
+    ((10, 74), 'cevPortEscon'), ((10, 75), 'cevPortParallel'), ((10, 76), 'cevPortCipVirtual'),
+    ((10, 78), 'cevPortDs3'), ((10, 79), 'cevPortE3'), ((10, 80), 'cevPortOc3'), ((10, 82), 'cevPortHdvDsp'),
+    ((10, 83), 'cevPortAdslFlexiDmt'), ((10, 84), 'cevPortAdslFlexiCap'), ((10, 85), 'cevPortAdslDmtIsdn'),
+    ((10, 86), 'cevPortRfMac'), ((10, 87), 'cevPortRfUs'), ((10, 88), 'cevPortRfDs'), ((10, 89), 'cevPortUbrClk'),
+    ((10, 90), 'cevPortShdslTcpam'), ((10, 91), 'cevPortShdslTcpamOptis'), ((10, 100), 'cevPortGEIP'),
+    ((10, 101), 'cevPortWDM'), ((10, 102), 'cevPortThru'), ((10, 103), 'cevPortFilter'), ((10, 104), 'cevPortWave'),
+    ((10, 105), 'cevPortWavePatch'), ((10, 106), 'cevPortTransparent'), ((10, 107), 'cevPortDPT'),
+    ((10, 108), 'cevPortOc12'), ((10, 109), 'cevPortGe'), ((10, 110), 'cevPortChOc12'),
+    ((10, 111), 'cevPortChOc3Stm1'), ((10, 112), 'cevPortFilterGroup'), ((10, 113), 'cevPortFilterBand'),
+    ((10, 114), 'cevPortChE1T1'), ((10, 115), 'cevPortASIMod'), ((10, 116), 'cevPortASIIn'),
+    ((10, 117), 'cevPortASIOut'), ((10, 118), 'cevPortAimDsp'), ((10, 119), 'cevPortAtm'),
+    ((10, 120), 'cevPortChSonet'), ((10, 121), 'cevPortChOcX'), ((10, 123), 'cevPortFe'),
+    ((10, 125), 'cevPortDs3E3Atm'), ((10, 126), 'cevPortFxs'), ((10, 127), 'cevPortFxo'), ((10, 128), 'cevPortEM'),
+    ((10, 129), 'cevPortOc48'), ((10, 130), 'cevPortOc192'), ((10, 131), 'cevPortFibreChannel'),
+    ((10, 132), 'cevPortGigEthernet'), ((10, 133), 'cevPortFibreChGigEth'), ((10, 134), 'cevPortCatEthernet'),
+    ((10, 135), 'cevPortWaveOsc'), ((10, 136), 'cevPortWaveEthPhy'), ((10, 137), 'cevPort10GigEthPhy'),
+    ((10, 138), 'cevPortEsconPhy'), ((10, 139), 'cevPortGEFCPhy'), ((10, 140), 'cevPortVOAIn'),
+    ((10, 141), 'cevPortVOAOut'), ((10, 142), 'cevPortVOAFilterIn'), ((10, 143), 'cevPortVOAFilterOut'),
+    ((10, 144), 'cevPortVOAByPassIn'), ((10, 145), 'cevPortVOAByPassOut'), ((10, 146), 'cevPortGT96K'),
+    ((10, 147), 'cevPortDSCC4'), ((10, 150), 'cevPortBaseTEther'), ((10, 151), 'cevPortGESFP'),
+    ((10, 152), 'cevPortWdmSplit'), ((10, 153), 'cevPortWavePassThru'), ((10, 154), 'cevPortDspPVDM'),
+    ((10, 155), 'cevPortiScsi'), ((10, 156), 'cevPortVic2Did'), ((10, 157), 'cevPortWic1Adsl'),
+    ((10, 158), 'cevPortWic1Shdsl'), ((10, 159), 'cevPortWic1Ethernet'), ((10, 160), 'cevPort10GigBaseEX4'),
+    ((10, 161), 'cevPort10GigBaseLR'), ((10, 162), 'cevPort10GigBaseSX4'), ((10, 163), 'cevPort10GigBaseER'),
+    ((10, 164), 'cevPortGigUnsupported'), ((10, 165), 'cevPortGigBaseZX'), ((10, 166), 'cevPort10GigBaseCPX'),
+    ((10, 167), 'cevPort10GigBaseLX4'), ((10, 168), 'cevPortGigBaseLX'), ((10, 169), 'cevPortGigBaseSX'),
+    ((10, 170), 'cevPortGigBaseCX'), ((10, 171), 'cevPortGigBaseLH'), ((10, 172), 'cevPortGigBaseT'),
+    ((10, 173), 'cevPortDslsar'), ((10, 174), 'cevPortAtm25'), ((10, 175), 'cevPortAnalogFxs'),
+    ((10, 176), 'cevPortE3Atm'), ((10, 177), 'cevPortDs3Atm'), ((10, 178), 'cevPortNetworkAnalysis'),
+    ((10, 180), 'cevPortIntrusionDetect'), ((10, 181), 'cevPort10GigBaseLW'), ((10, 182), 'cevPort10GigBaseEW'),
+    ((10, 183), 'cevPortGigBaseUnknown'), ((10, 184), 'cevPort10GigBaseUnknown'),
+    ((10, 185), 'cevPort10GigBaseUnapproved'), ((10, 186), 'cevPortGigBaseWdmRxOnly'),
+    ((10, 187), 'cevPortGigBaseDwdm3033'), ((10, 188), 'cevPortGigBaseDwdm3112'),
+    ((10, 189), 'cevPortGigBaseDwdm3190'), ((10, 190), 'cevPortGigBaseDwdm3268'),
+    ((10, 191), 'cevPortGigBaseDwdm3425'), ((10, 192), 'cevPortGigBaseDwdm3504'),
+    ((10, 193), 'cevPortGigBaseDwdm3582'), ((10, 194), 'cevPortGigBaseDwdm3661'),
+    ((10, 195), 'cevPortGigBaseDwdm3819'), ((10, 196), 'cevPortGigBaseDwdm3898'),
+    ((10, 197), 'cevPortGigBaseDwdm3977'), ((10, 198), 'cevPortGigBaseDwdm4056'),
+    ((10, 199), 'cevPortGigBaseDwdm4214'), ((10, 200), 'cevPortGigBaseDwdm4294'),
+    ((10, 201), 'cevPortGigBaseDwdm4373'), ((10, 202), 'cevPortGigBaseDwdm4453'),
+    ((10, 203), 'cevPortGigBaseDwdm4612'), ((10, 204), 'cevPortGigBaseDwdm4692'),
+    ((10, 205), 'cevPortGigBaseDwdm4772'), ((10, 206), 'cevPortGigBaseDwdm4851'),
+    ((10, 207), 'cevPortGigBaseDwdm5012'), ((10, 208), 'cevPortGigBaseDwdm5092'),
+    ((10, 209), 'cevPortGigBaseDwdm5172'), ((10, 210), 'cevPortGigBaseDwdm5252'),
+    ((10, 211), 'cevPortGigBaseDwdm5413'), ((10, 212), 'cevPortGigBaseDwdm5494'),
+    ((10, 213), 'cevPortGigBaseDwdm5575'), ((10, 214), 'cevPortGigBaseDwdm5655'),
+    ((10, 215), 'cevPortGigBaseDwdm5817'), ((10, 216), 'cevPortGigBaseDwdm5898'),
+    ((10, 217), 'cevPortGigBaseDwdm5979'), ((10, 218), 'cevPortGigBaseDwdm6061'),
+    ((10, 219), 'cevPort10GigBaseWdmRxOnly'), ((10, 220), 'cevPort10GigBaseDwdm3033'),
+    ((10, 221), 'cevPort10GigBaseDwdm3112'), ((10, 222), 'cevPort10GigBaseDwdm3190'),
+    ((10, 223), 'cevPort10GigBaseDwdm3268'), ((10, 224), 'cevPort10GigBaseDwdm3425'),
+    ((10, 225), 'cevPort10GigBaseDwdm3504'), ((10, 226), 'cevPort10GigBaseDwdm3582'),
+    ((10, 227), 'cevPort10GigBaseDwdm3661'), ((10, 228), 'cevPort10GigBaseDwdm3819'),
+    ((10, 229), 'cevPort10GigBaseDwdm3898'), ((10, 230), 'cevPort10GigBaseDwdm3977'),
+    ((10, 231), 'cevPort10GigBaseDwdm4056'), ((10, 232), 'cevPort10GigBaseDwdm4214'),
+    ((10, 233), 'cevPort10GigBaseDwdm4294'), ((10, 234), 'cevPort10GigBaseDwdm4373'),
+    ((10, 235), 'cevPort10GigBaseDwdm4453'), ((10, 236), 'cevPort10GigBaseDwdm4612'),
+    ((10, 237), 'cevPort10GigBaseDwdm4692'), ((10, 238), 'cevPort10GigBaseDwdm4772'),
+    ((10, 239), 'cevPort10GigBaseDwdm4851'), ((10, 240), 'cevPort10GigBaseDwdm5012'),
+    ((10, 241), 'cevPort10GigBaseDwdm5092'), ((10, 242), 'cevPort10GigBaseDwdm5172'),
+    ((10, 243), 'cevPort10GigBaseDwdm5252'), ((10, 244), 'cevPort10GigBaseDwdm5413'),
+    ((10, 245), 'cevPort10GigBaseDwdm5494'), ((10, 246), 'cevPort10GigBaseDwdm5575'),
+    ((10, 247), 'cevPort10GigBaseDwdm5655'), ((10, 248), 'cevPort10GigBaseDwdm5817'),
+    ((10, 249), 'cevPort10GigBaseDwdm5898'), ((10, 250), 'cevPort10GigBaseDwdm5979'),
+    ((10, 251), 'cevPort10GigBaseDwdm6061'), ((10, 252), 'cevPortGigBaseBX10D'), ((10, 253), 'cevPortGigBaseBX10U'),
+    ((10, 254), 'cevPortT1E1'), ((10, 255), 'cevPort2GFCPhy'), ((10, 256), 'cevPortLanWirelessApplication'),
+    ((10, 257), 'cevPortSEInternalFE'), ((10, 258), 'cevPortCEInternalFE'), ((10, 259), 'cevPortIpsecVpn'),
+    ((10, 260), 'cevPortSsl'), ((10, 261), 'cevPortFirewall'), ((10, 263), 'cevPortDsp5441'),
+    ((10, 264), 'cevPortDsp6415'), ((10, 265), 'cevPortHwicSerial'), ((10, 266), 'cevPortAsi'),
+    ((10, 267), 'cevPortQam'), ((10, 268), 'cevPortGigBaseBT'), ((10, 269), 'cevPort100BaseUnknown'),
+    ((10, 270), 'cevPort100BaseUnapproved'), ((10, 271), 'cevPort100BaseBX10D'), ((10, 272), 'cevPort100BaseBX10U'),
+    ((10, 273), 'cevPort100BaseFX'), ((10, 274), 'cevPort100BaseLX10'), ((10, 275), 'cevPort100BaseSX'),
+    ((10, 276), 'cevPortSM'), ((10, 277), 'cevPortT3E3'), ((10, 278), 'cevPortMultiRate'),
+    ((10, 279), 'cevPortWaveSonetPhy'), ((10, 280), 'cevPortSDCC'), ((10, 281), 'cevPortAdslAnnexA'),
+    ((10, 282), 'cevPortAdslAnnexB'), ((10, 285), 'cevPort10GigBaseZR'), ((10, 286), 'cevPort10GigBaseCX4'),
+    ((10, 287), 'cevPort10GigBaseSR'), ((10, 288), 'cevPortGigBaseCwdm1610'), ((10, 289), 'cevPortGigBaseCwdm1590'),
+    ((10, 290), 'cevPortGigBaseCwdm1550'), ((10, 291), 'cevPortGigBaseCwdm1530'),
+    ((10, 292), 'cevPortGigBaseCwdm1510'), ((10, 293), 'cevPortGigBaseCwdm1490'),
+    ((10, 294), 'cevPortGigBaseCwdm1470'), ((10, 295), 'cevPortGigBaseCwdm1570'), ((10, 296), 'cevPortUSB'),
+    ((10, 297), 'cevPortSslVpn'), ((10, 298), 'cevPortCableModem'), ((10, 299), 'cevNmeApaPort'),
+    ((10, 300), 'cevPort10GigBase'), ((10, 301), 'cevPort10GigBaseLRM'), ((10, 302), 'cevPortdot11abg'),
+    ((10, 303), 'cevPortDti'), ((10, 304), 'cevPort10GigSFPPlus'), ((10, 305), 'cevPortCscPort'),
+    ((10, 306), 'cevPortGEXFP'), ((10, 307), 'cevPortGigBaseDwdm6141'), ((10, 308), 'cevPortGigBaseDwdm5736'),
+    ((10, 309), 'cevPortGigBaseDwdm5332'), ((10, 310), 'cevPortGigBaseDwdm4931'),
+    ((10, 311), 'cevPortGigBaseDwdm4532'), ((10, 312), 'cevPortGigBaseDwdm4134'),
+    ((10, 313), 'cevPortGigBaseDwdm3739'), ((10, 314), 'cevPortGigBaseDwdm3346'), ((10, 315), 'cevPort10GigEthernet'),
+    ((10, 316), 'cevPortSEInternal'), ((10, 317), 'cevPortGigBaseEX'), ((10, 318), 'cevPort40GigEthernet'),
+    ((10, 319), 'cevPortAces'), ((10, 320), 'cevPort100GigEthernet'), ((10, 321), 'cevPort40GigQSFPPlus'),
+    ((10, 322), 'cevPort100GECFP'), ((10, 323), 'cevPortPlcG'), ((10, 324), 'cevPortWimaxG'),
+    ((10, 325), 'cevPort3gCdmaG'), ((10, 326), 'cevPort3gGsmG'), ((10, 327), 'cevPortWpanG'),
+    ((10, 328), 'cevPortDsp'), ((10, 331), 'cevPortCXP'), ((10, 332), 'cevPortCPAK'), ((10, 333), 'cevPortConsole'),
+    ((10, 334), 'cevPortAlarmDSUB15'), ((10, 337), 'cevPortSseBreakout100GePort'),
+    ((10, 338), 'cevPortSseBreakout10GePort'), ((10, 339), 'cevPortCisco10GeSFPPlusPOZR'),
+    ((10, 340), 'cevPortCisco10GeSFPPlusPOER'), ((10, 341), 'cevPortCisco10GeSFPPlusPOSRX'),
+    ((10, 342), 'cevPortCisco10GeSFPPlusPOLRX'), ((10, 343), 'cevPortCisco10GeSFPPlusPOLR'),
+    ((10, 344), 'cevPortCisco10GeSFPPlusPOSR'), ((10, 346), 'cevPortPHwicSerial'), ((10, 347), 'cevPortPT1E1'),
+    ((10, 348), 'cevPortPHdvDsp'), ((10, 350), 'cevPortSerial'), ((10, 351), 'cevPortCPAKLR10'),
+    ((10, 352), 'cevPortAdslAnnexM'), ((10, 354), 'cevPortNCS4KUSB'), ((10, 355), 'cevPortNCS4KGigEthernet'),
+    ((10, 356), 'cevPortNCS4KDWDMOptical'), ((10, 359), 'cevPort25GigEthernet'), ((11,), 'cevStack'),
+    ((11, 1), 'cevStackUnknown'), ((11, 2), 'cevStackCat37xx'), ((11, 3), 'cevCat65xxVirtualSwitch'),
+    ((11, 5), 'cevCbs3120Stack'), ((11, 11), 'cevC29xxStack'), ((11, 12), 'cevStackIosXrMultichassis'),
+    ((11, 13), 'cevStackCat4xxxVirtualSwitchStack'), ((11, 14), 'cevStackFex'), ((11, 20), 'cevStackC68xxVirSwitch'),
+    ((11, 21), 'cevC35xxStack'), ((12,), 'cevMidplane'), ((12, 1), 'cevMidplaneUmg9820'), ((13,), 'cevTCAMType'),
+)
@@ -0,0 +1,244 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""Single pass parsers of ASA show command outputs.
+
+Every parser takes an iterable of output lines and yields a dict per record once the record is complete.
+CLI service returns whole command outputs, iter_lines walks them without splitting into a list of lines.
+"""
+
+import re
+
+INVENTORY_NAME_PATTERN = re.compile(r'^\s*Name:\s*"(?P<name>[^"]*)"\s*,\s*DESCR:\s*"(?P<description>[^"]*)"')
+INVENTORY_PID_PATTERN = re.compile(r'^\s*PID:\s*(?P<pid>[^,]*?)\s*,\s*VID:\s*(?P<vid>[^,]*?)\s*,'
+                                   r'\s*SN:\s*(?P<serial_number>\S*)')
+INTERFACE_PATTERN = re.compile(r'^Interface\s+(?P<name>\S+)\s+"(?P<nameif>[^"]*)",\s*is\s+(?P<status>[^,]+)')
+HARDWARE_PATTERN = re.compile(r'^\s*Hardware is\s+(?P<hardware>[^,]+)'
+                              r'(,\s*BW\s+(?P<bandwidth>\d+)\s*(?P<unit>[KMG])bps)?')
+DESCRIPTION_PATTERN = re.compile(r'^\s*Description:\s*(?P<description>.*?)\s*$')
+MAC_MTU_PATTERN = re.compile(r'^\s*MAC address\s+(?P<mac>[0-9a-fA-F.:]+),\s*MTU\s+(?P<mtu>\d+|not set)')
+DUPLEX_PATTERN = re.compile(r'(?P<duplex>Full|Half)-Duplex', re.IGNORECASE)
+IPV4_PATTERN = re.compile(r'^\s*IP address\s+(?P<address>\d+\.\d+\.\d+\.\d+)')
+IPV6_HEADER_PATTERN = re.compile(r'^\s*IPv6 global unicast address\(es\):')
+IPV6_PATTERN = re.compile(r'^\s*(?P<address>[0-9a-fA-F:]*:[0-9a-fA-F:]*),\s*subnet is')
+NAMEIF_PATTERN = re.compile(r'^(?P<name>[A-Za-z][\w\-]*\d[\w/.:\-]*)\s+(?P<nameif>\S+)\s+(?P<security_level>\d+)\s*$')
+PORT_CHANNEL_PATTERN = re.compile(r'^\s*(?P<group>\d+)\s+Po(?P<channel>\d+)\((?P<flags>\w+)\)\s+(?P<protocol>\S+)'
+                                  r'(\s+(?P<span_cluster>Yes|No))?(?P<ports>.*)$')
+PORT_CHANNEL_MEMBER_PATTERN = re.compile(r'(?P<name>[A-Za-z][\w\-]*\d[\w/.:]*)\((?P<flags>\w+)\)')
+CONTEXT_PATTERN = re.compile(r'^(?P<current>[* ])?(?P<name>[^\s*]+)\s+(?P<class>\S+)\s+(?P<interfaces>.*?)\s*'
+                             r'(?P<mode>Routed|Transparent)\s+(?P<url>\S+)\s*$', re.IGNORECASE)
+CONTEXT_INTERFACES_PATTERN = re.compile(r'^\s+(?P<interfaces>[A-Za-z][^\s,]*((\s*,\s*|\s+)[^\s,]+)*),?\s*$')
+VERSION_PATTERN = re.compile(r'Version\s+(?P<version>[^\s,]+)')
+HOSTNAME_PATTERN = re.compile(r'^(?P<hostname>\S+)\s+up\s+')
+SHOW_HOSTNAME_PATTERN = re.compile(r'^\s*(?P<hostname>[^\s#>]+)\s*$')
+HARDWARE_MODEL_PATTERN = re.compile(r'^Hardware:\s*(?P<model>[^,\s]+)')
+SERIAL_NUMBER_PATTERN = re.compile(r'^Serial Number:\s*(?P<serial_number>\S+)')
+
+
+def iter_lines(output):
+    """Iterate over lines of the command output without splitting the whole buffer at once
+
+    :param output: command output
+    """
+
+    position = 0
+    length = len(output)
+    while position < length:
+        end = output.find('\n', position)
+        if end < 0:
+            end = length
+        yield output[position:end].rstrip('\r')
+        position = end + 1
+
+
+def parse_inventory(lines):
+    """Parse 'show inventory' output
+
+    :param lines: output lines
+    :return: generator of dicts with name, description, pid, vid and serial_number
+    """
+
+    record = None
+    for line in lines:
+        match = INVENTORY_NAME_PATTERN.match(line)
+        if match:
+            if record:
+                yield record
+            record = {'name': match.group('name').strip(), 'description': match.group('description').strip(),
+                      'pid': '', 'vid': '', 'serial_number': ''}
+            continue
+        match = INVENTORY_PID_PATTERN.match(line)
+        if match and record:
+            record.update((key, '' if value in ('N/A', None) else value)
+                          for key, value in match.groupdict().iteritems())
+            yield record
+            record = None
+    if record:
+        yield record
+
+
+def parse_interfaces(lines):
+    """Parse 'show interface' output
+
+    :param lines: output lines
+    :return: generator of dicts with name, nameif, status, hardware, bandwidth in bps, description, mac, mtu,
+        duplex, auto_negotiation, ipv4_address and ipv6_address lists
+    """
+
+    record = None
+    ipv6_block = False
+    for line in lines:
+        match = INTERFACE_PATTERN.match(line)
+        if match:
+            if record:
+                yield record
+            record = {'name': match.group('name'), 'nameif': match.group('nameif'),
+                      'status': match.group('status').strip(), 'hardware': '', 'bandwidth': 0, 'description': '',
+                      'mac': '', 'mtu': 0, 'duplex': 'Full', 'auto_negotiation': 'False', 'ipv4_address': [],
+                      'ipv6_address': []}
+            ipv6_block = False
+            continue
+        if record is None:
+            continue
+
+        if ipv6_block:
+            match = IPV6_PATTERN.match(line)
+            if match:
+                record['ipv6_address'].append(match.group('address'))
+                continue
+            ipv6_block = False
+
+        match = HARDWARE_PATTERN.match(line)
+        if match:
+            record['hardware'] = match.group('hardware').strip()
+            if match.group('bandwidth'):
+                record['bandwidth'] = int(match.group('bandwidth')) * {'K': 10 ** 3, 'M': 10 ** 6,
+                                                                       'G': 10 ** 9}[match.group('unit')]
+            continue
+        match = DESCRIPTION_PATTERN.match(line)
+        if match:
+            record['description'] = match.group('description')
+            continue
+        match = MAC_MTU_PATTERN.match(line)
+        if match:
+            record['mac'] = match.group('mac')
+            record['mtu'] = int(match.group('mtu')) if match.group('mtu').isdigit() else 0
+            continue
+        match = IPV4_PATTERN.match(line)
+        if match:
+            record['ipv4_address'].append(match.group('address'))
+            continue
+        if IPV6_HEADER_PATTERN.match(line):
+            ipv6_block = True
+            continue
+        if 'Duplex' in line or 'duplex' in line:
+            match = DUPLEX_PATTERN.search(line)
+            if match:
+                record['duplex'] = match.group('duplex').capitalize()
+            if 'Auto-Duplex' in line or 'Auto-Speed' in line:
+                record['auto_negotiation'] = 'True'
+    if record:
+        yield record
+
+
+def parse_nameif(lines):
+    """Parse 'show nameif' output
+
+    :param lines: output lines
+    :return: generator of dicts with name, nameif and security_level
+    """
+
+    for line in lines:
+        match = NAMEIF_PATTERN.match(line.strip())
+        if match:
+            yield {'name': match.group('name'), 'nameif': match.group('nameif'),
+                   'security_level': int(match.group('security_level'))}
+
+
+def parse_port_channel_summary(lines):
+    """Parse 'show port-channel summary' output, member lists wrapped to the next lines are joined
+
+    :param lines: output lines
+    :return: generator of dicts with group, channel, protocol and members list of (abbreviated name, flags)
+    """
+
+    record = None
+    for line in lines:
+        match = PORT_CHANNEL_PATTERN.match(line)
+        if match:
+            if record:
+                yield record
+            record = {'group': int(match.group('group')), 'channel': int(match.group('channel')),
+                      'protocol': match.group('protocol'),
+                      'members': PORT_CHANNEL_MEMBER_PATTERN.findall(match.group('ports'))}
+            continue
+        if record and line[:1].isspace() and PORT_CHANNEL_MEMBER_PATTERN.search(line):
+            record['members'].extend(PORT_CHANNEL_MEMBER_PATTERN.findall(line))
+        elif record:
+            yield record
+            record = None
+    if record:
+        yield record
+
+
+def parse_contexts(lines):
+    """Parse 'show context' output, interface lists wrapped to the next lines are joined
+
+    :param lines: output lines
+    :return: generator of dicts with name, current flag, class, interfaces list, mode and url
+    """
+
+    record = None
+    for line in lines:
+        match = CONTEXT_PATTERN.match(line)
+        if match:
+            if record:
+                yield record
+            record = {'name': match.group('name'), 'current': match.group('current') == '*',
+                      'class': match.group('class'), 'interfaces': re.findall(r'[^\s,]+', match.group('interfaces')),
+                      'mode': match.group('mode').capitalize(), 'url': match.group('url')}
+            continue
+        match = CONTEXT_INTERFACES_PATTERN.match(line)
+        if record and match:
+            record['interfaces'].extend(re.findall(r'[^\s,]+', match.group('interfaces')))
+        elif record:
+            yield record
+            record = None
+    if record:
+        yield record
+
+
+def parse_version(lines):
+    """Parse 'show version' output
+
+    :param lines: output lines
+    :rtype: dict
+    :return: version, hostname, model and serial_number
+    """
+
+    result = {'version': '', 'hostname': '', 'model': '', 'serial_number': ''}
+    for line in lines:
+        for key, pattern, search in (('version', VERSION_PATTERN, True), ('hostname', HOSTNAME_PATTERN, False),
+                                     ('model', HARDWARE_MODEL_PATTERN, False),
+                                     ('serial_number', SERIAL_NUMBER_PATTERN, False)):
+            if result[key]:
+                continue
+            match = pattern.search(line) if search else pattern.match(line)
+            if match:
+                result[key] = match.group(key)
+    return result
+
+
+def parse_hostname(lines):
+    """Parse 'show hostname' output, the echoed command and the prompt are skipped
+
+    :param lines: output lines
+    :rtype: str
+    :return: hostname or empty string
+    """
+
+    for line in lines:
+        match = SHOW_HOSTNAME_PATTERN.match(line)
+        if match:
+            return match.group('hostname')
+    return ''
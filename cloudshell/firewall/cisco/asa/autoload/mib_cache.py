@@ -0,0 +1,114 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import hashlib
+import imp
+import marshal
+import os
+import tempfile
+
+from pysnmp.smi.builder import DirMibSource
+
+from cloudshell.firewall.cisco.asa.autoload.cache_directory import ensure_private_directory, get_cache_path, is_own_file
+
+
+class CachedDirMibSource(DirMibSource):
+    """Pysnmp directory MIB source which keeps compiled MIB modules in an on-disk cache.
+
+    Every MIB module is a python file, which pysnmp compiles on each load. Compiled code is stored
+    in cache_path under the module name and sha1 of the module source, so a changed MIB file
+    gets a new cache entry and stale entries of the same module are removed.
+    Cache is marshalled code, so it's only used if cache_path is a directory private to the current user,
+    otherwise modules are compiled from the sources.
+    """
+
+    CACHE_SUFFIX = '.mibc'
+    SOURCE_SUFFIX = '.py'
+
+    def __init__(self, srcName, cache_path=None):
+        DirMibSource.__init__(self, srcName)
+        self._cache_path = cache_path or get_cache_path('mibs')
+        self._cache_private = None
+        self._magic = imp.get_magic()
+        self._checksums = {}
+
+    @property
+    def cache_path(self):
+        return self._cache_path
+
+    @property
+    def cache_private(self):
+        """Cache directory is created if it's missing and checked once"""
+
+        if self._cache_private is None:
+            self._cache_private = ensure_private_directory(self._cache_path)
+        return self._cache_private
+
+    def read(self, f):
+        source_name = f + self.SOURCE_SUFFIX
+        try:
+            source = self._getData(source_name, 'r')
+        except IOError:
+            return DirMibSource.read(self, f)
+
+        if not self.cache_private:
+            return compile(source, self.fullPath(f, self.SOURCE_SUFFIX), 'exec'), self.SOURCE_SUFFIX
+
+        checksum = self._get_checksum(source_name, source)
+        cache_file = os.path.join(self._cache_path, '{0}-{1}{2}'.format(f, checksum, self.CACHE_SUFFIX))
+        code = self._read_cache(cache_file)
+        if code is None:
+            code = compile(source, self.fullPath(f, self.SOURCE_SUFFIX), 'exec')
+            self._write_cache(f, cache_file, code)
+        return code, self.SOURCE_SUFFIX
+
+    def _get_checksum(self, source_name, source):
+        """Sha1 of the module source, memoized per file size and mtime
+
+        :param source_name: module file name
+        :param source: module source
+        :rtype: str
+        """
+
+        try:
+            stat = os.stat(os.path.join(self._srcName, source_name))
+            key = (source_name, stat.st_size, stat.st_mtime)
+        except OSError:
+            key = None
+        if key not in self._checksums:
+            self._checksums[key] = hashlib.sha1(source).hexdigest()
+        return self._checksums[key]
+
+    def _read_cache(self, cache_file):
+        try:
+            with open(cache_file, 'rb') as cache:
+                if not is_own_file(cache):
+                    return None
+                data = cache.read()
+        except (IOError, OSError):
+            return None
+        if data[:len(self._magic)] != self._magic:
+            return None
+        try:
+            return marshal.loads(data[len(self._magic):])
+        except (EOFError, ValueError, TypeError):
+            return None
+
+    def _write_cache(self, module_name, cache_file, code):
+        """Store compiled module atomically and drop entries built from older module versions
+
+        Cache write failures are not fatal, module is just compiled again on the next load.
+        """
+
+        try:
+            prefix = module_name + '-'
+            for name in os.listdir(self._cache_path):
+                if name.startswith(prefix) and name.endswith(self.CACHE_SUFFIX) \
+                        and name[len(prefix):-len(self.CACHE_SUFFIX)].isalnum():
+                    os.remove(os.path.join(self._cache_path, name))
+            fd, temp_file = tempfile.mkstemp(dir=self._cache_path, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as cache:
+                cache.write(self._magic + marshal.dumps(code))
+            os.rename(temp_file, cache_file)
+        except (IOError, OSError):
+            pass
@@ -0,0 +1,102 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from array import array
+
+
+class OidTrie(object):
+    """Read-only trie over OID arcs kept in flat arrays.
+
+    Nodes are stored breadth first, children of a node take a contiguous run sorted by arc,
+    so a lookup is a binary search per arc and a node costs three array slots and a value reference
+    instead of a Python object per MIB symbol.
+    """
+
+    def __init__(self, items=()):
+        """Build trie from (oid, value) pairs
+
+        :param items: iterable of (tuple of arcs, value), value None is not stored
+        """
+
+        tree = {}
+        for oid, value in items:
+            if not oid:
+                continue
+            children = tree
+            for arc in oid[:-1]:
+                children = children.setdefault(arc, [None, {}])[1]
+            children.setdefault(oid[-1], [None, {}])[0] = value
+
+        self._arcs = array('L', [0])
+        self._first_child = array('l', [0])
+        self._child_count = array('l', [0])
+        self._values = [None]
+        self._size = 0
+        level = [(0, tree)]
+        while level:
+            next_level = []
+            for node_id, children in level:
+                self._first_child[node_id] = len(self._arcs)
+                self._child_count[node_id] = len(children)
+                for arc in sorted(children):
+                    value, grand_children = children[arc]
+                    next_level.append((len(self._arcs), grand_children))
+                    self._arcs.append(arc)
+                    self._first_child.append(0)
+                    self._child_count.append(0)
+                    self._values.append(value)
+                    if value is not None:
+                        self._size += 1
+            level = next_level
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, oid):
+        return self.get(oid) is not None
+
+    def _find_child(self, node_id, arc):
+        low = self._first_child[node_id]
+        high = low + self._child_count[node_id]
+        while low < high:
+            middle = (low + high) // 2
+            if self._arcs[middle] < arc:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._first_child[node_id] + self._child_count[node_id] and self._arcs[low] == arc:
+            return low
+        return None
+
+    def get(self, oid, default=None):
+        """Get value stored exactly at oid
+
+        :param oid: tuple of arcs
+        :return: value or default
+        """
+
+        node_id = 0
+        for arc in oid:
+            node_id = self._find_child(node_id, arc)
+            if node_id is None:
+                return default
+        value = self._values[node_id]
+        return default if value is None else value
+
+    def prefixes(self, oid):
+        """Get values stored on the path to oid, from the shortest prefix to the longest one
+
+        :param oid: tuple of arcs
+        :rtype: list
+        :return: list of (prefix length, value)
+        """
+
+        result = []
+        node_id = 0
+        for depth, arc in enumerate(oid, 1):
+            node_id = self._find_child(node_id, arc)
+            if node_id is None:
+                break
+            if self._values[node_id] is not None:
+                result.append((depth, self._values[node_id]))
+        return result
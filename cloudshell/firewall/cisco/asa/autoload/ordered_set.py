@@ -0,0 +1,39 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from collections import MutableSet, OrderedDict
+
+
+class OrderedSet(MutableSet):
+    """Set which keeps insertion order, provides constant time membership check and removal.
+    Supports list style append, so it can replace lists used for discovery bookkeeping
+    """
+
+    def __init__(self, iterable=None):
+        self._items = OrderedDict()
+        if iterable:
+            for item in iterable:
+                self.add(item)
+
+    def __contains__(self, item):
+        return item in self._items
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __reversed__(self):
+        return reversed(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return '{0}({1})'.format(self.__class__.__name__, list(self))
+
+    def add(self, item):
+        self._items[item] = None
+
+    append = add
+
+    def discard(self, item):
+        self._items.pop(item, None)
@@ -0,0 +1,229 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import hashlib
+import marshal
+import os
+import tempfile
+import time
+import zlib
+
+from cloudshell.firewall.cisco.asa.autoload.cache_directory import ensure_private_directory, get_cache_path, is_own_file
+from cloudshell.shell.core.driver_context import AutoLoadDetails, AutoLoadResource, AutoLoadAttribute
+
+
+class Snapshot(object):
+    """AutoLoadDetails of the resource with metadata saved along with it"""
+
+    def __init__(self, resource_key, snapshot_id, timestamp, autoload_details, metadata):
+        self.resource_key = resource_key
+        self.snapshot_id = snapshot_id
+        self.timestamp = timestamp
+        self.autoload_details = autoload_details
+        self.metadata = metadata
+
+
+class SnapshotStore(object):
+    """On-disk store of AutoLoadDetails snapshots, a folder per resource and a file per snapshot.
+
+    Snapshot file is MAGIC, marshalled header (format version, resource key, timestamp, resource and attribute
+    counts) and zlib compressed marshalled body. Body keeps every distinct value once in a string table,
+    resources and attributes are flat tuples of string table positions, so repeated attribute names,
+    relative addresses and values cost a few bytes each.
+    Store path must be a directory private to the driver user, snapshots are not saved or loaded otherwise.
+    """
+
+    MAGIC = 'ASASNAP'
+    FORMAT_VERSION = 1
+    SNAPSHOT_SUFFIX = '.snapshot'
+
+    def __init__(self, store_path=None):
+        self._store_path = store_path or get_cache_path('autoload')
+
+    @property
+    def store_path(self):
+        return self._store_path
+
+    def _get_resource_path(self, resource_key):
+        if isinstance(resource_key, unicode):
+            resource_key = resource_key.encode('utf-8')
+        return os.path.join(self._store_path, hashlib.sha1(resource_key).hexdigest())
+
+    def is_private(self):
+        """Create store directory if it's missing and check it's private to the driver user
+
+        :rtype: bool
+        """
+
+        return ensure_private_directory(self._store_path)
+
+    def save(self, resource_key, autoload_details, metadata=None):
+        """Save snapshot of the resource
+
+        :param resource_key: resource identifier, i.e. resource name and address
+        :param autoload_details: AutoLoadDetails
+        :param metadata: marshallable data stored with the snapshot, i.e. dict of str, int, tuple, list, dict
+        :rtype: str
+        :return: snapshot id
+        """
+
+        strings = []
+        string_index = {}
+
+        def intern(value):
+            key = (type(value), value)
+            if key not in string_index:
+                string_index[key] = len(strings)
+                strings.append(value)
+            return string_index[key]
+
+        resources = []
+        for resource in autoload_details.resources:
+            resources.extend((intern(resource.model), intern(resource.name), intern(resource.relative_address),
+                              intern(resource.unique_identifier)))
+        attributes = []
+        for attribute in autoload_details.attributes:
+            attributes.extend((intern(attribute.relative_address), intern(attribute.attribute_name),
+                               intern(attribute.attribute_value)))
+
+        timestamp = time.time()
+        snapshot_id = '{0:017.6f}'.format(timestamp)
+        header = (self.FORMAT_VERSION, resource_key, timestamp, len(autoload_details.resources),
+                  len(autoload_details.attributes))
+        body = zlib.compress(marshal.dumps((tuple(strings), tuple(resources), tuple(attributes), metadata)))
+
+        if not self.is_private():
+            raise Exception(self.__class__.__name__,
+                            'Snapshot store {0} is not a directory private to the driver user'.format(self._store_path))
+        resource_path = self._get_resource_path(resource_key)
+        if not os.path.isdir(resource_path):
+            os.makedirs(resource_path, 0o700)
+        fd, temp_file = tempfile.mkstemp(dir=resource_path, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as snapshot_file:
+                snapshot_file.write(self.MAGIC)
+                marshal.dump(header, snapshot_file)
+                snapshot_file.write(body)
+            os.rename(temp_file, os.path.join(resource_path, snapshot_id + self.SNAPSHOT_SUFFIX))
+        except Exception:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            raise
+        return snapshot_id
+
+    def _read_header(self, snapshot_file):
+        if snapshot_file.read(len(self.MAGIC)) != self.MAGIC:
+            return None
+        header = marshal.load(snapshot_file)
+        if not isinstance(header, tuple) or not header or header[0] != self.FORMAT_VERSION:
+            return None
+        return header
+
+    def _get_snapshot_ids(self, resource_path):
+        try:
+            file_names = os.listdir(resource_path)
+        except OSError:
+            return []
+        return sorted((file_name[:-len(self.SNAPSHOT_SUFFIX)] for file_name in file_names
+                       if file_name.endswith(self.SNAPSHOT_SUFFIX)), reverse=True)
+
+    def load(self, resource_key, snapshot_id=None):
+        """Load snapshot of the resource
+
+        :param resource_key: resource identifier
+        :param snapshot_id: snapshot id, the latest readable snapshot by default
+        :rtype: Snapshot
+        :return: snapshot or None if there is no such snapshot
+        """
+
+        if not self.is_private():
+            return None
+        resource_path = self._get_resource_path(resource_key)
+        snapshot_ids = [snapshot_id] if snapshot_id else self._get_snapshot_ids(resource_path)
+        for current_id in snapshot_ids:
+            try:
+                with open(os.path.join(resource_path, current_id + self.SNAPSHOT_SUFFIX), 'rb') as snapshot_file:
+                    if not is_own_file(snapshot_file):
+                        continue
+                    header = self._read_header(snapshot_file)
+                    if header is None or header[1] != resource_key:
+                        continue
+                    strings, resources, attributes, metadata = marshal.loads(zlib.decompress(snapshot_file.read()))
+            except (IOError, OSError, EOFError, ValueError, TypeError, zlib.error):
+                continue
+            autoload_details = AutoLoadDetails(
+                resources=[AutoLoadResource(strings[resources[position]], strings[resources[position + 1]],
+                                            strings[resources[position + 2]], strings[resources[position + 3]])
+                           for position in xrange(0, len(resources), 4)],
+                attributes=[AutoLoadAttribute(strings[attributes[position]], strings[attributes[position + 1]],
+                                              strings[attributes[position + 2]])
+                            for position in xrange(0, len(attributes), 3)])
+            return Snapshot(resource_key, current_id, header[2], autoload_details, metadata)
+        return None
+
+    def list_snapshots(self, resource_key=None):
+        """List snapshots, only headers are read
+
+        :param resource_key: list snapshots of this resource only, all resources by default
+        :rtype: list
+        :return: list of dicts with resource_key, snapshot_id, timestamp, resources, attributes and size,
+            newest snapshots of every resource first
+        """
+
+        if resource_key:
+            resource_paths = [self._get_resource_path(resource_key)]
+        elif os.path.isdir(self._store_path):
+            resource_paths = [os.path.join(self._store_path, name) for name in sorted(os.listdir(self._store_path))]
+        else:
+            resource_paths = []
+
+        result = []
+        for resource_path in resource_paths:
+            for snapshot_id in self._get_snapshot_ids(resource_path):
+                file_name = os.path.join(resource_path, snapshot_id + self.SNAPSHOT_SUFFIX)
+                try:
+                    with open(file_name, 'rb') as snapshot_file:
+                        header = self._read_header(snapshot_file)
+                    size = os.path.getsize(file_name)
+                except (IOError, OSError, EOFError, ValueError, TypeError):
+                    continue
+                if header is None:
+                    continue
+                result.append({'resource_key': header[1], 'snapshot_id': snapshot_id, 'timestamp': header[2],
+                               'resources': header[3], 'attributes': header[4], 'size': size})
+        return result
+
+    def evict(self, resource_key=None, max_age=None, max_count=None):
+        """Remove old snapshots
+
+        :param resource_key: evict snapshots of this resource only, all resources by default
+        :param max_age: remove snapshots older than max_age seconds
+        :param max_count: keep only max_count newest snapshots of every resource
+        :rtype: int
+        :return: number of removed snapshots
+        """
+
+        if resource_key:
+            resource_paths = [self._get_resource_path(resource_key)]
+        elif os.path.isdir(self._store_path):
+            resource_paths = [os.path.join(self._store_path, name) for name in os.listdir(self._store_path)]
+        else:
+            resource_paths = []
+
+        removed = 0
+        oldest_id = '{0:017.6f}'.format(time.time() - max_age) if max_age is not None else None
+        for resource_path in resource_paths:
+            for position, snapshot_id in enumerate(self._get_snapshot_ids(resource_path)):
+                if (max_count is not None and position >= max_count) or \
+                        (oldest_id is not None and snapshot_id < oldest_id):
+                    try:
+                        os.remove(os.path.join(resource_path, snapshot_id + self.SNAPSHOT_SUFFIX))
+                        removed += 1
+                    except OSError:
+                        pass
+            try:
+                if os.path.isdir(resource_path) and not os.listdir(resource_path):
+                    os.rmdir(resource_path)
+            except OSError:
+                pass
+        return removed
@@ -0,0 +1,101 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import threading
+
+from pysnmp.proto.api import v2c
+from pysnmp.proto.rfc1905 import EndOfMibView, NoSuchInstance, NoSuchObject
+
+
+class SnmpRecorder(object):
+    """Record SNMP responses of the device to snmprec fixture file.
+
+    Every response varbind is written as 'OID|tag|value' line as soon as the response is received,
+    tag is ASN.1 type tag of the value, 'x' suffix marks hex encoded values. Lines follow capture order,
+    an OID is written once. Community string is replaced in recorded values,
+    SNMP-COMMUNITY-MIB and SNMP-USER-BASED-SM-MIB values are redacted completely.
+    """
+
+    REDACTED_VALUE = 'redacted'
+    REDACTED_SUBTREES = [(1, 3, 6, 1, 6, 3, 15), (1, 3, 6, 1, 6, 3, 18)]
+
+    def __init__(self, file_path, community=None):
+        self._file_path = file_path
+        self._community = community
+        self._lock = threading.Lock()
+        self._recorded_oids = set()
+        self._observers = []
+        self._fixture_file = open(file_path, 'w')
+
+    @property
+    def file_path(self):
+        return self._file_path
+
+    @property
+    def records_count(self):
+        return len(self._recorded_oids)
+
+    def attach(self, snmp_handler):
+        """Record responses received by the handler, handlers without pysnmp engine observer are skipped
+
+        :param snmp_handler: QualiSnmp handler
+        :return:
+        """
+
+        observer = getattr(getattr(getattr(snmp_handler, 'cmd_gen', None), 'snmpEngine', None), 'observer', None)
+        if observer is None or any(attached is observer for attached, callback in self._observers):
+            return
+
+        def callback(snmp_engine, execpoint, variables, context):
+            if variables.get('pdu') is not None:
+                self._record_pdu(variables['pdu'])
+
+        observer.registerObserver(callback, 'rfc3412.receiveMessage:response')
+        self._observers.append((observer, callback))
+
+    def close(self):
+        """Stop recording and close fixture file
+
+        :return:
+        """
+
+        for observer, callback in self._observers:
+            observer.unregisterObserver(callback)
+        self._observers = []
+        with self._lock:
+            self._fixture_file.close()
+
+    def _record_pdu(self, pdu):
+        lines = []
+        with self._lock:
+            for oid, value in v2c.apiPDU.getVarBinds(pdu):
+                if isinstance(value, (NoSuchInstance, NoSuchObject, EndOfMibView)):
+                    continue
+                oid = tuple(oid)
+                if oid in self._recorded_oids:
+                    continue
+                self._recorded_oids.add(oid)
+                lines.append('{0}|{1}\n'.format('.'.join(str(arc) for arc in oid), self._format_value(oid, value)))
+            if lines and not self._fixture_file.closed:
+                self._fixture_file.writelines(lines)
+
+    def _format_value(self, oid, value):
+        tag_class, tag_format, tag_id = value.tagSet[-1].asTuple()
+        tag = tag_class | tag_id
+        if tag in (2, 65, 66, 67, 70):
+            return '{0}|{1}'.format(tag, int(value))
+        if tag == 6:
+            return '{0}|{1}'.format(tag, '.'.join(str(arc) for arc in value))
+        if tag == 64:
+            return '{0}|{1}'.format(tag, value.prettyPrint())
+        if tag == 5:
+            return '{0}|'.format(tag)
+
+        text = value.asOctets()
+        if any(oid[:len(subtree)] == subtree for subtree in self.REDACTED_SUBTREES):
+            text = self.REDACTED_VALUE
+        elif self._community:
+            text = text.replace(self._community, self.REDACTED_VALUE)
+        if all(32 <= ord(char) < 127 for char in text) and '|' not in text:
+            return '{0}|{1}'.format(tag, text)
+        return '{0}x|{1}'.format(tag, text.encode('hex'))
@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import re
-from cloudshell.firewall.cisco.asa.autoload.cisco_asa_snmp_autoload import CiscoASASNMPAutoload
+from cloudshell.firewall.cisco.asa.autoload.cisco_asa_autoload import CiscoASAAutoload
 from cloudshell.firewall.cisco.asa.cisco_asa_configuration_operations import CiscoASAConfigurationOperations
 from cloudshell.firewall.cisco.asa.cisco_asa_run_command_operations import CiscoASARunCommandOperations
 from cloudshell.shell.core.context_utils import get_decrypted_password_by_attribute_name_wrapper
@@ -44,5 +44,35 @@ def enter_enable_mode(session):
 
 CONFIGURATION_OPERATIONS_CLASS = CiscoASAConfigurationOperations
 FIRMWARE_OPERATIONS_CLASS = CiscoASAConfigurationOperations
-AUTOLOAD_OPERATIONS_CLASS = CiscoASASNMPAutoload
+AUTOLOAD_OPERATIONS_CLASS = CiscoASAAutoload
 SEND_COMMAND_OPERATIONS_CLASS = CiscoASARunCommandOperations
+
+# Directory of compiled MIB modules, it must be owned by the driver user and not writable by others,
+# None keeps them in .cache/mibs next to the autoload package
+MIB_CACHE_PATH = None
+
+# Directory of autoload snapshots and autoload engine times, it must be owned by the driver user and not writable
+# by others, None keeps them in .cache/autoload next to the autoload package
+AUTOLOAD_CACHE_PATH = None
+
+# Return only added and changed resources and attributes compared to the previous successful autoload
+# of the resource, empty result means the device didn't change since then
+AUTOLOAD_DELTA_ONLY = False
+
+# Append per-phase autoload profile reports as JSON lines to this file, reports are only logged if it's None
+AUTOLOAD_PROFILE_PATH = None
+
+# Record SNMP responses read during autoload to this snmprec fixture file, community string is redacted
+SNMP_RECORD_PATH = None
+
+# Autoload engine: 'snmp', 'cli' (show commands only, SNMP is not configured) or 'auto' (faster one of the previous run
+# among engines that found the same chassis, ports and port channels as the last used one, the first autoload
+# of a resource runs all engines). Engines address modules and ports differently, switching engines readdresses them
+AUTOLOAD_MODE = 'snmp'
+
+# Discover security contexts of multiple context devices as sub-resources, contexts are discovered concurrently
+# in sessions of the CLI session pool, up to AUTOLOAD_CONTEXT_WORKERS and 'Sessions Concurrency Limit' - 1 at once.
+# The autoload session takes one session of the limit, so with the default limit of 1 contexts are discovered
+# one by one after the device, set the resource 'Sessions Concurrency Limit' to AUTOLOAD_CONTEXT_WORKERS + 1
+AUTOLOAD_CONTEXTS_ENABLED = False
+AUTOLOAD_CONTEXT_WORKERS = 4
@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 
 
-from cloudshell.firewall.cisco.asa.autoload.cisco_asa_snmp_autoload import CiscoASASNMPAutoload as Autoload
+from cloudshell.firewall.cisco.asa.autoload.cisco_asa_autoload import CiscoASAAutoload as Autoload
 from cloudshell.firewall.cisco.asa.cisco_asa_run_command_operations import CiscoASARunCommandOperations as RunCommandOperations
 from cloudshell.firewall.cisco.asa.cisco_asa_state_operations import CiscoASAStateOperations as StateOperations
 from cloudshell.firewall.cisco.asa.cisco_asa_firmware_operations import CiscoASAFirmwareOperations as FirmwareOperations
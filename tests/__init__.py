@@ -0,0 +1,185 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""Autoload tests replaying synthetic snmprec and CLI fixtures of benchmarks/fixtures"""
+
+import inject
+import logging
+import os
+import re
+import sys
+import threading
+import types
+
+BENCHMARKS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks')
+if BENCHMARKS_PATH not in sys.path:
+    sys.path.insert(0, BENCHMARKS_PATH)
+
+from cloudshell.firewall.cisco.asa.autoload.cisco_asa_cli_autoload import CiscoASACLIAutoload
+from cloudshell.firewall.cisco.asa.autoload.cisco_asa_snmp_autoload import CiscoASASNMPAutoload
+from cloudshell.configuration.cloudshell_shell_core_binding_keys import CONFIG, CONTEXT, LOGGER
+from cloudshell.shell.core import context_utils
+from cloudshell.shell.core.context import AutoLoadCommandContext, ResourceContextDetails
+from cloudshell.shell.core.dependency_injection.context_based_logger import get_logger_for_driver
+from snmp_replay import ReplayCommandGenerator, create_snmp_handler, load_snmprec
+
+FIXTURES_PATH = os.path.join(BENCHMARKS_PATH, 'fixtures')
+CLI_PROMPT_PATTERN = re.compile(r'^[\w.\-/]+# (?P<command>\S.*?)\s*$')
+
+
+class ReplayAutoload(CiscoASASNMPAutoload):
+    """SNMP autoload replaying fixture records in table loader and GET pipeline threads as well"""
+
+    _snmp_engines = []
+
+    def _create_snmp_engine(self):
+        return ReplayCommandGenerator()
+
+
+class ReplayCliService(object):
+    """CLI service answering commands with fixture outputs and recording them with their sessions"""
+
+    def __init__(self, outputs):
+        self.outputs = outputs
+        self.commands = []
+
+    def send_command(self, command, expected_str=None, session=None, **kwargs):
+        self.commands.append((command, session))
+        if command not in self.outputs:
+            return 'ERROR: % Invalid input detected at \'^\' marker.'
+        return self.outputs[command]
+
+
+def create_logger():
+    logger = logging.getLogger('tests')
+    if not logger.handlers:
+        logger.addHandler(logging.NullHandler())
+    return logger
+
+
+def create_config(**attributes):
+    """Create driver configuration module with the given attributes
+
+    :rtype: types.ModuleType
+    """
+
+    config = types.ModuleType('config')
+    for name, value in attributes.iteritems():
+        setattr(config, name, value)
+    return config
+
+
+def load_fixture(name):
+    """Load snmprec fixture of benchmarks/fixtures
+
+    :param name: fixture name, i.e. 'asa5506'
+    :rtype: dict
+    :return: pysnmp values by OID tuples
+    """
+
+    return load_snmprec(os.path.join(FIXTURES_PATH, name + '.snmprec'))
+
+
+def load_cli_fixture(name):
+    """Load CLI session fixture of benchmarks/fixtures, every command follows the device prompt
+
+    :param name: fixture name, i.e. 'asa5506'
+    :rtype: dict
+    :return: command outputs by command
+    """
+
+    outputs = {}
+    command = None
+    with open(os.path.join(FIXTURES_PATH, name + '.cli')) as fixture_file:
+        for line in fixture_file:
+            match = CLI_PROMPT_PATTERN.match(line)
+            if match:
+                command = match.group('command')
+                outputs[command] = ''
+            elif command is not None:
+                outputs[command] += line
+    return outputs
+
+
+def bind_command_context(attributes=None, bindings=()):
+    """Configure injector with the driver context and logger providers and put autoload command context
+    into the current thread, like the driver does for a command
+
+    :param attributes: resource attributes of the command context
+    :param bindings: functions adding more bindings to the binder
+    """
+
+    config = create_config(AUTOLOAD_COMMAND_CONTEXT=AutoLoadCommandContext.__name__,
+                           RESOURCE_COMMAND_CONTEXT='ResourceCommandContext',
+                           RESOURCE_REMOTE_COMMAND_CONTEXT='ResourceRemoteCommandContext',
+                           CONTEXT_WRAPPER=context_utils.build_suitable_context)
+
+    def configure(binder):
+        binder.bind(CONFIG, config)
+        binder.bind_to_provider(CONTEXT, context_utils.get_context)
+        binder.bind_to_provider(LOGGER, get_logger_for_driver)
+        for binding in bindings:
+            binding(binder)
+
+    inject.clear_and_configure(configure)
+    context = AutoLoadCommandContext()
+    context.resource = ResourceContextDetails()
+    context.resource.name = 'asa'
+    context.resource.address = '192.0.2.1'
+    context.resource.attributes = attributes or {}
+    context_utils.put_context(context)
+
+
+def unbind_command_context():
+    context_utils._CONTEXT_CONTAINER.pop(threading.currentThread(), None)
+    inject.clear()
+
+
+def create_snmp_autoload(records, **config_attributes):
+    logger = create_logger()
+    return ReplayAutoload(snmp_handler=create_snmp_handler(records, logger), logger=logger,
+                          config=create_config(**config_attributes), snmp_community='public')
+
+
+def discover_snmp(records, **config_attributes):
+    """Run SNMP discovery of the records, SNMP community is not configured through CLI
+
+    :param records: pysnmp values by OID tuples
+    :param config_attributes: driver configuration attributes
+    :rtype: AutoLoadDetails
+    """
+
+    return create_snmp_autoload(records, **config_attributes)._get_autoload_details()
+
+
+def discover_cli(outputs, **config_attributes):
+    """Run CLI discovery answering show commands with the outputs
+
+    :param outputs: command outputs by command
+    :param config_attributes: driver configuration attributes
+    :rtype: AutoLoadDetails
+    """
+
+    return CiscoASACLIAutoload(logger=create_logger(), config=create_config(**config_attributes),
+                               cli_service=ReplayCliService(outputs), session=object()).discover()
+
+
+def get_attributes(autoload_details):
+    """Get attribute values of the autoload result
+
+    :rtype: dict
+    :return: attribute values by (relative address, attribute name)
+    """
+
+    return {(attribute.relative_address, attribute.attribute_name): attribute.attribute_value
+            for attribute in autoload_details.attributes}
+
+
+def get_resources(autoload_details):
+    """Get resources of the autoload result
+
+    :rtype: list
+    :return: list of (relative address, model, name) in the result order
+    """
+
+    return [(resource.relative_address, resource.model, resource.name) for resource in autoload_details.resources]
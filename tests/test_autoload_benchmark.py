@@ -0,0 +1,35 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+from autoload_benchmark import BUDGET_COUNTERS, FIXTURES, ReplayAutoload, discover, load_budgets, load_records
+from tests import discover_snmp, load_fixture
+
+
+class TestAutoloadBenchmark(TestCase):
+    def setUp(self):
+        ReplayAutoload._snmp_engines = []
+        self.budgets = load_budgets()
+
+    def test_budgets_gate_request_counts_only(self):
+        self.assertEqual(sorted(self.budgets), sorted(FIXTURES + ['synthetic_1k', 'synthetic_5k']))
+        for fixture, budget in self.budgets.iteritems():
+            self.assertEqual(sorted(budget), sorted(BUDGET_COUNTERS), fixture)
+
+    def test_fixtures_are_discovered_within_budgets(self):
+        for fixture in FIXTURES:
+            measured = discover(load_records(fixture))
+
+            self.assertGreater(measured['resources'], 1, fixture)
+            for counter in BUDGET_COUNTERS:
+                self.assertLessEqual(measured[counter], self.budgets[fixture][counter], (fixture, counter))
+
+    def test_replayed_device_matches_test_replay(self):
+        records = load_fixture('asa5506')
+
+        measured = discover(records)
+
+        result = discover_snmp(records)
+        self.assertEqual(measured['resources'], len(result.resources))
+        self.assertEqual(measured['attributes'], len(result.attributes))
@@ -0,0 +1,95 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import shutil
+import tempfile
+from unittest import TestCase
+
+from pysnmp.proto import rfc1902
+
+from tests import create_snmp_autoload, discover_snmp, get_attributes, get_resources, load_fixture
+
+IF_TABLE_LAST_CHANGE = (1, 3, 6, 1, 2, 1, 31, 1, 5, 0)
+IF_ALIAS = (1, 3, 6, 1, 2, 1, 31, 1, 1, 1, 18)
+RESOURCE_KEY = 'asa5585@192.0.2.10'
+
+
+class AutoloadCacheTestCase(TestCase):
+    def setUp(self):
+        self.cache_path = tempfile.mkdtemp()
+        self.records = load_fixture('asa5585')
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_path)
+
+    def create_autoload(self, **config_attributes):
+        autoload = create_snmp_autoload(self.records, AUTOLOAD_CACHE_PATH=self.cache_path, **config_attributes)
+        autoload._get_resource_key = lambda: RESOURCE_KEY
+        return autoload
+
+    def discover(self, **config_attributes):
+        """Run SNMP discovery and save the snapshot the way discover() does on success"""
+
+        autoload = self.create_autoload(**config_attributes)
+        result = autoload._get_autoload_details()
+        autoload.save_autoload_snapshot()
+        return result
+
+    def change_interfaces(self):
+        self.records[IF_ALIAS + (1,)] = rfc1902.OctetString('outside-new')
+        self.records[IF_TABLE_LAST_CHANGE] = rfc1902.TimeTicks(int(self.records[IF_TABLE_LAST_CHANGE]) + 100)
+
+
+class TestCiscoASASNMPAutoloadCache(AutoloadCacheTestCase):
+    def test_entity_table_is_stored_in_walk_order(self):
+        self.discover(AUTOLOAD_CACHE_ENABLED=True)
+
+        entity_table = self.create_autoload().snapshot_store.load(RESOURCE_KEY).metadata['entity_table']
+
+        self.assertIsInstance(entity_table, list)
+        indexes = [index for index, row in entity_table]
+        self.assertEqual(indexes, sorted(indexes))
+
+    def test_cached_entity_table_keeps_resource_order(self):
+        expected_result = self.discover(AUTOLOAD_CACHE_ENABLED=True)
+        self.records[IF_TABLE_LAST_CHANGE] = rfc1902.TimeTicks(int(self.records[IF_TABLE_LAST_CHANGE]) + 100)
+
+        autoload = self.create_autoload(AUTOLOAD_CACHE_ENABLED=True)
+        result = autoload._get_autoload_details()
+
+        self.assertIsNotNone(autoload._cached_entity_table)
+        self.assertEqual(get_resources(result), get_resources(expected_result))
+
+
+class TestCiscoASASNMPAutoloadDelta(AutoloadCacheTestCase):
+    def test_first_delta_is_full_result(self):
+        expected_result = discover_snmp(self.records)
+
+        result = self.discover(AUTOLOAD_DELTA_ONLY=True)
+
+        self.assertEqual(get_resources(result), get_resources(expected_result))
+
+    def test_delta_has_changed_attributes_only(self):
+        self.discover(AUTOLOAD_DELTA_ONLY=True)
+        self.change_interfaces()
+
+        result = self.discover(AUTOLOAD_DELTA_ONLY=True)
+
+        self.assertEqual(get_resources(result), [])
+        self.assertEqual(get_attributes(result).values(), ['outside-new'])
+
+    def test_baseline_is_kept_until_discovery_returns(self):
+        self.discover(AUTOLOAD_DELTA_ONLY=True)
+        self.change_interfaces()
+        self.create_autoload(AUTOLOAD_DELTA_ONLY=True)._get_autoload_details()
+
+        result = self.discover(AUTOLOAD_DELTA_ONLY=True)
+
+        self.assertEqual(get_attributes(result).values(), ['outside-new'])
+
+    def test_unchanged_device_gives_empty_delta(self):
+        self.discover(AUTOLOAD_DELTA_ONLY=True, AUTOLOAD_CACHE_ENABLED=True)
+
+        result = self.discover(AUTOLOAD_DELTA_ONLY=True, AUTOLOAD_CACHE_ENABLED=True)
+
+        self.assertEqual((result.resources, result.attributes), ([], []))
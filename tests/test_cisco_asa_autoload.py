@@ -0,0 +1,191 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import threading
+from unittest import TestCase
+
+from cloudshell.firewall.cisco.asa.autoload.cisco_asa_autoload import CiscoASAAutoload
+from cloudshell.shell.core.driver_context import AutoLoadDetails
+from tests import create_config, create_logger, discover_cli, discover_snmp, get_attributes, get_resources, \
+    load_cli_fixture, load_fixture
+
+RESOURCE_KEY = 'asa5506@192.0.2.6'
+PORT_ATTRIBUTES = ['MAC Address', 'Bandwidth', 'Port Description', 'IPv4 Address', 'IPv6 Address',
+                   'L2 Protocol Type', 'Duplex', 'Auto Negotiation']
+
+
+def get_ports(autoload_details):
+    """Get port addresses by port name"""
+
+    return {name: address for address, model, name in get_resources(autoload_details) if model == 'Generic Port'}
+
+
+class TestCiscoASAAutoloadEngines(TestCase):
+    def setUp(self):
+        self.snmp_result = discover_snmp(load_fixture('asa5506'))
+        self.cli_result = discover_cli(load_cli_fixture('asa5506'))
+
+    def test_device_attributes_match(self):
+        snmp_attributes = get_attributes(self.snmp_result)
+        cli_attributes = get_attributes(self.cli_result)
+
+        for name in ['Model', 'Vendor', 'System Name']:
+            self.assertEqual(cli_attributes['', name], snmp_attributes['', name])
+        for name in ['Model', 'Serial Number']:
+            self.assertEqual(cli_attributes['0', name], snmp_attributes['0', name])
+
+    def test_port_attributes_match(self):
+        snmp_ports = get_ports(self.snmp_result)
+        cli_ports = get_ports(self.cli_result)
+        snmp_attributes = get_attributes(self.snmp_result)
+        cli_attributes = get_attributes(self.cli_result)
+
+        self.assertEqual(sorted(cli_ports), sorted(snmp_ports))
+        for name in snmp_ports:
+            for attribute_name in PORT_ATTRIBUTES:
+                self.assertEqual(cli_attributes[cli_ports[name], attribute_name],
+                                 snmp_attributes[snmp_ports[name], attribute_name], (name, attribute_name))
+            if snmp_attributes[snmp_ports[name], 'Port Description']:
+                self.assertEqual(cli_attributes[cli_ports[name], 'MTU'], snmp_attributes[snmp_ports[name], 'MTU'])
+
+    def test_tree_signatures_match_although_addresses_differ(self):
+        self.assertEqual(get_ports(self.snmp_result)['GigabitEthernet1-1'], '0/7')
+        self.assertEqual(get_ports(self.cli_result)['GigabitEthernet1-1'], '0/1/1')
+        self.assertEqual(CiscoASAAutoload._get_tree_signature(self.cli_result),
+                         CiscoASAAutoload._get_tree_signature(self.snmp_result))
+
+    def test_tree_signatures_differ_by_ports(self):
+        cli_result = remove_port(self.cli_result, 'GigabitEthernet1-8')
+
+        self.assertNotEqual(CiscoASAAutoload._get_tree_signature(cli_result),
+                            CiscoASAAutoload._get_tree_signature(self.snmp_result))
+
+
+def remove_port(autoload_details, name):
+    """Copy autoload result without the port"""
+
+    address = get_ports(autoload_details)[name]
+    return AutoLoadDetails(resources=[resource for resource in autoload_details.resources
+                                      if resource.relative_address != address],
+                           attributes=[attribute for attribute in autoload_details.attributes
+                                       if attribute.relative_address != address])
+
+
+class FakeEngine(object):
+    def __init__(self, result=None):
+        self.result = result
+        self.calls = 0
+
+    def discover(self):
+        self.calls += 1
+        if self.result is None:
+            raise Exception('FakeEngine', 'Autoload failed')
+        return self.result
+
+
+class TestCiscoASAAutoloadAutoMode(TestCase):
+    def setUp(self):
+        self.cache_path = tempfile.mkdtemp()
+        self.snmp_result = discover_snmp(load_fixture('asa5506'))
+        self.cli_result = discover_cli(load_cli_fixture('asa5506'))
+        self.other_cli_result = remove_port(self.cli_result, 'GigabitEthernet1-8')
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_path)
+
+    def discover(self, snmp_result, cli_result):
+        autoload = CiscoASAAutoload(logger=create_logger(),
+                                    config=create_config(AUTOLOAD_MODE='auto', AUTOLOAD_CACHE_PATH=self.cache_path))
+        autoload._get_resource_key = lambda: RESOURCE_KEY
+        snmp_engine = FakeEngine(snmp_result)
+        cli_engine = FakeEngine(cli_result)
+        autoload._engines = {'snmp': lambda: snmp_engine, 'cli': lambda: cli_engine}
+        return autoload, autoload.discover(), snmp_engine, cli_engine
+
+    def set_times(self, autoload, **times):
+        record = autoload._load_timings()[RESOURCE_KEY]
+        record['times'].update(times)
+        autoload._save_timings(RESOURCE_KEY, record)
+
+    def test_first_autoload_runs_all_engines(self):
+        autoload, result, snmp_engine, cli_engine = self.discover(self.snmp_result, self.cli_result)
+
+        self.assertIs(result, self.snmp_result)
+        self.assertEqual((snmp_engine.calls, cli_engine.calls), (1, 1))
+        record = autoload._load_timings()[RESOURCE_KEY]
+        self.assertEqual(record['engine'], 'snmp')
+        self.assertEqual(sorted(record['port_trees']), ['cli', 'snmp'])
+
+    def test_engine_with_different_tree_is_not_used(self):
+        autoload = self.discover(self.snmp_result, self.other_cli_result)[0]
+        self.set_times(autoload, snmp=10.0, cli=1.0)
+
+        result, snmp_engine, cli_engine = self.discover(self.snmp_result, self.other_cli_result)[1:]
+
+        self.assertIs(result, self.snmp_result)
+        self.assertEqual((snmp_engine.calls, cli_engine.calls), (1, 0))
+
+    def test_no_fallback_to_engine_with_different_tree(self):
+        self.discover(self.snmp_result, self.other_cli_result)
+
+        with self.assertRaises(Exception):
+            self.discover(None, self.other_cli_result)
+        autoload, result, snmp_engine, cli_engine = self.discover(self.snmp_result, self.other_cli_result)
+
+        self.assertIs(result, self.snmp_result)
+        self.assertEqual(autoload._load_timings()[RESOURCE_KEY]['engine'], 'snmp')
+
+    def test_auto_switches_to_faster_engine_with_the_same_ports(self):
+        autoload = self.discover(self.snmp_result, self.cli_result)[0]
+        self.set_times(autoload, snmp=10.0, cli=1.0)
+
+        autoload, result, snmp_engine, cli_engine = self.discover(self.snmp_result, self.cli_result)
+
+        self.assertIs(result, self.cli_result)
+        self.assertEqual((snmp_engine.calls, cli_engine.calls), (0, 1))
+        self.assertEqual(autoload._load_timings()[RESOURCE_KEY]['engine'], 'cli')
+
+    def test_fallback_to_engine_with_same_tree(self):
+        autoload = self.discover(self.snmp_result, self.cli_result)[0]
+        self.set_times(autoload, snmp=1.0, cli=10.0)
+
+        result, snmp_engine, cli_engine = self.discover(None, self.cli_result)[1:]
+
+        self.assertIs(result, self.cli_result)
+        self.assertEqual((snmp_engine.calls, cli_engine.calls), (1, 1))
+
+    def test_first_autoload_falls_back(self):
+        autoload, result, snmp_engine, cli_engine = self.discover(None, self.cli_result)
+
+        self.assertIs(result, self.cli_result)
+        record = autoload._load_timings()[RESOURCE_KEY]
+        self.assertEqual(record['engine'], 'cli')
+        self.assertIsNone(record['times']['snmp'])
+
+    def test_record_of_whole_tree_signatures_runs_all_engines(self):
+        autoload = self.discover(self.snmp_result, self.cli_result)[0]
+        autoload._save_timings(RESOURCE_KEY, {'engine': 'snmp', 'times': {'snmp': 10.0, 'cli': 1.0},
+                                              'trees': {'snmp': 'a', 'cli': 'b'}})
+
+        autoload, result, snmp_engine, cli_engine = self.discover(self.snmp_result, self.cli_result)
+
+        self.assertEqual((snmp_engine.calls, cli_engine.calls), (1, 1))
+        self.assertEqual(sorted(autoload._load_timings()[RESOURCE_KEY]['port_trees']), ['cli', 'snmp'])
+
+    def test_concurrent_saves_keep_all_records(self):
+        autoload = self.discover(self.snmp_result, self.cli_result)[0]
+        resource_keys = ['asa{0}@192.0.2.{0}'.format(number) for number in range(20)]
+        threads = [threading.Thread(target=autoload._save_timings, args=(resource_key, {'engine': 'snmp'}))
+                   for resource_key in resource_keys]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        timings = autoload._load_timings()
+        self.assertEqual(sorted(timings), sorted(resource_keys + [RESOURCE_KEY]))
+        self.assertEqual([name for name in os.listdir(os.path.dirname(autoload._timings_path))
+                          if name.endswith('.tmp')], [])
@@ -0,0 +1,49 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+from tests import discover_cli, get_attributes, load_cli_fixture
+
+REDUNDANT_INTERFACE = """Interface Redundant1 "inside", is up, line protocol is up
+  Hardware is i82546GB rev03, BW 1000 Mbps, DLY 10 usec
+	Auto-Duplex(Full-duplex), Auto-Speed(1000 Mbps)
+	Members GigabitEthernet0/2 GigabitEthernet0/3
+	MAC address 0025.8452.4e20, MTU 1500
+	IP address 192.168.1.1, subnet mask 255.255.255.0
+"""
+UNKNOWN_INTERFACE = """Interface Fabric2/1 "", is up, line protocol is up
+  Hardware is sfabric rev00, BW 10000 Mbps, DLY 10 usec
+	MAC address 0025.8452.4e30, MTU not set
+	IP address unassigned
+"""
+
+
+class TestCiscoASACLIAutoloadPorts(TestCase):
+    def setUp(self):
+        self.outputs = load_cli_fixture('asa5506')
+
+    def discover_interfaces(self, interfaces_output):
+        self.outputs['show interface'] += interfaces_output
+        return get_attributes(discover_cli(self.outputs))
+
+    def test_ethernet_port_type(self):
+        attributes = get_attributes(discover_cli(self.outputs))
+
+        self.assertEqual(attributes['0/1/1', 'L2 Protocol Type'], 'ethernetCsmacd')
+
+    def test_redundant_port_type_comes_from_name(self):
+        attributes = self.discover_interfaces(REDUNDANT_INTERFACE)
+
+        self.assertEqual(attributes['0/0/1', 'L2 Protocol Type'], 'propVirtual')
+        self.assertEqual(attributes['0/0/1', 'MAC Address'], '00:25:84:52:4e:20')
+
+    def test_unknown_port_type(self):
+        attributes = self.discover_interfaces(UNKNOWN_INTERFACE)
+
+        self.assertEqual(attributes['0/2/1', 'L2 Protocol Type'], 'other')
+
+    def test_adjacent_is_not_reported(self):
+        attributes = get_attributes(discover_cli(self.outputs))
+
+        self.assertEqual(attributes['0/1/2', 'Adjacent'], '')
@@ -0,0 +1,303 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import inject
+import logging
+import re
+import threading
+from unittest import TestCase
+
+from cloudshell.configuration.cloudshell_cli_binding_keys import CONNECTION_MANAGER
+from cloudshell.configuration.cloudshell_shell_core_binding_keys import LOGGER
+from cloudshell.firewall.cisco.asa.autoload import cisco_asa_autoload
+from cloudshell.firewall.cisco.asa.autoload.cisco_asa_autoload import CiscoASAAutoload
+from cloudshell.firewall.cisco.asa.autoload.cisco_asa_context_autoload import CiscoASAContextAutoload
+from tests import bind_command_context, create_config, create_logger, get_attributes, get_resources, \
+    load_cli_fixture, unbind_command_context
+
+HOSTNAME = 'asa5506-branch'
+SHOW_CONTEXT = """Context Name      Class                Interfaces           Mode         URL
+*admin            default              Management1/1        Routed       disk0:/admin.cfg
+ customerA        default              GigabitEthernet1/2,  Routed       disk0:/customerA.cfg
+                                       GigabitEthernet1/3
+ customerB        default              GigabitEthernet1/4   Transparent  disk0:/customerB.cfg
+
+Total active Security Contexts: 3
+"""
+CUSTOMER_A_OUTPUTS = {
+    'show nameif': """Interface                Name                     Security
+GigabitEthernet1/2       inside                   100
+GigabitEthernet1/3       dmz                       50
+""",
+    'show interface': """Interface GigabitEthernet1/2 "inside", is up, line protocol is up
+  MAC address 001e.f75a.0002, MTU 1500
+	IP address 192.168.1.1, subnet mask 255.255.255.0
+  Description: to core-sw>
+Interface GigabitEthernet1/3 "dmz", is up, line protocol is up
+  MAC address 001e.f75a.0003, MTU 1500
+	IP address 192.168.10.1, subnet mask 255.255.255.0
+"""}
+CUSTOMER_B_OUTPUTS = {
+    'show nameif': """Interface                Name                     Security
+GigabitEthernet1/4       lab                        0
+""",
+    'show interface': """Interface GigabitEthernet1/4 "lab", is up, line protocol is up
+  MAC address 001e.f75a.0004, MTU 1500
+"""}
+
+
+class ContextCliService(object):
+    """CLI service of a multiple context device answering with the prompt of the session execution space"""
+
+    def __init__(self, system_outputs, context_outputs, failing_commands=()):
+        self.system_outputs = system_outputs
+        self.context_outputs = context_outputs
+        self.failing_commands = failing_commands
+        self.current_context = None
+        self.commands = []
+
+    def send_command(self, command, expected_str=None, session=None, **kwargs):
+        self.commands.append(command)
+        if command in self.failing_commands:
+            raise Exception('ExpectSession', 'Session Loop limit exceeded, 3 loops')
+        if command == 'changeto system':
+            self.current_context = None
+            output = ''
+        elif command.startswith('changeto context '):
+            name = command[len('changeto context '):]
+            if name in self.context_outputs:
+                self.current_context = name
+                output = ''
+            else:
+                output = 'ERROR: Context {0} does not exist\n'.format(name)
+        else:
+            outputs = self.context_outputs[self.current_context] if self.current_context else self.system_outputs
+            output = outputs.get(command, 'ERROR: % Invalid input detected at \'^\' marker.\n')
+        prompt = '{0}/{1}# '.format(HOSTNAME, self.current_context) if self.current_context else HOSTNAME + '# '
+        output = '{0}\n{1}{2}'.format(command, output, prompt)
+        if expected_str and not re.search(expected_str, output, re.DOTALL):
+            raise Exception('ExpectSession', 'Session Loop limit exceeded, 3 loops')
+        return output
+
+
+class SessionsCliService(ContextCliService):
+    """Context CLI service keeping execution space of every session"""
+
+    def __init__(self, system_outputs, context_outputs, failing_commands=()):
+        ContextCliService.__init__(self, system_outputs, context_outputs, failing_commands)
+        self.lock = threading.Lock()
+        self.session_contexts = {}
+
+    def send_command(self, command, expected_str=None, session=None, **kwargs):
+        with self.lock:
+            self.current_context = self.session_contexts.get(session)
+            try:
+                return ContextCliService.send_command(self, command, expected_str, session, **kwargs)
+            finally:
+                self.session_contexts[session] = self.current_context
+
+
+class FakeSession(object):
+    def __init__(self):
+        self.valid = True
+
+    def set_invalid(self):
+        self.valid = False
+
+
+class FakeConnectionManager(object):
+    """Session pool getting the logger from the injector like the CLI connection manager does"""
+
+    def __init__(self):
+        self.sessions = []
+        self.returned_sessions = []
+
+    @inject.params(logger=LOGGER)
+    def get_session_instance(self, logger=None):
+        session = FakeSession()
+        logger.debug('Session {0} created'.format(len(self.sessions)))
+        self.sessions.append(session)
+        return session
+
+    def return_session_to_pool(self, session):
+        self.returned_sessions.append(session)
+
+
+def parse_context(name, interfaces, mode='Routed'):
+    return {'name': name, 'current': False, 'class': 'default', 'interfaces': interfaces, 'mode': mode,
+            'url': 'disk0:/{0}.cfg'.format(name)}
+
+
+class TestCiscoASAContextAutoload(TestCase):
+    def setUp(self):
+        self.session = FakeSession()
+        self.context = parse_context('customerA', ['GigabitEthernet1/2', 'GigabitEthernet1/3'])
+
+    def create_autoload(self, context_outputs, failing_commands=()):
+        self.cli_service = ContextCliService({}, context_outputs, failing_commands)
+        return CiscoASAContextAutoload(self.context, logger=create_logger(), config=create_config(),
+                                       cli_service=self.cli_service, session=self.session, hostname=HOSTNAME)
+
+    def test_context_ports(self):
+        autoload = self.create_autoload({'customerA': CUSTOMER_A_OUTPUTS})
+
+        result = autoload.discover()
+
+        self.assertEqual(get_resources(result), [('CTX-customerA', 'Generic Security Context', 'customerA'),
+                                                 ('CTX-customerA/1-2', 'Generic Port', 'GigabitEthernet1-2'),
+                                                 ('CTX-customerA/1-3', 'Generic Port', 'GigabitEthernet1-3')])
+        attributes = get_attributes(result)
+        self.assertEqual(attributes['CTX-customerA/1-2', 'IPv4 Address'], '192.168.1.1')
+        self.assertEqual(attributes['CTX-customerA/1-3', 'IPv4 Address'], '192.168.10.1')
+        self.assertEqual(self.cli_service.commands, ['changeto context customerA', 'show nameif', 'show interface',
+                                                     'changeto system'])
+        self.assertTrue(self.session.valid)
+
+    def test_prompts_match_only_the_device_prompt(self):
+        autoload = self.create_autoload({})
+
+        for text in ['  Description: to core-sw>', 'Interface GigabitEthernet1/2 "inside#', HOSTNAME + '# ',
+                     'other/customerA# ']:
+            self.assertIsNone(re.search(autoload._context_prompt, text, re.DOTALL), text)
+        self.assertIsNotNone(re.search(autoload._context_prompt, 'show nameif\n' + HOSTNAME + '/customerA# ',
+                                       re.DOTALL))
+        self.assertIsNotNone(re.search(autoload._system_prompt, 'changeto system\n' + HOSTNAME + '# ', re.DOTALL))
+        self.assertIsNone(re.search(autoload._system_prompt, HOSTNAME + '/customerA# ', re.DOTALL))
+
+    def test_command_error_is_raised(self):
+        autoload = self.create_autoload({'customerA': {'show interface': CUSTOMER_A_OUTPUTS['show interface']}})
+
+        with self.assertRaises(Exception):
+            autoload.discover()
+
+        self.assertEqual(self.cli_service.commands[-1], 'changeto system')
+        self.assertTrue(self.session.valid)
+
+    def test_unknown_context_keeps_session(self):
+        autoload = self.create_autoload({})
+
+        with self.assertRaises(Exception):
+            autoload.discover()
+
+        self.assertEqual(self.cli_service.commands, ['changeto context customerA'])
+        self.assertTrue(self.session.valid)
+
+    def test_failed_change_to_system_sets_session_invalid(self):
+        autoload = self.create_autoload({'customerA': CUSTOMER_A_OUTPUTS}, failing_commands=['changeto system'])
+
+        result = autoload.discover()
+
+        self.assertEqual(len(result.resources), 3)
+        self.assertFalse(autoload.session_valid)
+        self.assertFalse(self.session.valid)
+
+
+class TestCiscoASAAutoloadContexts(TestCase):
+    def setUp(self):
+        self.session = FakeSession()
+        self.system_outputs = load_cli_fixture('asa5506')
+        self.system_outputs['show context'] = SHOW_CONTEXT
+        self.system_outputs['show hostname'] = HOSTNAME + '\n'
+
+    def discover(self, context_outputs, failing_commands=()):
+        self.cli_service = ContextCliService(self.system_outputs, context_outputs, failing_commands)
+        autoload = CiscoASAAutoload(logger=create_logger(), cli_service=self.cli_service, session=self.session,
+                                    config=create_config(AUTOLOAD_MODE='cli', AUTOLOAD_CONTEXTS_ENABLED=True))
+        return autoload.discover()
+
+    def test_contexts_are_discovered_with_the_device(self):
+        result = self.discover({'admin': {}, 'customerA': CUSTOMER_A_OUTPUTS, 'customerB': CUSTOMER_B_OUTPUTS})
+
+        resources = get_resources(result)
+        self.assertIn(('0/1/1', 'Generic Port', 'GigabitEthernet1-1'), resources)
+        self.assertEqual([address for address, model, name in resources if address.startswith('CTX-')],
+                         ['CTX-admin', 'CTX-customerA', 'CTX-customerA/1-2', 'CTX-customerA/1-3', 'CTX-customerB',
+                          'CTX-customerB/1-4'])
+        self.assertEqual(get_attributes(result)['CTX-customerA', 'Allocated Interfaces'],
+                         'GigabitEthernet1/2, GigabitEthernet1/3')
+        self.assertTrue(self.session.valid)
+
+    def test_contexts_after_invalid_session_have_no_interfaces(self):
+        result = self.discover({'admin': {}, 'customerA': CUSTOMER_A_OUTPUTS, 'customerB': CUSTOMER_B_OUTPUTS},
+                               failing_commands=['changeto system'])
+
+        addresses = [address for address, model, name in get_resources(result) if address.startswith('CTX-')]
+        self.assertEqual(addresses, ['CTX-admin', 'CTX-customerA', 'CTX-customerB'])
+        self.assertFalse(self.session.valid)
+        self.assertEqual([command for command in self.cli_service.commands if command.startswith('changeto')],
+                         ['changeto context admin', 'changeto system'])
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestCiscoASAAutoloadContextWorkers(TestCase):
+    def setUp(self):
+        self.get_attribute_by_name = cisco_asa_autoload.get_attribute_by_name
+        self.sessions_limit = '1'
+        cisco_asa_autoload.get_attribute_by_name = lambda name: self.sessions_limit
+        self.handler = RecordingHandler()
+        create_logger().addHandler(self.handler)
+        self.autoload = CiscoASAAutoload(logger=create_logger(), config=create_config(AUTOLOAD_CONTEXT_WORKERS=4))
+
+    def tearDown(self):
+        cisco_asa_autoload.get_attribute_by_name = self.get_attribute_by_name
+        create_logger().removeHandler(self.handler)
+
+    def get_warnings(self):
+        return [record.getMessage() for record in self.handler.records if record.levelno == logging.WARNING]
+
+    def test_default_sessions_limit_discovers_contexts_one_by_one(self):
+        self.assertEqual(self.autoload._get_context_workers_count(3), 0)
+        self.assertEqual(len(self.get_warnings()), 1)
+        self.assertIn('set it to 4', self.get_warnings()[0])
+
+    def test_sessions_limit_bounds_workers(self):
+        self.sessions_limit = '3'
+
+        self.assertEqual(self.autoload._get_context_workers_count(3), 2)
+        self.assertEqual(self.get_warnings(), [])
+
+    def test_workers_limit_bounds_workers(self):
+        self.sessions_limit = '10'
+
+        self.assertEqual(self.autoload._get_context_workers_count(8), 4)
+
+
+class TestCiscoASAAutoloadContextPool(TestCase):
+    def setUp(self):
+        self.session = FakeSession()
+        self.connection_manager = FakeConnectionManager()
+        bind_command_context({'Sessions Concurrency Limit': '3'},
+                             [lambda binder: binder.bind(CONNECTION_MANAGER, self.connection_manager)])
+        system_outputs = load_cli_fixture('asa5506')
+        system_outputs['show context'] = SHOW_CONTEXT
+        system_outputs['show hostname'] = HOSTNAME + '\n'
+        self.cli_service = SessionsCliService(system_outputs, {'admin': {}, 'customerA': CUSTOMER_A_OUTPUTS,
+                                                               'customerB': CUSTOMER_B_OUTPUTS})
+
+    def tearDown(self):
+        unbind_command_context()
+
+    def test_contexts_are_discovered_in_pool_sessions_with_the_injected_logger(self):
+        autoload = CiscoASAAutoload(cli_service=self.cli_service, session=self.session,
+                                    config=create_config(AUTOLOAD_MODE='cli', AUTOLOAD_CONTEXTS_ENABLED=True))
+
+        self.assertEqual(autoload._get_context_workers_count(3), 2)
+        result = autoload.discover()
+
+        resources = get_resources(result)
+        self.assertIn(('0/1/1', 'Generic Port', 'GigabitEthernet1-1'), resources)
+        self.assertEqual([address for address, model, name in resources if address.startswith('CTX-')],
+                         ['CTX-admin', 'CTX-customerA', 'CTX-customerA/1-2', 'CTX-customerA/1-3', 'CTX-customerB',
+                          'CTX-customerB/1-4'])
+        self.assertEqual(get_attributes(result)['CTX-customerB/1-4', 'MAC Address'], '00:1e:f7:5a:00:04')
+        self.assertEqual(len(self.connection_manager.sessions), 3)
+        self.assertItemsEqual(self.connection_manager.returned_sessions, self.connection_manager.sessions)
+        self.assertTrue(self.session.valid)
@@ -0,0 +1,221 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import threading
+from unittest import TestCase
+
+from pysnmp.proto import rfc1902
+
+from snmp_replay import ReplayCommandGenerator, create_snmp_handler
+from tests import ReplayAutoload, bind_command_context, create_config, create_snmp_autoload, discover_snmp, \
+    get_attributes, get_resources, load_fixture, unbind_command_context
+
+CDP_PREFIX = (1, 3, 6, 1, 4, 1, 9, 9, 23)
+LLDP_LOC_PORT_DESC = (1, 0, 8802, 1, 1, 2, 1, 3, 7, 1, 4)
+IF_SPEED = (1, 3, 6, 1, 2, 1, 2, 2, 1, 5)
+IF_HIGH_SPEED = (1, 3, 6, 1, 2, 1, 31, 1, 1, 1, 15)
+IP_AD_ENT_IF_INDEX = (1, 3, 6, 1, 2, 1, 4, 20, 1, 2)
+IF_NAME = (1, 3, 6, 1, 2, 1, 31, 1, 1, 1, 1)
+ENT_ALIAS_MAPPING_TABLE = (1, 3, 6, 1, 2, 1, 47, 1, 3, 2)
+SYS_OBJECT_ID = (1, 3, 6, 1, 2, 1, 1, 2, 0)
+
+
+class TestCiscoASASNMPAutoloadNeighbors(TestCase):
+    def setUp(self):
+        self.records = {oid: value for oid, value in load_fixture('asa5506').iteritems()
+                        if oid[:len(CDP_PREFIX)] != CDP_PREFIX}
+
+    def _get_adjacent(self, address):
+        return get_attributes(discover_snmp(self.records))[(address, 'Adjacent')]
+
+    def test_cdp_neighbor(self):
+        attributes = get_attributes(discover_snmp(load_fixture('asa5506')))
+
+        self.assertEqual(attributes[('0/8', 'Adjacent')], 'sw-branch-01.example.com through GigabitEthernet1/0/2')
+        self.assertEqual(attributes[('0/10', 'Adjacent')], '')
+
+    def test_lldp_neighbor_port_description_equal_to_interface_name(self):
+        self.assertEqual(self._get_adjacent('0/8'), 'sw-branch-01 through Gi1/0/2')
+        self.assertEqual(self._get_adjacent('0/9'), 'sw-branch-01 through Gi1/0/3')
+
+    def test_lldp_neighbor_port_description_containing_interface_name(self):
+        self.records[LLDP_LOC_PORT_DESC + (2,)] = rfc1902.OctetString(
+            "Adaptive Security Appliance 'GigabitEthernet1/2' interface")
+
+        self.assertEqual(self._get_adjacent('0/8'), 'sw-branch-01 through Gi1/0/2')
+
+    def test_lldp_neighbor_is_not_matched_by_interface_name_prefix(self):
+        self.records[LLDP_LOC_PORT_DESC + (2,)] = rfc1902.OctetString('GigabitEthernet1/20')
+
+        self.assertEqual(self._get_adjacent('0/8'), '')
+
+
+class TestCiscoASASNMPAutoloadBandwidth(TestCase):
+    def setUp(self):
+        self.records = load_fixture('asa5506')
+        self.records[IF_SPEED + (1,)] = rfc1902.Gauge32(4294967295)
+        self.records[IF_HIGH_SPEED + (1,)] = rfc1902.Gauge32(10000)
+
+    def test_saturated_if_speed_is_replaced_with_if_high_speed(self):
+        attributes = get_attributes(discover_snmp(self.records))
+
+        self.assertEqual(attributes[('0/7', 'Bandwidth')], 10000000000)
+        self.assertEqual(attributes[('0/8', 'Bandwidth')], 1000000000)
+
+    def test_saturated_if_speed_is_replaced_with_if_high_speed_without_bulk_mode(self):
+        attributes = get_attributes(discover_snmp(self.records, SNMP_BULK_MODE=False))
+
+        self.assertEqual(attributes[('0/7', 'Bandwidth')], 10000000000)
+        self.assertEqual(attributes[('0/8', 'Bandwidth')], 1000000000)
+
+
+class TestCiscoASASNMPAutoloadDeviceModel(TestCase):
+    def test_device_model_is_resolved_from_products_table(self):
+        attributes = get_attributes(discover_snmp(load_fixture('asa5525')))
+
+        self.assertEqual(attributes[('', 'Model')], 'Ciscoasa5525')
+
+    def test_device_model_of_another_product(self):
+        records = load_fixture('asa5525')
+        records[SYS_OBJECT_ID] = rfc1902.ObjectName('1.3.6.1.4.1.9.1.2114')
+
+        attributes = get_attributes(discover_snmp(records))
+
+        self.assertEqual(attributes[('', 'Model')], 'Ciscoasa5506')
+
+
+class TestCiscoASASNMPAutoloadAddresses(TestCase):
+    def test_ipv6_address_is_built_from_ipv6_addr_table_index(self):
+        attributes = get_attributes(discover_snmp(load_fixture('asa5525')))
+
+        self.assertEqual(attributes[('0/5/1', 'IPv6 Address')], '2001:db8:10:0:0:0:0:1')
+        self.assertEqual(attributes[('0/5/2', 'IPv6 Address')], '')
+
+    def test_every_ipv4_address_of_the_interface_is_reported(self):
+        records = load_fixture('asa5506')
+        records[IP_AD_ENT_IF_INDEX + (192, 168, 2, 1)] = rfc1902.Integer32(2)
+
+        attributes = get_attributes(discover_snmp(records))
+
+        self.assertEqual(attributes[('0/7', 'IPv4 Address')], '198.51.100.2')
+        self.assertEqual(sorted(attributes[('0/8', 'IPv4 Address')].split(', ')), ['192.168.1.1', '192.168.2.1'])
+        self.assertEqual(attributes[('0/10', 'IPv4 Address')], '')
+
+
+class TestCiscoASASNMPAutoloadPortMapping(TestCase):
+    def setUp(self):
+        self.records = {oid: value for oid, value in load_fixture('asa5506').iteritems()
+                        if oid[:len(ENT_ALIAS_MAPPING_TABLE)] != ENT_ALIAS_MAPPING_TABLE}
+
+    def test_ports_are_mapped_by_interface_number_without_alias_mapping_table(self):
+        expected_result = discover_snmp(load_fixture('asa5506'))
+
+        result = discover_snmp(self.records)
+
+        self.assertEqual(get_resources(result), get_resources(expected_result))
+        self.assertEqual(get_attributes(result), get_attributes(expected_result))
+
+    def test_interface_number_is_matched_exactly(self):
+        # no interface is numbered 1/1 anymore, entity port GigabitEthernet1/1 must not match 1/10
+        del self.records[IF_NAME + (1,)]
+        for if_index, if_name in ((9, 'Management1/9'), (10, 'Internal-Control1/9'), (11, 'Internal-Data1/9'),
+                                  (16, 'GigabitEthernet1/10')):
+            self.records[IF_NAME + (if_index,)] = rfc1902.OctetString(if_name)
+
+        resources = get_resources(discover_snmp(self.records))
+
+        self.assertEqual([address for address, model, name in resources],
+                         ['0', '0/8', '0/9', '0/10', '0/11', '0/12', '0/13', '0/14'])
+        self.assertNotIn('GigabitEthernet1-10', [name for address, model, name in resources])
+
+
+class TestCiscoASASNMPAutoloadWorkers(TestCase):
+    def setUp(self):
+        self.records = load_fixture('asa5585')
+        ReplayAutoload._snmp_engines = []
+
+    def discover(self, **config_attributes):
+        autoload = create_snmp_autoload(self.records, **config_attributes)
+        result = autoload._get_autoload_details()
+        autoload._release_snmp_workers()
+        return result
+
+    def test_worker_threads_discover_the_same_resources(self):
+        expected_result = discover_snmp(self.records, SNMP_TABLE_LOAD_WORKERS=1, SNMP_GET_WINDOW=1)
+
+        result = self.discover(SNMP_TABLE_LOAD_WORKERS=4, SNMP_GET_WINDOW=4)
+
+        self.assertEqual(get_resources(result), get_resources(expected_result))
+        self.assertEqual(get_attributes(result), get_attributes(expected_result))
+
+    def test_worker_engines_are_reused_by_next_discovery(self):
+        self.discover(SNMP_TABLE_LOAD_WORKERS=4)
+        engines = [cmd_gen for cmd_gen, mib_viewer in ReplayAutoload._snmp_engines]
+
+        self.discover(SNMP_TABLE_LOAD_WORKERS=4)
+
+        self.assertEqual(len(engines), 4)
+        self.assertEqual(sorted(id(cmd_gen) for cmd_gen, mib_viewer in ReplayAutoload._snmp_engines),
+                         sorted(map(id, engines)))
+
+
+class FailingBatchCommandGenerator(ReplayCommandGenerator):
+    """Replay engine timing out the first multi-varbind GET request of the test"""
+
+    lock = threading.Lock()
+    failed_requests = []
+
+    def getCmd(self, auth_data, transport_target, *var_names, **kwargs):
+        with self.lock:
+            fail = len(var_names) > 1 and not self.failed_requests
+            if fail:
+                self.failed_requests.append(var_names)
+        if fail:
+            return 'requestTimedOut', 0, 0, []
+        return ReplayCommandGenerator.getCmd(self, auth_data, transport_target, *var_names, **kwargs)
+
+
+class FailingBatchAutoload(ReplayAutoload):
+    _snmp_engines = []
+
+    def _create_snmp_engine(self):
+        return FailingBatchCommandGenerator()
+
+
+class TestCiscoASASNMPAutoloadInjectedLogger(TestCase):
+    def setUp(self):
+        ReplayAutoload._snmp_engines = []
+        FailingBatchAutoload._snmp_engines = []
+        FailingBatchCommandGenerator.failed_requests = []
+        bind_command_context()
+
+    def tearDown(self):
+        unbind_command_context()
+
+    def discover(self, records, autoload_class=ReplayAutoload, **config_attributes):
+        autoload = autoload_class(snmp_handler=create_snmp_handler(records), config=create_config(**config_attributes),
+                                  snmp_community='public')
+        result = autoload._get_autoload_details()
+        autoload._release_snmp_workers()
+        return result
+
+    def test_table_load_workers_log_with_logger_of_the_command(self):
+        for name in ['asa5585', 'asa5506']:
+            records = load_fixture(name)
+            expected_result = discover_snmp(records)
+
+            result = self.discover(records, SNMP_TABLE_LOAD_WORKERS=4, SNMP_GET_WINDOW=1)
+
+            self.assertEqual(get_resources(result), get_resources(expected_result), name)
+            self.assertEqual(get_attributes(result), get_attributes(expected_result), name)
+
+    def test_failed_pipelined_get_falls_back_to_property_requests(self):
+        records = load_fixture('asa5585')
+        expected_result = discover_snmp(records)
+
+        result = self.discover(records, FailingBatchAutoload, SNMP_TABLE_LOAD_WORKERS=1, SNMP_GET_WINDOW=4,
+                               SNMP_MAX_MESSAGE_SIZE=484)
+
+        self.assertEqual(len(FailingBatchCommandGenerator.failed_requests), 1)
+        self.assertEqual(get_resources(result), get_resources(expected_result))
+        self.assertEqual(get_attributes(result), get_attributes(expected_result))
@@ -0,0 +1,57 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+from cloudshell.firewall.cisco.asa.autoload.cli_output_parser import iter_lines, parse_contexts, parse_hostname
+
+SHOW_CONTEXT = """show context
+Context Name      Class      Interfaces           Mode         URL
+*admin            default    GigabitEthernet0/1.100 Routed     disk0:/admin.cfg
+                             GigabitEthernet0/1.101
+ contexta         default    GigabitEthernet0/1.200, Routed    disk0:/contexta.cfg
+                             GigabitEthernet0/1.201,
+                             GigabitEthernet0/1.202
+ contextb         default    inside_int,          Transparent  disk0:/contextb.cfg
+                             outside_int
+ contextc         gold                            Routed       disk0:/contextc.cfg
+
+Total active Security Contexts: 4
+ciscoasa# """
+
+
+class TestParseContexts(TestCase):
+    def setUp(self):
+        self.contexts = list(parse_contexts(iter_lines(SHOW_CONTEXT)))
+
+    def test_contexts(self):
+        self.assertEqual([(context['name'], context['class'], context['mode'], context['url'], context['current'])
+                          for context in self.contexts],
+                         [('admin', 'default', 'Routed', 'disk0:/admin.cfg', True),
+                          ('contexta', 'default', 'Routed', 'disk0:/contexta.cfg', False),
+                          ('contextb', 'default', 'Transparent', 'disk0:/contextb.cfg', False),
+                          ('contextc', 'gold', 'Routed', 'disk0:/contextc.cfg', False)])
+
+    def test_wrapped_interface_lists_are_joined(self):
+        self.assertEqual(self.contexts[0]['interfaces'], ['GigabitEthernet0/1.100', 'GigabitEthernet0/1.101'])
+        self.assertEqual(self.contexts[1]['interfaces'], ['GigabitEthernet0/1.200', 'GigabitEthernet0/1.201',
+                                                          'GigabitEthernet0/1.202'])
+
+    def test_wrapped_mapped_interface_names_are_joined(self):
+        self.assertEqual(self.contexts[2]['interfaces'], ['inside_int', 'outside_int'])
+
+    def test_context_without_interfaces(self):
+        self.assertEqual(self.contexts[3]['interfaces'], [])
+
+    def test_single_context_mode_error(self):
+        output = "show context\n          ^\nERROR: % Invalid input detected at '^' marker.\nciscoasa# "
+
+        self.assertEqual(list(parse_contexts(iter_lines(output))), [])
+
+
+class TestParseHostname(TestCase):
+    def test_hostname(self):
+        self.assertEqual(parse_hostname(iter_lines('show hostname\r\nasa5585-dc1\r\nasa5585-dc1# ')), 'asa5585-dc1')
+
+    def test_no_hostname(self):
+        self.assertEqual(parse_hostname(iter_lines('show hostname\r\nasa5585-dc1# ')), '')
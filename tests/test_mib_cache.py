@@ -0,0 +1,46 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from cloudshell.firewall.cisco.asa.autoload.mib_cache import CachedDirMibSource
+
+MIBS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         'cloudshell', 'firewall', 'cisco', 'asa', 'mibs')
+
+
+class TestCachedDirMibSource(TestCase):
+    def setUp(self):
+        self.temp_path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_path)
+
+    def test_compiled_module_is_cached_in_private_directory(self):
+        cache_path = os.path.join(self.temp_path, 'mibs')
+
+        code, suffix = CachedDirMibSource(MIBS_PATH, cache_path).read('CISCO-SMI')
+
+        self.assertEqual(suffix, '.py')
+        self.assertEqual(os.stat(cache_path).st_mode & 0o777, 0o700)
+        self.assertEqual(len(os.listdir(cache_path)), 1)
+        cached_code, _ = CachedDirMibSource(MIBS_PATH, cache_path).read('CISCO-SMI')
+        self.assertEqual(cached_code.co_code, code.co_code)
+
+    def test_cache_is_not_used_in_directory_writable_by_others(self):
+        os.chmod(self.temp_path, 0o777)
+        mib_source = CachedDirMibSource(MIBS_PATH, self.temp_path)
+
+        code, _ = mib_source.read('CISCO-SMI')
+
+        self.assertFalse(mib_source.cache_private)
+        self.assertEqual(os.listdir(self.temp_path), [])
+        self.assertEqual(code.co_filename, os.path.join(MIBS_PATH, 'CISCO-SMI.py'))
+
+    def test_default_cache_is_not_in_temporary_directory(self):
+        mib_source = CachedDirMibSource(MIBS_PATH)
+
+        self.assertFalse(mib_source.cache_path.startswith(tempfile.gettempdir()))
@@ -0,0 +1,44 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+from cloudshell.firewall.cisco.asa.autoload.oid_trie import OidTrie
+from tests import create_snmp_autoload, load_fixture
+
+
+class TestOidTrie(TestCase):
+    def setUp(self):
+        self.trie = OidTrie([((1, 3, 6), 'dod'), ((1, 3, 6, 1, 4), 'private'), ((1, 3, 6, 1, 4, 1, 9), 'cisco'),
+                             ((1, 3, 6, 1, 2), None)])
+
+    def test_get_exact_oid(self):
+        self.assertEqual(self.trie.get((1, 3, 6, 1, 4, 1, 9)), 'cisco')
+        self.assertEqual(self.trie.get((1, 3, 6, 1)), None)
+        self.assertEqual(self.trie.get((1, 3, 6, 1, 2), 'missing'), 'missing')
+        self.assertEqual(self.trie.get((1, 3, 7), 'missing'), 'missing')
+        self.assertIn((1, 3, 6, 1, 4), self.trie)
+        self.assertEqual(len(self.trie), 3)
+
+    def test_prefixes_from_shortest_to_longest(self):
+        self.assertEqual(self.trie.prefixes((1, 3, 6, 1, 4, 1, 9, 1, 1408)),
+                         [(3, 'dod'), (5, 'private'), (7, 'cisco')])
+        self.assertEqual(self.trie.prefixes((1, 3, 6, 1, 2, 1)), [(3, 'dod')])
+        self.assertEqual(self.trie.prefixes((2, 5)), [])
+
+
+class TestCiscoASASNMPAutoloadOidNames(TestCase):
+    def setUp(self):
+        self.autoload = create_snmp_autoload(load_fixture('asa5525'))
+
+    def test_vendor_type_resolves_name_and_entity_class(self):
+        self.assertEqual(self.autoload._get_vendor_type('1.3.6.1.4.1.9.12.3.1.9.2.454'),
+                         ('CISCO-ENTITY-VENDORTYPE-OID-MIB::cevModuleASA5525ASAIC6GECUB', 'module'))
+        self.assertEqual(self.autoload._get_vendor_type('1.3.6.1.4.1.9.12.3.1.10.172.5'),
+                         ('CISCO-ENTITY-VENDORTYPE-OID-MIB::cevPortGigBaseT.5', 'port'))
+        self.assertEqual(self.autoload._get_vendor_type('1.3.6.1.4.1.9.1.1408'), ('1.3.6.1.4.1.9.1.1408', None))
+
+    def test_product_name_of_sys_object_id(self):
+        self.assertEqual(self.autoload._get_product_name('1.3.6.1.4.1.9.1.1408'), 'ciscoASA5525')
+        self.assertEqual(self.autoload._get_product_name('CISCO-PRODUCTS-MIB::ciscoASA5525'), 'ciscoASA5525')
+        self.assertIsNone(self.autoload._get_product_name('1.3.6.1.4.1.9.1.1408.1'))
@@ -0,0 +1,44 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+from cloudshell.firewall.cisco.asa.autoload.ordered_set import OrderedSet
+from tests import discover_snmp, get_resources, load_fixture
+
+
+class TestOrderedSet(TestCase):
+    def test_insertion_order_is_kept(self):
+        ordered_set = OrderedSet([30, 10, 20])
+        ordered_set.append(5)
+        ordered_set.add(10)
+
+        self.assertEqual(list(ordered_set), [30, 10, 20, 5])
+        self.assertEqual(list(reversed(ordered_set)), [5, 20, 10, 30])
+        self.assertEqual(len(ordered_set), 4)
+
+    def test_membership_and_removal(self):
+        ordered_set = OrderedSet([3, 1, 2])
+        ordered_set.discard(1)
+        ordered_set.discard(7)
+
+        self.assertIn(3, ordered_set)
+        self.assertNotIn(1, ordered_set)
+        self.assertEqual(list(ordered_set), [3, 2])
+
+    def test_in_place_difference_keeps_order(self):
+        ordered_set = OrderedSet([5, 4, 3, 2, 1])
+        ordered_set -= OrderedSet([4, 2])
+
+        self.assertEqual(list(ordered_set), [5, 3, 1])
+
+
+class TestDiscoveryOrder(TestCase):
+    def test_resources_are_added_in_entity_table_order(self):
+        resources = get_resources(discover_snmp(load_fixture('asa5585')))
+
+        self.assertEqual([address for address, model, name in resources],
+                         ['0'] + ['0/0/{0}'.format(port) for port in range(10)] +
+                         ['0/1/{0}'.format(port) for port in range(8)] + ['0/0', '0/1', '0/PP10-0', '0/PP11-0', 'PC1'])
+        self.assertEqual([name for address, model, name in resources if model == 'Generic Power Port'],
+                         ['PP0', 'PP1'])
@@ -0,0 +1,62 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from cloudshell.firewall.cisco.asa.autoload.snapshot_store import SnapshotStore
+from cloudshell.shell.core.driver_context import AutoLoadAttribute, AutoLoadDetails, AutoLoadResource
+
+
+def create_autoload_details():
+    return AutoLoadDetails(resources=[AutoLoadResource('Generic Port', 'GigabitEthernet0-0', '0/0/0', '42')],
+                           attributes=[AutoLoadAttribute('0/0/0', 'Port Description', u'uplink → core'),
+                                       AutoLoadAttribute('0/0/0', 'MTU', 1500)])
+
+
+class TestSnapshotStore(TestCase):
+    def setUp(self):
+        self.temp_path = tempfile.mkdtemp()
+        self.store = SnapshotStore(os.path.join(self.temp_path, 'snapshots'))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_path)
+
+    def test_snapshot_is_loaded_as_saved(self):
+        snapshot_id = self.store.save('asa@192.0.2.1', create_autoload_details(), {'entity_table': [(1, {})]})
+
+        snapshot = self.store.load('asa@192.0.2.1')
+
+        self.assertEqual(snapshot.snapshot_id, snapshot_id)
+        self.assertEqual(snapshot.metadata, {'entity_table': [(1, {})]})
+        self.assertEqual([(resource.model, resource.name, resource.relative_address, resource.unique_identifier)
+                          for resource in snapshot.autoload_details.resources],
+                         [('Generic Port', 'GigabitEthernet0-0', '0/0/0', '42')])
+        self.assertEqual([(attribute.relative_address, attribute.attribute_name, attribute.attribute_value)
+                          for attribute in snapshot.autoload_details.attributes],
+                         [('0/0/0', 'Port Description', u'uplink → core'), ('0/0/0', 'MTU', 1500)])
+
+    def test_unicode_resource_key(self):
+        resource_key = u'ASA берлин@192.0.2.1'
+
+        self.store.save(resource_key, create_autoload_details())
+
+        self.assertEqual(self.store.load(resource_key).resource_key, resource_key)
+        self.assertEqual([snapshot['resource_key'] for snapshot in self.store.list_snapshots()], [resource_key])
+
+    def test_store_is_created_private(self):
+        self.store.save('asa@192.0.2.1', create_autoload_details())
+
+        self.assertEqual(os.stat(self.store.store_path).st_mode & 0o777, 0o700)
+
+    def test_store_writable_by_others_is_not_used(self):
+        self.store.save('asa@192.0.2.1', create_autoload_details())
+        os.chmod(self.store.store_path, 0o777)
+
+        self.assertIsNone(self.store.load('asa@192.0.2.1'))
+        self.assertRaises(Exception, self.store.save, 'asa@192.0.2.1', create_autoload_details())
+
+    def test_default_store_is_not_in_temporary_directory(self):
+        self.assertFalse(SnapshotStore().store_path.startswith(tempfile.gettempdir()))
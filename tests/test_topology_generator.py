@@ -0,0 +1,35 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from collections import Counter
+from unittest import TestCase
+
+from tests import discover_snmp, get_attributes, get_resources
+from topology_generator import IF_ENTRY, TopologyGenerator
+
+
+class TestTopologyGenerator(TestCase):
+    def setUp(self):
+        self.generator = TopologyGenerator(chassis_count=2, modules_per_chassis=2, ports_per_module=4,
+                                           subinterfaces_per_port=1, port_channels=2, ports_per_channel=2)
+        self.records = self.generator.generate()
+
+    def test_interface_count(self):
+        if_descriptions = [oid for oid in self.records if oid[:len(IF_ENTRY) + 1] == IF_ENTRY + (2,)]
+
+        self.assertEqual(len(if_descriptions), self.generator.interfaces_count)
+
+    def test_generated_device_is_discovered(self):
+        result = discover_snmp(self.records)
+
+        resources = get_resources(result)
+        attributes = get_attributes(result)
+        self.assertEqual(Counter(model for address, model, name in resources),
+                         {'Generic Chassis': 2, 'Generic Module': 4, 'Generic Port': 16, 'Generic Power Port': 4,
+                          'Generic Port Channel': 2})
+        ports = [address for address, model, name in resources if model == 'Generic Port']
+        self.assertTrue(all(attributes[(address, 'Adjacent')] for address in ports))
+        self.assertEqual(attributes[('PC1', 'Associated Ports')], 'GigabitEthernet0-0; GigabitEthernet0-1;')
+
+    def test_records_are_rebuilt_on_every_call(self):
+        self.assertEqual(self.generator.generate(), self.records)
@@ -0,0 +1,99 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""Generate a precompiled OID table module of cloudshell/firewall/cisco/asa/autoload from a bundled MIB
+
+Symbols of the MIB under the prefix symbol are written as TABLE_NAME with the prefix OID as TABLE_NAME_PREFIX.
+If every symbol is a direct child of the prefix, the table is a dict of the last arc to the symbol name,
+otherwise it is a tuple of (arcs under the prefix, symbol name) pairs sorted by OID.
+Run it after the MIB in cloudshell/firewall/cisco/asa/mibs is updated:
+    python tools/generate_cisco_oids.py CISCO-PRODUCTS-MIB CISCO-SMI::ciscoProducts CISCO_PRODUCTS \\
+        cisco_products_oids.py
+    python tools/generate_cisco_oids.py CISCO-ENTITY-VENDORTYPE-OID-MIB cevMIBObjects CISCO_VENDORTYPES \\
+        cisco_vendortype_oids.py
+"""
+
+import hashlib
+import os
+import sys
+
+from pysnmp.smi import builder
+
+ROOT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+MIBS_PATH = os.path.join(ROOT_PATH, 'cloudshell', 'firewall', 'cisco', 'asa', 'mibs')
+OUTPUT_PATH = os.path.join(ROOT_PATH, 'cloudshell', 'firewall', 'cisco', 'asa', 'autoload')
+LINE_LENGTH = 119
+
+HEADER = '''#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Generated by tools/generate_cisco_oids.py from {mib_name}, do not edit.
+# Source sha1: {checksum}
+
+{table_name}_PREFIX = {prefix}
+
+# {description}
+{table_name} = {opening}
+'''
+
+
+def load_symbols(mib_name, prefix_symbol):
+    """Load OIDs of the MIB symbols under the prefix symbol
+
+    :param mib_name: MIB name, i.e. 'CISCO-PRODUCTS-MIB'
+    :param prefix_symbol: prefix symbol, 'MIB-NAME::symbol' or a symbol of mib_name, i.e. 'CISCO-SMI::ciscoProducts'
+    :return: prefix OID and dict of arcs under the prefix to symbol name
+    """
+
+    mib_builder = builder.MibBuilder()
+    mib_builder.addMibSources(builder.DirMibSource(MIBS_PATH))
+    mib_builder.loadModules(mib_name)
+    prefix_mib_name, _, prefix_name = prefix_symbol.rpartition('::')
+    prefix_mib_name = prefix_mib_name or mib_name
+    mib_builder.loadModules(prefix_mib_name)
+    prefix, = mib_builder.importSymbols(prefix_mib_name, prefix_name)
+    prefix = tuple(prefix.getName())
+    mib_identifier, = mib_builder.importSymbols('SNMPv2-SMI', 'MibIdentifier')
+    symbols = {}
+    for name, node in mib_builder.mibSymbols[mib_name].items():
+        if not isinstance(node, mib_identifier):
+            continue
+        oid = tuple(node.getName())
+        if oid[:len(prefix)] == prefix and len(oid) > len(prefix):
+            symbols[oid[len(prefix):]] = name
+    return prefix, symbols
+
+
+def main(mib_name, prefix_symbol, table_name, output_file_name):
+    with open(os.path.join(MIBS_PATH, mib_name + '.py'), 'rb') as mib_file:
+        checksum = hashlib.sha1(mib_file.read()).hexdigest()
+    prefix, symbols = load_symbols(mib_name, prefix_symbol)
+    if all(len(arcs) == 1 for arcs in symbols):
+        items = ['{0}: {1!r},'.format(arcs[0], name) for arcs, name in sorted(symbols.items())]
+        description = 'Last arc under {0} to {1} symbol name'.format(prefix_symbol.split('::')[-1], mib_name)
+        opening, closing = '{', '}'
+    else:
+        items = ['({0}, {1!r}),'.format(arcs, name) for arcs, name in sorted(symbols.items())]
+        description = 'OID arcs under {0} and {1} symbol name, sorted by OID'.format(prefix_symbol.split('::')[-1],
+                                                                                    mib_name)
+        opening, closing = '(', ')'
+
+    output_path = os.path.join(OUTPUT_PATH, output_file_name)
+    with open(output_path, 'w') as output_file:
+        output_file.write(HEADER.format(mib_name=mib_name, checksum=checksum, table_name=table_name, prefix=prefix,
+                                        description=description, opening=opening))
+        line = ''
+        for item in items:
+            if line and len(line) + len(item) + 1 > LINE_LENGTH:
+                output_file.write(line + '\n')
+                line = ''
+            line = line + ' ' + item if line else '    ' + item
+        output_file.write(line + '\n')
+        output_file.write(closing + '\n')
+    print('{0} {1} symbols written to {2}'.format(len(items), mib_name, output_path))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 5:
+        sys.exit('Usage: python tools/generate_cisco_oids.py MIB_NAME PREFIX_SYMBOL TABLE_NAME OUTPUT_FILE_NAME')
+    main(*sys.argv[1:])